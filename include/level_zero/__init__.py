@@ -0,0 +1,12 @@
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+ @file __init__.py
+
+ Python bindings for the Level Zero core (ze), sysman (zes) and tools (zet)
+ APIs. Submodules are imported on demand, e.g. `from level_zero import zes`
+ loads only the sysman bindings and the few core types they depend on.
+
+ """
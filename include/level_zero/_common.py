@@ -0,0 +1,397 @@
+"""
+ Copyright (C) 2019-2021 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+ @file _common.py
+ @version v1.13-r1.13.1
+
+ Core definitions shared by the ze, zes and zet bindings; imported by each
+ so that zes does not need to load the whole core API.
+
+ """
+import sys
+from ctypes import *
+from enum import *
+
+###############################################################################
+__version__ = "1.0"
+
+###############################################################################
+## @brief Generates generic 'oneAPI' API versions
+def ZE_MAKE_VERSION( _major, _minor ):
+    return (( _major << 16 )|( _minor & 0x0000ffff))
+
+###############################################################################
+## @brief compiler-independent type
+class ze_bool_t(c_ubyte):
+    pass
+
+###############################################################################
+## @brief Handle of a driver instance
+class ze_driver_handle_t(c_void_p):
+    pass
+
+###############################################################################
+## @brief Generic macro for enumerator bit masks
+def ZE_BIT( _i ):
+    return ( 1 << _i )
+
+###############################################################################
+## @brief Defines Return/Error codes
+class ze_result_v(IntEnum):
+    SUCCESS = 0                                                             ## [Core] success
+    NOT_READY = 1                                                           ## [Core] synchronization primitive not signaled
+    ERROR_DEVICE_LOST = 0x70000001                                          ## [Core] device hung, reset, was removed, or driver update occurred
+    ERROR_OUT_OF_HOST_MEMORY = 0x70000002                                   ## [Core] insufficient host memory to satisfy call
+    ERROR_OUT_OF_DEVICE_MEMORY = 0x70000003                                 ## [Core] insufficient device memory to satisfy call
+    ERROR_MODULE_BUILD_FAILURE = 0x70000004                                 ## [Core] error occurred when building module, see build log for details
+    ERROR_MODULE_LINK_FAILURE = 0x70000005                                  ## [Core] error occurred when linking modules, see build log for details
+    ERROR_DEVICE_REQUIRES_RESET = 0x70000006                                ## [Core] device requires a reset
+    ERROR_DEVICE_IN_LOW_POWER_STATE = 0x70000007                            ## [Core] device currently in low power state
+    EXP_ERROR_DEVICE_IS_NOT_VERTEX = 0x7ff00001                             ## [Core, Experimental] device is not represented by a fabric vertex
+    EXP_ERROR_VERTEX_IS_NOT_DEVICE = 0x7ff00002                             ## [Core, Experimental] fabric vertex does not represent a device
+    EXP_ERROR_REMOTE_DEVICE = 0x7ff00003                                    ## [Core, Experimental] fabric vertex represents a remote device or
+                                                                            ## subdevice
+    EXP_ERROR_OPERANDS_INCOMPATIBLE = 0x7ff00004                            ## [Core, Experimental] operands of comparison are not compatible
+    EXP_RTAS_BUILD_RETRY = 0x7ff00005                                       ## [Core, Experimental] ray tracing acceleration structure build
+                                                                            ## operation failed due to insufficient resources, retry with a larger
+                                                                            ## acceleration structure buffer allocation
+    EXP_RTAS_BUILD_DEFERRED = 0x7ff00006                                    ## [Core, Experimental] ray tracing acceleration structure build
+                                                                            ## operation deferred to parallel operation join
+    ERROR_INSUFFICIENT_PERMISSIONS = 0x70010000                             ## [Sysman] access denied due to permission level
+    ERROR_NOT_AVAILABLE = 0x70010001                                        ## [Sysman] resource already in use and simultaneous access not allowed
+                                                                            ## or resource was removed
+    ERROR_DEPENDENCY_UNAVAILABLE = 0x70020000                               ## [Common] external required dependency is unavailable or missing
+    WARNING_DROPPED_DATA = 0x70020001                                       ## [Tools] data may have been dropped
+    ERROR_UNINITIALIZED = 0x78000001                                        ## [Validation] driver is not initialized
+    ERROR_UNSUPPORTED_VERSION = 0x78000002                                  ## [Validation] generic error code for unsupported versions
+    ERROR_UNSUPPORTED_FEATURE = 0x78000003                                  ## [Validation] generic error code for unsupported features
+    ERROR_INVALID_ARGUMENT = 0x78000004                                     ## [Validation] generic error code for invalid arguments
+    ERROR_INVALID_NULL_HANDLE = 0x78000005                                  ## [Validation] handle argument is not valid
+    ERROR_HANDLE_OBJECT_IN_USE = 0x78000006                                 ## [Validation] object pointed to by handle still in-use by device
+    ERROR_INVALID_NULL_POINTER = 0x78000007                                 ## [Validation] pointer argument may not be nullptr
+    ERROR_INVALID_SIZE = 0x78000008                                         ## [Validation] size argument is invalid (e.g., must not be zero)
+    ERROR_UNSUPPORTED_SIZE = 0x78000009                                     ## [Validation] size argument is not supported by the device (e.g., too
+                                                                            ## large)
+    ERROR_UNSUPPORTED_ALIGNMENT = 0x7800000a                                ## [Validation] alignment argument is not supported by the device (e.g.,
+                                                                            ## too small)
+    ERROR_INVALID_SYNCHRONIZATION_OBJECT = 0x7800000b                       ## [Validation] synchronization object in invalid state
+    ERROR_INVALID_ENUMERATION = 0x7800000c                                  ## [Validation] enumerator argument is not valid
+    ERROR_UNSUPPORTED_ENUMERATION = 0x7800000d                              ## [Validation] enumerator argument is not supported by the device
+    ERROR_UNSUPPORTED_IMAGE_FORMAT = 0x7800000e                             ## [Validation] image format is not supported by the device
+    ERROR_INVALID_NATIVE_BINARY = 0x7800000f                                ## [Validation] native binary is not supported by the device
+    ERROR_INVALID_GLOBAL_NAME = 0x78000010                                  ## [Validation] global variable is not found in the module
+    ERROR_INVALID_KERNEL_NAME = 0x78000011                                  ## [Validation] kernel name is not found in the module
+    ERROR_INVALID_FUNCTION_NAME = 0x78000012                                ## [Validation] function name is not found in the module
+    ERROR_INVALID_GROUP_SIZE_DIMENSION = 0x78000013                         ## [Validation] group size dimension is not valid for the kernel or
+                                                                            ## device
+    ERROR_INVALID_GLOBAL_WIDTH_DIMENSION = 0x78000014                       ## [Validation] global width dimension is not valid for the kernel or
+                                                                            ## device
+    ERROR_INVALID_KERNEL_ARGUMENT_INDEX = 0x78000015                        ## [Validation] kernel argument index is not valid for kernel
+    ERROR_INVALID_KERNEL_ARGUMENT_SIZE = 0x78000016                         ## [Validation] kernel argument size does not match kernel
+    ERROR_INVALID_KERNEL_ATTRIBUTE_VALUE = 0x78000017                       ## [Validation] value of kernel attribute is not valid for the kernel or
+                                                                            ## device
+    ERROR_INVALID_MODULE_UNLINKED = 0x78000018                              ## [Validation] module with imports needs to be linked before kernels can
+                                                                            ## be created from it.
+    ERROR_INVALID_COMMAND_LIST_TYPE = 0x78000019                            ## [Validation] command list type does not match command queue type
+    ERROR_OVERLAPPING_REGIONS = 0x7800001a                                  ## [Validation] copy operations do not support overlapping regions of
+                                                                            ## memory
+    WARNING_ACTION_REQUIRED = 0x7800001b                                    ## [Sysman] an action is required to complete the desired operation
+    ERROR_INVALID_KERNEL_HANDLE = 0x7800001c                                ## [Core, Validation] kernel handle is invalid for the operation
+    EXT_RTAS_BUILD_RETRY = 0x7800001d                                       ## [Core, Extension] ray tracing acceleration structure build operation
+                                                                            ## failed due to insufficient resources, retry with a larger acceleration
+                                                                            ## structure buffer allocation
+    EXT_RTAS_BUILD_DEFERRED = 0x7800001e                                    ## [Core, Extension] ray tracing acceleration structure build operation
+                                                                            ## deferred to parallel operation join
+    EXT_ERROR_OPERANDS_INCOMPATIBLE = 0x7800001f                            ## [Core, Extension] operands of comparison are not compatible
+    ERROR_SURVIVABILITY_MODE_DETECTED = 0x78000020                          ## [Sysman] device is in survivability mode, firmware update needed
+    ERROR_UNKNOWN = 0x7ffffffe                                              ## [Core] unknown or internal error
+
+class ze_result_t(c_int):
+    def __str__(self):
+        return str(ze_result_v(self.value))
+
+
+###############################################################################
+## @brief Defines structure types
+class ze_structure_type_v(IntEnum):
+    DRIVER_PROPERTIES = 0x1                                                 ## ::ze_driver_properties_t
+    DRIVER_IPC_PROPERTIES = 0x2                                             ## ::ze_driver_ipc_properties_t
+    DEVICE_PROPERTIES = 0x3                                                 ## ::ze_device_properties_t
+    DEVICE_COMPUTE_PROPERTIES = 0x4                                         ## ::ze_device_compute_properties_t
+    DEVICE_MODULE_PROPERTIES = 0x5                                          ## ::ze_device_module_properties_t
+    COMMAND_QUEUE_GROUP_PROPERTIES = 0x6                                    ## ::ze_command_queue_group_properties_t
+    DEVICE_MEMORY_PROPERTIES = 0x7                                          ## ::ze_device_memory_properties_t
+    DEVICE_MEMORY_ACCESS_PROPERTIES = 0x8                                   ## ::ze_device_memory_access_properties_t
+    DEVICE_CACHE_PROPERTIES = 0x9                                           ## ::ze_device_cache_properties_t
+    DEVICE_IMAGE_PROPERTIES = 0xa                                           ## ::ze_device_image_properties_t
+    DEVICE_P2P_PROPERTIES = 0xb                                             ## ::ze_device_p2p_properties_t
+    DEVICE_EXTERNAL_MEMORY_PROPERTIES = 0xc                                 ## ::ze_device_external_memory_properties_t
+    CONTEXT_DESC = 0xd                                                      ## ::ze_context_desc_t
+    COMMAND_QUEUE_DESC = 0xe                                                ## ::ze_command_queue_desc_t
+    COMMAND_LIST_DESC = 0xf                                                 ## ::ze_command_list_desc_t
+    EVENT_POOL_DESC = 0x10                                                  ## ::ze_event_pool_desc_t
+    EVENT_DESC = 0x11                                                       ## ::ze_event_desc_t
+    FENCE_DESC = 0x12                                                       ## ::ze_fence_desc_t
+    IMAGE_DESC = 0x13                                                       ## ::ze_image_desc_t
+    IMAGE_PROPERTIES = 0x14                                                 ## ::ze_image_properties_t
+    DEVICE_MEM_ALLOC_DESC = 0x15                                            ## ::ze_device_mem_alloc_desc_t
+    HOST_MEM_ALLOC_DESC = 0x16                                              ## ::ze_host_mem_alloc_desc_t
+    MEMORY_ALLOCATION_PROPERTIES = 0x17                                     ## ::ze_memory_allocation_properties_t
+    EXTERNAL_MEMORY_EXPORT_DESC = 0x18                                      ## ::ze_external_memory_export_desc_t
+    EXTERNAL_MEMORY_IMPORT_FD = 0x19                                        ## ::ze_external_memory_import_fd_t
+    EXTERNAL_MEMORY_EXPORT_FD = 0x1a                                        ## ::ze_external_memory_export_fd_t
+    MODULE_DESC = 0x1b                                                      ## ::ze_module_desc_t
+    MODULE_PROPERTIES = 0x1c                                                ## ::ze_module_properties_t
+    KERNEL_DESC = 0x1d                                                      ## ::ze_kernel_desc_t
+    KERNEL_PROPERTIES = 0x1e                                                ## ::ze_kernel_properties_t
+    SAMPLER_DESC = 0x1f                                                     ## ::ze_sampler_desc_t
+    PHYSICAL_MEM_DESC = 0x20                                                ## ::ze_physical_mem_desc_t
+    KERNEL_PREFERRED_GROUP_SIZE_PROPERTIES = 0x21                           ## ::ze_kernel_preferred_group_size_properties_t
+    EXTERNAL_MEMORY_IMPORT_WIN32 = 0x22                                     ## ::ze_external_memory_import_win32_handle_t
+    EXTERNAL_MEMORY_EXPORT_WIN32 = 0x23                                     ## ::ze_external_memory_export_win32_handle_t
+    DEVICE_RAYTRACING_EXT_PROPERTIES = 0x00010001                           ## ::ze_device_raytracing_ext_properties_t
+    RAYTRACING_MEM_ALLOC_EXT_DESC = 0x10002                                 ## ::ze_raytracing_mem_alloc_ext_desc_t
+    FLOAT_ATOMIC_EXT_PROPERTIES = 0x10003                                   ## ::ze_float_atomic_ext_properties_t
+    CACHE_RESERVATION_EXT_DESC = 0x10004                                    ## ::ze_cache_reservation_ext_desc_t
+    EU_COUNT_EXT = 0x10005                                                  ## ::ze_eu_count_ext_t
+    SRGB_EXT_DESC = 0x10006                                                 ## ::ze_srgb_ext_desc_t
+    LINKAGE_INSPECTION_EXT_DESC = 0x10007                                   ## ::ze_linkage_inspection_ext_desc_t
+    PCI_EXT_PROPERTIES = 0x10008                                            ## ::ze_pci_ext_properties_t
+    DRIVER_MEMORY_FREE_EXT_PROPERTIES = 0x10009                             ## ::ze_driver_memory_free_ext_properties_t
+    MEMORY_FREE_EXT_DESC = 0x1000a                                          ## ::ze_memory_free_ext_desc_t
+    MEMORY_COMPRESSION_HINTS_EXT_DESC = 0x1000b                             ## ::ze_memory_compression_hints_ext_desc_t
+    IMAGE_ALLOCATION_EXT_PROPERTIES = 0x1000c                               ## ::ze_image_allocation_ext_properties_t
+    DEVICE_LUID_EXT_PROPERTIES = 0x1000d                                    ## ::ze_device_luid_ext_properties_t
+    DEVICE_MEMORY_EXT_PROPERTIES = 0x1000e                                  ## ::ze_device_memory_ext_properties_t
+    DEVICE_IP_VERSION_EXT = 0x1000f                                         ## ::ze_device_ip_version_ext_t
+    IMAGE_VIEW_PLANAR_EXT_DESC = 0x10010                                    ## ::ze_image_view_planar_ext_desc_t
+    EVENT_QUERY_KERNEL_TIMESTAMPS_EXT_PROPERTIES = 0x10011                  ## ::ze_event_query_kernel_timestamps_ext_properties_t
+    EVENT_QUERY_KERNEL_TIMESTAMPS_RESULTS_EXT_PROPERTIES = 0x10012          ## ::ze_event_query_kernel_timestamps_results_ext_properties_t
+    KERNEL_MAX_GROUP_SIZE_EXT_PROPERTIES = 0x10013                          ## ::ze_kernel_max_group_size_ext_properties_t
+    RELAXED_ALLOCATION_LIMITS_EXP_DESC = 0x00020001                         ## ::ze_relaxed_allocation_limits_exp_desc_t
+    MODULE_PROGRAM_EXP_DESC = 0x00020002                                    ## ::ze_module_program_exp_desc_t
+    SCHEDULING_HINT_EXP_PROPERTIES = 0x00020003                             ## ::ze_scheduling_hint_exp_properties_t
+    SCHEDULING_HINT_EXP_DESC = 0x00020004                                   ## ::ze_scheduling_hint_exp_desc_t
+    IMAGE_VIEW_PLANAR_EXP_DESC = 0x00020005                                 ## ::ze_image_view_planar_exp_desc_t
+    DEVICE_PROPERTIES_1_2 = 0x00020006                                      ## ::ze_device_properties_t
+    IMAGE_MEMORY_EXP_PROPERTIES = 0x00020007                                ## ::ze_image_memory_properties_exp_t
+    POWER_SAVING_HINT_EXP_DESC = 0x00020008                                 ## ::ze_context_power_saving_hint_exp_desc_t
+    COPY_BANDWIDTH_EXP_PROPERTIES = 0x00020009                              ## ::ze_copy_bandwidth_exp_properties_t
+    DEVICE_P2P_BANDWIDTH_EXP_PROPERTIES = 0x0002000A                        ## ::ze_device_p2p_bandwidth_exp_properties_t
+    FABRIC_VERTEX_EXP_PROPERTIES = 0x0002000B                               ## ::ze_fabric_vertex_exp_properties_t
+    FABRIC_EDGE_EXP_PROPERTIES = 0x0002000C                                 ## ::ze_fabric_edge_exp_properties_t
+    MEMORY_SUB_ALLOCATIONS_EXP_PROPERTIES = 0x0002000D                      ## ::ze_memory_sub_allocations_exp_properties_t
+    RTAS_BUILDER_EXP_DESC = 0x0002000E                                      ## ::ze_rtas_builder_exp_desc_t
+    RTAS_BUILDER_BUILD_OP_EXP_DESC = 0x0002000F                             ## ::ze_rtas_builder_build_op_exp_desc_t
+    RTAS_BUILDER_EXP_PROPERTIES = 0x00020010                                ## ::ze_rtas_builder_exp_properties_t
+    RTAS_PARALLEL_OPERATION_EXP_PROPERTIES = 0x00020011                     ## ::ze_rtas_parallel_operation_exp_properties_t
+    RTAS_DEVICE_EXP_PROPERTIES = 0x00020012                                 ## ::ze_rtas_device_exp_properties_t
+    RTAS_GEOMETRY_AABBS_EXP_CB_PARAMS = 0x00020013                          ## ::ze_rtas_geometry_aabbs_exp_cb_params_t
+    COUNTER_BASED_EVENT_POOL_EXP_DESC = 0x00020014                          ## ::ze_event_pool_counter_based_exp_desc_t
+    MUTABLE_COMMAND_LIST_EXP_PROPERTIES = 0x00020015                        ## ::ze_mutable_command_list_exp_properties_t
+    MUTABLE_COMMAND_LIST_EXP_DESC = 0x00020016                              ## ::ze_mutable_command_list_exp_desc_t
+    MUTABLE_COMMAND_ID_EXP_DESC = 0x00020017                                ## ::ze_mutable_command_id_exp_desc_t
+    MUTABLE_COMMANDS_EXP_DESC = 0x00020018                                  ## ::ze_mutable_commands_exp_desc_t
+    MUTABLE_KERNEL_ARGUMENT_EXP_DESC = 0x00020019                           ## ::ze_mutable_kernel_argument_exp_desc_t
+    MUTABLE_GROUP_COUNT_EXP_DESC = 0x0002001A                               ## ::ze_mutable_group_count_exp_desc_t
+    MUTABLE_GROUP_SIZE_EXP_DESC = 0x0002001B                                ## ::ze_mutable_group_size_exp_desc_t
+    MUTABLE_GLOBAL_OFFSET_EXP_DESC = 0x0002001C                             ## ::ze_mutable_global_offset_exp_desc_t
+    PITCHED_ALLOC_DEVICE_EXP_PROPERTIES = 0x0002001D                        ## ::ze_device_pitched_alloc_exp_properties_t
+    BINDLESS_IMAGE_EXP_DESC = 0x0002001E                                    ## ::ze_image_bindless_exp_desc_t
+    PITCHED_IMAGE_EXP_DESC = 0x0002001F                                     ## ::ze_image_pitched_exp_desc_t
+    MUTABLE_GRAPH_ARGUMENT_EXP_DESC = 0x00020020                            ## ::ze_mutable_graph_argument_exp_desc_t
+    INIT_DRIVER_TYPE_DESC = 0x00020021                                      ## ::ze_init_driver_type_desc_t
+    EXTERNAL_SEMAPHORE_EXT_DESC = 0x00020022                                ## ::ze_external_semaphore_ext_desc_t
+    EXTERNAL_SEMAPHORE_WIN32_EXT_DESC = 0x00020023                          ## ::ze_external_semaphore_win32_ext_desc_t
+    EXTERNAL_SEMAPHORE_FD_EXT_DESC = 0x00020024                             ## ::ze_external_semaphore_fd_ext_desc_t
+    EXTERNAL_SEMAPHORE_SIGNAL_PARAMS_EXT = 0x00020025                       ## ::ze_external_semaphore_signal_params_ext_t
+    EXTERNAL_SEMAPHORE_WAIT_PARAMS_EXT = 0x00020026                         ## ::ze_external_semaphore_wait_params_ext_t
+    DRIVER_DDI_HANDLES_EXT_PROPERTIES = 0x00020027                          ## ::ze_driver_ddi_handles_ext_properties_t
+    DEVICE_CACHELINE_SIZE_EXT = 0x00020028                                  ## ::ze_device_cache_line_size_ext_t
+    DEVICE_VECTOR_WIDTH_PROPERTIES_EXT = 0x00020029                         ## ::ze_device_vector_width_properties_ext_t
+    RTAS_BUILDER_EXT_DESC = 0x00020030                                      ## ::ze_rtas_builder_ext_desc_t
+    RTAS_BUILDER_BUILD_OP_EXT_DESC = 0x00020031                             ## ::ze_rtas_builder_build_op_ext_desc_t
+    RTAS_BUILDER_EXT_PROPERTIES = 0x00020032                                ## ::ze_rtas_builder_ext_properties_t
+    RTAS_PARALLEL_OPERATION_EXT_PROPERTIES = 0x00020033                     ## ::ze_rtas_parallel_operation_ext_properties_t
+    RTAS_DEVICE_EXT_PROPERTIES = 0x00020034                                 ## ::ze_rtas_device_ext_properties_t
+    RTAS_GEOMETRY_AABBS_EXT_CB_PARAMS = 0x00020035                          ## ::ze_rtas_geometry_aabbs_ext_cb_params_t
+
+class ze_structure_type_t(c_int):
+    def __str__(self):
+        return str(ze_structure_type_v(self.value))
+
+
+###############################################################################
+## @brief Supported API versions
+## 
+## @details
+##     - API versions contain major and minor attributes, use
+##       ::ZE_MAJOR_VERSION and ::ZE_MINOR_VERSION
+class ze_api_version_v(IntEnum):
+    _1_0 = ZE_MAKE_VERSION( 1, 0 )                                          ## version 1.0
+    _1_1 = ZE_MAKE_VERSION( 1, 1 )                                          ## version 1.1
+    _1_2 = ZE_MAKE_VERSION( 1, 2 )                                          ## version 1.2
+    _1_3 = ZE_MAKE_VERSION( 1, 3 )                                          ## version 1.3
+    _1_4 = ZE_MAKE_VERSION( 1, 4 )                                          ## version 1.4
+    _1_5 = ZE_MAKE_VERSION( 1, 5 )                                          ## version 1.5
+    _1_6 = ZE_MAKE_VERSION( 1, 6 )                                          ## version 1.6
+    _1_7 = ZE_MAKE_VERSION( 1, 7 )                                          ## version 1.7
+    _1_8 = ZE_MAKE_VERSION( 1, 8 )                                          ## version 1.8
+    _1_9 = ZE_MAKE_VERSION( 1, 9 )                                          ## version 1.9
+    _1_10 = ZE_MAKE_VERSION( 1, 10 )                                        ## version 1.10
+    _1_11 = ZE_MAKE_VERSION( 1, 11 )                                        ## version 1.11
+    _1_12 = ZE_MAKE_VERSION( 1, 12 )                                        ## version 1.12
+    _1_13 = ZE_MAKE_VERSION( 1, 13 )                                        ## version 1.13
+    CURRENT = ZE_MAKE_VERSION( 1, 13 )                                      ## latest known version
+
+class ze_api_version_t(c_int):
+    def __str__(self):
+        return str(ze_api_version_v(self.value))
+
+
+###############################################################################
+## @brief Supported device types
+class ze_device_type_v(IntEnum):
+    GPU = 1                                                                 ## Graphics Processing Unit
+    CPU = 2                                                                 ## Central Processing Unit
+    FPGA = 3                                                                ## Field Programmable Gate Array
+    MCA = 4                                                                 ## Memory Copy Accelerator
+    VPU = 5                                                                 ## Vision Processing Unit
+
+class ze_device_type_t(c_int):
+    def __str__(self):
+        return str(ze_device_type_v(self.value))
+
+
+###############################################################################
+## @brief Maximum device universal unique id (UUID) size in bytes
+ZE_MAX_DEVICE_UUID_SIZE = 16
+
+###############################################################################
+## @brief Device universal unique id (UUID)
+class ze_device_uuid_t(Structure):
+    _fields_ = [
+        ("id", c_ubyte * ZE_MAX_DEVICE_UUID_SIZE)                       ## [out] opaque data representing a device UUID
+    ]
+
+###############################################################################
+## @brief Maximum device name string size
+ZE_MAX_DEVICE_NAME = 256
+
+###############################################################################
+## @brief Supported device property flags
+class ze_device_property_flags_v(IntEnum):
+    INTEGRATED = ZE_BIT(0)                                                  ## Device is integrated with the Host.
+    SUBDEVICE = ZE_BIT(1)                                                   ## Device handle used for query represents a sub-device.
+    ECC = ZE_BIT(2)                                                         ## Device supports error correction memory access.
+    ONDEMANDPAGING = ZE_BIT(3)                                              ## Device supports on-demand page-faulting.
+
+class ze_device_property_flags_t(c_int):
+    def __str__(self):
+        return hex(self.value)
+
+
+###############################################################################
+## @brief Device properties queried using ::zeDeviceGetProperties
+class ze_device_properties_t(Structure):
+    _fields_ = [
+        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
+        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
+                                                                        ## structure (i.e. contains stype and pNext).
+        ("type", ze_device_type_t),                                     ## [out] generic device type
+        ("vendorId", c_uint32),                                         ## [out] vendor id from PCI configuration
+        ("deviceId", c_uint32),                                         ## [out] device id from PCI configuration.
+                                                                        ## Note, the device id uses little-endian format.
+        ("flags", ze_device_property_flags_t),                          ## [out] 0 (none) or a valid combination of ::ze_device_property_flag_t
+        ("subdeviceId", c_uint32),                                      ## [out] sub-device id. Only valid if ::ZE_DEVICE_PROPERTY_FLAG_SUBDEVICE
+                                                                        ## is set.
+        ("coreClockRate", c_uint32),                                    ## [out] Clock rate for device core.
+        ("maxMemAllocSize", c_uint64),                                  ## [out] Maximum memory allocation size.
+        ("maxHardwareContexts", c_uint32),                              ## [out] Maximum number of logical hardware contexts.
+        ("maxCommandQueuePriority", c_uint32),                          ## [out] Maximum priority for command queues. Higher value is higher
+                                                                        ## priority.
+        ("numThreadsPerEU", c_uint32),                                  ## [out] Maximum number of threads per EU.
+        ("physicalEUSimdWidth", c_uint32),                              ## [out] The physical EU simd width.
+        ("numEUsPerSubslice", c_uint32),                                ## [out] Maximum number of EUs per sub-slice.
+        ("numSubslicesPerSlice", c_uint32),                             ## [out] Maximum number of sub-slices per slice.
+        ("numSlices", c_uint32),                                        ## [out] Maximum number of slices.
+        ("timerResolution", c_uint64),                                  ## [out] Returns the resolution of device timer used for profiling,
+                                                                        ## timestamps, etc. When stype==::ZE_STRUCTURE_TYPE_DEVICE_PROPERTIES the
+                                                                        ## units are in nanoseconds. When
+                                                                        ## stype==::ZE_STRUCTURE_TYPE_DEVICE_PROPERTIES_1_2 units are in
+                                                                        ## cycles/sec
+        ("timestampValidBits", c_uint32),                               ## [out] Returns the number of valid bits in the timestamp value.
+        ("kernelTimestampValidBits", c_uint32),                         ## [out] Returns the number of valid bits in the kernel timestamp values
+        ("uuid", ze_device_uuid_t),                                     ## [out] universal unique identifier. Note: Subdevices will have their
+                                                                        ## own uuid.
+        ("name", c_char * ZE_MAX_DEVICE_NAME)                           ## [out] Device name
+    ]
+
+###############################################################################
+__use_win_types = "win32" == sys.platform
+
+###############################################################################
+## @brief Fast-call argument type: handles and pointers become c_void_p, so raw
+##        int addresses are accepted, and typedefs decay to their ctypes base
+def _fastcall_argtype(argtype):
+    if issubclass(argtype, c_void_p) or isinstance(getattr(argtype, "_type_", None), type):
+        return c_void_p
+    for base in argtype.__mro__:
+        if base.__module__ == "ctypes":
+            return base
+    return argtype
+
+_fastcall_types = {}
+
+###############################################################################
+## @brief Returns the (cached) fast-call equivalent of a function-pointer type
+def _fastcall_type(functype):
+    fasttype = _fastcall_types.get(functype)
+    if fasttype is None:
+        argtypes = [_fastcall_argtype(argtype) for argtype in functype._argtypes_]
+        if __use_win_types:
+            fasttype = WINFUNCTYPE( c_int, *argtypes )
+        else:
+            fasttype = CFUNCTYPE( c_int, *argtypes )
+        _fastcall_types[functype] = fasttype
+    return fasttype
+
+###############################################################################
+## @brief Fast-call view of a device-driver interface
+## 
+## @details
+##     - Functions are bound to the same driver entry points as the ddi, but
+##       take handles and pointers as raw int addresses (or byref/ctypes
+##       objects), and return the result as a plain int.
+##     - 0 is ::ZE_RESULT_SUCCESS; only other values need converting with
+##       ze_result_v.
+##     - Unsupported functions raise ::UnsupportedFunctionError as on the ddi.
+class ZE_FASTCALL:
+    def __init__(self, ddi):
+        self.__ddi = ddi
+
+    def __getattr__(self, name):
+        try:
+            table, pfn, functype = self.__ddi._functions[name]
+        except (KeyError, AttributeError):
+            raise AttributeError(name) from None
+
+        _table = self.__ddi._get_table(table)
+        if _table is None or not getattr(_table, pfn):
+            func = getattr(self.__ddi, name)
+        else:
+            func = _fastcall_type(self.__ddi._functype(functype))(getattr(_table, pfn))
+        setattr(self, name, func)
+        return func
+
+###############################################################################
+## @brief Raised when calling a function whose ddi table, or table entry, was
+##        not provided by the driver
+class UnsupportedFunctionError(Exception):
+    def __init__(self, function, table, result):
+        super().__init__("%s is not supported by the driver (%s table: %s)" % (function, table, result.name))
+        self.function = function
+        self.table = table
+        self.result = result
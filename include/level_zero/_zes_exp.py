@@ -0,0 +1,339 @@
+"""
+ Copyright (C) 2019-2021 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+ @file _zes_exp.py
+ @version v1.13-r1.13.1
+
+ Experimental definitions of zes.py, defined on first access through
+ level_zero.zes.
+
+ """
+import sys
+from ctypes import *
+from enum import *
+
+from ._common import (
+    ze_bool_t, ze_result_t
+    )
+
+from .zes import (
+    zes_device_handle_t, zes_driver_handle_t, zes_engine_group_t,
+    zes_firmware_handle_t, zes_mem_loc_t, zes_pci_address_t,
+    zes_power_domain_t, zes_ras_handle_t, zes_structure_type_t, zes_uuid_t,
+    zes_vf_handle_t, zes_vf_info_mem_type_exp_flags_t,
+    zes_vf_info_util_exp_flags_t
+    )
+
+###############################################################################
+__use_win_types = "win32" == sys.platform
+
+###############################################################################
+## @brief RAS error categories
+class zes_ras_error_category_exp_v(IntEnum):
+    RESET = 0                                                               ## The number of accelerator engine resets attempted by the driver
+    PROGRAMMING_ERRORS = 1                                                  ## The number of hardware exceptions generated by the way workloads have
+                                                                            ## programmed the hardware
+    DRIVER_ERRORS = 2                                                       ## The number of low level driver communication errors have occurred
+    COMPUTE_ERRORS = 3                                                      ## The number of errors that have occurred in the compute accelerator
+                                                                            ## hardware
+    NON_COMPUTE_ERRORS = 4                                                  ## The number of errors that have occurred in the fixed-function
+                                                                            ## accelerator hardware
+    CACHE_ERRORS = 5                                                        ## The number of errors that have occurred in caches (L1/L3/register
+                                                                            ## file/shared local memory/sampler)
+    DISPLAY_ERRORS = 6                                                      ## The number of errors that have occurred in the display
+    MEMORY_ERRORS = 7                                                       ## The number of errors that have occurred in Memory
+    SCALE_ERRORS = 8                                                        ## The number of errors that have occurred in Scale Fabric
+    L3FABRIC_ERRORS = 9                                                     ## The number of errors that have occurred in L3 Fabric
+
+class zes_ras_error_category_exp_t(c_int):
+    def __str__(self):
+        return str(zes_ras_error_category_exp_v(self.value))
+
+
+###############################################################################
+## @brief Extension structure for providing RAS error counters for different
+##        error sets
+class zes_ras_state_exp_t(Structure):
+    _fields_ = [
+        ("category", zes_ras_error_category_exp_t),                     ## [out] category for which error counter is provided.
+        ("errorCounter", c_uint64)                                      ## [out] Current value of RAS counter for specific error category.
+    ]
+
+###############################################################################
+## @brief Extension properties for Memory State
+## 
+## @details
+##     - This structure may be returned from ::zesMemoryGetState via the
+##       `pNext` member of ::zes_mem_state_t
+##     - These additional parameters get Memory Page Offline Metrics
+class zes_mem_page_offline_state_exp_t(Structure):
+    _fields_ = [
+        ("stype", zes_structure_type_t),                                ## [in] type of this structure
+        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
+                                                                        ## structure (i.e. contains stype and pNext).
+        ("memoryPageOffline", c_uint32),                                ## [out] Returns the number of Memory Pages Offline
+        ("maxMemoryPageOffline", c_uint32)                              ## [out] Returns the Allowed Memory Pages Offline
+    ]
+
+###############################################################################
+## @brief Extension properties for reporting valid bit count for memory
+##        bandwidth counter value
+## 
+## @details
+##     - Number of valid read and write counter bits of memory bandwidth
+##     - This structure may be returned from ::zesMemoryGetProperties via the
+##       `pNext` member of ::zes_mem_properties_t.
+##     - Used for denoting number of valid bits in the counter value returned
+##       in ::zes_mem_bandwidth_t.
+class zes_mem_bandwidth_counter_bits_exp_properties_t(Structure):
+    _fields_ = [
+        ("stype", zes_structure_type_t),                                ## [in] type of this structure
+        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
+                                                                        ## structure (i.e. contains stype and pNext).
+        ("validBitsCount", c_uint32)                                    ## [out] Returns the number of valid bits in the counter values
+    ]
+
+###############################################################################
+## @brief Extension structure for providing power domain information associated
+##        with a power handle
+## 
+## @details
+##     - This structure may be returned from ::zesPowerGetProperties via the
+##       `pNext` member of ::zes_power_properties_t.
+##     - Used for associating a power handle with a power domain.
+class zes_power_domain_exp_properties_t(Structure):
+    _fields_ = [
+        ("stype", zes_structure_type_t),                                ## [in] type of this structure
+        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
+                                                                        ## structure (i.e. contains stype and pNext).
+        ("powerDomain", zes_power_domain_t)                             ## [out] Power domain associated with the power handle.
+    ]
+
+###############################################################################
+## @brief Sub Device Properties
+class zes_subdevice_exp_properties_t(Structure):
+    _fields_ = [
+        ("stype", zes_structure_type_t),                                ## [in] type of this structure
+        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
+                                                                        ## structure (i.e. contains stype and pNext).
+        ("subdeviceId", c_uint32),                                      ## [out] this gives the ID of the sub device
+        ("uuid", zes_uuid_t)                                            ## [out] universal unique identifier of the sub device.
+    ]
+
+###############################################################################
+## @brief Virtual function management properties (deprecated)
+class zes_vf_exp_properties_t(Structure):
+    _fields_ = [
+        ("stype", zes_structure_type_t),                                ## [in] type of this structure
+        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
+                                                                        ## structure (i.e. contains stype and pNext).
+        ("address", zes_pci_address_t),                                 ## [out] Virtual function BDF address
+        ("uuid", zes_uuid_t),                                           ## [out] universal unique identifier of the device
+        ("flags", zes_vf_info_util_exp_flags_t)                         ## [out] utilization flags available. May be 0 or a valid combination of
+                                                                        ## ::zes_vf_info_util_exp_flag_t.
+    ]
+
+###############################################################################
+## @brief Provides memory utilization values for a virtual function (deprecated)
+class zes_vf_util_mem_exp_t(Structure):
+    _fields_ = [
+        ("stype", zes_structure_type_t),                                ## [in] type of this structure
+        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
+                                                                        ## structure (i.e. contains stype and pNext).
+        ("memTypeFlags", zes_vf_info_mem_type_exp_flags_t),             ## [out] Memory type flags.
+        ("free", c_uint64),                                             ## [out] Free memory size in bytes.
+        ("size", c_uint64),                                             ## [out] Total allocatable memory in bytes.
+        ("timestamp", c_uint64)                                         ## [out] Wall clock time from VF when value was sampled.
+    ]
+
+###############################################################################
+## @brief Provides engine utilization values for a virtual function (deprecated)
+class zes_vf_util_engine_exp_t(Structure):
+    _fields_ = [
+        ("stype", zes_structure_type_t),                                ## [in] type of this structure
+        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
+                                                                        ## structure (i.e. contains stype and pNext).
+        ("type", zes_engine_group_t),                                   ## [out] The engine group.
+        ("activeCounterValue", c_uint64),                               ## [out] Represents active counter.
+        ("samplingCounterValue", c_uint64),                             ## [out] Represents counter value when activeCounterValue was sampled.
+        ("timestamp", c_uint64)                                         ## [out] Wall clock time when the activeCounterValue was sampled.
+    ]
+
+###############################################################################
+## @brief Virtual function management capabilities (deprecated)
+class zes_vf_exp_capabilities_t(Structure):
+    _fields_ = [
+        ("stype", zes_structure_type_t),                                ## [in] type of this structure
+        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
+                                                                        ## structure (i.e. contains stype and pNext).
+        ("address", zes_pci_address_t),                                 ## [out] Virtual function BDF address
+        ("vfDeviceMemSize", c_uint32),                                  ## [out] Virtual function memory size in kilo bytes
+        ("vfID", c_uint32)                                              ## [out] Virtual Function ID
+    ]
+
+###############################################################################
+## @brief Virtual function management capabilities
+class zes_vf_exp2_capabilities_t(Structure):
+    _fields_ = [
+        ("stype", zes_structure_type_t),                                ## [in] type of this structure
+        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
+                                                                        ## structure (i.e. contains stype and pNext).
+        ("address", zes_pci_address_t),                                 ## [out] Virtual function BDF address
+        ("vfDeviceMemSize", c_uint64),                                  ## [out] Virtual function memory size in bytes
+        ("vfID", c_uint32)                                              ## [out] Virtual Function ID
+    ]
+
+###############################################################################
+## @brief Provides memory utilization values for a virtual function
+class zes_vf_util_mem_exp2_t(Structure):
+    _fields_ = [
+        ("stype", zes_structure_type_t),                                ## [in] type of this structure
+        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
+                                                                        ## structure (i.e. contains stype and pNext).
+        ("vfMemLocation", zes_mem_loc_t),                               ## [out] Location of this memory (system, device)
+        ("vfMemUtilized", c_uint64)                                     ## [out] Utilized memory size in bytes.
+    ]
+
+###############################################################################
+## @brief Provides engine utilization values for a virtual function
+## 
+## @details
+##     - Percent utilization is calculated by taking two snapshots (s1, s2) and
+##       using the equation: %util = (s2.activeCounterValue -
+##       s1.activeCounterValue) / (s2.samplingCounterValue -
+##       s1.samplingCounterValue)
+class zes_vf_util_engine_exp2_t(Structure):
+    _fields_ = [
+        ("stype", zes_structure_type_t),                                ## [in] type of this structure
+        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
+                                                                        ## structure (i.e. contains stype and pNext).
+        ("vfEngineType", zes_engine_group_t),                           ## [out] The engine group.
+        ("activeCounterValue", c_uint64),                               ## [out] Represents active counter.
+        ("samplingCounterValue", c_uint64)                              ## [out] Represents counter value when activeCounterValue was sampled.
+                                                                        ## Refer to the formulae above for calculating the utilization percent
+    ]
+
+###############################################################################
+## @brief Function-pointer for zesDeviceGetSubDevicePropertiesExp
+if __use_win_types:
+    _zesDeviceGetSubDevicePropertiesExp_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_subdevice_exp_properties_t) )
+else:
+    _zesDeviceGetSubDevicePropertiesExp_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_subdevice_exp_properties_t) )
+
+###############################################################################
+## @brief Function-pointer for zesDeviceEnumActiveVFExp
+if __use_win_types:
+    _zesDeviceEnumActiveVFExp_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_vf_handle_t) )
+else:
+    _zesDeviceEnumActiveVFExp_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_vf_handle_t) )
+
+###############################################################################
+## @brief Function-pointer for zesDeviceEnumEnabledVFExp
+if __use_win_types:
+    _zesDeviceEnumEnabledVFExp_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_vf_handle_t) )
+else:
+    _zesDeviceEnumEnabledVFExp_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_vf_handle_t) )
+
+
+###############################################################################
+## @brief Function-pointer for zesDriverGetDeviceByUuidExp
+if __use_win_types:
+    _zesDriverGetDeviceByUuidExp_t = WINFUNCTYPE( ze_result_t, zes_driver_handle_t, zes_uuid_t, POINTER(zes_device_handle_t), POINTER(ze_bool_t), POINTER(c_uint32) )
+else:
+    _zesDriverGetDeviceByUuidExp_t = CFUNCTYPE( ze_result_t, zes_driver_handle_t, zes_uuid_t, POINTER(zes_device_handle_t), POINTER(ze_bool_t), POINTER(c_uint32) )
+
+
+###############################################################################
+## @brief Function-pointer for zesFirmwareGetSecurityVersionExp
+if __use_win_types:
+    _zesFirmwareGetSecurityVersionExp_t = WINFUNCTYPE( ze_result_t, zes_firmware_handle_t, c_char_p )
+else:
+    _zesFirmwareGetSecurityVersionExp_t = CFUNCTYPE( ze_result_t, zes_firmware_handle_t, c_char_p )
+
+###############################################################################
+## @brief Function-pointer for zesFirmwareSetSecurityVersionExp
+if __use_win_types:
+    _zesFirmwareSetSecurityVersionExp_t = WINFUNCTYPE( ze_result_t, zes_firmware_handle_t )
+else:
+    _zesFirmwareSetSecurityVersionExp_t = CFUNCTYPE( ze_result_t, zes_firmware_handle_t )
+
+
+###############################################################################
+## @brief Function-pointer for zesRasGetStateExp
+if __use_win_types:
+    _zesRasGetStateExp_t = WINFUNCTYPE( ze_result_t, zes_ras_handle_t, POINTER(c_uint32), POINTER(zes_ras_state_exp_t) )
+else:
+    _zesRasGetStateExp_t = CFUNCTYPE( ze_result_t, zes_ras_handle_t, POINTER(c_uint32), POINTER(zes_ras_state_exp_t) )
+
+###############################################################################
+## @brief Function-pointer for zesRasClearStateExp
+if __use_win_types:
+    _zesRasClearStateExp_t = WINFUNCTYPE( ze_result_t, zes_ras_handle_t, zes_ras_error_category_exp_t )
+else:
+    _zesRasClearStateExp_t = CFUNCTYPE( ze_result_t, zes_ras_handle_t, zes_ras_error_category_exp_t )
+
+
+###############################################################################
+## @brief Function-pointer for zesVFManagementGetVFPropertiesExp
+if __use_win_types:
+    _zesVFManagementGetVFPropertiesExp_t = WINFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(zes_vf_exp_properties_t) )
+else:
+    _zesVFManagementGetVFPropertiesExp_t = CFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(zes_vf_exp_properties_t) )
+
+###############################################################################
+## @brief Function-pointer for zesVFManagementGetVFMemoryUtilizationExp
+if __use_win_types:
+    _zesVFManagementGetVFMemoryUtilizationExp_t = WINFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(c_uint32), POINTER(zes_vf_util_mem_exp_t) )
+else:
+    _zesVFManagementGetVFMemoryUtilizationExp_t = CFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(c_uint32), POINTER(zes_vf_util_mem_exp_t) )
+
+###############################################################################
+## @brief Function-pointer for zesVFManagementGetVFEngineUtilizationExp
+if __use_win_types:
+    _zesVFManagementGetVFEngineUtilizationExp_t = WINFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(c_uint32), POINTER(zes_vf_util_engine_exp_t) )
+else:
+    _zesVFManagementGetVFEngineUtilizationExp_t = CFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(c_uint32), POINTER(zes_vf_util_engine_exp_t) )
+
+###############################################################################
+## @brief Function-pointer for zesVFManagementSetVFTelemetryModeExp
+if __use_win_types:
+    _zesVFManagementSetVFTelemetryModeExp_t = WINFUNCTYPE( ze_result_t, zes_vf_handle_t, zes_vf_info_util_exp_flags_t, ze_bool_t )
+else:
+    _zesVFManagementSetVFTelemetryModeExp_t = CFUNCTYPE( ze_result_t, zes_vf_handle_t, zes_vf_info_util_exp_flags_t, ze_bool_t )
+
+###############################################################################
+## @brief Function-pointer for zesVFManagementSetVFTelemetrySamplingIntervalExp
+if __use_win_types:
+    _zesVFManagementSetVFTelemetrySamplingIntervalExp_t = WINFUNCTYPE( ze_result_t, zes_vf_handle_t, zes_vf_info_util_exp_flags_t, c_uint64 )
+else:
+    _zesVFManagementSetVFTelemetrySamplingIntervalExp_t = CFUNCTYPE( ze_result_t, zes_vf_handle_t, zes_vf_info_util_exp_flags_t, c_uint64 )
+
+###############################################################################
+## @brief Function-pointer for zesVFManagementGetVFCapabilitiesExp
+if __use_win_types:
+    _zesVFManagementGetVFCapabilitiesExp_t = WINFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(zes_vf_exp_capabilities_t) )
+else:
+    _zesVFManagementGetVFCapabilitiesExp_t = CFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(zes_vf_exp_capabilities_t) )
+
+###############################################################################
+## @brief Function-pointer for zesVFManagementGetVFMemoryUtilizationExp2
+if __use_win_types:
+    _zesVFManagementGetVFMemoryUtilizationExp2_t = WINFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(c_uint32), POINTER(zes_vf_util_mem_exp2_t) )
+else:
+    _zesVFManagementGetVFMemoryUtilizationExp2_t = CFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(c_uint32), POINTER(zes_vf_util_mem_exp2_t) )
+
+###############################################################################
+## @brief Function-pointer for zesVFManagementGetVFEngineUtilizationExp2
+if __use_win_types:
+    _zesVFManagementGetVFEngineUtilizationExp2_t = WINFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(c_uint32), POINTER(zes_vf_util_engine_exp2_t) )
+else:
+    _zesVFManagementGetVFEngineUtilizationExp2_t = CFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(c_uint32), POINTER(zes_vf_util_engine_exp2_t) )
+
+###############################################################################
+## @brief Function-pointer for zesVFManagementGetVFCapabilitiesExp2
+if __use_win_types:
+    _zesVFManagementGetVFCapabilitiesExp2_t = WINFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(zes_vf_exp2_capabilities_t) )
+else:
+    _zesVFManagementGetVFCapabilitiesExp2_t = CFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(zes_vf_exp2_capabilities_t) )
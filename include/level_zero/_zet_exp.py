@@ -0,0 +1,474 @@
+"""
+ Copyright (C) 2019-2021 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+ @file _zet_exp.py
+ @version v1.13-r1.13.1
+
+ Experimental definitions of zet.py, defined on first access through
+ level_zero.zet.
+
+ """
+import sys
+from ctypes import *
+from enum import *
+
+from .ze import (
+    ze_bool_t, ze_driver_handle_t, ze_event_handle_t, ze_result_t
+    )
+
+from .zet import (
+    ZET_MAX_METRIC_PROGRAMMABLE_COMPONENT_EXP,
+    ZET_MAX_METRIC_PROGRAMMABLE_DESCRIPTION_EXP,
+    ZET_MAX_METRIC_PROGRAMMABLE_NAME_EXP,
+    ZET_MAX_METRIC_PROGRAMMABLE_PARAMETER_NAME_EXP,
+    ZET_MAX_METRIC_PROGRAMMABLE_VALUE_DESCRIPTION_EXP,
+    zet_command_list_handle_t, zet_context_handle_t, zet_device_handle_t,
+    zet_metric_group_calculation_type_t, zet_metric_group_handle_t,
+    zet_metric_group_sampling_type_flags_t, zet_metric_group_type_exp_flags_t,
+    zet_metric_handle_t, zet_structure_type_t, zet_typed_value_t, zet_value_t
+    )
+
+###############################################################################
+__use_win_types = "win32" == sys.platform
+
+###############################################################################
+## @brief Handle of metric tracer's object
+class zet_metric_tracer_exp_handle_t(c_void_p):
+    pass
+
+###############################################################################
+## @brief Handle of metric decoder's object
+class zet_metric_decoder_exp_handle_t(c_void_p):
+    pass
+
+###############################################################################
+## @brief Metric tracer descriptor
+class zet_metric_tracer_exp_desc_t(Structure):
+    _fields_ = [
+        ("stype", zet_structure_type_t),                                ## [in] type of this structure
+        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
+                                                                        ## structure (i.e. contains stype and pNext).
+        ("notifyEveryNBytes", c_uint32)                                 ## [in,out] number of collected bytes after which notification event will
+                                                                        ## be signaled. If the requested value is not supported exactly, then the
+                                                                        ## driver may use a value that is the closest supported approximation and
+                                                                        ## shall update this member during ::zetMetricTracerCreateExp.
+    ]
+
+###############################################################################
+## @brief Decoded metric entry
+class zet_metric_entry_exp_t(Structure):
+    _fields_ = [
+        ("value", zet_value_t),                                         ## [out] value of the decodable metric entry or event. Number is
+                                                                        ## meaningful based on the metric type.
+        ("timeStamp", c_uint64),                                        ## [out] timestamp at which the event happened.
+        ("metricIndex", c_uint32),                                      ## [out] index to the decodable metric handle in the input array
+                                                                        ## (phMetric) in ::zetMetricTracerDecodeExp().
+        ("onSubdevice", ze_bool_t),                                     ## [out] True if the event occurred on a sub-device; false means the
+                                                                        ## device on which the metric tracer was opened does not have
+                                                                        ## sub-devices.
+        ("subdeviceId", c_uint32)                                       ## [out] If onSubdevice is true, this gives the ID of the sub-device.
+    ]
+
+###############################################################################
+## @brief Query the metric group type using `pNext` of
+##        ::zet_metric_group_properties_t
+class zet_metric_group_type_exp_t(Structure):
+    _fields_ = [
+        ("stype", zet_structure_type_t),                                ## [in] type of this structure
+        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
+                                                                        ## structure (i.e. contains stype and pNext).
+        ("type", zet_metric_group_type_exp_flags_t)                     ## [out] metric group type.
+                                                                        ## returns a combination of ::zet_metric_group_type_exp_flags_t.
+    ]
+
+###############################################################################
+## @brief Exported dma_buf properties queried using `pNext` of
+##        ::zet_metric_group_properties_t or ::zet_metric_properties_t
+class zet_export_dma_buf_exp_properties_t(Structure):
+    _fields_ = [
+        ("stype", zet_structure_type_t),                                ## [in] type of this structure
+        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
+                                                                        ## structure (i.e. contains stype and pNext).
+        ("fd", c_int),                                                  ## [out] the file descriptor handle that could be used to import the
+                                                                        ## memory by the host process.
+        ("size", c_size_t)                                              ## [out] size in bytes of the dma_buf
+    ]
+
+###############################################################################
+## @brief Query the metric source unique identifier using `pNext` of
+##        ::zet_metric_group_properties_t
+class zet_metric_source_id_exp_t(Structure):
+    _fields_ = [
+        ("stype", zet_structure_type_t),                                ## [in] type of this structure
+        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
+                                                                        ## structure (i.e. contains stype and pNext).
+        ("sourceId", c_uint32)                                          ## [out] unique number representing the Metric Source.
+    ]
+
+###############################################################################
+## @brief Metric timestamps resolution
+## 
+## @details
+##     - This structure may be returned from ::zetMetricGroupGetProperties via
+##       the `pNext` member of ::zet_metric_group_properties_t.
+##     - Used for mapping metric timestamps to other timers.
+class zet_metric_global_timestamps_resolution_exp_t(Structure):
+    _fields_ = [
+        ("stype", zet_structure_type_t),                                ## [in] type of this structure
+        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
+                                                                        ## structure (i.e. contains stype and pNext).
+        ("timerResolution", c_uint64),                                  ## [out] Returns the resolution of metrics timer (used for timestamps) in
+                                                                        ## cycles/sec.
+        ("timestampValidBits", c_uint64)                                ## [out] Returns the number of valid bits in the timestamp value.
+    ]
+
+###############################################################################
+## @brief Metrics calculation descriptor
+class zet_metric_calculate_exp_desc_t(Structure):
+    _fields_ = [
+        ("stype", zet_structure_type_t),                                ## [in] type of this structure
+        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
+                                                                        ## structure (i.e. contains stype and pNext).
+        ("rawReportSkipCount", c_uint32)                                ## [in] number of reports to skip during calculation
+    ]
+
+###############################################################################
+## @brief Handle of metric programmable's object
+class zet_metric_programmable_exp_handle_t(c_void_p):
+    pass
+
+###############################################################################
+## @brief Metric Programmable properties queried using
+##        ::zetMetricProgrammableGetPropertiesExp
+class zet_metric_programmable_exp_properties_t(Structure):
+    _fields_ = [
+        ("stype", zet_structure_type_t),                                ## [in] type of this structure
+        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
+                                                                        ## structure (i.e. contains stype and pNext).
+        ("name", c_char * ZET_MAX_METRIC_PROGRAMMABLE_NAME_EXP),        ## [out] metric programmable name
+        ("description", c_char * ZET_MAX_METRIC_PROGRAMMABLE_DESCRIPTION_EXP),  ## [out] metric programmable description
+        ("component", c_char * ZET_MAX_METRIC_PROGRAMMABLE_COMPONENT_EXP),  ## [out] metric programmable component
+        ("tierNumber", c_uint32),                                       ## [out] tier number
+        ("domain", c_uint32),                                           ## [out] metric domain number.
+        ("parameterCount", c_uint32),                                   ## [out] number of parameters in the programmable
+        ("samplingType", zet_metric_group_sampling_type_flags_t),       ## [out] metric sampling type.
+                                                                        ## returns a combination of ::zet_metric_group_sampling_type_flag_t.
+        ("sourceId", c_uint32)                                          ## [out] unique metric source identifier(within platform)to identify the
+                                                                        ## HW block where the metric is collected.
+    ]
+
+###############################################################################
+## @brief Metric Programmable Parameter types
+class zet_metric_programmable_param_type_exp_v(IntEnum):
+    DISAGGREGATION = 0                                                      ## Metric is disaggregated.
+    LATENCY = 1                                                             ## Metric for latency measurement.
+    NORMALIZATION_UTILIZATION = 2                                           ## Produces normalization in percent using raw_metric * 100 / cycles / HW
+                                                                            ## instance_count.
+    NORMALIZATION_AVERAGE = 3                                               ## Produces normalization using raw_metric / HW instance_count.
+    NORMALIZATION_RATE = 4                                                  ## Produces normalization average using raw_metric / timestamp.
+    NORMALIZATION_BYTES = 5                                                 ## Produces normalization average using raw_metric * n bytes.
+    GENERIC = 6                                                             ## Generic Parameter type. Please refer the parameter's description.
+
+class zet_metric_programmable_param_type_exp_t(c_int):
+    def __str__(self):
+        return str(zet_metric_programmable_param_type_exp_v(self.value))
+
+
+###############################################################################
+## @brief Supported value info types
+class zet_value_info_type_exp_v(IntEnum):
+    UINT32 = 0                                                              ## 32-bit unsigned-integer
+    UINT64 = 1                                                              ## 64-bit unsigned-integer
+    FLOAT32 = 2                                                             ## 32-bit floating-point
+    FLOAT64 = 3                                                             ## 64-bit floating-point
+    BOOL8 = 4                                                               ## 8-bit boolean
+    UINT8 = 5                                                               ## 8-bit unsigned-integer
+    UINT16 = 6                                                              ## 16-bit unsigned-integer
+    UINT64_RANGE = 7                                                        ## 64-bit unsigned-integer range (minimum and maximum)
+    FLOAT64_RANGE = 8                                                       ## 64-bit floating point range (minimum and maximum)
+
+class zet_value_info_type_exp_t(c_int):
+    def __str__(self):
+        return str(zet_value_info_type_exp_v(self.value))
+
+
+###############################################################################
+## @brief Value info of type uint64_t range
+class zet_value_uint64_range_exp_t(Structure):
+    _fields_ = [
+        ("ui64Min", c_uint64),                                          ## [out] minimum value of the range
+        ("ui64Max", c_uint64)                                           ## [out] maximum value of the range
+    ]
+
+###############################################################################
+## @brief Value info of type float64 range
+class zet_value_fp64_range_exp_t(Structure):
+    _fields_ = [
+        ("fp64Min", c_double),                                          ## [out] minimum value of the range
+        ("fp64Max", c_double)                                           ## [out] maximum value of the range
+    ]
+
+###############################################################################
+## @brief Union of value information
+class zet_value_info_exp_t(Union):
+    _fields_ = [
+        ("ui32", c_uint32),                                             ## [out] 32-bit unsigned-integer
+        ("ui64", c_uint64),                                             ## [out] 64-bit unsigned-integer
+        ("fp32", c_float),                                              ## [out] 32-bit floating-point
+        ("fp64", c_double),                                             ## [out] 64-bit floating-point
+        ("b8", ze_bool_t),                                              ## [out] 8-bit boolean
+        ("ui8", c_ubyte),                                               ## [out] 8-bit unsigned integer
+        ("ui16", c_uint16),                                             ## [out] 16-bit unsigned integer
+        ("ui64Range", zet_value_uint64_range_exp_t),                    ## [out] minimum and maximum value of the range
+        ("fp64Range", zet_value_fp64_range_exp_t)                       ## [out] minimum and maximum value of the range
+    ]
+
+###############################################################################
+## @brief Metric Programmable parameter information
+class zet_metric_programmable_param_info_exp_t(Structure):
+    _fields_ = [
+        ("stype", zet_structure_type_t),                                ## [in] type of this structure
+        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
+                                                                        ## structure (i.e. contains stype and pNext).
+        ("type", zet_metric_programmable_param_type_exp_t),             ## [out] programmable parameter type
+        ("name", c_char * ZET_MAX_METRIC_PROGRAMMABLE_PARAMETER_NAME_EXP),  ## [out] metric programmable parameter name
+        ("valueInfoType", zet_value_info_type_exp_t),                   ## [out] value info type
+        ("defaultValue", zet_value_t),                                  ## [out] default value for the parameter
+        ("valueInfoCount", c_uint32)                                    ## [out] count of ::zet_metric_programmable_param_value_info_exp_t
+    ]
+
+###############################################################################
+## @brief Metric Programmable parameter value information
+class zet_metric_programmable_param_value_info_exp_t(Structure):
+    _fields_ = [
+        ("stype", zet_structure_type_t),                                ## [in] type of this structure
+        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
+                                                                        ## structure (i.e. contains stype and pNext).
+        ("valueInfo", zet_value_info_exp_t),                            ## [out] information about the parameter value
+        ("description", c_char * ZET_MAX_METRIC_PROGRAMMABLE_VALUE_DESCRIPTION_EXP) ## [out] description about the value
+    ]
+
+###############################################################################
+## @brief Metric Programmable parameter value
+class zet_metric_programmable_param_value_exp_t(Structure):
+    _fields_ = [
+        ("value", zet_value_t)                                          ## [in] parameter value
+    ]
+
+###############################################################################
+## @brief Function-pointer for zetMetricProgrammableGetExp
+if __use_win_types:
+    _zetMetricProgrammableGetExp_t = WINFUNCTYPE( ze_result_t, zet_device_handle_t, POINTER(c_uint32), POINTER(zet_metric_programmable_exp_handle_t) )
+else:
+    _zetMetricProgrammableGetExp_t = CFUNCTYPE( ze_result_t, zet_device_handle_t, POINTER(c_uint32), POINTER(zet_metric_programmable_exp_handle_t) )
+
+###############################################################################
+## @brief Function-pointer for zetMetricProgrammableGetPropertiesExp
+if __use_win_types:
+    _zetMetricProgrammableGetPropertiesExp_t = WINFUNCTYPE( ze_result_t, zet_metric_programmable_exp_handle_t, POINTER(zet_metric_programmable_exp_properties_t) )
+else:
+    _zetMetricProgrammableGetPropertiesExp_t = CFUNCTYPE( ze_result_t, zet_metric_programmable_exp_handle_t, POINTER(zet_metric_programmable_exp_properties_t) )
+
+###############################################################################
+## @brief Function-pointer for zetMetricProgrammableGetParamInfoExp
+if __use_win_types:
+    _zetMetricProgrammableGetParamInfoExp_t = WINFUNCTYPE( ze_result_t, zet_metric_programmable_exp_handle_t, POINTER(c_uint32), POINTER(zet_metric_programmable_param_info_exp_t) )
+else:
+    _zetMetricProgrammableGetParamInfoExp_t = CFUNCTYPE( ze_result_t, zet_metric_programmable_exp_handle_t, POINTER(c_uint32), POINTER(zet_metric_programmable_param_info_exp_t) )
+
+###############################################################################
+## @brief Function-pointer for zetMetricProgrammableGetParamValueInfoExp
+if __use_win_types:
+    _zetMetricProgrammableGetParamValueInfoExp_t = WINFUNCTYPE( ze_result_t, zet_metric_programmable_exp_handle_t, c_uint32, POINTER(c_uint32), POINTER(zet_metric_programmable_param_value_info_exp_t) )
+else:
+    _zetMetricProgrammableGetParamValueInfoExp_t = CFUNCTYPE( ze_result_t, zet_metric_programmable_exp_handle_t, c_uint32, POINTER(c_uint32), POINTER(zet_metric_programmable_param_value_info_exp_t) )
+
+
+###############################################################################
+## @brief Function-pointer for zetMetricTracerCreateExp
+if __use_win_types:
+    _zetMetricTracerCreateExp_t = WINFUNCTYPE( ze_result_t, zet_context_handle_t, zet_device_handle_t, c_uint32, POINTER(zet_metric_group_handle_t), POINTER(zet_metric_tracer_exp_desc_t), ze_event_handle_t, POINTER(zet_metric_tracer_exp_handle_t) )
+else:
+    _zetMetricTracerCreateExp_t = CFUNCTYPE( ze_result_t, zet_context_handle_t, zet_device_handle_t, c_uint32, POINTER(zet_metric_group_handle_t), POINTER(zet_metric_tracer_exp_desc_t), ze_event_handle_t, POINTER(zet_metric_tracer_exp_handle_t) )
+
+###############################################################################
+## @brief Function-pointer for zetMetricTracerDestroyExp
+if __use_win_types:
+    _zetMetricTracerDestroyExp_t = WINFUNCTYPE( ze_result_t, zet_metric_tracer_exp_handle_t )
+else:
+    _zetMetricTracerDestroyExp_t = CFUNCTYPE( ze_result_t, zet_metric_tracer_exp_handle_t )
+
+###############################################################################
+## @brief Function-pointer for zetMetricTracerEnableExp
+if __use_win_types:
+    _zetMetricTracerEnableExp_t = WINFUNCTYPE( ze_result_t, zet_metric_tracer_exp_handle_t, ze_bool_t )
+else:
+    _zetMetricTracerEnableExp_t = CFUNCTYPE( ze_result_t, zet_metric_tracer_exp_handle_t, ze_bool_t )
+
+###############################################################################
+## @brief Function-pointer for zetMetricTracerDisableExp
+if __use_win_types:
+    _zetMetricTracerDisableExp_t = WINFUNCTYPE( ze_result_t, zet_metric_tracer_exp_handle_t, ze_bool_t )
+else:
+    _zetMetricTracerDisableExp_t = CFUNCTYPE( ze_result_t, zet_metric_tracer_exp_handle_t, ze_bool_t )
+
+###############################################################################
+## @brief Function-pointer for zetMetricTracerReadDataExp
+if __use_win_types:
+    _zetMetricTracerReadDataExp_t = WINFUNCTYPE( ze_result_t, zet_metric_tracer_exp_handle_t, POINTER(c_size_t), POINTER(c_ubyte) )
+else:
+    _zetMetricTracerReadDataExp_t = CFUNCTYPE( ze_result_t, zet_metric_tracer_exp_handle_t, POINTER(c_size_t), POINTER(c_ubyte) )
+
+###############################################################################
+## @brief Function-pointer for zetMetricTracerDecodeExp
+if __use_win_types:
+    _zetMetricTracerDecodeExp_t = WINFUNCTYPE( ze_result_t, zet_metric_decoder_exp_handle_t, POINTER(c_size_t), POINTER(c_ubyte), c_uint32, POINTER(zet_metric_handle_t), POINTER(c_uint32), POINTER(c_uint32), POINTER(c_uint32), POINTER(zet_metric_entry_exp_t) )
+else:
+    _zetMetricTracerDecodeExp_t = CFUNCTYPE( ze_result_t, zet_metric_decoder_exp_handle_t, POINTER(c_size_t), POINTER(c_ubyte), c_uint32, POINTER(zet_metric_handle_t), POINTER(c_uint32), POINTER(c_uint32), POINTER(c_uint32), POINTER(zet_metric_entry_exp_t) )
+
+
+###############################################################################
+## @brief Function-pointer for zetMetricDecoderCreateExp
+if __use_win_types:
+    _zetMetricDecoderCreateExp_t = WINFUNCTYPE( ze_result_t, zet_metric_tracer_exp_handle_t, POINTER(zet_metric_decoder_exp_handle_t) )
+else:
+    _zetMetricDecoderCreateExp_t = CFUNCTYPE( ze_result_t, zet_metric_tracer_exp_handle_t, POINTER(zet_metric_decoder_exp_handle_t) )
+
+###############################################################################
+## @brief Function-pointer for zetMetricDecoderDestroyExp
+if __use_win_types:
+    _zetMetricDecoderDestroyExp_t = WINFUNCTYPE( ze_result_t, zet_metric_decoder_exp_handle_t )
+else:
+    _zetMetricDecoderDestroyExp_t = CFUNCTYPE( ze_result_t, zet_metric_decoder_exp_handle_t )
+
+###############################################################################
+## @brief Function-pointer for zetMetricDecoderGetDecodableMetricsExp
+if __use_win_types:
+    _zetMetricDecoderGetDecodableMetricsExp_t = WINFUNCTYPE( ze_result_t, zet_metric_decoder_exp_handle_t, POINTER(c_uint32), POINTER(zet_metric_handle_t) )
+else:
+    _zetMetricDecoderGetDecodableMetricsExp_t = CFUNCTYPE( ze_result_t, zet_metric_decoder_exp_handle_t, POINTER(c_uint32), POINTER(zet_metric_handle_t) )
+
+
+###############################################################################
+## @brief Function-pointer for zetDeviceGetConcurrentMetricGroupsExp
+if __use_win_types:
+    _zetDeviceGetConcurrentMetricGroupsExp_t = WINFUNCTYPE( ze_result_t, zet_device_handle_t, c_uint32, POINTER(zet_metric_group_handle_t), POINTER(c_uint32), POINTER(c_uint32) )
+else:
+    _zetDeviceGetConcurrentMetricGroupsExp_t = CFUNCTYPE( ze_result_t, zet_device_handle_t, c_uint32, POINTER(zet_metric_group_handle_t), POINTER(c_uint32), POINTER(c_uint32) )
+
+###############################################################################
+## @brief Function-pointer for zetDeviceCreateMetricGroupsFromMetricsExp
+if __use_win_types:
+    _zetDeviceCreateMetricGroupsFromMetricsExp_t = WINFUNCTYPE( ze_result_t, zet_device_handle_t, c_uint32, POINTER(zet_metric_handle_t), c_char_p, c_char_p, POINTER(c_uint32), POINTER(zet_metric_group_handle_t) )
+else:
+    _zetDeviceCreateMetricGroupsFromMetricsExp_t = CFUNCTYPE( ze_result_t, zet_device_handle_t, c_uint32, POINTER(zet_metric_handle_t), c_char_p, c_char_p, POINTER(c_uint32), POINTER(zet_metric_group_handle_t) )
+
+###############################################################################
+## @brief Function-pointer for zetDeviceEnableMetricsExp
+if __use_win_types:
+    _zetDeviceEnableMetricsExp_t = WINFUNCTYPE( ze_result_t, zet_device_handle_t )
+else:
+    _zetDeviceEnableMetricsExp_t = CFUNCTYPE( ze_result_t, zet_device_handle_t )
+
+###############################################################################
+## @brief Function-pointer for zetDeviceDisableMetricsExp
+if __use_win_types:
+    _zetDeviceDisableMetricsExp_t = WINFUNCTYPE( ze_result_t, zet_device_handle_t )
+else:
+    _zetDeviceDisableMetricsExp_t = CFUNCTYPE( ze_result_t, zet_device_handle_t )
+
+
+###############################################################################
+## @brief Function-pointer for zetCommandListAppendMarkerExp
+if __use_win_types:
+    _zetCommandListAppendMarkerExp_t = WINFUNCTYPE( ze_result_t, zet_command_list_handle_t, zet_metric_group_handle_t, c_uint32 )
+else:
+    _zetCommandListAppendMarkerExp_t = CFUNCTYPE( ze_result_t, zet_command_list_handle_t, zet_metric_group_handle_t, c_uint32 )
+
+
+###############################################################################
+## @brief Function-pointer for zetMetricCreateFromProgrammableExp
+if __use_win_types:
+    _zetMetricCreateFromProgrammableExp_t = WINFUNCTYPE( ze_result_t, zet_metric_programmable_exp_handle_t, POINTER(zet_metric_programmable_param_value_exp_t), c_uint32, c_char_p, c_char_p, POINTER(c_uint32), POINTER(zet_metric_handle_t) )
+else:
+    _zetMetricCreateFromProgrammableExp_t = CFUNCTYPE( ze_result_t, zet_metric_programmable_exp_handle_t, POINTER(zet_metric_programmable_param_value_exp_t), c_uint32, c_char_p, c_char_p, POINTER(c_uint32), POINTER(zet_metric_handle_t) )
+
+###############################################################################
+## @brief Function-pointer for zetMetricDestroyExp
+if __use_win_types:
+    _zetMetricDestroyExp_t = WINFUNCTYPE( ze_result_t, zet_metric_handle_t )
+else:
+    _zetMetricDestroyExp_t = CFUNCTYPE( ze_result_t, zet_metric_handle_t )
+
+###############################################################################
+## @brief Function-pointer for zetMetricCreateFromProgrammableExp2
+if __use_win_types:
+    _zetMetricCreateFromProgrammableExp2_t = WINFUNCTYPE( ze_result_t, zet_metric_programmable_exp_handle_t, c_uint32, POINTER(zet_metric_programmable_param_value_exp_t), c_char_p, c_char_p, POINTER(c_uint32), POINTER(zet_metric_handle_t) )
+else:
+    _zetMetricCreateFromProgrammableExp2_t = CFUNCTYPE( ze_result_t, zet_metric_programmable_exp_handle_t, c_uint32, POINTER(zet_metric_programmable_param_value_exp_t), c_char_p, c_char_p, POINTER(c_uint32), POINTER(zet_metric_handle_t) )
+
+
+###############################################################################
+## @brief Function-pointer for zetMetricGroupCalculateMultipleMetricValuesExp
+if __use_win_types:
+    _zetMetricGroupCalculateMultipleMetricValuesExp_t = WINFUNCTYPE( ze_result_t, zet_metric_group_handle_t, zet_metric_group_calculation_type_t, c_size_t, POINTER(c_ubyte), POINTER(c_uint32), POINTER(c_uint32), POINTER(c_uint32), POINTER(zet_typed_value_t) )
+else:
+    _zetMetricGroupCalculateMultipleMetricValuesExp_t = CFUNCTYPE( ze_result_t, zet_metric_group_handle_t, zet_metric_group_calculation_type_t, c_size_t, POINTER(c_ubyte), POINTER(c_uint32), POINTER(c_uint32), POINTER(c_uint32), POINTER(zet_typed_value_t) )
+
+###############################################################################
+## @brief Function-pointer for zetMetricGroupGetGlobalTimestampsExp
+if __use_win_types:
+    _zetMetricGroupGetGlobalTimestampsExp_t = WINFUNCTYPE( ze_result_t, zet_metric_group_handle_t, ze_bool_t, POINTER(c_uint64), POINTER(c_uint64) )
+else:
+    _zetMetricGroupGetGlobalTimestampsExp_t = CFUNCTYPE( ze_result_t, zet_metric_group_handle_t, ze_bool_t, POINTER(c_uint64), POINTER(c_uint64) )
+
+###############################################################################
+## @brief Function-pointer for zetMetricGroupGetExportDataExp
+if __use_win_types:
+    _zetMetricGroupGetExportDataExp_t = WINFUNCTYPE( ze_result_t, zet_metric_group_handle_t, POINTER(c_ubyte), c_size_t, POINTER(c_size_t), POINTER(c_ubyte) )
+else:
+    _zetMetricGroupGetExportDataExp_t = CFUNCTYPE( ze_result_t, zet_metric_group_handle_t, POINTER(c_ubyte), c_size_t, POINTER(c_size_t), POINTER(c_ubyte) )
+
+###############################################################################
+## @brief Function-pointer for zetMetricGroupCalculateMetricExportDataExp
+if __use_win_types:
+    _zetMetricGroupCalculateMetricExportDataExp_t = WINFUNCTYPE( ze_result_t, ze_driver_handle_t, zet_metric_group_calculation_type_t, c_size_t, POINTER(c_ubyte), POINTER(zet_metric_calculate_exp_desc_t), POINTER(c_uint32), POINTER(c_uint32), POINTER(c_uint32), POINTER(zet_typed_value_t) )
+else:
+    _zetMetricGroupCalculateMetricExportDataExp_t = CFUNCTYPE( ze_result_t, ze_driver_handle_t, zet_metric_group_calculation_type_t, c_size_t, POINTER(c_ubyte), POINTER(zet_metric_calculate_exp_desc_t), POINTER(c_uint32), POINTER(c_uint32), POINTER(c_uint32), POINTER(zet_typed_value_t) )
+
+###############################################################################
+## @brief Function-pointer for zetMetricGroupCreateExp
+if __use_win_types:
+    _zetMetricGroupCreateExp_t = WINFUNCTYPE( ze_result_t, zet_device_handle_t, c_char_p, c_char_p, zet_metric_group_sampling_type_flags_t, POINTER(zet_metric_group_handle_t) )
+else:
+    _zetMetricGroupCreateExp_t = CFUNCTYPE( ze_result_t, zet_device_handle_t, c_char_p, c_char_p, zet_metric_group_sampling_type_flags_t, POINTER(zet_metric_group_handle_t) )
+
+###############################################################################
+## @brief Function-pointer for zetMetricGroupAddMetricExp
+if __use_win_types:
+    _zetMetricGroupAddMetricExp_t = WINFUNCTYPE( ze_result_t, zet_metric_group_handle_t, zet_metric_handle_t, POINTER(c_size_t), c_char_p )
+else:
+    _zetMetricGroupAddMetricExp_t = CFUNCTYPE( ze_result_t, zet_metric_group_handle_t, zet_metric_handle_t, POINTER(c_size_t), c_char_p )
+
+###############################################################################
+## @brief Function-pointer for zetMetricGroupRemoveMetricExp
+if __use_win_types:
+    _zetMetricGroupRemoveMetricExp_t = WINFUNCTYPE( ze_result_t, zet_metric_group_handle_t, zet_metric_handle_t )
+else:
+    _zetMetricGroupRemoveMetricExp_t = CFUNCTYPE( ze_result_t, zet_metric_group_handle_t, zet_metric_handle_t )
+
+###############################################################################
+## @brief Function-pointer for zetMetricGroupCloseExp
+if __use_win_types:
+    _zetMetricGroupCloseExp_t = WINFUNCTYPE( ze_result_t, zet_metric_group_handle_t )
+else:
+    _zetMetricGroupCloseExp_t = CFUNCTYPE( ze_result_t, zet_metric_group_handle_t )
+
+###############################################################################
+## @brief Function-pointer for zetMetricGroupDestroyExp
+if __use_win_types:
+    _zetMetricGroupDestroyExp_t = WINFUNCTYPE( ze_result_t, zet_metric_group_handle_t )
+else:
+    _zetMetricGroupDestroyExp_t = CFUNCTYPE( ze_result_t, zet_metric_group_handle_t )
@@ -0,0 +1,302 @@
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+ @file aio.py
+
+ asyncio awaitables for event, fence and sysman event waits, served by a
+ fixed pool of waiter threads instead of one blocked thread per wait.
+
+ """
+import asyncio
+import threading
+import time
+from ctypes import *
+from ._common import ze_result_v
+
+_PENDING = object()
+
+## @brief Number of polls between points where the GIL is offered to the event
+##        loop thread
+_POLL_CHUNK = 256
+
+###############################################################################
+## @brief A wait handled by the pool
+##
+## @details
+##     - Event and fence waits poll query(handle), a non-blocking query
+##       function returning a ze_result_v value.
+##     - Other waits set query to None and poll(), which returns the result,
+##       or _PENDING if not complete, and raises on errors.
+##     - block(timeout) returns as poll() does, waiting at most 'timeout'
+##       seconds.
+class _Wait:
+    __slots__ = ("loop", "future", "query", "handle", "poll", "block")
+
+    def __init__(self, loop, future, query, handle, poll, block):
+        self.loop = loop
+        self.future = future
+        self.query = query
+        self.handle = handle
+        self.poll = poll
+        self.block = block
+
+## @brief Returns a non-blocking query function taking one handle, callable
+##        without releasing the GIL, which would otherwise be handed back and
+##        forth with the event loop thread on every poll
+_query_types = {}
+
+def _query(function):
+    # ctypes functions are unhashable; the entry keeps 'function' alive
+    entry = _query_types.get(id(function))
+    if entry is None or entry[0] is not function:
+        entry = (function, PYFUNCTYPE(c_int, c_void_p)(cast(function, c_void_p).value))
+        _query_types[id(function)] = entry
+    return entry[1]
+
+## @brief Returns the non-blocking query function of the ddi function 'name';
+##        raises UnsupportedFunctionError if the driver does not provide it
+def _query_function(ddi, name):
+    function = getattr(ddi.fastcall, name)
+    if not ddi.is_supported(name):
+        # the stub bound in place of the function raises the typed error
+        function()
+    return _query(function)
+
+def _check(r):
+    if r == ze_result_v.SUCCESS:
+        return None
+    if r == ze_result_v.NOT_READY:
+        return _PENDING
+    raise Exception(ze_result_v(r))
+
+def _resolve(completed):
+    for future, value, failed in completed:
+        if future.done():
+            continue
+        if failed:
+            future.set_exception(value)
+        else:
+            future.set_result(value)
+
+###############################################################################
+## @brief One thread of the pool and the waits it polls
+class _Worker:
+    def __init__(self, pool, index):
+        self.pool = pool
+        self.cond = threading.Condition()
+        self.incoming = []
+        self.pending = 0
+        self.idle = False
+        self.thread = threading.Thread(target=self.run, name="level_zero.aio-%d" % index, daemon=True)
+        self.thread.start()
+
+    def submit(self, wait):
+        with self.cond:
+            self.incoming.append(wait)
+            self.pending += 1
+            # a busy thread picks up new waits by its next poll
+            if self.idle:
+                self.cond.notify()
+
+    def finish(self, completed):
+        by_loop = {}
+        for wait, value, failed in completed:
+            by_loop.setdefault(wait.loop, []).append((wait.future, value, failed))
+        for loop, items in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(_resolve, items)
+            except RuntimeError:
+                # the loop was closed while waiting
+                pass
+        with self.cond:
+            self.pending -= len(completed)
+
+    def poll(self, waits, completed):
+        remaining = []
+        polled = 0
+        for wait in waits:
+            polled += 1
+            if polled == _POLL_CHUNK:
+                polled = 0
+                time.sleep(0)
+            if wait.query is not None:
+                r = wait.query(wait.handle)
+                if r == ze_result_v.NOT_READY:
+                    remaining.append(wait)
+                elif r == ze_result_v.SUCCESS:
+                    completed.append((wait, None, False))
+                else:
+                    completed.append((wait, Exception(ze_result_v(r)), True))
+                continue
+            try:
+                value = wait.poll()
+            except Exception as e:
+                completed.append((wait, e, True))
+                continue
+            if value is _PENDING:
+                remaining.append(wait)
+            else:
+                completed.append((wait, value, False))
+        return remaining
+
+    def run(self):
+        pool = self.pool
+        waits = []
+        interval = pool.min_poll
+        next_poll = 0
+        while True:
+            with self.cond:
+                while not self.incoming and not waits and not pool.closed:
+                    self.idle = True
+                    self.cond.wait()
+                    self.idle = False
+                if pool.closed:
+                    break
+                incoming = self.incoming
+                self.incoming = []
+
+            # new waits are polled once on arrival, then with the others
+            completed = []
+            if incoming:
+                waits += self.poll(incoming, completed)
+
+            now = time.perf_counter()
+            if waits and now >= next_poll:
+                start = now
+                waits = self.poll(waits, completed)
+                if completed:
+                    interval = pool.min_poll
+                else:
+                    # back off while nothing completes, and drop cancelled waits
+                    interval = min(interval * 2, pool.max_poll)
+                    for wait in waits:
+                        if wait.future.cancelled():
+                            completed.append((wait, None, False))
+                    if completed:
+                        waits = [wait for wait in waits if not wait.future.cancelled()]
+                # polling at most half the time leaves the GIL to the event loop
+                now = time.perf_counter()
+                next_poll = now + max(interval, now - start)
+
+            if not completed and waits:
+                # wait on the oldest until the next poll
+                wait = waits[0]
+                try:
+                    value = wait.block(max(next_poll - now, 0))
+                except Exception as e:
+                    completed.append((wait, e, True))
+                    waits.pop(0)
+                else:
+                    if value is not _PENDING:
+                        completed.append((wait, value, False))
+                        waits.pop(0)
+
+            if completed:
+                self.finish(completed)
+                # let the event loop run the callbacks before polling again
+                time.sleep(0)
+
+###############################################################################
+## @brief Resolves asyncio futures when events, fences or sysman events
+##        complete, using a fixed number of threads
+##
+## @details
+##     - Each thread polls its waits with zeEventQueryStatus, zeFenceQueryStatus
+##       or a zero timeout zesDriverEventListenEx, once on arrival and then
+##       every poll interval, which doubles from 'min_poll' up to 'max_poll'
+##       seconds while nothing completes; between polls it blocks on the
+##       oldest wait.
+##     - Futures resolve on the loop that created them, to None for events
+##       and fences; failures set an exception holding the ze_result_v.
+##     - The wait functions must be called from a running event loop.
+##     - Polling holds the GIL, so a single thread is usually fastest; more
+##       threads help when block() waits dominate.
+class Waiter:
+    def __init__(self, threads=1, min_poll=20e-6, max_poll=1e-3):
+        self.min_poll = min_poll
+        self.max_poll = max_poll
+        self.closed = False
+        self.__workers = [_Worker(self, i) for i in range(threads)]
+
+    ## @brief Number of waits not yet resolved
+    @property
+    def pending(self):
+        return sum(worker.pending for worker in self.__workers)
+
+    def __submit(self, query, handle, poll, block):
+        if self.closed:
+            raise RuntimeError("waiter is closed")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        worker = min(self.__workers, key=lambda worker: worker.pending)
+        worker.submit(_Wait(loop, future, query, handle, poll, block))
+        return future
+
+    ## @brief Returns a future resolved when 'hEvent' is signaled
+    def wait_event(self, ddi, hEvent):
+        query = _query_function(ddi, "zeEventQueryStatus")
+        synchronize = ddi.fastcall.zeEventHostSynchronize
+        return self.__submit(query, hEvent, None,
+                             lambda timeout: _check(synchronize(hEvent, int(timeout * 1e9))))
+
+    ## @brief Returns a future resolved when 'hFence' is signaled
+    def wait_fence(self, ddi, hFence):
+        query = _query_function(ddi, "zeFenceQueryStatus")
+        synchronize = ddi.fastcall.zeFenceHostSynchronize
+        return self.__submit(query, hFence, None,
+                             lambda timeout: _check(synchronize(hFence, int(timeout * 1e9))))
+
+    ## @brief Returns a future resolved with a list of the
+    ##        zes_event_type_flags_t value of each of 'devices', once any of
+    ##        them has events registered with zesDeviceEventRegister
+    def listen_events(self, ddi, hDriver, devices):
+        listen = ddi.fastcall.zesDriverEventListenEx
+        count = len(devices)
+        phDevices = (c_void_p * count)(*devices)
+        events = (c_uint32 * count)()
+        num = c_uint32(0)
+
+        def poll(timeout_ms=0):
+            r = _check(listen(hDriver, timeout_ms, count, phDevices, byref(num), events))
+            if r is _PENDING or num.value == 0:
+                return _PENDING
+            return list(events)
+
+        return self.__submit(None, None, poll, lambda timeout: poll(int(timeout * 1e3)))
+
+    ## @brief Stops the threads; unresolved futures are left pending
+    def close(self):
+        self.closed = True
+        for worker in self.__workers:
+            with worker.cond:
+                worker.cond.notify()
+        for worker in self.__workers:
+            worker.thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+_default = None
+
+###############################################################################
+## @brief Returns the shared single-thread ::Waiter
+def default_waiter():
+    global _default
+    if _default is None:
+        _default = Waiter()
+    return _default
+
+###############################################################################
+## @brief Awaits 'hEvent' with the shared ::Waiter
+async def event_host_synchronize(ddi, hEvent):
+    return await default_waiter().wait_event(ddi, hEvent)
+
+###############################################################################
+## @brief Awaits 'hFence' with the shared ::Waiter
+async def fence_host_synchronize(ddi, hFence):
+    return await default_waiter().wait_fence(ddi, hFence)
@@ -0,0 +1,215 @@
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+ @file kernels.py
+
+ Kernel handles of a module cached by name, with the group size and
+ argument values last set on each kernel, so launches only call the driver
+ for what changed.
+
+ """
+from ctypes import *
+from .ze import *
+
+###############################################################################
+## @brief Returns the bytes of a kernel argument value: bytes, a ctypes object
+##        (c_void_p for a pointer, e.g. a USM address), or None for a null
+##        pointer; a bare int has no size, so is rejected
+def _argument_bytes(value):
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+    if value is None:
+        return bytes(c_void_p())
+    if isinstance(value, int):
+        raise TypeError("kernel argument %d has no size: pass c_void_p(%d) for a pointer or a ctypes scalar, e.g. c_int32(%d)" % (value, value, value))
+    return string_at(addressof(value), sizeof(value))
+
+###############################################################################
+## @brief State of one kernel: its handle, group size and argument values as
+##        last set on the driver
+class _Kernel:
+    __slots__ = ("handle", "group_size", "arguments", "suggested")
+
+    def __init__(self, handle):
+        self.handle = handle
+        self.group_size = None
+        self.arguments = {}
+        self.suggested = {}
+
+###############################################################################
+## @brief Cache of the kernels of a module, skipping driver calls that would
+##        set a value the kernel already has
+##
+## @details
+##     - kernel(name) creates the kernel on first use, then returns the same
+##       handle.
+##     - suggest_group_size memoizes zeKernelSuggestGroupSize by global size.
+##     - set_group_size and set_argument compare the group size, or the
+##       argument bytes, with those last set on the kernel and call
+##       zeKernelSetGroupSize or zeKernelSetArgumentValue only if they differ.
+##     - launch(hCommandList, name, args, global_size) does all of the above
+##       and appends the launch; stats() counts the driver calls avoided,
+##       overall and per launch.
+##     - Values set on the kernel handles without the cache are not seen by
+##       it: call invalidate() afterwards.
+##     - Not thread-safe: use one cache per thread, as kernel arguments are
+##       state of the handle.
+class KernelCache:
+    def __init__(self, ddi, hModule, flags=0):
+        self.ddi = ddi
+        self.module = hModule
+        self.flags = flags
+        self.__fast = ddi.fastcall
+        self.__kernels = {}
+        self.__group_size = (c_uint32 * 3)()
+
+        self.launches = 0
+        self.creates = 0
+        self.suggest_calls = 0
+        self.suggest_hits = 0
+        self.group_size_sets = 0
+        self.group_size_skips = 0
+        self.argument_sets = 0
+        self.argument_skips = 0
+
+    @staticmethod
+    def __check(r):
+        if r != ze_result_v.SUCCESS:
+            raise Exception(ze_result_v(r))
+
+    def __get(self, name):
+        kernel = self.__kernels.get(name)
+        if kernel is None:
+            handle = ze_kernel_handle_t()
+            desc = ze_kernel_desc_t(ze_structure_type_v.KERNEL_DESC, None, self.flags,
+                name.encode() if isinstance(name, str) else name)
+            self.__check(self.__fast.zeKernelCreate(self.module, byref(desc), byref(handle)))
+            kernel = self.__kernels[name] = _Kernel(handle.value)
+            self.creates += 1
+        return kernel
+
+    ## @brief Returns the handle of kernel 'name', created on first use
+    def kernel(self, name):
+        return self.__get(name).handle
+
+    ## @brief Returns the group size (x, y, z) suggested for kernel 'name' and
+    ##        the global size (x, y, z), from the driver on first use
+    def suggest_group_size(self, name, x, y=1, z=1):
+        kernel = self.__get(name)
+        size = kernel.suggested.get((x, y, z))
+        if size is None:
+            group = self.__group_size
+            self.__check(self.__fast.zeKernelSuggestGroupSize(kernel.handle, x, y, z,
+                byref(group, 0), byref(group, 4), byref(group, 8)))
+            size = kernel.suggested[(x, y, z)] = (group[0], group[1], group[2])
+            self.suggest_calls += 1
+        else:
+            self.suggest_hits += 1
+        return size
+
+    ## @brief Sets the group size of kernel 'name', unless already set
+    def set_group_size(self, name, x, y=1, z=1):
+        kernel = self.__get(name)
+        if kernel.group_size == (x, y, z):
+            self.group_size_skips += 1
+            return
+        self.__check(self.__fast.zeKernelSetGroupSize(kernel.handle, x, y, z))
+        kernel.group_size = (x, y, z)
+        self.group_size_sets += 1
+
+    ## @brief Sets argument 'index' of kernel 'name' to 'value', unless already
+    ##        set to the same bytes
+    ##
+    ## @details
+    ##     - 'value' is bytes, a ctypes object, or None for a null pointer;
+    ##       pointers are passed as c_void_p and scalars as sized ctypes
+    ##       objects (c_int32, c_float...), a bare int raises TypeError.
+    def set_argument(self, name, index, value):
+        self.__set(self.__get(name), index, _argument_bytes(value), False)
+
+    ## @brief Sets argument 'index' of kernel 'name' to 'size' bytes of shared
+    ##        local memory, unless already set
+    def set_local_argument(self, name, index, size):
+        self.__set(self.__get(name), index, size, True)
+
+    def __set(self, kernel, index, value, local):
+        state = (local, value)
+        if kernel.arguments.get(index) == state:
+            self.argument_skips += 1
+            return
+        if local:
+            r = self.__fast.zeKernelSetArgumentValue(kernel.handle, index, value, None)
+        else:
+            r = self.__fast.zeKernelSetArgumentValue(kernel.handle, index, len(value), value)
+        if r != ze_result_v.SUCCESS:
+            # the driver may have left the previous value in place or not
+            kernel.arguments.pop(index, None)
+            raise Exception(ze_result_v(r))
+        kernel.arguments[index] = state
+        self.argument_sets += 1
+
+    ## @brief Appends a launch of kernel 'name' over 'global_size' (x, y, z)
+    ##        work-items to 'hCommandList', setting 'args' first; returns the
+    ##        ze_group_count_t launched
+    ##
+    ## @details
+    ##     - args[i] is the value of argument i, as for set_argument.
+    ##     - The group size is 'group_size', or the size suggested for
+    ##       'global_size'; the group count is rounded up.
+    def launch(self, hCommandList, name, args, global_size, group_size=None,
+               hSignalEvent=None, phWaitEvents=None):
+        kernel = self.__get(name)
+        x, y, z = tuple(global_size) + (1,) * (3 - len(global_size))
+        if group_size is None:
+            group_size = self.suggest_group_size(name, x, y, z)
+        gx, gy, gz = tuple(group_size) + (1,) * (3 - len(group_size))
+        self.set_group_size(name, gx, gy, gz)
+        for index, value in enumerate(args):
+            self.__set(kernel, index, _argument_bytes(value), False)
+        count = ze_group_count_t(-(-x // gx), -(-y // gy), -(-z // gz))
+        waits = len(phWaitEvents) if phWaitEvents else 0
+        if waits:
+            phWaitEvents = (ze_event_handle_t * waits)(*phWaitEvents)
+        self.__check(self.__fast.zeCommandListAppendLaunchKernel(hCommandList, kernel.handle, byref(count),
+            hSignalEvent, waits, phWaitEvents))
+        self.launches += 1
+        return count
+
+    ## @brief Forgets the group size and argument values of kernel 'name', or
+    ##        of every kernel, so they are set again on next use
+    def invalidate(self, name=None):
+        for kernel in ([self.__kernels[name]] if name is not None else self.__kernels.values()):
+            kernel.group_size = None
+            kernel.arguments.clear()
+
+    ## @brief Returns the cache counters; avoided_per_launch is the mean
+    ##        number of driver calls skipped by each launch
+    def stats(self):
+        avoided = self.suggest_hits + self.group_size_skips + self.argument_skips
+        return {
+            "kernels" : len(self.__kernels),
+            "launches" : self.launches,
+            "creates" : self.creates,
+            "suggest_calls" : self.suggest_calls,
+            "suggest_hits" : self.suggest_hits,
+            "group_size_sets" : self.group_size_sets,
+            "group_size_skips" : self.group_size_skips,
+            "argument_sets" : self.argument_sets,
+            "argument_skips" : self.argument_skips,
+            "avoided" : avoided,
+            "avoided_per_launch" : avoided / self.launches if self.launches else 0.0,
+        }
+
+    ## @brief Destroys the kernels of the cache
+    def close(self):
+        for kernel in self.__kernels.values():
+            self.__fast.zeKernelDestroy(kernel.handle)
+        self.__kernels = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,391 @@
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+ @file metrics.py
+
+ Bulk handling of metric values calculated by the zet API. Requires numpy.
+
+ """
+import queue
+import threading
+import time
+from ctypes import *
+import numpy
+from .zet import *
+from . import ze_dtypes
+
+###############################################################################
+## @brief zet_typed_value_t with the value union exposed once per value type
+_typed_value_dtype = numpy.dtype({
+    "names" : ["type", "u1", "u2", "u4", "u8", "f4", "f8"],
+    "formats" : ["i4", "u1", "u2", "u4", "u8", "f4", "f8"],
+    "offsets" : [0, 8, 8, 8, 8, 8, 8],
+    "itemsize" : 16})
+
+## @brief Union member read for each value type; strings have no value member
+_value_members = {
+    zet_value_type_v.UINT32 : "u4",
+    zet_value_type_v.UINT64 : "u8",
+    zet_value_type_v.FLOAT32 : "f4",
+    zet_value_type_v.FLOAT64 : "f8",
+    zet_value_type_v.BOOL8 : "u1",
+    zet_value_type_v.UINT8 : "u1",
+    zet_value_type_v.UINT16 : "u2",
+}
+
+###############################################################################
+## @brief Typed values decoded into one column per value type
+##
+## @details
+##     - columns[type] holds the values of that type in their native width,
+##       and indices[type] their positions in the decoded buffer.
+##     - types holds the value type of every position.
+##     - Types unknown to these bindings, e.g. from a newer driver, are keyed
+##       by their int value in indices and, as strings, have no column.
+class TypedValueColumns:
+    def __init__(self, types, columns, indices):
+        self.types = types
+        self.columns = columns
+        self.indices = indices
+
+    def __len__(self):
+        return len(self.types)
+
+    ## @brief Returns every value converted to float64, NaN for strings and
+    ##        unknown types
+    def as_float64(self):
+        values = numpy.full(len(self.types), numpy.nan)
+        for type, column in self.columns.items():
+            values[self.indices[type]] = column
+        return values
+
+###############################################################################
+## @brief Decodes a buffer of zet_typed_value_t into per-type columns
+##
+## @details
+##     - 'values' may be a numpy array with the ze_dtypes zet_typed_value_t
+##       dtype, a ctypes array of zet_typed_value_t, or any buffer holding
+##       'count' elements.
+##     - Values are grouped by type with a single stable sort, so each column
+##       keeps the order of the buffer.
+def decode_typed_values(values, count=-1):
+    raw = numpy.frombuffer(values, dtype=_typed_value_dtype, count=count)
+    types = raw["type"].copy()
+    order = numpy.argsort(types, kind="stable")
+    present, counts = numpy.unique(types, return_counts=True)
+
+    columns = {}
+    indices = {}
+    start = 0
+    for type, n in zip(present.tolist(), counts.tolist()):
+        index = order[start:start + n]
+        start += n
+        try:
+            type = zet_value_type_v(type)
+        except ValueError:
+            indices[type] = index
+            continue
+        indices[type] = index
+        member = _value_members.get(type)
+        if member is not None:
+            column = raw[member][index]
+            columns[type] = column.astype(bool) if type == zet_value_type_v.BOOL8 else column
+    return TypedValueColumns(types, columns, indices)
+
+###############################################################################
+## @brief Allocates an array for 'count' zet_typed_value_t results
+def typed_values(count):
+    return ze_dtypes.zeros("zet_typed_value_t", count)
+
+###############################################################################
+## @brief Calculates typed metric values from raw streamer data of a metric group
+##
+## @details
+##     - Queries the group's metric count once, and reuses the typed value array
+##       across calls while it is large enough.
+class MetricCalculator:
+    def __init__(self, ddi, group):
+        self.ddi = ddi
+        self.group = group
+        properties = zet_metric_group_properties_t()
+        properties.stype = zet_structure_type_v.METRIC_GROUP_PROPERTIES
+        r = ze_result_v(ddi.zetMetricGroupGetProperties(group, byref(properties)).value)
+        if r != ze_result_v.SUCCESS:
+            raise Exception(r)
+        self.metric_count = properties.metricCount
+        self.__values = typed_values(0)
+
+    ## @brief Returns the typed values calculated from 'raw', a uint8 array
+    def __call__(self, raw):
+        data = raw.ctypes.data_as(POINTER(c_ubyte))
+        count = c_uint32(0)
+        r = ze_result_v(self.ddi.zetMetricGroupCalculateMetricValues(self.group,
+            zet_metric_group_calculation_type_v.METRIC_VALUES, raw.nbytes, data, byref(count), None).value)
+        if r != ze_result_v.SUCCESS:
+            raise Exception(r)
+        if len(self.__values) < count.value:
+            self.__values = typed_values(count.value)
+        values = ze_dtypes.pointer(self.__values, zet_typed_value_t)
+        r = ze_result_v(self.ddi.zetMetricGroupCalculateMetricValues(self.group,
+            zet_metric_group_calculation_type_v.METRIC_VALUES, raw.nbytes, data, byref(count), values).value)
+        if r != ze_result_v.SUCCESS:
+            raise Exception(r)
+        return self.__values[:count.value]
+
+###############################################################################
+## @brief Reads raw report data from an open metric streamer
+class MetricStreamerReader:
+    def __init__(self, ddi, streamer):
+        self.ddi = ddi
+        self.streamer = streamer
+
+    ## @brief Reads as many whole reports as fit in 'buffer', a uint8 array;
+    ##        returns the number of bytes read
+    def read(self, buffer):
+        size = c_size_t(buffer.nbytes)
+        r = ze_result_v(self.ddi.zetMetricStreamerReadData(self.streamer, 0xffffffff,
+            byref(size), buffer.ctypes.data_as(POINTER(c_ubyte))).value)
+        if r != ze_result_v.SUCCESS:
+            raise Exception(r)
+        return size.value
+
+###############################################################################
+## @brief Replays recorded raw streamer buffers, in place of a
+##        ::MetricStreamerReader
+##
+## @details
+##     - Each read returns the next recorded buffer, or None once all of them
+##       were returned, which ends the stream.
+##     - 'period' spaces reads by that many seconds, as a streamer sampling at
+##       a fixed rate would.
+class ReplayStreamer:
+    def __init__(self, buffers, period=0):
+        self.buffers = [numpy.frombuffer(buffer, dtype=numpy.uint8) for buffer in buffers]
+        self.period = period
+        self.__next = 0
+        self.__deadline = None
+
+    def read(self, buffer):
+        if self.__next == len(self.buffers):
+            return None
+        if self.period:
+            now = time.perf_counter()
+            if self.__deadline is None:
+                self.__deadline = now
+            if now < self.__deadline:
+                return 0
+            self.__deadline += self.period
+        data = self.buffers[self.__next]
+        if data.nbytes > buffer.nbytes:
+            raise ValueError("recorded buffer of %d bytes exceeds the read buffer" % data.nbytes)
+        buffer[:data.nbytes] = data
+        self.__next += 1
+        return data.nbytes
+
+###############################################################################
+## @brief Metric values calculated from a batch of raw reads
+##
+## @details
+##     - values holds the decoded ::TypedValueColumns, in report order.
+##     - samples() returns them as a float64 array of one row per report.
+class MetricBatch:
+    def __init__(self, values, metric_count, reads, raw_bytes):
+        self.values = values
+        self.metric_count = metric_count
+        self.reads = reads
+        self.raw_bytes = raw_bytes
+
+    def samples(self):
+        return self.values.as_float64().reshape(-1, self.metric_count)
+
+###############################################################################
+## @brief Continuous capture of a metric streamer
+##
+## @details
+##     - A background thread reads raw report data into a ring of 'buffers'
+##       preallocated buffers of 'buffer_size' bytes each.
+##     - Iterating the stream, or async iterating it, hands up to 'batch' filled
+##       buffers at a time to 'calculate' and yields a ::MetricBatch.
+##     - When every buffer is waiting for calculation, the reader either blocks
+##       ('overflow' is "block") or reads into a scratch buffer and drops the
+##       data ("drop"); 'stalls' counts the blocking waits, 'dropped_reads'
+##       and 'dropped_bytes' the dropped data.
+##     - 'reader' is a ::MetricStreamerReader, or any object with a
+##       read(buffer) method such as ::ReplayStreamer; 'calculate' is a
+##       ::MetricCalculator, or any callable turning a uint8 array into
+##       zet_typed_value_t values.
+class MetricStream:
+    def __init__(self, reader, calculate, metric_count, buffer_size=1 << 20, buffers=4, batch=2,
+                 overflow="drop", poll_interval=0.0001):
+        if overflow not in ("drop", "block"):
+            raise ValueError("overflow must be 'drop' or 'block'")
+        self.reader = reader
+        self.calculate = calculate
+        self.metric_count = metric_count
+        self.batch = batch
+        self.overflow = overflow
+        self.poll_interval = poll_interval
+
+        self.__ring = [numpy.zeros(buffer_size, dtype=numpy.uint8) for _ in range(buffers)]
+        self.__scratch = numpy.zeros(buffer_size, dtype=numpy.uint8)
+        self.__staging = numpy.zeros(buffer_size * batch, dtype=numpy.uint8)
+        self.__free = queue.Queue()
+        self.__filled = queue.Queue()
+        for slot in range(buffers):
+            self.__free.put(slot)
+        self.__stop = threading.Event()
+        self.__done = threading.Event()
+        self.__error = None
+        self.__thread = None
+
+        self.reads = 0
+        self.raw_bytes = 0
+        self.stalls = 0
+        self.dropped_reads = 0
+        self.dropped_bytes = 0
+        self.batches = 0
+        self.reports = 0
+
+    ## @brief Current counters of the stream
+    @property
+    def counters(self):
+        return {
+            "reads" : self.reads,
+            "raw_bytes" : self.raw_bytes,
+            "stalls" : self.stalls,
+            "dropped_reads" : self.dropped_reads,
+            "dropped_bytes" : self.dropped_bytes,
+            "batches" : self.batches,
+            "reports" : self.reports,
+            "pending" : max(0, self.__filled.qsize() - self.__done.is_set()),
+        }
+
+    ## @brief Starts the reader thread
+    def start(self):
+        if self.__thread is None:
+            self.__thread = threading.Thread(target=self.__run, name="MetricStream", daemon=True)
+            self.__thread.start()
+        return self
+
+    ## @brief Stops the reader thread; buffers already read are still yielded
+    def stop(self):
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def __acquire(self):
+        if self.overflow == "drop":
+            try:
+                return self.__free.get_nowait()
+            except queue.Empty:
+                return None
+        stalled = False
+        while not self.__stop.is_set():
+            try:
+                return self.__free.get(timeout=self.poll_interval) if stalled else self.__free.get_nowait()
+            except queue.Empty:
+                if not stalled:
+                    self.stalls += 1
+                    stalled = True
+        return None
+
+    def __run(self):
+        try:
+            while not self.__stop.is_set():
+                slot = self.__acquire()
+                if slot is None:
+                    if self.__stop.is_set():
+                        break
+                    size = self.reader.read(self.__scratch)
+                    if size is None:
+                        break
+                    if size:
+                        self.dropped_reads += 1
+                        self.dropped_bytes += size
+                    else:
+                        self.__stop.wait(self.poll_interval)
+                    continue
+                size = self.reader.read(self.__ring[slot])
+                if not size:
+                    self.__free.put(slot)
+                    if size is None:
+                        break
+                    self.__stop.wait(self.poll_interval)
+                    continue
+                self.reads += 1
+                self.raw_bytes += size
+                self.__filled.put((slot, size))
+        except Exception as e:
+            self.__error = e
+        finally:
+            self.__done.set()
+            self.__filled.put(None)
+
+    ## @brief Returns the next batch, None at the end of the stream, or
+    ##        raises queue.Empty when nothing was read within 'timeout'
+    def next_batch(self, timeout=None):
+        item = self.__filled.get(timeout=timeout)
+        if item is None:
+            # keep the end marker for later calls
+            self.__filled.put(None)
+            if self.__error is not None:
+                raise self.__error
+            return None
+        items = [item]
+        while len(items) < self.batch:
+            try:
+                item = self.__filled.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self.__filled.put(None)
+                break
+            items.append(item)
+
+        if len(items) == 1:
+            slot, size = items[0]
+            raw = self.__ring[slot][:size]
+        else:
+            size = 0
+            for slot, nbytes in items:
+                self.__staging[size:size + nbytes] = self.__ring[slot][:nbytes]
+                size += nbytes
+            raw = self.__staging[:size]
+        try:
+            values = decode_typed_values(self.calculate(raw))
+        finally:
+            for slot, _ in items:
+                self.__free.put(slot)
+
+        self.batches += 1
+        self.reports += len(values) // self.metric_count
+        return MetricBatch(values, self.metric_count, len(items), size)
+
+    def __iter__(self):
+        self.start()
+        while True:
+            batch = self.next_batch()
+            if batch is None:
+                return
+            yield batch
+
+    async def __aiter__(self):
+        import asyncio
+        loop = asyncio.get_running_loop()
+        self.start()
+        while True:
+            try:
+                batch = self.next_batch(timeout=0)
+            except queue.Empty:
+                batch = await loop.run_in_executor(None, self.next_batch)
+            if batch is None:
+                return
+            yield batch
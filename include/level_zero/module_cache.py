@@ -0,0 +1,272 @@
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+ @file module_cache.py
+
+ Persistent cache of native module binaries: modules built from SPIR-V are
+ saved with zeModuleGetNativeBinary and later processes create them from
+ the native binary instead of compiling the IL again.
+
+ """
+import hashlib
+import os
+import struct
+import time
+from ctypes import *
+from .ze import *
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+## @brief Version of the cache layout and key, part of every key
+_CACHE_VERSION = 1
+
+_SUFFIX = ".bin"
+
+###############################################################################
+## @brief Exclusive lock on a file, held across processes while in the 'with'
+##        block
+class _FileLock:
+    def __init__(self, path):
+        self.path = path
+        self.__fd = None
+
+    def __enter__(self):
+        self.__fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if os.name == "nt":
+            while True:
+                try:
+                    msvcrt.locking(self.__fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after 10 seconds
+                    pass
+        else:
+            fcntl.flock(self.__fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if os.name == "nt":
+            os.lseek(self.__fd, 0, os.SEEK_SET)
+            msvcrt.locking(self.__fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(self.__fd, fcntl.LOCK_UN)
+        os.close(self.__fd)
+        self.__fd = None
+
+###############################################################################
+## @brief Returns the bytes of a specialization constant value: bytes, a
+##        ctypes object, or an int taken as uint32_t
+def _constant_bytes(value):
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+    if isinstance(value, int):
+        return struct.pack("<I", value)
+    return string_at(addressof(value), sizeof(value))
+
+###############################################################################
+## @brief Cache of native module binaries in a directory, shared by processes
+##
+## @details
+##     - create(il, build_flags, constants) returns a module handle, created
+##       from the cached native binary on a hit, or built from the IL on a
+##       miss, after which the native binary is saved.
+##     - The key is the sha256 of the IL, the build flags, the specialization
+##       constants, the device (vendor, device id and uuid) and the driver
+##       (uuid and version), so binaries of other devices or drivers are
+##       never loaded.
+##     - A native binary the driver rejects is counted as stale, rebuilt and
+##       replaced.
+##     - Entries are written to a temporary file then renamed, so readers see
+##       whole binaries only; concurrent misses on the same key build the
+##       module once, the other processes waiting for its binary.
+##     - Entries are evicted least recently used first once the directory
+##       holds more than max_bytes; hits refresh the entry's mtime.
+class ModuleCache:
+    def __init__(self, ddi, hContext, hDevice, hDriver, path, max_bytes=1 << 30):
+        self.ddi = ddi
+        self.context = hContext
+        self.device = hDevice
+        self.path = path
+        self.max_bytes = max_bytes
+        os.makedirs(path, exist_ok=True)
+        self.__fast = fast = ddi.fastcall
+
+        device_properties = ze_device_properties_t(ze_structure_type_v.DEVICE_PROPERTIES, None)
+        r = fast.zeDeviceGetProperties(hDevice, byref(device_properties))
+        if r != ze_result_v.SUCCESS:
+            raise Exception(ze_result_v(r))
+        driver_properties = ze_driver_properties_t(ze_structure_type_v.DRIVER_PROPERTIES, None)
+        r = fast.zeDriverGetProperties(hDriver, byref(driver_properties))
+        if r != ze_result_v.SUCCESS:
+            raise Exception(ze_result_v(r))
+        self.__salt = struct.pack("<III", _CACHE_VERSION, device_properties.vendorId, device_properties.deviceId) + \
+            bytes(device_properties.uuid.id) + bytes(driver_properties.uuid.id) + \
+            struct.pack("<I", driver_properties.driverVersion)
+
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.build_seconds = 0.0
+        self.load_seconds = 0.0
+
+    ## @brief Returns the cache key of a module
+    def key(self, il, build_flags=None, constants=None):
+        h = hashlib.sha256(self.__salt)
+        h.update(struct.pack("<Q", len(il)))
+        h.update(il)
+        flags = build_flags.encode() if isinstance(build_flags, str) else (build_flags or b"")
+        h.update(struct.pack("<Q", len(flags)))
+        h.update(flags)
+        for id, value in sorted((constants or {}).items()):
+            data = _constant_bytes(value)
+            h.update(struct.pack("<IQ", id, len(data)))
+            h.update(data)
+        return h.hexdigest()
+
+    def __entry(self, key):
+        return os.path.join(self.path, key + _SUFFIX)
+
+    def __create(self, format, data, build_flags=None, constants=None):
+        desc = ze_module_desc_t(ze_structure_type_v.MODULE_DESC, None, format, len(data),
+            cast(c_char_p(data), POINTER(c_ubyte)), build_flags)
+        if constants:
+            ids = (c_uint32 * len(constants))(*constants)
+            values = [_constant_bytes(value) for value in constants.values()]
+            values = [create_string_buffer(value, len(value)) for value in values]
+            pointers = (c_void_p * len(values))(*[addressof(value) for value in values])
+            module_constants = ze_module_constants_t(len(constants), ids, pointers)
+            desc.pConstants = pointer(module_constants)
+        module = ze_module_handle_t()
+        r = self.__fast.zeModuleCreate(self.context, self.device, byref(desc), byref(module), None)
+        return r, module.value
+
+    # returns a module of the entry 'key', or None if there is none or the
+    # driver rejects it
+    def __load(self, key, count_stale=True):
+        try:
+            with open(self.__entry(key), 'rb') as fin:
+                data = fin.read()
+        except FileNotFoundError:
+            return None
+        start = time.perf_counter()
+        r, module = self.__create(ze_module_format_v.NATIVE, data)
+        self.load_seconds += time.perf_counter() - start
+        if r != ze_result_v.SUCCESS:
+            self.stale += count_stale
+            return None
+        self.bytes_read += len(data)
+        try:
+            os.utime(self.__entry(key))
+        except OSError:
+            # evicted meanwhile
+            pass
+        return module
+
+    def __save(self, key, module):
+        size = c_size_t(0)
+        r = self.__fast.zeModuleGetNativeBinary(module, byref(size), None)
+        if r != ze_result_v.SUCCESS:
+            return
+        binary = (c_ubyte * size.value)()
+        r = self.__fast.zeModuleGetNativeBinary(module, byref(size), binary)
+        if r != ze_result_v.SUCCESS:
+            return
+        temp = "%s.%d.tmp" % (self.__entry(key), os.getpid())
+        with open(temp, 'wb') as fout:
+            fout.write(bytes(binary)[:size.value])
+        os.replace(temp, self.__entry(key))
+        self.bytes_written += size.value
+        with _FileLock(os.path.join(self.path, ".lock")):
+            self.__evict(keep=key)
+
+    # removes the least recently used entries until at most max_bytes are
+    # cached, keeping the entry 'keep'
+    def __evict(self, keep=None):
+        entries = []
+        total = 0
+        for name in os.listdir(self.path):
+            if not name.endswith(_SUFFIX):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.path, name))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, name, stat.st_size))
+            total += stat.st_size
+        for _, name, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if name == (keep or "") + _SUFFIX:
+                continue
+            key = name[:-len(_SUFFIX)]
+            try:
+                os.remove(os.path.join(self.path, name))
+            except OSError:
+                continue
+            # a process waiting on the removed lock may build the module again,
+            # which at worst replaces the entry with the same binary
+            try:
+                os.remove(os.path.join(self.path, key + ".lock"))
+            except OSError:
+                pass
+            total -= size
+            self.evictions += 1
+
+    ## @brief Returns a module of the SPIR-V 'il', with the given build flags
+    ##        and specialization constants ({id : value}), from the cache if
+    ##        possible
+    def create(self, il, build_flags=None, constants=None):
+        il = bytes(il)
+        if isinstance(build_flags, str):
+            build_flags = build_flags.encode()
+        key = self.key(il, build_flags, constants)
+        module = self.__load(key, count_stale=False)
+        if module is not None:
+            self.hits += 1
+            return module
+
+        with _FileLock(os.path.join(self.path, key + ".lock")):
+            # another process may have built it while this one waited
+            module = self.__load(key)
+            if module is not None:
+                self.hits += 1
+                return module
+            self.misses += 1
+            start = time.perf_counter()
+            r, module = self.__create(ze_module_format_v.IL_SPIRV, il, build_flags, constants)
+            self.build_seconds += time.perf_counter() - start
+            if r != ze_result_v.SUCCESS:
+                raise Exception(ze_result_v(r))
+            self.__save(key, module)
+        return module
+
+    ## @brief Removes every entry of the cache
+    def clear(self):
+        with _FileLock(os.path.join(self.path, ".lock")):
+            for name in os.listdir(self.path):
+                if name.endswith(_SUFFIX):
+                    try:
+                        os.remove(os.path.join(self.path, name))
+                    except OSError:
+                        pass
+
+    ## @brief Returns the cache counters
+    def stats(self):
+        return {
+            "hits" : self.hits,
+            "misses" : self.misses,
+            "stale" : self.stale,
+            "evictions" : self.evictions,
+            "bytes_read" : self.bytes_read,
+            "bytes_written" : self.bytes_written,
+            "build_seconds" : self.build_seconds,
+            "load_seconds" : self.load_seconds,
+        }
@@ -0,0 +1,201 @@
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+ @file staging.py
+
+ Host-device transfers of NumPy arrays through a pool of pinned staging
+ buffers, copying one chunk on the host while the device copies the
+ previous one. Requires numpy.
+
+ """
+import time
+from ctypes import *
+import numpy
+from .ze import *
+
+_UINT64_MAX = 0xffffffffffffffff
+
+###############################################################################
+## @brief Pool of pinned host buffers staging transfers between NumPy arrays
+##        and device memory
+##
+## @details
+##     - Transfers are split into chunks of chunk_size bytes, copied through
+##       'buffers' zeMemAllocHost buffers in turn; each buffer has an event
+##       signaled by its device copy, waited on before the buffer is reused.
+##     - upload copies a chunk into a free buffer and appends its device copy,
+##       then copies the next chunk while the device copies the previous one;
+##       download keeps buffers-1 device copies in flight ahead of the chunk
+##       being copied out.
+##     - Copies are appended to an immediate command list, created on
+##       'ordinal' unless one is given, so they start without an execute.
+##     - Not thread-safe: use one pool per thread.
+class StagingPool:
+    def __init__(self, ddi, hContext, hDevice, chunk_size=4 << 20, buffers=2, ordinal=0, hCommandList=None):
+        if buffers < 2:
+            raise ValueError("double-buffering needs at least 2 buffers")
+        self.ddi = ddi
+        self.context = hContext
+        self.device = hDevice
+        self.chunk_size = chunk_size
+        self.__fast = fast = ddi.fastcall
+        self.__buffers = []
+        self.__events = []
+        self.__pending = [False] * buffers
+        self.__pool = None
+        self.__list = hCommandList
+        self.__owns_list = hCommandList is None
+
+        self.uploads = 0
+        self.downloads = 0
+        self.bytes_uploaded = 0
+        self.bytes_downloaded = 0
+        self.chunks = 0
+        self.wait_seconds = 0.0
+
+        try:
+            address = c_void_p()
+            host_desc = ze_host_mem_alloc_desc_t(ze_structure_type_v.HOST_MEM_ALLOC_DESC, None, 0)
+            for _ in range(buffers):
+                self.__check(fast.zeMemAllocHost(hContext, byref(host_desc), chunk_size, 64, byref(address)))
+                self.__buffers.append(address.value)
+
+            pool = ze_event_pool_handle_t()
+            pool_desc = ze_event_pool_desc_t(ze_structure_type_v.EVENT_POOL_DESC, None,
+                ze_event_pool_flags_v.HOST_VISIBLE, buffers)
+            devices = (ze_device_handle_t * 1)(hDevice)
+            self.__check(fast.zeEventPoolCreate(hContext, byref(pool_desc), 1, devices, byref(pool)))
+            self.__pool = pool.value
+            event = ze_event_handle_t()
+            for index in range(buffers):
+                event_desc = ze_event_desc_t(ze_structure_type_v.EVENT_DESC, None, index,
+                    ze_event_scope_flags_v.HOST, ze_event_scope_flags_v.HOST)
+                self.__check(fast.zeEventCreate(self.__pool, byref(event_desc), byref(event)))
+                self.__events.append(event.value)
+
+            if self.__list is None:
+                command_list = ze_command_list_handle_t()
+                queue_desc = ze_command_queue_desc_t(ze_structure_type_v.COMMAND_QUEUE_DESC, None, ordinal, 0, 0,
+                    ze_command_queue_mode_v.ASYNCHRONOUS, ze_command_queue_priority_v.NORMAL)
+                self.__check(fast.zeCommandListCreateImmediate(hContext, hDevice, byref(queue_desc),
+                    byref(command_list)))
+                self.__list = command_list.value
+        except Exception:
+            self.close()
+            raise
+
+    @staticmethod
+    def __check(r):
+        if r != ze_result_v.SUCCESS:
+            raise Exception(ze_result_v(r))
+
+    # waits until buffer 'index' is no longer read or written by the device
+    def __wait(self, index):
+        if self.__pending[index]:
+            start = time.perf_counter()
+            self.__check(self.__fast.zeEventHostSynchronize(self.__events[index], _UINT64_MAX))
+            self.__check(self.__fast.zeEventHostReset(self.__events[index]))
+            self.wait_seconds += time.perf_counter() - start
+            self.__pending[index] = False
+
+    def __copy(self, index, dst, src, size):
+        self.__check(self.__fast.zeCommandListAppendMemoryCopy(self.__list, dst, src, size,
+            self.__events[index], 0, None))
+        self.__pending[index] = True
+        self.chunks += 1
+
+    ## @brief Waits for every transfer of the pool to complete
+    def synchronize(self):
+        for index in range(len(self.__buffers)):
+            self.__wait(index)
+
+    ## @brief Copies 'array' to the device memory at address 'dst'
+    ##
+    ## @details
+    ##     - With wait=False, returns once the last chunk is staged; call
+    ##       synchronize() before the device reads 'dst'.
+    def upload(self, array, dst, wait=True):
+        array = numpy.ascontiguousarray(array)
+        src = array.ctypes.data
+        size = array.nbytes
+        count = len(self.__buffers)
+        for chunk, offset in enumerate(range(0, size, self.chunk_size)):
+            index = chunk % count
+            length = min(self.chunk_size, size - offset)
+            self.__wait(index)
+            memmove(self.__buffers[index], src + offset, length)
+            self.__copy(index, dst + offset, self.__buffers[index], length)
+        if wait:
+            self.synchronize()
+        self.uploads += 1
+        self.bytes_uploaded += size
+
+    ## @brief Copies the device memory at address 'src' to 'out', a writable
+    ##        C-contiguous array, or to a new array of 'shape' and 'dtype';
+    ##        returns the array
+    def download(self, src, out=None, shape=None, dtype=numpy.uint8):
+        if out is None:
+            if shape is None:
+                raise ValueError("download needs 'out' or 'shape'")
+            out = numpy.empty(shape, dtype=dtype)
+        elif not out.flags.c_contiguous or not out.flags.writeable:
+            raise ValueError("out must be a writable C-contiguous array")
+        dst = out.ctypes.data
+        size = out.nbytes
+        count = len(self.__buffers)
+        offsets = list(range(0, size, self.chunk_size))
+        # device copies run up to count-1 chunks ahead of the host copy, into
+        # the buffers drained by the previous host copies
+        ahead = 0
+        for chunk, offset in enumerate(offsets):
+            while ahead < len(offsets) and ahead < chunk + count:
+                index = ahead % count
+                self.__wait(index)
+                self.__copy(index, self.__buffers[index], src + offsets[ahead],
+                    min(self.chunk_size, size - offsets[ahead]))
+                ahead += 1
+            index = chunk % count
+            self.__wait(index)
+            memmove(dst + offset, self.__buffers[index], min(self.chunk_size, size - offset))
+        self.downloads += 1
+        self.bytes_downloaded += size
+        return out
+
+    ## @brief Returns the pool counters; wait_seconds is the time the host
+    ##        spent waiting for device copies
+    def stats(self):
+        return {
+            "uploads" : self.uploads,
+            "downloads" : self.downloads,
+            "bytes_uploaded" : self.bytes_uploaded,
+            "bytes_downloaded" : self.bytes_downloaded,
+            "chunks" : self.chunks,
+            "wait_seconds" : self.wait_seconds,
+        }
+
+    ## @brief Waits for pending transfers and releases the buffers, events and
+    ##        command list
+    def close(self):
+        fast = self.__fast
+        if self.__events and self.__list is not None:
+            self.synchronize()
+        for event in self.__events:
+            fast.zeEventDestroy(event)
+        self.__events = []
+        if self.__pool is not None:
+            fast.zeEventPoolDestroy(self.__pool)
+            self.__pool = None
+        if self.__owns_list and self.__list is not None:
+            fast.zeCommandListDestroy(self.__list)
+        self.__list = None
+        for buffer in self.__buffers:
+            fast.zeMemFree(self.context, buffer)
+        self.__buffers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
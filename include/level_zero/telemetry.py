@@ -0,0 +1,169 @@
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+ @file telemetry.py
+
+ Batched sampling of the monotonic sysman counters of many devices, with
+ rates computed across all domains at once. Requires numpy.
+
+ """
+from ctypes import *
+import numpy
+from .zes import *
+from . import ze_dtypes
+
+###############################################################################
+## @brief Sampled domain kinds
+##
+## @details
+##     - kind : (enumeration function, or None for one domain per device,
+##       counter function, counter structure, [(counter, rate, scale)])
+##     - A rate is the counter's delta per second of timestamp delta, times
+##       scale; timestamps are in microseconds.
+_kinds = {
+    "power" : ("zesDeviceEnumPowerDomains", "zesPowerGetEnergyCounter", "zes_power_energy_counter_t",
+        [("energy", "power", 1e-6)]),                                       ## microjoules to watts
+    "engine" : ("zesDeviceEnumEngineGroups", "zesEngineGetActivity", "zes_engine_stats_t",
+        [("activeTime", "utilization", 1e-6)]),                             ## active fraction of the interval
+    "memory" : ("zesDeviceEnumMemoryModules", "zesMemoryGetBandwidth", "zes_mem_bandwidth_t",
+        [("readCounter", "read_bandwidth", 1.0), ("writeCounter", "write_bandwidth", 1.0)]),
+    "pci" : (None, "zesDevicePciGetStats", "zes_pci_stats_t",
+        [("rxCounter", "rx_bandwidth", 1.0), ("txCounter", "tx_bandwidth", 1.0)]),
+    "fabric" : ("zesDeviceEnumFabricPorts", "zesFabricPortGetThroughput", "zes_fabric_port_throughput_t",
+        [("rxCounter", "rx_bandwidth", 1.0), ("txCounter", "tx_bandwidth", 1.0)]),
+}
+
+###############################################################################
+## @brief Domains of one kind across all sampled devices
+##
+## @details
+##     - handles and device (the index of the owning device) are in
+##       enumeration order; current and previous hold the last two samples.
+##     - rates maps each rate name to a float64 array, overwritten by every
+##       sample; NaN marks domains without two valid consecutive samples.
+class TelemetryDomains:
+    def __init__(self, kind, handles, device, function, struct, counters, counter_bits):
+        self.kind = kind
+        self.handles = handles
+        self.device = numpy.array(device, dtype=numpy.intp)
+        self.current = ze_dtypes.zeros(struct, len(handles))
+        self.previous = ze_dtypes.zeros(struct, len(handles))
+        self.valid = numpy.zeros(len(handles), dtype=bool)
+        self.counters = counters
+        self.rates = dict((rate, numpy.full(len(handles), numpy.nan)) for _, rate, _ in counters)
+
+        self.__mask = numpy.uint64((1 << counter_bits) - 1)
+        self.__wrap = counter_bits < 64
+        self.__delta = numpy.zeros(len(handles), dtype=numpy.uint64)
+        self.__interval = numpy.zeros(len(handles))
+        self.__valid = numpy.zeros(len(handles), dtype=bool)
+        stride = self.current.dtype.itemsize
+        base = self.current.ctypes.data
+        self.__calls = [(function, handle, base + i * stride) for i, handle in enumerate(handles)]
+
+    def __len__(self):
+        return len(self.handles)
+
+    def __elapsed(self, field):
+        numpy.subtract(self.current[field], self.previous[field], out=self.__delta)
+        if self.__wrap:
+            numpy.bitwise_and(self.__delta, self.__mask, out=self.__delta)
+        return self.__delta
+
+    ## @brief Reads every domain's counters and updates the rates
+    def sample(self):
+        numpy.copyto(self.previous, self.current)
+        numpy.copyto(self.__valid, self.valid)
+        results = [function(handle, address) for function, handle, address in self.__calls]
+        if any(results):
+            self.valid[:] = numpy.array(results) == ze_result_v.SUCCESS
+        else:
+            self.valid[:] = True
+        self.__valid &= self.valid
+
+        interval = self.__interval
+        interval[:] = self.__elapsed("timestamp")
+        self.__valid &= interval > 0
+        # rates per second of microsecond timestamps
+        numpy.divide(1e6, interval, out=interval, where=self.__valid)
+        for counter, rate, scale in self.counters:
+            out = self.rates[rate]
+            out[:] = self.__elapsed(counter)
+            out *= interval
+            if scale != 1.0:
+                out *= scale
+            out[~self.__valid] = numpy.nan
+
+###############################################################################
+## @brief Samples the power, engine, memory, PCI and fabric counters of a set
+##        of devices
+##
+## @details
+##     - Domains are enumerated once, at construction, through the
+##       zesDeviceEnum* functions; kinds not supported by a device have no
+##       domains on it, and kinds whose counter function the ddi does not
+##       provide have no domains at all.
+##     - Each sample() reads every domain through the ddi's fast-call view
+##       into preallocated arrays, then computes the rates of each kind with
+##       array operations.
+##     - Counter deltas are taken modulo 2^counter_bits[kind] (64 by default),
+##       so counters wrapping around yield the correct delta.
+class TelemetrySampler:
+    def __init__(self, ddi, devices, kinds=None, counter_bits=None):
+        self.ddi = ddi
+        self.devices = list(devices)
+        self.domains = {}
+        counter_bits = counter_bits or {}
+        for kind in (kinds or _kinds):
+            enum, get, struct, counters = _kinds[kind]
+            handles = []
+            device = []
+            for index, hDevice in enumerate(self.devices):
+                found = self.__enumerate(enum, hDevice)
+                handles += found
+                device += [index] * len(found)
+            if handles and not ddi.is_supported(get):
+                # e.g. the domains enumerate, but the driver lacks their table
+                handles = []
+                device = []
+            function = getattr(ddi.fastcall, get) if handles else None
+            self.domains[kind] = TelemetryDomains(kind, handles, device, function, struct, counters,
+                counter_bits.get(kind, 64))
+        self.samples = 0
+
+    def __enumerate(self, enum, hDevice):
+        if enum is None:
+            return [hDevice.value if isinstance(hDevice, c_void_p) else hDevice]
+        function = getattr(self.ddi, enum)
+        count = c_uint32(0)
+        try:
+            if function(hDevice, byref(count), None).value != ze_result_v.SUCCESS:
+                return []
+        except UnsupportedFunctionError:
+            return []
+        handles = (function.argtypes[2]._type_ * count.value)()
+        if function(hDevice, byref(count), handles).value != ze_result_v.SUCCESS:
+            return []
+        return [handle.value for handle in handles[:count.value]]
+
+    ## @brief Reads all domains once; returns {kind : {rate : float64 array}},
+    ##        whose arrays are overwritten by the next sample
+    def sample(self):
+        for domains in self.domains.values():
+            if len(domains):
+                domains.sample()
+        self.samples += 1
+        return self.rates
+
+    ## @brief Rates of the last sample, by kind and rate name
+    @property
+    def rates(self):
+        return dict((kind, domains.rates) for kind, domains in self.domains.items())
+
+    ## @brief Returns a rate of the last sample summed over the domains of each
+    ##        device
+    def per_device(self, kind, rate):
+        domains = self.domains[kind]
+        return numpy.bincount(domains.device, weights=domains.rates[rate], minlength=len(self.devices))
@@ -0,0 +1,531 @@
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+ @file usm.py
+
+ Caching allocator of unified shared memory: freed blocks are kept in
+ size-class bins and handed out again without calling the driver, reusing
+ blocks across command queues only once the work using them is complete.
+
+ USMBuffer exports allocations without copies through the buffer protocol,
+ the NumPy array interface and DLPack.
+
+ """
+import collections
+import threading
+from ctypes import *
+from .ze import *
+
+## @brief Smallest block size; smaller requests share its bin
+_MIN_BLOCK = 512
+
+## @brief Requests up to this size are rounded up to a power of two, larger
+##        ones to a multiple of _LARGE_ROUND
+_SMALL_LIMIT = 1 << 20
+_LARGE_ROUND = 2 << 20
+
+_UINT64_MAX = 0xffffffffffffffff
+
+###############################################################################
+## @brief Returns the size of the blocks of the bin serving 'size' bytes
+def size_class(size):
+    if size <= _MIN_BLOCK:
+        return _MIN_BLOCK
+    if size <= _SMALL_LIMIT:
+        return 1 << (size - 1).bit_length()
+    return (size + _LARGE_ROUND - 1) // _LARGE_ROUND * _LARGE_ROUND
+
+###############################################################################
+## @brief A block allocated from the driver
+##
+## @details
+##     - queue is the command queue the block was last freed on, or None once
+##       no work may be using it; event, if not None, is signaled when that
+##       work is complete.
+class _Block:
+    __slots__ = ("address", "size", "requested", "queue", "event")
+
+    def __init__(self, address, size):
+        self.address = address
+        self.size = size
+        self.requested = 0
+        self.queue = None
+        self.event = None
+
+###############################################################################
+## @brief Caching allocator over zeMemAllocDevice, zeMemAllocHost or
+##        zeMemAllocShared
+##
+## @details
+##     - alloc(size, queue) returns the address of a block of at least 'size'
+##       bytes; free(address, queue, event) returns it to its bin instead of
+##       calling zeMemFree.
+##     - A block freed on a queue is reused at once by allocations on the same
+##       queue, whose work runs in submission order, and by other queues once
+##       'event' is signaled or after synchronize(queue). Blocks freed without
+##       a queue are reused by any queue.
+##     - Allocations that would raise the memory held from the driver above
+##       high_water bytes first release cached blocks, least recently freed
+##       first; a failed driver allocation releases every cached block and is
+##       retried once.
+##     - Thread-safe; the driver is called through the ddi's fast-call view.
+class CachingAllocator:
+    def __init__(self, ddi, hContext, hDevice=None, kind="device", alignment=64, ordinal=0, high_water=None):
+        if kind not in ("device", "host", "shared"):
+            raise ValueError("kind must be 'device', 'host' or 'shared', not %r" % kind)
+        if kind != "host" and hDevice is None:
+            raise ValueError("%s allocations need a device" % kind)
+        self.ddi = ddi
+        self.context = hContext
+        self.device = hDevice
+        self.kind = kind
+        self.alignment = alignment
+        self.high_water = high_water
+
+        self.__fast = ddi.fastcall
+        self.__lock = threading.Lock()
+        self.__device_desc = ze_device_mem_alloc_desc_t(ze_structure_type_v.DEVICE_MEM_ALLOC_DESC, None, 0, ordinal)
+        self.__host_desc = ze_host_mem_alloc_desc_t(ze_structure_type_v.HOST_MEM_ALLOC_DESC, None, 0)
+        self.__address = c_void_p()
+
+        # size class : {queue or None : {address : block}}, in order of free
+        self.__bins = {}
+        # every cached block, least recently freed first
+        self.__cached = collections.OrderedDict()
+        self.__in_use = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.driver_allocs = 0
+        self.driver_frees = 0
+        self.trims = 0
+        self.bytes_in_use = 0
+        self.bytes_requested = 0
+        self.bytes_cached = 0
+        self.peak_reserved = 0
+
+    ## @brief Bytes held from the driver, in use or cached
+    @property
+    def bytes_reserved(self):
+        return self.bytes_in_use + self.bytes_cached
+
+    def __driver_alloc(self, size):
+        fast = self.__fast
+        if self.kind == "device":
+            r = fast.zeMemAllocDevice(self.context, byref(self.__device_desc), size, self.alignment,
+                self.device, byref(self.__address))
+        elif self.kind == "host":
+            r = fast.zeMemAllocHost(self.context, byref(self.__host_desc), size, self.alignment,
+                byref(self.__address))
+        else:
+            r = fast.zeMemAllocShared(self.context, byref(self.__device_desc), byref(self.__host_desc), size,
+                self.alignment, self.device, byref(self.__address))
+        if r != ze_result_v.SUCCESS:
+            return r, None
+        self.driver_allocs += 1
+        return r, _Block(self.__address.value, size)
+
+    def __driver_free(self, block):
+        r = self.__fast.zeMemFree(self.context, block.address)
+        if r != ze_result_v.SUCCESS:
+            raise Exception(ze_result_v(r))
+        self.driver_frees += 1
+
+    def __is_idle(self, block):
+        return block.event is not None and self.__fast.zeEventQueryStatus(block.event) == ze_result_v.SUCCESS
+
+    # removes and returns a cached block of 'size' usable on 'queue', or None
+    def __take(self, size, queue):
+        queues = self.__bins.get(size)
+        if not queues:
+            return None
+        block = None
+        for key in (queue, None):
+            blocks = queues.get(key)
+            if blocks:
+                block = blocks.popitem(last=True)[1]
+                break
+        if block is None:
+            # blocks of other queues, once their work is complete
+            for blocks in queues.values():
+                for address, candidate in blocks.items():
+                    if self.__is_idle(candidate):
+                        block = blocks.pop(address)
+                        break
+                if block is not None:
+                    break
+        if block is None:
+            return None
+        self.__uncache(block, pop=False)
+        return block
+
+    def __uncache(self, block, pop=True):
+        if pop:
+            blocks = self.__bins[block.size][block.queue]
+            del blocks[block.address]
+        else:
+            blocks = self.__bins[block.size].get(block.queue)
+        if not blocks:
+            del self.__bins[block.size][block.queue]
+        del self.__cached[block.address]
+        self.bytes_cached -= block.size
+
+    # releases cached blocks, least recently freed first, until at most
+    # 'target' bytes are cached; returns the number of bytes released
+    def __trim(self, target):
+        released = 0
+        synchronized = set()
+        while self.__cached and self.bytes_cached > target:
+            block = next(iter(self.__cached.values()))
+            self.__uncache(block)
+            if block.queue is not None and block.queue not in synchronized and not self.__is_idle(block):
+                # the work using the block may still be running
+                self.__fast.zeCommandQueueSynchronize(block.queue, _UINT64_MAX)
+                synchronized.add(block.queue)
+            self.__driver_free(block)
+            released += block.size
+        if released:
+            self.trims += 1
+        return released
+
+    ## @brief Returns the address of a block of at least 'size' bytes, for work
+    ##        submitted to 'queue'
+    def alloc(self, size, queue=None):
+        block_size = size_class(size)
+        with self.__lock:
+            block = self.__take(block_size, queue)
+            if block is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+                if self.high_water is not None and self.bytes_reserved + block_size > self.high_water:
+                    self.__trim(max(0, self.high_water - self.bytes_in_use - block_size))
+                r, block = self.__driver_alloc(block_size)
+                if block is None and self.__cached:
+                    self.__trim(0)
+                    r, block = self.__driver_alloc(block_size)
+                if block is None:
+                    raise Exception(ze_result_v(r))
+            block.queue = None
+            block.event = None
+            block.requested = size
+            self.__in_use[block.address] = block
+            self.bytes_in_use += block.size
+            self.bytes_requested += size
+            self.peak_reserved = max(self.peak_reserved, self.bytes_reserved)
+            return block.address
+
+    ## @brief Returns the block at 'address' to the cache; 'queue' is the
+    ##        command queue of the last work using it, and 'event', if given,
+    ##        is signaled once that work is complete
+    def free(self, address, queue=None, event=None):
+        with self.__lock:
+            block = self.__in_use.pop(address)
+            self.bytes_in_use -= block.size
+            self.bytes_requested -= block.requested
+            block.queue = queue
+            block.event = event
+            self.__bins.setdefault(block.size, {}).setdefault(queue, collections.OrderedDict())[address] = block
+            self.__cached[address] = block
+            self.bytes_cached += block.size
+            if self.high_water is not None and self.bytes_reserved > self.high_water:
+                self.__trim(max(0, self.high_water - self.bytes_in_use))
+
+    ## @brief Marks the blocks freed on 'queue' as reusable by every queue,
+    ##        once the caller has synchronized with it
+    def synchronize(self, queue):
+        with self.__lock:
+            for queues in self.__bins.values():
+                blocks = queues.pop(queue, None)
+                if not blocks:
+                    continue
+                idle = queues.setdefault(None, collections.OrderedDict())
+                for address, block in blocks.items():
+                    block.queue = None
+                    block.event = None
+                    idle[address] = block
+
+    ## @brief Releases cached blocks, least recently freed first, until at most
+    ##        'target' bytes are cached; returns the number of bytes released
+    def trim(self, target=0):
+        with self.__lock:
+            return self.__trim(target)
+
+    ## @brief Releases every cached block; blocks in use are left allocated
+    def close(self):
+        self.trim(0)
+
+    ## @brief Returns the allocator counters
+    ##
+    ## @details
+    ##     - fragmentation is the fraction of the bytes in use lost to rounding
+    ##       requests up to their size class.
+    def stats(self):
+        with self.__lock:
+            return {
+                "hits" : self.hits,
+                "misses" : self.misses,
+                "driver_allocs" : self.driver_allocs,
+                "driver_frees" : self.driver_frees,
+                "trims" : self.trims,
+                "blocks_in_use" : len(self.__in_use),
+                "blocks_cached" : len(self.__cached),
+                "bytes_in_use" : self.bytes_in_use,
+                "bytes_requested" : self.bytes_requested,
+                "bytes_cached" : self.bytes_cached,
+                "bytes_reserved" : self.bytes_reserved,
+                "peak_reserved" : self.peak_reserved,
+                "fragmentation" : 1.0 - self.bytes_requested / self.bytes_in_use if self.bytes_in_use else 0.0,
+            }
+
+###############################################################################
+## @brief DLPack device types and data type codes
+_kDLCPU = 1
+_kDLOneAPI = 14
+
+_kDLInt = 0
+_kDLUInt = 1
+_kDLFloat = 2
+_kDLBool = 6
+
+## @brief struct format : (itemsize, DLPack type code, NumPy typestr)
+_formats = {
+    "b" : (1, _kDLInt, "|i1"), "B" : (1, _kDLUInt, "|u1"), "?" : (1, _kDLBool, "|b1"),
+    "h" : (2, _kDLInt, "<i2"), "H" : (2, _kDLUInt, "<u2"), "e" : (2, _kDLFloat, "<f2"),
+    "i" : (4, _kDLInt, "<i4"), "I" : (4, _kDLUInt, "<u4"), "f" : (4, _kDLFloat, "<f4"),
+    "q" : (8, _kDLInt, "<i8"), "Q" : (8, _kDLUInt, "<u8"), "d" : (8, _kDLFloat, "<f8"),
+}
+
+## @brief Formats memoryview.cast accepts
+_memoryview_formats = set(_formats) - {"e"}
+
+###############################################################################
+## @brief DLPack (v0.8) tensor structures
+class _DLDevice(Structure):
+    _fields_ = [
+        ("device_type", c_int),
+        ("device_id", c_int32)
+    ]
+
+class _DLDataType(Structure):
+    _fields_ = [
+        ("code", c_uint8),
+        ("bits", c_uint8),
+        ("lanes", c_uint16)
+    ]
+
+class _DLTensor(Structure):
+    _fields_ = [
+        ("data", c_void_p),
+        ("device", _DLDevice),
+        ("ndim", c_int32),
+        ("dtype", _DLDataType),
+        ("shape", POINTER(c_int64)),
+        ("strides", POINTER(c_int64)),
+        ("byte_offset", c_uint64)
+    ]
+
+class _DLManagedTensor(Structure):
+    pass
+
+_dl_deleter_t = CFUNCTYPE(None, c_void_p)
+
+_DLManagedTensor._fields_ = [
+    ("dl_tensor", _DLTensor),
+    ("manager_ctx", c_void_p),
+    ("deleter", _dl_deleter_t)
+]
+
+## @brief Exported tensors, by address: (managed tensor, shape, buffer), kept
+##        alive until the consumer calls the deleter
+_exports = {}
+
+def _dl_delete(address):
+    _exports.pop(address, None)
+
+_dl_deleter = _dl_deleter_t(_dl_delete)
+
+_PyCapsule_New = PYFUNCTYPE(py_object, c_void_p, c_char_p, c_void_p)(("PyCapsule_New", pythonapi))
+_PyCapsule_IsValid = PYFUNCTYPE(c_int, c_void_p, c_char_p)(("PyCapsule_IsValid", pythonapi))
+_PyCapsule_GetPointer = PYFUNCTYPE(c_void_p, c_void_p, c_char_p)(("PyCapsule_GetPointer", pythonapi))
+
+## @brief Frees a tensor whose capsule was never consumed; a consumer renames
+##        the capsule to "used_dltensor" and calls the deleter itself
+def _capsule_destructor(capsule):
+    if _PyCapsule_IsValid(capsule, b"dltensor"):
+        _dl_delete(_PyCapsule_GetPointer(capsule, b"dltensor"))
+
+_capsule_destructor_cb = CFUNCTYPE(None, c_void_p)(_capsule_destructor)
+
+###############################################################################
+## @brief Unified shared memory allocation, viewable without copies
+##
+## @details
+##     - The memory type and owning device are queried with
+##       zeMemGetAllocProperties; addresses not allocated in hContext raise
+##       ValueError.
+##     - Host and shared allocations support the buffer protocol (Python
+##       3.12+, or memoryview() on any version) and the NumPy array
+##       interface, so numpy.asarray(buffer) is a view of the allocation.
+##       float16 ("e") buffers have no memoryview, which cannot cast to it,
+##       and are viewed through the array interface or DLPack only.
+##     - __dlpack__ exports host allocations as CPU tensors, device and shared
+##       allocations as oneAPI tensors of device_id, and shared allocations as
+##       CPU tensors when the consumer requests dl_device=(1, 0). Level Zero
+##       has no streams: the caller synchronizes before the consumer reads.
+##     - The allocation is freed on close() only if owned, as when returned
+##       by allocate().
+class USMBuffer:
+    def __init__(self, ddi, hContext, address, size, format="B", shape=None, device_id=0, owned=False, allocator=None):
+        if format not in _formats:
+            raise ValueError("unsupported format %r, expected one of %s" % (format, "".join(_formats)))
+        itemsize = _formats[format][0]
+        if shape is None:
+            shape = (size // itemsize,)
+        shape = tuple(shape)
+        count = 1
+        for extent in shape:
+            count *= extent
+        if count * itemsize > size:
+            raise ValueError("shape %s of %r exceeds the %d bytes of the buffer" % (shape, format, size))
+
+        properties = ze_memory_allocation_properties_t(ze_structure_type_v.MEMORY_ALLOCATION_PROPERTIES, None)
+        device = ze_device_handle_t()
+        r = ddi.fastcall.zeMemGetAllocProperties(hContext, address, byref(properties), byref(device))
+        if r != ze_result_v.SUCCESS:
+            raise Exception(ze_result_v(r))
+        if properties.type.value == ze_memory_type_v.UNKNOWN:
+            raise ValueError("0x%x is not an allocation of the context" % address)
+
+        self.ddi = ddi
+        self.context = hContext
+        self.address = address
+        self.size = size
+        self.format = format
+        self.itemsize = itemsize
+        self.shape = shape
+        self.nbytes = count * itemsize
+        self.type = ze_memory_type_v(properties.type.value)
+        self.device = device.value
+        self.device_id = device_id
+        self.__owned = owned
+        self.__allocator = allocator
+
+    ## @brief Allocates a host, shared or device buffer of 'size' bytes, freed
+    ##        on close(); from 'allocator', a CachingAllocator of the same
+    ##        kind, if given
+    @classmethod
+    def allocate(cls, ddi, hContext, size, kind="host", hDevice=None, alignment=64, allocator=None, **kwargs):
+        if allocator is not None:
+            return cls(ddi, hContext, allocator.alloc(size), size, owned=True, allocator=allocator, **kwargs)
+        fast = ddi.fastcall
+        device_desc = ze_device_mem_alloc_desc_t(ze_structure_type_v.DEVICE_MEM_ALLOC_DESC, None, 0, 0)
+        host_desc = ze_host_mem_alloc_desc_t(ze_structure_type_v.HOST_MEM_ALLOC_DESC, None, 0)
+        address = c_void_p()
+        if kind == "host":
+            r = fast.zeMemAllocHost(hContext, byref(host_desc), size, alignment, byref(address))
+        elif kind == "shared":
+            r = fast.zeMemAllocShared(hContext, byref(device_desc), byref(host_desc), size, alignment, hDevice,
+                byref(address))
+        elif kind == "device":
+            r = fast.zeMemAllocDevice(hContext, byref(device_desc), size, alignment, hDevice, byref(address))
+        else:
+            raise ValueError("kind must be 'device', 'host' or 'shared', not %r" % kind)
+        if r != ze_result_v.SUCCESS:
+            raise Exception(ze_result_v(r))
+        return cls(ddi, hContext, address.value, size, owned=True, **kwargs)
+
+    ## @brief True if the host can access the memory
+    @property
+    def host_accessible(self):
+        return self.type in (ze_memory_type_v.HOST, ze_memory_type_v.SHARED)
+
+    def __check_host(self):
+        if self.address is None:
+            raise ValueError("the buffer is closed")
+        if not self.host_accessible:
+            raise BufferError("%s memory is not accessible from the host" % self.type.name.lower())
+
+    ## @brief Returns a memoryview of the memory, in the buffer's format and shape
+    def memoryview(self):
+        self.__check_host()
+        if self.format not in _memoryview_formats:
+            raise BufferError("memoryview does not support the %r format" % self.format)
+        view = memoryview((c_ubyte * self.nbytes).from_address(self.address))
+        return view.cast("B").cast(self.format, self.shape)
+
+    def __buffer__(self, flags):
+        return self.memoryview()
+
+    def __release_buffer__(self, view):
+        view.release()
+
+    @property
+    def __array_interface__(self):
+        self.__check_host()
+        return {
+            "shape" : self.shape,
+            "typestr" : _formats[self.format][2],
+            "data" : (self.address, False),
+            "version" : 3,
+        }
+
+    ## @brief DLPack device of the buffer: (device type, device id)
+    def __dlpack_device__(self):
+        if self.type == ze_memory_type_v.HOST:
+            return (_kDLCPU, 0)
+        return (_kDLOneAPI, self.device_id)
+
+    ## @brief Returns a "dltensor" capsule of the buffer
+    def __dlpack__(self, stream=None, max_version=None, dl_device=None, copy=None):
+        if self.address is None:
+            raise ValueError("the buffer is closed")
+        if copy:
+            raise BufferError("USMBuffer only exports without copies")
+        device = self.__dlpack_device__()
+        if dl_device is not None and tuple(dl_device) != device:
+            if tuple(dl_device) != (_kDLCPU, 0) or not self.host_accessible:
+                raise BufferError("can't export %s memory to device %s" % (self.type.name.lower(), tuple(dl_device)))
+            device = (_kDLCPU, 0)
+
+        shape = (c_int64 * len(self.shape))(*self.shape)
+        managed = _DLManagedTensor()
+        tensor = managed.dl_tensor
+        tensor.data = self.address
+        tensor.device = _DLDevice(*device)
+        tensor.ndim = len(self.shape)
+        tensor.dtype = _DLDataType(_formats[self.format][1], self.itemsize * 8, 1)
+        tensor.shape = shape
+        tensor.strides = None
+        tensor.byte_offset = 0
+        managed.deleter = _dl_deleter
+        # the tensor keeps the buffer, and so the allocation, alive
+        _exports[addressof(managed)] = (managed, shape, self)
+        return _PyCapsule_New(addressof(managed), b"dltensor", cast(_capsule_destructor_cb, c_void_p))
+
+    ## @brief Frees an owned allocation; views and exported tensors must no
+    ##        longer be used
+    def close(self):
+        if self.__owned and self.address is not None:
+            if self.__allocator is not None:
+                self.__allocator.free(self.address)
+            else:
+                r = self.ddi.fastcall.zeMemFree(self.context, self.address)
+                if r != ze_result_v.SUCCESS:
+                    raise Exception(ze_result_v(r))
+        self.address = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.shape[0] if self.shape else 1
+
+    def __repr__(self):
+        return "<USMBuffer %s 0x%x, %d bytes, %r %s>" % (
+            self.type.name.lower(), self.address or 0, self.size, self.format, self.shape)
@@ -7,17 +7,21 @@
  @version v1.13-r1.13.1
 
  """
-import platform
+import sys
 from ctypes import *
 from enum import *
 
-###############################################################################
-__version__ = "1.0"
+from ._common import (
+    UnsupportedFunctionError, ZE_BIT, ZE_FASTCALL, ZE_MAKE_VERSION,
+    ZE_MAX_DEVICE_NAME, ZE_MAX_DEVICE_UUID_SIZE, ze_api_version_t,
+    ze_api_version_v, ze_bool_t, ze_device_properties_t,
+    ze_device_property_flags_t, ze_device_property_flags_v, ze_device_type_t,
+    ze_device_type_v, ze_device_uuid_t, ze_driver_handle_t, ze_result_t,
+    ze_result_v, ze_structure_type_t, ze_structure_type_v
+    )
 
 ###############################################################################
-## @brief Generates generic 'oneAPI' API versions
-def ZE_MAKE_VERSION( _major, _minor ):
-    return (( _major << 16 )|( _minor & 0x0000ffff))
+__version__ = "1.0"
 
 ###############################################################################
 ## @brief Extracts 'oneAPI' API major version
@@ -49,16 +53,6 @@ def ZE_MINOR_VERSION( _ver ):
 ## @brief GCC-specific dllexport storage-class attribute
 # ZE_DLLEXPORT not required for python
 
-###############################################################################
-## @brief compiler-independent type
-class ze_bool_t(c_ubyte):
-    pass
-
-###############################################################################
-## @brief Handle of a driver instance
-class ze_driver_handle_t(c_void_p):
-    pass
-
 ###############################################################################
 ## @brief Handle of driver's device object
 class ze_device_handle_t(c_void_p):
@@ -152,197 +146,6 @@ class ze_ipc_event_pool_handle_t(Structure):
         ("data", c_char * ZE_MAX_IPC_HANDLE_SIZE)                       ## [out] Opaque data representing an IPC handle
     ]
 
-###############################################################################
-## @brief Generic macro for enumerator bit masks
-def ZE_BIT( _i ):
-    return ( 1 << _i )
-
-###############################################################################
-## @brief Defines Return/Error codes
-class ze_result_v(IntEnum):
-    SUCCESS = 0                                                             ## [Core] success
-    NOT_READY = 1                                                           ## [Core] synchronization primitive not signaled
-    ERROR_DEVICE_LOST = 0x70000001                                          ## [Core] device hung, reset, was removed, or driver update occurred
-    ERROR_OUT_OF_HOST_MEMORY = 0x70000002                                   ## [Core] insufficient host memory to satisfy call
-    ERROR_OUT_OF_DEVICE_MEMORY = 0x70000003                                 ## [Core] insufficient device memory to satisfy call
-    ERROR_MODULE_BUILD_FAILURE = 0x70000004                                 ## [Core] error occurred when building module, see build log for details
-    ERROR_MODULE_LINK_FAILURE = 0x70000005                                  ## [Core] error occurred when linking modules, see build log for details
-    ERROR_DEVICE_REQUIRES_RESET = 0x70000006                                ## [Core] device requires a reset
-    ERROR_DEVICE_IN_LOW_POWER_STATE = 0x70000007                            ## [Core] device currently in low power state
-    EXP_ERROR_DEVICE_IS_NOT_VERTEX = 0x7ff00001                             ## [Core, Experimental] device is not represented by a fabric vertex
-    EXP_ERROR_VERTEX_IS_NOT_DEVICE = 0x7ff00002                             ## [Core, Experimental] fabric vertex does not represent a device
-    EXP_ERROR_REMOTE_DEVICE = 0x7ff00003                                    ## [Core, Experimental] fabric vertex represents a remote device or
-                                                                            ## subdevice
-    EXP_ERROR_OPERANDS_INCOMPATIBLE = 0x7ff00004                            ## [Core, Experimental] operands of comparison are not compatible
-    EXP_RTAS_BUILD_RETRY = 0x7ff00005                                       ## [Core, Experimental] ray tracing acceleration structure build
-                                                                            ## operation failed due to insufficient resources, retry with a larger
-                                                                            ## acceleration structure buffer allocation
-    EXP_RTAS_BUILD_DEFERRED = 0x7ff00006                                    ## [Core, Experimental] ray tracing acceleration structure build
-                                                                            ## operation deferred to parallel operation join
-    ERROR_INSUFFICIENT_PERMISSIONS = 0x70010000                             ## [Sysman] access denied due to permission level
-    ERROR_NOT_AVAILABLE = 0x70010001                                        ## [Sysman] resource already in use and simultaneous access not allowed
-                                                                            ## or resource was removed
-    ERROR_DEPENDENCY_UNAVAILABLE = 0x70020000                               ## [Common] external required dependency is unavailable or missing
-    WARNING_DROPPED_DATA = 0x70020001                                       ## [Tools] data may have been dropped
-    ERROR_UNINITIALIZED = 0x78000001                                        ## [Validation] driver is not initialized
-    ERROR_UNSUPPORTED_VERSION = 0x78000002                                  ## [Validation] generic error code for unsupported versions
-    ERROR_UNSUPPORTED_FEATURE = 0x78000003                                  ## [Validation] generic error code for unsupported features
-    ERROR_INVALID_ARGUMENT = 0x78000004                                     ## [Validation] generic error code for invalid arguments
-    ERROR_INVALID_NULL_HANDLE = 0x78000005                                  ## [Validation] handle argument is not valid
-    ERROR_HANDLE_OBJECT_IN_USE = 0x78000006                                 ## [Validation] object pointed to by handle still in-use by device
-    ERROR_INVALID_NULL_POINTER = 0x78000007                                 ## [Validation] pointer argument may not be nullptr
-    ERROR_INVALID_SIZE = 0x78000008                                         ## [Validation] size argument is invalid (e.g., must not be zero)
-    ERROR_UNSUPPORTED_SIZE = 0x78000009                                     ## [Validation] size argument is not supported by the device (e.g., too
-                                                                            ## large)
-    ERROR_UNSUPPORTED_ALIGNMENT = 0x7800000a                                ## [Validation] alignment argument is not supported by the device (e.g.,
-                                                                            ## too small)
-    ERROR_INVALID_SYNCHRONIZATION_OBJECT = 0x7800000b                       ## [Validation] synchronization object in invalid state
-    ERROR_INVALID_ENUMERATION = 0x7800000c                                  ## [Validation] enumerator argument is not valid
-    ERROR_UNSUPPORTED_ENUMERATION = 0x7800000d                              ## [Validation] enumerator argument is not supported by the device
-    ERROR_UNSUPPORTED_IMAGE_FORMAT = 0x7800000e                             ## [Validation] image format is not supported by the device
-    ERROR_INVALID_NATIVE_BINARY = 0x7800000f                                ## [Validation] native binary is not supported by the device
-    ERROR_INVALID_GLOBAL_NAME = 0x78000010                                  ## [Validation] global variable is not found in the module
-    ERROR_INVALID_KERNEL_NAME = 0x78000011                                  ## [Validation] kernel name is not found in the module
-    ERROR_INVALID_FUNCTION_NAME = 0x78000012                                ## [Validation] function name is not found in the module
-    ERROR_INVALID_GROUP_SIZE_DIMENSION = 0x78000013                         ## [Validation] group size dimension is not valid for the kernel or
-                                                                            ## device
-    ERROR_INVALID_GLOBAL_WIDTH_DIMENSION = 0x78000014                       ## [Validation] global width dimension is not valid for the kernel or
-                                                                            ## device
-    ERROR_INVALID_KERNEL_ARGUMENT_INDEX = 0x78000015                        ## [Validation] kernel argument index is not valid for kernel
-    ERROR_INVALID_KERNEL_ARGUMENT_SIZE = 0x78000016                         ## [Validation] kernel argument size does not match kernel
-    ERROR_INVALID_KERNEL_ATTRIBUTE_VALUE = 0x78000017                       ## [Validation] value of kernel attribute is not valid for the kernel or
-                                                                            ## device
-    ERROR_INVALID_MODULE_UNLINKED = 0x78000018                              ## [Validation] module with imports needs to be linked before kernels can
-                                                                            ## be created from it.
-    ERROR_INVALID_COMMAND_LIST_TYPE = 0x78000019                            ## [Validation] command list type does not match command queue type
-    ERROR_OVERLAPPING_REGIONS = 0x7800001a                                  ## [Validation] copy operations do not support overlapping regions of
-                                                                            ## memory
-    WARNING_ACTION_REQUIRED = 0x7800001b                                    ## [Sysman] an action is required to complete the desired operation
-    ERROR_INVALID_KERNEL_HANDLE = 0x7800001c                                ## [Core, Validation] kernel handle is invalid for the operation
-    EXT_RTAS_BUILD_RETRY = 0x7800001d                                       ## [Core, Extension] ray tracing acceleration structure build operation
-                                                                            ## failed due to insufficient resources, retry with a larger acceleration
-                                                                            ## structure buffer allocation
-    EXT_RTAS_BUILD_DEFERRED = 0x7800001e                                    ## [Core, Extension] ray tracing acceleration structure build operation
-                                                                            ## deferred to parallel operation join
-    EXT_ERROR_OPERANDS_INCOMPATIBLE = 0x7800001f                            ## [Core, Extension] operands of comparison are not compatible
-    ERROR_SURVIVABILITY_MODE_DETECTED = 0x78000020                          ## [Sysman] device is in survivability mode, firmware update needed
-    ERROR_UNKNOWN = 0x7ffffffe                                              ## [Core] unknown or internal error
-
-class ze_result_t(c_int):
-    def __str__(self):
-        return str(ze_result_v(self.value))
-
-
-###############################################################################
-## @brief Defines structure types
-class ze_structure_type_v(IntEnum):
-    DRIVER_PROPERTIES = 0x1                                                 ## ::ze_driver_properties_t
-    DRIVER_IPC_PROPERTIES = 0x2                                             ## ::ze_driver_ipc_properties_t
-    DEVICE_PROPERTIES = 0x3                                                 ## ::ze_device_properties_t
-    DEVICE_COMPUTE_PROPERTIES = 0x4                                         ## ::ze_device_compute_properties_t
-    DEVICE_MODULE_PROPERTIES = 0x5                                          ## ::ze_device_module_properties_t
-    COMMAND_QUEUE_GROUP_PROPERTIES = 0x6                                    ## ::ze_command_queue_group_properties_t
-    DEVICE_MEMORY_PROPERTIES = 0x7                                          ## ::ze_device_memory_properties_t
-    DEVICE_MEMORY_ACCESS_PROPERTIES = 0x8                                   ## ::ze_device_memory_access_properties_t
-    DEVICE_CACHE_PROPERTIES = 0x9                                           ## ::ze_device_cache_properties_t
-    DEVICE_IMAGE_PROPERTIES = 0xa                                           ## ::ze_device_image_properties_t
-    DEVICE_P2P_PROPERTIES = 0xb                                             ## ::ze_device_p2p_properties_t
-    DEVICE_EXTERNAL_MEMORY_PROPERTIES = 0xc                                 ## ::ze_device_external_memory_properties_t
-    CONTEXT_DESC = 0xd                                                      ## ::ze_context_desc_t
-    COMMAND_QUEUE_DESC = 0xe                                                ## ::ze_command_queue_desc_t
-    COMMAND_LIST_DESC = 0xf                                                 ## ::ze_command_list_desc_t
-    EVENT_POOL_DESC = 0x10                                                  ## ::ze_event_pool_desc_t
-    EVENT_DESC = 0x11                                                       ## ::ze_event_desc_t
-    FENCE_DESC = 0x12                                                       ## ::ze_fence_desc_t
-    IMAGE_DESC = 0x13                                                       ## ::ze_image_desc_t
-    IMAGE_PROPERTIES = 0x14                                                 ## ::ze_image_properties_t
-    DEVICE_MEM_ALLOC_DESC = 0x15                                            ## ::ze_device_mem_alloc_desc_t
-    HOST_MEM_ALLOC_DESC = 0x16                                              ## ::ze_host_mem_alloc_desc_t
-    MEMORY_ALLOCATION_PROPERTIES = 0x17                                     ## ::ze_memory_allocation_properties_t
-    EXTERNAL_MEMORY_EXPORT_DESC = 0x18                                      ## ::ze_external_memory_export_desc_t
-    EXTERNAL_MEMORY_IMPORT_FD = 0x19                                        ## ::ze_external_memory_import_fd_t
-    EXTERNAL_MEMORY_EXPORT_FD = 0x1a                                        ## ::ze_external_memory_export_fd_t
-    MODULE_DESC = 0x1b                                                      ## ::ze_module_desc_t
-    MODULE_PROPERTIES = 0x1c                                                ## ::ze_module_properties_t
-    KERNEL_DESC = 0x1d                                                      ## ::ze_kernel_desc_t
-    KERNEL_PROPERTIES = 0x1e                                                ## ::ze_kernel_properties_t
-    SAMPLER_DESC = 0x1f                                                     ## ::ze_sampler_desc_t
-    PHYSICAL_MEM_DESC = 0x20                                                ## ::ze_physical_mem_desc_t
-    KERNEL_PREFERRED_GROUP_SIZE_PROPERTIES = 0x21                           ## ::ze_kernel_preferred_group_size_properties_t
-    EXTERNAL_MEMORY_IMPORT_WIN32 = 0x22                                     ## ::ze_external_memory_import_win32_handle_t
-    EXTERNAL_MEMORY_EXPORT_WIN32 = 0x23                                     ## ::ze_external_memory_export_win32_handle_t
-    DEVICE_RAYTRACING_EXT_PROPERTIES = 0x00010001                           ## ::ze_device_raytracing_ext_properties_t
-    RAYTRACING_MEM_ALLOC_EXT_DESC = 0x10002                                 ## ::ze_raytracing_mem_alloc_ext_desc_t
-    FLOAT_ATOMIC_EXT_PROPERTIES = 0x10003                                   ## ::ze_float_atomic_ext_properties_t
-    CACHE_RESERVATION_EXT_DESC = 0x10004                                    ## ::ze_cache_reservation_ext_desc_t
-    EU_COUNT_EXT = 0x10005                                                  ## ::ze_eu_count_ext_t
-    SRGB_EXT_DESC = 0x10006                                                 ## ::ze_srgb_ext_desc_t
-    LINKAGE_INSPECTION_EXT_DESC = 0x10007                                   ## ::ze_linkage_inspection_ext_desc_t
-    PCI_EXT_PROPERTIES = 0x10008                                            ## ::ze_pci_ext_properties_t
-    DRIVER_MEMORY_FREE_EXT_PROPERTIES = 0x10009                             ## ::ze_driver_memory_free_ext_properties_t
-    MEMORY_FREE_EXT_DESC = 0x1000a                                          ## ::ze_memory_free_ext_desc_t
-    MEMORY_COMPRESSION_HINTS_EXT_DESC = 0x1000b                             ## ::ze_memory_compression_hints_ext_desc_t
-    IMAGE_ALLOCATION_EXT_PROPERTIES = 0x1000c                               ## ::ze_image_allocation_ext_properties_t
-    DEVICE_LUID_EXT_PROPERTIES = 0x1000d                                    ## ::ze_device_luid_ext_properties_t
-    DEVICE_MEMORY_EXT_PROPERTIES = 0x1000e                                  ## ::ze_device_memory_ext_properties_t
-    DEVICE_IP_VERSION_EXT = 0x1000f                                         ## ::ze_device_ip_version_ext_t
-    IMAGE_VIEW_PLANAR_EXT_DESC = 0x10010                                    ## ::ze_image_view_planar_ext_desc_t
-    EVENT_QUERY_KERNEL_TIMESTAMPS_EXT_PROPERTIES = 0x10011                  ## ::ze_event_query_kernel_timestamps_ext_properties_t
-    EVENT_QUERY_KERNEL_TIMESTAMPS_RESULTS_EXT_PROPERTIES = 0x10012          ## ::ze_event_query_kernel_timestamps_results_ext_properties_t
-    KERNEL_MAX_GROUP_SIZE_EXT_PROPERTIES = 0x10013                          ## ::ze_kernel_max_group_size_ext_properties_t
-    RELAXED_ALLOCATION_LIMITS_EXP_DESC = 0x00020001                         ## ::ze_relaxed_allocation_limits_exp_desc_t
-    MODULE_PROGRAM_EXP_DESC = 0x00020002                                    ## ::ze_module_program_exp_desc_t
-    SCHEDULING_HINT_EXP_PROPERTIES = 0x00020003                             ## ::ze_scheduling_hint_exp_properties_t
-    SCHEDULING_HINT_EXP_DESC = 0x00020004                                   ## ::ze_scheduling_hint_exp_desc_t
-    IMAGE_VIEW_PLANAR_EXP_DESC = 0x00020005                                 ## ::ze_image_view_planar_exp_desc_t
-    DEVICE_PROPERTIES_1_2 = 0x00020006                                      ## ::ze_device_properties_t
-    IMAGE_MEMORY_EXP_PROPERTIES = 0x00020007                                ## ::ze_image_memory_properties_exp_t
-    POWER_SAVING_HINT_EXP_DESC = 0x00020008                                 ## ::ze_context_power_saving_hint_exp_desc_t
-    COPY_BANDWIDTH_EXP_PROPERTIES = 0x00020009                              ## ::ze_copy_bandwidth_exp_properties_t
-    DEVICE_P2P_BANDWIDTH_EXP_PROPERTIES = 0x0002000A                        ## ::ze_device_p2p_bandwidth_exp_properties_t
-    FABRIC_VERTEX_EXP_PROPERTIES = 0x0002000B                               ## ::ze_fabric_vertex_exp_properties_t
-    FABRIC_EDGE_EXP_PROPERTIES = 0x0002000C                                 ## ::ze_fabric_edge_exp_properties_t
-    MEMORY_SUB_ALLOCATIONS_EXP_PROPERTIES = 0x0002000D                      ## ::ze_memory_sub_allocations_exp_properties_t
-    RTAS_BUILDER_EXP_DESC = 0x0002000E                                      ## ::ze_rtas_builder_exp_desc_t
-    RTAS_BUILDER_BUILD_OP_EXP_DESC = 0x0002000F                             ## ::ze_rtas_builder_build_op_exp_desc_t
-    RTAS_BUILDER_EXP_PROPERTIES = 0x00020010                                ## ::ze_rtas_builder_exp_properties_t
-    RTAS_PARALLEL_OPERATION_EXP_PROPERTIES = 0x00020011                     ## ::ze_rtas_parallel_operation_exp_properties_t
-    RTAS_DEVICE_EXP_PROPERTIES = 0x00020012                                 ## ::ze_rtas_device_exp_properties_t
-    RTAS_GEOMETRY_AABBS_EXP_CB_PARAMS = 0x00020013                          ## ::ze_rtas_geometry_aabbs_exp_cb_params_t
-    COUNTER_BASED_EVENT_POOL_EXP_DESC = 0x00020014                          ## ::ze_event_pool_counter_based_exp_desc_t
-    MUTABLE_COMMAND_LIST_EXP_PROPERTIES = 0x00020015                        ## ::ze_mutable_command_list_exp_properties_t
-    MUTABLE_COMMAND_LIST_EXP_DESC = 0x00020016                              ## ::ze_mutable_command_list_exp_desc_t
-    MUTABLE_COMMAND_ID_EXP_DESC = 0x00020017                                ## ::ze_mutable_command_id_exp_desc_t
-    MUTABLE_COMMANDS_EXP_DESC = 0x00020018                                  ## ::ze_mutable_commands_exp_desc_t
-    MUTABLE_KERNEL_ARGUMENT_EXP_DESC = 0x00020019                           ## ::ze_mutable_kernel_argument_exp_desc_t
-    MUTABLE_GROUP_COUNT_EXP_DESC = 0x0002001A                               ## ::ze_mutable_group_count_exp_desc_t
-    MUTABLE_GROUP_SIZE_EXP_DESC = 0x0002001B                                ## ::ze_mutable_group_size_exp_desc_t
-    MUTABLE_GLOBAL_OFFSET_EXP_DESC = 0x0002001C                             ## ::ze_mutable_global_offset_exp_desc_t
-    PITCHED_ALLOC_DEVICE_EXP_PROPERTIES = 0x0002001D                        ## ::ze_device_pitched_alloc_exp_properties_t
-    BINDLESS_IMAGE_EXP_DESC = 0x0002001E                                    ## ::ze_image_bindless_exp_desc_t
-    PITCHED_IMAGE_EXP_DESC = 0x0002001F                                     ## ::ze_image_pitched_exp_desc_t
-    MUTABLE_GRAPH_ARGUMENT_EXP_DESC = 0x00020020                            ## ::ze_mutable_graph_argument_exp_desc_t
-    INIT_DRIVER_TYPE_DESC = 0x00020021                                      ## ::ze_init_driver_type_desc_t
-    EXTERNAL_SEMAPHORE_EXT_DESC = 0x00020022                                ## ::ze_external_semaphore_ext_desc_t
-    EXTERNAL_SEMAPHORE_WIN32_EXT_DESC = 0x00020023                          ## ::ze_external_semaphore_win32_ext_desc_t
-    EXTERNAL_SEMAPHORE_FD_EXT_DESC = 0x00020024                             ## ::ze_external_semaphore_fd_ext_desc_t
-    EXTERNAL_SEMAPHORE_SIGNAL_PARAMS_EXT = 0x00020025                       ## ::ze_external_semaphore_signal_params_ext_t
-    EXTERNAL_SEMAPHORE_WAIT_PARAMS_EXT = 0x00020026                         ## ::ze_external_semaphore_wait_params_ext_t
-    DRIVER_DDI_HANDLES_EXT_PROPERTIES = 0x00020027                          ## ::ze_driver_ddi_handles_ext_properties_t
-    DEVICE_CACHELINE_SIZE_EXT = 0x00020028                                  ## ::ze_device_cache_line_size_ext_t
-    DEVICE_VECTOR_WIDTH_PROPERTIES_EXT = 0x00020029                         ## ::ze_device_vector_width_properties_ext_t
-    RTAS_BUILDER_EXT_DESC = 0x00020030                                      ## ::ze_rtas_builder_ext_desc_t
-    RTAS_BUILDER_BUILD_OP_EXT_DESC = 0x00020031                             ## ::ze_rtas_builder_build_op_ext_desc_t
-    RTAS_BUILDER_EXT_PROPERTIES = 0x00020032                                ## ::ze_rtas_builder_ext_properties_t
-    RTAS_PARALLEL_OPERATION_EXT_PROPERTIES = 0x00020033                     ## ::ze_rtas_parallel_operation_ext_properties_t
-    RTAS_DEVICE_EXT_PROPERTIES = 0x00020034                                 ## ::ze_rtas_device_ext_properties_t
-    RTAS_GEOMETRY_AABBS_EXT_CB_PARAMS = 0x00020035                          ## ::ze_rtas_geometry_aabbs_ext_cb_params_t
-
-class ze_structure_type_t(c_int):
-    def __str__(self):
-        return str(ze_structure_type_v(self.value))
-
-
 ###############################################################################
 ## @brief External memory type flags
 class ze_external_memory_type_flags_v(IntEnum):
@@ -487,34 +290,6 @@ class ze_init_driver_type_desc_t(Structure):
                                                                         ## driver types are init and retrieved based on these init flags in zeInitDrivers().
     ]
 
-###############################################################################
-## @brief Supported API versions
-## 
-## @details
-##     - API versions contain major and minor attributes, use
-##       ::ZE_MAJOR_VERSION and ::ZE_MINOR_VERSION
-class ze_api_version_v(IntEnum):
-    _1_0 = ZE_MAKE_VERSION( 1, 0 )                                          ## version 1.0
-    _1_1 = ZE_MAKE_VERSION( 1, 1 )                                          ## version 1.1
-    _1_2 = ZE_MAKE_VERSION( 1, 2 )                                          ## version 1.2
-    _1_3 = ZE_MAKE_VERSION( 1, 3 )                                          ## version 1.3
-    _1_4 = ZE_MAKE_VERSION( 1, 4 )                                          ## version 1.4
-    _1_5 = ZE_MAKE_VERSION( 1, 5 )                                          ## version 1.5
-    _1_6 = ZE_MAKE_VERSION( 1, 6 )                                          ## version 1.6
-    _1_7 = ZE_MAKE_VERSION( 1, 7 )                                          ## version 1.7
-    _1_8 = ZE_MAKE_VERSION( 1, 8 )                                          ## version 1.8
-    _1_9 = ZE_MAKE_VERSION( 1, 9 )                                          ## version 1.9
-    _1_10 = ZE_MAKE_VERSION( 1, 10 )                                        ## version 1.10
-    _1_11 = ZE_MAKE_VERSION( 1, 11 )                                        ## version 1.11
-    _1_12 = ZE_MAKE_VERSION( 1, 12 )                                        ## version 1.12
-    _1_13 = ZE_MAKE_VERSION( 1, 13 )                                        ## version 1.13
-    CURRENT = ZE_MAKE_VERSION( 1, 13 )                                      ## latest known version
-
-class ze_api_version_t(c_int):
-    def __str__(self):
-        return str(ze_api_version_v(self.value))
-
-
 ###############################################################################
 ## @brief Current API version as a macro
 ZE_API_VERSION_CURRENT_M = ZE_MAKE_VERSION( 1, 13 )
@@ -538,7 +313,7 @@ class ze_driver_properties_t(Structure):
         ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
         ("uuid", ze_driver_uuid_t),                                     ## [out] universal unique identifier.
-        ("driverVersion", c_ulong)                                      ## [out] driver version
+        ("driverVersion", c_uint32)                                     ## [out] driver version
                                                                         ## The driver version is a non-zero, monotonically increasing value where
                                                                         ## higher values always indicate a more recent version.
     ]
@@ -575,100 +350,22 @@ ZE_MAX_EXTENSION_NAME = 256
 class ze_driver_extension_properties_t(Structure):
     _fields_ = [
         ("name", c_char * ZE_MAX_EXTENSION_NAME),                       ## [out] extension name
-        ("version", c_ulong)                                            ## [out] extension version using ::ZE_MAKE_VERSION
-    ]
-
-###############################################################################
-## @brief Supported device types
-class ze_device_type_v(IntEnum):
-    GPU = 1                                                                 ## Graphics Processing Unit
-    CPU = 2                                                                 ## Central Processing Unit
-    FPGA = 3                                                                ## Field Programmable Gate Array
-    MCA = 4                                                                 ## Memory Copy Accelerator
-    VPU = 5                                                                 ## Vision Processing Unit
-
-class ze_device_type_t(c_int):
-    def __str__(self):
-        return str(ze_device_type_v(self.value))
-
-
-###############################################################################
-## @brief Maximum device universal unique id (UUID) size in bytes
-ZE_MAX_DEVICE_UUID_SIZE = 16
-
-###############################################################################
-## @brief Device universal unique id (UUID)
-class ze_device_uuid_t(Structure):
-    _fields_ = [
-        ("id", c_ubyte * ZE_MAX_DEVICE_UUID_SIZE)                       ## [out] opaque data representing a device UUID
-    ]
-
-###############################################################################
-## @brief Maximum device name string size
-ZE_MAX_DEVICE_NAME = 256
-
-###############################################################################
-## @brief Supported device property flags
-class ze_device_property_flags_v(IntEnum):
-    INTEGRATED = ZE_BIT(0)                                                  ## Device is integrated with the Host.
-    SUBDEVICE = ZE_BIT(1)                                                   ## Device handle used for query represents a sub-device.
-    ECC = ZE_BIT(2)                                                         ## Device supports error correction memory access.
-    ONDEMANDPAGING = ZE_BIT(3)                                              ## Device supports on-demand page-faulting.
-
-class ze_device_property_flags_t(c_int):
-    def __str__(self):
-        return hex(self.value)
-
-
-###############################################################################
-## @brief Device properties queried using ::zeDeviceGetProperties
-class ze_device_properties_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("type", ze_device_type_t),                                     ## [out] generic device type
-        ("vendorId", c_ulong),                                          ## [out] vendor id from PCI configuration
-        ("deviceId", c_ulong),                                          ## [out] device id from PCI configuration.
-                                                                        ## Note, the device id uses little-endian format.
-        ("flags", ze_device_property_flags_t),                          ## [out] 0 (none) or a valid combination of ::ze_device_property_flag_t
-        ("subdeviceId", c_ulong),                                       ## [out] sub-device id. Only valid if ::ZE_DEVICE_PROPERTY_FLAG_SUBDEVICE
-                                                                        ## is set.
-        ("coreClockRate", c_ulong),                                     ## [out] Clock rate for device core.
-        ("maxMemAllocSize", c_ulonglong),                               ## [out] Maximum memory allocation size.
-        ("maxHardwareContexts", c_ulong),                               ## [out] Maximum number of logical hardware contexts.
-        ("maxCommandQueuePriority", c_ulong),                           ## [out] Maximum priority for command queues. Higher value is higher
-                                                                        ## priority.
-        ("numThreadsPerEU", c_ulong),                                   ## [out] Maximum number of threads per EU.
-        ("physicalEUSimdWidth", c_ulong),                               ## [out] The physical EU simd width.
-        ("numEUsPerSubslice", c_ulong),                                 ## [out] Maximum number of EUs per sub-slice.
-        ("numSubslicesPerSlice", c_ulong),                              ## [out] Maximum number of sub-slices per slice.
-        ("numSlices", c_ulong),                                         ## [out] Maximum number of slices.
-        ("timerResolution", c_ulonglong),                               ## [out] Returns the resolution of device timer used for profiling,
-                                                                        ## timestamps, etc. When stype==::ZE_STRUCTURE_TYPE_DEVICE_PROPERTIES the
-                                                                        ## units are in nanoseconds. When
-                                                                        ## stype==::ZE_STRUCTURE_TYPE_DEVICE_PROPERTIES_1_2 units are in
-                                                                        ## cycles/sec
-        ("timestampValidBits", c_ulong),                                ## [out] Returns the number of valid bits in the timestamp value.
-        ("kernelTimestampValidBits", c_ulong),                          ## [out] Returns the number of valid bits in the kernel timestamp values
-        ("uuid", ze_device_uuid_t),                                     ## [out] universal unique identifier. Note: Subdevices will have their
-                                                                        ## own uuid.
-        ("name", c_char * ZE_MAX_DEVICE_NAME)                           ## [out] Device name
+        ("version", c_uint32)                                           ## [out] extension version using ::ZE_MAKE_VERSION
     ]
 
 ###############################################################################
 ## @brief Device thread identifier.
 class ze_device_thread_t(Structure):
     _fields_ = [
-        ("slice", c_ulong),                                             ## [in,out] the slice number.
+        ("slice", c_uint32),                                            ## [in,out] the slice number.
                                                                         ## Must be `UINT32_MAX` (all) or less than the `numSlices` member of ::ze_device_properties_t.
-        ("subslice", c_ulong),                                          ## [in,out] the sub-slice number within its slice.
+        ("subslice", c_uint32),                                         ## [in,out] the sub-slice number within its slice.
                                                                         ## Must be `UINT32_MAX` (all) or less than the `numSubslicesPerSlice`
                                                                         ## member of ::ze_device_properties_t.
-        ("eu", c_ulong),                                                ## [in,out] the EU number within its sub-slice.
+        ("eu", c_uint32),                                               ## [in,out] the EU number within its sub-slice.
                                                                         ## Must be `UINT32_MAX` (all) or less than the `numEUsPerSubslice` member
                                                                         ## of ::ze_device_properties_t.
-        ("thread", c_ulong)                                             ## [in,out] the thread number within its EU.
+        ("thread", c_uint32)                                            ## [in,out] the thread number within its EU.
                                                                         ## Must be `UINT32_MAX` (all) or less than the `numThreadsPerEU` member
                                                                         ## of ::ze_device_properties_t.
     ]
@@ -684,18 +381,18 @@ class ze_device_compute_properties_t(Structure):
         ("stype", ze_structure_type_t),                                 ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("maxTotalGroupSize", c_ulong),                                 ## [out] Maximum items per compute group. (groupSizeX * groupSizeY *
+        ("maxTotalGroupSize", c_uint32),                                ## [out] Maximum items per compute group. (groupSizeX * groupSizeY *
                                                                         ## groupSizeZ) <= maxTotalGroupSize
-        ("maxGroupSizeX", c_ulong),                                     ## [out] Maximum items for X dimension in group
-        ("maxGroupSizeY", c_ulong),                                     ## [out] Maximum items for Y dimension in group
-        ("maxGroupSizeZ", c_ulong),                                     ## [out] Maximum items for Z dimension in group
-        ("maxGroupCountX", c_ulong),                                    ## [out] Maximum groups that can be launched for x dimension
-        ("maxGroupCountY", c_ulong),                                    ## [out] Maximum groups that can be launched for y dimension
-        ("maxGroupCountZ", c_ulong),                                    ## [out] Maximum groups that can be launched for z dimension
-        ("maxSharedLocalMemory", c_ulong),                              ## [out] Maximum shared local memory per group.
-        ("numSubGroupSizes", c_ulong),                                  ## [out] Number of subgroup sizes supported. This indicates number of
+        ("maxGroupSizeX", c_uint32),                                    ## [out] Maximum items for X dimension in group
+        ("maxGroupSizeY", c_uint32),                                    ## [out] Maximum items for Y dimension in group
+        ("maxGroupSizeZ", c_uint32),                                    ## [out] Maximum items for Z dimension in group
+        ("maxGroupCountX", c_uint32),                                   ## [out] Maximum groups that can be launched for x dimension
+        ("maxGroupCountY", c_uint32),                                   ## [out] Maximum groups that can be launched for y dimension
+        ("maxGroupCountZ", c_uint32),                                   ## [out] Maximum groups that can be launched for z dimension
+        ("maxSharedLocalMemory", c_uint32),                             ## [out] Maximum shared local memory per group.
+        ("numSubGroupSizes", c_uint32),                                 ## [out] Number of subgroup sizes supported. This indicates number of
                                                                         ## entries in subGroupSizes.
-        ("subGroupSizes", c_ulong * ZE_SUBGROUPSIZE_COUNT)              ## [out] Size group sizes supported.
+        ("subGroupSizes", c_uint32 * ZE_SUBGROUPSIZE_COUNT)             ## [out] Size group sizes supported.
     ]
 
 ###############################################################################
@@ -747,7 +444,7 @@ class ze_device_module_properties_t(Structure):
         ("stype", ze_structure_type_t),                                 ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("spirvVersionSupported", c_ulong),                             ## [out] Maximum supported SPIR-V version.
+        ("spirvVersionSupported", c_uint32),                            ## [out] Maximum supported SPIR-V version.
                                                                         ## Returns zero if SPIR-V is not supported.
                                                                         ## Contains major and minor attributes, use ::ZE_MAJOR_VERSION and ::ZE_MINOR_VERSION.
         ("flags", ze_device_module_flags_t),                            ## [out] 0 or a valid combination of ::ze_device_module_flag_t
@@ -759,8 +456,8 @@ class ze_device_module_properties_t(Structure):
         ("fp64flags", ze_device_fp_flags_t),                            ## [out] Capabilities for double-precision floating-point operations.
                                                                         ## returns 0 (if ::ZE_DEVICE_MODULE_FLAG_FP64 is not set) or a
                                                                         ## combination of ::ze_device_fp_flag_t.
-        ("maxArgumentsSize", c_ulong),                                  ## [out] Maximum kernel argument size that is supported.
-        ("printfBufferSize", c_ulong),                                  ## [out] Maximum size of internal buffer that holds output of printf
+        ("maxArgumentsSize", c_uint32),                                 ## [out] Maximum kernel argument size that is supported.
+        ("printfBufferSize", c_uint32),                                 ## [out] Maximum size of internal buffer that holds output of printf
                                                                         ## calls from kernel.
         ("nativeKernelSupported", ze_native_kernel_uuid_t)              ## [out] Compatibility UUID of supported native kernel.
                                                                         ## UUID may or may not be the same across driver release, devices, or
@@ -796,7 +493,7 @@ class ze_command_queue_group_properties_t(Structure):
                                                                         ## ::ze_command_queue_group_property_flag_t
         ("maxMemoryFillPatternSize", c_size_t),                         ## [out] maximum `pattern_size` supported by command queue group.
                                                                         ## See ::zeCommandListAppendMemoryFill for more details.
-        ("numQueues", c_ulong)                                          ## [out] the number of physical engines within the group.
+        ("numQueues", c_uint32)                                         ## [out] the number of physical engines within the group.
     ]
 
 ###############################################################################
@@ -819,9 +516,9 @@ class ze_device_memory_properties_t(Structure):
                                                                         ## structure (i.e. contains stype and pNext).
         ("flags", ze_device_memory_property_flags_t),                   ## [out] 0 (none) or a valid combination of
                                                                         ## ::ze_device_memory_property_flag_t
-        ("maxClockRate", c_ulong),                                      ## [out] Maximum clock rate for device memory.
-        ("maxBusWidth", c_ulong),                                       ## [out] Maximum bus width between device and memory.
-        ("totalSize", c_ulonglong),                                     ## [out] Total memory size in bytes that is available to the device.
+        ("maxClockRate", c_uint32),                                     ## [out] Maximum clock rate for device memory.
+        ("maxBusWidth", c_uint32),                                      ## [out] Maximum bus width between device and memory.
+        ("totalSize", c_uint64),                                        ## [out] Total memory size in bytes that is available to the device.
         ("name", c_char * ZE_MAX_DEVICE_NAME)                           ## [out] Memory name
     ]
 
@@ -891,22 +588,22 @@ class ze_device_image_properties_t(Structure):
         ("stype", ze_structure_type_t),                                 ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("maxImageDims1D", c_ulong),                                    ## [out] Maximum image dimensions for 1D resources. if 0, then 1D images
+        ("maxImageDims1D", c_uint32),                                   ## [out] Maximum image dimensions for 1D resources. if 0, then 1D images
                                                                         ## are unsupported.
-        ("maxImageDims2D", c_ulong),                                    ## [out] Maximum image dimensions for 2D resources. if 0, then 2D images
+        ("maxImageDims2D", c_uint32),                                   ## [out] Maximum image dimensions for 2D resources. if 0, then 2D images
                                                                         ## are unsupported.
-        ("maxImageDims3D", c_ulong),                                    ## [out] Maximum image dimensions for 3D resources. if 0, then 3D images
+        ("maxImageDims3D", c_uint32),                                   ## [out] Maximum image dimensions for 3D resources. if 0, then 3D images
                                                                         ## are unsupported.
-        ("maxImageBufferSize", c_ulonglong),                            ## [out] Maximum image buffer size in bytes. if 0, then buffer images are
+        ("maxImageBufferSize", c_uint64),                               ## [out] Maximum image buffer size in bytes. if 0, then buffer images are
                                                                         ## unsupported.
-        ("maxImageArraySlices", c_ulong),                               ## [out] Maximum image array slices. if 0, then image arrays are
+        ("maxImageArraySlices", c_uint32),                              ## [out] Maximum image array slices. if 0, then image arrays are
                                                                         ## unsupported.
-        ("maxSamplers", c_ulong),                                       ## [out] Max samplers that can be used in kernel. if 0, then sampling is
+        ("maxSamplers", c_uint32),                                      ## [out] Max samplers that can be used in kernel. if 0, then sampling is
                                                                         ## unsupported.
-        ("maxReadImageArgs", c_ulong),                                  ## [out] Returns the maximum number of simultaneous image objects that
+        ("maxReadImageArgs", c_uint32),                                 ## [out] Returns the maximum number of simultaneous image objects that
                                                                         ## can be read from by a kernel. if 0, then reading images is
                                                                         ## unsupported.
-        ("maxWriteImageArgs", c_ulong)                                  ## [out] Returns the maximum number of simultaneous image objects that
+        ("maxWriteImageArgs", c_uint32)                                 ## [out] Returns the maximum number of simultaneous image objects that
                                                                         ## can be written to by a kernel. if 0, then writing images is
                                                                         ## unsupported.
     ]
@@ -1027,8 +724,8 @@ class ze_command_queue_desc_t(Structure):
         ("stype", ze_structure_type_t),                                 ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("ordinal", c_ulong),                                           ## [in] command queue group ordinal
-        ("index", c_ulong),                                             ## [in] command queue index within the group;
+        ("ordinal", c_uint32),                                          ## [in] command queue group ordinal
+        ("index", c_uint32),                                            ## [in] command queue index within the group;
                                                                         ## must be zero. 
         ("flags", ze_command_queue_flags_t),                            ## [in] usage flags.
                                                                         ## must be 0 (default) or a valid combination of ::ze_command_queue_flag_t;
@@ -1081,7 +778,7 @@ class ze_command_list_desc_t(Structure):
         ("stype", ze_structure_type_t),                                 ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("commandQueueGroupOrdinal", c_ulong),                          ## [in] command queue group ordinal to which this command list will be
+        ("commandQueueGroupOrdinal", c_uint32),                         ## [in] command queue group ordinal to which this command list will be
                                                                         ## submitted
         ("flags", ze_command_list_flags_t)                              ## [in] usage flags.
                                                                         ## must be 0 (default) or a valid combination of ::ze_command_list_flag_t;
@@ -1093,12 +790,12 @@ class ze_command_list_desc_t(Structure):
 ## @brief Copy region descriptor
 class ze_copy_region_t(Structure):
     _fields_ = [
-        ("originX", c_ulong),                                           ## [in] The origin x offset for region in bytes
-        ("originY", c_ulong),                                           ## [in] The origin y offset for region in rows
-        ("originZ", c_ulong),                                           ## [in] The origin z offset for region in slices
-        ("width", c_ulong),                                             ## [in] The region width relative to origin in bytes
-        ("height", c_ulong),                                            ## [in] The region height relative to origin in rows
-        ("depth", c_ulong)                                              ## [in] The region depth relative to origin in slices. Set this to 0 for
+        ("originX", c_uint32),                                          ## [in] The origin x offset for region in bytes
+        ("originY", c_uint32),                                          ## [in] The origin y offset for region in rows
+        ("originZ", c_uint32),                                          ## [in] The origin z offset for region in slices
+        ("width", c_uint32),                                            ## [in] The region width relative to origin in bytes
+        ("height", c_uint32),                                           ## [in] The region height relative to origin in rows
+        ("depth", c_uint32)                                             ## [in] The region depth relative to origin in slices. Set this to 0 for
                                                                         ## 2D copy.
     ]
 
@@ -1106,12 +803,12 @@ class ze_copy_region_t(Structure):
 ## @brief Region descriptor
 class ze_image_region_t(Structure):
     _fields_ = [
-        ("originX", c_ulong),                                           ## [in] The origin x offset for region in pixels
-        ("originY", c_ulong),                                           ## [in] The origin y offset for region in pixels
-        ("originZ", c_ulong),                                           ## [in] The origin z offset for region in pixels
-        ("width", c_ulong),                                             ## [in] The region width relative to origin in pixels
-        ("height", c_ulong),                                            ## [in] The region height relative to origin in pixels
-        ("depth", c_ulong)                                              ## [in] The region depth relative to origin. For 1D or 2D images, set
+        ("originX", c_uint32),                                          ## [in] The origin x offset for region in pixels
+        ("originY", c_uint32),                                          ## [in] The origin y offset for region in pixels
+        ("originZ", c_uint32),                                          ## [in] The origin z offset for region in pixels
+        ("width", c_uint32),                                            ## [in] The region width relative to origin in pixels
+        ("height", c_uint32),                                           ## [in] The region height relative to origin in pixels
+        ("depth", c_uint32)                                             ## [in] The region depth relative to origin. For 1D or 2D images, set
                                                                         ## this to 1.
     ]
 
@@ -1161,7 +858,7 @@ class ze_event_pool_desc_t(Structure):
                                                                         ## must be 0 (default) or a valid combination of ::ze_event_pool_flag_t;
                                                                         ## default behavior is signals and waits are visible to the entire device
                                                                         ## and peer devices.
-        ("count", c_ulong)                                              ## [in] number of events within the pool; must be greater than 0
+        ("count", c_uint32)                                             ## [in] number of events within the pool; must be greater than 0
     ]
 
 ###############################################################################
@@ -1186,7 +883,7 @@ class ze_event_desc_t(Structure):
         ("stype", ze_structure_type_t),                                 ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("index", c_ulong),                                             ## [in] index of the event within the pool; must be less than the count
+        ("index", c_uint32),                                            ## [in] index of the event within the pool; must be less than the count
                                                                         ## specified during pool creation
         ("signal", ze_event_scope_flags_t),                             ## [in] defines the scope of relevant cache hierarchies to flush on a
                                                                         ## signal action before the event is triggered.
@@ -1210,8 +907,8 @@ class ze_event_desc_t(Structure):
 ##       the `kernelTimestampValidBits` member of ::ze_device_properties_t.
 class ze_kernel_timestamp_data_t(Structure):
     _fields_ = [
-        ("kernelStart", c_ulonglong),                                   ## [out] device clock at start of kernel execution
-        ("kernelEnd", c_ulonglong)                                      ## [out] device clock at end of kernel execution
+        ("kernelStart", c_uint64),                                      ## [out] device clock at start of kernel execution
+        ("kernelEnd", c_uint64)                                         ## [out] device clock at end of kernel execution
     ]
 
 ###############################################################################
@@ -1381,7 +1078,7 @@ class ze_image_desc_t(Structure):
         ("type", ze_image_type_t),                                      ## [in] image type. Media format layouts are unsupported for
                                                                         ## ::ZE_IMAGE_TYPE_BUFFER
         ("format", ze_image_format_t),                                  ## [in] image format
-        ("width", c_ulonglong),                                         ## [in] width dimension.
+        ("width", c_uint64),                                            ## [in] width dimension.
                                                                         ## ::ZE_IMAGE_TYPE_BUFFER: size in bytes; see the `maxImageBufferSize`
                                                                         ## member of ::ze_device_image_properties_t for limits.
                                                                         ## ::ZE_IMAGE_TYPE_1D, ::ZE_IMAGE_TYPE_1DARRAY: width in pixels; see the
@@ -1390,21 +1087,21 @@ class ze_image_desc_t(Structure):
                                                                         ## `maxImageDims2D` member of ::ze_device_image_properties_t for limits.
                                                                         ## ::ZE_IMAGE_TYPE_3D: width in pixels; see the `maxImageDims3D` member
                                                                         ## of ::ze_device_image_properties_t for limits.
-        ("height", c_ulong),                                            ## [in] height dimension.
+        ("height", c_uint32),                                           ## [in] height dimension.
                                                                         ## ::ZE_IMAGE_TYPE_2D, ::ZE_IMAGE_TYPE_2DARRAY: height in pixels; see the
                                                                         ## `maxImageDims2D` member of ::ze_device_image_properties_t for limits.
                                                                         ## ::ZE_IMAGE_TYPE_3D: height in pixels; see the `maxImageDims3D` member
                                                                         ## of ::ze_device_image_properties_t for limits.
                                                                         ## other: ignored.
-        ("depth", c_ulong),                                             ## [in] depth dimension.
+        ("depth", c_uint32),                                            ## [in] depth dimension.
                                                                         ## ::ZE_IMAGE_TYPE_3D: depth in pixels; see the `maxImageDims3D` member
                                                                         ## of ::ze_device_image_properties_t for limits.
                                                                         ## other: ignored.
-        ("arraylevels", c_ulong),                                       ## [in] array levels.
+        ("arraylevels", c_uint32),                                      ## [in] array levels.
                                                                         ## ::ZE_IMAGE_TYPE_1DARRAY, ::ZE_IMAGE_TYPE_2DARRAY: see the
                                                                         ## `maxImageArraySlices` member of ::ze_device_image_properties_t for limits.
                                                                         ## other: ignored.
-        ("miplevels", c_ulong)                                          ## [in] mipmap levels (must be 0)
+        ("miplevels", c_uint32)                                         ## [in] mipmap levels (must be 0)
     ]
 
 ###############################################################################
@@ -1451,7 +1148,7 @@ class ze_device_mem_alloc_desc_t(Structure):
         ("flags", ze_device_mem_alloc_flags_t),                         ## [in] flags specifying additional allocation controls.
                                                                         ## must be 0 (default) or a valid combination of ::ze_device_mem_alloc_flag_t;
                                                                         ## default behavior may use implicit driver-based heuristics.
-        ("ordinal", c_ulong)                                            ## [in] ordinal of the device's local memory to allocate from.
+        ("ordinal", c_uint32)                                           ## [in] ordinal of the device's local memory to allocate from.
                                                                         ## must be less than the count returned from ::zeDeviceGetMemoryProperties.
     ]
 
@@ -1501,8 +1198,8 @@ class ze_memory_allocation_properties_t(Structure):
         ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
         ("type", ze_memory_type_t),                                     ## [out] type of allocated memory
-        ("id", c_ulonglong),                                            ## [out] identifier for this allocation
-        ("pageSize", c_ulonglong)                                       ## [out] page size used for allocation
+        ("id", c_uint64),                                               ## [out] identifier for this allocation
+        ("pageSize", c_uint64)                                          ## [out] page size used for allocation
     ]
 
 ###############################################################################
@@ -1664,8 +1361,8 @@ class ze_module_format_t(c_int):
 ## @brief Specialization constants - User defined constants
 class ze_module_constants_t(Structure):
     _fields_ = [
-        ("numConstants", c_ulong),                                      ## [in] Number of specialization constants.
-        ("pConstantIds", POINTER(c_ulong)),                             ## [in][range(0, numConstants)] Array of IDs that is sized to
+        ("numConstants", c_uint32),                                     ## [in] Number of specialization constants.
+        ("pConstantIds", POINTER(c_uint32)),                            ## [in][range(0, numConstants)] Array of IDs that is sized to
                                                                         ## numConstants.
         ("pConstantValues", POINTER(c_void_p))                          ## [in][range(0, numConstants)] Array of pointers to values that is sized
                                                                         ## to numConstants.
@@ -1798,22 +1495,22 @@ class ze_kernel_properties_t(Structure):
         ("stype", ze_structure_type_t),                                 ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("numKernelArgs", c_ulong),                                     ## [out] number of kernel arguments.
-        ("requiredGroupSizeX", c_ulong),                                ## [out] required group size in the X dimension,
+        ("numKernelArgs", c_uint32),                                    ## [out] number of kernel arguments.
+        ("requiredGroupSizeX", c_uint32),                               ## [out] required group size in the X dimension,
                                                                         ## or zero if there is no required group size
-        ("requiredGroupSizeY", c_ulong),                                ## [out] required group size in the Y dimension,
+        ("requiredGroupSizeY", c_uint32),                               ## [out] required group size in the Y dimension,
                                                                         ## or zero if there is no required group size
-        ("requiredGroupSizeZ", c_ulong),                                ## [out] required group size in the Z dimension,
+        ("requiredGroupSizeZ", c_uint32),                               ## [out] required group size in the Z dimension,
                                                                         ## or zero if there is no required group size
-        ("requiredNumSubGroups", c_ulong),                              ## [out] required number of subgroups per thread group,
+        ("requiredNumSubGroups", c_uint32),                             ## [out] required number of subgroups per thread group,
                                                                         ## or zero if there is no required number of subgroups
-        ("requiredSubgroupSize", c_ulong),                              ## [out] required subgroup size,
+        ("requiredSubgroupSize", c_uint32),                             ## [out] required subgroup size,
                                                                         ## or zero if there is no required subgroup size
-        ("maxSubgroupSize", c_ulong),                                   ## [out] maximum subgroup size
-        ("maxNumSubgroups", c_ulong),                                   ## [out] maximum number of subgroups per thread group
-        ("localMemSize", c_ulong),                                      ## [out] local memory size used by each thread group
-        ("privateMemSize", c_ulong),                                    ## [out] private memory size allocated by compiler used by each thread
-        ("spillMemSize", c_ulong),                                      ## [out] spill memory size allocated by compiler
+        ("maxSubgroupSize", c_uint32),                                  ## [out] maximum subgroup size
+        ("maxNumSubgroups", c_uint32),                                  ## [out] maximum number of subgroups per thread group
+        ("localMemSize", c_uint32),                                     ## [out] local memory size used by each thread group
+        ("privateMemSize", c_uint32),                                   ## [out] private memory size allocated by compiler used by each thread
+        ("spillMemSize", c_uint32),                                     ## [out] spill memory size allocated by compiler
         ("uuid", ze_kernel_uuid_t)                                      ## [out] universal unique identifier.
     ]
 
@@ -1829,16 +1526,16 @@ class ze_kernel_preferred_group_size_properties_t(Structure):
         ("stype", ze_structure_type_t),                                 ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("preferredMultiple", c_ulong)                                  ## [out] preferred group size multiple
+        ("preferredMultiple", c_uint32)                                 ## [out] preferred group size multiple
     ]
 
 ###############################################################################
 ## @brief Kernel dispatch group count.
 class ze_group_count_t(Structure):
     _fields_ = [
-        ("groupCountX", c_ulong),                                       ## [in] number of thread groups in X dimension
-        ("groupCountY", c_ulong),                                       ## [in] number of thread groups in Y dimension
-        ("groupCountZ", c_ulong)                                        ## [in] number of thread groups in Z dimension
+        ("groupCountX", c_uint32),                                      ## [in] number of thread groups in X dimension
+        ("groupCountY", c_uint32),                                      ## [in] number of thread groups in Y dimension
+        ("groupCountZ", c_uint32)                                       ## [in] number of thread groups in Z dimension
     ]
 
 ###############################################################################
@@ -1856,35 +1553,6 @@ class ze_module_program_exp_version_t(c_int):
         return str(ze_module_program_exp_version_v(self.value))
 
 
-###############################################################################
-## @brief Module extended descriptor to support multiple input modules.
-## 
-## @details
-##     - Implementation must support ::ZE_experimental_module_program extension
-##     - Modules support import and export linkage for functions and global
-##       variables.
-##     - SPIR-V import and export linkage types are used. See SPIR-V
-##       specification for linkage details.
-##     - pInputModules, pBuildFlags, and pConstants from ::ze_module_desc_t is
-##       ignored.
-##     - Format in ::ze_module_desc_t needs to be set to
-##       ::ZE_MODULE_FORMAT_IL_SPIRV.
-class ze_module_program_exp_desc_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("count", c_ulong),                                             ## [in] Count of input modules
-        ("inputSizes", POINTER(c_size_t)),                              ## [in][range(0, count)] sizes of each input IL module in pInputModules.
-        ("pInputModules", POINTER(c_ubyte*)),                           ## [in][range(0, count)] pointer to an array of IL (e.g. SPIR-V modules).
-                                                                        ## Valid only for SPIR-V input.
-        ("pBuildFlags", POINTER(c_char_p)),                             ## [in][optional][range(0, count)] array of strings containing build
-                                                                        ## flags. See pBuildFlags in ::ze_module_desc_t.
-        ("pConstants", POINTER(ze_module_constants_t*))                 ## [in][optional][range(0, count)] pointer to array of specialization
-                                                                        ## constant strings. Valid only for SPIR-V input. This must be set to
-                                                                        ## nullptr if no specialization constants are provided.
-    ]
-
 ###############################################################################
 ## @brief Raytracing Extension Name
 ZE_RAYTRACING_EXT_NAME = "ZE_extension_raytracing"
@@ -1922,7 +1590,7 @@ class ze_device_raytracing_ext_properties_t(Structure):
         ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
         ("flags", ze_device_raytracing_ext_flags_t),                    ## [out] 0 or a valid combination of ::ze_device_raytracing_ext_flags_t
-        ("maxBVHLevels", c_ulong)                                       ## [out] Maximum number of BVH levels supported
+        ("maxBVHLevels", c_uint32)                                      ## [out] Maximum number of BVH levels supported
     ]
 
 ###############################################################################
@@ -2119,24 +1787,6 @@ class ze_relaxed_allocation_limits_exp_flags_t(c_int):
         return hex(self.value)
 
 
-###############################################################################
-## @brief Relaxed limits memory allocation descriptor
-## 
-## @details
-##     - This structure may be passed to ::zeMemAllocShared or
-##       ::zeMemAllocDevice, via the `pNext` member of
-##       ::ze_device_mem_alloc_desc_t.
-##     - This structure may also be passed to ::zeMemAllocHost, via the `pNext`
-##       member of ::ze_host_mem_alloc_desc_t.
-class ze_relaxed_allocation_limits_exp_desc_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("flags", ze_relaxed_allocation_limits_exp_flags_t)             ## [in] flags specifying allocation limits to relax.
-                                                                        ## must be 0 (default) or a valid combination of ::ze_relaxed_allocation_limits_exp_flag_t;
-    ]
-
 ###############################################################################
 ## @brief Get Kernel Binary Extension Name
 ZE_GET_KERNEL_BINARY_EXP_NAME = "ZE_extension_kernel_binary_exp"
@@ -2273,7 +1923,7 @@ class ze_external_semaphore_signal_params_ext_t(Structure):
         ("stype", ze_structure_type_t),                                 ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("value", c_ulonglong)                                          ## [in] [optional] Value to signal.
+        ("value", c_uint64)                                             ## [in] [optional] Value to signal.
                                                                         ## Specified by user as an expected value with some of semaphore types,
                                                                         ## such as ::ZE_EXTERNAL_SEMAPHORE_EXT_FLAG_D3D12_FENCE.
     ]
@@ -2285,7 +1935,7 @@ class ze_external_semaphore_wait_params_ext_t(Structure):
         ("stype", ze_structure_type_t),                                 ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("value", c_ulonglong)                                          ## [in] [optional] Value to wait for.
+        ("value", c_uint64)                                             ## [in] [optional] Value to wait for.
                                                                         ## Specified by user as an expected value with some of semaphore types,
                                                                         ## such as ::ZE_EXTERNAL_SEMAPHORE_EXT_FLAG_D3D12_FENCE.
     ]
@@ -2562,7 +2212,7 @@ class ze_rtas_parallel_operation_ext_properties_t(Structure):
                                                                         ## structure (i.e. contains stype and pNext).
         ("flags", ze_rtas_parallel_operation_ext_flags_t),              ## [out] ray tracing acceleration structure builder parallel operation
                                                                         ## flags
-        ("maxConcurrency", c_ulong)                                     ## [out] maximum number of threads that may join the parallel operation
+        ("maxConcurrency", c_uint32)                                    ## [out] maximum number of threads that may join the parallel operation
     ]
 
 ###############################################################################
@@ -2580,7 +2230,7 @@ class ze_rtas_device_ext_properties_t(Structure):
                                                                         ## structure (i.e. contains stype and pNext).
         ("flags", ze_rtas_device_ext_flags_t),                          ## [out] ray tracing acceleration structure device flags
         ("rtasFormat", ze_rtas_format_ext_t),                           ## [out] ray tracing acceleration structure format
-        ("rtasBufferAlignment", c_ulong)                                ## [out] required alignment of acceleration structure buffer
+        ("rtasBufferAlignment", c_uint32)                               ## [out] required alignment of acceleration structure buffer
     ]
 
 ###############################################################################
@@ -2685,8 +2335,8 @@ class ze_rtas_transform_float3x4_row_major_ext_t(Structure):
 ##        in each dimension
 class ze_rtas_aabb_ext_t(Structure):
     _fields_ = [
-        ("lower", ze_rtas_c_float3_ext_t),                              ## [in] lower bounds of AABB
-        ("upper", ze_rtas_c_float3_ext_t)                               ## [in] upper bounds of AABB
+        ("lower", ze_rtas_float3_ext_t),                              ## [in] lower bounds of AABB
+        ("upper", ze_rtas_float3_ext_t)                               ## [in] upper bounds of AABB
     ]
 
 ###############################################################################
@@ -2701,10 +2351,10 @@ class ze_rtas_aabb_ext_t(Structure):
 ##          - (u=0, v=1) at v2
 class ze_rtas_triangle_indices_uint32_ext_t(Structure):
     _fields_ = [
-        ("v0", c_ulong),                                                ## [in] first index pointing to the first triangle vertex in vertex array
-        ("v1", c_ulong),                                                ## [in] second index pointing to the second triangle vertex in vertex
+        ("v0", c_uint32),                                               ## [in] first index pointing to the first triangle vertex in vertex array
+        ("v1", c_uint32),                                               ## [in] second index pointing to the second triangle vertex in vertex
                                                                         ## array
-        ("v2", c_ulong)                                                 ## [in] third index pointing to the third triangle vertex in vertex array
+        ("v2", c_uint32)                                                ## [in] third index pointing to the third triangle vertex in vertex array
     ]
 
 ###############################################################################
@@ -2727,10 +2377,10 @@ class ze_rtas_triangle_indices_uint32_ext_t(Structure):
 ##       *u = 1-u'* and *v = 1-v'*, yielding a piecewise linear parametrization.
 class ze_rtas_quad_indices_uint32_ext_t(Structure):
     _fields_ = [
-        ("v0", c_ulong),                                                ## [in] first index pointing to the first quad vertex in vertex array
-        ("v1", c_ulong),                                                ## [in] second index pointing to the second quad vertex in vertex array
-        ("v2", c_ulong),                                                ## [in] third index pointing to the third quad vertex in vertex array
-        ("v3", c_ulong)                                                 ## [in] fourth index pointing to the fourth quad vertex in vertex array
+        ("v0", c_uint32),                                               ## [in] first index pointing to the first quad vertex in vertex array
+        ("v1", c_uint32),                                               ## [in] second index pointing to the second quad vertex in vertex array
+        ("v2", c_uint32),                                               ## [in] third index pointing to the third quad vertex in vertex array
+        ("v3", c_uint32)                                                ## [in] fourth index pointing to the fourth quad vertex in vertex array
     ]
 
 ###############################################################################
@@ -2760,10 +2410,10 @@ class ze_rtas_builder_triangles_geometry_info_ext_t(Structure):
                                                                         ## ::ZE_RTAS_BUILDER_INPUT_DATA_FORMAT_EXT_TRIANGLE_INDICES_UINT32
         ("vertexFormat", ze_rtas_builder_packed_input_data_format_ext_t),   ## [in] format of vertex buffer data, must be
                                                                         ## ::ZE_RTAS_BUILDER_INPUT_DATA_FORMAT_EXT_FLOAT3
-        ("triangleCount", c_ulong),                                     ## [in] number of triangles in triangle buffer
-        ("vertexCount", c_ulong),                                       ## [in] number of vertices in vertex buffer
-        ("triangleStride", c_ulong),                                    ## [in] stride (in bytes) of triangles in triangle buffer
-        ("vertexStride", c_ulong),                                      ## [in] stride (in bytes) of vertices in vertex buffer
+        ("triangleCount", c_uint32),                                    ## [in] number of triangles in triangle buffer
+        ("vertexCount", c_uint32),                                      ## [in] number of vertices in vertex buffer
+        ("triangleStride", c_uint32),                                   ## [in] stride (in bytes) of triangles in triangle buffer
+        ("vertexStride", c_uint32),                                     ## [in] stride (in bytes) of vertices in vertex buffer
         ("pTriangleBuffer", c_void_p),                                  ## [in] pointer to array of triangle indices in specified format
         ("pVertexBuffer", c_void_p)                                     ## [in] pointer to array of triangle vertices in specified format
     ]
@@ -2795,10 +2445,10 @@ class ze_rtas_builder_quads_geometry_info_ext_t(Structure):
                                                                         ## ::ZE_RTAS_BUILDER_INPUT_DATA_FORMAT_EXT_QUAD_INDICES_UINT32
         ("vertexFormat", ze_rtas_builder_packed_input_data_format_ext_t),   ## [in] format of vertex buffer data, must be
                                                                         ## ::ZE_RTAS_BUILDER_INPUT_DATA_FORMAT_EXT_FLOAT3
-        ("quadCount", c_ulong),                                         ## [in] number of quads in quad buffer
-        ("vertexCount", c_ulong),                                       ## [in] number of vertices in vertex buffer
-        ("quadStride", c_ulong),                                        ## [in] stride (in bytes) of quads in quad buffer
-        ("vertexStride", c_ulong),                                      ## [in] stride (in bytes) of vertices in vertex buffer
+        ("quadCount", c_uint32),                                        ## [in] number of quads in quad buffer
+        ("vertexCount", c_uint32),                                      ## [in] number of vertices in vertex buffer
+        ("quadStride", c_uint32),                                       ## [in] stride (in bytes) of quads in quad buffer
+        ("vertexStride", c_uint32),                                     ## [in] stride (in bytes) of vertices in vertex buffer
         ("pQuadBuffer", c_void_p),                                      ## [in] pointer to array of quad indices in specified format
         ("pVertexBuffer", c_void_p)                                     ## [in] pointer to array of quad vertices in specified format
     ]
@@ -2810,8 +2460,8 @@ class ze_rtas_geometry_aabbs_ext_cb_params_t(Structure):
         ("stype", ze_structure_type_t),                                 ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("primID", c_ulong),                                            ## [in] first primitive to return bounds for
-        ("primIDCount", c_ulong),                                       ## [in] number of primitives to return bounds for
+        ("primID", c_uint32),                                           ## [in] first primitive to return bounds for
+        ("primIDCount", c_uint32),                                      ## [in] number of primitives to return bounds for
         ("pGeomUserPtr", c_void_p),                                     ## [in] pointer provided through geometry descriptor
         ("pBuildUserPtr", c_void_p),                                    ## [in] pointer provided through ::zeRTASBuilderBuildExt function
         ("pBoundsOut", POINTER(ze_rtas_aabb_ext_t))                     ## [out] destination buffer to write AABB bounds to
@@ -2820,6 +2470,7 @@ class ze_rtas_geometry_aabbs_ext_cb_params_t(Structure):
 ###############################################################################
 ## @brief Callback function pointer type to return AABBs for a range of
 ##        procedural primitives
+ze_rtas_geometry_aabbs_cb_ext_t = CFUNCTYPE( None, POINTER(ze_rtas_geometry_aabbs_ext_cb_params_t) )
 
 ###############################################################################
 ## @brief Ray tracing acceleration structure builder procedural primitives
@@ -2844,7 +2495,7 @@ class ze_rtas_builder_procedural_geometry_info_ext_t(Structure):
                                                                         ## geometry
         ("geometryMask", c_ubyte),                                      ## [in] 8-bit geometry mask for ray masking
         ("reserved", c_ubyte),                                          ## [in] reserved for future use
-        ("primCount", c_ulong),                                         ## [in] number of primitives in geometry
+        ("primCount", c_uint32),                                        ## [in] number of primitives in geometry
         ("pfnGetBoundsCb", ze_rtas_geometry_aabbs_cb_ext_t),            ## [in] pointer to callback function to get the axis-aligned bounding-box
                                                                         ## for a range of primitives
         ("pGeomUserPtr", c_void_p)                                      ## [in] user data pointer passed to callback
@@ -2861,7 +2512,7 @@ class ze_rtas_builder_instance_geometry_info_ext_t(Structure):
                                                                         ## geometry
         ("geometryMask", c_ubyte),                                      ## [in] 8-bit geometry mask for ray masking
         ("transformFormat", ze_rtas_builder_packed_input_data_format_ext_t),## [in] format of the specified transformation
-        ("instanceUserID", c_ulong),                                    ## [in] user-specified identifier for the instance
+        ("instanceUserID", c_uint32),                                   ## [in] user-specified identifier for the instance
         ("pTransform", c_void_p),                                       ## [in] object-to-world instance transformation in specified format
         ("pBounds", POINTER(ze_rtas_aabb_ext_t)),                       ## [in] object-space axis-aligned bounding-box of the instanced
                                                                         ## acceleration structure
@@ -2879,9 +2530,9 @@ class ze_rtas_builder_build_op_ext_desc_t(Structure):
         ("buildQuality", ze_rtas_builder_build_quality_hint_ext_t),     ## [in] acceleration structure build quality hint
         ("buildFlags", ze_rtas_builder_build_op_ext_flags_t),           ## [in] 0 or some combination of ::ze_rtas_builder_build_op_ext_flag_t
                                                                         ## flags
-        ("ppGeometries", POINTER(ze_rtas_builder_geometry_info_ext_t*)),## [in][optional][range(0, `numGeometries`)] NULL or a valid array of
+        ("ppGeometries", POINTER(POINTER(ze_rtas_builder_geometry_info_ext_t))),## [in][optional][range(0, `numGeometries`)] NULL or a valid array of
                                                                         ## pointers to geometry infos
-        ("numGeometries", c_ulong)                                      ## [in] number of geometries in geometry infos array, can be zero when
+        ("numGeometries", c_uint32)                                     ## [in] number of geometries in geometry infos array, can be zero when
                                                                         ## `ppGeometries` is NULL
     ]
 
@@ -2908,21 +2559,21 @@ class ze_device_vector_width_properties_ext_t(Structure):
         ("stype", ze_structure_type_t),                                 ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("vector_width_size", c_ulong),                                 ## [out] The associated vector width size supported by the device.
-        ("preferred_vector_width_char", c_ulong),                       ## [out] The preferred vector width size for char type supported by the device.
-        ("preferred_vector_width_short", c_ulong),                      ## [out] The preferred vector width size for short type supported by the device.
-        ("preferred_vector_width_int", c_ulong),                        ## [out] The preferred vector width size for int type supported by the device.
-        ("preferred_vector_width_long", c_ulong),                       ## [out] The preferred vector width size for long type supported by the device.
-        ("preferred_vector_width_float", c_ulong),                      ## [out] The preferred vector width size for float type supported by the device.
-        ("preferred_vector_width_double", c_ulong),                     ## [out] The preferred vector width size for double type supported by the device.
-        ("preferred_vector_width_half", c_ulong),                       ## [out] The preferred vector width size for half type supported by the device.
-        ("native_vector_width_char", c_ulong),                          ## [out] The native vector width size for char type supported by the device.
-        ("native_vector_width_short", c_ulong),                         ## [out] The native vector width size for short type supported by the device.
-        ("native_vector_width_int", c_ulong),                           ## [out] The native vector width size for int type supported by the device.
-        ("native_vector_width_long", c_ulong),                          ## [out] The native vector width size for long type supported by the device.
-        ("native_vector_width_float", c_ulong),                         ## [out] The native vector width size for float type supported by the device.
-        ("native_vector_width_double", c_ulong),                        ## [out] The native vector width size for double type supported by the device.
-        ("native_vector_width_half", c_ulong)                           ## [out] The native vector width size for half type supported by the device.
+        ("vector_width_size", c_uint32),                                ## [out] The associated vector width size supported by the device.
+        ("preferred_vector_width_char", c_uint32),                      ## [out] The preferred vector width size for char type supported by the device.
+        ("preferred_vector_width_short", c_uint32),                     ## [out] The preferred vector width size for short type supported by the device.
+        ("preferred_vector_width_int", c_uint32),                       ## [out] The preferred vector width size for int type supported by the device.
+        ("preferred_vector_width_long", c_uint32),                      ## [out] The preferred vector width size for long type supported by the device.
+        ("preferred_vector_width_float", c_uint32),                     ## [out] The preferred vector width size for float type supported by the device.
+        ("preferred_vector_width_double", c_uint32),                    ## [out] The preferred vector width size for double type supported by the device.
+        ("preferred_vector_width_half", c_uint32),                      ## [out] The preferred vector width size for half type supported by the device.
+        ("native_vector_width_char", c_uint32),                         ## [out] The native vector width size for char type supported by the device.
+        ("native_vector_width_short", c_uint32),                        ## [out] The native vector width size for short type supported by the device.
+        ("native_vector_width_int", c_uint32),                          ## [out] The native vector width size for int type supported by the device.
+        ("native_vector_width_long", c_uint32),                         ## [out] The native vector width size for long type supported by the device.
+        ("native_vector_width_float", c_uint32),                        ## [out] The native vector width size for float type supported by the device.
+        ("native_vector_width_double", c_uint32),                       ## [out] The native vector width size for double type supported by the device.
+        ("native_vector_width_half", c_uint32)                          ## [out] The native vector width size for half type supported by the device.
     ]
 
 ###############################################################################
@@ -3004,18 +2655,6 @@ class ze_image_memory_properties_exp_version_t(c_int):
         return str(ze_image_memory_properties_exp_version_v(self.value))
 
 
-###############################################################################
-## @brief Image memory properties
-class ze_image_memory_properties_exp_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("size", c_ulonglong),                                          ## [out] size of image allocation in bytes.
-        ("rowPitch", c_ulonglong),                                      ## [out] size of image row in bytes.
-        ("slicePitch", c_ulonglong)                                     ## [out] size of image slice in bytes.
-    ]
-
 ###############################################################################
 ## @brief Image View Extension Name
 ZE_IMAGE_VIEW_EXT_NAME = "ZE_extension_image_view"
@@ -3068,7 +2707,7 @@ class ze_image_view_planar_ext_desc_t(Structure):
         ("stype", ze_structure_type_t),                                 ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("planeIndex", c_ulong)                                         ## [in] the 0-based plane index (e.g. NV12 is 0 = Y plane, 1 UV plane)
+        ("planeIndex", c_uint32)                                        ## [in] the 0-based plane index (e.g. NV12 is 0 = Y plane, 1 UV plane)
     ]
 
 ###############################################################################
@@ -3086,17 +2725,6 @@ class ze_image_view_planar_exp_version_t(c_int):
         return str(ze_image_view_planar_exp_version_v(self.value))
 
 
-###############################################################################
-## @brief Image view planar descriptor
-class ze_image_view_planar_exp_desc_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("planeIndex", c_ulong)                                         ## [DEPRECATED] no longer supported, use
-                                                                        ## ::ze_image_view_planar_ext_desc_t instead
-    ]
-
 ###############################################################################
 ## @brief Kernel Scheduling Hints Extension Name
 ZE_KERNEL_SCHEDULING_HINTS_EXP_NAME = "ZE_experimental_scheduling_hints"
@@ -3124,36 +2752,6 @@ class ze_scheduling_hint_exp_flags_t(c_int):
         return hex(self.value)
 
 
-###############################################################################
-## @brief Device kernel scheduling hint properties queried using
-##        ::zeDeviceGetModuleProperties
-## 
-## @details
-##     - This structure may be returned from ::zeDeviceGetModuleProperties, via
-##       the `pNext` member of ::ze_device_module_properties_t.
-class ze_scheduling_hint_exp_properties_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("schedulingHintFlags", ze_scheduling_hint_exp_flags_t)         ## [out] Supported kernel scheduling hints.
-                                                                        ## May be 0 (none) or a valid combination of ::ze_scheduling_hint_exp_flag_t.
-    ]
-
-###############################################################################
-## @brief Kernel scheduling hint descriptor
-## 
-## @details
-##     - This structure may be passed to ::zeKernelSchedulingHintExp.
-class ze_scheduling_hint_exp_desc_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("flags", ze_scheduling_hint_exp_flags_t)                       ## [in] flags specifying kernel scheduling hints.
-                                                                        ## must be 0 (default) or a valid combination of ::ze_scheduling_hint_exp_flag_t.
-    ]
-
 ###############################################################################
 ## @brief Linkonce ODR Extension Name
 ZE_LINKONCE_ODR_EXT_NAME = "ZE_extension_linkonce_odr"
@@ -3197,17 +2795,6 @@ class ze_power_saving_hint_type_t(c_int):
         return str(ze_power_saving_hint_type_v(self.value))
 
 
-###############################################################################
-## @brief Extended context descriptor containing power saving hint.
-class ze_context_power_saving_hint_exp_desc_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("hint", c_ulong)                                               ## [in] power saving hint (default value = 0). This is value from [0,100]
-                                                                        ## and can use pre-defined settings from ::ze_power_saving_hint_type_t.
-    ]
-
 ###############################################################################
 ## @brief Subgroups Extension Name
 ZE_SUBGROUPS_EXT_NAME = "ZE_extension_subgroups"
@@ -3250,7 +2837,7 @@ class ze_eu_count_ext_t(Structure):
         ("stype", ze_structure_type_t),                                 ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("numTotalEUs", c_ulong)                                        ## [out] Total number of EUs available
+        ("numTotalEUs", c_uint32)                                       ## [out] Total number of EUs available
     ]
 
 ###############################################################################
@@ -3278,21 +2865,21 @@ class ze_pci_properties_ext_version_t(c_int):
 ##       is useful for locating the device in the PCI switch fabric.
 class ze_pci_address_ext_t(Structure):
     _fields_ = [
-        ("domain", c_ulong),                                            ## [out] PCI domain number
-        ("bus", c_ulong),                                               ## [out] PCI BDF bus number
-        ("device", c_ulong),                                            ## [out] PCI BDF device number
-        ("function", c_ulong)                                           ## [out] PCI BDF function number
+        ("domain", c_uint32),                                           ## [out] PCI domain number
+        ("bus", c_uint32),                                              ## [out] PCI BDF bus number
+        ("device", c_uint32),                                           ## [out] PCI BDF device number
+        ("function", c_uint32)                                          ## [out] PCI BDF function number
     ]
 
 ###############################################################################
 ## @brief Device PCI speed
 class ze_pci_speed_ext_t(Structure):
     _fields_ = [
-        ("genVersion", c_int32_t),                                      ## [out] The link generation. A value of -1 means that this property is
+        ("genVersion", c_int32),                                      ## [out] The link generation. A value of -1 means that this property is
                                                                         ## unknown.
-        ("width", c_int32_t),                                           ## [out] The number of lanes. A value of -1 means that this property is
+        ("width", c_int32),                                           ## [out] The number of lanes. A value of -1 means that this property is
                                                                         ## unknown.
-        ("maxBandwidth", c_int64_t)                                     ## [out] The theoretical maximum bandwidth in bytes/sec (sum of all
+        ("maxBandwidth", c_int64)                                     ## [out] The theoretical maximum bandwidth in bytes/sec (sum of all
                                                                         ## lanes). A value of -1 means that this property is unknown.
     ]
 
@@ -3376,7 +2963,7 @@ class ze_image_allocation_ext_properties_t(Structure):
         ("stype", ze_structure_type_t),                                 ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("id", c_ulonglong)                                             ## [out] identifier for this allocation
+        ("id", c_uint64)                                                ## [out] identifier for this allocation
     ]
 
 ###############################################################################
@@ -3532,46 +3119,6 @@ class ze_memory_free_ext_desc_t(Structure):
 ## @brief Bandwidth Extension Name
 ZE_BANDWIDTH_PROPERTIES_EXP_NAME = "ZE_experimental_bandwidth_properties"
 
-###############################################################################
-## @brief P2P Bandwidth Properties
-## 
-## @details
-##     - This structure may be passed to ::zeDeviceGetP2PProperties by having
-##       the pNext member of ::ze_device_p2p_properties_t point at this struct.
-class ze_device_p2p_bandwidth_exp_properties_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("logicalBandwidth", c_ulong),                                  ## [out] total logical design bandwidth for all links connecting the two
-                                                                        ## devices
-        ("physicalBandwidth", c_ulong),                                 ## [out] total physical design bandwidth for all links connecting the two
-                                                                        ## devices
-        ("bandwidthUnit", ze_bandwidth_unit_t),                         ## [out] bandwidth unit
-        ("logicalLatency", c_ulong),                                    ## [out] average logical design latency for all links connecting the two
-                                                                        ## devices
-        ("physicalLatency", c_ulong),                                   ## [out] average physical design latency for all links connecting the two
-                                                                        ## devices
-        ("latencyUnit", ze_latency_unit_t)                              ## [out] latency unit
-    ]
-
-###############################################################################
-## @brief Copy Bandwidth Properties
-## 
-## @details
-##     - This structure may be passed to
-##       ::zeDeviceGetCommandQueueGroupProperties by having the pNext member of
-##       ::ze_command_queue_group_properties_t point at this struct.
-class ze_copy_bandwidth_exp_properties_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("copyBandwidth", c_ulong),                                     ## [out] design bandwidth supported by this engine type for copy
-                                                                        ## operations
-        ("copyBandwidthUnit", ze_bandwidth_unit_t)                      ## [out] copy bandwidth unit
-    ]
-
 ###############################################################################
 ## @brief Device Local Identifier (LUID) Extension Name
 ZE_DEVICE_LUID_EXT_NAME = "ZE_extension_device_luid"
@@ -3613,7 +3160,7 @@ class ze_device_luid_ext_properties_t(Structure):
                                                                         ## The returned LUID can be cast to a LUID object and must be equal to
                                                                         ## the locally
                                                                         ## unique identifier of an IDXGIAdapter1 object that corresponds to the device.
-        ("nodeMask", c_ulong)                                           ## [out] node mask.
+        ("nodeMask", c_uint32)                                          ## [out] node mask.
                                                                         ## The returned node mask must contain exactly one bit.
                                                                         ## If the device is running on an operating system that supports the
                                                                         ## Direct3D 12 API
@@ -3659,54 +3206,6 @@ class ze_fabric_edge_exp_duplexity_t(c_int):
         return str(ze_fabric_edge_exp_duplexity_v(self.value))
 
 
-###############################################################################
-## @brief PCI address
-## 
-## @details
-##     - A PCI BDF address is the bus:device:function address of the device and
-##       is useful for locating the device in the PCI switch fabric.
-class ze_fabric_vertex_pci_exp_address_t(Structure):
-    _fields_ = [
-        ("domain", c_ulong),                                            ## [out] PCI domain number
-        ("bus", c_ulong),                                               ## [out] PCI BDF bus number
-        ("device", c_ulong),                                            ## [out] PCI BDF device number
-        ("function", c_ulong)                                           ## [out] PCI BDF function number
-    ]
-
-###############################################################################
-## @brief Fabric Vertex properties
-class ze_fabric_vertex_exp_properties_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("uuid", ze_uuid_t),                                            ## [out] universal unique identifier. If the vertex is co-located with a
-                                                                        ## device/subdevice, then this uuid will match that of the corresponding
-                                                                        ## device/subdevice
-        ("type", ze_fabric_vertex_exp_type_t),                          ## [out] does the fabric vertex represent a device, subdevice, or switch?
-        ("remote", ze_bool_t),                                          ## [out] does the fabric vertex live on the local node or on a remote
-                                                                        ## node?
-        ("address", ze_fabric_vertex_pci_exp_address_t)                 ## [out] B/D/F address of fabric vertex & associated device/subdevice if
-                                                                        ## available
-    ]
-
-###############################################################################
-## @brief Fabric Edge properties
-class ze_fabric_edge_exp_properties_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("uuid", ze_uuid_t),                                            ## [out] universal unique identifier.
-        ("model", c_char * ZE_MAX_FABRIC_EDGE_MODEL_EXP_SIZE),          ## [out] Description of fabric edge technology. Will be set to the string
-                                                                        ## "unkown" if this cannot be determined for this edge
-        ("bandwidth", c_ulong),                                         ## [out] design bandwidth
-        ("bandwidthUnit", ze_bandwidth_unit_t),                         ## [out] bandwidth unit
-        ("latency", c_ulong),                                           ## [out] design latency
-        ("latencyUnit", ze_latency_unit_t),                             ## [out] latency unit
-        ("duplexity", ze_fabric_edge_exp_duplexity_t)                   ## [out] Duplexity of the fabric edge
-    ]
-
 ###############################################################################
 ## @brief Device Memory Properties Extension Name
 ZE_DEVICE_MEMORY_PROPERTIES_EXT_NAME = "ZE_extension_device_memory_properties"
@@ -3765,11 +3264,11 @@ class ze_device_memory_ext_properties_t(Structure):
         ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
         ("type", ze_device_memory_ext_type_t),                          ## [out] The memory type
-        ("physicalSize", c_ulonglong),                                  ## [out] Physical memory size in bytes. A value of 0 indicates that this
+        ("physicalSize", c_uint64),                                     ## [out] Physical memory size in bytes. A value of 0 indicates that this
                                                                         ## property is not known. However, a call to ::zesMemoryGetState() will
                                                                         ## correctly return the total size of usable memory.
-        ("readBandwidth", c_ulong),                                     ## [out] Design bandwidth for reads
-        ("writeBandwidth", c_ulong),                                    ## [out] Design bandwidth for writes
+        ("readBandwidth", c_uint32),                                    ## [out] Design bandwidth for reads
+        ("writeBandwidth", c_uint32),                                   ## [out] Design bandwidth for writes
         ("bandwidthUnit", ze_bandwidth_unit_t)                          ## [out] bandwidth unit
     ]
 
@@ -3814,7 +3313,7 @@ class ze_device_ip_version_ext_t(Structure):
         ("stype", ze_structure_type_t),                                 ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("ipVersion", c_ulong)                                          ## [out] Device IP version. The meaning of the device IP version is
+        ("ipVersion", c_uint32)                                         ## [out] Device IP version. The meaning of the device IP version is
                                                                         ## implementation-defined, but newer devices should have a higher
                                                                         ## version than older devices.
     ]
@@ -3846,7 +3345,7 @@ class ze_kernel_max_group_size_properties_ext_t(Structure):
         ("stype", ze_structure_type_t),                                 ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("maxGroupSize", c_ulong)                                       ## [out] maximum group size that can be used to execute the kernel. This
+        ("maxGroupSize", c_uint32)                                      ## [out] maximum group size that can be used to execute the kernel. This
                                                                         ## value may be less than or equal to the `maxTotalGroupSize` member of
                                                                         ## ::ze_device_compute_properties_t.
     ]
@@ -3879,27 +3378,6 @@ class ze_sub_allocation_t(Structure):
         ("size", c_size_t)                                              ## [in,out][optional] size of the allocation
     ]
 
-###############################################################################
-## @brief Sub-Allocations Properties
-## 
-## @details
-##     - This structure may be passed to ::zeMemGetAllocProperties, via the
-##       `pNext` member of ::ze_memory_allocation_properties_t.
-class ze_memory_sub_allocations_exp_properties_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("pCount", POINTER(c_ulong)),                                   ## [in,out] pointer to the number of sub-allocations.
-                                                                        ## if count is zero, then the driver shall update the value with the
-                                                                        ## total number of sub-allocations on which the allocation has been divided.
-                                                                        ## if count is greater than the number of sub-allocations, then the
-                                                                        ## driver shall update the value with the correct number of sub-allocations.
-        ("pSubAllocations", POINTER(ze_sub_allocation_t))               ## [in,out][optional][range(0, *pCount)] array of properties for sub-allocations.
-                                                                        ## if count is less than the number of sub-allocations available, then
-                                                                        ## driver shall only retrieve properties for that number of sub-allocations.
-    ]
-
 ###############################################################################
 ## @brief Event Query Kernel Timestamps Extension Name
 ZE_EVENT_QUERY_KERNEL_TIMESTAMPS_EXT_NAME = "ZE_extension_event_query_kernel_timestamps"
@@ -3945,8 +3423,8 @@ class ze_event_query_kernel_timestamps_ext_properties_t(Structure):
 ## @brief Kernel timestamp clock data synchronized to the host time domain
 class ze_synchronized_timestamp_data_ext_t(Structure):
     _fields_ = [
-        ("kernelStart", c_ulonglong),                                   ## [out] synchronized clock at start of kernel execution
-        ("kernelEnd", c_ulonglong)                                      ## [out] synchronized clock at end of kernel execution
+        ("kernelStart", c_uint64),                                      ## [out] synchronized clock at start of kernel execution
+        ("kernelEnd", c_uint64)                                         ## [out] synchronized clock at end of kernel execution
     ]
 
 ###############################################################################
@@ -3996,21 +3474,6 @@ class ze_rtas_device_exp_flags_t(c_int):
         return hex(self.value)
 
 
-###############################################################################
-## @brief Ray tracing acceleration structure format
-## 
-## @details
-##     - This is an opaque ray tracing acceleration structure format
-##       identifier.
-class ze_rtas_format_exp_v(IntEnum):
-    INVALID = 0                                                             ## Invalid acceleration structure format
-    MAX = 0x7ffffffe                                                        ## Maximum acceleration structure format code
-
-class ze_rtas_format_exp_t(c_int):
-    def __str__(self):
-        return str(ze_rtas_format_exp_v(self.value))
-
-
 ###############################################################################
 ## @brief Ray tracing acceleration structure builder flags
 class ze_rtas_builder_exp_flags_v(IntEnum):
@@ -4041,12 +3504,6 @@ class ze_rtas_builder_geometry_exp_flags_t(c_int):
         return hex(self.value)
 
 
-###############################################################################
-## @brief Packed ray tracing acceleration structure builder geometry flags (see
-##        ::ze_rtas_builder_geometry_exp_flags_t)
-class ze_rtas_builder_packed_geometry_exp_flags_t(c_ubyte):
-    pass
-
 ###############################################################################
 ## @brief Ray tracing acceleration structure builder instance flags
 class ze_rtas_builder_instance_exp_flags_v(IntEnum):
@@ -4062,12 +3519,6 @@ class ze_rtas_builder_instance_exp_flags_t(c_int):
         return hex(self.value)
 
 
-###############################################################################
-## @brief Packed ray tracing acceleration structure builder instance flags (see
-##        ::ze_rtas_builder_instance_exp_flags_t)
-class ze_rtas_builder_packed_instance_exp_flags_t(c_ubyte):
-    pass
-
 ###############################################################################
 ## @brief Ray tracing acceleration structure builder build operation flags
 ## 
@@ -4090,567 +3541,59 @@ class ze_rtas_builder_build_op_exp_flags_t(c_int):
 
 
 ###############################################################################
-## @brief Ray tracing acceleration structure builder build quality hint
-## 
-## @details
-##     - Depending on use case different quality modes for acceleration
-##       structure build are supported.
-##     - A low-quality build builds an acceleration structure fast, but at the
-##       cost of some reduction in ray tracing performance. This mode is
-##       recommended for dynamic content, such as animated characters.
-##     - A medium-quality build uses a compromise between build quality and ray
-##       tracing performance. This mode should be used by default.
-##     - Higher ray tracing performance can be achieved by using a high-quality
-##       build, but acceleration structure build performance might be
-##       significantly reduced.
-class ze_rtas_builder_build_quality_hint_exp_v(IntEnum):
-    LOW = 0                                                                 ## build low-quality acceleration structure (fast)
-    MEDIUM = 1                                                              ## build medium-quality acceleration structure (slower)
-    HIGH = 2                                                                ## build high-quality acceleration structure (slow)
+## @brief Counter-based Event Pools Extension Name
+ZE_EVENT_POOL_COUNTER_BASED_EXP_NAME = "ZE_experimental_event_pool_counter_based"
+
+###############################################################################
+## @brief Counter-based Event Pools Extension Version(s)
+class ze_event_pool_counter_based_exp_version_v(IntEnum):
+    _1_0 = ZE_MAKE_VERSION( 1, 0 )                                          ## version 1.0
+    CURRENT = ZE_MAKE_VERSION( 1, 0 )                                       ## latest known version
 
-class ze_rtas_builder_build_quality_hint_exp_t(c_int):
+class ze_event_pool_counter_based_exp_version_t(c_int):
     def __str__(self):
-        return str(ze_rtas_builder_build_quality_hint_exp_v(self.value))
+        return str(ze_event_pool_counter_based_exp_version_v(self.value))
 
 
 ###############################################################################
-## @brief Ray tracing acceleration structure builder geometry type
-class ze_rtas_builder_geometry_type_exp_v(IntEnum):
-    TRIANGLES = 0                                                           ## triangle mesh geometry type
-    QUADS = 1                                                               ## quad mesh geometry type
-    PROCEDURAL = 2                                                          ## procedural geometry type
-    INSTANCE = 3                                                            ## instance geometry type
+## @brief Supported event flags for defining counter-based event pools.
+class ze_event_pool_counter_based_exp_flags_v(IntEnum):
+    IMMEDIATE = ZE_BIT(0)                                                   ## Counter-based event pool is used for immediate command lists (default)
+    NON_IMMEDIATE = ZE_BIT(1)                                               ## Counter-based event pool is for non-immediate command lists
 
-class ze_rtas_builder_geometry_type_exp_t(c_int):
+class ze_event_pool_counter_based_exp_flags_t(c_int):
     def __str__(self):
-        return str(ze_rtas_builder_geometry_type_exp_v(self.value))
+        return hex(self.value)
 
 
 ###############################################################################
-## @brief Packed ray tracing acceleration structure builder geometry type (see
-##        ::ze_rtas_builder_geometry_type_exp_t)
-class ze_rtas_builder_packed_geometry_type_exp_t(c_ubyte):
-    pass
+## @brief Image Memory Properties Extension Name
+ZE_BINDLESS_IMAGE_EXP_NAME = "ZE_experimental_bindless_image"
 
 ###############################################################################
-## @brief Ray tracing acceleration structure data buffer element format
-## 
-## @details
-##     - Specifies the format of data buffer elements.
-##     - Data buffers may contain instancing transform matrices, triangle/quad
-##       vertex indices, etc...
-class ze_rtas_builder_input_data_format_exp_v(IntEnum):
-    FLOAT3 = 0                                                              ## 3-component float vector (see ::ze_rtas_float3_exp_t)
-    FLOAT3X4_COLUMN_MAJOR = 1                                               ## 3x4 affine transformation in column-major format (see
-                                                                            ## ::ze_rtas_transform_float3x4_column_major_exp_t)
-    FLOAT3X4_ALIGNED_COLUMN_MAJOR = 2                                       ## 3x4 affine transformation in column-major format (see
-                                                                            ## ::ze_rtas_transform_float3x4_aligned_column_major_exp_t)
-    FLOAT3X4_ROW_MAJOR = 3                                                  ## 3x4 affine transformation in row-major format (see
-                                                                            ## ::ze_rtas_transform_float3x4_row_major_exp_t)
-    AABB = 4                                                                ## 3-dimensional axis-aligned bounding-box (see ::ze_rtas_aabb_exp_t)
-    TRIANGLE_INDICES_UINT32 = 5                                             ## Unsigned 32-bit triangle indices (see
-                                                                            ## ::ze_rtas_triangle_indices_uint32_exp_t)
-    QUAD_INDICES_UINT32 = 6                                                 ## Unsigned 32-bit quad indices (see ::ze_rtas_quad_indices_uint32_exp_t)
+## @brief Bindless Image Extension Version(s)
+class ze_bindless_image_exp_version_v(IntEnum):
+    _1_0 = ZE_MAKE_VERSION( 1, 0 )                                          ## version 1.0
+    CURRENT = ZE_MAKE_VERSION( 1, 0 )                                       ## latest known version
 
-class ze_rtas_builder_input_data_format_exp_t(c_int):
+class ze_bindless_image_exp_version_t(c_int):
     def __str__(self):
-        return str(ze_rtas_builder_input_data_format_exp_v(self.value))
+        return str(ze_bindless_image_exp_version_v(self.value))
 
 
 ###############################################################################
-## @brief Packed ray tracing acceleration structure data buffer element format
-##        (see ::ze_rtas_builder_input_data_format_exp_t)
-class ze_rtas_builder_packed_input_data_format_exp_t(c_ubyte):
-    pass
-
-###############################################################################
-## @brief Handle of ray tracing acceleration structure builder object
-class ze_rtas_builder_exp_handle_t(c_void_p):
-    pass
-
-###############################################################################
-## @brief Handle of ray tracing acceleration structure builder parallel
-##        operation object
-class ze_rtas_parallel_operation_exp_handle_t(c_void_p):
-    pass
-
-###############################################################################
-## @brief Ray tracing acceleration structure builder descriptor
-class ze_rtas_builder_exp_desc_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("builderVersion", ze_rtas_builder_exp_version_t)               ## [in] ray tracing acceleration structure builder version
-    ]
-
-###############################################################################
-## @brief Ray tracing acceleration structure builder properties
-class ze_rtas_builder_exp_properties_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("flags", ze_rtas_builder_exp_flags_t),                         ## [out] ray tracing acceleration structure builder flags
-        ("rtasBufferSizeBytesExpected", c_size_t),                      ## [out] expected size (in bytes) required for acceleration structure buffer
-                                                                        ##    - When using an acceleration structure buffer of this size, the
-                                                                        ## build is expected to succeed; however, it is possible that the build
-                                                                        ## may fail with ::ZE_RESULT_EXP_RTAS_BUILD_RETRY
-        ("rtasBufferSizeBytesMaxRequired", c_size_t),                   ## [out] worst-case size (in bytes) required for acceleration structure buffer
-                                                                        ##    - When using an acceleration structure buffer of this size, the
-                                                                        ## build is guaranteed to not run out of memory.
-        ("scratchBufferSizeBytes", c_size_t)                            ## [out] scratch buffer size (in bytes) required for acceleration
-                                                                        ## structure build.
-    ]
-
-###############################################################################
-## @brief Ray tracing acceleration structure builder parallel operation
-##        properties
-class ze_rtas_parallel_operation_exp_properties_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("flags", ze_rtas_parallel_operation_exp_flags_t),              ## [out] ray tracing acceleration structure builder parallel operation
-                                                                        ## flags
-        ("maxConcurrency", c_ulong)                                     ## [out] maximum number of threads that may join the parallel operation
-    ]
-
-###############################################################################
-## @brief Ray tracing acceleration structure device properties
-## 
-## @details
-##     - This structure may be passed to ::zeDeviceGetProperties, via `pNext`
-##       member of ::ze_device_properties_t.
-##     - The implementation shall populate `format` with a value other than
-##       ::ZE_RTAS_FORMAT_EXP_INVALID when the device supports ray tracing.
-class ze_rtas_device_exp_properties_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("flags", ze_rtas_device_exp_flags_t),                          ## [out] ray tracing acceleration structure device flags
-        ("rtasFormat", ze_rtas_format_exp_t),                           ## [out] ray tracing acceleration structure format
-        ("rtasBufferAlignment", c_ulong)                                ## [out] required alignment of acceleration structure buffer
-    ]
-
-###############################################################################
-## @brief A 3-component vector type
-class ze_rtas_float3_exp_t(Structure):
-    _fields_ = [
-        ("x", c_float),                                                 ## [in] x-coordinate of float3 vector
-        ("y", c_float),                                                 ## [in] y-coordinate of float3 vector
-        ("z", c_float)                                                  ## [in] z-coordinate of float3 vector
-    ]
-
-###############################################################################
-## @brief 3x4 affine transformation in column-major layout
-## 
-## @details
-##     - A 3x4 affine transformation in column major layout, consisting of vectors
-##          - vx=(vx_x, vx_y, vx_z),
-##          - vy=(vy_x, vy_y, vy_z),
-##          - vz=(vz_x, vz_y, vz_z), and
-##          - p=(p_x, p_y, p_z)
-##     - The transformation transforms a point (x, y, z) to: `x*vx + y*vy +
-##       z*vz + p`.
-class ze_rtas_transform_float3x4_column_major_exp_t(Structure):
-    _fields_ = [
-        ("vx_x", c_float),                                              ## [in] element 0 of column 0 of 3x4 matrix
-        ("vx_y", c_float),                                              ## [in] element 1 of column 0 of 3x4 matrix
-        ("vx_z", c_float),                                              ## [in] element 2 of column 0 of 3x4 matrix
-        ("vy_x", c_float),                                              ## [in] element 0 of column 1 of 3x4 matrix
-        ("vy_y", c_float),                                              ## [in] element 1 of column 1 of 3x4 matrix
-        ("vy_z", c_float),                                              ## [in] element 2 of column 1 of 3x4 matrix
-        ("vz_x", c_float),                                              ## [in] element 0 of column 2 of 3x4 matrix
-        ("vz_y", c_float),                                              ## [in] element 1 of column 2 of 3x4 matrix
-        ("vz_z", c_float),                                              ## [in] element 2 of column 2 of 3x4 matrix
-        ("p_x", c_float),                                               ## [in] element 0 of column 3 of 3x4 matrix
-        ("p_y", c_float),                                               ## [in] element 1 of column 3 of 3x4 matrix
-        ("p_z", c_float)                                                ## [in] element 2 of column 3 of 3x4 matrix
-    ]
-
-###############################################################################
-## @brief 3x4 affine transformation in column-major layout with aligned column
-##        vectors
-## 
-## @details
-##     - A 3x4 affine transformation in column major layout, consisting of vectors
-##        - vx=(vx_x, vx_y, vx_z),
-##        - vy=(vy_x, vy_y, vy_z),
-##        - vz=(vz_x, vz_y, vz_z), and
-##        - p=(p_x, p_y, p_z)
-##     - The transformation transforms a point (x, y, z) to: `x*vx + y*vy +
-##       z*vz + p`.
-##     - The column vectors are aligned to 16-bytes and pad members are
-##       ignored.
-class ze_rtas_transform_float3x4_aligned_column_major_exp_t(Structure):
-    _fields_ = [
-        ("vx_x", c_float),                                              ## [in] element 0 of column 0 of 3x4 matrix
-        ("vx_y", c_float),                                              ## [in] element 1 of column 0 of 3x4 matrix
-        ("vx_z", c_float),                                              ## [in] element 2 of column 0 of 3x4 matrix
-        ("pad0", c_float),                                              ## [in] ignored padding
-        ("vy_x", c_float),                                              ## [in] element 0 of column 1 of 3x4 matrix
-        ("vy_y", c_float),                                              ## [in] element 1 of column 1 of 3x4 matrix
-        ("vy_z", c_float),                                              ## [in] element 2 of column 1 of 3x4 matrix
-        ("pad1", c_float),                                              ## [in] ignored padding
-        ("vz_x", c_float),                                              ## [in] element 0 of column 2 of 3x4 matrix
-        ("vz_y", c_float),                                              ## [in] element 1 of column 2 of 3x4 matrix
-        ("vz_z", c_float),                                              ## [in] element 2 of column 2 of 3x4 matrix
-        ("pad2", c_float),                                              ## [in] ignored padding
-        ("p_x", c_float),                                               ## [in] element 0 of column 3 of 3x4 matrix
-        ("p_y", c_float),                                               ## [in] element 1 of column 3 of 3x4 matrix
-        ("p_z", c_float),                                               ## [in] element 2 of column 3 of 3x4 matrix
-        ("pad3", c_float)                                               ## [in] ignored padding
-    ]
-
-###############################################################################
-## @brief 3x4 affine transformation in row-major layout
-## 
-## @details
-##     - A 3x4 affine transformation in row-major layout, consisting of vectors
-##          - vx=(vx_x, vx_y, vx_z),
-##          - vy=(vy_x, vy_y, vy_z),
-##          - vz=(vz_x, vz_y, vz_z), and
-##          - p=(p_x, p_y, p_z)
-##     - The transformation transforms a point (x, y, z) to: `x*vx + y*vy +
-##       z*vz + p`.
-class ze_rtas_transform_float3x4_row_major_exp_t(Structure):
-    _fields_ = [
-        ("vx_x", c_float),                                              ## [in] element 0 of row 0 of 3x4 matrix
-        ("vy_x", c_float),                                              ## [in] element 1 of row 0 of 3x4 matrix
-        ("vz_x", c_float),                                              ## [in] element 2 of row 0 of 3x4 matrix
-        ("p_x", c_float),                                               ## [in] element 3 of row 0 of 3x4 matrix
-        ("vx_y", c_float),                                              ## [in] element 0 of row 1 of 3x4 matrix
-        ("vy_y", c_float),                                              ## [in] element 1 of row 1 of 3x4 matrix
-        ("vz_y", c_float),                                              ## [in] element 2 of row 1 of 3x4 matrix
-        ("p_y", c_float),                                               ## [in] element 3 of row 1 of 3x4 matrix
-        ("vx_z", c_float),                                              ## [in] element 0 of row 2 of 3x4 matrix
-        ("vy_z", c_float),                                              ## [in] element 1 of row 2 of 3x4 matrix
-        ("vz_z", c_float),                                              ## [in] element 2 of row 2 of 3x4 matrix
-        ("p_z", c_float)                                                ## [in] element 3 of row 2 of 3x4 matrix
-    ]
-
-###############################################################################
-## @brief A 3-dimensional axis-aligned bounding-box with lower and upper bounds
-##        in each dimension
-class ze_rtas_aabb_exp_t(Structure):
-    _fields_ = [
-        ("lower", ze_rtas_c_float3_exp_t),                              ## [in] lower bounds of AABB
-        ("upper", ze_rtas_c_float3_exp_t)                               ## [in] upper bounds of AABB
-    ]
-
-###############################################################################
-## @brief Triangle represented using 3 vertex indices
-## 
-## @details
-##     - Represents a triangle using 3 vertex indices that index into a vertex
-##       array that needs to be provided together with the index array.
-##     - The linear barycentric u/v parametrization of the triangle is defined as:
-##          - (u=0, v=0) at v0,
-##          - (u=1, v=0) at v1, and
-##          - (u=0, v=1) at v2
-class ze_rtas_triangle_indices_uint32_exp_t(Structure):
-    _fields_ = [
-        ("v0", c_ulong),                                                ## [in] first index pointing to the first triangle vertex in vertex array
-        ("v1", c_ulong),                                                ## [in] second index pointing to the second triangle vertex in vertex
-                                                                        ## array
-        ("v2", c_ulong)                                                 ## [in] third index pointing to the third triangle vertex in vertex array
-    ]
-
-###############################################################################
-## @brief Quad represented using 4 vertex indices
-## 
-## @details
-##     - Represents a quad composed of 4 indices that index into a vertex array
-##       that needs to be provided together with the index array.
-##     - A quad is a triangle pair represented using 4 vertex indices v0, v1,
-##       v2, v3.
-##       The first triangle is made out of indices v0, v1, v3 and the second triangle
-##       from indices v2, v3, v1. The piecewise linear barycentric u/v parametrization
-##       of the quad is defined as:
-##          - (u=0, v=0) at v0,
-##          - (u=1, v=0) at v1,
-##          - (u=0, v=1) at v3, and
-##          - (u=1, v=1) at v2
-##       This is achieved by correcting the u'/v' coordinates of the second
-##       triangle by
-##       *u = 1-u'* and *v = 1-v'*, yielding a piecewise linear parametrization.
-class ze_rtas_quad_indices_uint32_exp_t(Structure):
-    _fields_ = [
-        ("v0", c_ulong),                                                ## [in] first index pointing to the first quad vertex in vertex array
-        ("v1", c_ulong),                                                ## [in] second index pointing to the second quad vertex in vertex array
-        ("v2", c_ulong),                                                ## [in] third index pointing to the third quad vertex in vertex array
-        ("v3", c_ulong)                                                 ## [in] fourth index pointing to the fourth quad vertex in vertex array
-    ]
-
-###############################################################################
-## @brief Ray tracing acceleration structure builder geometry info
-class ze_rtas_builder_geometry_info_exp_t(Structure):
-    _fields_ = [
-        ("geometryType", ze_rtas_builder_packed_geometry_type_exp_t)    ## [in] geometry type
-    ]
-
-###############################################################################
-## @brief Ray tracing acceleration structure builder triangle mesh geometry info
-## 
-## @details
-##     - The linear barycentric u/v parametrization of the triangle is defined as:
-##          - (u=0, v=0) at v0,
-##          - (u=1, v=0) at v1, and
-##          - (u=0, v=1) at v2
-class ze_rtas_builder_triangles_geometry_info_exp_t(Structure):
-    _fields_ = [
-        ("geometryType", ze_rtas_builder_packed_geometry_type_exp_t),   ## [in] geometry type, must be
-                                                                        ## ::ZE_RTAS_BUILDER_GEOMETRY_TYPE_EXP_TRIANGLES
-        ("geometryFlags", ze_rtas_builder_packed_geometry_exp_flags_t), ## [in] 0 or some combination of ::ze_rtas_builder_geometry_exp_flag_t
-                                                                        ## bits representing the geometry flags for all primitives of this
-                                                                        ## geometry
-        ("geometryMask", c_ubyte),                                      ## [in] 8-bit geometry mask for ray masking
-        ("triangleFormat", ze_rtas_builder_packed_input_data_format_exp_t), ## [in] format of triangle buffer data, must be
-                                                                        ## ::ZE_RTAS_BUILDER_INPUT_DATA_FORMAT_EXP_TRIANGLE_INDICES_UINT32
-        ("vertexFormat", ze_rtas_builder_packed_input_data_format_exp_t),   ## [in] format of vertex buffer data, must be
-                                                                        ## ::ZE_RTAS_BUILDER_INPUT_DATA_FORMAT_EXP_FLOAT3
-        ("triangleCount", c_ulong),                                     ## [in] number of triangles in triangle buffer
-        ("vertexCount", c_ulong),                                       ## [in] number of vertices in vertex buffer
-        ("triangleStride", c_ulong),                                    ## [in] stride (in bytes) of triangles in triangle buffer
-        ("vertexStride", c_ulong),                                      ## [in] stride (in bytes) of vertices in vertex buffer
-        ("pTriangleBuffer", c_void_p),                                  ## [in] pointer to array of triangle indices in specified format
-        ("pVertexBuffer", c_void_p)                                     ## [in] pointer to array of triangle vertices in specified format
-    ]
-
-###############################################################################
-## @brief Ray tracing acceleration structure builder quad mesh geometry info
-## 
-## @details
-##     - A quad is a triangle pair represented using 4 vertex indices v0, v1,
-##       v2, v3.
-##       The first triangle is made out of indices v0, v1, v3 and the second triangle
-##       from indices v2, v3, v1. The piecewise linear barycentric u/v parametrization
-##       of the quad is defined as:
-##          - (u=0, v=0) at v0,
-##          - (u=1, v=0) at v1,
-##          - (u=0, v=1) at v3, and
-##          - (u=1, v=1) at v2
-##       This is achieved by correcting the u'/v' coordinates of the second
-##       triangle by
-##       *u = 1-u'* and *v = 1-v'*, yielding a piecewise linear parametrization.
-class ze_rtas_builder_quads_geometry_info_exp_t(Structure):
-    _fields_ = [
-        ("geometryType", ze_rtas_builder_packed_geometry_type_exp_t),   ## [in] geometry type, must be ::ZE_RTAS_BUILDER_GEOMETRY_TYPE_EXP_QUADS
-        ("geometryFlags", ze_rtas_builder_packed_geometry_exp_flags_t), ## [in] 0 or some combination of ::ze_rtas_builder_geometry_exp_flag_t
-                                                                        ## bits representing the geometry flags for all primitives of this
-                                                                        ## geometry
-        ("geometryMask", c_ubyte),                                      ## [in] 8-bit geometry mask for ray masking
-        ("quadFormat", ze_rtas_builder_packed_input_data_format_exp_t), ## [in] format of quad buffer data, must be
-                                                                        ## ::ZE_RTAS_BUILDER_INPUT_DATA_FORMAT_EXP_QUAD_INDICES_UINT32
-        ("vertexFormat", ze_rtas_builder_packed_input_data_format_exp_t),   ## [in] format of vertex buffer data, must be
-                                                                        ## ::ZE_RTAS_BUILDER_INPUT_DATA_FORMAT_EXP_FLOAT3
-        ("quadCount", c_ulong),                                         ## [in] number of quads in quad buffer
-        ("vertexCount", c_ulong),                                       ## [in] number of vertices in vertex buffer
-        ("quadStride", c_ulong),                                        ## [in] stride (in bytes) of quads in quad buffer
-        ("vertexStride", c_ulong),                                      ## [in] stride (in bytes) of vertices in vertex buffer
-        ("pQuadBuffer", c_void_p),                                      ## [in] pointer to array of quad indices in specified format
-        ("pVertexBuffer", c_void_p)                                     ## [in] pointer to array of quad vertices in specified format
-    ]
-
-###############################################################################
-## @brief AABB callback function parameters
-class ze_rtas_geometry_aabbs_exp_cb_params_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("primID", c_ulong),                                            ## [in] first primitive to return bounds for
-        ("primIDCount", c_ulong),                                       ## [in] number of primitives to return bounds for
-        ("pGeomUserPtr", c_void_p),                                     ## [in] pointer provided through geometry descriptor
-        ("pBuildUserPtr", c_void_p),                                    ## [in] pointer provided through ::zeRTASBuilderBuildExp function
-        ("pBoundsOut", POINTER(ze_rtas_aabb_exp_t))                     ## [out] destination buffer to write AABB bounds to
-    ]
-
-###############################################################################
-## @brief Callback function pointer type to return AABBs for a range of
-##        procedural primitives
-
-###############################################################################
-## @brief Ray tracing acceleration structure builder procedural primitives
-##        geometry info
-## 
-## @details
-##     - A host-side bounds callback function is invoked by the acceleration
-##       structure builder to query the bounds of procedural primitives on
-##       demand. The callback is passed some `pGeomUserPtr` that can point to
-##       an application-side representation of the procedural primitives.
-##       Further, a second `pBuildUserPtr`, which is set by a parameter to
-##       ::zeRTASBuilderBuildExp, is passed to the callback. This allows the
-##       build to change the bounds of the procedural geometry, for example, to
-##       build a BVH only over a short time range to implement multi-segment
-##       motion blur.
-class ze_rtas_builder_procedural_geometry_info_exp_t(Structure):
-    _fields_ = [
-        ("geometryType", ze_rtas_builder_packed_geometry_type_exp_t),   ## [in] geometry type, must be
-                                                                        ## ::ZE_RTAS_BUILDER_GEOMETRY_TYPE_EXP_PROCEDURAL
-        ("geometryFlags", ze_rtas_builder_packed_geometry_exp_flags_t), ## [in] 0 or some combination of ::ze_rtas_builder_geometry_exp_flag_t
-                                                                        ## bits representing the geometry flags for all primitives of this
-                                                                        ## geometry
-        ("geometryMask", c_ubyte),                                      ## [in] 8-bit geometry mask for ray masking
-        ("reserved", c_ubyte),                                          ## [in] reserved for future use
-        ("primCount", c_ulong),                                         ## [in] number of primitives in geometry
-        ("pfnGetBoundsCb", ze_rtas_geometry_aabbs_cb_exp_t),            ## [in] pointer to callback function to get the axis-aligned bounding-box
-                                                                        ## for a range of primitives
-        ("pGeomUserPtr", c_void_p)                                      ## [in] user data pointer passed to callback
-    ]
-
-###############################################################################
-## @brief Ray tracing acceleration structure builder instance geometry info
-class ze_rtas_builder_instance_geometry_info_exp_t(Structure):
-    _fields_ = [
-        ("geometryType", ze_rtas_builder_packed_geometry_type_exp_t),   ## [in] geometry type, must be
-                                                                        ## ::ZE_RTAS_BUILDER_GEOMETRY_TYPE_EXP_INSTANCE
-        ("instanceFlags", ze_rtas_builder_packed_instance_exp_flags_t), ## [in] 0 or some combination of ::ze_rtas_builder_geometry_exp_flag_t
-                                                                        ## bits representing the geometry flags for all primitives of this
-                                                                        ## geometry
-        ("geometryMask", c_ubyte),                                      ## [in] 8-bit geometry mask for ray masking
-        ("transformFormat", ze_rtas_builder_packed_input_data_format_exp_t),## [in] format of the specified transformation
-        ("instanceUserID", c_ulong),                                    ## [in] user-specified identifier for the instance
-        ("pTransform", c_void_p),                                       ## [in] object-to-world instance transformation in specified format
-        ("pBounds", POINTER(ze_rtas_aabb_exp_t)),                       ## [in] object-space axis-aligned bounding-box of the instanced
-                                                                        ## acceleration structure
-        ("pAccelerationStructure", c_void_p)                            ## [in] pointer to acceleration structure to instantiate
-    ]
-
-###############################################################################
-## @brief 
-class ze_rtas_builder_build_op_exp_desc_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("rtasFormat", ze_rtas_format_exp_t),                           ## [in] ray tracing acceleration structure format
-        ("buildQuality", ze_rtas_builder_build_quality_hint_exp_t),     ## [in] acceleration structure build quality hint
-        ("buildFlags", ze_rtas_builder_build_op_exp_flags_t),           ## [in] 0 or some combination of ::ze_rtas_builder_build_op_exp_flag_t
-                                                                        ## flags
-        ("ppGeometries", POINTER(ze_rtas_builder_geometry_info_exp_t*)),## [in][optional][range(0, `numGeometries`)] NULL or a valid array of
-                                                                        ## pointers to geometry infos
-        ("numGeometries", c_ulong)                                      ## [in] number of geometries in geometry infos array, can be zero when
-                                                                        ## `ppGeometries` is NULL
-    ]
-
-###############################################################################
-## @brief Counter-based Event Pools Extension Name
-ZE_EVENT_POOL_COUNTER_BASED_EXP_NAME = "ZE_experimental_event_pool_counter_based"
-
-###############################################################################
-## @brief Counter-based Event Pools Extension Version(s)
-class ze_event_pool_counter_based_exp_version_v(IntEnum):
-    _1_0 = ZE_MAKE_VERSION( 1, 0 )                                          ## version 1.0
-    CURRENT = ZE_MAKE_VERSION( 1, 0 )                                       ## latest known version
-
-class ze_event_pool_counter_based_exp_version_t(c_int):
-    def __str__(self):
-        return str(ze_event_pool_counter_based_exp_version_v(self.value))
-
-
-###############################################################################
-## @brief Supported event flags for defining counter-based event pools.
-class ze_event_pool_counter_based_exp_flags_v(IntEnum):
-    IMMEDIATE = ZE_BIT(0)                                                   ## Counter-based event pool is used for immediate command lists (default)
-    NON_IMMEDIATE = ZE_BIT(1)                                               ## Counter-based event pool is for non-immediate command lists
-
-class ze_event_pool_counter_based_exp_flags_t(c_int):
-    def __str__(self):
-        return hex(self.value)
-
-
-###############################################################################
-## @brief Event pool descriptor for counter-based events. This structure may be
-##        passed to ::zeEventPoolCreate as pNext member of
-##        ::ze_event_pool_desc_t.
-class ze_event_pool_counter_based_exp_desc_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("flags", ze_event_pool_counter_based_exp_flags_t)              ## [in] mode flags.
-                                                                        ## must be 0 (default) or a valid value of ::ze_event_pool_counter_based_exp_flag_t
-                                                                        ## default behavior is counter-based event pool is only used for
-                                                                        ## immediate command lists.
-    ]
-
-###############################################################################
-## @brief Image Memory Properties Extension Name
-ZE_BINDLESS_IMAGE_EXP_NAME = "ZE_experimental_bindless_image"
-
-###############################################################################
-## @brief Bindless Image Extension Version(s)
-class ze_bindless_image_exp_version_v(IntEnum):
-    _1_0 = ZE_MAKE_VERSION( 1, 0 )                                          ## version 1.0
-    CURRENT = ZE_MAKE_VERSION( 1, 0 )                                       ## latest known version
-
-class ze_bindless_image_exp_version_t(c_int):
-    def __str__(self):
-        return str(ze_bindless_image_exp_version_v(self.value))
-
-
-###############################################################################
-## @brief Image flags for Bindless images
-class ze_image_bindless_exp_flags_v(IntEnum):
-    BINDLESS = ZE_BIT(0)                                                    ## Bindless images are created with ::zeImageCreate. The image handle
-                                                                            ## created with this flag is valid on both host and device.
-    SAMPLED_IMAGE = ZE_BIT(1)                                               ## Bindless sampled images are created with ::zeImageCreate by combining
-                                                                            ## BINDLESS and SAMPLED_IMAGE.
-                                                                            ## Create sampled image view from bindless unsampled image using SAMPLED_IMAGE.
-
-class ze_image_bindless_exp_flags_t(c_int):
-    def __str__(self):
-        return hex(self.value)
-
-
-###############################################################################
-## @brief Image descriptor for bindless images. This structure may be passed to
-##        ::zeImageCreate via pNext member of ::ze_image_desc_t.
-class ze_image_bindless_exp_desc_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("flags", ze_image_bindless_exp_flags_t)                        ## [in] image flags.
-                                                                        ## must be 0 (default) or a valid value of ::ze_image_bindless_exp_flag_t
-                                                                        ## default behavior is bindless images are not used when creating handles
-                                                                        ## via ::zeImageCreate.
-                                                                        ## When the flag is passed to ::zeImageCreate, then only the memory for
-                                                                        ## the image is allocated.
-                                                                        ## Additional image handles can be created with ::zeImageViewCreateExt.
-                                                                        ## When ::ZE_IMAGE_BINDLESS_EXP_FLAG_SAMPLED_IMAGE flag is passed,
-                                                                        ## ::ze_sampler_desc_t must be attached via pNext member of ::ze_image_bindless_exp_desc_t.
-    ]
-
-###############################################################################
-## @brief Image descriptor for bindless images created from pitched allocations.
-##        This structure may be passed to ::zeImageCreate via pNext member of
-##        ::ze_image_desc_t.
-class ze_image_pitched_exp_desc_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("ptr", c_void_p)                                               ## [in] pointer to pitched device allocation allocated using ::zeMemAllocDevice
-    ]
-
-###############################################################################
-## @brief Device specific properties for pitched allocations
-## 
-## @details
-##     - This structure may be passed to ::zeDeviceGetImageProperties via the
-##       pNext member of ::ze_device_image_properties_t.
-class ze_device_pitched_alloc_exp_properties_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("maxImageLinearWidth", c_size_t),                              ## [out] Maximum image linear width.
-        ("maxImageLinearHeight", c_size_t)                              ## [out] Maximum image linear height.
-    ]
+## @brief Image flags for Bindless images
+class ze_image_bindless_exp_flags_v(IntEnum):
+    BINDLESS = ZE_BIT(0)                                                    ## Bindless images are created with ::zeImageCreate. The image handle
+                                                                            ## created with this flag is valid on both host and device.
+    SAMPLED_IMAGE = ZE_BIT(1)                                               ## Bindless sampled images are created with ::zeImageCreate by combining
+                                                                            ## BINDLESS and SAMPLED_IMAGE.
+                                                                            ## Create sampled image view from bindless unsampled image using SAMPLED_IMAGE.
+
+class ze_image_bindless_exp_flags_t(c_int):
+    def __str__(self):
+        return hex(self.value)
+
 
 ###############################################################################
 ## @brief Command List Clone Extension Name
@@ -4715,20 +3658,6 @@ class ze_mutable_command_exp_flags_t(c_int):
         return hex(self.value)
 
 
-###############################################################################
-## @brief Mutable command identifier descriptor
-class ze_mutable_command_id_exp_desc_t(Structure):
-    _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("flags", ze_mutable_command_exp_flags_t)                       ## [in] mutable command flags.
-                                                                        ##  - must be 0 (default, equivalent to setting all flags bar kernel
-                                                                        ## instruction), or a valid combination of ::ze_mutable_command_exp_flag_t
-                                                                        ##  - in order to include kernel instruction mutation,
-                                                                        ## ::ZE_MUTABLE_COMMAND_EXP_FLAG_KERNEL_INSTRUCTION must be explictly included
-    ]
-
 ###############################################################################
 ## @brief Mutable command list flags
 class ze_mutable_command_list_exp_flags_v(IntEnum):
@@ -4740,101 +3669,252 @@ class ze_mutable_command_list_exp_flags_t(c_int):
 
 
 ###############################################################################
-## @brief Mutable command list properties
-class ze_mutable_command_list_exp_properties_t(Structure):
+## @brief Table of Global callback functions pointers
+class ze_global_callbacks_t(Structure):
     _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("mutableCommandListFlags", ze_mutable_command_list_exp_flags_t),   ## [out] mutable command list flags
-        ("mutableCommandFlags", ze_mutable_command_exp_flags_t)         ## [out] mutable command flags
+        ("pfnInitCb", c_void_p)                                         ## ze_pfnInitCb_t
     ]
 
 ###############################################################################
-## @brief Mutable command list descriptor
-class ze_mutable_command_list_exp_desc_t(Structure):
+## @brief Table of Driver callback functions pointers
+class ze_driver_callbacks_t(Structure):
     _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("flags", ze_mutable_command_list_exp_flags_t)                  ## [in] mutable command list flags.
-                                                                        ##  - must be 0 (default) or a valid combination of ::ze_mutable_command_list_exp_flag_t
+        ("pfnGetCb", c_void_p),                                         ## ze_pfnDriverGetCb_t
+        ("pfnGetApiVersionCb", c_void_p),                               ## ze_pfnDriverGetApiVersionCb_t
+        ("pfnGetPropertiesCb", c_void_p),                               ## ze_pfnDriverGetPropertiesCb_t
+        ("pfnGetIpcPropertiesCb", c_void_p),                            ## ze_pfnDriverGetIpcPropertiesCb_t
+        ("pfnGetExtensionPropertiesCb", c_void_p)                       ## ze_pfnDriverGetExtensionPropertiesCb_t
     ]
 
 ###############################################################################
-## @brief Mutable commands descriptor
-class ze_mutable_commands_exp_desc_t(Structure):
+## @brief Table of Device callback functions pointers
+class ze_device_callbacks_t(Structure):
     _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("flags", c_ulong)                                              ## [in] must be 0, this field is reserved for future use
+        ("pfnGetCb", c_void_p),                                         ## ze_pfnDeviceGetCb_t
+        ("pfnGetSubDevicesCb", c_void_p),                               ## ze_pfnDeviceGetSubDevicesCb_t
+        ("pfnGetPropertiesCb", c_void_p),                               ## ze_pfnDeviceGetPropertiesCb_t
+        ("pfnGetComputePropertiesCb", c_void_p),                        ## ze_pfnDeviceGetComputePropertiesCb_t
+        ("pfnGetModulePropertiesCb", c_void_p),                         ## ze_pfnDeviceGetModulePropertiesCb_t
+        ("pfnGetCommandQueueGroupPropertiesCb", c_void_p),              ## ze_pfnDeviceGetCommandQueueGroupPropertiesCb_t
+        ("pfnGetMemoryPropertiesCb", c_void_p),                         ## ze_pfnDeviceGetMemoryPropertiesCb_t
+        ("pfnGetMemoryAccessPropertiesCb", c_void_p),                   ## ze_pfnDeviceGetMemoryAccessPropertiesCb_t
+        ("pfnGetCachePropertiesCb", c_void_p),                          ## ze_pfnDeviceGetCachePropertiesCb_t
+        ("pfnGetImagePropertiesCb", c_void_p),                          ## ze_pfnDeviceGetImagePropertiesCb_t
+        ("pfnGetExternalMemoryPropertiesCb", c_void_p),                 ## ze_pfnDeviceGetExternalMemoryPropertiesCb_t
+        ("pfnGetP2PPropertiesCb", c_void_p),                            ## ze_pfnDeviceGetP2PPropertiesCb_t
+        ("pfnCanAccessPeerCb", c_void_p),                               ## ze_pfnDeviceCanAccessPeerCb_t
+        ("pfnGetStatusCb", c_void_p)                                    ## ze_pfnDeviceGetStatusCb_t
     ]
 
 ###############################################################################
-## @brief Mutable kernel argument descriptor
-class ze_mutable_kernel_argument_exp_desc_t(Structure):
+## @brief Table of Context callback functions pointers
+class ze_context_callbacks_t(Structure):
     _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("commandId", c_ulonglong),                                     ## [in] command identifier
-        ("argIndex", c_ulong),                                          ## [in] kernel argument index
-        ("argSize", c_size_t),                                          ## [in] kernel argument size
-        ("pArgValue", c_void_p)                                         ## [in] pointer to kernel argument value
+        ("pfnCreateCb", c_void_p),                                      ## ze_pfnContextCreateCb_t
+        ("pfnDestroyCb", c_void_p),                                     ## ze_pfnContextDestroyCb_t
+        ("pfnGetStatusCb", c_void_p),                                   ## ze_pfnContextGetStatusCb_t
+        ("pfnSystemBarrierCb", c_void_p),                               ## ze_pfnContextSystemBarrierCb_t
+        ("pfnMakeMemoryResidentCb", c_void_p),                          ## ze_pfnContextMakeMemoryResidentCb_t
+        ("pfnEvictMemoryCb", c_void_p),                                 ## ze_pfnContextEvictMemoryCb_t
+        ("pfnMakeImageResidentCb", c_void_p),                           ## ze_pfnContextMakeImageResidentCb_t
+        ("pfnEvictImageCb", c_void_p)                                   ## ze_pfnContextEvictImageCb_t
     ]
 
 ###############################################################################
-## @brief Mutable kernel group count descriptor
-class ze_mutable_group_count_exp_desc_t(Structure):
+## @brief Table of CommandQueue callback functions pointers
+class ze_command_queue_callbacks_t(Structure):
     _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("commandId", c_ulonglong),                                     ## [in] command identifier
-        ("pGroupCount", POINTER(ze_group_count_t))                      ## [in] pointer to group count
+        ("pfnCreateCb", c_void_p),                                      ## ze_pfnCommandQueueCreateCb_t
+        ("pfnDestroyCb", c_void_p),                                     ## ze_pfnCommandQueueDestroyCb_t
+        ("pfnExecuteCommandListsCb", c_void_p),                         ## ze_pfnCommandQueueExecuteCommandListsCb_t
+        ("pfnSynchronizeCb", c_void_p)                                  ## ze_pfnCommandQueueSynchronizeCb_t
     ]
 
 ###############################################################################
-## @brief Mutable kernel group size descriptor
-class ze_mutable_group_size_exp_desc_t(Structure):
+## @brief Table of CommandList callback functions pointers
+class ze_command_list_callbacks_t(Structure):
     _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("commandId", c_ulonglong),                                     ## [in] command identifier
-        ("groupSizeX", c_ulong),                                        ## [in] group size for X dimension to use for the kernel
-        ("groupSizeY", c_ulong),                                        ## [in] group size for Y dimension to use for the kernel
-        ("groupSizeZ", c_ulong)                                         ## [in] group size for Z dimension to use for the kernel
+        ("pfnCreateCb", c_void_p),                                      ## ze_pfnCommandListCreateCb_t
+        ("pfnCreateImmediateCb", c_void_p),                             ## ze_pfnCommandListCreateImmediateCb_t
+        ("pfnDestroyCb", c_void_p),                                     ## ze_pfnCommandListDestroyCb_t
+        ("pfnCloseCb", c_void_p),                                       ## ze_pfnCommandListCloseCb_t
+        ("pfnResetCb", c_void_p),                                       ## ze_pfnCommandListResetCb_t
+        ("pfnAppendWriteGlobalTimestampCb", c_void_p),                  ## ze_pfnCommandListAppendWriteGlobalTimestampCb_t
+        ("pfnAppendBarrierCb", c_void_p),                               ## ze_pfnCommandListAppendBarrierCb_t
+        ("pfnAppendMemoryRangesBarrierCb", c_void_p),                   ## ze_pfnCommandListAppendMemoryRangesBarrierCb_t
+        ("pfnAppendMemoryCopyCb", c_void_p),                            ## ze_pfnCommandListAppendMemoryCopyCb_t
+        ("pfnAppendMemoryFillCb", c_void_p),                            ## ze_pfnCommandListAppendMemoryFillCb_t
+        ("pfnAppendMemoryCopyRegionCb", c_void_p),                      ## ze_pfnCommandListAppendMemoryCopyRegionCb_t
+        ("pfnAppendMemoryCopyFromContextCb", c_void_p),                 ## ze_pfnCommandListAppendMemoryCopyFromContextCb_t
+        ("pfnAppendImageCopyCb", c_void_p),                             ## ze_pfnCommandListAppendImageCopyCb_t
+        ("pfnAppendImageCopyRegionCb", c_void_p),                       ## ze_pfnCommandListAppendImageCopyRegionCb_t
+        ("pfnAppendImageCopyToMemoryCb", c_void_p),                     ## ze_pfnCommandListAppendImageCopyToMemoryCb_t
+        ("pfnAppendImageCopyFromMemoryCb", c_void_p),                   ## ze_pfnCommandListAppendImageCopyFromMemoryCb_t
+        ("pfnAppendMemoryPrefetchCb", c_void_p),                        ## ze_pfnCommandListAppendMemoryPrefetchCb_t
+        ("pfnAppendMemAdviseCb", c_void_p),                             ## ze_pfnCommandListAppendMemAdviseCb_t
+        ("pfnAppendSignalEventCb", c_void_p),                           ## ze_pfnCommandListAppendSignalEventCb_t
+        ("pfnAppendWaitOnEventsCb", c_void_p),                          ## ze_pfnCommandListAppendWaitOnEventsCb_t
+        ("pfnAppendEventResetCb", c_void_p),                            ## ze_pfnCommandListAppendEventResetCb_t
+        ("pfnAppendQueryKernelTimestampsCb", c_void_p),                 ## ze_pfnCommandListAppendQueryKernelTimestampsCb_t
+        ("pfnAppendLaunchKernelCb", c_void_p),                          ## ze_pfnCommandListAppendLaunchKernelCb_t
+        ("pfnAppendLaunchCooperativeKernelCb", c_void_p),               ## ze_pfnCommandListAppendLaunchCooperativeKernelCb_t
+        ("pfnAppendLaunchKernelIndirectCb", c_void_p),                  ## ze_pfnCommandListAppendLaunchKernelIndirectCb_t
+        ("pfnAppendLaunchMultipleKernelsIndirectCb", c_void_p)          ## ze_pfnCommandListAppendLaunchMultipleKernelsIndirectCb_t
     ]
 
 ###############################################################################
-## @brief Mutable kernel global offset descriptor
-class ze_mutable_global_offset_exp_desc_t(Structure):
+## @brief Table of Image callback functions pointers
+class ze_image_callbacks_t(Structure):
     _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("commandId", c_ulonglong),                                     ## [in] command identifier
-        ("offsetX", c_ulong),                                           ## [in] global offset for X dimension to use for this kernel
-        ("offsetY", c_ulong),                                           ## [in] global offset for Y dimension to use for this kernel
-        ("offsetZ", c_ulong)                                            ## [in] global offset for Z dimension to use for this kernel
+        ("pfnGetPropertiesCb", c_void_p),                               ## ze_pfnImageGetPropertiesCb_t
+        ("pfnCreateCb", c_void_p),                                      ## ze_pfnImageCreateCb_t
+        ("pfnDestroyCb", c_void_p)                                      ## ze_pfnImageDestroyCb_t
     ]
 
 ###############################################################################
-## @brief Mutable graph argument descriptor
-class ze_mutable_graph_argument_exp_desc_t(Structure):
+## @brief Table of Mem callback functions pointers
+class ze_mem_callbacks_t(Structure):
     _fields_ = [
-        ("stype", ze_structure_type_t),                                 ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("commandId", c_ulonglong),                                     ## [in] command identifier
-        ("argIndex", c_ulong),                                          ## [in] graph argument index
-        ("pArgValue", c_void_p)                                         ## [in] pointer to graph argument value
+        ("pfnAllocSharedCb", c_void_p),                                 ## ze_pfnMemAllocSharedCb_t
+        ("pfnAllocDeviceCb", c_void_p),                                 ## ze_pfnMemAllocDeviceCb_t
+        ("pfnAllocHostCb", c_void_p),                                   ## ze_pfnMemAllocHostCb_t
+        ("pfnFreeCb", c_void_p),                                        ## ze_pfnMemFreeCb_t
+        ("pfnGetAllocPropertiesCb", c_void_p),                          ## ze_pfnMemGetAllocPropertiesCb_t
+        ("pfnGetAddressRangeCb", c_void_p),                             ## ze_pfnMemGetAddressRangeCb_t
+        ("pfnGetIpcHandleCb", c_void_p),                                ## ze_pfnMemGetIpcHandleCb_t
+        ("pfnOpenIpcHandleCb", c_void_p),                               ## ze_pfnMemOpenIpcHandleCb_t
+        ("pfnCloseIpcHandleCb", c_void_p)                               ## ze_pfnMemCloseIpcHandleCb_t
+    ]
+
+###############################################################################
+## @brief Table of Fence callback functions pointers
+class ze_fence_callbacks_t(Structure):
+    _fields_ = [
+        ("pfnCreateCb", c_void_p),                                      ## ze_pfnFenceCreateCb_t
+        ("pfnDestroyCb", c_void_p),                                     ## ze_pfnFenceDestroyCb_t
+        ("pfnHostSynchronizeCb", c_void_p),                             ## ze_pfnFenceHostSynchronizeCb_t
+        ("pfnQueryStatusCb", c_void_p),                                 ## ze_pfnFenceQueryStatusCb_t
+        ("pfnResetCb", c_void_p)                                        ## ze_pfnFenceResetCb_t
+    ]
+
+###############################################################################
+## @brief Table of EventPool callback functions pointers
+class ze_event_pool_callbacks_t(Structure):
+    _fields_ = [
+        ("pfnCreateCb", c_void_p),                                      ## ze_pfnEventPoolCreateCb_t
+        ("pfnDestroyCb", c_void_p),                                     ## ze_pfnEventPoolDestroyCb_t
+        ("pfnGetIpcHandleCb", c_void_p),                                ## ze_pfnEventPoolGetIpcHandleCb_t
+        ("pfnOpenIpcHandleCb", c_void_p),                               ## ze_pfnEventPoolOpenIpcHandleCb_t
+        ("pfnCloseIpcHandleCb", c_void_p)                               ## ze_pfnEventPoolCloseIpcHandleCb_t
+    ]
+
+###############################################################################
+## @brief Table of Event callback functions pointers
+class ze_event_callbacks_t(Structure):
+    _fields_ = [
+        ("pfnCreateCb", c_void_p),                                      ## ze_pfnEventCreateCb_t
+        ("pfnDestroyCb", c_void_p),                                     ## ze_pfnEventDestroyCb_t
+        ("pfnHostSignalCb", c_void_p),                                  ## ze_pfnEventHostSignalCb_t
+        ("pfnHostSynchronizeCb", c_void_p),                             ## ze_pfnEventHostSynchronizeCb_t
+        ("pfnQueryStatusCb", c_void_p),                                 ## ze_pfnEventQueryStatusCb_t
+        ("pfnHostResetCb", c_void_p),                                   ## ze_pfnEventHostResetCb_t
+        ("pfnQueryKernelTimestampCb", c_void_p)                         ## ze_pfnEventQueryKernelTimestampCb_t
+    ]
+
+###############################################################################
+## @brief Table of Module callback functions pointers
+class ze_module_callbacks_t(Structure):
+    _fields_ = [
+        ("pfnCreateCb", c_void_p),                                      ## ze_pfnModuleCreateCb_t
+        ("pfnDestroyCb", c_void_p),                                     ## ze_pfnModuleDestroyCb_t
+        ("pfnDynamicLinkCb", c_void_p),                                 ## ze_pfnModuleDynamicLinkCb_t
+        ("pfnGetNativeBinaryCb", c_void_p),                             ## ze_pfnModuleGetNativeBinaryCb_t
+        ("pfnGetGlobalPointerCb", c_void_p),                            ## ze_pfnModuleGetGlobalPointerCb_t
+        ("pfnGetKernelNamesCb", c_void_p),                              ## ze_pfnModuleGetKernelNamesCb_t
+        ("pfnGetPropertiesCb", c_void_p),                               ## ze_pfnModuleGetPropertiesCb_t
+        ("pfnGetFunctionPointerCb", c_void_p)                           ## ze_pfnModuleGetFunctionPointerCb_t
+    ]
+
+###############################################################################
+## @brief Table of ModuleBuildLog callback functions pointers
+class ze_module_build_log_callbacks_t(Structure):
+    _fields_ = [
+        ("pfnDestroyCb", c_void_p),                                     ## ze_pfnModuleBuildLogDestroyCb_t
+        ("pfnGetStringCb", c_void_p)                                    ## ze_pfnModuleBuildLogGetStringCb_t
+    ]
+
+###############################################################################
+## @brief Table of Kernel callback functions pointers
+class ze_kernel_callbacks_t(Structure):
+    _fields_ = [
+        ("pfnCreateCb", c_void_p),                                      ## ze_pfnKernelCreateCb_t
+        ("pfnDestroyCb", c_void_p),                                     ## ze_pfnKernelDestroyCb_t
+        ("pfnSetCacheConfigCb", c_void_p),                              ## ze_pfnKernelSetCacheConfigCb_t
+        ("pfnSetGroupSizeCb", c_void_p),                                ## ze_pfnKernelSetGroupSizeCb_t
+        ("pfnSuggestGroupSizeCb", c_void_p),                            ## ze_pfnKernelSuggestGroupSizeCb_t
+        ("pfnSuggestMaxCooperativeGroupCountCb", c_void_p),             ## ze_pfnKernelSuggestMaxCooperativeGroupCountCb_t
+        ("pfnSetArgumentValueCb", c_void_p),                            ## ze_pfnKernelSetArgumentValueCb_t
+        ("pfnSetIndirectAccessCb", c_void_p),                           ## ze_pfnKernelSetIndirectAccessCb_t
+        ("pfnGetIndirectAccessCb", c_void_p),                           ## ze_pfnKernelGetIndirectAccessCb_t
+        ("pfnGetSourceAttributesCb", c_void_p),                         ## ze_pfnKernelGetSourceAttributesCb_t
+        ("pfnGetPropertiesCb", c_void_p),                               ## ze_pfnKernelGetPropertiesCb_t
+        ("pfnGetNameCb", c_void_p)                                      ## ze_pfnKernelGetNameCb_t
+    ]
+
+###############################################################################
+## @brief Table of Sampler callback functions pointers
+class ze_sampler_callbacks_t(Structure):
+    _fields_ = [
+        ("pfnCreateCb", c_void_p),                                      ## ze_pfnSamplerCreateCb_t
+        ("pfnDestroyCb", c_void_p)                                      ## ze_pfnSamplerDestroyCb_t
+    ]
+
+###############################################################################
+## @brief Table of PhysicalMem callback functions pointers
+class ze_physical_mem_callbacks_t(Structure):
+    _fields_ = [
+        ("pfnCreateCb", c_void_p),                                      ## ze_pfnPhysicalMemCreateCb_t
+        ("pfnDestroyCb", c_void_p)                                      ## ze_pfnPhysicalMemDestroyCb_t
+    ]
+
+###############################################################################
+## @brief Table of VirtualMem callback functions pointers
+class ze_virtual_mem_callbacks_t(Structure):
+    _fields_ = [
+        ("pfnReserveCb", c_void_p),                                     ## ze_pfnVirtualMemReserveCb_t
+        ("pfnFreeCb", c_void_p),                                        ## ze_pfnVirtualMemFreeCb_t
+        ("pfnQueryPageSizeCb", c_void_p),                               ## ze_pfnVirtualMemQueryPageSizeCb_t
+        ("pfnMapCb", c_void_p),                                         ## ze_pfnVirtualMemMapCb_t
+        ("pfnUnmapCb", c_void_p),                                       ## ze_pfnVirtualMemUnmapCb_t
+        ("pfnSetAccessAttributeCb", c_void_p),                          ## ze_pfnVirtualMemSetAccessAttributeCb_t
+        ("pfnGetAccessAttributeCb", c_void_p)                           ## ze_pfnVirtualMemGetAccessAttributeCb_t
+    ]
+
+###############################################################################
+## @brief Container for all callbacks
+class ze_callbacks_t(Structure):
+    _fields_ = [
+        ("Global", ze_global_callbacks_t),
+        ("Driver", ze_driver_callbacks_t),
+        ("Device", ze_device_callbacks_t),
+        ("Context", ze_context_callbacks_t),
+        ("CommandQueue", ze_command_queue_callbacks_t),
+        ("CommandList", ze_command_list_callbacks_t),
+        ("Fence", ze_fence_callbacks_t),
+        ("EventPool", ze_event_pool_callbacks_t),
+        ("Event", ze_event_callbacks_t),
+        ("Image", ze_image_callbacks_t),
+        ("Module", ze_module_callbacks_t),
+        ("ModuleBuildLog", ze_module_build_log_callbacks_t),
+        ("Kernel", ze_kernel_callbacks_t),
+        ("Sampler", ze_sampler_callbacks_t),
+        ("PhysicalMem", ze_physical_mem_callbacks_t),
+        ("Mem", ze_mem_callbacks_t),
+        ("VirtualMem", ze_virtual_mem_callbacks_t)
     ]
 
 ###############################################################################
-__use_win_types = "Windows" == platform.uname()[0]
+__use_win_types = "win32" == sys.platform
 
 ###############################################################################
 ## @brief Function-pointer for zeRTASBuilderCreateExt
@@ -4860,9 +3940,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeRTASBuilderCommandListAppendCopyExt
 if __use_win_types:
-    _zeRTASBuilderCommandListAppendCopyExt_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, c_void_p, c_size_t, ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeRTASBuilderCommandListAppendCopyExt_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, c_void_p, c_size_t, ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeRTASBuilderCommandListAppendCopyExt_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, c_void_p, c_size_t, ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeRTASBuilderCommandListAppendCopyExt_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, c_void_p, c_size_t, ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeRTASBuilderDestroyExt
@@ -4883,35 +3963,6 @@ class _ze_rtas_builder_dditable_t(Structure):
         ("pfnDestroyExt", c_void_p)                                     ## _zeRTASBuilderDestroyExt_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zeRTASBuilderCreateExp
-if __use_win_types:
-    _zeRTASBuilderCreateExp_t = WINFUNCTYPE( ze_result_t, ze_driver_handle_t, POINTER(ze_rtas_builder_exp_desc_t), POINTER(ze_rtas_builder_exp_handle_t) )
-else:
-    _zeRTASBuilderCreateExp_t = CFUNCTYPE( ze_result_t, ze_driver_handle_t, POINTER(ze_rtas_builder_exp_desc_t), POINTER(ze_rtas_builder_exp_handle_t) )
-
-###############################################################################
-## @brief Function-pointer for zeRTASBuilderGetBuildPropertiesExp
-if __use_win_types:
-    _zeRTASBuilderGetBuildPropertiesExp_t = WINFUNCTYPE( ze_result_t, ze_rtas_builder_exp_handle_t, POINTER(ze_rtas_builder_build_op_exp_desc_t), POINTER(ze_rtas_builder_exp_properties_t) )
-else:
-    _zeRTASBuilderGetBuildPropertiesExp_t = CFUNCTYPE( ze_result_t, ze_rtas_builder_exp_handle_t, POINTER(ze_rtas_builder_build_op_exp_desc_t), POINTER(ze_rtas_builder_exp_properties_t) )
-
-###############################################################################
-## @brief Function-pointer for zeRTASBuilderBuildExp
-if __use_win_types:
-    _zeRTASBuilderBuildExp_t = WINFUNCTYPE( ze_result_t, ze_rtas_builder_exp_handle_t, POINTER(ze_rtas_builder_build_op_exp_desc_t), c_void_p, c_size_t, c_void_p, c_size_t, ze_rtas_parallel_operation_exp_handle_t, c_void_p, POINTER(ze_rtas_aabb_exp_t), POINTER(c_size_t) )
-else:
-    _zeRTASBuilderBuildExp_t = CFUNCTYPE( ze_result_t, ze_rtas_builder_exp_handle_t, POINTER(ze_rtas_builder_build_op_exp_desc_t), c_void_p, c_size_t, c_void_p, c_size_t, ze_rtas_parallel_operation_exp_handle_t, c_void_p, POINTER(ze_rtas_aabb_exp_t), POINTER(c_size_t) )
-
-###############################################################################
-## @brief Function-pointer for zeRTASBuilderDestroyExp
-if __use_win_types:
-    _zeRTASBuilderDestroyExp_t = WINFUNCTYPE( ze_result_t, ze_rtas_builder_exp_handle_t )
-else:
-    _zeRTASBuilderDestroyExp_t = CFUNCTYPE( ze_result_t, ze_rtas_builder_exp_handle_t )
-
-
 ###############################################################################
 ## @brief Table of RTASBuilderExp functions pointers
 class _ze_rtas_builder_exp_dditable_t(Structure):
@@ -4961,35 +4012,6 @@ class _ze_rtas_parallel_operation_dditable_t(Structure):
         ("pfnDestroyExt", c_void_p)                                     ## _zeRTASParallelOperationDestroyExt_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zeRTASParallelOperationCreateExp
-if __use_win_types:
-    _zeRTASParallelOperationCreateExp_t = WINFUNCTYPE( ze_result_t, ze_driver_handle_t, POINTER(ze_rtas_parallel_operation_exp_handle_t) )
-else:
-    _zeRTASParallelOperationCreateExp_t = CFUNCTYPE( ze_result_t, ze_driver_handle_t, POINTER(ze_rtas_parallel_operation_exp_handle_t) )
-
-###############################################################################
-## @brief Function-pointer for zeRTASParallelOperationGetPropertiesExp
-if __use_win_types:
-    _zeRTASParallelOperationGetPropertiesExp_t = WINFUNCTYPE( ze_result_t, ze_rtas_parallel_operation_exp_handle_t, POINTER(ze_rtas_parallel_operation_exp_properties_t) )
-else:
-    _zeRTASParallelOperationGetPropertiesExp_t = CFUNCTYPE( ze_result_t, ze_rtas_parallel_operation_exp_handle_t, POINTER(ze_rtas_parallel_operation_exp_properties_t) )
-
-###############################################################################
-## @brief Function-pointer for zeRTASParallelOperationJoinExp
-if __use_win_types:
-    _zeRTASParallelOperationJoinExp_t = WINFUNCTYPE( ze_result_t, ze_rtas_parallel_operation_exp_handle_t )
-else:
-    _zeRTASParallelOperationJoinExp_t = CFUNCTYPE( ze_result_t, ze_rtas_parallel_operation_exp_handle_t )
-
-###############################################################################
-## @brief Function-pointer for zeRTASParallelOperationDestroyExp
-if __use_win_types:
-    _zeRTASParallelOperationDestroyExp_t = WINFUNCTYPE( ze_result_t, ze_rtas_parallel_operation_exp_handle_t )
-else:
-    _zeRTASParallelOperationDestroyExp_t = CFUNCTYPE( ze_result_t, ze_rtas_parallel_operation_exp_handle_t )
-
-
 ###############################################################################
 ## @brief Table of RTASParallelOperationExp functions pointers
 class _ze_rtas_parallel_operation_exp_dditable_t(Structure):
@@ -5010,9 +4032,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeInitDrivers
 if __use_win_types:
-    _zeInitDrivers_t = WINFUNCTYPE( ze_result_t, POINTER(c_ulong), POINTER(ze_driver_handle_t), POINTER(ze_init_driver_type_desc_t) )
+    _zeInitDrivers_t = WINFUNCTYPE( ze_result_t, POINTER(c_uint32), POINTER(ze_driver_handle_t), POINTER(ze_init_driver_type_desc_t) )
 else:
-    _zeInitDrivers_t = CFUNCTYPE( ze_result_t, POINTER(c_ulong), POINTER(ze_driver_handle_t), POINTER(ze_init_driver_type_desc_t) )
+    _zeInitDrivers_t = CFUNCTYPE( ze_result_t, POINTER(c_uint32), POINTER(ze_driver_handle_t), POINTER(ze_init_driver_type_desc_t) )
 
 
 ###############################################################################
@@ -5026,9 +4048,9 @@ class _ze_global_dditable_t(Structure):
 ###############################################################################
 ## @brief Function-pointer for zeDriverGet
 if __use_win_types:
-    _zeDriverGet_t = WINFUNCTYPE( ze_result_t, POINTER(c_ulong), POINTER(ze_driver_handle_t) )
+    _zeDriverGet_t = WINFUNCTYPE( ze_result_t, POINTER(c_uint32), POINTER(ze_driver_handle_t) )
 else:
-    _zeDriverGet_t = CFUNCTYPE( ze_result_t, POINTER(c_ulong), POINTER(ze_driver_handle_t) )
+    _zeDriverGet_t = CFUNCTYPE( ze_result_t, POINTER(c_uint32), POINTER(ze_driver_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeDriverGetApiVersion
@@ -5054,9 +4076,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeDriverGetExtensionProperties
 if __use_win_types:
-    _zeDriverGetExtensionProperties_t = WINFUNCTYPE( ze_result_t, ze_driver_handle_t, POINTER(c_ulong), POINTER(ze_driver_extension_properties_t) )
+    _zeDriverGetExtensionProperties_t = WINFUNCTYPE( ze_result_t, ze_driver_handle_t, POINTER(c_uint32), POINTER(ze_driver_extension_properties_t) )
 else:
-    _zeDriverGetExtensionProperties_t = CFUNCTYPE( ze_result_t, ze_driver_handle_t, POINTER(c_ulong), POINTER(ze_driver_extension_properties_t) )
+    _zeDriverGetExtensionProperties_t = CFUNCTYPE( ze_result_t, ze_driver_handle_t, POINTER(c_uint32), POINTER(ze_driver_extension_properties_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeDriverGetExtensionFunctionAddress
@@ -5094,14 +4116,6 @@ class _ze_driver_dditable_t(Structure):
         ("pfnRTASFormatCompatibilityCheckExt", c_void_p)                ## _zeDriverRTASFormatCompatibilityCheckExt_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zeDriverRTASFormatCompatibilityCheckExp
-if __use_win_types:
-    _zeDriverRTASFormatCompatibilityCheckExp_t = WINFUNCTYPE( ze_result_t, ze_driver_handle_t, ze_rtas_format_exp_t, ze_rtas_format_exp_t )
-else:
-    _zeDriverRTASFormatCompatibilityCheckExp_t = CFUNCTYPE( ze_result_t, ze_driver_handle_t, ze_rtas_format_exp_t, ze_rtas_format_exp_t )
-
-
 ###############################################################################
 ## @brief Table of DriverExp functions pointers
 class _ze_driver_exp_dditable_t(Structure):
@@ -5112,16 +4126,16 @@ class _ze_driver_exp_dditable_t(Structure):
 ###############################################################################
 ## @brief Function-pointer for zeDeviceGet
 if __use_win_types:
-    _zeDeviceGet_t = WINFUNCTYPE( ze_result_t, ze_driver_handle_t, POINTER(c_ulong), POINTER(ze_device_handle_t) )
+    _zeDeviceGet_t = WINFUNCTYPE( ze_result_t, ze_driver_handle_t, POINTER(c_uint32), POINTER(ze_device_handle_t) )
 else:
-    _zeDeviceGet_t = CFUNCTYPE( ze_result_t, ze_driver_handle_t, POINTER(c_ulong), POINTER(ze_device_handle_t) )
+    _zeDeviceGet_t = CFUNCTYPE( ze_result_t, ze_driver_handle_t, POINTER(c_uint32), POINTER(ze_device_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeDeviceGetSubDevices
 if __use_win_types:
-    _zeDeviceGetSubDevices_t = WINFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_ulong), POINTER(ze_device_handle_t) )
+    _zeDeviceGetSubDevices_t = WINFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_uint32), POINTER(ze_device_handle_t) )
 else:
-    _zeDeviceGetSubDevices_t = CFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_ulong), POINTER(ze_device_handle_t) )
+    _zeDeviceGetSubDevices_t = CFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_uint32), POINTER(ze_device_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeDeviceGetProperties
@@ -5147,16 +4161,16 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeDeviceGetCommandQueueGroupProperties
 if __use_win_types:
-    _zeDeviceGetCommandQueueGroupProperties_t = WINFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_ulong), POINTER(ze_command_queue_group_properties_t) )
+    _zeDeviceGetCommandQueueGroupProperties_t = WINFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_uint32), POINTER(ze_command_queue_group_properties_t) )
 else:
-    _zeDeviceGetCommandQueueGroupProperties_t = CFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_ulong), POINTER(ze_command_queue_group_properties_t) )
+    _zeDeviceGetCommandQueueGroupProperties_t = CFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_uint32), POINTER(ze_command_queue_group_properties_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeDeviceGetMemoryProperties
 if __use_win_types:
-    _zeDeviceGetMemoryProperties_t = WINFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_ulong), POINTER(ze_device_memory_properties_t) )
+    _zeDeviceGetMemoryProperties_t = WINFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_uint32), POINTER(ze_device_memory_properties_t) )
 else:
-    _zeDeviceGetMemoryProperties_t = CFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_ulong), POINTER(ze_device_memory_properties_t) )
+    _zeDeviceGetMemoryProperties_t = CFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_uint32), POINTER(ze_device_memory_properties_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeDeviceGetMemoryAccessProperties
@@ -5168,9 +4182,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeDeviceGetCacheProperties
 if __use_win_types:
-    _zeDeviceGetCacheProperties_t = WINFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_ulong), POINTER(ze_device_cache_properties_t) )
+    _zeDeviceGetCacheProperties_t = WINFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_uint32), POINTER(ze_device_cache_properties_t) )
 else:
-    _zeDeviceGetCacheProperties_t = CFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_ulong), POINTER(ze_device_cache_properties_t) )
+    _zeDeviceGetCacheProperties_t = CFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_uint32), POINTER(ze_device_cache_properties_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeDeviceGetImageProperties
@@ -5210,9 +4224,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeDeviceGetGlobalTimestamps
 if __use_win_types:
-    _zeDeviceGetGlobalTimestamps_t = WINFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_ulonglong), POINTER(c_ulonglong) )
+    _zeDeviceGetGlobalTimestamps_t = WINFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_uint64), POINTER(c_uint64) )
 else:
-    _zeDeviceGetGlobalTimestamps_t = CFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_ulonglong), POINTER(c_ulonglong) )
+    _zeDeviceGetGlobalTimestamps_t = CFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_uint64), POINTER(c_uint64) )
 
 ###############################################################################
 ## @brief Function-pointer for zeDeviceReserveCacheExt
@@ -5259,9 +4273,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeDeviceGetVectorWidthPropertiesExt
 if __use_win_types:
-    _zeDeviceGetVectorWidthPropertiesExt_t = WINFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_ulong), POINTER(ze_device_vector_width_properties_ext_t) )
+    _zeDeviceGetVectorWidthPropertiesExt_t = WINFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_uint32), POINTER(ze_device_vector_width_properties_ext_t) )
 else:
-    _zeDeviceGetVectorWidthPropertiesExt_t = CFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_ulong), POINTER(ze_device_vector_width_properties_ext_t) )
+    _zeDeviceGetVectorWidthPropertiesExt_t = CFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(c_uint32), POINTER(ze_device_vector_width_properties_ext_t) )
 
 
 ###############################################################################
@@ -5292,14 +4306,6 @@ class _ze_device_dditable_t(Structure):
         ("pfnGetVectorWidthPropertiesExt", c_void_p)                    ## _zeDeviceGetVectorWidthPropertiesExt_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zeDeviceGetFabricVertexExp
-if __use_win_types:
-    _zeDeviceGetFabricVertexExp_t = WINFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(ze_fabric_vertex_handle_t) )
-else:
-    _zeDeviceGetFabricVertexExp_t = CFUNCTYPE( ze_result_t, ze_device_handle_t, POINTER(ze_fabric_vertex_handle_t) )
-
-
 ###############################################################################
 ## @brief Table of DeviceExp functions pointers
 class _ze_device_exp_dditable_t(Structure):
@@ -5366,9 +4372,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeContextCreateEx
 if __use_win_types:
-    _zeContextCreateEx_t = WINFUNCTYPE( ze_result_t, ze_driver_handle_t, POINTER(ze_context_desc_t), c_ulong, POINTER(ze_device_handle_t), POINTER(ze_context_handle_t) )
+    _zeContextCreateEx_t = WINFUNCTYPE( ze_result_t, ze_driver_handle_t, POINTER(ze_context_desc_t), c_uint32, POINTER(ze_device_handle_t), POINTER(ze_context_handle_t) )
 else:
-    _zeContextCreateEx_t = CFUNCTYPE( ze_result_t, ze_driver_handle_t, POINTER(ze_context_desc_t), c_ulong, POINTER(ze_device_handle_t), POINTER(ze_context_handle_t) )
+    _zeContextCreateEx_t = CFUNCTYPE( ze_result_t, ze_driver_handle_t, POINTER(ze_context_desc_t), c_uint32, POINTER(ze_device_handle_t), POINTER(ze_context_handle_t) )
 
 
 ###############################################################################
@@ -5403,30 +4409,30 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeCommandQueueExecuteCommandLists
 if __use_win_types:
-    _zeCommandQueueExecuteCommandLists_t = WINFUNCTYPE( ze_result_t, ze_command_queue_handle_t, c_ulong, POINTER(ze_command_list_handle_t), ze_fence_handle_t )
+    _zeCommandQueueExecuteCommandLists_t = WINFUNCTYPE( ze_result_t, ze_command_queue_handle_t, c_uint32, POINTER(ze_command_list_handle_t), ze_fence_handle_t )
 else:
-    _zeCommandQueueExecuteCommandLists_t = CFUNCTYPE( ze_result_t, ze_command_queue_handle_t, c_ulong, POINTER(ze_command_list_handle_t), ze_fence_handle_t )
+    _zeCommandQueueExecuteCommandLists_t = CFUNCTYPE( ze_result_t, ze_command_queue_handle_t, c_uint32, POINTER(ze_command_list_handle_t), ze_fence_handle_t )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandQueueSynchronize
 if __use_win_types:
-    _zeCommandQueueSynchronize_t = WINFUNCTYPE( ze_result_t, ze_command_queue_handle_t, c_ulonglong )
+    _zeCommandQueueSynchronize_t = WINFUNCTYPE( ze_result_t, ze_command_queue_handle_t, c_uint64 )
 else:
-    _zeCommandQueueSynchronize_t = CFUNCTYPE( ze_result_t, ze_command_queue_handle_t, c_ulonglong )
+    _zeCommandQueueSynchronize_t = CFUNCTYPE( ze_result_t, ze_command_queue_handle_t, c_uint64 )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandQueueGetOrdinal
 if __use_win_types:
-    _zeCommandQueueGetOrdinal_t = WINFUNCTYPE( ze_result_t, ze_command_queue_handle_t, POINTER(c_ulong) )
+    _zeCommandQueueGetOrdinal_t = WINFUNCTYPE( ze_result_t, ze_command_queue_handle_t, POINTER(c_uint32) )
 else:
-    _zeCommandQueueGetOrdinal_t = CFUNCTYPE( ze_result_t, ze_command_queue_handle_t, POINTER(c_ulong) )
+    _zeCommandQueueGetOrdinal_t = CFUNCTYPE( ze_result_t, ze_command_queue_handle_t, POINTER(c_uint32) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandQueueGetIndex
 if __use_win_types:
-    _zeCommandQueueGetIndex_t = WINFUNCTYPE( ze_result_t, ze_command_queue_handle_t, POINTER(c_ulong) )
+    _zeCommandQueueGetIndex_t = WINFUNCTYPE( ze_result_t, ze_command_queue_handle_t, POINTER(c_uint32) )
 else:
-    _zeCommandQueueGetIndex_t = CFUNCTYPE( ze_result_t, ze_command_queue_handle_t, POINTER(c_ulong) )
+    _zeCommandQueueGetIndex_t = CFUNCTYPE( ze_result_t, ze_command_queue_handle_t, POINTER(c_uint32) )
 
 
 ###############################################################################
@@ -5479,79 +4485,79 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendWriteGlobalTimestamp
 if __use_win_types:
-    _zeCommandListAppendWriteGlobalTimestamp_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, POINTER(c_ulonglong), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendWriteGlobalTimestamp_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, POINTER(c_uint64), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeCommandListAppendWriteGlobalTimestamp_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, POINTER(c_ulonglong), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendWriteGlobalTimestamp_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, POINTER(c_uint64), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendBarrier
 if __use_win_types:
-    _zeCommandListAppendBarrier_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendBarrier_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeCommandListAppendBarrier_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendBarrier_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendMemoryRangesBarrier
 if __use_win_types:
-    _zeCommandListAppendMemoryRangesBarrier_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulong, POINTER(c_size_t), POINTER(c_void_p), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendMemoryRangesBarrier_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_uint32, POINTER(c_size_t), POINTER(c_void_p), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeCommandListAppendMemoryRangesBarrier_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulong, POINTER(c_size_t), POINTER(c_void_p), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendMemoryRangesBarrier_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_uint32, POINTER(c_size_t), POINTER(c_void_p), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendMemoryCopy
 if __use_win_types:
-    _zeCommandListAppendMemoryCopy_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, c_void_p, c_size_t, ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendMemoryCopy_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, c_void_p, c_size_t, ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeCommandListAppendMemoryCopy_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, c_void_p, c_size_t, ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendMemoryCopy_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, c_void_p, c_size_t, ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendMemoryFill
 if __use_win_types:
-    _zeCommandListAppendMemoryFill_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, c_void_p, c_size_t, c_size_t, ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendMemoryFill_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, c_void_p, c_size_t, c_size_t, ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeCommandListAppendMemoryFill_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, c_void_p, c_size_t, c_size_t, ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendMemoryFill_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, c_void_p, c_size_t, c_size_t, ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendMemoryCopyRegion
 if __use_win_types:
-    _zeCommandListAppendMemoryCopyRegion_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, POINTER(ze_copy_region_t), c_ulong, c_ulong, c_void_p, POINTER(ze_copy_region_t), c_ulong, c_ulong, ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendMemoryCopyRegion_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, POINTER(ze_copy_region_t), c_uint32, c_uint32, c_void_p, POINTER(ze_copy_region_t), c_uint32, c_uint32, ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeCommandListAppendMemoryCopyRegion_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, POINTER(ze_copy_region_t), c_ulong, c_ulong, c_void_p, POINTER(ze_copy_region_t), c_ulong, c_ulong, ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendMemoryCopyRegion_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, POINTER(ze_copy_region_t), c_uint32, c_uint32, c_void_p, POINTER(ze_copy_region_t), c_uint32, c_uint32, ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendMemoryCopyFromContext
 if __use_win_types:
-    _zeCommandListAppendMemoryCopyFromContext_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, ze_context_handle_t, c_void_p, c_size_t, ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendMemoryCopyFromContext_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, ze_context_handle_t, c_void_p, c_size_t, ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeCommandListAppendMemoryCopyFromContext_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, ze_context_handle_t, c_void_p, c_size_t, ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendMemoryCopyFromContext_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, ze_context_handle_t, c_void_p, c_size_t, ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendImageCopy
 if __use_win_types:
-    _zeCommandListAppendImageCopy_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_image_handle_t, ze_image_handle_t, ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendImageCopy_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_image_handle_t, ze_image_handle_t, ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeCommandListAppendImageCopy_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_image_handle_t, ze_image_handle_t, ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendImageCopy_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_image_handle_t, ze_image_handle_t, ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendImageCopyRegion
 if __use_win_types:
-    _zeCommandListAppendImageCopyRegion_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_image_handle_t, ze_image_handle_t, POINTER(ze_image_region_t), POINTER(ze_image_region_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendImageCopyRegion_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_image_handle_t, ze_image_handle_t, POINTER(ze_image_region_t), POINTER(ze_image_region_t), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeCommandListAppendImageCopyRegion_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_image_handle_t, ze_image_handle_t, POINTER(ze_image_region_t), POINTER(ze_image_region_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendImageCopyRegion_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_image_handle_t, ze_image_handle_t, POINTER(ze_image_region_t), POINTER(ze_image_region_t), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendImageCopyToMemory
 if __use_win_types:
-    _zeCommandListAppendImageCopyToMemory_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, ze_image_handle_t, POINTER(ze_image_region_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendImageCopyToMemory_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, ze_image_handle_t, POINTER(ze_image_region_t), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeCommandListAppendImageCopyToMemory_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, ze_image_handle_t, POINTER(ze_image_region_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendImageCopyToMemory_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, ze_image_handle_t, POINTER(ze_image_region_t), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendImageCopyFromMemory
 if __use_win_types:
-    _zeCommandListAppendImageCopyFromMemory_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_image_handle_t, c_void_p, POINTER(ze_image_region_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendImageCopyFromMemory_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_image_handle_t, c_void_p, POINTER(ze_image_region_t), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeCommandListAppendImageCopyFromMemory_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_image_handle_t, c_void_p, POINTER(ze_image_region_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendImageCopyFromMemory_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_image_handle_t, c_void_p, POINTER(ze_image_region_t), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendMemoryPrefetch
@@ -5577,9 +4583,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendWaitOnEvents
 if __use_win_types:
-    _zeCommandListAppendWaitOnEvents_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendWaitOnEvents_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeCommandListAppendWaitOnEvents_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendWaitOnEvents_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendEventReset
@@ -5591,58 +4597,58 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendQueryKernelTimestamps
 if __use_win_types:
-    _zeCommandListAppendQueryKernelTimestamps_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulong, POINTER(ze_event_handle_t), c_void_p, POINTER(c_size_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendQueryKernelTimestamps_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_uint32, POINTER(ze_event_handle_t), c_void_p, POINTER(c_size_t), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeCommandListAppendQueryKernelTimestamps_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulong, POINTER(ze_event_handle_t), c_void_p, POINTER(c_size_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendQueryKernelTimestamps_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_uint32, POINTER(ze_event_handle_t), c_void_p, POINTER(c_size_t), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendLaunchKernel
 if __use_win_types:
-    _zeCommandListAppendLaunchKernel_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_kernel_handle_t, POINTER(ze_group_count_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendLaunchKernel_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_kernel_handle_t, POINTER(ze_group_count_t), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeCommandListAppendLaunchKernel_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_kernel_handle_t, POINTER(ze_group_count_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendLaunchKernel_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_kernel_handle_t, POINTER(ze_group_count_t), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendLaunchCooperativeKernel
 if __use_win_types:
-    _zeCommandListAppendLaunchCooperativeKernel_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_kernel_handle_t, POINTER(ze_group_count_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendLaunchCooperativeKernel_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_kernel_handle_t, POINTER(ze_group_count_t), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeCommandListAppendLaunchCooperativeKernel_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_kernel_handle_t, POINTER(ze_group_count_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendLaunchCooperativeKernel_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_kernel_handle_t, POINTER(ze_group_count_t), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendLaunchKernelIndirect
 if __use_win_types:
-    _zeCommandListAppendLaunchKernelIndirect_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_kernel_handle_t, POINTER(ze_group_count_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendLaunchKernelIndirect_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_kernel_handle_t, POINTER(ze_group_count_t), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeCommandListAppendLaunchKernelIndirect_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_kernel_handle_t, POINTER(ze_group_count_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendLaunchKernelIndirect_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_kernel_handle_t, POINTER(ze_group_count_t), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendLaunchMultipleKernelsIndirect
 if __use_win_types:
-    _zeCommandListAppendLaunchMultipleKernelsIndirect_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulong, POINTER(ze_kernel_handle_t), POINTER(c_ulong), POINTER(ze_group_count_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendLaunchMultipleKernelsIndirect_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_uint32, POINTER(ze_kernel_handle_t), POINTER(c_uint32), POINTER(ze_group_count_t), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeCommandListAppendLaunchMultipleKernelsIndirect_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulong, POINTER(ze_kernel_handle_t), POINTER(c_ulong), POINTER(ze_group_count_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendLaunchMultipleKernelsIndirect_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_uint32, POINTER(ze_kernel_handle_t), POINTER(c_uint32), POINTER(ze_group_count_t), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendImageCopyToMemoryExt
 if __use_win_types:
-    _zeCommandListAppendImageCopyToMemoryExt_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, ze_image_handle_t, POINTER(ze_image_region_t), c_ulong, c_ulong, ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendImageCopyToMemoryExt_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, ze_image_handle_t, POINTER(ze_image_region_t), c_uint32, c_uint32, ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeCommandListAppendImageCopyToMemoryExt_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, ze_image_handle_t, POINTER(ze_image_region_t), c_ulong, c_ulong, ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendImageCopyToMemoryExt_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_void_p, ze_image_handle_t, POINTER(ze_image_region_t), c_uint32, c_uint32, ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendImageCopyFromMemoryExt
 if __use_win_types:
-    _zeCommandListAppendImageCopyFromMemoryExt_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_image_handle_t, c_void_p, POINTER(ze_image_region_t), c_ulong, c_ulong, ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendImageCopyFromMemoryExt_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_image_handle_t, c_void_p, POINTER(ze_image_region_t), c_uint32, c_uint32, ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeCommandListAppendImageCopyFromMemoryExt_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_image_handle_t, c_void_p, POINTER(ze_image_region_t), c_ulong, c_ulong, ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendImageCopyFromMemoryExt_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, ze_image_handle_t, c_void_p, POINTER(ze_image_region_t), c_uint32, c_uint32, ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListHostSynchronize
 if __use_win_types:
-    _zeCommandListHostSynchronize_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulonglong )
+    _zeCommandListHostSynchronize_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_uint64 )
 else:
-    _zeCommandListHostSynchronize_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulonglong )
+    _zeCommandListHostSynchronize_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_uint64 )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListGetDeviceHandle
@@ -5661,16 +4667,16 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeCommandListGetOrdinal
 if __use_win_types:
-    _zeCommandListGetOrdinal_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, POINTER(c_ulong) )
+    _zeCommandListGetOrdinal_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, POINTER(c_uint32) )
 else:
-    _zeCommandListGetOrdinal_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, POINTER(c_ulong) )
+    _zeCommandListGetOrdinal_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, POINTER(c_uint32) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListImmediateGetIndex
 if __use_win_types:
-    _zeCommandListImmediateGetIndex_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, POINTER(c_ulong) )
+    _zeCommandListImmediateGetIndex_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, POINTER(c_uint32) )
 else:
-    _zeCommandListImmediateGetIndex_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, POINTER(c_ulong) )
+    _zeCommandListImmediateGetIndex_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, POINTER(c_uint32) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListIsImmediate
@@ -5682,16 +4688,16 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendSignalExternalSemaphoreExt
 if __use_win_types:
-    _zeCommandListAppendSignalExternalSemaphoreExt_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulong, POINTER(ze_external_semaphore_ext_handle_t), POINTER(ze_external_semaphore_signal_params_ext_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendSignalExternalSemaphoreExt_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_uint32, POINTER(ze_external_semaphore_ext_handle_t), POINTER(ze_external_semaphore_signal_params_ext_t), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeCommandListAppendSignalExternalSemaphoreExt_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulong, POINTER(ze_external_semaphore_ext_handle_t), POINTER(ze_external_semaphore_signal_params_ext_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendSignalExternalSemaphoreExt_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_uint32, POINTER(ze_external_semaphore_ext_handle_t), POINTER(ze_external_semaphore_signal_params_ext_t), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeCommandListAppendWaitExternalSemaphoreExt
 if __use_win_types:
-    _zeCommandListAppendWaitExternalSemaphoreExt_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulong, POINTER(ze_external_semaphore_ext_handle_t), POINTER(ze_external_semaphore_wait_params_ext_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendWaitExternalSemaphoreExt_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_uint32, POINTER(ze_external_semaphore_ext_handle_t), POINTER(ze_external_semaphore_wait_params_ext_t), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zeCommandListAppendWaitExternalSemaphoreExt_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulong, POINTER(ze_external_semaphore_ext_handle_t), POINTER(ze_external_semaphore_wait_params_ext_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zeCommandListAppendWaitExternalSemaphoreExt_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_uint32, POINTER(ze_external_semaphore_ext_handle_t), POINTER(ze_external_semaphore_wait_params_ext_t), ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 
 ###############################################################################
@@ -5736,63 +4742,6 @@ class _ze_command_list_dditable_t(Structure):
         ("pfnAppendWaitExternalSemaphoreExt", c_void_p)                 ## _zeCommandListAppendWaitExternalSemaphoreExt_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zeCommandListCreateCloneExp
-if __use_win_types:
-    _zeCommandListCreateCloneExp_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, POINTER(ze_command_list_handle_t) )
-else:
-    _zeCommandListCreateCloneExp_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, POINTER(ze_command_list_handle_t) )
-
-###############################################################################
-## @brief Function-pointer for zeCommandListImmediateAppendCommandListsExp
-if __use_win_types:
-    _zeCommandListImmediateAppendCommandListsExp_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulong, POINTER(ze_command_list_handle_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
-else:
-    _zeCommandListImmediateAppendCommandListsExp_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulong, POINTER(ze_command_list_handle_t), ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
-
-###############################################################################
-## @brief Function-pointer for zeCommandListGetNextCommandIdExp
-if __use_win_types:
-    _zeCommandListGetNextCommandIdExp_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, POINTER(ze_mutable_command_id_exp_desc_t), POINTER(c_ulonglong) )
-else:
-    _zeCommandListGetNextCommandIdExp_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, POINTER(ze_mutable_command_id_exp_desc_t), POINTER(c_ulonglong) )
-
-###############################################################################
-## @brief Function-pointer for zeCommandListUpdateMutableCommandsExp
-if __use_win_types:
-    _zeCommandListUpdateMutableCommandsExp_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, POINTER(ze_mutable_commands_exp_desc_t) )
-else:
-    _zeCommandListUpdateMutableCommandsExp_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, POINTER(ze_mutable_commands_exp_desc_t) )
-
-###############################################################################
-## @brief Function-pointer for zeCommandListUpdateMutableCommandSignalEventExp
-if __use_win_types:
-    _zeCommandListUpdateMutableCommandSignalEventExp_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulonglong, ze_event_handle_t )
-else:
-    _zeCommandListUpdateMutableCommandSignalEventExp_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulonglong, ze_event_handle_t )
-
-###############################################################################
-## @brief Function-pointer for zeCommandListUpdateMutableCommandWaitEventsExp
-if __use_win_types:
-    _zeCommandListUpdateMutableCommandWaitEventsExp_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulonglong, c_ulong, POINTER(ze_event_handle_t) )
-else:
-    _zeCommandListUpdateMutableCommandWaitEventsExp_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulonglong, c_ulong, POINTER(ze_event_handle_t) )
-
-###############################################################################
-## @brief Function-pointer for zeCommandListGetNextCommandIdWithKernelsExp
-if __use_win_types:
-    _zeCommandListGetNextCommandIdWithKernelsExp_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, POINTER(ze_mutable_command_id_exp_desc_t), c_ulong, POINTER(ze_kernel_handle_t), POINTER(c_ulonglong) )
-else:
-    _zeCommandListGetNextCommandIdWithKernelsExp_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, POINTER(ze_mutable_command_id_exp_desc_t), c_ulong, POINTER(ze_kernel_handle_t), POINTER(c_ulonglong) )
-
-###############################################################################
-## @brief Function-pointer for zeCommandListUpdateMutableCommandKernelsExp
-if __use_win_types:
-    _zeCommandListUpdateMutableCommandKernelsExp_t = WINFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulong, POINTER(c_ulonglong), POINTER(ze_kernel_handle_t) )
-else:
-    _zeCommandListUpdateMutableCommandKernelsExp_t = CFUNCTYPE( ze_result_t, ze_command_list_handle_t, c_ulong, POINTER(c_ulonglong), POINTER(ze_kernel_handle_t) )
-
-
 ###############################################################################
 ## @brief Table of CommandListExp functions pointers
 class _ze_command_list_exp_dditable_t(Structure):
@@ -5854,28 +4803,6 @@ class _ze_image_dditable_t(Structure):
         ("pfnViewCreateExt", c_void_p)                                  ## _zeImageViewCreateExt_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zeImageGetMemoryPropertiesExp
-if __use_win_types:
-    _zeImageGetMemoryPropertiesExp_t = WINFUNCTYPE( ze_result_t, ze_image_handle_t, POINTER(ze_image_memory_properties_exp_t) )
-else:
-    _zeImageGetMemoryPropertiesExp_t = CFUNCTYPE( ze_result_t, ze_image_handle_t, POINTER(ze_image_memory_properties_exp_t) )
-
-###############################################################################
-## @brief Function-pointer for zeImageViewCreateExp
-if __use_win_types:
-    _zeImageViewCreateExp_t = WINFUNCTYPE( ze_result_t, ze_context_handle_t, ze_device_handle_t, POINTER(ze_image_desc_t), ze_image_handle_t, POINTER(ze_image_handle_t) )
-else:
-    _zeImageViewCreateExp_t = CFUNCTYPE( ze_result_t, ze_context_handle_t, ze_device_handle_t, POINTER(ze_image_desc_t), ze_image_handle_t, POINTER(ze_image_handle_t) )
-
-###############################################################################
-## @brief Function-pointer for zeImageGetDeviceOffsetExp
-if __use_win_types:
-    _zeImageGetDeviceOffsetExp_t = WINFUNCTYPE( ze_result_t, ze_image_handle_t, POINTER(c_ulonglong) )
-else:
-    _zeImageGetDeviceOffsetExp_t = CFUNCTYPE( ze_result_t, ze_image_handle_t, POINTER(c_ulonglong) )
-
-
 ###############################################################################
 ## @brief Table of ImageExp functions pointers
 class _ze_image_exp_dditable_t(Structure):
@@ -5965,9 +4892,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeMemGetPitchFor2dImage
 if __use_win_types:
-    _zeMemGetPitchFor2dImage_t = WINFUNCTYPE( ze_result_t, ze_context_handle_t, ze_device_handle_t, c_size_t, c_size_t, c_int, * )
+    _zeMemGetPitchFor2dImage_t = WINFUNCTYPE( ze_result_t, ze_context_handle_t, ze_device_handle_t, c_size_t, c_size_t, c_uint, POINTER(c_size_t) )
 else:
-    _zeMemGetPitchFor2dImage_t = CFUNCTYPE( ze_result_t, ze_context_handle_t, ze_device_handle_t, c_size_t, c_size_t, c_int, * )
+    _zeMemGetPitchFor2dImage_t = CFUNCTYPE( ze_result_t, ze_context_handle_t, ze_device_handle_t, c_size_t, c_size_t, c_uint, POINTER(c_size_t) )
 
 
 ###############################################################################
@@ -5988,35 +4915,6 @@ class _ze_mem_dditable_t(Structure):
         ("pfnGetPitchFor2dImage", c_void_p)                             ## _zeMemGetPitchFor2dImage_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zeMemGetIpcHandleFromFileDescriptorExp
-if __use_win_types:
-    _zeMemGetIpcHandleFromFileDescriptorExp_t = WINFUNCTYPE( ze_result_t, ze_context_handle_t, c_ulonglong, POINTER(ze_ipc_mem_handle_t) )
-else:
-    _zeMemGetIpcHandleFromFileDescriptorExp_t = CFUNCTYPE( ze_result_t, ze_context_handle_t, c_ulonglong, POINTER(ze_ipc_mem_handle_t) )
-
-###############################################################################
-## @brief Function-pointer for zeMemGetFileDescriptorFromIpcHandleExp
-if __use_win_types:
-    _zeMemGetFileDescriptorFromIpcHandleExp_t = WINFUNCTYPE( ze_result_t, ze_context_handle_t, ze_ipc_mem_handle_t, POINTER(c_ulonglong) )
-else:
-    _zeMemGetFileDescriptorFromIpcHandleExp_t = CFUNCTYPE( ze_result_t, ze_context_handle_t, ze_ipc_mem_handle_t, POINTER(c_ulonglong) )
-
-###############################################################################
-## @brief Function-pointer for zeMemSetAtomicAccessAttributeExp
-if __use_win_types:
-    _zeMemSetAtomicAccessAttributeExp_t = WINFUNCTYPE( ze_result_t, ze_context_handle_t, ze_device_handle_t, c_void_p, c_size_t, ze_memory_atomic_attr_exp_flags_t )
-else:
-    _zeMemSetAtomicAccessAttributeExp_t = CFUNCTYPE( ze_result_t, ze_context_handle_t, ze_device_handle_t, c_void_p, c_size_t, ze_memory_atomic_attr_exp_flags_t )
-
-###############################################################################
-## @brief Function-pointer for zeMemGetAtomicAccessAttributeExp
-if __use_win_types:
-    _zeMemGetAtomicAccessAttributeExp_t = WINFUNCTYPE( ze_result_t, ze_context_handle_t, ze_device_handle_t, c_void_p, c_size_t, POINTER(ze_memory_atomic_attr_exp_flags_t) )
-else:
-    _zeMemGetAtomicAccessAttributeExp_t = CFUNCTYPE( ze_result_t, ze_context_handle_t, ze_device_handle_t, c_void_p, c_size_t, POINTER(ze_memory_atomic_attr_exp_flags_t) )
-
-
 ###############################################################################
 ## @brief Table of MemExp functions pointers
 class _ze_mem_exp_dditable_t(Structure):
@@ -6044,9 +4942,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeFenceHostSynchronize
 if __use_win_types:
-    _zeFenceHostSynchronize_t = WINFUNCTYPE( ze_result_t, ze_fence_handle_t, c_ulonglong )
+    _zeFenceHostSynchronize_t = WINFUNCTYPE( ze_result_t, ze_fence_handle_t, c_uint64 )
 else:
-    _zeFenceHostSynchronize_t = CFUNCTYPE( ze_result_t, ze_fence_handle_t, c_ulonglong )
+    _zeFenceHostSynchronize_t = CFUNCTYPE( ze_result_t, ze_fence_handle_t, c_uint64 )
 
 ###############################################################################
 ## @brief Function-pointer for zeFenceQueryStatus
@@ -6077,9 +4975,9 @@ class _ze_fence_dditable_t(Structure):
 ###############################################################################
 ## @brief Function-pointer for zeEventPoolCreate
 if __use_win_types:
-    _zeEventPoolCreate_t = WINFUNCTYPE( ze_result_t, ze_context_handle_t, POINTER(ze_event_pool_desc_t), c_ulong, POINTER(ze_device_handle_t), POINTER(ze_event_pool_handle_t) )
+    _zeEventPoolCreate_t = WINFUNCTYPE( ze_result_t, ze_context_handle_t, POINTER(ze_event_pool_desc_t), c_uint32, POINTER(ze_device_handle_t), POINTER(ze_event_pool_handle_t) )
 else:
-    _zeEventPoolCreate_t = CFUNCTYPE( ze_result_t, ze_context_handle_t, POINTER(ze_event_pool_desc_t), c_ulong, POINTER(ze_device_handle_t), POINTER(ze_event_pool_handle_t) )
+    _zeEventPoolCreate_t = CFUNCTYPE( ze_result_t, ze_context_handle_t, POINTER(ze_event_pool_desc_t), c_uint32, POINTER(ze_device_handle_t), POINTER(ze_event_pool_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeEventPoolDestroy
@@ -6169,9 +5067,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeEventHostSynchronize
 if __use_win_types:
-    _zeEventHostSynchronize_t = WINFUNCTYPE( ze_result_t, ze_event_handle_t, c_ulonglong )
+    _zeEventHostSynchronize_t = WINFUNCTYPE( ze_result_t, ze_event_handle_t, c_uint64 )
 else:
-    _zeEventHostSynchronize_t = CFUNCTYPE( ze_result_t, ze_event_handle_t, c_ulonglong )
+    _zeEventHostSynchronize_t = CFUNCTYPE( ze_result_t, ze_event_handle_t, c_uint64 )
 
 ###############################################################################
 ## @brief Function-pointer for zeEventQueryStatus
@@ -6197,9 +5095,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeEventQueryKernelTimestampsExt
 if __use_win_types:
-    _zeEventQueryKernelTimestampsExt_t = WINFUNCTYPE( ze_result_t, ze_event_handle_t, ze_device_handle_t, POINTER(c_ulong), POINTER(ze_event_query_kernel_timestamps_results_ext_properties_t) )
+    _zeEventQueryKernelTimestampsExt_t = WINFUNCTYPE( ze_result_t, ze_event_handle_t, ze_device_handle_t, POINTER(c_uint32), POINTER(ze_event_query_kernel_timestamps_results_ext_properties_t) )
 else:
-    _zeEventQueryKernelTimestampsExt_t = CFUNCTYPE( ze_result_t, ze_event_handle_t, ze_device_handle_t, POINTER(c_ulong), POINTER(ze_event_query_kernel_timestamps_results_ext_properties_t) )
+    _zeEventQueryKernelTimestampsExt_t = CFUNCTYPE( ze_result_t, ze_event_handle_t, ze_device_handle_t, POINTER(c_uint32), POINTER(ze_event_query_kernel_timestamps_results_ext_properties_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeEventGetEventPool
@@ -6240,14 +5138,6 @@ class _ze_event_dditable_t(Structure):
         ("pfnGetWaitScope", c_void_p)                                   ## _zeEventGetWaitScope_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zeEventQueryTimestampsExp
-if __use_win_types:
-    _zeEventQueryTimestampsExp_t = WINFUNCTYPE( ze_result_t, ze_event_handle_t, ze_device_handle_t, POINTER(c_ulong), POINTER(ze_kernel_timestamp_result_t) )
-else:
-    _zeEventQueryTimestampsExp_t = CFUNCTYPE( ze_result_t, ze_event_handle_t, ze_device_handle_t, POINTER(c_ulong), POINTER(ze_kernel_timestamp_result_t) )
-
-
 ###############################################################################
 ## @brief Table of EventExp functions pointers
 class _ze_event_exp_dditable_t(Structure):
@@ -6272,9 +5162,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeModuleDynamicLink
 if __use_win_types:
-    _zeModuleDynamicLink_t = WINFUNCTYPE( ze_result_t, c_ulong, POINTER(ze_module_handle_t), POINTER(ze_module_build_log_handle_t) )
+    _zeModuleDynamicLink_t = WINFUNCTYPE( ze_result_t, c_uint32, POINTER(ze_module_handle_t), POINTER(ze_module_build_log_handle_t) )
 else:
-    _zeModuleDynamicLink_t = CFUNCTYPE( ze_result_t, c_ulong, POINTER(ze_module_handle_t), POINTER(ze_module_build_log_handle_t) )
+    _zeModuleDynamicLink_t = CFUNCTYPE( ze_result_t, c_uint32, POINTER(ze_module_handle_t), POINTER(ze_module_build_log_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zeModuleGetNativeBinary
@@ -6293,9 +5183,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeModuleGetKernelNames
 if __use_win_types:
-    _zeModuleGetKernelNames_t = WINFUNCTYPE( ze_result_t, ze_module_handle_t, POINTER(c_ulong), POINTER(c_char_p) )
+    _zeModuleGetKernelNames_t = WINFUNCTYPE( ze_result_t, ze_module_handle_t, POINTER(c_uint32), POINTER(c_char_p) )
 else:
-    _zeModuleGetKernelNames_t = CFUNCTYPE( ze_result_t, ze_module_handle_t, POINTER(c_ulong), POINTER(c_char_p) )
+    _zeModuleGetKernelNames_t = CFUNCTYPE( ze_result_t, ze_module_handle_t, POINTER(c_uint32), POINTER(c_char_p) )
 
 ###############################################################################
 ## @brief Function-pointer for zeModuleGetProperties
@@ -6314,9 +5204,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeModuleInspectLinkageExt
 if __use_win_types:
-    _zeModuleInspectLinkageExt_t = WINFUNCTYPE( ze_result_t, POINTER(ze_linkage_inspection_ext_desc_t), c_ulong, POINTER(ze_module_handle_t), POINTER(ze_module_build_log_handle_t) )
+    _zeModuleInspectLinkageExt_t = WINFUNCTYPE( ze_result_t, POINTER(ze_linkage_inspection_ext_desc_t), c_uint32, POINTER(ze_module_handle_t), POINTER(ze_module_build_log_handle_t) )
 else:
-    _zeModuleInspectLinkageExt_t = CFUNCTYPE( ze_result_t, POINTER(ze_linkage_inspection_ext_desc_t), c_ulong, POINTER(ze_module_handle_t), POINTER(ze_module_build_log_handle_t) )
+    _zeModuleInspectLinkageExt_t = CFUNCTYPE( ze_result_t, POINTER(ze_linkage_inspection_ext_desc_t), c_uint32, POINTER(ze_module_handle_t), POINTER(ze_module_build_log_handle_t) )
 
 
 ###############################################################################
@@ -6381,30 +5271,30 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeKernelSetGroupSize
 if __use_win_types:
-    _zeKernelSetGroupSize_t = WINFUNCTYPE( ze_result_t, ze_kernel_handle_t, c_ulong, c_ulong, c_ulong )
+    _zeKernelSetGroupSize_t = WINFUNCTYPE( ze_result_t, ze_kernel_handle_t, c_uint32, c_uint32, c_uint32 )
 else:
-    _zeKernelSetGroupSize_t = CFUNCTYPE( ze_result_t, ze_kernel_handle_t, c_ulong, c_ulong, c_ulong )
+    _zeKernelSetGroupSize_t = CFUNCTYPE( ze_result_t, ze_kernel_handle_t, c_uint32, c_uint32, c_uint32 )
 
 ###############################################################################
 ## @brief Function-pointer for zeKernelSuggestGroupSize
 if __use_win_types:
-    _zeKernelSuggestGroupSize_t = WINFUNCTYPE( ze_result_t, ze_kernel_handle_t, c_ulong, c_ulong, c_ulong, POINTER(c_ulong), POINTER(c_ulong), POINTER(c_ulong) )
+    _zeKernelSuggestGroupSize_t = WINFUNCTYPE( ze_result_t, ze_kernel_handle_t, c_uint32, c_uint32, c_uint32, POINTER(c_uint32), POINTER(c_uint32), POINTER(c_uint32) )
 else:
-    _zeKernelSuggestGroupSize_t = CFUNCTYPE( ze_result_t, ze_kernel_handle_t, c_ulong, c_ulong, c_ulong, POINTER(c_ulong), POINTER(c_ulong), POINTER(c_ulong) )
+    _zeKernelSuggestGroupSize_t = CFUNCTYPE( ze_result_t, ze_kernel_handle_t, c_uint32, c_uint32, c_uint32, POINTER(c_uint32), POINTER(c_uint32), POINTER(c_uint32) )
 
 ###############################################################################
 ## @brief Function-pointer for zeKernelSuggestMaxCooperativeGroupCount
 if __use_win_types:
-    _zeKernelSuggestMaxCooperativeGroupCount_t = WINFUNCTYPE( ze_result_t, ze_kernel_handle_t, POINTER(c_ulong) )
+    _zeKernelSuggestMaxCooperativeGroupCount_t = WINFUNCTYPE( ze_result_t, ze_kernel_handle_t, POINTER(c_uint32) )
 else:
-    _zeKernelSuggestMaxCooperativeGroupCount_t = CFUNCTYPE( ze_result_t, ze_kernel_handle_t, POINTER(c_ulong) )
+    _zeKernelSuggestMaxCooperativeGroupCount_t = CFUNCTYPE( ze_result_t, ze_kernel_handle_t, POINTER(c_uint32) )
 
 ###############################################################################
 ## @brief Function-pointer for zeKernelSetArgumentValue
 if __use_win_types:
-    _zeKernelSetArgumentValue_t = WINFUNCTYPE( ze_result_t, ze_kernel_handle_t, c_ulong, c_size_t, c_void_p )
+    _zeKernelSetArgumentValue_t = WINFUNCTYPE( ze_result_t, ze_kernel_handle_t, c_uint32, c_size_t, c_void_p )
 else:
-    _zeKernelSetArgumentValue_t = CFUNCTYPE( ze_result_t, ze_kernel_handle_t, c_ulong, c_size_t, c_void_p )
+    _zeKernelSetArgumentValue_t = CFUNCTYPE( ze_result_t, ze_kernel_handle_t, c_uint32, c_size_t, c_void_p )
 
 ###############################################################################
 ## @brief Function-pointer for zeKernelSetIndirectAccess
@@ -6423,9 +5313,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zeKernelGetSourceAttributes
 if __use_win_types:
-    _zeKernelGetSourceAttributes_t = WINFUNCTYPE( ze_result_t, ze_kernel_handle_t, POINTER(c_ulong), POINTER(c_char_p) )
+    _zeKernelGetSourceAttributes_t = WINFUNCTYPE( ze_result_t, ze_kernel_handle_t, POINTER(c_uint32), POINTER(c_char_p) )
 else:
-    _zeKernelGetSourceAttributes_t = CFUNCTYPE( ze_result_t, ze_kernel_handle_t, POINTER(c_ulong), POINTER(c_char_p) )
+    _zeKernelGetSourceAttributes_t = CFUNCTYPE( ze_result_t, ze_kernel_handle_t, POINTER(c_uint32), POINTER(c_char_p) )
 
 ###############################################################################
 ## @brief Function-pointer for zeKernelGetProperties
@@ -6460,28 +5350,6 @@ class _ze_kernel_dditable_t(Structure):
         ("pfnGetName", c_void_p)                                        ## _zeKernelGetName_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zeKernelSetGlobalOffsetExp
-if __use_win_types:
-    _zeKernelSetGlobalOffsetExp_t = WINFUNCTYPE( ze_result_t, ze_kernel_handle_t, c_ulong, c_ulong, c_ulong )
-else:
-    _zeKernelSetGlobalOffsetExp_t = CFUNCTYPE( ze_result_t, ze_kernel_handle_t, c_ulong, c_ulong, c_ulong )
-
-###############################################################################
-## @brief Function-pointer for zeKernelSchedulingHintExp
-if __use_win_types:
-    _zeKernelSchedulingHintExp_t = WINFUNCTYPE( ze_result_t, ze_kernel_handle_t, POINTER(ze_scheduling_hint_exp_desc_t) )
-else:
-    _zeKernelSchedulingHintExp_t = CFUNCTYPE( ze_result_t, ze_kernel_handle_t, POINTER(ze_scheduling_hint_exp_desc_t) )
-
-###############################################################################
-## @brief Function-pointer for zeKernelGetBinaryExp
-if __use_win_types:
-    _zeKernelGetBinaryExp_t = WINFUNCTYPE( ze_result_t, ze_kernel_handle_t, POINTER(c_size_t), POINTER(c_ubyte) )
-else:
-    _zeKernelGetBinaryExp_t = CFUNCTYPE( ze_result_t, ze_kernel_handle_t, POINTER(c_size_t), POINTER(c_ubyte) )
-
-
 ###############################################################################
 ## @brief Table of KernelExp functions pointers
 class _ze_kernel_exp_dditable_t(Structure):
@@ -6600,35 +5468,6 @@ class _ze_virtual_mem_dditable_t(Structure):
         ("pfnGetAccessAttribute", c_void_p)                             ## _zeVirtualMemGetAccessAttribute_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zeFabricVertexGetExp
-if __use_win_types:
-    _zeFabricVertexGetExp_t = WINFUNCTYPE( ze_result_t, ze_driver_handle_t, POINTER(c_ulong), POINTER(ze_fabric_vertex_handle_t) )
-else:
-    _zeFabricVertexGetExp_t = CFUNCTYPE( ze_result_t, ze_driver_handle_t, POINTER(c_ulong), POINTER(ze_fabric_vertex_handle_t) )
-
-###############################################################################
-## @brief Function-pointer for zeFabricVertexGetSubVerticesExp
-if __use_win_types:
-    _zeFabricVertexGetSubVerticesExp_t = WINFUNCTYPE( ze_result_t, ze_fabric_vertex_handle_t, POINTER(c_ulong), POINTER(ze_fabric_vertex_handle_t) )
-else:
-    _zeFabricVertexGetSubVerticesExp_t = CFUNCTYPE( ze_result_t, ze_fabric_vertex_handle_t, POINTER(c_ulong), POINTER(ze_fabric_vertex_handle_t) )
-
-###############################################################################
-## @brief Function-pointer for zeFabricVertexGetPropertiesExp
-if __use_win_types:
-    _zeFabricVertexGetPropertiesExp_t = WINFUNCTYPE( ze_result_t, ze_fabric_vertex_handle_t, POINTER(ze_fabric_vertex_exp_properties_t) )
-else:
-    _zeFabricVertexGetPropertiesExp_t = CFUNCTYPE( ze_result_t, ze_fabric_vertex_handle_t, POINTER(ze_fabric_vertex_exp_properties_t) )
-
-###############################################################################
-## @brief Function-pointer for zeFabricVertexGetDeviceExp
-if __use_win_types:
-    _zeFabricVertexGetDeviceExp_t = WINFUNCTYPE( ze_result_t, ze_fabric_vertex_handle_t, POINTER(ze_device_handle_t) )
-else:
-    _zeFabricVertexGetDeviceExp_t = CFUNCTYPE( ze_result_t, ze_fabric_vertex_handle_t, POINTER(ze_device_handle_t) )
-
-
 ###############################################################################
 ## @brief Table of FabricVertexExp functions pointers
 class _ze_fabric_vertex_exp_dditable_t(Structure):
@@ -6639,28 +5478,6 @@ class _ze_fabric_vertex_exp_dditable_t(Structure):
         ("pfnGetDeviceExp", c_void_p)                                   ## _zeFabricVertexGetDeviceExp_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zeFabricEdgeGetExp
-if __use_win_types:
-    _zeFabricEdgeGetExp_t = WINFUNCTYPE( ze_result_t, ze_fabric_vertex_handle_t, ze_fabric_vertex_handle_t, POINTER(c_ulong), POINTER(ze_fabric_edge_handle_t) )
-else:
-    _zeFabricEdgeGetExp_t = CFUNCTYPE( ze_result_t, ze_fabric_vertex_handle_t, ze_fabric_vertex_handle_t, POINTER(c_ulong), POINTER(ze_fabric_edge_handle_t) )
-
-###############################################################################
-## @brief Function-pointer for zeFabricEdgeGetVerticesExp
-if __use_win_types:
-    _zeFabricEdgeGetVerticesExp_t = WINFUNCTYPE( ze_result_t, ze_fabric_edge_handle_t, POINTER(ze_fabric_vertex_handle_t), POINTER(ze_fabric_vertex_handle_t) )
-else:
-    _zeFabricEdgeGetVerticesExp_t = CFUNCTYPE( ze_result_t, ze_fabric_edge_handle_t, POINTER(ze_fabric_vertex_handle_t), POINTER(ze_fabric_vertex_handle_t) )
-
-###############################################################################
-## @brief Function-pointer for zeFabricEdgeGetPropertiesExp
-if __use_win_types:
-    _zeFabricEdgeGetPropertiesExp_t = WINFUNCTYPE( ze_result_t, ze_fabric_edge_handle_t, POINTER(ze_fabric_edge_exp_properties_t) )
-else:
-    _zeFabricEdgeGetPropertiesExp_t = CFUNCTYPE( ze_result_t, ze_fabric_edge_handle_t, POINTER(ze_fabric_edge_exp_properties_t) )
-
-
 ###############################################################################
 ## @brief Table of FabricEdgeExp functions pointers
 class _ze_fabric_edge_exp_dditable_t(Structure):
@@ -6705,490 +5522,466 @@ class _ze_dditable_t(Structure):
         ("FabricEdgeExp", _ze_fabric_edge_exp_dditable_t)
     ]
 
+###############################################################################
+## @brief Returns the named function-pointer type, defining it if deferred
+def _get_functype(name):
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
+###############################################################################
+## @brief Experimental definitions deferred to _ze_exp until first accessed
+_deferred = frozenset([
+    "_zeCommandListCreateCloneExp_t",
+    "_zeCommandListGetNextCommandIdExp_t",
+    "_zeCommandListGetNextCommandIdWithKernelsExp_t",
+    "_zeCommandListImmediateAppendCommandListsExp_t",
+    "_zeCommandListUpdateMutableCommandKernelsExp_t",
+    "_zeCommandListUpdateMutableCommandSignalEventExp_t",
+    "_zeCommandListUpdateMutableCommandWaitEventsExp_t",
+    "_zeCommandListUpdateMutableCommandsExp_t",
+    "_zeDeviceGetFabricVertexExp_t",
+    "_zeDriverRTASFormatCompatibilityCheckExp_t",
+    "_zeEventQueryTimestampsExp_t",
+    "_zeFabricEdgeGetExp_t",
+    "_zeFabricEdgeGetPropertiesExp_t",
+    "_zeFabricEdgeGetVerticesExp_t",
+    "_zeFabricVertexGetDeviceExp_t",
+    "_zeFabricVertexGetExp_t",
+    "_zeFabricVertexGetPropertiesExp_t",
+    "_zeFabricVertexGetSubVerticesExp_t",
+    "_zeImageGetDeviceOffsetExp_t",
+    "_zeImageGetMemoryPropertiesExp_t",
+    "_zeImageViewCreateExp_t",
+    "_zeKernelGetBinaryExp_t",
+    "_zeKernelSchedulingHintExp_t",
+    "_zeKernelSetGlobalOffsetExp_t",
+    "_zeMemGetAtomicAccessAttributeExp_t",
+    "_zeMemGetFileDescriptorFromIpcHandleExp_t",
+    "_zeMemGetIpcHandleFromFileDescriptorExp_t",
+    "_zeMemSetAtomicAccessAttributeExp_t",
+    "_zeRTASBuilderBuildExp_t",
+    "_zeRTASBuilderCreateExp_t",
+    "_zeRTASBuilderDestroyExp_t",
+    "_zeRTASBuilderGetBuildPropertiesExp_t",
+    "_zeRTASParallelOperationCreateExp_t",
+    "_zeRTASParallelOperationDestroyExp_t",
+    "_zeRTASParallelOperationGetPropertiesExp_t",
+    "_zeRTASParallelOperationJoinExp_t",
+    "ze_context_power_saving_hint_exp_desc_t",
+    "ze_copy_bandwidth_exp_properties_t",
+    "ze_device_p2p_bandwidth_exp_properties_t",
+    "ze_device_pitched_alloc_exp_properties_t",
+    "ze_event_pool_counter_based_exp_desc_t",
+    "ze_fabric_edge_exp_properties_t",
+    "ze_fabric_vertex_exp_properties_t",
+    "ze_fabric_vertex_pci_exp_address_t",
+    "ze_image_bindless_exp_desc_t",
+    "ze_image_memory_properties_exp_t",
+    "ze_image_pitched_exp_desc_t",
+    "ze_image_view_planar_exp_desc_t",
+    "ze_memory_sub_allocations_exp_properties_t",
+    "ze_module_program_exp_desc_t",
+    "ze_mutable_command_id_exp_desc_t",
+    "ze_mutable_command_list_exp_desc_t",
+    "ze_mutable_command_list_exp_properties_t",
+    "ze_mutable_commands_exp_desc_t",
+    "ze_mutable_global_offset_exp_desc_t",
+    "ze_mutable_graph_argument_exp_desc_t",
+    "ze_mutable_group_count_exp_desc_t",
+    "ze_mutable_group_size_exp_desc_t",
+    "ze_mutable_kernel_argument_exp_desc_t",
+    "ze_relaxed_allocation_limits_exp_desc_t",
+    "ze_rtas_aabb_exp_t",
+    "ze_rtas_builder_build_op_exp_desc_t",
+    "ze_rtas_builder_build_quality_hint_exp_t",
+    "ze_rtas_builder_build_quality_hint_exp_v",
+    "ze_rtas_builder_exp_desc_t",
+    "ze_rtas_builder_exp_handle_t",
+    "ze_rtas_builder_exp_properties_t",
+    "ze_rtas_builder_geometry_info_exp_t",
+    "ze_rtas_builder_geometry_type_exp_t",
+    "ze_rtas_builder_geometry_type_exp_v",
+    "ze_rtas_builder_input_data_format_exp_t",
+    "ze_rtas_builder_input_data_format_exp_v",
+    "ze_rtas_builder_instance_geometry_info_exp_t",
+    "ze_rtas_builder_packed_geometry_exp_flags_t",
+    "ze_rtas_builder_packed_geometry_type_exp_t",
+    "ze_rtas_builder_packed_input_data_format_exp_t",
+    "ze_rtas_builder_packed_instance_exp_flags_t",
+    "ze_rtas_builder_procedural_geometry_info_exp_t",
+    "ze_rtas_builder_quads_geometry_info_exp_t",
+    "ze_rtas_builder_triangles_geometry_info_exp_t",
+    "ze_rtas_device_exp_properties_t",
+    "ze_rtas_float3_exp_t",
+    "ze_rtas_format_exp_t",
+    "ze_rtas_format_exp_v",
+    "ze_rtas_geometry_aabbs_cb_exp_t",
+    "ze_rtas_geometry_aabbs_exp_cb_params_t",
+    "ze_rtas_parallel_operation_exp_handle_t",
+    "ze_rtas_parallel_operation_exp_properties_t",
+    "ze_rtas_quad_indices_uint32_exp_t",
+    "ze_rtas_transform_float3x4_aligned_column_major_exp_t",
+    "ze_rtas_transform_float3x4_column_major_exp_t",
+    "ze_rtas_transform_float3x4_row_major_exp_t",
+    "ze_rtas_triangle_indices_uint32_exp_t",
+    "ze_scheduling_hint_exp_desc_t",
+    "ze_scheduling_hint_exp_properties_t",
+])
+
+###############################################################################
+## @brief Defines the deferred experimental definitions on first access
+def __getattr__(name):
+    if name in _deferred:
+        from . import _ze_exp
+        for deferred in _deferred:
+            globals()[deferred] = getattr(_ze_exp, deferred)
+        return globals()[name]
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+###############################################################################
+## @brief Lists the deferred experimental definitions before they are defined
+def __dir__():
+    return sorted(set(globals()) | _deferred)
+
 ###############################################################################
 ## @brief ze device-driver interfaces
 class ZE_DDI:
-    def __init__(self, version : ze_api_version_t):
+    ## @brief Map of table name to (proc-address table getter, table type)
+    _tables = {
+        "RTASBuilder" : ("zeGetRTASBuilderProcAddrTable", _ze_rtas_builder_dditable_t),
+        "RTASBuilderExp" : ("zeGetRTASBuilderExpProcAddrTable", _ze_rtas_builder_exp_dditable_t),
+        "RTASParallelOperation" : ("zeGetRTASParallelOperationProcAddrTable", _ze_rtas_parallel_operation_dditable_t),
+        "RTASParallelOperationExp" : ("zeGetRTASParallelOperationExpProcAddrTable", _ze_rtas_parallel_operation_exp_dditable_t),
+        "Global" : ("zeGetGlobalProcAddrTable", _ze_global_dditable_t),
+        "Driver" : ("zeGetDriverProcAddrTable", _ze_driver_dditable_t),
+        "DriverExp" : ("zeGetDriverExpProcAddrTable", _ze_driver_exp_dditable_t),
+        "Device" : ("zeGetDeviceProcAddrTable", _ze_device_dditable_t),
+        "DeviceExp" : ("zeGetDeviceExpProcAddrTable", _ze_device_exp_dditable_t),
+        "Context" : ("zeGetContextProcAddrTable", _ze_context_dditable_t),
+        "CommandQueue" : ("zeGetCommandQueueProcAddrTable", _ze_command_queue_dditable_t),
+        "CommandList" : ("zeGetCommandListProcAddrTable", _ze_command_list_dditable_t),
+        "CommandListExp" : ("zeGetCommandListExpProcAddrTable", _ze_command_list_exp_dditable_t),
+        "Image" : ("zeGetImageProcAddrTable", _ze_image_dditable_t),
+        "ImageExp" : ("zeGetImageExpProcAddrTable", _ze_image_exp_dditable_t),
+        "Mem" : ("zeGetMemProcAddrTable", _ze_mem_dditable_t),
+        "MemExp" : ("zeGetMemExpProcAddrTable", _ze_mem_exp_dditable_t),
+        "Fence" : ("zeGetFenceProcAddrTable", _ze_fence_dditable_t),
+        "EventPool" : ("zeGetEventPoolProcAddrTable", _ze_event_pool_dditable_t),
+        "Event" : ("zeGetEventProcAddrTable", _ze_event_dditable_t),
+        "EventExp" : ("zeGetEventExpProcAddrTable", _ze_event_exp_dditable_t),
+        "Module" : ("zeGetModuleProcAddrTable", _ze_module_dditable_t),
+        "ModuleBuildLog" : ("zeGetModuleBuildLogProcAddrTable", _ze_module_build_log_dditable_t),
+        "Kernel" : ("zeGetKernelProcAddrTable", _ze_kernel_dditable_t),
+        "KernelExp" : ("zeGetKernelExpProcAddrTable", _ze_kernel_exp_dditable_t),
+        "Sampler" : ("zeGetSamplerProcAddrTable", _ze_sampler_dditable_t),
+        "PhysicalMem" : ("zeGetPhysicalMemProcAddrTable", _ze_physical_mem_dditable_t),
+        "VirtualMem" : ("zeGetVirtualMemProcAddrTable", _ze_virtual_mem_dditable_t),
+        "FabricVertexExp" : ("zeGetFabricVertexExpProcAddrTable", _ze_fabric_vertex_exp_dditable_t),
+        "FabricEdgeExp" : ("zeGetFabricEdgeExpProcAddrTable", _ze_fabric_edge_exp_dditable_t),
+    }
+
+    ## @brief Map of function name to (table name, table member, function-pointer type name)
+    _functions = {
+        "zeRTASBuilderCreateExt" : ("RTASBuilder", "pfnCreateExt", "_zeRTASBuilderCreateExt_t"),
+        "zeRTASBuilderGetBuildPropertiesExt" : ("RTASBuilder", "pfnGetBuildPropertiesExt", "_zeRTASBuilderGetBuildPropertiesExt_t"),
+        "zeRTASBuilderBuildExt" : ("RTASBuilder", "pfnBuildExt", "_zeRTASBuilderBuildExt_t"),
+        "zeRTASBuilderCommandListAppendCopyExt" : ("RTASBuilder", "pfnCommandListAppendCopyExt", "_zeRTASBuilderCommandListAppendCopyExt_t"),
+        "zeRTASBuilderDestroyExt" : ("RTASBuilder", "pfnDestroyExt", "_zeRTASBuilderDestroyExt_t"),
+        "zeRTASBuilderCreateExp" : ("RTASBuilderExp", "pfnCreateExp", "_zeRTASBuilderCreateExp_t"),
+        "zeRTASBuilderGetBuildPropertiesExp" : ("RTASBuilderExp", "pfnGetBuildPropertiesExp", "_zeRTASBuilderGetBuildPropertiesExp_t"),
+        "zeRTASBuilderBuildExp" : ("RTASBuilderExp", "pfnBuildExp", "_zeRTASBuilderBuildExp_t"),
+        "zeRTASBuilderDestroyExp" : ("RTASBuilderExp", "pfnDestroyExp", "_zeRTASBuilderDestroyExp_t"),
+        "zeRTASParallelOperationCreateExt" : ("RTASParallelOperation", "pfnCreateExt", "_zeRTASParallelOperationCreateExt_t"),
+        "zeRTASParallelOperationGetPropertiesExt" : ("RTASParallelOperation", "pfnGetPropertiesExt", "_zeRTASParallelOperationGetPropertiesExt_t"),
+        "zeRTASParallelOperationJoinExt" : ("RTASParallelOperation", "pfnJoinExt", "_zeRTASParallelOperationJoinExt_t"),
+        "zeRTASParallelOperationDestroyExt" : ("RTASParallelOperation", "pfnDestroyExt", "_zeRTASParallelOperationDestroyExt_t"),
+        "zeRTASParallelOperationCreateExp" : ("RTASParallelOperationExp", "pfnCreateExp", "_zeRTASParallelOperationCreateExp_t"),
+        "zeRTASParallelOperationGetPropertiesExp" : ("RTASParallelOperationExp", "pfnGetPropertiesExp", "_zeRTASParallelOperationGetPropertiesExp_t"),
+        "zeRTASParallelOperationJoinExp" : ("RTASParallelOperationExp", "pfnJoinExp", "_zeRTASParallelOperationJoinExp_t"),
+        "zeRTASParallelOperationDestroyExp" : ("RTASParallelOperationExp", "pfnDestroyExp", "_zeRTASParallelOperationDestroyExp_t"),
+        "zeInit" : ("Global", "pfnInit", "_zeInit_t"),
+        "zeInitDrivers" : ("Global", "pfnInitDrivers", "_zeInitDrivers_t"),
+        "zeDriverGet" : ("Driver", "pfnGet", "_zeDriverGet_t"),
+        "zeDriverGetApiVersion" : ("Driver", "pfnGetApiVersion", "_zeDriverGetApiVersion_t"),
+        "zeDriverGetProperties" : ("Driver", "pfnGetProperties", "_zeDriverGetProperties_t"),
+        "zeDriverGetIpcProperties" : ("Driver", "pfnGetIpcProperties", "_zeDriverGetIpcProperties_t"),
+        "zeDriverGetExtensionProperties" : ("Driver", "pfnGetExtensionProperties", "_zeDriverGetExtensionProperties_t"),
+        "zeDriverGetExtensionFunctionAddress" : ("Driver", "pfnGetExtensionFunctionAddress", "_zeDriverGetExtensionFunctionAddress_t"),
+        "zeDriverGetLastErrorDescription" : ("Driver", "pfnGetLastErrorDescription", "_zeDriverGetLastErrorDescription_t"),
+        "zeDriverRTASFormatCompatibilityCheckExt" : ("Driver", "pfnRTASFormatCompatibilityCheckExt", "_zeDriverRTASFormatCompatibilityCheckExt_t"),
+        "zeDriverRTASFormatCompatibilityCheckExp" : ("DriverExp", "pfnRTASFormatCompatibilityCheckExp", "_zeDriverRTASFormatCompatibilityCheckExp_t"),
+        "zeDeviceGet" : ("Device", "pfnGet", "_zeDeviceGet_t"),
+        "zeDeviceGetSubDevices" : ("Device", "pfnGetSubDevices", "_zeDeviceGetSubDevices_t"),
+        "zeDeviceGetProperties" : ("Device", "pfnGetProperties", "_zeDeviceGetProperties_t"),
+        "zeDeviceGetComputeProperties" : ("Device", "pfnGetComputeProperties", "_zeDeviceGetComputeProperties_t"),
+        "zeDeviceGetModuleProperties" : ("Device", "pfnGetModuleProperties", "_zeDeviceGetModuleProperties_t"),
+        "zeDeviceGetCommandQueueGroupProperties" : ("Device", "pfnGetCommandQueueGroupProperties", "_zeDeviceGetCommandQueueGroupProperties_t"),
+        "zeDeviceGetMemoryProperties" : ("Device", "pfnGetMemoryProperties", "_zeDeviceGetMemoryProperties_t"),
+        "zeDeviceGetMemoryAccessProperties" : ("Device", "pfnGetMemoryAccessProperties", "_zeDeviceGetMemoryAccessProperties_t"),
+        "zeDeviceGetCacheProperties" : ("Device", "pfnGetCacheProperties", "_zeDeviceGetCacheProperties_t"),
+        "zeDeviceGetImageProperties" : ("Device", "pfnGetImageProperties", "_zeDeviceGetImageProperties_t"),
+        "zeDeviceGetExternalMemoryProperties" : ("Device", "pfnGetExternalMemoryProperties", "_zeDeviceGetExternalMemoryProperties_t"),
+        "zeDeviceGetP2PProperties" : ("Device", "pfnGetP2PProperties", "_zeDeviceGetP2PProperties_t"),
+        "zeDeviceCanAccessPeer" : ("Device", "pfnCanAccessPeer", "_zeDeviceCanAccessPeer_t"),
+        "zeDeviceGetStatus" : ("Device", "pfnGetStatus", "_zeDeviceGetStatus_t"),
+        "zeDeviceGetGlobalTimestamps" : ("Device", "pfnGetGlobalTimestamps", "_zeDeviceGetGlobalTimestamps_t"),
+        "zeDeviceReserveCacheExt" : ("Device", "pfnReserveCacheExt", "_zeDeviceReserveCacheExt_t"),
+        "zeDeviceSetCacheAdviceExt" : ("Device", "pfnSetCacheAdviceExt", "_zeDeviceSetCacheAdviceExt_t"),
+        "zeDevicePciGetPropertiesExt" : ("Device", "pfnPciGetPropertiesExt", "_zeDevicePciGetPropertiesExt_t"),
+        "zeDeviceGetRootDevice" : ("Device", "pfnGetRootDevice", "_zeDeviceGetRootDevice_t"),
+        "zeDeviceImportExternalSemaphoreExt" : ("Device", "pfnImportExternalSemaphoreExt", "_zeDeviceImportExternalSemaphoreExt_t"),
+        "zeDeviceReleaseExternalSemaphoreExt" : ("Device", "pfnReleaseExternalSemaphoreExt", "_zeDeviceReleaseExternalSemaphoreExt_t"),
+        "zeDeviceGetVectorWidthPropertiesExt" : ("Device", "pfnGetVectorWidthPropertiesExt", "_zeDeviceGetVectorWidthPropertiesExt_t"),
+        "zeDeviceGetFabricVertexExp" : ("DeviceExp", "pfnGetFabricVertexExp", "_zeDeviceGetFabricVertexExp_t"),
+        "zeContextCreate" : ("Context", "pfnCreate", "_zeContextCreate_t"),
+        "zeContextDestroy" : ("Context", "pfnDestroy", "_zeContextDestroy_t"),
+        "zeContextGetStatus" : ("Context", "pfnGetStatus", "_zeContextGetStatus_t"),
+        "zeContextSystemBarrier" : ("Context", "pfnSystemBarrier", "_zeContextSystemBarrier_t"),
+        "zeContextMakeMemoryResident" : ("Context", "pfnMakeMemoryResident", "_zeContextMakeMemoryResident_t"),
+        "zeContextEvictMemory" : ("Context", "pfnEvictMemory", "_zeContextEvictMemory_t"),
+        "zeContextMakeImageResident" : ("Context", "pfnMakeImageResident", "_zeContextMakeImageResident_t"),
+        "zeContextEvictImage" : ("Context", "pfnEvictImage", "_zeContextEvictImage_t"),
+        "zeContextCreateEx" : ("Context", "pfnCreateEx", "_zeContextCreateEx_t"),
+        "zeCommandQueueCreate" : ("CommandQueue", "pfnCreate", "_zeCommandQueueCreate_t"),
+        "zeCommandQueueDestroy" : ("CommandQueue", "pfnDestroy", "_zeCommandQueueDestroy_t"),
+        "zeCommandQueueExecuteCommandLists" : ("CommandQueue", "pfnExecuteCommandLists", "_zeCommandQueueExecuteCommandLists_t"),
+        "zeCommandQueueSynchronize" : ("CommandQueue", "pfnSynchronize", "_zeCommandQueueSynchronize_t"),
+        "zeCommandQueueGetOrdinal" : ("CommandQueue", "pfnGetOrdinal", "_zeCommandQueueGetOrdinal_t"),
+        "zeCommandQueueGetIndex" : ("CommandQueue", "pfnGetIndex", "_zeCommandQueueGetIndex_t"),
+        "zeCommandListCreate" : ("CommandList", "pfnCreate", "_zeCommandListCreate_t"),
+        "zeCommandListCreateImmediate" : ("CommandList", "pfnCreateImmediate", "_zeCommandListCreateImmediate_t"),
+        "zeCommandListDestroy" : ("CommandList", "pfnDestroy", "_zeCommandListDestroy_t"),
+        "zeCommandListClose" : ("CommandList", "pfnClose", "_zeCommandListClose_t"),
+        "zeCommandListReset" : ("CommandList", "pfnReset", "_zeCommandListReset_t"),
+        "zeCommandListAppendWriteGlobalTimestamp" : ("CommandList", "pfnAppendWriteGlobalTimestamp", "_zeCommandListAppendWriteGlobalTimestamp_t"),
+        "zeCommandListAppendBarrier" : ("CommandList", "pfnAppendBarrier", "_zeCommandListAppendBarrier_t"),
+        "zeCommandListAppendMemoryRangesBarrier" : ("CommandList", "pfnAppendMemoryRangesBarrier", "_zeCommandListAppendMemoryRangesBarrier_t"),
+        "zeCommandListAppendMemoryCopy" : ("CommandList", "pfnAppendMemoryCopy", "_zeCommandListAppendMemoryCopy_t"),
+        "zeCommandListAppendMemoryFill" : ("CommandList", "pfnAppendMemoryFill", "_zeCommandListAppendMemoryFill_t"),
+        "zeCommandListAppendMemoryCopyRegion" : ("CommandList", "pfnAppendMemoryCopyRegion", "_zeCommandListAppendMemoryCopyRegion_t"),
+        "zeCommandListAppendMemoryCopyFromContext" : ("CommandList", "pfnAppendMemoryCopyFromContext", "_zeCommandListAppendMemoryCopyFromContext_t"),
+        "zeCommandListAppendImageCopy" : ("CommandList", "pfnAppendImageCopy", "_zeCommandListAppendImageCopy_t"),
+        "zeCommandListAppendImageCopyRegion" : ("CommandList", "pfnAppendImageCopyRegion", "_zeCommandListAppendImageCopyRegion_t"),
+        "zeCommandListAppendImageCopyToMemory" : ("CommandList", "pfnAppendImageCopyToMemory", "_zeCommandListAppendImageCopyToMemory_t"),
+        "zeCommandListAppendImageCopyFromMemory" : ("CommandList", "pfnAppendImageCopyFromMemory", "_zeCommandListAppendImageCopyFromMemory_t"),
+        "zeCommandListAppendMemoryPrefetch" : ("CommandList", "pfnAppendMemoryPrefetch", "_zeCommandListAppendMemoryPrefetch_t"),
+        "zeCommandListAppendMemAdvise" : ("CommandList", "pfnAppendMemAdvise", "_zeCommandListAppendMemAdvise_t"),
+        "zeCommandListAppendSignalEvent" : ("CommandList", "pfnAppendSignalEvent", "_zeCommandListAppendSignalEvent_t"),
+        "zeCommandListAppendWaitOnEvents" : ("CommandList", "pfnAppendWaitOnEvents", "_zeCommandListAppendWaitOnEvents_t"),
+        "zeCommandListAppendEventReset" : ("CommandList", "pfnAppendEventReset", "_zeCommandListAppendEventReset_t"),
+        "zeCommandListAppendQueryKernelTimestamps" : ("CommandList", "pfnAppendQueryKernelTimestamps", "_zeCommandListAppendQueryKernelTimestamps_t"),
+        "zeCommandListAppendLaunchKernel" : ("CommandList", "pfnAppendLaunchKernel", "_zeCommandListAppendLaunchKernel_t"),
+        "zeCommandListAppendLaunchCooperativeKernel" : ("CommandList", "pfnAppendLaunchCooperativeKernel", "_zeCommandListAppendLaunchCooperativeKernel_t"),
+        "zeCommandListAppendLaunchKernelIndirect" : ("CommandList", "pfnAppendLaunchKernelIndirect", "_zeCommandListAppendLaunchKernelIndirect_t"),
+        "zeCommandListAppendLaunchMultipleKernelsIndirect" : ("CommandList", "pfnAppendLaunchMultipleKernelsIndirect", "_zeCommandListAppendLaunchMultipleKernelsIndirect_t"),
+        "zeCommandListAppendImageCopyToMemoryExt" : ("CommandList", "pfnAppendImageCopyToMemoryExt", "_zeCommandListAppendImageCopyToMemoryExt_t"),
+        "zeCommandListAppendImageCopyFromMemoryExt" : ("CommandList", "pfnAppendImageCopyFromMemoryExt", "_zeCommandListAppendImageCopyFromMemoryExt_t"),
+        "zeCommandListHostSynchronize" : ("CommandList", "pfnHostSynchronize", "_zeCommandListHostSynchronize_t"),
+        "zeCommandListGetDeviceHandle" : ("CommandList", "pfnGetDeviceHandle", "_zeCommandListGetDeviceHandle_t"),
+        "zeCommandListGetContextHandle" : ("CommandList", "pfnGetContextHandle", "_zeCommandListGetContextHandle_t"),
+        "zeCommandListGetOrdinal" : ("CommandList", "pfnGetOrdinal", "_zeCommandListGetOrdinal_t"),
+        "zeCommandListImmediateGetIndex" : ("CommandList", "pfnImmediateGetIndex", "_zeCommandListImmediateGetIndex_t"),
+        "zeCommandListIsImmediate" : ("CommandList", "pfnIsImmediate", "_zeCommandListIsImmediate_t"),
+        "zeCommandListAppendSignalExternalSemaphoreExt" : ("CommandList", "pfnAppendSignalExternalSemaphoreExt", "_zeCommandListAppendSignalExternalSemaphoreExt_t"),
+        "zeCommandListAppendWaitExternalSemaphoreExt" : ("CommandList", "pfnAppendWaitExternalSemaphoreExt", "_zeCommandListAppendWaitExternalSemaphoreExt_t"),
+        "zeCommandListCreateCloneExp" : ("CommandListExp", "pfnCreateCloneExp", "_zeCommandListCreateCloneExp_t"),
+        "zeCommandListImmediateAppendCommandListsExp" : ("CommandListExp", "pfnImmediateAppendCommandListsExp", "_zeCommandListImmediateAppendCommandListsExp_t"),
+        "zeCommandListGetNextCommandIdExp" : ("CommandListExp", "pfnGetNextCommandIdExp", "_zeCommandListGetNextCommandIdExp_t"),
+        "zeCommandListUpdateMutableCommandsExp" : ("CommandListExp", "pfnUpdateMutableCommandsExp", "_zeCommandListUpdateMutableCommandsExp_t"),
+        "zeCommandListUpdateMutableCommandSignalEventExp" : ("CommandListExp", "pfnUpdateMutableCommandSignalEventExp", "_zeCommandListUpdateMutableCommandSignalEventExp_t"),
+        "zeCommandListUpdateMutableCommandWaitEventsExp" : ("CommandListExp", "pfnUpdateMutableCommandWaitEventsExp", "_zeCommandListUpdateMutableCommandWaitEventsExp_t"),
+        "zeCommandListGetNextCommandIdWithKernelsExp" : ("CommandListExp", "pfnGetNextCommandIdWithKernelsExp", "_zeCommandListGetNextCommandIdWithKernelsExp_t"),
+        "zeCommandListUpdateMutableCommandKernelsExp" : ("CommandListExp", "pfnUpdateMutableCommandKernelsExp", "_zeCommandListUpdateMutableCommandKernelsExp_t"),
+        "zeImageGetProperties" : ("Image", "pfnGetProperties", "_zeImageGetProperties_t"),
+        "zeImageCreate" : ("Image", "pfnCreate", "_zeImageCreate_t"),
+        "zeImageDestroy" : ("Image", "pfnDestroy", "_zeImageDestroy_t"),
+        "zeImageGetAllocPropertiesExt" : ("Image", "pfnGetAllocPropertiesExt", "_zeImageGetAllocPropertiesExt_t"),
+        "zeImageViewCreateExt" : ("Image", "pfnViewCreateExt", "_zeImageViewCreateExt_t"),
+        "zeImageGetMemoryPropertiesExp" : ("ImageExp", "pfnGetMemoryPropertiesExp", "_zeImageGetMemoryPropertiesExp_t"),
+        "zeImageViewCreateExp" : ("ImageExp", "pfnViewCreateExp", "_zeImageViewCreateExp_t"),
+        "zeImageGetDeviceOffsetExp" : ("ImageExp", "pfnGetDeviceOffsetExp", "_zeImageGetDeviceOffsetExp_t"),
+        "zeMemAllocShared" : ("Mem", "pfnAllocShared", "_zeMemAllocShared_t"),
+        "zeMemAllocDevice" : ("Mem", "pfnAllocDevice", "_zeMemAllocDevice_t"),
+        "zeMemAllocHost" : ("Mem", "pfnAllocHost", "_zeMemAllocHost_t"),
+        "zeMemFree" : ("Mem", "pfnFree", "_zeMemFree_t"),
+        "zeMemGetAllocProperties" : ("Mem", "pfnGetAllocProperties", "_zeMemGetAllocProperties_t"),
+        "zeMemGetAddressRange" : ("Mem", "pfnGetAddressRange", "_zeMemGetAddressRange_t"),
+        "zeMemGetIpcHandle" : ("Mem", "pfnGetIpcHandle", "_zeMemGetIpcHandle_t"),
+        "zeMemOpenIpcHandle" : ("Mem", "pfnOpenIpcHandle", "_zeMemOpenIpcHandle_t"),
+        "zeMemCloseIpcHandle" : ("Mem", "pfnCloseIpcHandle", "_zeMemCloseIpcHandle_t"),
+        "zeMemFreeExt" : ("Mem", "pfnFreeExt", "_zeMemFreeExt_t"),
+        "zeMemPutIpcHandle" : ("Mem", "pfnPutIpcHandle", "_zeMemPutIpcHandle_t"),
+        "zeMemGetPitchFor2dImage" : ("Mem", "pfnGetPitchFor2dImage", "_zeMemGetPitchFor2dImage_t"),
+        "zeMemGetIpcHandleFromFileDescriptorExp" : ("MemExp", "pfnGetIpcHandleFromFileDescriptorExp", "_zeMemGetIpcHandleFromFileDescriptorExp_t"),
+        "zeMemGetFileDescriptorFromIpcHandleExp" : ("MemExp", "pfnGetFileDescriptorFromIpcHandleExp", "_zeMemGetFileDescriptorFromIpcHandleExp_t"),
+        "zeMemSetAtomicAccessAttributeExp" : ("MemExp", "pfnSetAtomicAccessAttributeExp", "_zeMemSetAtomicAccessAttributeExp_t"),
+        "zeMemGetAtomicAccessAttributeExp" : ("MemExp", "pfnGetAtomicAccessAttributeExp", "_zeMemGetAtomicAccessAttributeExp_t"),
+        "zeFenceCreate" : ("Fence", "pfnCreate", "_zeFenceCreate_t"),
+        "zeFenceDestroy" : ("Fence", "pfnDestroy", "_zeFenceDestroy_t"),
+        "zeFenceHostSynchronize" : ("Fence", "pfnHostSynchronize", "_zeFenceHostSynchronize_t"),
+        "zeFenceQueryStatus" : ("Fence", "pfnQueryStatus", "_zeFenceQueryStatus_t"),
+        "zeFenceReset" : ("Fence", "pfnReset", "_zeFenceReset_t"),
+        "zeEventPoolCreate" : ("EventPool", "pfnCreate", "_zeEventPoolCreate_t"),
+        "zeEventPoolDestroy" : ("EventPool", "pfnDestroy", "_zeEventPoolDestroy_t"),
+        "zeEventPoolGetIpcHandle" : ("EventPool", "pfnGetIpcHandle", "_zeEventPoolGetIpcHandle_t"),
+        "zeEventPoolOpenIpcHandle" : ("EventPool", "pfnOpenIpcHandle", "_zeEventPoolOpenIpcHandle_t"),
+        "zeEventPoolCloseIpcHandle" : ("EventPool", "pfnCloseIpcHandle", "_zeEventPoolCloseIpcHandle_t"),
+        "zeEventPoolPutIpcHandle" : ("EventPool", "pfnPutIpcHandle", "_zeEventPoolPutIpcHandle_t"),
+        "zeEventPoolGetContextHandle" : ("EventPool", "pfnGetContextHandle", "_zeEventPoolGetContextHandle_t"),
+        "zeEventPoolGetFlags" : ("EventPool", "pfnGetFlags", "_zeEventPoolGetFlags_t"),
+        "zeEventCreate" : ("Event", "pfnCreate", "_zeEventCreate_t"),
+        "zeEventDestroy" : ("Event", "pfnDestroy", "_zeEventDestroy_t"),
+        "zeEventHostSignal" : ("Event", "pfnHostSignal", "_zeEventHostSignal_t"),
+        "zeEventHostSynchronize" : ("Event", "pfnHostSynchronize", "_zeEventHostSynchronize_t"),
+        "zeEventQueryStatus" : ("Event", "pfnQueryStatus", "_zeEventQueryStatus_t"),
+        "zeEventHostReset" : ("Event", "pfnHostReset", "_zeEventHostReset_t"),
+        "zeEventQueryKernelTimestamp" : ("Event", "pfnQueryKernelTimestamp", "_zeEventQueryKernelTimestamp_t"),
+        "zeEventQueryKernelTimestampsExt" : ("Event", "pfnQueryKernelTimestampsExt", "_zeEventQueryKernelTimestampsExt_t"),
+        "zeEventGetEventPool" : ("Event", "pfnGetEventPool", "_zeEventGetEventPool_t"),
+        "zeEventGetSignalScope" : ("Event", "pfnGetSignalScope", "_zeEventGetSignalScope_t"),
+        "zeEventGetWaitScope" : ("Event", "pfnGetWaitScope", "_zeEventGetWaitScope_t"),
+        "zeEventQueryTimestampsExp" : ("EventExp", "pfnQueryTimestampsExp", "_zeEventQueryTimestampsExp_t"),
+        "zeModuleCreate" : ("Module", "pfnCreate", "_zeModuleCreate_t"),
+        "zeModuleDestroy" : ("Module", "pfnDestroy", "_zeModuleDestroy_t"),
+        "zeModuleDynamicLink" : ("Module", "pfnDynamicLink", "_zeModuleDynamicLink_t"),
+        "zeModuleGetNativeBinary" : ("Module", "pfnGetNativeBinary", "_zeModuleGetNativeBinary_t"),
+        "zeModuleGetGlobalPointer" : ("Module", "pfnGetGlobalPointer", "_zeModuleGetGlobalPointer_t"),
+        "zeModuleGetKernelNames" : ("Module", "pfnGetKernelNames", "_zeModuleGetKernelNames_t"),
+        "zeModuleGetProperties" : ("Module", "pfnGetProperties", "_zeModuleGetProperties_t"),
+        "zeModuleGetFunctionPointer" : ("Module", "pfnGetFunctionPointer", "_zeModuleGetFunctionPointer_t"),
+        "zeModuleInspectLinkageExt" : ("Module", "pfnInspectLinkageExt", "_zeModuleInspectLinkageExt_t"),
+        "zeModuleBuildLogDestroy" : ("ModuleBuildLog", "pfnDestroy", "_zeModuleBuildLogDestroy_t"),
+        "zeModuleBuildLogGetString" : ("ModuleBuildLog", "pfnGetString", "_zeModuleBuildLogGetString_t"),
+        "zeKernelCreate" : ("Kernel", "pfnCreate", "_zeKernelCreate_t"),
+        "zeKernelDestroy" : ("Kernel", "pfnDestroy", "_zeKernelDestroy_t"),
+        "zeKernelSetCacheConfig" : ("Kernel", "pfnSetCacheConfig", "_zeKernelSetCacheConfig_t"),
+        "zeKernelSetGroupSize" : ("Kernel", "pfnSetGroupSize", "_zeKernelSetGroupSize_t"),
+        "zeKernelSuggestGroupSize" : ("Kernel", "pfnSuggestGroupSize", "_zeKernelSuggestGroupSize_t"),
+        "zeKernelSuggestMaxCooperativeGroupCount" : ("Kernel", "pfnSuggestMaxCooperativeGroupCount", "_zeKernelSuggestMaxCooperativeGroupCount_t"),
+        "zeKernelSetArgumentValue" : ("Kernel", "pfnSetArgumentValue", "_zeKernelSetArgumentValue_t"),
+        "zeKernelSetIndirectAccess" : ("Kernel", "pfnSetIndirectAccess", "_zeKernelSetIndirectAccess_t"),
+        "zeKernelGetIndirectAccess" : ("Kernel", "pfnGetIndirectAccess", "_zeKernelGetIndirectAccess_t"),
+        "zeKernelGetSourceAttributes" : ("Kernel", "pfnGetSourceAttributes", "_zeKernelGetSourceAttributes_t"),
+        "zeKernelGetProperties" : ("Kernel", "pfnGetProperties", "_zeKernelGetProperties_t"),
+        "zeKernelGetName" : ("Kernel", "pfnGetName", "_zeKernelGetName_t"),
+        "zeKernelSetGlobalOffsetExp" : ("KernelExp", "pfnSetGlobalOffsetExp", "_zeKernelSetGlobalOffsetExp_t"),
+        "zeKernelSchedulingHintExp" : ("KernelExp", "pfnSchedulingHintExp", "_zeKernelSchedulingHintExp_t"),
+        "zeKernelGetBinaryExp" : ("KernelExp", "pfnGetBinaryExp", "_zeKernelGetBinaryExp_t"),
+        "zeSamplerCreate" : ("Sampler", "pfnCreate", "_zeSamplerCreate_t"),
+        "zeSamplerDestroy" : ("Sampler", "pfnDestroy", "_zeSamplerDestroy_t"),
+        "zePhysicalMemCreate" : ("PhysicalMem", "pfnCreate", "_zePhysicalMemCreate_t"),
+        "zePhysicalMemDestroy" : ("PhysicalMem", "pfnDestroy", "_zePhysicalMemDestroy_t"),
+        "zeVirtualMemReserve" : ("VirtualMem", "pfnReserve", "_zeVirtualMemReserve_t"),
+        "zeVirtualMemFree" : ("VirtualMem", "pfnFree", "_zeVirtualMemFree_t"),
+        "zeVirtualMemQueryPageSize" : ("VirtualMem", "pfnQueryPageSize", "_zeVirtualMemQueryPageSize_t"),
+        "zeVirtualMemMap" : ("VirtualMem", "pfnMap", "_zeVirtualMemMap_t"),
+        "zeVirtualMemUnmap" : ("VirtualMem", "pfnUnmap", "_zeVirtualMemUnmap_t"),
+        "zeVirtualMemSetAccessAttribute" : ("VirtualMem", "pfnSetAccessAttribute", "_zeVirtualMemSetAccessAttribute_t"),
+        "zeVirtualMemGetAccessAttribute" : ("VirtualMem", "pfnGetAccessAttribute", "_zeVirtualMemGetAccessAttribute_t"),
+        "zeFabricVertexGetExp" : ("FabricVertexExp", "pfnGetExp", "_zeFabricVertexGetExp_t"),
+        "zeFabricVertexGetSubVerticesExp" : ("FabricVertexExp", "pfnGetSubVerticesExp", "_zeFabricVertexGetSubVerticesExp_t"),
+        "zeFabricVertexGetPropertiesExp" : ("FabricVertexExp", "pfnGetPropertiesExp", "_zeFabricVertexGetPropertiesExp_t"),
+        "zeFabricVertexGetDeviceExp" : ("FabricVertexExp", "pfnGetDeviceExp", "_zeFabricVertexGetDeviceExp_t"),
+        "zeFabricEdgeGetExp" : ("FabricEdgeExp", "pfnGetExp", "_zeFabricEdgeGetExp_t"),
+        "zeFabricEdgeGetVerticesExp" : ("FabricEdgeExp", "pfnGetVerticesExp", "_zeFabricEdgeGetVerticesExp_t"),
+        "zeFabricEdgeGetPropertiesExp" : ("FabricEdgeExp", "pfnGetPropertiesExp", "_zeFabricEdgeGetPropertiesExp_t"),
+    }
+
+    _functype = staticmethod(_get_functype)
+
+    def __init__(self, version : ze_api_version_t, lazy : bool = False, strict : bool = True):
         # load the ze_loader library
-        if "Windows" == platform.uname()[0]:
+        if "win32" == sys.platform:
             self.__dll = WinDLL("ze_loader.dll")
         else:
             self.__dll = CDLL("ze_loader.so")
+        self.__version = version
+        self.__strict = strict
 
         # fill the ddi tables
         self.__dditable = _ze_dditable_t()
+        self.__loaded = {}
+        self.__results = {}
+        self.__fastcall = None
 
-        # call driver to get function pointers
-        _RTASBuilder = _ze_rtas_builder_dditable_t()
-        r = ze_result_v(self.__dll.zeGetRTASBuilderProcAddrTable(version, byref(_RTASBuilder)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.RTASBuilder = _RTASBuilder
-
-        # attach function interface to function address
-        self.zeRTASBuilderCreateExt = _zeRTASBuilderCreateExt_t(self.__dditable.RTASBuilder.pfnCreateExt)
-        self.zeRTASBuilderGetBuildPropertiesExt = _zeRTASBuilderGetBuildPropertiesExt_t(self.__dditable.RTASBuilder.pfnGetBuildPropertiesExt)
-        self.zeRTASBuilderBuildExt = _zeRTASBuilderBuildExt_t(self.__dditable.RTASBuilder.pfnBuildExt)
-        self.zeRTASBuilderCommandListAppendCopyExt = _zeRTASBuilderCommandListAppendCopyExt_t(self.__dditable.RTASBuilder.pfnCommandListAppendCopyExt)
-        self.zeRTASBuilderDestroyExt = _zeRTASBuilderDestroyExt_t(self.__dditable.RTASBuilder.pfnDestroyExt)
-
-        # call driver to get function pointers
-        _RTASBuilderExp = _ze_rtas_builder_exp_dditable_t()
-        r = ze_result_v(self.__dll.zeGetRTASBuilderExpProcAddrTable(version, byref(_RTASBuilderExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.RTASBuilderExp = _RTASBuilderExp
-
-        # attach function interface to function address
-        self.zeRTASBuilderCreateExp = _zeRTASBuilderCreateExp_t(self.__dditable.RTASBuilderExp.pfnCreateExp)
-        self.zeRTASBuilderGetBuildPropertiesExp = _zeRTASBuilderGetBuildPropertiesExp_t(self.__dditable.RTASBuilderExp.pfnGetBuildPropertiesExp)
-        self.zeRTASBuilderBuildExp = _zeRTASBuilderBuildExp_t(self.__dditable.RTASBuilderExp.pfnBuildExp)
-        self.zeRTASBuilderDestroyExp = _zeRTASBuilderDestroyExp_t(self.__dditable.RTASBuilderExp.pfnDestroyExp)
-
-        # call driver to get function pointers
-        _RTASParallelOperation = _ze_rtas_parallel_operation_dditable_t()
-        r = ze_result_v(self.__dll.zeGetRTASParallelOperationProcAddrTable(version, byref(_RTASParallelOperation)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.RTASParallelOperation = _RTASParallelOperation
-
-        # attach function interface to function address
-        self.zeRTASParallelOperationCreateExt = _zeRTASParallelOperationCreateExt_t(self.__dditable.RTASParallelOperation.pfnCreateExt)
-        self.zeRTASParallelOperationGetPropertiesExt = _zeRTASParallelOperationGetPropertiesExt_t(self.__dditable.RTASParallelOperation.pfnGetPropertiesExt)
-        self.zeRTASParallelOperationJoinExt = _zeRTASParallelOperationJoinExt_t(self.__dditable.RTASParallelOperation.pfnJoinExt)
-        self.zeRTASParallelOperationDestroyExt = _zeRTASParallelOperationDestroyExt_t(self.__dditable.RTASParallelOperation.pfnDestroyExt)
-
-        # call driver to get function pointers
-        _RTASParallelOperationExp = _ze_rtas_parallel_operation_exp_dditable_t()
-        r = ze_result_v(self.__dll.zeGetRTASParallelOperationExpProcAddrTable(version, byref(_RTASParallelOperationExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.RTASParallelOperationExp = _RTASParallelOperationExp
-
-        # attach function interface to function address
-        self.zeRTASParallelOperationCreateExp = _zeRTASParallelOperationCreateExp_t(self.__dditable.RTASParallelOperationExp.pfnCreateExp)
-        self.zeRTASParallelOperationGetPropertiesExp = _zeRTASParallelOperationGetPropertiesExp_t(self.__dditable.RTASParallelOperationExp.pfnGetPropertiesExp)
-        self.zeRTASParallelOperationJoinExp = _zeRTASParallelOperationJoinExp_t(self.__dditable.RTASParallelOperationExp.pfnJoinExp)
-        self.zeRTASParallelOperationDestroyExp = _zeRTASParallelOperationDestroyExp_t(self.__dditable.RTASParallelOperationExp.pfnDestroyExp)
-
-        # call driver to get function pointers
-        _Global = _ze_global_dditable_t()
-        r = ze_result_v(self.__dll.zeGetGlobalProcAddrTable(version, byref(_Global)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Global = _Global
-
-        # attach function interface to function address
-        self.zeInit = _zeInit_t(self.__dditable.Global.pfnInit)
-        self.zeInitDrivers = _zeInitDrivers_t(self.__dditable.Global.pfnInitDrivers)
-
-        # call driver to get function pointers
-        _Driver = _ze_driver_dditable_t()
-        r = ze_result_v(self.__dll.zeGetDriverProcAddrTable(version, byref(_Driver)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Driver = _Driver
-
-        # attach function interface to function address
-        self.zeDriverGet = _zeDriverGet_t(self.__dditable.Driver.pfnGet)
-        self.zeDriverGetApiVersion = _zeDriverGetApiVersion_t(self.__dditable.Driver.pfnGetApiVersion)
-        self.zeDriverGetProperties = _zeDriverGetProperties_t(self.__dditable.Driver.pfnGetProperties)
-        self.zeDriverGetIpcProperties = _zeDriverGetIpcProperties_t(self.__dditable.Driver.pfnGetIpcProperties)
-        self.zeDriverGetExtensionProperties = _zeDriverGetExtensionProperties_t(self.__dditable.Driver.pfnGetExtensionProperties)
-        self.zeDriverGetExtensionFunctionAddress = _zeDriverGetExtensionFunctionAddress_t(self.__dditable.Driver.pfnGetExtensionFunctionAddress)
-        self.zeDriverGetLastErrorDescription = _zeDriverGetLastErrorDescription_t(self.__dditable.Driver.pfnGetLastErrorDescription)
-        self.zeDriverRTASFormatCompatibilityCheckExt = _zeDriverRTASFormatCompatibilityCheckExt_t(self.__dditable.Driver.pfnRTASFormatCompatibilityCheckExt)
-
-        # call driver to get function pointers
-        _DriverExp = _ze_driver_exp_dditable_t()
-        r = ze_result_v(self.__dll.zeGetDriverExpProcAddrTable(version, byref(_DriverExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.DriverExp = _DriverExp
-
-        # attach function interface to function address
-        self.zeDriverRTASFormatCompatibilityCheckExp = _zeDriverRTASFormatCompatibilityCheckExp_t(self.__dditable.DriverExp.pfnRTASFormatCompatibilityCheckExp)
-
-        # call driver to get function pointers
-        _Device = _ze_device_dditable_t()
-        r = ze_result_v(self.__dll.zeGetDeviceProcAddrTable(version, byref(_Device)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Device = _Device
-
-        # attach function interface to function address
-        self.zeDeviceGet = _zeDeviceGet_t(self.__dditable.Device.pfnGet)
-        self.zeDeviceGetSubDevices = _zeDeviceGetSubDevices_t(self.__dditable.Device.pfnGetSubDevices)
-        self.zeDeviceGetProperties = _zeDeviceGetProperties_t(self.__dditable.Device.pfnGetProperties)
-        self.zeDeviceGetComputeProperties = _zeDeviceGetComputeProperties_t(self.__dditable.Device.pfnGetComputeProperties)
-        self.zeDeviceGetModuleProperties = _zeDeviceGetModuleProperties_t(self.__dditable.Device.pfnGetModuleProperties)
-        self.zeDeviceGetCommandQueueGroupProperties = _zeDeviceGetCommandQueueGroupProperties_t(self.__dditable.Device.pfnGetCommandQueueGroupProperties)
-        self.zeDeviceGetMemoryProperties = _zeDeviceGetMemoryProperties_t(self.__dditable.Device.pfnGetMemoryProperties)
-        self.zeDeviceGetMemoryAccessProperties = _zeDeviceGetMemoryAccessProperties_t(self.__dditable.Device.pfnGetMemoryAccessProperties)
-        self.zeDeviceGetCacheProperties = _zeDeviceGetCacheProperties_t(self.__dditable.Device.pfnGetCacheProperties)
-        self.zeDeviceGetImageProperties = _zeDeviceGetImageProperties_t(self.__dditable.Device.pfnGetImageProperties)
-        self.zeDeviceGetExternalMemoryProperties = _zeDeviceGetExternalMemoryProperties_t(self.__dditable.Device.pfnGetExternalMemoryProperties)
-        self.zeDeviceGetP2PProperties = _zeDeviceGetP2PProperties_t(self.__dditable.Device.pfnGetP2PProperties)
-        self.zeDeviceCanAccessPeer = _zeDeviceCanAccessPeer_t(self.__dditable.Device.pfnCanAccessPeer)
-        self.zeDeviceGetStatus = _zeDeviceGetStatus_t(self.__dditable.Device.pfnGetStatus)
-        self.zeDeviceGetGlobalTimestamps = _zeDeviceGetGlobalTimestamps_t(self.__dditable.Device.pfnGetGlobalTimestamps)
-        self.zeDeviceReserveCacheExt = _zeDeviceReserveCacheExt_t(self.__dditable.Device.pfnReserveCacheExt)
-        self.zeDeviceSetCacheAdviceExt = _zeDeviceSetCacheAdviceExt_t(self.__dditable.Device.pfnSetCacheAdviceExt)
-        self.zeDevicePciGetPropertiesExt = _zeDevicePciGetPropertiesExt_t(self.__dditable.Device.pfnPciGetPropertiesExt)
-        self.zeDeviceGetRootDevice = _zeDeviceGetRootDevice_t(self.__dditable.Device.pfnGetRootDevice)
-        self.zeDeviceImportExternalSemaphoreExt = _zeDeviceImportExternalSemaphoreExt_t(self.__dditable.Device.pfnImportExternalSemaphoreExt)
-        self.zeDeviceReleaseExternalSemaphoreExt = _zeDeviceReleaseExternalSemaphoreExt_t(self.__dditable.Device.pfnReleaseExternalSemaphoreExt)
-        self.zeDeviceGetVectorWidthPropertiesExt = _zeDeviceGetVectorWidthPropertiesExt_t(self.__dditable.Device.pfnGetVectorWidthPropertiesExt)
-
-        # call driver to get function pointers
-        _DeviceExp = _ze_device_exp_dditable_t()
-        r = ze_result_v(self.__dll.zeGetDeviceExpProcAddrTable(version, byref(_DeviceExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.DeviceExp = _DeviceExp
-
-        # attach function interface to function address
-        self.zeDeviceGetFabricVertexExp = _zeDeviceGetFabricVertexExp_t(self.__dditable.DeviceExp.pfnGetFabricVertexExp)
-
-        # call driver to get function pointers
-        _Context = _ze_context_dditable_t()
-        r = ze_result_v(self.__dll.zeGetContextProcAddrTable(version, byref(_Context)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Context = _Context
-
-        # attach function interface to function address
-        self.zeContextCreate = _zeContextCreate_t(self.__dditable.Context.pfnCreate)
-        self.zeContextDestroy = _zeContextDestroy_t(self.__dditable.Context.pfnDestroy)
-        self.zeContextGetStatus = _zeContextGetStatus_t(self.__dditable.Context.pfnGetStatus)
-        self.zeContextSystemBarrier = _zeContextSystemBarrier_t(self.__dditable.Context.pfnSystemBarrier)
-        self.zeContextMakeMemoryResident = _zeContextMakeMemoryResident_t(self.__dditable.Context.pfnMakeMemoryResident)
-        self.zeContextEvictMemory = _zeContextEvictMemory_t(self.__dditable.Context.pfnEvictMemory)
-        self.zeContextMakeImageResident = _zeContextMakeImageResident_t(self.__dditable.Context.pfnMakeImageResident)
-        self.zeContextEvictImage = _zeContextEvictImage_t(self.__dditable.Context.pfnEvictImage)
-        self.zeContextCreateEx = _zeContextCreateEx_t(self.__dditable.Context.pfnCreateEx)
-
-        # call driver to get function pointers
-        _CommandQueue = _ze_command_queue_dditable_t()
-        r = ze_result_v(self.__dll.zeGetCommandQueueProcAddrTable(version, byref(_CommandQueue)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.CommandQueue = _CommandQueue
-
-        # attach function interface to function address
-        self.zeCommandQueueCreate = _zeCommandQueueCreate_t(self.__dditable.CommandQueue.pfnCreate)
-        self.zeCommandQueueDestroy = _zeCommandQueueDestroy_t(self.__dditable.CommandQueue.pfnDestroy)
-        self.zeCommandQueueExecuteCommandLists = _zeCommandQueueExecuteCommandLists_t(self.__dditable.CommandQueue.pfnExecuteCommandLists)
-        self.zeCommandQueueSynchronize = _zeCommandQueueSynchronize_t(self.__dditable.CommandQueue.pfnSynchronize)
-        self.zeCommandQueueGetOrdinal = _zeCommandQueueGetOrdinal_t(self.__dditable.CommandQueue.pfnGetOrdinal)
-        self.zeCommandQueueGetIndex = _zeCommandQueueGetIndex_t(self.__dditable.CommandQueue.pfnGetIndex)
-
-        # call driver to get function pointers
-        _CommandList = _ze_command_list_dditable_t()
-        r = ze_result_v(self.__dll.zeGetCommandListProcAddrTable(version, byref(_CommandList)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.CommandList = _CommandList
-
-        # attach function interface to function address
-        self.zeCommandListCreate = _zeCommandListCreate_t(self.__dditable.CommandList.pfnCreate)
-        self.zeCommandListCreateImmediate = _zeCommandListCreateImmediate_t(self.__dditable.CommandList.pfnCreateImmediate)
-        self.zeCommandListDestroy = _zeCommandListDestroy_t(self.__dditable.CommandList.pfnDestroy)
-        self.zeCommandListClose = _zeCommandListClose_t(self.__dditable.CommandList.pfnClose)
-        self.zeCommandListReset = _zeCommandListReset_t(self.__dditable.CommandList.pfnReset)
-        self.zeCommandListAppendWriteGlobalTimestamp = _zeCommandListAppendWriteGlobalTimestamp_t(self.__dditable.CommandList.pfnAppendWriteGlobalTimestamp)
-        self.zeCommandListAppendBarrier = _zeCommandListAppendBarrier_t(self.__dditable.CommandList.pfnAppendBarrier)
-        self.zeCommandListAppendMemoryRangesBarrier = _zeCommandListAppendMemoryRangesBarrier_t(self.__dditable.CommandList.pfnAppendMemoryRangesBarrier)
-        self.zeCommandListAppendMemoryCopy = _zeCommandListAppendMemoryCopy_t(self.__dditable.CommandList.pfnAppendMemoryCopy)
-        self.zeCommandListAppendMemoryFill = _zeCommandListAppendMemoryFill_t(self.__dditable.CommandList.pfnAppendMemoryFill)
-        self.zeCommandListAppendMemoryCopyRegion = _zeCommandListAppendMemoryCopyRegion_t(self.__dditable.CommandList.pfnAppendMemoryCopyRegion)
-        self.zeCommandListAppendMemoryCopyFromContext = _zeCommandListAppendMemoryCopyFromContext_t(self.__dditable.CommandList.pfnAppendMemoryCopyFromContext)
-        self.zeCommandListAppendImageCopy = _zeCommandListAppendImageCopy_t(self.__dditable.CommandList.pfnAppendImageCopy)
-        self.zeCommandListAppendImageCopyRegion = _zeCommandListAppendImageCopyRegion_t(self.__dditable.CommandList.pfnAppendImageCopyRegion)
-        self.zeCommandListAppendImageCopyToMemory = _zeCommandListAppendImageCopyToMemory_t(self.__dditable.CommandList.pfnAppendImageCopyToMemory)
-        self.zeCommandListAppendImageCopyFromMemory = _zeCommandListAppendImageCopyFromMemory_t(self.__dditable.CommandList.pfnAppendImageCopyFromMemory)
-        self.zeCommandListAppendMemoryPrefetch = _zeCommandListAppendMemoryPrefetch_t(self.__dditable.CommandList.pfnAppendMemoryPrefetch)
-        self.zeCommandListAppendMemAdvise = _zeCommandListAppendMemAdvise_t(self.__dditable.CommandList.pfnAppendMemAdvise)
-        self.zeCommandListAppendSignalEvent = _zeCommandListAppendSignalEvent_t(self.__dditable.CommandList.pfnAppendSignalEvent)
-        self.zeCommandListAppendWaitOnEvents = _zeCommandListAppendWaitOnEvents_t(self.__dditable.CommandList.pfnAppendWaitOnEvents)
-        self.zeCommandListAppendEventReset = _zeCommandListAppendEventReset_t(self.__dditable.CommandList.pfnAppendEventReset)
-        self.zeCommandListAppendQueryKernelTimestamps = _zeCommandListAppendQueryKernelTimestamps_t(self.__dditable.CommandList.pfnAppendQueryKernelTimestamps)
-        self.zeCommandListAppendLaunchKernel = _zeCommandListAppendLaunchKernel_t(self.__dditable.CommandList.pfnAppendLaunchKernel)
-        self.zeCommandListAppendLaunchCooperativeKernel = _zeCommandListAppendLaunchCooperativeKernel_t(self.__dditable.CommandList.pfnAppendLaunchCooperativeKernel)
-        self.zeCommandListAppendLaunchKernelIndirect = _zeCommandListAppendLaunchKernelIndirect_t(self.__dditable.CommandList.pfnAppendLaunchKernelIndirect)
-        self.zeCommandListAppendLaunchMultipleKernelsIndirect = _zeCommandListAppendLaunchMultipleKernelsIndirect_t(self.__dditable.CommandList.pfnAppendLaunchMultipleKernelsIndirect)
-        self.zeCommandListAppendImageCopyToMemoryExt = _zeCommandListAppendImageCopyToMemoryExt_t(self.__dditable.CommandList.pfnAppendImageCopyToMemoryExt)
-        self.zeCommandListAppendImageCopyFromMemoryExt = _zeCommandListAppendImageCopyFromMemoryExt_t(self.__dditable.CommandList.pfnAppendImageCopyFromMemoryExt)
-        self.zeCommandListHostSynchronize = _zeCommandListHostSynchronize_t(self.__dditable.CommandList.pfnHostSynchronize)
-        self.zeCommandListGetDeviceHandle = _zeCommandListGetDeviceHandle_t(self.__dditable.CommandList.pfnGetDeviceHandle)
-        self.zeCommandListGetContextHandle = _zeCommandListGetContextHandle_t(self.__dditable.CommandList.pfnGetContextHandle)
-        self.zeCommandListGetOrdinal = _zeCommandListGetOrdinal_t(self.__dditable.CommandList.pfnGetOrdinal)
-        self.zeCommandListImmediateGetIndex = _zeCommandListImmediateGetIndex_t(self.__dditable.CommandList.pfnImmediateGetIndex)
-        self.zeCommandListIsImmediate = _zeCommandListIsImmediate_t(self.__dditable.CommandList.pfnIsImmediate)
-        self.zeCommandListAppendSignalExternalSemaphoreExt = _zeCommandListAppendSignalExternalSemaphoreExt_t(self.__dditable.CommandList.pfnAppendSignalExternalSemaphoreExt)
-        self.zeCommandListAppendWaitExternalSemaphoreExt = _zeCommandListAppendWaitExternalSemaphoreExt_t(self.__dditable.CommandList.pfnAppendWaitExternalSemaphoreExt)
-
-        # call driver to get function pointers
-        _CommandListExp = _ze_command_list_exp_dditable_t()
-        r = ze_result_v(self.__dll.zeGetCommandListExpProcAddrTable(version, byref(_CommandListExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.CommandListExp = _CommandListExp
-
-        # attach function interface to function address
-        self.zeCommandListCreateCloneExp = _zeCommandListCreateCloneExp_t(self.__dditable.CommandListExp.pfnCreateCloneExp)
-        self.zeCommandListImmediateAppendCommandListsExp = _zeCommandListImmediateAppendCommandListsExp_t(self.__dditable.CommandListExp.pfnImmediateAppendCommandListsExp)
-        self.zeCommandListGetNextCommandIdExp = _zeCommandListGetNextCommandIdExp_t(self.__dditable.CommandListExp.pfnGetNextCommandIdExp)
-        self.zeCommandListUpdateMutableCommandsExp = _zeCommandListUpdateMutableCommandsExp_t(self.__dditable.CommandListExp.pfnUpdateMutableCommandsExp)
-        self.zeCommandListUpdateMutableCommandSignalEventExp = _zeCommandListUpdateMutableCommandSignalEventExp_t(self.__dditable.CommandListExp.pfnUpdateMutableCommandSignalEventExp)
-        self.zeCommandListUpdateMutableCommandWaitEventsExp = _zeCommandListUpdateMutableCommandWaitEventsExp_t(self.__dditable.CommandListExp.pfnUpdateMutableCommandWaitEventsExp)
-        self.zeCommandListGetNextCommandIdWithKernelsExp = _zeCommandListGetNextCommandIdWithKernelsExp_t(self.__dditable.CommandListExp.pfnGetNextCommandIdWithKernelsExp)
-        self.zeCommandListUpdateMutableCommandKernelsExp = _zeCommandListUpdateMutableCommandKernelsExp_t(self.__dditable.CommandListExp.pfnUpdateMutableCommandKernelsExp)
-
-        # call driver to get function pointers
-        _Image = _ze_image_dditable_t()
-        r = ze_result_v(self.__dll.zeGetImageProcAddrTable(version, byref(_Image)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Image = _Image
-
-        # attach function interface to function address
-        self.zeImageGetProperties = _zeImageGetProperties_t(self.__dditable.Image.pfnGetProperties)
-        self.zeImageCreate = _zeImageCreate_t(self.__dditable.Image.pfnCreate)
-        self.zeImageDestroy = _zeImageDestroy_t(self.__dditable.Image.pfnDestroy)
-        self.zeImageGetAllocPropertiesExt = _zeImageGetAllocPropertiesExt_t(self.__dditable.Image.pfnGetAllocPropertiesExt)
-        self.zeImageViewCreateExt = _zeImageViewCreateExt_t(self.__dditable.Image.pfnViewCreateExt)
-
-        # call driver to get function pointers
-        _ImageExp = _ze_image_exp_dditable_t()
-        r = ze_result_v(self.__dll.zeGetImageExpProcAddrTable(version, byref(_ImageExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.ImageExp = _ImageExp
-
-        # attach function interface to function address
-        self.zeImageGetMemoryPropertiesExp = _zeImageGetMemoryPropertiesExp_t(self.__dditable.ImageExp.pfnGetMemoryPropertiesExp)
-        self.zeImageViewCreateExp = _zeImageViewCreateExp_t(self.__dditable.ImageExp.pfnViewCreateExp)
-        self.zeImageGetDeviceOffsetExp = _zeImageGetDeviceOffsetExp_t(self.__dditable.ImageExp.pfnGetDeviceOffsetExp)
-
-        # call driver to get function pointers
-        _Mem = _ze_mem_dditable_t()
-        r = ze_result_v(self.__dll.zeGetMemProcAddrTable(version, byref(_Mem)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Mem = _Mem
-
-        # attach function interface to function address
-        self.zeMemAllocShared = _zeMemAllocShared_t(self.__dditable.Mem.pfnAllocShared)
-        self.zeMemAllocDevice = _zeMemAllocDevice_t(self.__dditable.Mem.pfnAllocDevice)
-        self.zeMemAllocHost = _zeMemAllocHost_t(self.__dditable.Mem.pfnAllocHost)
-        self.zeMemFree = _zeMemFree_t(self.__dditable.Mem.pfnFree)
-        self.zeMemGetAllocProperties = _zeMemGetAllocProperties_t(self.__dditable.Mem.pfnGetAllocProperties)
-        self.zeMemGetAddressRange = _zeMemGetAddressRange_t(self.__dditable.Mem.pfnGetAddressRange)
-        self.zeMemGetIpcHandle = _zeMemGetIpcHandle_t(self.__dditable.Mem.pfnGetIpcHandle)
-        self.zeMemOpenIpcHandle = _zeMemOpenIpcHandle_t(self.__dditable.Mem.pfnOpenIpcHandle)
-        self.zeMemCloseIpcHandle = _zeMemCloseIpcHandle_t(self.__dditable.Mem.pfnCloseIpcHandle)
-        self.zeMemFreeExt = _zeMemFreeExt_t(self.__dditable.Mem.pfnFreeExt)
-        self.zeMemPutIpcHandle = _zeMemPutIpcHandle_t(self.__dditable.Mem.pfnPutIpcHandle)
-        self.zeMemGetPitchFor2dImage = _zeMemGetPitchFor2dImage_t(self.__dditable.Mem.pfnGetPitchFor2dImage)
-
-        # call driver to get function pointers
-        _MemExp = _ze_mem_exp_dditable_t()
-        r = ze_result_v(self.__dll.zeGetMemExpProcAddrTable(version, byref(_MemExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.MemExp = _MemExp
-
-        # attach function interface to function address
-        self.zeMemGetIpcHandleFromFileDescriptorExp = _zeMemGetIpcHandleFromFileDescriptorExp_t(self.__dditable.MemExp.pfnGetIpcHandleFromFileDescriptorExp)
-        self.zeMemGetFileDescriptorFromIpcHandleExp = _zeMemGetFileDescriptorFromIpcHandleExp_t(self.__dditable.MemExp.pfnGetFileDescriptorFromIpcHandleExp)
-        self.zeMemSetAtomicAccessAttributeExp = _zeMemSetAtomicAccessAttributeExp_t(self.__dditable.MemExp.pfnSetAtomicAccessAttributeExp)
-        self.zeMemGetAtomicAccessAttributeExp = _zeMemGetAtomicAccessAttributeExp_t(self.__dditable.MemExp.pfnGetAtomicAccessAttributeExp)
-
-        # call driver to get function pointers
-        _Fence = _ze_fence_dditable_t()
-        r = ze_result_v(self.__dll.zeGetFenceProcAddrTable(version, byref(_Fence)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Fence = _Fence
-
-        # attach function interface to function address
-        self.zeFenceCreate = _zeFenceCreate_t(self.__dditable.Fence.pfnCreate)
-        self.zeFenceDestroy = _zeFenceDestroy_t(self.__dditable.Fence.pfnDestroy)
-        self.zeFenceHostSynchronize = _zeFenceHostSynchronize_t(self.__dditable.Fence.pfnHostSynchronize)
-        self.zeFenceQueryStatus = _zeFenceQueryStatus_t(self.__dditable.Fence.pfnQueryStatus)
-        self.zeFenceReset = _zeFenceReset_t(self.__dditable.Fence.pfnReset)
-
-        # call driver to get function pointers
-        _EventPool = _ze_event_pool_dditable_t()
-        r = ze_result_v(self.__dll.zeGetEventPoolProcAddrTable(version, byref(_EventPool)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.EventPool = _EventPool
-
-        # attach function interface to function address
-        self.zeEventPoolCreate = _zeEventPoolCreate_t(self.__dditable.EventPool.pfnCreate)
-        self.zeEventPoolDestroy = _zeEventPoolDestroy_t(self.__dditable.EventPool.pfnDestroy)
-        self.zeEventPoolGetIpcHandle = _zeEventPoolGetIpcHandle_t(self.__dditable.EventPool.pfnGetIpcHandle)
-        self.zeEventPoolOpenIpcHandle = _zeEventPoolOpenIpcHandle_t(self.__dditable.EventPool.pfnOpenIpcHandle)
-        self.zeEventPoolCloseIpcHandle = _zeEventPoolCloseIpcHandle_t(self.__dditable.EventPool.pfnCloseIpcHandle)
-        self.zeEventPoolPutIpcHandle = _zeEventPoolPutIpcHandle_t(self.__dditable.EventPool.pfnPutIpcHandle)
-        self.zeEventPoolGetContextHandle = _zeEventPoolGetContextHandle_t(self.__dditable.EventPool.pfnGetContextHandle)
-        self.zeEventPoolGetFlags = _zeEventPoolGetFlags_t(self.__dditable.EventPool.pfnGetFlags)
-
-        # call driver to get function pointers
-        _Event = _ze_event_dditable_t()
-        r = ze_result_v(self.__dll.zeGetEventProcAddrTable(version, byref(_Event)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Event = _Event
-
-        # attach function interface to function address
-        self.zeEventCreate = _zeEventCreate_t(self.__dditable.Event.pfnCreate)
-        self.zeEventDestroy = _zeEventDestroy_t(self.__dditable.Event.pfnDestroy)
-        self.zeEventHostSignal = _zeEventHostSignal_t(self.__dditable.Event.pfnHostSignal)
-        self.zeEventHostSynchronize = _zeEventHostSynchronize_t(self.__dditable.Event.pfnHostSynchronize)
-        self.zeEventQueryStatus = _zeEventQueryStatus_t(self.__dditable.Event.pfnQueryStatus)
-        self.zeEventHostReset = _zeEventHostReset_t(self.__dditable.Event.pfnHostReset)
-        self.zeEventQueryKernelTimestamp = _zeEventQueryKernelTimestamp_t(self.__dditable.Event.pfnQueryKernelTimestamp)
-        self.zeEventQueryKernelTimestampsExt = _zeEventQueryKernelTimestampsExt_t(self.__dditable.Event.pfnQueryKernelTimestampsExt)
-        self.zeEventGetEventPool = _zeEventGetEventPool_t(self.__dditable.Event.pfnGetEventPool)
-        self.zeEventGetSignalScope = _zeEventGetSignalScope_t(self.__dditable.Event.pfnGetSignalScope)
-        self.zeEventGetWaitScope = _zeEventGetWaitScope_t(self.__dditable.Event.pfnGetWaitScope)
-
-        # call driver to get function pointers
-        _EventExp = _ze_event_exp_dditable_t()
-        r = ze_result_v(self.__dll.zeGetEventExpProcAddrTable(version, byref(_EventExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.EventExp = _EventExp
-
-        # attach function interface to function address
-        self.zeEventQueryTimestampsExp = _zeEventQueryTimestampsExp_t(self.__dditable.EventExp.pfnQueryTimestampsExp)
-
-        # call driver to get function pointers
-        _Module = _ze_module_dditable_t()
-        r = ze_result_v(self.__dll.zeGetModuleProcAddrTable(version, byref(_Module)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Module = _Module
-
-        # attach function interface to function address
-        self.zeModuleCreate = _zeModuleCreate_t(self.__dditable.Module.pfnCreate)
-        self.zeModuleDestroy = _zeModuleDestroy_t(self.__dditable.Module.pfnDestroy)
-        self.zeModuleDynamicLink = _zeModuleDynamicLink_t(self.__dditable.Module.pfnDynamicLink)
-        self.zeModuleGetNativeBinary = _zeModuleGetNativeBinary_t(self.__dditable.Module.pfnGetNativeBinary)
-        self.zeModuleGetGlobalPointer = _zeModuleGetGlobalPointer_t(self.__dditable.Module.pfnGetGlobalPointer)
-        self.zeModuleGetKernelNames = _zeModuleGetKernelNames_t(self.__dditable.Module.pfnGetKernelNames)
-        self.zeModuleGetProperties = _zeModuleGetProperties_t(self.__dditable.Module.pfnGetProperties)
-        self.zeModuleGetFunctionPointer = _zeModuleGetFunctionPointer_t(self.__dditable.Module.pfnGetFunctionPointer)
-        self.zeModuleInspectLinkageExt = _zeModuleInspectLinkageExt_t(self.__dditable.Module.pfnInspectLinkageExt)
-
-        # call driver to get function pointers
-        _ModuleBuildLog = _ze_module_build_log_dditable_t()
-        r = ze_result_v(self.__dll.zeGetModuleBuildLogProcAddrTable(version, byref(_ModuleBuildLog)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.ModuleBuildLog = _ModuleBuildLog
-
-        # attach function interface to function address
-        self.zeModuleBuildLogDestroy = _zeModuleBuildLogDestroy_t(self.__dditable.ModuleBuildLog.pfnDestroy)
-        self.zeModuleBuildLogGetString = _zeModuleBuildLogGetString_t(self.__dditable.ModuleBuildLog.pfnGetString)
-
-        # call driver to get function pointers
-        _Kernel = _ze_kernel_dditable_t()
-        r = ze_result_v(self.__dll.zeGetKernelProcAddrTable(version, byref(_Kernel)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Kernel = _Kernel
-
-        # attach function interface to function address
-        self.zeKernelCreate = _zeKernelCreate_t(self.__dditable.Kernel.pfnCreate)
-        self.zeKernelDestroy = _zeKernelDestroy_t(self.__dditable.Kernel.pfnDestroy)
-        self.zeKernelSetCacheConfig = _zeKernelSetCacheConfig_t(self.__dditable.Kernel.pfnSetCacheConfig)
-        self.zeKernelSetGroupSize = _zeKernelSetGroupSize_t(self.__dditable.Kernel.pfnSetGroupSize)
-        self.zeKernelSuggestGroupSize = _zeKernelSuggestGroupSize_t(self.__dditable.Kernel.pfnSuggestGroupSize)
-        self.zeKernelSuggestMaxCooperativeGroupCount = _zeKernelSuggestMaxCooperativeGroupCount_t(self.__dditable.Kernel.pfnSuggestMaxCooperativeGroupCount)
-        self.zeKernelSetArgumentValue = _zeKernelSetArgumentValue_t(self.__dditable.Kernel.pfnSetArgumentValue)
-        self.zeKernelSetIndirectAccess = _zeKernelSetIndirectAccess_t(self.__dditable.Kernel.pfnSetIndirectAccess)
-        self.zeKernelGetIndirectAccess = _zeKernelGetIndirectAccess_t(self.__dditable.Kernel.pfnGetIndirectAccess)
-        self.zeKernelGetSourceAttributes = _zeKernelGetSourceAttributes_t(self.__dditable.Kernel.pfnGetSourceAttributes)
-        self.zeKernelGetProperties = _zeKernelGetProperties_t(self.__dditable.Kernel.pfnGetProperties)
-        self.zeKernelGetName = _zeKernelGetName_t(self.__dditable.Kernel.pfnGetName)
-
-        # call driver to get function pointers
-        _KernelExp = _ze_kernel_exp_dditable_t()
-        r = ze_result_v(self.__dll.zeGetKernelExpProcAddrTable(version, byref(_KernelExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.KernelExp = _KernelExp
-
-        # attach function interface to function address
-        self.zeKernelSetGlobalOffsetExp = _zeKernelSetGlobalOffsetExp_t(self.__dditable.KernelExp.pfnSetGlobalOffsetExp)
-        self.zeKernelSchedulingHintExp = _zeKernelSchedulingHintExp_t(self.__dditable.KernelExp.pfnSchedulingHintExp)
-        self.zeKernelGetBinaryExp = _zeKernelGetBinaryExp_t(self.__dditable.KernelExp.pfnGetBinaryExp)
-
-        # call driver to get function pointers
-        _Sampler = _ze_sampler_dditable_t()
-        r = ze_result_v(self.__dll.zeGetSamplerProcAddrTable(version, byref(_Sampler)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Sampler = _Sampler
-
-        # attach function interface to function address
-        self.zeSamplerCreate = _zeSamplerCreate_t(self.__dditable.Sampler.pfnCreate)
-        self.zeSamplerDestroy = _zeSamplerDestroy_t(self.__dditable.Sampler.pfnDestroy)
-
-        # call driver to get function pointers
-        _PhysicalMem = _ze_physical_mem_dditable_t()
-        r = ze_result_v(self.__dll.zeGetPhysicalMemProcAddrTable(version, byref(_PhysicalMem)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.PhysicalMem = _PhysicalMem
-
-        # attach function interface to function address
-        self.zePhysicalMemCreate = _zePhysicalMemCreate_t(self.__dditable.PhysicalMem.pfnCreate)
-        self.zePhysicalMemDestroy = _zePhysicalMemDestroy_t(self.__dditable.PhysicalMem.pfnDestroy)
-
-        # call driver to get function pointers
-        _VirtualMem = _ze_virtual_mem_dditable_t()
-        r = ze_result_v(self.__dll.zeGetVirtualMemProcAddrTable(version, byref(_VirtualMem)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.VirtualMem = _VirtualMem
-
-        # attach function interface to function address
-        self.zeVirtualMemReserve = _zeVirtualMemReserve_t(self.__dditable.VirtualMem.pfnReserve)
-        self.zeVirtualMemFree = _zeVirtualMemFree_t(self.__dditable.VirtualMem.pfnFree)
-        self.zeVirtualMemQueryPageSize = _zeVirtualMemQueryPageSize_t(self.__dditable.VirtualMem.pfnQueryPageSize)
-        self.zeVirtualMemMap = _zeVirtualMemMap_t(self.__dditable.VirtualMem.pfnMap)
-        self.zeVirtualMemUnmap = _zeVirtualMemUnmap_t(self.__dditable.VirtualMem.pfnUnmap)
-        self.zeVirtualMemSetAccessAttribute = _zeVirtualMemSetAccessAttribute_t(self.__dditable.VirtualMem.pfnSetAccessAttribute)
-        self.zeVirtualMemGetAccessAttribute = _zeVirtualMemGetAccessAttribute_t(self.__dditable.VirtualMem.pfnGetAccessAttribute)
-
-        # call driver to get function pointers
-        _FabricVertexExp = _ze_fabric_vertex_exp_dditable_t()
-        r = ze_result_v(self.__dll.zeGetFabricVertexExpProcAddrTable(version, byref(_FabricVertexExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.FabricVertexExp = _FabricVertexExp
-
-        # attach function interface to function address
-        self.zeFabricVertexGetExp = _zeFabricVertexGetExp_t(self.__dditable.FabricVertexExp.pfnGetExp)
-        self.zeFabricVertexGetSubVerticesExp = _zeFabricVertexGetSubVerticesExp_t(self.__dditable.FabricVertexExp.pfnGetSubVerticesExp)
-        self.zeFabricVertexGetPropertiesExp = _zeFabricVertexGetPropertiesExp_t(self.__dditable.FabricVertexExp.pfnGetPropertiesExp)
-        self.zeFabricVertexGetDeviceExp = _zeFabricVertexGetDeviceExp_t(self.__dditable.FabricVertexExp.pfnGetDeviceExp)
-
-        # call driver to get function pointers
-        _FabricEdgeExp = _ze_fabric_edge_exp_dditable_t()
-        r = ze_result_v(self.__dll.zeGetFabricEdgeExpProcAddrTable(version, byref(_FabricEdgeExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.FabricEdgeExp = _FabricEdgeExp
-
-        # attach function interface to function address
-        self.zeFabricEdgeGetExp = _zeFabricEdgeGetExp_t(self.__dditable.FabricEdgeExp.pfnGetExp)
-        self.zeFabricEdgeGetVerticesExp = _zeFabricEdgeGetVerticesExp_t(self.__dditable.FabricEdgeExp.pfnGetVerticesExp)
-        self.zeFabricEdgeGetPropertiesExp = _zeFabricEdgeGetPropertiesExp_t(self.__dditable.FabricEdgeExp.pfnGetPropertiesExp)
+        # in lazy mode, tables are fetched and functions bound on first access
+        if not lazy:
+            for name in self._functions:
+                getattr(self, name)
 
         # success!
+
+    ## @brief Returns the named ddi table, calling the driver to fill it on first use;
+    ##        in non-strict mode, returns None if the driver does not provide the table
+    def _get_table(self, table):
+        if table not in self.__loaded:
+            # call driver to get function pointers
+            getter, tabletype = self._tables[table]
+            _table = tabletype()
+            try:
+                r = ze_result_v(getattr(self.__dll, getter)(self.__version, byref(_table)))
+            except AttributeError:
+                if self.__strict:
+                    raise
+                r = ze_result_v.ERROR_UNSUPPORTED_FEATURE
+            self.__results[table] = r
+            if r != ze_result_v.SUCCESS:
+                if self.__strict:
+                    raise Exception(r)
+                self.__loaded[table] = None
+            else:
+                setattr(self.__dditable, table, _table)
+                self.__loaded[table] = getattr(self.__dditable, table)
+        return self.__loaded[table]
+
+    ## @brief Fast-call view of this interface; see ::ZE_FASTCALL
+    @property
+    def fastcall(self):
+        if self.__fastcall is None:
+            self.__fastcall = ZE_FASTCALL(self)
+        return self.__fastcall
+
+    ## @brief Map of table name to ddi table, or None if not provided by the driver
+    @property
+    def tables(self):
+        return {table : self._get_table(table) for table in self._tables}
+
+    ## @brief Set of table names provided by the driver
+    @property
+    def supported_tables(self):
+        return set(table for table, _table in self.tables.items() if _table is not None)
+
+    ## @brief Returns True if the driver provides the named function
+    def is_supported(self, name):
+        table, pfn, _ = self._functions[name]
+        _table = self._get_table(table)
+        return _table is not None and bool(getattr(_table, pfn))
+
+    ## @brief Binds the named function on first access and caches it on the instance
+    def __getattr__(self, name):
+        try:
+            table, pfn, functype = self._functions[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+        _table = self._get_table(table)
+        if _table is None or not getattr(_table, pfn):
+            # calling a function the driver did not provide raises instead of crashing
+            result = self.__results.get(table, ze_result_v.ERROR_UNSUPPORTED_FEATURE)
+            if result == ze_result_v.SUCCESS:
+                result = ze_result_v.ERROR_UNSUPPORTED_FEATURE
+            def func(*args):
+                raise UnsupportedFunctionError(name, table, result)
+        else:
+            # attach function interface to function address
+            func = _get_functype(functype)(getattr(_table, pfn))
+        setattr(self, name, func)
+        return func
+
+###############################################################################
+## @brief Names of 'from level_zero.ze import *': every public name, including
+##        the deferred experimental definitions, which the import defines
+__all__ = sorted(set(name for name in globals() if not name.startswith("_")) |
+                 set(name for name in _deferred if not name.startswith("_")))
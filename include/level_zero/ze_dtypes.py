@@ -0,0 +1,455 @@
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+ @file ze_dtypes.py
+
+ Generated by scripts/generate_layout.py from the C headers, do not edit.
+
+ NumPy structured dtypes matching the ze, zes and zet structures, so arrays of
+ descriptors, properties and counters can be passed to the driver and read
+ back without per-element Python objects. Requires numpy.
+
+ """
+from ctypes import *
+import numpy
+
+###############################################################################
+## @brief (itemsize, [(field, format, offset)]) of every structure, on 64-bit
+##        targets; a format naming another structure nests its dtype
+_specs = {
+    "ze_device_uuid_t" : (16, [("id", ("u1", 16), 0)]),
+    "ze_device_properties_t" : (368, [("stype", "i4", 0), ("pNext", "u8", 8), ("type", "i4", 16), ("vendorId", "u4", 20), ("deviceId", "u4", 24), ("flags", "i4", 28), ("subdeviceId", "u4", 32), ("coreClockRate", "u4", 36), ("maxMemAllocSize", "u8", 40), ("maxHardwareContexts", "u4", 48), ("maxCommandQueuePriority", "u4", 52), ("numThreadsPerEU", "u4", 56), ("physicalEUSimdWidth", "u4", 60), ("numEUsPerSubslice", "u4", 64), ("numSubslicesPerSlice", "u4", 68), ("numSlices", "u4", 72), ("timerResolution", "u8", 80), ("timestampValidBits", "u4", 88), ("kernelTimestampValidBits", "u4", 92), ("uuid", "ze_device_uuid_t", 96), ("name", "S256", 112)]),
+    "ze_ipc_mem_handle_t" : (64, [("data", "S64", 0)]),
+    "ze_ipc_event_pool_handle_t" : (64, [("data", "S64", 0)]),
+    "ze_uuid_t" : (16, [("id", ("u1", 16), 0)]),
+    "ze_base_cb_params_t" : (16, [("stype", "i4", 0), ("pNext", "u8", 8)]),
+    "ze_base_properties_t" : (16, [("stype", "i4", 0), ("pNext", "u8", 8)]),
+    "ze_base_desc_t" : (16, [("stype", "i4", 0), ("pNext", "u8", 8)]),
+    "ze_init_driver_type_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16)]),
+    "ze_driver_uuid_t" : (16, [("id", ("u1", 16), 0)]),
+    "ze_driver_properties_t" : (40, [("stype", "i4", 0), ("pNext", "u8", 8), ("uuid", "ze_driver_uuid_t", 16), ("driverVersion", "u4", 32)]),
+    "ze_driver_ipc_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16)]),
+    "ze_driver_extension_properties_t" : (260, [("name", "S256", 0), ("version", "u4", 256)]),
+    "ze_device_thread_t" : (16, [("slice", "u4", 0), ("subslice", "u4", 4), ("eu", "u4", 8), ("thread", "u4", 12)]),
+    "ze_device_compute_properties_t" : (88, [("stype", "i4", 0), ("pNext", "u8", 8), ("maxTotalGroupSize", "u4", 16), ("maxGroupSizeX", "u4", 20), ("maxGroupSizeY", "u4", 24), ("maxGroupSizeZ", "u4", 28), ("maxGroupCountX", "u4", 32), ("maxGroupCountY", "u4", 36), ("maxGroupCountZ", "u4", 40), ("maxSharedLocalMemory", "u4", 44), ("numSubGroupSizes", "u4", 48), ("subGroupSizes", ("u4", 8), 52)]),
+    "ze_native_kernel_uuid_t" : (16, [("id", ("u1", 16), 0)]),
+    "ze_device_module_properties_t" : (64, [("stype", "i4", 0), ("pNext", "u8", 8), ("spirvVersionSupported", "u4", 16), ("flags", "i4", 20), ("fp16flags", "i4", 24), ("fp32flags", "i4", 28), ("fp64flags", "i4", 32), ("maxArgumentsSize", "u4", 36), ("printfBufferSize", "u4", 40), ("nativeKernelSupported", "ze_native_kernel_uuid_t", 44)]),
+    "ze_command_queue_group_properties_t" : (40, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16), ("maxMemoryFillPatternSize", "u8", 24), ("numQueues", "u4", 32)]),
+    "ze_device_memory_properties_t" : (296, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16), ("maxClockRate", "u4", 20), ("maxBusWidth", "u4", 24), ("totalSize", "u8", 32), ("name", "S256", 40)]),
+    "ze_device_memory_access_properties_t" : (40, [("stype", "i4", 0), ("pNext", "u8", 8), ("hostAllocCapabilities", "i4", 16), ("deviceAllocCapabilities", "i4", 20), ("sharedSingleDeviceAllocCapabilities", "i4", 24), ("sharedCrossDeviceAllocCapabilities", "i4", 28), ("sharedSystemAllocCapabilities", "i4", 32)]),
+    "ze_device_cache_properties_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16), ("cacheSize", "u8", 24)]),
+    "ze_device_image_properties_t" : (56, [("stype", "i4", 0), ("pNext", "u8", 8), ("maxImageDims1D", "u4", 16), ("maxImageDims2D", "u4", 20), ("maxImageDims3D", "u4", 24), ("maxImageBufferSize", "u8", 32), ("maxImageArraySlices", "u4", 40), ("maxSamplers", "u4", 44), ("maxReadImageArgs", "u4", 48), ("maxWriteImageArgs", "u4", 52)]),
+    "ze_device_external_memory_properties_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("memoryAllocationImportTypes", "i4", 16), ("memoryAllocationExportTypes", "i4", 20), ("imageImportTypes", "i4", 24), ("imageExportTypes", "i4", 28)]),
+    "ze_device_p2p_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16)]),
+    "ze_context_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16)]),
+    "ze_command_queue_desc_t" : (40, [("stype", "i4", 0), ("pNext", "u8", 8), ("ordinal", "u4", 16), ("index", "u4", 20), ("flags", "i4", 24), ("mode", "i4", 28), ("priority", "i4", 32)]),
+    "ze_command_list_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("commandQueueGroupOrdinal", "u4", 16), ("flags", "i4", 20)]),
+    "ze_copy_region_t" : (24, [("originX", "u4", 0), ("originY", "u4", 4), ("originZ", "u4", 8), ("width", "u4", 12), ("height", "u4", 16), ("depth", "u4", 20)]),
+    "ze_image_region_t" : (24, [("originX", "u4", 0), ("originY", "u4", 4), ("originZ", "u4", 8), ("width", "u4", 12), ("height", "u4", 16), ("depth", "u4", 20)]),
+    "ze_event_pool_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16), ("count", "u4", 20)]),
+    "ze_event_desc_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("index", "u4", 16), ("signal", "i4", 20), ("wait", "i4", 24)]),
+    "ze_kernel_timestamp_data_t" : (16, [("kernelStart", "u8", 0), ("kernelEnd", "u8", 8)]),
+    "ze_kernel_timestamp_result_t" : (32, [("global", "ze_kernel_timestamp_data_t", 0), ("context", "ze_kernel_timestamp_data_t", 16)]),
+    "ze_fence_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16)]),
+    "ze_image_format_t" : (24, [("layout", "i4", 0), ("type", "i4", 4), ("x", "i4", 8), ("y", "i4", 12), ("z", "i4", 16), ("w", "i4", 20)]),
+    "ze_image_desc_t" : (72, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16), ("type", "i4", 20), ("format", "ze_image_format_t", 24), ("width", "u8", 48), ("height", "u4", 56), ("depth", "u4", 60), ("arraylevels", "u4", 64), ("miplevels", "u4", 68)]),
+    "ze_image_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("samplerFilterFlags", "i4", 16)]),
+    "ze_device_mem_alloc_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16), ("ordinal", "u4", 20)]),
+    "ze_host_mem_alloc_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16)]),
+    "ze_memory_allocation_properties_t" : (40, [("stype", "i4", 0), ("pNext", "u8", 8), ("type", "i4", 16), ("id", "u8", 24), ("pageSize", "u8", 32)]),
+    "ze_external_memory_export_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16)]),
+    "ze_external_memory_import_fd_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16), ("fd", "i4", 20)]),
+    "ze_external_memory_export_fd_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16), ("fd", "i4", 20)]),
+    "ze_external_memory_import_win32_handle_t" : (40, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16), ("handle", "u8", 24), ("name", "u8", 32)]),
+    "ze_external_memory_export_win32_handle_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16), ("handle", "u8", 24)]),
+    "ze_module_constants_t" : (24, [("numConstants", "u4", 0), ("pConstantIds", "u8", 8), ("pConstantValues", "u8", 16)]),
+    "ze_module_desc_t" : (56, [("stype", "i4", 0), ("pNext", "u8", 8), ("format", "i4", 16), ("inputSize", "u8", 24), ("pInputModule", "u8", 32), ("pBuildFlags", "u8", 40), ("pConstants", "u8", 48)]),
+    "ze_module_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16)]),
+    "ze_kernel_desc_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16), ("pKernelName", "u8", 24)]),
+    "ze_kernel_uuid_t" : (32, [("kid", ("u1", 16), 0), ("mid", ("u1", 16), 16)]),
+    "ze_kernel_properties_t" : (96, [("stype", "i4", 0), ("pNext", "u8", 8), ("numKernelArgs", "u4", 16), ("requiredGroupSizeX", "u4", 20), ("requiredGroupSizeY", "u4", 24), ("requiredGroupSizeZ", "u4", 28), ("requiredNumSubGroups", "u4", 32), ("requiredSubgroupSize", "u4", 36), ("maxSubgroupSize", "u4", 40), ("maxNumSubgroups", "u4", 44), ("localMemSize", "u4", 48), ("privateMemSize", "u4", 52), ("spillMemSize", "u4", 56), ("uuid", "ze_kernel_uuid_t", 60)]),
+    "ze_kernel_preferred_group_size_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("preferredMultiple", "u4", 16)]),
+    "ze_group_count_t" : (12, [("groupCountX", "u4", 0), ("groupCountY", "u4", 4), ("groupCountZ", "u4", 8)]),
+    "ze_device_raytracing_ext_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16), ("maxBVHLevels", "u4", 20)]),
+    "ze_raytracing_mem_alloc_ext_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16)]),
+    "ze_sampler_desc_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("addressMode", "i4", 16), ("filterMode", "i4", 20), ("isNormalized", "u1", 24)]),
+    "ze_physical_mem_desc_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16), ("size", "u8", 24)]),
+    "ze_float_atomic_ext_properties_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("fp16Flags", "i4", 16), ("fp32Flags", "i4", 20), ("fp64Flags", "i4", 24)]),
+    "ze_driver_ddi_handles_ext_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16)]),
+    "ze_external_semaphore_ext_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16)]),
+    "ze_external_semaphore_win32_ext_desc_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("handle", "u8", 16), ("name", "u8", 24)]),
+    "ze_external_semaphore_fd_ext_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("fd", "i4", 16)]),
+    "ze_external_semaphore_signal_params_ext_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("value", "u8", 16)]),
+    "ze_external_semaphore_wait_params_ext_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("value", "u8", 16)]),
+    "ze_device_cache_line_size_ext_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("cacheLineSize", "u8", 16)]),
+    "ze_rtas_builder_ext_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("builderVersion", "i4", 16)]),
+    "ze_rtas_builder_ext_properties_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16), ("rtasBufferSizeBytesExpected", "u8", 24), ("rtasBufferSizeBytesMaxRequired", "u8", 32), ("scratchBufferSizeBytes", "u8", 40)]),
+    "ze_rtas_parallel_operation_ext_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16), ("maxConcurrency", "u4", 20)]),
+    "ze_rtas_device_ext_properties_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16), ("rtasFormat", "i4", 20), ("rtasBufferAlignment", "u4", 24)]),
+    "ze_rtas_float3_ext_t" : (12, [("x", "f4", 0), ("y", "f4", 4), ("z", "f4", 8)]),
+    "ze_rtas_transform_float3x4_column_major_ext_t" : (48, [("vx_x", "f4", 0), ("vx_y", "f4", 4), ("vx_z", "f4", 8), ("vy_x", "f4", 12), ("vy_y", "f4", 16), ("vy_z", "f4", 20), ("vz_x", "f4", 24), ("vz_y", "f4", 28), ("vz_z", "f4", 32), ("p_x", "f4", 36), ("p_y", "f4", 40), ("p_z", "f4", 44)]),
+    "ze_rtas_transform_float3x4_aligned_column_major_ext_t" : (64, [("vx_x", "f4", 0), ("vx_y", "f4", 4), ("vx_z", "f4", 8), ("pad0", "f4", 12), ("vy_x", "f4", 16), ("vy_y", "f4", 20), ("vy_z", "f4", 24), ("pad1", "f4", 28), ("vz_x", "f4", 32), ("vz_y", "f4", 36), ("vz_z", "f4", 40), ("pad2", "f4", 44), ("p_x", "f4", 48), ("p_y", "f4", 52), ("p_z", "f4", 56), ("pad3", "f4", 60)]),
+    "ze_rtas_transform_float3x4_row_major_ext_t" : (48, [("vx_x", "f4", 0), ("vy_x", "f4", 4), ("vz_x", "f4", 8), ("p_x", "f4", 12), ("vx_y", "f4", 16), ("vy_y", "f4", 20), ("vz_y", "f4", 24), ("p_y", "f4", 28), ("vx_z", "f4", 32), ("vy_z", "f4", 36), ("vz_z", "f4", 40), ("p_z", "f4", 44)]),
+    "ze_rtas_aabb_ext_t" : (24, [("lower", "ze_rtas_float3_ext_t", 0), ("upper", "ze_rtas_float3_ext_t", 12)]),
+    "ze_rtas_triangle_indices_uint32_ext_t" : (12, [("v0", "u4", 0), ("v1", "u4", 4), ("v2", "u4", 8)]),
+    "ze_rtas_quad_indices_uint32_ext_t" : (16, [("v0", "u4", 0), ("v1", "u4", 4), ("v2", "u4", 8), ("v3", "u4", 12)]),
+    "ze_rtas_builder_geometry_info_ext_t" : (1, [("geometryType", "u1", 0)]),
+    "ze_rtas_builder_triangles_geometry_info_ext_t" : (40, [("geometryType", "u1", 0), ("geometryFlags", "u1", 1), ("geometryMask", "u1", 2), ("triangleFormat", "u1", 3), ("vertexFormat", "u1", 4), ("triangleCount", "u4", 8), ("vertexCount", "u4", 12), ("triangleStride", "u4", 16), ("vertexStride", "u4", 20), ("pTriangleBuffer", "u8", 24), ("pVertexBuffer", "u8", 32)]),
+    "ze_rtas_builder_quads_geometry_info_ext_t" : (40, [("geometryType", "u1", 0), ("geometryFlags", "u1", 1), ("geometryMask", "u1", 2), ("quadFormat", "u1", 3), ("vertexFormat", "u1", 4), ("quadCount", "u4", 8), ("vertexCount", "u4", 12), ("quadStride", "u4", 16), ("vertexStride", "u4", 20), ("pQuadBuffer", "u8", 24), ("pVertexBuffer", "u8", 32)]),
+    "ze_rtas_geometry_aabbs_ext_cb_params_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("primID", "u4", 16), ("primIDCount", "u4", 20), ("pGeomUserPtr", "u8", 24), ("pBuildUserPtr", "u8", 32), ("pBoundsOut", "u8", 40)]),
+    "ze_rtas_builder_procedural_geometry_info_ext_t" : (24, [("geometryType", "u1", 0), ("geometryFlags", "u1", 1), ("geometryMask", "u1", 2), ("reserved", "u1", 3), ("primCount", "u4", 4), ("pfnGetBoundsCb", "u8", 8), ("pGeomUserPtr", "u8", 16)]),
+    "ze_rtas_builder_instance_geometry_info_ext_t" : (32, [("geometryType", "u1", 0), ("instanceFlags", "u1", 1), ("geometryMask", "u1", 2), ("transformFormat", "u1", 3), ("instanceUserID", "u4", 4), ("pTransform", "u8", 8), ("pBounds", "u8", 16), ("pAccelerationStructure", "u8", 24)]),
+    "ze_rtas_builder_build_op_ext_desc_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("rtasFormat", "i4", 16), ("buildQuality", "i4", 20), ("buildFlags", "i4", 24), ("ppGeometries", "u8", 32), ("numGeometries", "u4", 40)]),
+    "ze_device_vector_width_properties_ext_t" : (80, [("stype", "i4", 0), ("pNext", "u8", 8), ("vector_width_size", "u4", 16), ("preferred_vector_width_char", "u4", 20), ("preferred_vector_width_short", "u4", 24), ("preferred_vector_width_int", "u4", 28), ("preferred_vector_width_long", "u4", 32), ("preferred_vector_width_float", "u4", 36), ("preferred_vector_width_double", "u4", 40), ("preferred_vector_width_half", "u4", 44), ("native_vector_width_char", "u4", 48), ("native_vector_width_short", "u4", 52), ("native_vector_width_int", "u4", 56), ("native_vector_width_long", "u4", 60), ("native_vector_width_float", "u4", 64), ("native_vector_width_double", "u4", 68), ("native_vector_width_half", "u4", 72)]),
+    "ze_cache_reservation_ext_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("maxCacheReservationSize", "u8", 16)]),
+    "ze_image_view_planar_ext_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("planeIndex", "u4", 16)]),
+    "ze_eu_count_ext_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("numTotalEUs", "u4", 16)]),
+    "ze_pci_address_ext_t" : (16, [("domain", "u4", 0), ("bus", "u4", 4), ("device", "u4", 8), ("function", "u4", 12)]),
+    "ze_pci_speed_ext_t" : (16, [("genVersion", "i4", 0), ("width", "i4", 4), ("maxBandwidth", "i8", 8)]),
+    "ze_pci_ext_properties_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("address", "ze_pci_address_ext_t", 16), ("maxSpeed", "ze_pci_speed_ext_t", 32)]),
+    "ze_srgb_ext_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("sRGB", "u1", 16)]),
+    "ze_image_allocation_ext_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("id", "u8", 16)]),
+    "ze_linkage_inspection_ext_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16)]),
+    "ze_memory_compression_hints_ext_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16)]),
+    "ze_driver_memory_free_ext_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("freePolicies", "i4", 16)]),
+    "ze_memory_free_ext_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("freePolicy", "i4", 16)]),
+    "ze_device_luid_ext_t" : (8, [("id", ("u1", 8), 0)]),
+    "ze_device_luid_ext_properties_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("luid", "ze_device_luid_ext_t", 16), ("nodeMask", "u4", 24)]),
+    "ze_device_memory_ext_properties_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("type", "i4", 16), ("physicalSize", "u8", 24), ("readBandwidth", "u4", 32), ("writeBandwidth", "u4", 36), ("bandwidthUnit", "i4", 40)]),
+    "ze_device_ip_version_ext_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("ipVersion", "u4", 16)]),
+    "ze_kernel_max_group_size_properties_ext_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("maxGroupSize", "u4", 16)]),
+    "ze_sub_allocation_t" : (16, [("base", "u8", 0), ("size", "u8", 8)]),
+    "ze_event_query_kernel_timestamps_ext_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16)]),
+    "ze_synchronized_timestamp_data_ext_t" : (16, [("kernelStart", "u8", 0), ("kernelEnd", "u8", 8)]),
+    "ze_synchronized_timestamp_result_ext_t" : (32, [("global", "ze_synchronized_timestamp_data_ext_t", 0), ("context", "ze_synchronized_timestamp_data_ext_t", 16)]),
+    "ze_event_query_kernel_timestamps_results_ext_properties_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("pKernelTimestampsBuffer", "u8", 16), ("pSynchronizedTimestampsBuffer", "u8", 24)]),
+    "ze_global_callbacks_t" : (8, [("pfnInitCb", "u8", 0)]),
+    "ze_driver_callbacks_t" : (40, [("pfnGetCb", "u8", 0), ("pfnGetApiVersionCb", "u8", 8), ("pfnGetPropertiesCb", "u8", 16), ("pfnGetIpcPropertiesCb", "u8", 24), ("pfnGetExtensionPropertiesCb", "u8", 32)]),
+    "ze_device_callbacks_t" : (112, [("pfnGetCb", "u8", 0), ("pfnGetSubDevicesCb", "u8", 8), ("pfnGetPropertiesCb", "u8", 16), ("pfnGetComputePropertiesCb", "u8", 24), ("pfnGetModulePropertiesCb", "u8", 32), ("pfnGetCommandQueueGroupPropertiesCb", "u8", 40), ("pfnGetMemoryPropertiesCb", "u8", 48), ("pfnGetMemoryAccessPropertiesCb", "u8", 56), ("pfnGetCachePropertiesCb", "u8", 64), ("pfnGetImagePropertiesCb", "u8", 72), ("pfnGetExternalMemoryPropertiesCb", "u8", 80), ("pfnGetP2PPropertiesCb", "u8", 88), ("pfnCanAccessPeerCb", "u8", 96), ("pfnGetStatusCb", "u8", 104)]),
+    "ze_context_callbacks_t" : (64, [("pfnCreateCb", "u8", 0), ("pfnDestroyCb", "u8", 8), ("pfnGetStatusCb", "u8", 16), ("pfnSystemBarrierCb", "u8", 24), ("pfnMakeMemoryResidentCb", "u8", 32), ("pfnEvictMemoryCb", "u8", 40), ("pfnMakeImageResidentCb", "u8", 48), ("pfnEvictImageCb", "u8", 56)]),
+    "ze_command_queue_callbacks_t" : (32, [("pfnCreateCb", "u8", 0), ("pfnDestroyCb", "u8", 8), ("pfnExecuteCommandListsCb", "u8", 16), ("pfnSynchronizeCb", "u8", 24)]),
+    "ze_command_list_callbacks_t" : (208, [("pfnCreateCb", "u8", 0), ("pfnCreateImmediateCb", "u8", 8), ("pfnDestroyCb", "u8", 16), ("pfnCloseCb", "u8", 24), ("pfnResetCb", "u8", 32), ("pfnAppendWriteGlobalTimestampCb", "u8", 40), ("pfnAppendBarrierCb", "u8", 48), ("pfnAppendMemoryRangesBarrierCb", "u8", 56), ("pfnAppendMemoryCopyCb", "u8", 64), ("pfnAppendMemoryFillCb", "u8", 72), ("pfnAppendMemoryCopyRegionCb", "u8", 80), ("pfnAppendMemoryCopyFromContextCb", "u8", 88), ("pfnAppendImageCopyCb", "u8", 96), ("pfnAppendImageCopyRegionCb", "u8", 104), ("pfnAppendImageCopyToMemoryCb", "u8", 112), ("pfnAppendImageCopyFromMemoryCb", "u8", 120), ("pfnAppendMemoryPrefetchCb", "u8", 128), ("pfnAppendMemAdviseCb", "u8", 136), ("pfnAppendSignalEventCb", "u8", 144), ("pfnAppendWaitOnEventsCb", "u8", 152), ("pfnAppendEventResetCb", "u8", 160), ("pfnAppendQueryKernelTimestampsCb", "u8", 168), ("pfnAppendLaunchKernelCb", "u8", 176), ("pfnAppendLaunchCooperativeKernelCb", "u8", 184), ("pfnAppendLaunchKernelIndirectCb", "u8", 192), ("pfnAppendLaunchMultipleKernelsIndirectCb", "u8", 200)]),
+    "ze_image_callbacks_t" : (24, [("pfnGetPropertiesCb", "u8", 0), ("pfnCreateCb", "u8", 8), ("pfnDestroyCb", "u8", 16)]),
+    "ze_mem_callbacks_t" : (72, [("pfnAllocSharedCb", "u8", 0), ("pfnAllocDeviceCb", "u8", 8), ("pfnAllocHostCb", "u8", 16), ("pfnFreeCb", "u8", 24), ("pfnGetAllocPropertiesCb", "u8", 32), ("pfnGetAddressRangeCb", "u8", 40), ("pfnGetIpcHandleCb", "u8", 48), ("pfnOpenIpcHandleCb", "u8", 56), ("pfnCloseIpcHandleCb", "u8", 64)]),
+    "ze_fence_callbacks_t" : (40, [("pfnCreateCb", "u8", 0), ("pfnDestroyCb", "u8", 8), ("pfnHostSynchronizeCb", "u8", 16), ("pfnQueryStatusCb", "u8", 24), ("pfnResetCb", "u8", 32)]),
+    "ze_event_pool_callbacks_t" : (40, [("pfnCreateCb", "u8", 0), ("pfnDestroyCb", "u8", 8), ("pfnGetIpcHandleCb", "u8", 16), ("pfnOpenIpcHandleCb", "u8", 24), ("pfnCloseIpcHandleCb", "u8", 32)]),
+    "ze_event_callbacks_t" : (56, [("pfnCreateCb", "u8", 0), ("pfnDestroyCb", "u8", 8), ("pfnHostSignalCb", "u8", 16), ("pfnHostSynchronizeCb", "u8", 24), ("pfnQueryStatusCb", "u8", 32), ("pfnHostResetCb", "u8", 40), ("pfnQueryKernelTimestampCb", "u8", 48)]),
+    "ze_module_callbacks_t" : (64, [("pfnCreateCb", "u8", 0), ("pfnDestroyCb", "u8", 8), ("pfnDynamicLinkCb", "u8", 16), ("pfnGetNativeBinaryCb", "u8", 24), ("pfnGetGlobalPointerCb", "u8", 32), ("pfnGetKernelNamesCb", "u8", 40), ("pfnGetPropertiesCb", "u8", 48), ("pfnGetFunctionPointerCb", "u8", 56)]),
+    "ze_module_build_log_callbacks_t" : (16, [("pfnDestroyCb", "u8", 0), ("pfnGetStringCb", "u8", 8)]),
+    "ze_kernel_callbacks_t" : (96, [("pfnCreateCb", "u8", 0), ("pfnDestroyCb", "u8", 8), ("pfnSetCacheConfigCb", "u8", 16), ("pfnSetGroupSizeCb", "u8", 24), ("pfnSuggestGroupSizeCb", "u8", 32), ("pfnSuggestMaxCooperativeGroupCountCb", "u8", 40), ("pfnSetArgumentValueCb", "u8", 48), ("pfnSetIndirectAccessCb", "u8", 56), ("pfnGetIndirectAccessCb", "u8", 64), ("pfnGetSourceAttributesCb", "u8", 72), ("pfnGetPropertiesCb", "u8", 80), ("pfnGetNameCb", "u8", 88)]),
+    "ze_sampler_callbacks_t" : (16, [("pfnCreateCb", "u8", 0), ("pfnDestroyCb", "u8", 8)]),
+    "ze_physical_mem_callbacks_t" : (16, [("pfnCreateCb", "u8", 0), ("pfnDestroyCb", "u8", 8)]),
+    "ze_virtual_mem_callbacks_t" : (56, [("pfnReserveCb", "u8", 0), ("pfnFreeCb", "u8", 8), ("pfnQueryPageSizeCb", "u8", 16), ("pfnMapCb", "u8", 24), ("pfnUnmapCb", "u8", 32), ("pfnSetAccessAttributeCb", "u8", 40), ("pfnGetAccessAttributeCb", "u8", 48)]),
+    "ze_callbacks_t" : (960, [("Global", "ze_global_callbacks_t", 0), ("Driver", "ze_driver_callbacks_t", 8), ("Device", "ze_device_callbacks_t", 48), ("Context", "ze_context_callbacks_t", 160), ("CommandQueue", "ze_command_queue_callbacks_t", 224), ("CommandList", "ze_command_list_callbacks_t", 256), ("Fence", "ze_fence_callbacks_t", 464), ("EventPool", "ze_event_pool_callbacks_t", 504), ("Event", "ze_event_callbacks_t", 544), ("Image", "ze_image_callbacks_t", 600), ("Module", "ze_module_callbacks_t", 624), ("ModuleBuildLog", "ze_module_build_log_callbacks_t", 688), ("Kernel", "ze_kernel_callbacks_t", 704), ("Sampler", "ze_sampler_callbacks_t", 800), ("PhysicalMem", "ze_physical_mem_callbacks_t", 816), ("Mem", "ze_mem_callbacks_t", 832), ("VirtualMem", "ze_virtual_mem_callbacks_t", 904)]),
+    "_ze_rtas_builder_dditable_t" : (40, [("pfnCreateExt", "u8", 0), ("pfnGetBuildPropertiesExt", "u8", 8), ("pfnBuildExt", "u8", 16), ("pfnCommandListAppendCopyExt", "u8", 24), ("pfnDestroyExt", "u8", 32)]),
+    "_ze_rtas_builder_exp_dditable_t" : (32, [("pfnCreateExp", "u8", 0), ("pfnGetBuildPropertiesExp", "u8", 8), ("pfnBuildExp", "u8", 16), ("pfnDestroyExp", "u8", 24)]),
+    "_ze_rtas_parallel_operation_dditable_t" : (32, [("pfnCreateExt", "u8", 0), ("pfnGetPropertiesExt", "u8", 8), ("pfnJoinExt", "u8", 16), ("pfnDestroyExt", "u8", 24)]),
+    "_ze_rtas_parallel_operation_exp_dditable_t" : (32, [("pfnCreateExp", "u8", 0), ("pfnGetPropertiesExp", "u8", 8), ("pfnJoinExp", "u8", 16), ("pfnDestroyExp", "u8", 24)]),
+    "_ze_global_dditable_t" : (16, [("pfnInit", "u8", 0), ("pfnInitDrivers", "u8", 8)]),
+    "_ze_driver_dditable_t" : (64, [("pfnGet", "u8", 0), ("pfnGetApiVersion", "u8", 8), ("pfnGetProperties", "u8", 16), ("pfnGetIpcProperties", "u8", 24), ("pfnGetExtensionProperties", "u8", 32), ("pfnGetExtensionFunctionAddress", "u8", 40), ("pfnGetLastErrorDescription", "u8", 48), ("pfnRTASFormatCompatibilityCheckExt", "u8", 56)]),
+    "_ze_driver_exp_dditable_t" : (8, [("pfnRTASFormatCompatibilityCheckExp", "u8", 0)]),
+    "_ze_device_dditable_t" : (176, [("pfnGet", "u8", 0), ("pfnGetSubDevices", "u8", 8), ("pfnGetProperties", "u8", 16), ("pfnGetComputeProperties", "u8", 24), ("pfnGetModuleProperties", "u8", 32), ("pfnGetCommandQueueGroupProperties", "u8", 40), ("pfnGetMemoryProperties", "u8", 48), ("pfnGetMemoryAccessProperties", "u8", 56), ("pfnGetCacheProperties", "u8", 64), ("pfnGetImageProperties", "u8", 72), ("pfnGetExternalMemoryProperties", "u8", 80), ("pfnGetP2PProperties", "u8", 88), ("pfnCanAccessPeer", "u8", 96), ("pfnGetStatus", "u8", 104), ("pfnGetGlobalTimestamps", "u8", 112), ("pfnReserveCacheExt", "u8", 120), ("pfnSetCacheAdviceExt", "u8", 128), ("pfnPciGetPropertiesExt", "u8", 136), ("pfnGetRootDevice", "u8", 144), ("pfnImportExternalSemaphoreExt", "u8", 152), ("pfnReleaseExternalSemaphoreExt", "u8", 160), ("pfnGetVectorWidthPropertiesExt", "u8", 168)]),
+    "_ze_device_exp_dditable_t" : (8, [("pfnGetFabricVertexExp", "u8", 0)]),
+    "_ze_context_dditable_t" : (72, [("pfnCreate", "u8", 0), ("pfnDestroy", "u8", 8), ("pfnGetStatus", "u8", 16), ("pfnSystemBarrier", "u8", 24), ("pfnMakeMemoryResident", "u8", 32), ("pfnEvictMemory", "u8", 40), ("pfnMakeImageResident", "u8", 48), ("pfnEvictImage", "u8", 56), ("pfnCreateEx", "u8", 64)]),
+    "_ze_command_queue_dditable_t" : (48, [("pfnCreate", "u8", 0), ("pfnDestroy", "u8", 8), ("pfnExecuteCommandLists", "u8", 16), ("pfnSynchronize", "u8", 24), ("pfnGetOrdinal", "u8", 32), ("pfnGetIndex", "u8", 40)]),
+    "_ze_command_list_dditable_t" : (288, [("pfnCreate", "u8", 0), ("pfnCreateImmediate", "u8", 8), ("pfnDestroy", "u8", 16), ("pfnClose", "u8", 24), ("pfnReset", "u8", 32), ("pfnAppendWriteGlobalTimestamp", "u8", 40), ("pfnAppendBarrier", "u8", 48), ("pfnAppendMemoryRangesBarrier", "u8", 56), ("pfnAppendMemoryCopy", "u8", 64), ("pfnAppendMemoryFill", "u8", 72), ("pfnAppendMemoryCopyRegion", "u8", 80), ("pfnAppendMemoryCopyFromContext", "u8", 88), ("pfnAppendImageCopy", "u8", 96), ("pfnAppendImageCopyRegion", "u8", 104), ("pfnAppendImageCopyToMemory", "u8", 112), ("pfnAppendImageCopyFromMemory", "u8", 120), ("pfnAppendMemoryPrefetch", "u8", 128), ("pfnAppendMemAdvise", "u8", 136), ("pfnAppendSignalEvent", "u8", 144), ("pfnAppendWaitOnEvents", "u8", 152), ("pfnAppendEventReset", "u8", 160), ("pfnAppendQueryKernelTimestamps", "u8", 168), ("pfnAppendLaunchKernel", "u8", 176), ("pfnAppendLaunchCooperativeKernel", "u8", 184), ("pfnAppendLaunchKernelIndirect", "u8", 192), ("pfnAppendLaunchMultipleKernelsIndirect", "u8", 200), ("pfnAppendImageCopyToMemoryExt", "u8", 208), ("pfnAppendImageCopyFromMemoryExt", "u8", 216), ("pfnHostSynchronize", "u8", 224), ("pfnGetDeviceHandle", "u8", 232), ("pfnGetContextHandle", "u8", 240), ("pfnGetOrdinal", "u8", 248), ("pfnImmediateGetIndex", "u8", 256), ("pfnIsImmediate", "u8", 264), ("pfnAppendSignalExternalSemaphoreExt", "u8", 272), ("pfnAppendWaitExternalSemaphoreExt", "u8", 280)]),
+    "_ze_command_list_exp_dditable_t" : (64, [("pfnCreateCloneExp", "u8", 0), ("pfnImmediateAppendCommandListsExp", "u8", 8), ("pfnGetNextCommandIdExp", "u8", 16), ("pfnUpdateMutableCommandsExp", "u8", 24), ("pfnUpdateMutableCommandSignalEventExp", "u8", 32), ("pfnUpdateMutableCommandWaitEventsExp", "u8", 40), ("pfnGetNextCommandIdWithKernelsExp", "u8", 48), ("pfnUpdateMutableCommandKernelsExp", "u8", 56)]),
+    "_ze_image_dditable_t" : (40, [("pfnGetProperties", "u8", 0), ("pfnCreate", "u8", 8), ("pfnDestroy", "u8", 16), ("pfnGetAllocPropertiesExt", "u8", 24), ("pfnViewCreateExt", "u8", 32)]),
+    "_ze_image_exp_dditable_t" : (24, [("pfnGetMemoryPropertiesExp", "u8", 0), ("pfnViewCreateExp", "u8", 8), ("pfnGetDeviceOffsetExp", "u8", 16)]),
+    "_ze_mem_dditable_t" : (96, [("pfnAllocShared", "u8", 0), ("pfnAllocDevice", "u8", 8), ("pfnAllocHost", "u8", 16), ("pfnFree", "u8", 24), ("pfnGetAllocProperties", "u8", 32), ("pfnGetAddressRange", "u8", 40), ("pfnGetIpcHandle", "u8", 48), ("pfnOpenIpcHandle", "u8", 56), ("pfnCloseIpcHandle", "u8", 64), ("pfnFreeExt", "u8", 72), ("pfnPutIpcHandle", "u8", 80), ("pfnGetPitchFor2dImage", "u8", 88)]),
+    "_ze_mem_exp_dditable_t" : (32, [("pfnGetIpcHandleFromFileDescriptorExp", "u8", 0), ("pfnGetFileDescriptorFromIpcHandleExp", "u8", 8), ("pfnSetAtomicAccessAttributeExp", "u8", 16), ("pfnGetAtomicAccessAttributeExp", "u8", 24)]),
+    "_ze_fence_dditable_t" : (40, [("pfnCreate", "u8", 0), ("pfnDestroy", "u8", 8), ("pfnHostSynchronize", "u8", 16), ("pfnQueryStatus", "u8", 24), ("pfnReset", "u8", 32)]),
+    "_ze_event_pool_dditable_t" : (64, [("pfnCreate", "u8", 0), ("pfnDestroy", "u8", 8), ("pfnGetIpcHandle", "u8", 16), ("pfnOpenIpcHandle", "u8", 24), ("pfnCloseIpcHandle", "u8", 32), ("pfnPutIpcHandle", "u8", 40), ("pfnGetContextHandle", "u8", 48), ("pfnGetFlags", "u8", 56)]),
+    "_ze_event_dditable_t" : (88, [("pfnCreate", "u8", 0), ("pfnDestroy", "u8", 8), ("pfnHostSignal", "u8", 16), ("pfnHostSynchronize", "u8", 24), ("pfnQueryStatus", "u8", 32), ("pfnHostReset", "u8", 40), ("pfnQueryKernelTimestamp", "u8", 48), ("pfnQueryKernelTimestampsExt", "u8", 56), ("pfnGetEventPool", "u8", 64), ("pfnGetSignalScope", "u8", 72), ("pfnGetWaitScope", "u8", 80)]),
+    "_ze_event_exp_dditable_t" : (8, [("pfnQueryTimestampsExp", "u8", 0)]),
+    "_ze_module_dditable_t" : (72, [("pfnCreate", "u8", 0), ("pfnDestroy", "u8", 8), ("pfnDynamicLink", "u8", 16), ("pfnGetNativeBinary", "u8", 24), ("pfnGetGlobalPointer", "u8", 32), ("pfnGetKernelNames", "u8", 40), ("pfnGetProperties", "u8", 48), ("pfnGetFunctionPointer", "u8", 56), ("pfnInspectLinkageExt", "u8", 64)]),
+    "_ze_module_build_log_dditable_t" : (16, [("pfnDestroy", "u8", 0), ("pfnGetString", "u8", 8)]),
+    "_ze_kernel_dditable_t" : (96, [("pfnCreate", "u8", 0), ("pfnDestroy", "u8", 8), ("pfnSetCacheConfig", "u8", 16), ("pfnSetGroupSize", "u8", 24), ("pfnSuggestGroupSize", "u8", 32), ("pfnSuggestMaxCooperativeGroupCount", "u8", 40), ("pfnSetArgumentValue", "u8", 48), ("pfnSetIndirectAccess", "u8", 56), ("pfnGetIndirectAccess", "u8", 64), ("pfnGetSourceAttributes", "u8", 72), ("pfnGetProperties", "u8", 80), ("pfnGetName", "u8", 88)]),
+    "_ze_kernel_exp_dditable_t" : (24, [("pfnSetGlobalOffsetExp", "u8", 0), ("pfnSchedulingHintExp", "u8", 8), ("pfnGetBinaryExp", "u8", 16)]),
+    "_ze_sampler_dditable_t" : (16, [("pfnCreate", "u8", 0), ("pfnDestroy", "u8", 8)]),
+    "_ze_physical_mem_dditable_t" : (16, [("pfnCreate", "u8", 0), ("pfnDestroy", "u8", 8)]),
+    "_ze_virtual_mem_dditable_t" : (56, [("pfnReserve", "u8", 0), ("pfnFree", "u8", 8), ("pfnQueryPageSize", "u8", 16), ("pfnMap", "u8", 24), ("pfnUnmap", "u8", 32), ("pfnSetAccessAttribute", "u8", 40), ("pfnGetAccessAttribute", "u8", 48)]),
+    "_ze_fabric_vertex_exp_dditable_t" : (32, [("pfnGetExp", "u8", 0), ("pfnGetSubVerticesExp", "u8", 8), ("pfnGetPropertiesExp", "u8", 16), ("pfnGetDeviceExp", "u8", 24)]),
+    "_ze_fabric_edge_exp_dditable_t" : (24, [("pfnGetExp", "u8", 0), ("pfnGetVerticesExp", "u8", 8), ("pfnGetPropertiesExp", "u8", 16)]),
+    "_ze_dditable_t" : (1624, [("RTASBuilder", "_ze_rtas_builder_dditable_t", 0), ("RTASBuilderExp", "_ze_rtas_builder_exp_dditable_t", 40), ("RTASParallelOperation", "_ze_rtas_parallel_operation_dditable_t", 72), ("RTASParallelOperationExp", "_ze_rtas_parallel_operation_exp_dditable_t", 104), ("Global", "_ze_global_dditable_t", 136), ("Driver", "_ze_driver_dditable_t", 152), ("DriverExp", "_ze_driver_exp_dditable_t", 216), ("Device", "_ze_device_dditable_t", 224), ("DeviceExp", "_ze_device_exp_dditable_t", 400), ("Context", "_ze_context_dditable_t", 408), ("CommandQueue", "_ze_command_queue_dditable_t", 480), ("CommandList", "_ze_command_list_dditable_t", 528), ("CommandListExp", "_ze_command_list_exp_dditable_t", 816), ("Image", "_ze_image_dditable_t", 880), ("ImageExp", "_ze_image_exp_dditable_t", 920), ("Mem", "_ze_mem_dditable_t", 944), ("MemExp", "_ze_mem_exp_dditable_t", 1040), ("Fence", "_ze_fence_dditable_t", 1072), ("EventPool", "_ze_event_pool_dditable_t", 1112), ("Event", "_ze_event_dditable_t", 1176), ("EventExp", "_ze_event_exp_dditable_t", 1264), ("Module", "_ze_module_dditable_t", 1272), ("ModuleBuildLog", "_ze_module_build_log_dditable_t", 1344), ("Kernel", "_ze_kernel_dditable_t", 1360), ("KernelExp", "_ze_kernel_exp_dditable_t", 1456), ("Sampler", "_ze_sampler_dditable_t", 1480), ("PhysicalMem", "_ze_physical_mem_dditable_t", 1496), ("VirtualMem", "_ze_virtual_mem_dditable_t", 1512), ("FabricVertexExp", "_ze_fabric_vertex_exp_dditable_t", 1568), ("FabricEdgeExp", "_ze_fabric_edge_exp_dditable_t", 1600)]),
+    "ze_module_program_exp_desc_t" : (56, [("stype", "i4", 0), ("pNext", "u8", 8), ("count", "u4", 16), ("inputSizes", "u8", 24), ("pInputModules", "u8", 32), ("pBuildFlags", "u8", 40), ("pConstants", "u8", 48)]),
+    "ze_relaxed_allocation_limits_exp_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16)]),
+    "ze_image_memory_properties_exp_t" : (40, [("stype", "i4", 0), ("pNext", "u8", 8), ("size", "u8", 16), ("rowPitch", "u8", 24), ("slicePitch", "u8", 32)]),
+    "ze_image_view_planar_exp_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("planeIndex", "u4", 16)]),
+    "ze_scheduling_hint_exp_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("schedulingHintFlags", "i4", 16)]),
+    "ze_scheduling_hint_exp_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16)]),
+    "ze_context_power_saving_hint_exp_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("hint", "u4", 16)]),
+    "ze_device_p2p_bandwidth_exp_properties_t" : (40, [("stype", "i4", 0), ("pNext", "u8", 8), ("logicalBandwidth", "u4", 16), ("physicalBandwidth", "u4", 20), ("bandwidthUnit", "i4", 24), ("logicalLatency", "u4", 28), ("physicalLatency", "u4", 32), ("latencyUnit", "i4", 36)]),
+    "ze_copy_bandwidth_exp_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("copyBandwidth", "u4", 16), ("copyBandwidthUnit", "i4", 20)]),
+    "ze_fabric_vertex_pci_exp_address_t" : (16, [("domain", "u4", 0), ("bus", "u4", 4), ("device", "u4", 8), ("function", "u4", 12)]),
+    "ze_fabric_vertex_exp_properties_t" : (56, [("stype", "i4", 0), ("pNext", "u8", 8), ("uuid", "ze_uuid_t", 16), ("type", "i4", 32), ("remote", "u1", 36), ("address", "ze_fabric_vertex_pci_exp_address_t", 40)]),
+    "ze_fabric_edge_exp_properties_t" : (312, [("stype", "i4", 0), ("pNext", "u8", 8), ("uuid", "ze_uuid_t", 16), ("model", "S256", 32), ("bandwidth", "u4", 288), ("bandwidthUnit", "i4", 292), ("latency", "u4", 296), ("latencyUnit", "i4", 300), ("duplexity", "i4", 304)]),
+    "ze_memory_sub_allocations_exp_properties_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("pCount", "u8", 16), ("pSubAllocations", "u8", 24)]),
+    "ze_rtas_builder_exp_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("builderVersion", "i4", 16)]),
+    "ze_rtas_builder_exp_properties_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16), ("rtasBufferSizeBytesExpected", "u8", 24), ("rtasBufferSizeBytesMaxRequired", "u8", 32), ("scratchBufferSizeBytes", "u8", 40)]),
+    "ze_rtas_parallel_operation_exp_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16), ("maxConcurrency", "u4", 20)]),
+    "ze_rtas_device_exp_properties_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16), ("rtasFormat", "i4", 20), ("rtasBufferAlignment", "u4", 24)]),
+    "ze_rtas_float3_exp_t" : (12, [("x", "f4", 0), ("y", "f4", 4), ("z", "f4", 8)]),
+    "ze_rtas_transform_float3x4_column_major_exp_t" : (48, [("vx_x", "f4", 0), ("vx_y", "f4", 4), ("vx_z", "f4", 8), ("vy_x", "f4", 12), ("vy_y", "f4", 16), ("vy_z", "f4", 20), ("vz_x", "f4", 24), ("vz_y", "f4", 28), ("vz_z", "f4", 32), ("p_x", "f4", 36), ("p_y", "f4", 40), ("p_z", "f4", 44)]),
+    "ze_rtas_transform_float3x4_aligned_column_major_exp_t" : (64, [("vx_x", "f4", 0), ("vx_y", "f4", 4), ("vx_z", "f4", 8), ("pad0", "f4", 12), ("vy_x", "f4", 16), ("vy_y", "f4", 20), ("vy_z", "f4", 24), ("pad1", "f4", 28), ("vz_x", "f4", 32), ("vz_y", "f4", 36), ("vz_z", "f4", 40), ("pad2", "f4", 44), ("p_x", "f4", 48), ("p_y", "f4", 52), ("p_z", "f4", 56), ("pad3", "f4", 60)]),
+    "ze_rtas_transform_float3x4_row_major_exp_t" : (48, [("vx_x", "f4", 0), ("vy_x", "f4", 4), ("vz_x", "f4", 8), ("p_x", "f4", 12), ("vx_y", "f4", 16), ("vy_y", "f4", 20), ("vz_y", "f4", 24), ("p_y", "f4", 28), ("vx_z", "f4", 32), ("vy_z", "f4", 36), ("vz_z", "f4", 40), ("p_z", "f4", 44)]),
+    "ze_rtas_aabb_exp_t" : (24, [("lower", "ze_rtas_float3_exp_t", 0), ("upper", "ze_rtas_float3_exp_t", 12)]),
+    "ze_rtas_triangle_indices_uint32_exp_t" : (12, [("v0", "u4", 0), ("v1", "u4", 4), ("v2", "u4", 8)]),
+    "ze_rtas_quad_indices_uint32_exp_t" : (16, [("v0", "u4", 0), ("v1", "u4", 4), ("v2", "u4", 8), ("v3", "u4", 12)]),
+    "ze_rtas_builder_geometry_info_exp_t" : (1, [("geometryType", "u1", 0)]),
+    "ze_rtas_builder_triangles_geometry_info_exp_t" : (40, [("geometryType", "u1", 0), ("geometryFlags", "u1", 1), ("geometryMask", "u1", 2), ("triangleFormat", "u1", 3), ("vertexFormat", "u1", 4), ("triangleCount", "u4", 8), ("vertexCount", "u4", 12), ("triangleStride", "u4", 16), ("vertexStride", "u4", 20), ("pTriangleBuffer", "u8", 24), ("pVertexBuffer", "u8", 32)]),
+    "ze_rtas_builder_quads_geometry_info_exp_t" : (40, [("geometryType", "u1", 0), ("geometryFlags", "u1", 1), ("geometryMask", "u1", 2), ("quadFormat", "u1", 3), ("vertexFormat", "u1", 4), ("quadCount", "u4", 8), ("vertexCount", "u4", 12), ("quadStride", "u4", 16), ("vertexStride", "u4", 20), ("pQuadBuffer", "u8", 24), ("pVertexBuffer", "u8", 32)]),
+    "ze_rtas_geometry_aabbs_exp_cb_params_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("primID", "u4", 16), ("primIDCount", "u4", 20), ("pGeomUserPtr", "u8", 24), ("pBuildUserPtr", "u8", 32), ("pBoundsOut", "u8", 40)]),
+    "ze_rtas_builder_procedural_geometry_info_exp_t" : (24, [("geometryType", "u1", 0), ("geometryFlags", "u1", 1), ("geometryMask", "u1", 2), ("reserved", "u1", 3), ("primCount", "u4", 4), ("pfnGetBoundsCb", "u8", 8), ("pGeomUserPtr", "u8", 16)]),
+    "ze_rtas_builder_instance_geometry_info_exp_t" : (32, [("geometryType", "u1", 0), ("instanceFlags", "u1", 1), ("geometryMask", "u1", 2), ("transformFormat", "u1", 3), ("instanceUserID", "u4", 4), ("pTransform", "u8", 8), ("pBounds", "u8", 16), ("pAccelerationStructure", "u8", 24)]),
+    "ze_rtas_builder_build_op_exp_desc_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("rtasFormat", "i4", 16), ("buildQuality", "i4", 20), ("buildFlags", "i4", 24), ("ppGeometries", "u8", 32), ("numGeometries", "u4", 40)]),
+    "ze_event_pool_counter_based_exp_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16)]),
+    "ze_image_bindless_exp_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16)]),
+    "ze_image_pitched_exp_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("ptr", "u8", 16)]),
+    "ze_device_pitched_alloc_exp_properties_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("maxImageLinearWidth", "u8", 16), ("maxImageLinearHeight", "u8", 24)]),
+    "ze_mutable_command_id_exp_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16)]),
+    "ze_mutable_command_list_exp_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("mutableCommandListFlags", "i4", 16), ("mutableCommandFlags", "i4", 20)]),
+    "ze_mutable_command_list_exp_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16)]),
+    "ze_mutable_commands_exp_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "u4", 16)]),
+    "ze_mutable_kernel_argument_exp_desc_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("commandId", "u8", 16), ("argIndex", "u4", 24), ("argSize", "u8", 32), ("pArgValue", "u8", 40)]),
+    "ze_mutable_group_count_exp_desc_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("commandId", "u8", 16), ("pGroupCount", "u8", 24)]),
+    "ze_mutable_group_size_exp_desc_t" : (40, [("stype", "i4", 0), ("pNext", "u8", 8), ("commandId", "u8", 16), ("groupSizeX", "u4", 24), ("groupSizeY", "u4", 28), ("groupSizeZ", "u4", 32)]),
+    "ze_mutable_global_offset_exp_desc_t" : (40, [("stype", "i4", 0), ("pNext", "u8", 8), ("commandId", "u8", 16), ("offsetX", "u4", 24), ("offsetY", "u4", 28), ("offsetZ", "u4", 32)]),
+    "ze_mutable_graph_argument_exp_desc_t" : (40, [("stype", "i4", 0), ("pNext", "u8", 8), ("commandId", "u8", 16), ("argIndex", "u4", 24), ("pArgValue", "u8", 32)]),
+    "zes_base_properties_t" : (16, [("stype", "i4", 0), ("pNext", "u8", 8)]),
+    "zes_base_desc_t" : (16, [("stype", "i4", 0), ("pNext", "u8", 8)]),
+    "zes_base_state_t" : (16, [("stype", "i4", 0), ("pNext", "u8", 8)]),
+    "zes_base_config_t" : (16, [("stype", "i4", 0), ("pNext", "u8", 8)]),
+    "zes_base_capability_t" : (16, [("stype", "i4", 0), ("pNext", "u8", 8)]),
+    "zes_driver_extension_properties_t" : (260, [("name", "S256", 0), ("version", "u4", 256)]),
+    "zes_device_state_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("reset", "i4", 16), ("repaired", "i4", 20)]),
+    "zes_reset_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("force", "u1", 16), ("resetType", "i4", 20)]),
+    "zes_uuid_t" : (16, [("id", ("u1", 16), 0)]),
+    "zes_device_properties_t" : (776, [("stype", "i4", 0), ("pNext", "u8", 8), ("core", "ze_device_properties_t", 16), ("numSubdevices", "u4", 384), ("serialNumber", "S64", 388), ("boardNumber", "S64", 452), ("brandName", "S64", 516), ("modelName", "S64", 580), ("vendorName", "S64", 644), ("driverVersion", "S64", 708)]),
+    "zes_device_ext_properties_t" : (40, [("stype", "i4", 0), ("pNext", "u8", 8), ("uuid", "zes_uuid_t", 16), ("type", "i4", 32), ("flags", "i4", 36)]),
+    "zes_process_state_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("processId", "u4", 16), ("memSize", "u8", 24), ("sharedSize", "u8", 32), ("engines", "i4", 40)]),
+    "zes_pci_address_t" : (16, [("domain", "u4", 0), ("bus", "u4", 4), ("device", "u4", 8), ("function", "u4", 12)]),
+    "zes_pci_speed_t" : (16, [("gen", "i4", 0), ("width", "i4", 4), ("maxBandwidth", "i8", 8)]),
+    "zes_pci_properties_t" : (56, [("stype", "i4", 0), ("pNext", "u8", 8), ("address", "zes_pci_address_t", 16), ("maxSpeed", "zes_pci_speed_t", 32), ("haveBandwidthCounters", "u1", 48), ("havePacketCounters", "u1", 49), ("haveReplayCounters", "u1", 50)]),
+    "zes_pci_state_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("status", "i4", 16), ("qualityIssues", "i4", 20), ("stabilityIssues", "i4", 24), ("speed", "zes_pci_speed_t", 32)]),
+    "zes_pci_bar_properties_t" : (40, [("stype", "i4", 0), ("pNext", "u8", 8), ("type", "i4", 16), ("index", "u4", 20), ("base", "u8", 24), ("size", "u8", 32)]),
+    "zes_pci_bar_properties_1_2_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("type", "i4", 16), ("index", "u4", 20), ("base", "u8", 24), ("size", "u8", 32), ("resizableBarSupported", "u1", 40), ("resizableBarEnabled", "u1", 41)]),
+    "zes_pci_stats_t" : (56, [("timestamp", "u8", 0), ("replayCounter", "u8", 8), ("packetCounter", "u8", 16), ("rxCounter", "u8", 24), ("txCounter", "u8", 32), ("speed", "zes_pci_speed_t", 40)]),
+    "zes_overclock_properties_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("domainType", "i4", 16), ("AvailableControls", "u4", 20), ("VFProgramType", "i4", 24), ("NumberOfVFPoints", "u4", 28)]),
+    "zes_control_property_t" : (40, [("MinValue", "f8", 0), ("MaxValue", "f8", 8), ("StepValue", "f8", 16), ("RefValue", "f8", 24), ("DefaultValue", "f8", 32)]),
+    "zes_vf_property_t" : (48, [("MinFreq", "f8", 0), ("MaxFreq", "f8", 8), ("StepFreq", "f8", 16), ("MinVolt", "f8", 24), ("MaxVolt", "f8", 32), ("StepVolt", "f8", 40)]),
+    "zes_diag_test_t" : (68, [("index", "u4", 0), ("name", "S64", 4)]),
+    "zes_diag_properties_t" : (96, [("stype", "i4", 0), ("pNext", "u8", 8), ("onSubdevice", "u1", 16), ("subdeviceId", "u4", 20), ("name", "S64", 24), ("haveTests", "u1", 88)]),
+    "zes_device_ecc_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("state", "i4", 16)]),
+    "zes_device_ecc_properties_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("currentState", "i4", 16), ("pendingState", "i4", 20), ("pendingAction", "i4", 24)]),
+    "zes_engine_properties_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("type", "i4", 16), ("onSubdevice", "u1", 20), ("subdeviceId", "u4", 24)]),
+    "zes_engine_stats_t" : (16, [("activeTime", "u8", 0), ("timestamp", "u8", 8)]),
+    "zes_fabric_port_id_t" : (12, [("fabricId", "u4", 0), ("attachId", "u4", 4), ("portNumber", "u1", 8)]),
+    "zes_fabric_port_speed_t" : (16, [("bitRate", "i8", 0), ("width", "i4", 8)]),
+    "zes_fabric_port_properties_t" : (328, [("stype", "i4", 0), ("pNext", "u8", 8), ("model", "S256", 16), ("onSubdevice", "u1", 272), ("subdeviceId", "u4", 276), ("portId", "zes_fabric_port_id_t", 280), ("maxRxSpeed", "zes_fabric_port_speed_t", 296), ("maxTxSpeed", "zes_fabric_port_speed_t", 312)]),
+    "zes_fabric_link_type_t" : (256, [("desc", "S256", 0)]),
+    "zes_fabric_port_config_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("enabled", "u1", 16), ("beaconing", "u1", 17)]),
+    "zes_fabric_port_state_t" : (72, [("stype", "i4", 0), ("pNext", "u8", 8), ("status", "i4", 16), ("qualityIssues", "i4", 20), ("failureReasons", "i4", 24), ("remotePortId", "zes_fabric_port_id_t", 28), ("rxSpeed", "zes_fabric_port_speed_t", 40), ("txSpeed", "zes_fabric_port_speed_t", 56)]),
+    "zes_fabric_port_throughput_t" : (24, [("timestamp", "u8", 0), ("rxCounter", "u8", 8), ("txCounter", "u8", 16)]),
+    "zes_fabric_port_error_counters_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("linkFailureCount", "u8", 16), ("fwCommErrorCount", "u8", 24), ("fwErrorCount", "u8", 32), ("linkDegradeCount", "u8", 40)]),
+    "zes_fan_speed_t" : (8, [("speed", "i4", 0), ("units", "i4", 4)]),
+    "zes_fan_temp_speed_t" : (12, [("temperature", "u4", 0), ("speed", "zes_fan_speed_t", 4)]),
+    "zes_fan_speed_table_t" : (388, [("numPoints", "i4", 0), ("table", ("zes_fan_temp_speed_t", 32), 4)]),
+    "zes_fan_properties_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("onSubdevice", "u1", 16), ("subdeviceId", "u4", 20), ("canControl", "u1", 24), ("supportedModes", "u4", 28), ("supportedUnits", "u4", 32), ("maxRPM", "i4", 36), ("maxPoints", "i4", 40)]),
+    "zes_fan_config_t" : (416, [("stype", "i4", 0), ("pNext", "u8", 8), ("mode", "i4", 16), ("speedFixed", "zes_fan_speed_t", 20), ("speedTable", "zes_fan_speed_table_t", 28)]),
+    "zes_firmware_properties_t" : (160, [("stype", "i4", 0), ("pNext", "u8", 8), ("onSubdevice", "u1", 16), ("subdeviceId", "u4", 20), ("canControl", "u1", 24), ("name", "S64", 25), ("version", "S64", 89)]),
+    "zes_freq_properties_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("type", "i4", 16), ("onSubdevice", "u1", 20), ("subdeviceId", "u4", 24), ("canControl", "u1", 28), ("isThrottleEventSupported", "u1", 29), ("min", "f8", 32), ("max", "f8", 40)]),
+    "zes_freq_range_t" : (16, [("min", "f8", 0), ("max", "f8", 8)]),
+    "zes_freq_state_t" : (64, [("stype", "i4", 0), ("pNext", "u8", 8), ("currentVoltage", "f8", 16), ("request", "f8", 24), ("tdp", "f8", 32), ("efficient", "f8", 40), ("actual", "f8", 48), ("throttleReasons", "i4", 56)]),
+    "zes_freq_throttle_time_t" : (16, [("throttleTime", "u8", 0), ("timestamp", "u8", 8)]),
+    "zes_oc_capabilities_t" : (80, [("stype", "i4", 0), ("pNext", "u8", 8), ("isOcSupported", "u1", 16), ("maxFactoryDefaultFrequency", "f8", 24), ("maxFactoryDefaultVoltage", "f8", 32), ("maxOcFrequency", "f8", 40), ("minOcVoltageOffset", "f8", 48), ("maxOcVoltageOffset", "f8", 56), ("maxOcVoltage", "f8", 64), ("isTjMaxSupported", "u1", 72), ("isIccMaxSupported", "u1", 73), ("isHighVoltModeCapable", "u1", 74), ("isHighVoltModeEnabled", "u1", 75), ("isExtendedModeSupported", "u1", 76), ("isFixedModeSupported", "u1", 77)]),
+    "zes_led_properties_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("onSubdevice", "u1", 16), ("subdeviceId", "u4", 20), ("canControl", "u1", 24), ("haveRGB", "u1", 25)]),
+    "zes_led_color_t" : (24, [("red", "f8", 0), ("green", "f8", 8), ("blue", "f8", 16)]),
+    "zes_led_state_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("isOn", "u1", 16), ("color", "zes_led_color_t", 24)]),
+    "zes_mem_properties_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("type", "i4", 16), ("onSubdevice", "u1", 20), ("subdeviceId", "u4", 24), ("location", "i4", 28), ("physicalSize", "u8", 32), ("busWidth", "i4", 40), ("numChannels", "i4", 44)]),
+    "zes_mem_state_t" : (40, [("stype", "i4", 0), ("pNext", "u8", 8), ("health", "i4", 16), ("free", "u8", 24), ("size", "u8", 32)]),
+    "zes_mem_bandwidth_t" : (32, [("readCounter", "u8", 0), ("writeCounter", "u8", 8), ("maxBandwidth", "u8", 16), ("timestamp", "u8", 24)]),
+    "zes_mem_ext_bandwidth_t" : (4, [("memoryTimestampValidBits", "u4", 0)]),
+    "zes_perf_properties_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("onSubdevice", "u1", 16), ("subdeviceId", "u4", 20), ("engines", "i4", 24)]),
+    "zes_power_properties_t" : (40, [("stype", "i4", 0), ("pNext", "u8", 8), ("onSubdevice", "u1", 16), ("subdeviceId", "u4", 20), ("canControl", "u1", 24), ("isEnergyThresholdSupported", "u1", 25), ("defaultLimit", "i4", 28), ("minLimit", "i4", 32), ("maxLimit", "i4", 36)]),
+    "zes_power_energy_counter_t" : (16, [("energy", "u8", 0), ("timestamp", "u8", 8)]),
+    "zes_power_sustained_limit_t" : (12, [("enabled", "u1", 0), ("power", "i4", 4), ("interval", "i4", 8)]),
+    "zes_power_burst_limit_t" : (8, [("enabled", "u1", 0), ("power", "i4", 4)]),
+    "zes_power_peak_limit_t" : (8, [("powerAC", "i4", 0), ("powerDC", "i4", 4)]),
+    "zes_energy_threshold_t" : (24, [("enable", "u1", 0), ("threshold", "f8", 8), ("processId", "u4", 16)]),
+    "zes_psu_properties_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("onSubdevice", "u1", 16), ("subdeviceId", "u4", 20), ("haveFan", "u1", 24), ("ampLimit", "i4", 28)]),
+    "zes_psu_state_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("voltStatus", "i4", 16), ("fanFailed", "u1", 20), ("temperature", "i4", 24), ("current", "i4", 28)]),
+    "zes_ras_properties_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("type", "i4", 16), ("onSubdevice", "u1", 20), ("subdeviceId", "u4", 24)]),
+    "zes_ras_state_t" : (72, [("stype", "i4", 0), ("pNext", "u8", 8), ("category", ("u8", 7), 16)]),
+    "zes_ras_config_t" : (96, [("stype", "i4", 0), ("pNext", "u8", 8), ("totalThreshold", "u8", 16), ("detailedThresholds", "zes_ras_state_t", 24)]),
+    "zes_sched_properties_t" : (40, [("stype", "i4", 0), ("pNext", "u8", 8), ("onSubdevice", "u1", 16), ("subdeviceId", "u4", 20), ("canControl", "u1", 24), ("engines", "i4", 28), ("supportedModes", "u4", 32)]),
+    "zes_sched_timeout_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("watchdogTimeout", "u8", 16)]),
+    "zes_sched_timeslice_properties_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("interval", "u8", 16), ("yieldTimeout", "u8", 24)]),
+    "zes_standby_properties_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("type", "i4", 16), ("onSubdevice", "u1", 20), ("subdeviceId", "u4", 24)]),
+    "zes_temp_properties_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("type", "i4", 16), ("onSubdevice", "u1", 20), ("subdeviceId", "u4", 24), ("maxTemperature", "f8", 32), ("isCriticalTempSupported", "u1", 40), ("isThreshold1Supported", "u1", 41), ("isThreshold2Supported", "u1", 42)]),
+    "zes_temp_threshold_t" : (16, [("enableLowToHigh", "u1", 0), ("enableHighToLow", "u1", 1), ("threshold", "f8", 8)]),
+    "zes_temp_config_t" : (56, [("stype", "i4", 0), ("pNext", "u8", 8), ("enableCritical", "u1", 16), ("threshold1", "zes_temp_threshold_t", 24), ("threshold2", "zes_temp_threshold_t", 40)]),
+    "zes_device_ecc_default_properties_ext_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("defaultState", "i4", 16)]),
+    "zes_power_limit_ext_desc_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("level", "i4", 16), ("source", "i4", 20), ("limitUnit", "i4", 24), ("enabledStateLocked", "u1", 28), ("enabled", "u1", 29), ("intervalValueLocked", "u1", 30), ("interval", "i4", 32), ("limitValueLocked", "u1", 36), ("limit", "i4", 40)]),
+    "zes_power_ext_properties_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("domain", "i4", 16), ("defaultLimit", "u8", 24)]),
+    "zes_engine_ext_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("countOfVirtualFunctionInstance", "u4", 16)]),
+    "_zes_global_dditable_t" : (8, [("pfnInit", "u8", 0)]),
+    "_zes_device_dditable_t" : (296, [("pfnGetProperties", "u8", 0), ("pfnGetState", "u8", 8), ("pfnReset", "u8", 16), ("pfnProcessesGetState", "u8", 24), ("pfnPciGetProperties", "u8", 32), ("pfnPciGetState", "u8", 40), ("pfnPciGetBars", "u8", 48), ("pfnPciGetStats", "u8", 56), ("pfnEnumDiagnosticTestSuites", "u8", 64), ("pfnEnumEngineGroups", "u8", 72), ("pfnEventRegister", "u8", 80), ("pfnEnumFabricPorts", "u8", 88), ("pfnEnumFans", "u8", 96), ("pfnEnumFirmwares", "u8", 104), ("pfnEnumFrequencyDomains", "u8", 112), ("pfnEnumLeds", "u8", 120), ("pfnEnumMemoryModules", "u8", 128), ("pfnEnumPerformanceFactorDomains", "u8", 136), ("pfnEnumPowerDomains", "u8", 144), ("pfnGetCardPowerDomain", "u8", 152), ("pfnEnumPsus", "u8", 160), ("pfnEnumRasErrorSets", "u8", 168), ("pfnEnumSchedulers", "u8", 176), ("pfnEnumStandbyDomains", "u8", 184), ("pfnEnumTemperatureSensors", "u8", 192), ("pfnEccAvailable", "u8", 200), ("pfnEccConfigurable", "u8", 208), ("pfnGetEccState", "u8", 216), ("pfnSetEccState", "u8", 224), ("pfnGet", "u8", 232), ("pfnSetOverclockWaiver", "u8", 240), ("pfnGetOverclockDomains", "u8", 248), ("pfnGetOverclockControls", "u8", 256), ("pfnResetOverclockSettings", "u8", 264), ("pfnReadOverclockState", "u8", 272), ("pfnEnumOverclockDomains", "u8", 280), ("pfnResetExt", "u8", 288)]),
+    "_zes_device_exp_dditable_t" : (24, [("pfnGetSubDevicePropertiesExp", "u8", 0), ("pfnEnumActiveVFExp", "u8", 8), ("pfnEnumEnabledVFExp", "u8", 16)]),
+    "_zes_driver_dditable_t" : (40, [("pfnEventListen", "u8", 0), ("pfnEventListenEx", "u8", 8), ("pfnGet", "u8", 16), ("pfnGetExtensionProperties", "u8", 24), ("pfnGetExtensionFunctionAddress", "u8", 32)]),
+    "_zes_driver_exp_dditable_t" : (8, [("pfnGetDeviceByUuidExp", "u8", 0)]),
+    "_zes_overclock_dditable_t" : (72, [("pfnGetDomainProperties", "u8", 0), ("pfnGetDomainVFProperties", "u8", 8), ("pfnGetDomainControlProperties", "u8", 16), ("pfnGetControlCurrentValue", "u8", 24), ("pfnGetControlPendingValue", "u8", 32), ("pfnSetControlUserValue", "u8", 40), ("pfnGetControlState", "u8", 48), ("pfnGetVFPointValues", "u8", 56), ("pfnSetVFPointValues", "u8", 64)]),
+    "_zes_scheduler_dditable_t" : (64, [("pfnGetProperties", "u8", 0), ("pfnGetCurrentMode", "u8", 8), ("pfnGetTimeoutModeProperties", "u8", 16), ("pfnGetTimesliceModeProperties", "u8", 24), ("pfnSetTimeoutMode", "u8", 32), ("pfnSetTimesliceMode", "u8", 40), ("pfnSetExclusiveMode", "u8", 48), ("pfnSetComputeUnitDebugMode", "u8", 56)]),
+    "_zes_performance_factor_dditable_t" : (24, [("pfnGetProperties", "u8", 0), ("pfnGetConfig", "u8", 8), ("pfnSetConfig", "u8", 16)]),
+    "_zes_power_dditable_t" : (64, [("pfnGetProperties", "u8", 0), ("pfnGetEnergyCounter", "u8", 8), ("pfnGetLimits", "u8", 16), ("pfnSetLimits", "u8", 24), ("pfnGetEnergyThreshold", "u8", 32), ("pfnSetEnergyThreshold", "u8", 40), ("pfnGetLimitsExt", "u8", 48), ("pfnSetLimitsExt", "u8", 56)]),
+    "_zes_frequency_dditable_t" : (136, [("pfnGetProperties", "u8", 0), ("pfnGetAvailableClocks", "u8", 8), ("pfnGetRange", "u8", 16), ("pfnSetRange", "u8", 24), ("pfnGetState", "u8", 32), ("pfnGetThrottleTime", "u8", 40), ("pfnOcGetCapabilities", "u8", 48), ("pfnOcGetFrequencyTarget", "u8", 56), ("pfnOcSetFrequencyTarget", "u8", 64), ("pfnOcGetVoltageTarget", "u8", 72), ("pfnOcSetVoltageTarget", "u8", 80), ("pfnOcSetMode", "u8", 88), ("pfnOcGetMode", "u8", 96), ("pfnOcGetIccMax", "u8", 104), ("pfnOcSetIccMax", "u8", 112), ("pfnOcGetTjMax", "u8", 120), ("pfnOcSetTjMax", "u8", 128)]),
+    "_zes_engine_dditable_t" : (24, [("pfnGetProperties", "u8", 0), ("pfnGetActivity", "u8", 8), ("pfnGetActivityExt", "u8", 16)]),
+    "_zes_standby_dditable_t" : (24, [("pfnGetProperties", "u8", 0), ("pfnGetMode", "u8", 8), ("pfnSetMode", "u8", 16)]),
+    "_zes_firmware_dditable_t" : (32, [("pfnGetProperties", "u8", 0), ("pfnFlash", "u8", 8), ("pfnGetFlashProgress", "u8", 16), ("pfnGetConsoleLogs", "u8", 24)]),
+    "_zes_firmware_exp_dditable_t" : (16, [("pfnGetSecurityVersionExp", "u8", 0), ("pfnSetSecurityVersionExp", "u8", 8)]),
+    "_zes_memory_dditable_t" : (24, [("pfnGetProperties", "u8", 0), ("pfnGetState", "u8", 8), ("pfnGetBandwidth", "u8", 16)]),
+    "_zes_fabric_port_dditable_t" : (64, [("pfnGetProperties", "u8", 0), ("pfnGetLinkType", "u8", 8), ("pfnGetConfig", "u8", 16), ("pfnSetConfig", "u8", 24), ("pfnGetState", "u8", 32), ("pfnGetThroughput", "u8", 40), ("pfnGetFabricErrorCounters", "u8", 48), ("pfnGetMultiPortThroughput", "u8", 56)]),
+    "_zes_temperature_dditable_t" : (32, [("pfnGetProperties", "u8", 0), ("pfnGetConfig", "u8", 8), ("pfnSetConfig", "u8", 16), ("pfnGetState", "u8", 24)]),
+    "_zes_psu_dditable_t" : (16, [("pfnGetProperties", "u8", 0), ("pfnGetState", "u8", 8)]),
+    "_zes_fan_dditable_t" : (48, [("pfnGetProperties", "u8", 0), ("pfnGetConfig", "u8", 8), ("pfnSetDefaultMode", "u8", 16), ("pfnSetFixedSpeedMode", "u8", 24), ("pfnSetSpeedTableMode", "u8", 32), ("pfnGetState", "u8", 40)]),
+    "_zes_led_dditable_t" : (32, [("pfnGetProperties", "u8", 0), ("pfnGetState", "u8", 8), ("pfnSetState", "u8", 16), ("pfnSetColor", "u8", 24)]),
+    "_zes_ras_dditable_t" : (32, [("pfnGetProperties", "u8", 0), ("pfnGetConfig", "u8", 8), ("pfnSetConfig", "u8", 16), ("pfnGetState", "u8", 24)]),
+    "_zes_ras_exp_dditable_t" : (16, [("pfnGetStateExp", "u8", 0), ("pfnClearStateExp", "u8", 8)]),
+    "_zes_diagnostics_dditable_t" : (24, [("pfnGetProperties", "u8", 0), ("pfnGetTests", "u8", 8), ("pfnRunTests", "u8", 16)]),
+    "_zes_vf_management_exp_dditable_t" : (72, [("pfnGetVFPropertiesExp", "u8", 0), ("pfnGetVFMemoryUtilizationExp", "u8", 8), ("pfnGetVFEngineUtilizationExp", "u8", 16), ("pfnSetVFTelemetryModeExp", "u8", 24), ("pfnSetVFTelemetrySamplingIntervalExp", "u8", 32), ("pfnGetVFCapabilitiesExp", "u8", 40), ("pfnGetVFMemoryUtilizationExp2", "u8", 48), ("pfnGetVFEngineUtilizationExp2", "u8", 56), ("pfnGetVFCapabilitiesExp2", "u8", 64)]),
+    "_zes_dditable_t" : (1192, [("Global", "_zes_global_dditable_t", 0), ("Device", "_zes_device_dditable_t", 8), ("DeviceExp", "_zes_device_exp_dditable_t", 304), ("Driver", "_zes_driver_dditable_t", 328), ("DriverExp", "_zes_driver_exp_dditable_t", 368), ("Overclock", "_zes_overclock_dditable_t", 376), ("Scheduler", "_zes_scheduler_dditable_t", 448), ("PerformanceFactor", "_zes_performance_factor_dditable_t", 512), ("Power", "_zes_power_dditable_t", 536), ("Frequency", "_zes_frequency_dditable_t", 600), ("Engine", "_zes_engine_dditable_t", 736), ("Standby", "_zes_standby_dditable_t", 760), ("Firmware", "_zes_firmware_dditable_t", 784), ("FirmwareExp", "_zes_firmware_exp_dditable_t", 816), ("Memory", "_zes_memory_dditable_t", 832), ("FabricPort", "_zes_fabric_port_dditable_t", 856), ("Temperature", "_zes_temperature_dditable_t", 920), ("Psu", "_zes_psu_dditable_t", 952), ("Fan", "_zes_fan_dditable_t", 968), ("Led", "_zes_led_dditable_t", 1016), ("Ras", "_zes_ras_dditable_t", 1048), ("RasExp", "_zes_ras_exp_dditable_t", 1080), ("Diagnostics", "_zes_diagnostics_dditable_t", 1096), ("VFManagementExp", "_zes_vf_management_exp_dditable_t", 1120)]),
+    "zes_ras_state_exp_t" : (16, [("category", "i4", 0), ("errorCounter", "u8", 8)]),
+    "zes_mem_page_offline_state_exp_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("memoryPageOffline", "u4", 16), ("maxMemoryPageOffline", "u4", 20)]),
+    "zes_mem_bandwidth_counter_bits_exp_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("validBitsCount", "u4", 16)]),
+    "zes_power_domain_exp_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("powerDomain", "i4", 16)]),
+    "zes_subdevice_exp_properties_t" : (40, [("stype", "i4", 0), ("pNext", "u8", 8), ("subdeviceId", "u4", 16), ("uuid", "zes_uuid_t", 20)]),
+    "zes_vf_exp_properties_t" : (56, [("stype", "i4", 0), ("pNext", "u8", 8), ("address", "zes_pci_address_t", 16), ("uuid", "zes_uuid_t", 32), ("flags", "i4", 48)]),
+    "zes_vf_util_mem_exp_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("memTypeFlags", "i4", 16), ("free", "u8", 24), ("size", "u8", 32), ("timestamp", "u8", 40)]),
+    "zes_vf_util_engine_exp_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("type", "i4", 16), ("activeCounterValue", "u8", 24), ("samplingCounterValue", "u8", 32), ("timestamp", "u8", 40)]),
+    "zes_vf_exp_capabilities_t" : (40, [("stype", "i4", 0), ("pNext", "u8", 8), ("address", "zes_pci_address_t", 16), ("vfDeviceMemSize", "u4", 32), ("vfID", "u4", 36)]),
+    "zes_vf_exp2_capabilities_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("address", "zes_pci_address_t", 16), ("vfDeviceMemSize", "u8", 32), ("vfID", "u4", 40)]),
+    "zes_vf_util_mem_exp2_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("vfMemLocation", "i4", 16), ("vfMemUtilized", "u8", 24)]),
+    "zes_vf_util_engine_exp2_t" : (40, [("stype", "i4", 0), ("pNext", "u8", 8), ("vfEngineType", "i4", 16), ("activeCounterValue", "u8", 24), ("samplingCounterValue", "u8", 32)]),
+    "zet_base_properties_t" : (16, [("stype", "i4", 0), ("pNext", "u8", 8)]),
+    "zet_base_desc_t" : (16, [("stype", "i4", 0), ("pNext", "u8", 8)]),
+    "zet_value_t" : (8, [("ui32", "u4", 0), ("ui64", "u8", 0), ("fp32", "f4", 0), ("fp64", "f8", 0), ("b8", "u1", 0)]),
+    "zet_typed_value_t" : (16, [("type", "i4", 0), ("value", "zet_value_t", 8)]),
+    "zet_device_debug_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16)]),
+    "zet_debug_config_t" : (4, [("pid", "u4", 0)]),
+    "zet_debug_event_info_detached_t" : (4, [("reason", "i4", 0)]),
+    "zet_debug_event_info_module_t" : (32, [("format", "i4", 0), ("moduleBegin", "u8", 8), ("moduleEnd", "u8", 16), ("load", "u8", 24)]),
+    "zet_debug_event_info_thread_stopped_t" : (16, [("thread", "ze_device_thread_t", 0)]),
+    "zet_debug_event_info_page_fault_t" : (24, [("address", "u8", 0), ("mask", "u8", 8), ("reason", "i4", 16)]),
+    "zet_debug_event_info_t" : (32, [("detached", "zet_debug_event_info_detached_t", 0), ("module", "zet_debug_event_info_module_t", 0), ("thread", "zet_debug_event_info_thread_stopped_t", 0), ("page_fault", "zet_debug_event_info_page_fault_t", 0)]),
+    "zet_debug_event_t" : (40, [("type", "i4", 0), ("flags", "i4", 4), ("info", "zet_debug_event_info_t", 8)]),
+    "zet_debug_memory_space_desc_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("type", "i4", 16), ("address", "u8", 24)]),
+    "zet_debug_regset_properties_t" : (48, [("stype", "i4", 0), ("pNext", "u8", 8), ("type", "u4", 16), ("version", "u4", 20), ("generalFlags", "i4", 24), ("deviceFlags", "u4", 28), ("count", "u4", 32), ("bitSize", "u4", 36), ("byteSize", "u4", 40)]),
+    "zet_metric_group_properties_t" : (544, [("stype", "i4", 0), ("pNext", "u8", 8), ("name", "S256", 16), ("description", "S256", 272), ("samplingType", "i4", 528), ("domain", "u4", 532), ("metricCount", "u4", 536)]),
+    "zet_metric_properties_t" : (1056, [("stype", "i4", 0), ("pNext", "u8", 8), ("name", "S256", 16), ("description", "S256", 272), ("component", "S256", 528), ("tierNumber", "u4", 784), ("metricType", "i4", 788), ("resultType", "i4", 792), ("resultUnits", "S256", 796)]),
+    "zet_metric_streamer_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("notifyEveryNReports", "u4", 16), ("samplingPeriod", "u4", 20)]),
+    "zet_metric_query_pool_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("type", "i4", 16), ("count", "u4", 20)]),
+    "zet_profile_properties_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("flags", "i4", 16), ("numTokens", "u4", 20)]),
+    "zet_profile_free_register_token_t" : (12, [("type", "i4", 0), ("size", "u4", 4), ("count", "u4", 8)]),
+    "zet_profile_register_sequence_t" : (8, [("start", "u4", 0), ("count", "u4", 4)]),
+    "zet_tracer_exp_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("pUserData", "u8", 16)]),
+    "_zet_metric_programmable_exp_dditable_t" : (32, [("pfnGetExp", "u8", 0), ("pfnGetPropertiesExp", "u8", 8), ("pfnGetParamInfoExp", "u8", 16), ("pfnGetParamValueInfoExp", "u8", 24)]),
+    "_zet_metric_tracer_exp_dditable_t" : (48, [("pfnCreateExp", "u8", 0), ("pfnDestroyExp", "u8", 8), ("pfnEnableExp", "u8", 16), ("pfnDisableExp", "u8", 24), ("pfnReadDataExp", "u8", 32), ("pfnDecodeExp", "u8", 40)]),
+    "_zet_metric_decoder_exp_dditable_t" : (24, [("pfnCreateExp", "u8", 0), ("pfnDestroyExp", "u8", 8), ("pfnGetDecodableMetricsExp", "u8", 16)]),
+    "_zet_device_dditable_t" : (8, [("pfnGetDebugProperties", "u8", 0)]),
+    "_zet_device_exp_dditable_t" : (32, [("pfnGetConcurrentMetricGroupsExp", "u8", 0), ("pfnCreateMetricGroupsFromMetricsExp", "u8", 8), ("pfnEnableMetricsExp", "u8", 16), ("pfnDisableMetricsExp", "u8", 24)]),
+    "_zet_context_dditable_t" : (8, [("pfnActivateMetricGroups", "u8", 0)]),
+    "_zet_command_list_dditable_t" : (32, [("pfnAppendMetricStreamerMarker", "u8", 0), ("pfnAppendMetricQueryBegin", "u8", 8), ("pfnAppendMetricQueryEnd", "u8", 16), ("pfnAppendMetricMemoryBarrier", "u8", 24)]),
+    "_zet_command_list_exp_dditable_t" : (8, [("pfnAppendMarkerExp", "u8", 0)]),
+    "_zet_module_dditable_t" : (8, [("pfnGetDebugInfo", "u8", 0)]),
+    "_zet_kernel_dditable_t" : (8, [("pfnGetProfileInfo", "u8", 0)]),
+    "_zet_metric_dditable_t" : (16, [("pfnGet", "u8", 0), ("pfnGetProperties", "u8", 8)]),
+    "_zet_metric_exp_dditable_t" : (24, [("pfnCreateFromProgrammableExp", "u8", 0), ("pfnDestroyExp", "u8", 8), ("pfnCreateFromProgrammableExp2", "u8", 16)]),
+    "_zet_metric_group_dditable_t" : (24, [("pfnGet", "u8", 0), ("pfnGetProperties", "u8", 8), ("pfnCalculateMetricValues", "u8", 16)]),
+    "_zet_metric_group_exp_dditable_t" : (72, [("pfnCalculateMultipleMetricValuesExp", "u8", 0), ("pfnGetGlobalTimestampsExp", "u8", 8), ("pfnGetExportDataExp", "u8", 16), ("pfnCalculateMetricExportDataExp", "u8", 24), ("pfnCreateExp", "u8", 32), ("pfnAddMetricExp", "u8", 40), ("pfnRemoveMetricExp", "u8", 48), ("pfnCloseExp", "u8", 56), ("pfnDestroyExp", "u8", 64)]),
+    "_zet_metric_streamer_dditable_t" : (24, [("pfnOpen", "u8", 0), ("pfnClose", "u8", 8), ("pfnReadData", "u8", 16)]),
+    "_zet_metric_query_pool_dditable_t" : (16, [("pfnCreate", "u8", 0), ("pfnDestroy", "u8", 8)]),
+    "_zet_metric_query_dditable_t" : (32, [("pfnCreate", "u8", 0), ("pfnDestroy", "u8", 8), ("pfnReset", "u8", 16), ("pfnGetData", "u8", 24)]),
+    "_zet_tracer_exp_dditable_t" : (40, [("pfnCreate", "u8", 0), ("pfnDestroy", "u8", 8), ("pfnSetPrologues", "u8", 16), ("pfnSetEpilogues", "u8", 24), ("pfnSetEnabled", "u8", 32)]),
+    "_zet_debug_dditable_t" : (96, [("pfnAttach", "u8", 0), ("pfnDetach", "u8", 8), ("pfnReadEvent", "u8", 16), ("pfnAcknowledgeEvent", "u8", 24), ("pfnInterrupt", "u8", 32), ("pfnResume", "u8", 40), ("pfnReadMemory", "u8", 48), ("pfnWriteMemory", "u8", 56), ("pfnGetRegisterSetProperties", "u8", 64), ("pfnReadRegisters", "u8", 72), ("pfnWriteRegisters", "u8", 80), ("pfnGetThreadRegisterSetProperties", "u8", 88)]),
+    "_zet_dditable_t" : (552, [("MetricProgrammableExp", "_zet_metric_programmable_exp_dditable_t", 0), ("MetricTracerExp", "_zet_metric_tracer_exp_dditable_t", 32), ("MetricDecoderExp", "_zet_metric_decoder_exp_dditable_t", 80), ("Device", "_zet_device_dditable_t", 104), ("DeviceExp", "_zet_device_exp_dditable_t", 112), ("Context", "_zet_context_dditable_t", 144), ("CommandList", "_zet_command_list_dditable_t", 152), ("CommandListExp", "_zet_command_list_exp_dditable_t", 184), ("Module", "_zet_module_dditable_t", 192), ("Kernel", "_zet_kernel_dditable_t", 200), ("Metric", "_zet_metric_dditable_t", 208), ("MetricExp", "_zet_metric_exp_dditable_t", 224), ("MetricGroup", "_zet_metric_group_dditable_t", 248), ("MetricGroupExp", "_zet_metric_group_exp_dditable_t", 272), ("MetricStreamer", "_zet_metric_streamer_dditable_t", 344), ("MetricQueryPool", "_zet_metric_query_pool_dditable_t", 368), ("MetricQuery", "_zet_metric_query_dditable_t", 384), ("TracerExp", "_zet_tracer_exp_dditable_t", 416), ("Debug", "_zet_debug_dditable_t", 456)]),
+    "zet_metric_tracer_exp_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("notifyEveryNBytes", "u4", 16)]),
+    "zet_metric_entry_exp_t" : (32, [("value", "zet_value_t", 0), ("timeStamp", "u8", 8), ("metricIndex", "u4", 16), ("onSubdevice", "u1", 20), ("subdeviceId", "u4", 24)]),
+    "zet_metric_group_type_exp_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("type", "i4", 16)]),
+    "zet_export_dma_buf_exp_properties_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("fd", "i4", 16), ("size", "u8", 24)]),
+    "zet_metric_source_id_exp_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("sourceId", "u4", 16)]),
+    "zet_metric_global_timestamps_resolution_exp_t" : (32, [("stype", "i4", 0), ("pNext", "u8", 8), ("timerResolution", "u8", 16), ("timestampValidBits", "u8", 24)]),
+    "zet_metric_calculate_exp_desc_t" : (24, [("stype", "i4", 0), ("pNext", "u8", 8), ("rawReportSkipCount", "u4", 16)]),
+    "zet_metric_programmable_exp_properties_t" : (424, [("stype", "i4", 0), ("pNext", "u8", 8), ("name", "S128", 16), ("description", "S128", 144), ("component", "S128", 272), ("tierNumber", "u4", 400), ("domain", "u4", 404), ("parameterCount", "u4", 408), ("samplingType", "i4", 412), ("sourceId", "u4", 416)]),
+    "zet_value_uint64_range_exp_t" : (16, [("ui64Min", "u8", 0), ("ui64Max", "u8", 8)]),
+    "zet_value_fp64_range_exp_t" : (16, [("fp64Min", "f8", 0), ("fp64Max", "f8", 8)]),
+    "zet_value_info_exp_t" : (16, [("ui32", "u4", 0), ("ui64", "u8", 0), ("fp32", "f4", 0), ("fp64", "f8", 0), ("b8", "u1", 0), ("ui8", "u1", 0), ("ui16", "u2", 0), ("ui64Range", "zet_value_uint64_range_exp_t", 0), ("fp64Range", "zet_value_fp64_range_exp_t", 0)]),
+    "zet_metric_programmable_param_info_exp_t" : (168, [("stype", "i4", 0), ("pNext", "u8", 8), ("type", "i4", 16), ("name", "S128", 20), ("valueInfoType", "i4", 148), ("defaultValue", "zet_value_t", 152), ("valueInfoCount", "u4", 160)]),
+    "zet_metric_programmable_param_value_info_exp_t" : (160, [("stype", "i4", 0), ("pNext", "u8", 8), ("valueInfo", "zet_value_info_exp_t", 16), ("description", "S128", 32)]),
+    "zet_metric_programmable_param_value_exp_t" : (8, [("value", "zet_value_t", 0)]),
+}
+
+_dtypes = {}
+
+###############################################################################
+## @brief Returns the numpy dtype of a structure, given its ctypes class or name
+def dtype(struct):
+    name = struct if isinstance(struct, str) else struct.__name__
+    value = _dtypes.get(name)
+    if value is None:
+        itemsize, fields = _specs[name]
+        formats = []
+        for _, format, _ in fields:
+            if isinstance(format, tuple):
+                format = (dtype(format[0]) if format[0] in _specs else format[0], format[1])
+            elif format in _specs:
+                format = dtype(format)
+            formats.append(format)
+        value = numpy.dtype({
+            "names" : [field[0] for field in fields],
+            "formats" : formats,
+            "offsets" : [field[2] for field in fields],
+            "itemsize" : itemsize})
+        _dtypes[name] = value
+    return value
+
+###############################################################################
+## @brief Allocates a zero-filled array of 'count' structures, optionally
+##        setting each element's stype
+def zeros(struct, count, stype=None):
+    array = numpy.zeros(count, dtype=dtype(struct))
+    if stype is not None:
+        array["stype"] = stype
+    return array
+
+###############################################################################
+## @brief Returns the ctypes class of a structure, given the class or its name,
+##        looked up in the ze, zes and zet bindings
+def _struct(struct):
+    if not isinstance(struct, str):
+        return struct
+    from . import ze, zes, zet
+    for module in (ze, zes, zet):
+        value = getattr(module, struct, None)
+        if value is not None:
+            return value
+    raise KeyError(struct)
+
+###############################################################################
+## @brief Returns 'array' as a ctypes POINTER(struct), for functions taking an
+##        array of structures, given the structure's ctypes class or name; raw
+##        fast-call functions also accept array.ctypes.data directly
+def pointer(array, struct):
+    struct = _struct(struct)
+    if array.dtype != dtype(struct):
+        raise TypeError("array dtype does not match %s" % struct.__name__)
+    return cast(array.ctypes.data, POINTER(struct))
+
+###############################################################################
+## @brief Returns a numpy view of 'count' structures at 'address', without
+##        copying; the memory must outlive the view
+def view(address, struct, count):
+    value = dtype(struct)
+    buffer = (c_ubyte * (value.itemsize * count)).from_address(address)
+    return numpy.frombuffer(buffer, dtype=value, count=count)
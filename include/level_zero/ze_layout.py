@@ -0,0 +1,408 @@
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+ @file ze_layout.py
+
+ Generated by scripts/generate_layout.py from the C headers, do not edit.
+
+ """
+from ctypes import *
+
+###############################################################################
+## @brief Expected (sizeof, {field : offset}) of every structure declared by
+##        the ze, zes and zet bindings, as laid out by the C compiler on 64-bit
+##        targets
+layouts = {
+    "ze_device_uuid_t" : (16, {"id" : 0}),
+    "ze_device_properties_t" : (368, {"stype" : 0, "pNext" : 8, "type" : 16, "vendorId" : 20, "deviceId" : 24, "flags" : 28, "subdeviceId" : 32, "coreClockRate" : 36, "maxMemAllocSize" : 40, "maxHardwareContexts" : 48, "maxCommandQueuePriority" : 52, "numThreadsPerEU" : 56, "physicalEUSimdWidth" : 60, "numEUsPerSubslice" : 64, "numSubslicesPerSlice" : 68, "numSlices" : 72, "timerResolution" : 80, "timestampValidBits" : 88, "kernelTimestampValidBits" : 92, "uuid" : 96, "name" : 112}),
+    "ze_ipc_mem_handle_t" : (64, {"data" : 0}),
+    "ze_ipc_event_pool_handle_t" : (64, {"data" : 0}),
+    "ze_uuid_t" : (16, {"id" : 0}),
+    "ze_base_cb_params_t" : (16, {"stype" : 0, "pNext" : 8}),
+    "ze_base_properties_t" : (16, {"stype" : 0, "pNext" : 8}),
+    "ze_base_desc_t" : (16, {"stype" : 0, "pNext" : 8}),
+    "ze_init_driver_type_desc_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "ze_driver_uuid_t" : (16, {"id" : 0}),
+    "ze_driver_properties_t" : (40, {"stype" : 0, "pNext" : 8, "uuid" : 16, "driverVersion" : 32}),
+    "ze_driver_ipc_properties_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "ze_driver_extension_properties_t" : (260, {"name" : 0, "version" : 256}),
+    "ze_device_thread_t" : (16, {"slice" : 0, "subslice" : 4, "eu" : 8, "thread" : 12}),
+    "ze_device_compute_properties_t" : (88, {"stype" : 0, "pNext" : 8, "maxTotalGroupSize" : 16, "maxGroupSizeX" : 20, "maxGroupSizeY" : 24, "maxGroupSizeZ" : 28, "maxGroupCountX" : 32, "maxGroupCountY" : 36, "maxGroupCountZ" : 40, "maxSharedLocalMemory" : 44, "numSubGroupSizes" : 48, "subGroupSizes" : 52}),
+    "ze_native_kernel_uuid_t" : (16, {"id" : 0}),
+    "ze_device_module_properties_t" : (64, {"stype" : 0, "pNext" : 8, "spirvVersionSupported" : 16, "flags" : 20, "fp16flags" : 24, "fp32flags" : 28, "fp64flags" : 32, "maxArgumentsSize" : 36, "printfBufferSize" : 40, "nativeKernelSupported" : 44}),
+    "ze_command_queue_group_properties_t" : (40, {"stype" : 0, "pNext" : 8, "flags" : 16, "maxMemoryFillPatternSize" : 24, "numQueues" : 32}),
+    "ze_device_memory_properties_t" : (296, {"stype" : 0, "pNext" : 8, "flags" : 16, "maxClockRate" : 20, "maxBusWidth" : 24, "totalSize" : 32, "name" : 40}),
+    "ze_device_memory_access_properties_t" : (40, {"stype" : 0, "pNext" : 8, "hostAllocCapabilities" : 16, "deviceAllocCapabilities" : 20, "sharedSingleDeviceAllocCapabilities" : 24, "sharedCrossDeviceAllocCapabilities" : 28, "sharedSystemAllocCapabilities" : 32}),
+    "ze_device_cache_properties_t" : (32, {"stype" : 0, "pNext" : 8, "flags" : 16, "cacheSize" : 24}),
+    "ze_device_image_properties_t" : (56, {"stype" : 0, "pNext" : 8, "maxImageDims1D" : 16, "maxImageDims2D" : 20, "maxImageDims3D" : 24, "maxImageBufferSize" : 32, "maxImageArraySlices" : 40, "maxSamplers" : 44, "maxReadImageArgs" : 48, "maxWriteImageArgs" : 52}),
+    "ze_device_external_memory_properties_t" : (32, {"stype" : 0, "pNext" : 8, "memoryAllocationImportTypes" : 16, "memoryAllocationExportTypes" : 20, "imageImportTypes" : 24, "imageExportTypes" : 28}),
+    "ze_device_p2p_properties_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "ze_context_desc_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "ze_command_queue_desc_t" : (40, {"stype" : 0, "pNext" : 8, "ordinal" : 16, "index" : 20, "flags" : 24, "mode" : 28, "priority" : 32}),
+    "ze_command_list_desc_t" : (24, {"stype" : 0, "pNext" : 8, "commandQueueGroupOrdinal" : 16, "flags" : 20}),
+    "ze_copy_region_t" : (24, {"originX" : 0, "originY" : 4, "originZ" : 8, "width" : 12, "height" : 16, "depth" : 20}),
+    "ze_image_region_t" : (24, {"originX" : 0, "originY" : 4, "originZ" : 8, "width" : 12, "height" : 16, "depth" : 20}),
+    "ze_event_pool_desc_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16, "count" : 20}),
+    "ze_event_desc_t" : (32, {"stype" : 0, "pNext" : 8, "index" : 16, "signal" : 20, "wait" : 24}),
+    "ze_kernel_timestamp_data_t" : (16, {"kernelStart" : 0, "kernelEnd" : 8}),
+    "ze_kernel_timestamp_result_t" : (32, {"global" : 0, "context" : 16}),
+    "ze_fence_desc_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "ze_image_format_t" : (24, {"layout" : 0, "type" : 4, "x" : 8, "y" : 12, "z" : 16, "w" : 20}),
+    "ze_image_desc_t" : (72, {"stype" : 0, "pNext" : 8, "flags" : 16, "type" : 20, "format" : 24, "width" : 48, "height" : 56, "depth" : 60, "arraylevels" : 64, "miplevels" : 68}),
+    "ze_image_properties_t" : (24, {"stype" : 0, "pNext" : 8, "samplerFilterFlags" : 16}),
+    "ze_device_mem_alloc_desc_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16, "ordinal" : 20}),
+    "ze_host_mem_alloc_desc_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "ze_memory_allocation_properties_t" : (40, {"stype" : 0, "pNext" : 8, "type" : 16, "id" : 24, "pageSize" : 32}),
+    "ze_external_memory_export_desc_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "ze_external_memory_import_fd_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16, "fd" : 20}),
+    "ze_external_memory_export_fd_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16, "fd" : 20}),
+    "ze_external_memory_import_win32_handle_t" : (40, {"stype" : 0, "pNext" : 8, "flags" : 16, "handle" : 24, "name" : 32}),
+    "ze_external_memory_export_win32_handle_t" : (32, {"stype" : 0, "pNext" : 8, "flags" : 16, "handle" : 24}),
+    "ze_module_constants_t" : (24, {"numConstants" : 0, "pConstantIds" : 8, "pConstantValues" : 16}),
+    "ze_module_desc_t" : (56, {"stype" : 0, "pNext" : 8, "format" : 16, "inputSize" : 24, "pInputModule" : 32, "pBuildFlags" : 40, "pConstants" : 48}),
+    "ze_module_properties_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "ze_kernel_desc_t" : (32, {"stype" : 0, "pNext" : 8, "flags" : 16, "pKernelName" : 24}),
+    "ze_kernel_uuid_t" : (32, {"kid" : 0, "mid" : 16}),
+    "ze_kernel_properties_t" : (96, {"stype" : 0, "pNext" : 8, "numKernelArgs" : 16, "requiredGroupSizeX" : 20, "requiredGroupSizeY" : 24, "requiredGroupSizeZ" : 28, "requiredNumSubGroups" : 32, "requiredSubgroupSize" : 36, "maxSubgroupSize" : 40, "maxNumSubgroups" : 44, "localMemSize" : 48, "privateMemSize" : 52, "spillMemSize" : 56, "uuid" : 60}),
+    "ze_kernel_preferred_group_size_properties_t" : (24, {"stype" : 0, "pNext" : 8, "preferredMultiple" : 16}),
+    "ze_group_count_t" : (12, {"groupCountX" : 0, "groupCountY" : 4, "groupCountZ" : 8}),
+    "ze_device_raytracing_ext_properties_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16, "maxBVHLevels" : 20}),
+    "ze_raytracing_mem_alloc_ext_desc_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "ze_sampler_desc_t" : (32, {"stype" : 0, "pNext" : 8, "addressMode" : 16, "filterMode" : 20, "isNormalized" : 24}),
+    "ze_physical_mem_desc_t" : (32, {"stype" : 0, "pNext" : 8, "flags" : 16, "size" : 24}),
+    "ze_float_atomic_ext_properties_t" : (32, {"stype" : 0, "pNext" : 8, "fp16Flags" : 16, "fp32Flags" : 20, "fp64Flags" : 24}),
+    "ze_driver_ddi_handles_ext_properties_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "ze_external_semaphore_ext_desc_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "ze_external_semaphore_win32_ext_desc_t" : (32, {"stype" : 0, "pNext" : 8, "handle" : 16, "name" : 24}),
+    "ze_external_semaphore_fd_ext_desc_t" : (24, {"stype" : 0, "pNext" : 8, "fd" : 16}),
+    "ze_external_semaphore_signal_params_ext_t" : (24, {"stype" : 0, "pNext" : 8, "value" : 16}),
+    "ze_external_semaphore_wait_params_ext_t" : (24, {"stype" : 0, "pNext" : 8, "value" : 16}),
+    "ze_device_cache_line_size_ext_t" : (24, {"stype" : 0, "pNext" : 8, "cacheLineSize" : 16}),
+    "ze_rtas_builder_ext_desc_t" : (24, {"stype" : 0, "pNext" : 8, "builderVersion" : 16}),
+    "ze_rtas_builder_ext_properties_t" : (48, {"stype" : 0, "pNext" : 8, "flags" : 16, "rtasBufferSizeBytesExpected" : 24, "rtasBufferSizeBytesMaxRequired" : 32, "scratchBufferSizeBytes" : 40}),
+    "ze_rtas_parallel_operation_ext_properties_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16, "maxConcurrency" : 20}),
+    "ze_rtas_device_ext_properties_t" : (32, {"stype" : 0, "pNext" : 8, "flags" : 16, "rtasFormat" : 20, "rtasBufferAlignment" : 24}),
+    "ze_rtas_float3_ext_t" : (12, {"x" : 0, "y" : 4, "z" : 8}),
+    "ze_rtas_transform_float3x4_column_major_ext_t" : (48, {"vx_x" : 0, "vx_y" : 4, "vx_z" : 8, "vy_x" : 12, "vy_y" : 16, "vy_z" : 20, "vz_x" : 24, "vz_y" : 28, "vz_z" : 32, "p_x" : 36, "p_y" : 40, "p_z" : 44}),
+    "ze_rtas_transform_float3x4_aligned_column_major_ext_t" : (64, {"vx_x" : 0, "vx_y" : 4, "vx_z" : 8, "pad0" : 12, "vy_x" : 16, "vy_y" : 20, "vy_z" : 24, "pad1" : 28, "vz_x" : 32, "vz_y" : 36, "vz_z" : 40, "pad2" : 44, "p_x" : 48, "p_y" : 52, "p_z" : 56, "pad3" : 60}),
+    "ze_rtas_transform_float3x4_row_major_ext_t" : (48, {"vx_x" : 0, "vy_x" : 4, "vz_x" : 8, "p_x" : 12, "vx_y" : 16, "vy_y" : 20, "vz_y" : 24, "p_y" : 28, "vx_z" : 32, "vy_z" : 36, "vz_z" : 40, "p_z" : 44}),
+    "ze_rtas_aabb_ext_t" : (24, {"lower" : 0, "upper" : 12}),
+    "ze_rtas_triangle_indices_uint32_ext_t" : (12, {"v0" : 0, "v1" : 4, "v2" : 8}),
+    "ze_rtas_quad_indices_uint32_ext_t" : (16, {"v0" : 0, "v1" : 4, "v2" : 8, "v3" : 12}),
+    "ze_rtas_builder_geometry_info_ext_t" : (1, {"geometryType" : 0}),
+    "ze_rtas_builder_triangles_geometry_info_ext_t" : (40, {"geometryType" : 0, "geometryFlags" : 1, "geometryMask" : 2, "triangleFormat" : 3, "vertexFormat" : 4, "triangleCount" : 8, "vertexCount" : 12, "triangleStride" : 16, "vertexStride" : 20, "pTriangleBuffer" : 24, "pVertexBuffer" : 32}),
+    "ze_rtas_builder_quads_geometry_info_ext_t" : (40, {"geometryType" : 0, "geometryFlags" : 1, "geometryMask" : 2, "quadFormat" : 3, "vertexFormat" : 4, "quadCount" : 8, "vertexCount" : 12, "quadStride" : 16, "vertexStride" : 20, "pQuadBuffer" : 24, "pVertexBuffer" : 32}),
+    "ze_rtas_geometry_aabbs_ext_cb_params_t" : (48, {"stype" : 0, "pNext" : 8, "primID" : 16, "primIDCount" : 20, "pGeomUserPtr" : 24, "pBuildUserPtr" : 32, "pBoundsOut" : 40}),
+    "ze_rtas_builder_procedural_geometry_info_ext_t" : (24, {"geometryType" : 0, "geometryFlags" : 1, "geometryMask" : 2, "reserved" : 3, "primCount" : 4, "pfnGetBoundsCb" : 8, "pGeomUserPtr" : 16}),
+    "ze_rtas_builder_instance_geometry_info_ext_t" : (32, {"geometryType" : 0, "instanceFlags" : 1, "geometryMask" : 2, "transformFormat" : 3, "instanceUserID" : 4, "pTransform" : 8, "pBounds" : 16, "pAccelerationStructure" : 24}),
+    "ze_rtas_builder_build_op_ext_desc_t" : (48, {"stype" : 0, "pNext" : 8, "rtasFormat" : 16, "buildQuality" : 20, "buildFlags" : 24, "ppGeometries" : 32, "numGeometries" : 40}),
+    "ze_device_vector_width_properties_ext_t" : (80, {"stype" : 0, "pNext" : 8, "vector_width_size" : 16, "preferred_vector_width_char" : 20, "preferred_vector_width_short" : 24, "preferred_vector_width_int" : 28, "preferred_vector_width_long" : 32, "preferred_vector_width_float" : 36, "preferred_vector_width_double" : 40, "preferred_vector_width_half" : 44, "native_vector_width_char" : 48, "native_vector_width_short" : 52, "native_vector_width_int" : 56, "native_vector_width_long" : 60, "native_vector_width_float" : 64, "native_vector_width_double" : 68, "native_vector_width_half" : 72}),
+    "ze_cache_reservation_ext_desc_t" : (24, {"stype" : 0, "pNext" : 8, "maxCacheReservationSize" : 16}),
+    "ze_image_view_planar_ext_desc_t" : (24, {"stype" : 0, "pNext" : 8, "planeIndex" : 16}),
+    "ze_eu_count_ext_t" : (24, {"stype" : 0, "pNext" : 8, "numTotalEUs" : 16}),
+    "ze_pci_address_ext_t" : (16, {"domain" : 0, "bus" : 4, "device" : 8, "function" : 12}),
+    "ze_pci_speed_ext_t" : (16, {"genVersion" : 0, "width" : 4, "maxBandwidth" : 8}),
+    "ze_pci_ext_properties_t" : (48, {"stype" : 0, "pNext" : 8, "address" : 16, "maxSpeed" : 32}),
+    "ze_srgb_ext_desc_t" : (24, {"stype" : 0, "pNext" : 8, "sRGB" : 16}),
+    "ze_image_allocation_ext_properties_t" : (24, {"stype" : 0, "pNext" : 8, "id" : 16}),
+    "ze_linkage_inspection_ext_desc_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "ze_memory_compression_hints_ext_desc_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "ze_driver_memory_free_ext_properties_t" : (24, {"stype" : 0, "pNext" : 8, "freePolicies" : 16}),
+    "ze_memory_free_ext_desc_t" : (24, {"stype" : 0, "pNext" : 8, "freePolicy" : 16}),
+    "ze_device_luid_ext_t" : (8, {"id" : 0}),
+    "ze_device_luid_ext_properties_t" : (32, {"stype" : 0, "pNext" : 8, "luid" : 16, "nodeMask" : 24}),
+    "ze_device_memory_ext_properties_t" : (48, {"stype" : 0, "pNext" : 8, "type" : 16, "physicalSize" : 24, "readBandwidth" : 32, "writeBandwidth" : 36, "bandwidthUnit" : 40}),
+    "ze_device_ip_version_ext_t" : (24, {"stype" : 0, "pNext" : 8, "ipVersion" : 16}),
+    "ze_kernel_max_group_size_properties_ext_t" : (24, {"stype" : 0, "pNext" : 8, "maxGroupSize" : 16}),
+    "ze_sub_allocation_t" : (16, {"base" : 0, "size" : 8}),
+    "ze_event_query_kernel_timestamps_ext_properties_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "ze_synchronized_timestamp_data_ext_t" : (16, {"kernelStart" : 0, "kernelEnd" : 8}),
+    "ze_synchronized_timestamp_result_ext_t" : (32, {"global" : 0, "context" : 16}),
+    "ze_event_query_kernel_timestamps_results_ext_properties_t" : (32, {"stype" : 0, "pNext" : 8, "pKernelTimestampsBuffer" : 16, "pSynchronizedTimestampsBuffer" : 24}),
+    "ze_global_callbacks_t" : (8, {"pfnInitCb" : 0}),
+    "ze_driver_callbacks_t" : (40, {"pfnGetCb" : 0, "pfnGetApiVersionCb" : 8, "pfnGetPropertiesCb" : 16, "pfnGetIpcPropertiesCb" : 24, "pfnGetExtensionPropertiesCb" : 32}),
+    "ze_device_callbacks_t" : (112, {"pfnGetCb" : 0, "pfnGetSubDevicesCb" : 8, "pfnGetPropertiesCb" : 16, "pfnGetComputePropertiesCb" : 24, "pfnGetModulePropertiesCb" : 32, "pfnGetCommandQueueGroupPropertiesCb" : 40, "pfnGetMemoryPropertiesCb" : 48, "pfnGetMemoryAccessPropertiesCb" : 56, "pfnGetCachePropertiesCb" : 64, "pfnGetImagePropertiesCb" : 72, "pfnGetExternalMemoryPropertiesCb" : 80, "pfnGetP2PPropertiesCb" : 88, "pfnCanAccessPeerCb" : 96, "pfnGetStatusCb" : 104}),
+    "ze_context_callbacks_t" : (64, {"pfnCreateCb" : 0, "pfnDestroyCb" : 8, "pfnGetStatusCb" : 16, "pfnSystemBarrierCb" : 24, "pfnMakeMemoryResidentCb" : 32, "pfnEvictMemoryCb" : 40, "pfnMakeImageResidentCb" : 48, "pfnEvictImageCb" : 56}),
+    "ze_command_queue_callbacks_t" : (32, {"pfnCreateCb" : 0, "pfnDestroyCb" : 8, "pfnExecuteCommandListsCb" : 16, "pfnSynchronizeCb" : 24}),
+    "ze_command_list_callbacks_t" : (208, {"pfnCreateCb" : 0, "pfnCreateImmediateCb" : 8, "pfnDestroyCb" : 16, "pfnCloseCb" : 24, "pfnResetCb" : 32, "pfnAppendWriteGlobalTimestampCb" : 40, "pfnAppendBarrierCb" : 48, "pfnAppendMemoryRangesBarrierCb" : 56, "pfnAppendMemoryCopyCb" : 64, "pfnAppendMemoryFillCb" : 72, "pfnAppendMemoryCopyRegionCb" : 80, "pfnAppendMemoryCopyFromContextCb" : 88, "pfnAppendImageCopyCb" : 96, "pfnAppendImageCopyRegionCb" : 104, "pfnAppendImageCopyToMemoryCb" : 112, "pfnAppendImageCopyFromMemoryCb" : 120, "pfnAppendMemoryPrefetchCb" : 128, "pfnAppendMemAdviseCb" : 136, "pfnAppendSignalEventCb" : 144, "pfnAppendWaitOnEventsCb" : 152, "pfnAppendEventResetCb" : 160, "pfnAppendQueryKernelTimestampsCb" : 168, "pfnAppendLaunchKernelCb" : 176, "pfnAppendLaunchCooperativeKernelCb" : 184, "pfnAppendLaunchKernelIndirectCb" : 192, "pfnAppendLaunchMultipleKernelsIndirectCb" : 200}),
+    "ze_image_callbacks_t" : (24, {"pfnGetPropertiesCb" : 0, "pfnCreateCb" : 8, "pfnDestroyCb" : 16}),
+    "ze_mem_callbacks_t" : (72, {"pfnAllocSharedCb" : 0, "pfnAllocDeviceCb" : 8, "pfnAllocHostCb" : 16, "pfnFreeCb" : 24, "pfnGetAllocPropertiesCb" : 32, "pfnGetAddressRangeCb" : 40, "pfnGetIpcHandleCb" : 48, "pfnOpenIpcHandleCb" : 56, "pfnCloseIpcHandleCb" : 64}),
+    "ze_fence_callbacks_t" : (40, {"pfnCreateCb" : 0, "pfnDestroyCb" : 8, "pfnHostSynchronizeCb" : 16, "pfnQueryStatusCb" : 24, "pfnResetCb" : 32}),
+    "ze_event_pool_callbacks_t" : (40, {"pfnCreateCb" : 0, "pfnDestroyCb" : 8, "pfnGetIpcHandleCb" : 16, "pfnOpenIpcHandleCb" : 24, "pfnCloseIpcHandleCb" : 32}),
+    "ze_event_callbacks_t" : (56, {"pfnCreateCb" : 0, "pfnDestroyCb" : 8, "pfnHostSignalCb" : 16, "pfnHostSynchronizeCb" : 24, "pfnQueryStatusCb" : 32, "pfnHostResetCb" : 40, "pfnQueryKernelTimestampCb" : 48}),
+    "ze_module_callbacks_t" : (64, {"pfnCreateCb" : 0, "pfnDestroyCb" : 8, "pfnDynamicLinkCb" : 16, "pfnGetNativeBinaryCb" : 24, "pfnGetGlobalPointerCb" : 32, "pfnGetKernelNamesCb" : 40, "pfnGetPropertiesCb" : 48, "pfnGetFunctionPointerCb" : 56}),
+    "ze_module_build_log_callbacks_t" : (16, {"pfnDestroyCb" : 0, "pfnGetStringCb" : 8}),
+    "ze_kernel_callbacks_t" : (96, {"pfnCreateCb" : 0, "pfnDestroyCb" : 8, "pfnSetCacheConfigCb" : 16, "pfnSetGroupSizeCb" : 24, "pfnSuggestGroupSizeCb" : 32, "pfnSuggestMaxCooperativeGroupCountCb" : 40, "pfnSetArgumentValueCb" : 48, "pfnSetIndirectAccessCb" : 56, "pfnGetIndirectAccessCb" : 64, "pfnGetSourceAttributesCb" : 72, "pfnGetPropertiesCb" : 80, "pfnGetNameCb" : 88}),
+    "ze_sampler_callbacks_t" : (16, {"pfnCreateCb" : 0, "pfnDestroyCb" : 8}),
+    "ze_physical_mem_callbacks_t" : (16, {"pfnCreateCb" : 0, "pfnDestroyCb" : 8}),
+    "ze_virtual_mem_callbacks_t" : (56, {"pfnReserveCb" : 0, "pfnFreeCb" : 8, "pfnQueryPageSizeCb" : 16, "pfnMapCb" : 24, "pfnUnmapCb" : 32, "pfnSetAccessAttributeCb" : 40, "pfnGetAccessAttributeCb" : 48}),
+    "ze_callbacks_t" : (960, {"Global" : 0, "Driver" : 8, "Device" : 48, "Context" : 160, "CommandQueue" : 224, "CommandList" : 256, "Fence" : 464, "EventPool" : 504, "Event" : 544, "Image" : 600, "Module" : 624, "ModuleBuildLog" : 688, "Kernel" : 704, "Sampler" : 800, "PhysicalMem" : 816, "Mem" : 832, "VirtualMem" : 904}),
+    "_ze_rtas_builder_dditable_t" : (40, {"pfnCreateExt" : 0, "pfnGetBuildPropertiesExt" : 8, "pfnBuildExt" : 16, "pfnCommandListAppendCopyExt" : 24, "pfnDestroyExt" : 32}),
+    "_ze_rtas_builder_exp_dditable_t" : (32, {"pfnCreateExp" : 0, "pfnGetBuildPropertiesExp" : 8, "pfnBuildExp" : 16, "pfnDestroyExp" : 24}),
+    "_ze_rtas_parallel_operation_dditable_t" : (32, {"pfnCreateExt" : 0, "pfnGetPropertiesExt" : 8, "pfnJoinExt" : 16, "pfnDestroyExt" : 24}),
+    "_ze_rtas_parallel_operation_exp_dditable_t" : (32, {"pfnCreateExp" : 0, "pfnGetPropertiesExp" : 8, "pfnJoinExp" : 16, "pfnDestroyExp" : 24}),
+    "_ze_global_dditable_t" : (16, {"pfnInit" : 0, "pfnInitDrivers" : 8}),
+    "_ze_driver_dditable_t" : (64, {"pfnGet" : 0, "pfnGetApiVersion" : 8, "pfnGetProperties" : 16, "pfnGetIpcProperties" : 24, "pfnGetExtensionProperties" : 32, "pfnGetExtensionFunctionAddress" : 40, "pfnGetLastErrorDescription" : 48, "pfnRTASFormatCompatibilityCheckExt" : 56}),
+    "_ze_driver_exp_dditable_t" : (8, {"pfnRTASFormatCompatibilityCheckExp" : 0}),
+    "_ze_device_dditable_t" : (176, {"pfnGet" : 0, "pfnGetSubDevices" : 8, "pfnGetProperties" : 16, "pfnGetComputeProperties" : 24, "pfnGetModuleProperties" : 32, "pfnGetCommandQueueGroupProperties" : 40, "pfnGetMemoryProperties" : 48, "pfnGetMemoryAccessProperties" : 56, "pfnGetCacheProperties" : 64, "pfnGetImageProperties" : 72, "pfnGetExternalMemoryProperties" : 80, "pfnGetP2PProperties" : 88, "pfnCanAccessPeer" : 96, "pfnGetStatus" : 104, "pfnGetGlobalTimestamps" : 112, "pfnReserveCacheExt" : 120, "pfnSetCacheAdviceExt" : 128, "pfnPciGetPropertiesExt" : 136, "pfnGetRootDevice" : 144, "pfnImportExternalSemaphoreExt" : 152, "pfnReleaseExternalSemaphoreExt" : 160, "pfnGetVectorWidthPropertiesExt" : 168}),
+    "_ze_device_exp_dditable_t" : (8, {"pfnGetFabricVertexExp" : 0}),
+    "_ze_context_dditable_t" : (72, {"pfnCreate" : 0, "pfnDestroy" : 8, "pfnGetStatus" : 16, "pfnSystemBarrier" : 24, "pfnMakeMemoryResident" : 32, "pfnEvictMemory" : 40, "pfnMakeImageResident" : 48, "pfnEvictImage" : 56, "pfnCreateEx" : 64}),
+    "_ze_command_queue_dditable_t" : (48, {"pfnCreate" : 0, "pfnDestroy" : 8, "pfnExecuteCommandLists" : 16, "pfnSynchronize" : 24, "pfnGetOrdinal" : 32, "pfnGetIndex" : 40}),
+    "_ze_command_list_dditable_t" : (288, {"pfnCreate" : 0, "pfnCreateImmediate" : 8, "pfnDestroy" : 16, "pfnClose" : 24, "pfnReset" : 32, "pfnAppendWriteGlobalTimestamp" : 40, "pfnAppendBarrier" : 48, "pfnAppendMemoryRangesBarrier" : 56, "pfnAppendMemoryCopy" : 64, "pfnAppendMemoryFill" : 72, "pfnAppendMemoryCopyRegion" : 80, "pfnAppendMemoryCopyFromContext" : 88, "pfnAppendImageCopy" : 96, "pfnAppendImageCopyRegion" : 104, "pfnAppendImageCopyToMemory" : 112, "pfnAppendImageCopyFromMemory" : 120, "pfnAppendMemoryPrefetch" : 128, "pfnAppendMemAdvise" : 136, "pfnAppendSignalEvent" : 144, "pfnAppendWaitOnEvents" : 152, "pfnAppendEventReset" : 160, "pfnAppendQueryKernelTimestamps" : 168, "pfnAppendLaunchKernel" : 176, "pfnAppendLaunchCooperativeKernel" : 184, "pfnAppendLaunchKernelIndirect" : 192, "pfnAppendLaunchMultipleKernelsIndirect" : 200, "pfnAppendImageCopyToMemoryExt" : 208, "pfnAppendImageCopyFromMemoryExt" : 216, "pfnHostSynchronize" : 224, "pfnGetDeviceHandle" : 232, "pfnGetContextHandle" : 240, "pfnGetOrdinal" : 248, "pfnImmediateGetIndex" : 256, "pfnIsImmediate" : 264, "pfnAppendSignalExternalSemaphoreExt" : 272, "pfnAppendWaitExternalSemaphoreExt" : 280}),
+    "_ze_command_list_exp_dditable_t" : (64, {"pfnCreateCloneExp" : 0, "pfnImmediateAppendCommandListsExp" : 8, "pfnGetNextCommandIdExp" : 16, "pfnUpdateMutableCommandsExp" : 24, "pfnUpdateMutableCommandSignalEventExp" : 32, "pfnUpdateMutableCommandWaitEventsExp" : 40, "pfnGetNextCommandIdWithKernelsExp" : 48, "pfnUpdateMutableCommandKernelsExp" : 56}),
+    "_ze_image_dditable_t" : (40, {"pfnGetProperties" : 0, "pfnCreate" : 8, "pfnDestroy" : 16, "pfnGetAllocPropertiesExt" : 24, "pfnViewCreateExt" : 32}),
+    "_ze_image_exp_dditable_t" : (24, {"pfnGetMemoryPropertiesExp" : 0, "pfnViewCreateExp" : 8, "pfnGetDeviceOffsetExp" : 16}),
+    "_ze_mem_dditable_t" : (96, {"pfnAllocShared" : 0, "pfnAllocDevice" : 8, "pfnAllocHost" : 16, "pfnFree" : 24, "pfnGetAllocProperties" : 32, "pfnGetAddressRange" : 40, "pfnGetIpcHandle" : 48, "pfnOpenIpcHandle" : 56, "pfnCloseIpcHandle" : 64, "pfnFreeExt" : 72, "pfnPutIpcHandle" : 80, "pfnGetPitchFor2dImage" : 88}),
+    "_ze_mem_exp_dditable_t" : (32, {"pfnGetIpcHandleFromFileDescriptorExp" : 0, "pfnGetFileDescriptorFromIpcHandleExp" : 8, "pfnSetAtomicAccessAttributeExp" : 16, "pfnGetAtomicAccessAttributeExp" : 24}),
+    "_ze_fence_dditable_t" : (40, {"pfnCreate" : 0, "pfnDestroy" : 8, "pfnHostSynchronize" : 16, "pfnQueryStatus" : 24, "pfnReset" : 32}),
+    "_ze_event_pool_dditable_t" : (64, {"pfnCreate" : 0, "pfnDestroy" : 8, "pfnGetIpcHandle" : 16, "pfnOpenIpcHandle" : 24, "pfnCloseIpcHandle" : 32, "pfnPutIpcHandle" : 40, "pfnGetContextHandle" : 48, "pfnGetFlags" : 56}),
+    "_ze_event_dditable_t" : (88, {"pfnCreate" : 0, "pfnDestroy" : 8, "pfnHostSignal" : 16, "pfnHostSynchronize" : 24, "pfnQueryStatus" : 32, "pfnHostReset" : 40, "pfnQueryKernelTimestamp" : 48, "pfnQueryKernelTimestampsExt" : 56, "pfnGetEventPool" : 64, "pfnGetSignalScope" : 72, "pfnGetWaitScope" : 80}),
+    "_ze_event_exp_dditable_t" : (8, {"pfnQueryTimestampsExp" : 0}),
+    "_ze_module_dditable_t" : (72, {"pfnCreate" : 0, "pfnDestroy" : 8, "pfnDynamicLink" : 16, "pfnGetNativeBinary" : 24, "pfnGetGlobalPointer" : 32, "pfnGetKernelNames" : 40, "pfnGetProperties" : 48, "pfnGetFunctionPointer" : 56, "pfnInspectLinkageExt" : 64}),
+    "_ze_module_build_log_dditable_t" : (16, {"pfnDestroy" : 0, "pfnGetString" : 8}),
+    "_ze_kernel_dditable_t" : (96, {"pfnCreate" : 0, "pfnDestroy" : 8, "pfnSetCacheConfig" : 16, "pfnSetGroupSize" : 24, "pfnSuggestGroupSize" : 32, "pfnSuggestMaxCooperativeGroupCount" : 40, "pfnSetArgumentValue" : 48, "pfnSetIndirectAccess" : 56, "pfnGetIndirectAccess" : 64, "pfnGetSourceAttributes" : 72, "pfnGetProperties" : 80, "pfnGetName" : 88}),
+    "_ze_kernel_exp_dditable_t" : (24, {"pfnSetGlobalOffsetExp" : 0, "pfnSchedulingHintExp" : 8, "pfnGetBinaryExp" : 16}),
+    "_ze_sampler_dditable_t" : (16, {"pfnCreate" : 0, "pfnDestroy" : 8}),
+    "_ze_physical_mem_dditable_t" : (16, {"pfnCreate" : 0, "pfnDestroy" : 8}),
+    "_ze_virtual_mem_dditable_t" : (56, {"pfnReserve" : 0, "pfnFree" : 8, "pfnQueryPageSize" : 16, "pfnMap" : 24, "pfnUnmap" : 32, "pfnSetAccessAttribute" : 40, "pfnGetAccessAttribute" : 48}),
+    "_ze_fabric_vertex_exp_dditable_t" : (32, {"pfnGetExp" : 0, "pfnGetSubVerticesExp" : 8, "pfnGetPropertiesExp" : 16, "pfnGetDeviceExp" : 24}),
+    "_ze_fabric_edge_exp_dditable_t" : (24, {"pfnGetExp" : 0, "pfnGetVerticesExp" : 8, "pfnGetPropertiesExp" : 16}),
+    "_ze_dditable_t" : (1624, {"RTASBuilder" : 0, "RTASBuilderExp" : 40, "RTASParallelOperation" : 72, "RTASParallelOperationExp" : 104, "Global" : 136, "Driver" : 152, "DriverExp" : 216, "Device" : 224, "DeviceExp" : 400, "Context" : 408, "CommandQueue" : 480, "CommandList" : 528, "CommandListExp" : 816, "Image" : 880, "ImageExp" : 920, "Mem" : 944, "MemExp" : 1040, "Fence" : 1072, "EventPool" : 1112, "Event" : 1176, "EventExp" : 1264, "Module" : 1272, "ModuleBuildLog" : 1344, "Kernel" : 1360, "KernelExp" : 1456, "Sampler" : 1480, "PhysicalMem" : 1496, "VirtualMem" : 1512, "FabricVertexExp" : 1568, "FabricEdgeExp" : 1600}),
+    "ze_module_program_exp_desc_t" : (56, {"stype" : 0, "pNext" : 8, "count" : 16, "inputSizes" : 24, "pInputModules" : 32, "pBuildFlags" : 40, "pConstants" : 48}),
+    "ze_relaxed_allocation_limits_exp_desc_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "ze_image_memory_properties_exp_t" : (40, {"stype" : 0, "pNext" : 8, "size" : 16, "rowPitch" : 24, "slicePitch" : 32}),
+    "ze_image_view_planar_exp_desc_t" : (24, {"stype" : 0, "pNext" : 8, "planeIndex" : 16}),
+    "ze_scheduling_hint_exp_properties_t" : (24, {"stype" : 0, "pNext" : 8, "schedulingHintFlags" : 16}),
+    "ze_scheduling_hint_exp_desc_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "ze_context_power_saving_hint_exp_desc_t" : (24, {"stype" : 0, "pNext" : 8, "hint" : 16}),
+    "ze_device_p2p_bandwidth_exp_properties_t" : (40, {"stype" : 0, "pNext" : 8, "logicalBandwidth" : 16, "physicalBandwidth" : 20, "bandwidthUnit" : 24, "logicalLatency" : 28, "physicalLatency" : 32, "latencyUnit" : 36}),
+    "ze_copy_bandwidth_exp_properties_t" : (24, {"stype" : 0, "pNext" : 8, "copyBandwidth" : 16, "copyBandwidthUnit" : 20}),
+    "ze_fabric_vertex_pci_exp_address_t" : (16, {"domain" : 0, "bus" : 4, "device" : 8, "function" : 12}),
+    "ze_fabric_vertex_exp_properties_t" : (56, {"stype" : 0, "pNext" : 8, "uuid" : 16, "type" : 32, "remote" : 36, "address" : 40}),
+    "ze_fabric_edge_exp_properties_t" : (312, {"stype" : 0, "pNext" : 8, "uuid" : 16, "model" : 32, "bandwidth" : 288, "bandwidthUnit" : 292, "latency" : 296, "latencyUnit" : 300, "duplexity" : 304}),
+    "ze_memory_sub_allocations_exp_properties_t" : (32, {"stype" : 0, "pNext" : 8, "pCount" : 16, "pSubAllocations" : 24}),
+    "ze_rtas_builder_exp_desc_t" : (24, {"stype" : 0, "pNext" : 8, "builderVersion" : 16}),
+    "ze_rtas_builder_exp_properties_t" : (48, {"stype" : 0, "pNext" : 8, "flags" : 16, "rtasBufferSizeBytesExpected" : 24, "rtasBufferSizeBytesMaxRequired" : 32, "scratchBufferSizeBytes" : 40}),
+    "ze_rtas_parallel_operation_exp_properties_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16, "maxConcurrency" : 20}),
+    "ze_rtas_device_exp_properties_t" : (32, {"stype" : 0, "pNext" : 8, "flags" : 16, "rtasFormat" : 20, "rtasBufferAlignment" : 24}),
+    "ze_rtas_float3_exp_t" : (12, {"x" : 0, "y" : 4, "z" : 8}),
+    "ze_rtas_transform_float3x4_column_major_exp_t" : (48, {"vx_x" : 0, "vx_y" : 4, "vx_z" : 8, "vy_x" : 12, "vy_y" : 16, "vy_z" : 20, "vz_x" : 24, "vz_y" : 28, "vz_z" : 32, "p_x" : 36, "p_y" : 40, "p_z" : 44}),
+    "ze_rtas_transform_float3x4_aligned_column_major_exp_t" : (64, {"vx_x" : 0, "vx_y" : 4, "vx_z" : 8, "pad0" : 12, "vy_x" : 16, "vy_y" : 20, "vy_z" : 24, "pad1" : 28, "vz_x" : 32, "vz_y" : 36, "vz_z" : 40, "pad2" : 44, "p_x" : 48, "p_y" : 52, "p_z" : 56, "pad3" : 60}),
+    "ze_rtas_transform_float3x4_row_major_exp_t" : (48, {"vx_x" : 0, "vy_x" : 4, "vz_x" : 8, "p_x" : 12, "vx_y" : 16, "vy_y" : 20, "vz_y" : 24, "p_y" : 28, "vx_z" : 32, "vy_z" : 36, "vz_z" : 40, "p_z" : 44}),
+    "ze_rtas_aabb_exp_t" : (24, {"lower" : 0, "upper" : 12}),
+    "ze_rtas_triangle_indices_uint32_exp_t" : (12, {"v0" : 0, "v1" : 4, "v2" : 8}),
+    "ze_rtas_quad_indices_uint32_exp_t" : (16, {"v0" : 0, "v1" : 4, "v2" : 8, "v3" : 12}),
+    "ze_rtas_builder_geometry_info_exp_t" : (1, {"geometryType" : 0}),
+    "ze_rtas_builder_triangles_geometry_info_exp_t" : (40, {"geometryType" : 0, "geometryFlags" : 1, "geometryMask" : 2, "triangleFormat" : 3, "vertexFormat" : 4, "triangleCount" : 8, "vertexCount" : 12, "triangleStride" : 16, "vertexStride" : 20, "pTriangleBuffer" : 24, "pVertexBuffer" : 32}),
+    "ze_rtas_builder_quads_geometry_info_exp_t" : (40, {"geometryType" : 0, "geometryFlags" : 1, "geometryMask" : 2, "quadFormat" : 3, "vertexFormat" : 4, "quadCount" : 8, "vertexCount" : 12, "quadStride" : 16, "vertexStride" : 20, "pQuadBuffer" : 24, "pVertexBuffer" : 32}),
+    "ze_rtas_geometry_aabbs_exp_cb_params_t" : (48, {"stype" : 0, "pNext" : 8, "primID" : 16, "primIDCount" : 20, "pGeomUserPtr" : 24, "pBuildUserPtr" : 32, "pBoundsOut" : 40}),
+    "ze_rtas_builder_procedural_geometry_info_exp_t" : (24, {"geometryType" : 0, "geometryFlags" : 1, "geometryMask" : 2, "reserved" : 3, "primCount" : 4, "pfnGetBoundsCb" : 8, "pGeomUserPtr" : 16}),
+    "ze_rtas_builder_instance_geometry_info_exp_t" : (32, {"geometryType" : 0, "instanceFlags" : 1, "geometryMask" : 2, "transformFormat" : 3, "instanceUserID" : 4, "pTransform" : 8, "pBounds" : 16, "pAccelerationStructure" : 24}),
+    "ze_rtas_builder_build_op_exp_desc_t" : (48, {"stype" : 0, "pNext" : 8, "rtasFormat" : 16, "buildQuality" : 20, "buildFlags" : 24, "ppGeometries" : 32, "numGeometries" : 40}),
+    "ze_event_pool_counter_based_exp_desc_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "ze_image_bindless_exp_desc_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "ze_image_pitched_exp_desc_t" : (24, {"stype" : 0, "pNext" : 8, "ptr" : 16}),
+    "ze_device_pitched_alloc_exp_properties_t" : (32, {"stype" : 0, "pNext" : 8, "maxImageLinearWidth" : 16, "maxImageLinearHeight" : 24}),
+    "ze_mutable_command_id_exp_desc_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "ze_mutable_command_list_exp_properties_t" : (24, {"stype" : 0, "pNext" : 8, "mutableCommandListFlags" : 16, "mutableCommandFlags" : 20}),
+    "ze_mutable_command_list_exp_desc_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "ze_mutable_commands_exp_desc_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "ze_mutable_kernel_argument_exp_desc_t" : (48, {"stype" : 0, "pNext" : 8, "commandId" : 16, "argIndex" : 24, "argSize" : 32, "pArgValue" : 40}),
+    "ze_mutable_group_count_exp_desc_t" : (32, {"stype" : 0, "pNext" : 8, "commandId" : 16, "pGroupCount" : 24}),
+    "ze_mutable_group_size_exp_desc_t" : (40, {"stype" : 0, "pNext" : 8, "commandId" : 16, "groupSizeX" : 24, "groupSizeY" : 28, "groupSizeZ" : 32}),
+    "ze_mutable_global_offset_exp_desc_t" : (40, {"stype" : 0, "pNext" : 8, "commandId" : 16, "offsetX" : 24, "offsetY" : 28, "offsetZ" : 32}),
+    "ze_mutable_graph_argument_exp_desc_t" : (40, {"stype" : 0, "pNext" : 8, "commandId" : 16, "argIndex" : 24, "pArgValue" : 32}),
+    "zes_base_properties_t" : (16, {"stype" : 0, "pNext" : 8}),
+    "zes_base_desc_t" : (16, {"stype" : 0, "pNext" : 8}),
+    "zes_base_state_t" : (16, {"stype" : 0, "pNext" : 8}),
+    "zes_base_config_t" : (16, {"stype" : 0, "pNext" : 8}),
+    "zes_base_capability_t" : (16, {"stype" : 0, "pNext" : 8}),
+    "zes_driver_extension_properties_t" : (260, {"name" : 0, "version" : 256}),
+    "zes_device_state_t" : (24, {"stype" : 0, "pNext" : 8, "reset" : 16, "repaired" : 20}),
+    "zes_reset_properties_t" : (24, {"stype" : 0, "pNext" : 8, "force" : 16, "resetType" : 20}),
+    "zes_uuid_t" : (16, {"id" : 0}),
+    "zes_device_properties_t" : (776, {"stype" : 0, "pNext" : 8, "core" : 16, "numSubdevices" : 384, "serialNumber" : 388, "boardNumber" : 452, "brandName" : 516, "modelName" : 580, "vendorName" : 644, "driverVersion" : 708}),
+    "zes_device_ext_properties_t" : (40, {"stype" : 0, "pNext" : 8, "uuid" : 16, "type" : 32, "flags" : 36}),
+    "zes_process_state_t" : (48, {"stype" : 0, "pNext" : 8, "processId" : 16, "memSize" : 24, "sharedSize" : 32, "engines" : 40}),
+    "zes_pci_address_t" : (16, {"domain" : 0, "bus" : 4, "device" : 8, "function" : 12}),
+    "zes_pci_speed_t" : (16, {"gen" : 0, "width" : 4, "maxBandwidth" : 8}),
+    "zes_pci_properties_t" : (56, {"stype" : 0, "pNext" : 8, "address" : 16, "maxSpeed" : 32, "haveBandwidthCounters" : 48, "havePacketCounters" : 49, "haveReplayCounters" : 50}),
+    "zes_pci_state_t" : (48, {"stype" : 0, "pNext" : 8, "status" : 16, "qualityIssues" : 20, "stabilityIssues" : 24, "speed" : 32}),
+    "zes_pci_bar_properties_t" : (40, {"stype" : 0, "pNext" : 8, "type" : 16, "index" : 20, "base" : 24, "size" : 32}),
+    "zes_pci_bar_properties_1_2_t" : (48, {"stype" : 0, "pNext" : 8, "type" : 16, "index" : 20, "base" : 24, "size" : 32, "resizableBarSupported" : 40, "resizableBarEnabled" : 41}),
+    "zes_pci_stats_t" : (56, {"timestamp" : 0, "replayCounter" : 8, "packetCounter" : 16, "rxCounter" : 24, "txCounter" : 32, "speed" : 40}),
+    "zes_overclock_properties_t" : (32, {"stype" : 0, "pNext" : 8, "domainType" : 16, "AvailableControls" : 20, "VFProgramType" : 24, "NumberOfVFPoints" : 28}),
+    "zes_control_property_t" : (40, {"MinValue" : 0, "MaxValue" : 8, "StepValue" : 16, "RefValue" : 24, "DefaultValue" : 32}),
+    "zes_vf_property_t" : (48, {"MinFreq" : 0, "MaxFreq" : 8, "StepFreq" : 16, "MinVolt" : 24, "MaxVolt" : 32, "StepVolt" : 40}),
+    "zes_diag_test_t" : (68, {"index" : 0, "name" : 4}),
+    "zes_diag_properties_t" : (96, {"stype" : 0, "pNext" : 8, "onSubdevice" : 16, "subdeviceId" : 20, "name" : 24, "haveTests" : 88}),
+    "zes_device_ecc_desc_t" : (24, {"stype" : 0, "pNext" : 8, "state" : 16}),
+    "zes_device_ecc_properties_t" : (32, {"stype" : 0, "pNext" : 8, "currentState" : 16, "pendingState" : 20, "pendingAction" : 24}),
+    "zes_engine_properties_t" : (32, {"stype" : 0, "pNext" : 8, "type" : 16, "onSubdevice" : 20, "subdeviceId" : 24}),
+    "zes_engine_stats_t" : (16, {"activeTime" : 0, "timestamp" : 8}),
+    "zes_fabric_port_id_t" : (12, {"fabricId" : 0, "attachId" : 4, "portNumber" : 8}),
+    "zes_fabric_port_speed_t" : (16, {"bitRate" : 0, "width" : 8}),
+    "zes_fabric_port_properties_t" : (328, {"stype" : 0, "pNext" : 8, "model" : 16, "onSubdevice" : 272, "subdeviceId" : 276, "portId" : 280, "maxRxSpeed" : 296, "maxTxSpeed" : 312}),
+    "zes_fabric_link_type_t" : (256, {"desc" : 0}),
+    "zes_fabric_port_config_t" : (24, {"stype" : 0, "pNext" : 8, "enabled" : 16, "beaconing" : 17}),
+    "zes_fabric_port_state_t" : (72, {"stype" : 0, "pNext" : 8, "status" : 16, "qualityIssues" : 20, "failureReasons" : 24, "remotePortId" : 28, "rxSpeed" : 40, "txSpeed" : 56}),
+    "zes_fabric_port_throughput_t" : (24, {"timestamp" : 0, "rxCounter" : 8, "txCounter" : 16}),
+    "zes_fabric_port_error_counters_t" : (48, {"stype" : 0, "pNext" : 8, "linkFailureCount" : 16, "fwCommErrorCount" : 24, "fwErrorCount" : 32, "linkDegradeCount" : 40}),
+    "zes_fan_speed_t" : (8, {"speed" : 0, "units" : 4}),
+    "zes_fan_temp_speed_t" : (12, {"temperature" : 0, "speed" : 4}),
+    "zes_fan_speed_table_t" : (388, {"numPoints" : 0, "table" : 4}),
+    "zes_fan_properties_t" : (48, {"stype" : 0, "pNext" : 8, "onSubdevice" : 16, "subdeviceId" : 20, "canControl" : 24, "supportedModes" : 28, "supportedUnits" : 32, "maxRPM" : 36, "maxPoints" : 40}),
+    "zes_fan_config_t" : (416, {"stype" : 0, "pNext" : 8, "mode" : 16, "speedFixed" : 20, "speedTable" : 28}),
+    "zes_firmware_properties_t" : (160, {"stype" : 0, "pNext" : 8, "onSubdevice" : 16, "subdeviceId" : 20, "canControl" : 24, "name" : 25, "version" : 89}),
+    "zes_freq_properties_t" : (48, {"stype" : 0, "pNext" : 8, "type" : 16, "onSubdevice" : 20, "subdeviceId" : 24, "canControl" : 28, "isThrottleEventSupported" : 29, "min" : 32, "max" : 40}),
+    "zes_freq_range_t" : (16, {"min" : 0, "max" : 8}),
+    "zes_freq_state_t" : (64, {"stype" : 0, "pNext" : 8, "currentVoltage" : 16, "request" : 24, "tdp" : 32, "efficient" : 40, "actual" : 48, "throttleReasons" : 56}),
+    "zes_freq_throttle_time_t" : (16, {"throttleTime" : 0, "timestamp" : 8}),
+    "zes_oc_capabilities_t" : (80, {"stype" : 0, "pNext" : 8, "isOcSupported" : 16, "maxFactoryDefaultFrequency" : 24, "maxFactoryDefaultVoltage" : 32, "maxOcFrequency" : 40, "minOcVoltageOffset" : 48, "maxOcVoltageOffset" : 56, "maxOcVoltage" : 64, "isTjMaxSupported" : 72, "isIccMaxSupported" : 73, "isHighVoltModeCapable" : 74, "isHighVoltModeEnabled" : 75, "isExtendedModeSupported" : 76, "isFixedModeSupported" : 77}),
+    "zes_led_properties_t" : (32, {"stype" : 0, "pNext" : 8, "onSubdevice" : 16, "subdeviceId" : 20, "canControl" : 24, "haveRGB" : 25}),
+    "zes_led_color_t" : (24, {"red" : 0, "green" : 8, "blue" : 16}),
+    "zes_led_state_t" : (48, {"stype" : 0, "pNext" : 8, "isOn" : 16, "color" : 24}),
+    "zes_mem_properties_t" : (48, {"stype" : 0, "pNext" : 8, "type" : 16, "onSubdevice" : 20, "subdeviceId" : 24, "location" : 28, "physicalSize" : 32, "busWidth" : 40, "numChannels" : 44}),
+    "zes_mem_state_t" : (40, {"stype" : 0, "pNext" : 8, "health" : 16, "free" : 24, "size" : 32}),
+    "zes_mem_bandwidth_t" : (32, {"readCounter" : 0, "writeCounter" : 8, "maxBandwidth" : 16, "timestamp" : 24}),
+    "zes_mem_ext_bandwidth_t" : (4, {"memoryTimestampValidBits" : 0}),
+    "zes_perf_properties_t" : (32, {"stype" : 0, "pNext" : 8, "onSubdevice" : 16, "subdeviceId" : 20, "engines" : 24}),
+    "zes_power_properties_t" : (40, {"stype" : 0, "pNext" : 8, "onSubdevice" : 16, "subdeviceId" : 20, "canControl" : 24, "isEnergyThresholdSupported" : 25, "defaultLimit" : 28, "minLimit" : 32, "maxLimit" : 36}),
+    "zes_power_energy_counter_t" : (16, {"energy" : 0, "timestamp" : 8}),
+    "zes_power_sustained_limit_t" : (12, {"enabled" : 0, "power" : 4, "interval" : 8}),
+    "zes_power_burst_limit_t" : (8, {"enabled" : 0, "power" : 4}),
+    "zes_power_peak_limit_t" : (8, {"powerAC" : 0, "powerDC" : 4}),
+    "zes_energy_threshold_t" : (24, {"enable" : 0, "threshold" : 8, "processId" : 16}),
+    "zes_psu_properties_t" : (32, {"stype" : 0, "pNext" : 8, "onSubdevice" : 16, "subdeviceId" : 20, "haveFan" : 24, "ampLimit" : 28}),
+    "zes_psu_state_t" : (32, {"stype" : 0, "pNext" : 8, "voltStatus" : 16, "fanFailed" : 20, "temperature" : 24, "current" : 28}),
+    "zes_ras_properties_t" : (32, {"stype" : 0, "pNext" : 8, "type" : 16, "onSubdevice" : 20, "subdeviceId" : 24}),
+    "zes_ras_state_t" : (72, {"stype" : 0, "pNext" : 8, "category" : 16}),
+    "zes_ras_config_t" : (96, {"stype" : 0, "pNext" : 8, "totalThreshold" : 16, "detailedThresholds" : 24}),
+    "zes_sched_properties_t" : (40, {"stype" : 0, "pNext" : 8, "onSubdevice" : 16, "subdeviceId" : 20, "canControl" : 24, "engines" : 28, "supportedModes" : 32}),
+    "zes_sched_timeout_properties_t" : (24, {"stype" : 0, "pNext" : 8, "watchdogTimeout" : 16}),
+    "zes_sched_timeslice_properties_t" : (32, {"stype" : 0, "pNext" : 8, "interval" : 16, "yieldTimeout" : 24}),
+    "zes_standby_properties_t" : (32, {"stype" : 0, "pNext" : 8, "type" : 16, "onSubdevice" : 20, "subdeviceId" : 24}),
+    "zes_temp_properties_t" : (48, {"stype" : 0, "pNext" : 8, "type" : 16, "onSubdevice" : 20, "subdeviceId" : 24, "maxTemperature" : 32, "isCriticalTempSupported" : 40, "isThreshold1Supported" : 41, "isThreshold2Supported" : 42}),
+    "zes_temp_threshold_t" : (16, {"enableLowToHigh" : 0, "enableHighToLow" : 1, "threshold" : 8}),
+    "zes_temp_config_t" : (56, {"stype" : 0, "pNext" : 8, "enableCritical" : 16, "threshold1" : 24, "threshold2" : 40}),
+    "zes_device_ecc_default_properties_ext_t" : (24, {"stype" : 0, "pNext" : 8, "defaultState" : 16}),
+    "zes_power_limit_ext_desc_t" : (48, {"stype" : 0, "pNext" : 8, "level" : 16, "source" : 20, "limitUnit" : 24, "enabledStateLocked" : 28, "enabled" : 29, "intervalValueLocked" : 30, "interval" : 32, "limitValueLocked" : 36, "limit" : 40}),
+    "zes_power_ext_properties_t" : (32, {"stype" : 0, "pNext" : 8, "domain" : 16, "defaultLimit" : 24}),
+    "zes_engine_ext_properties_t" : (24, {"stype" : 0, "pNext" : 8, "countOfVirtualFunctionInstance" : 16}),
+    "_zes_global_dditable_t" : (8, {"pfnInit" : 0}),
+    "_zes_device_dditable_t" : (296, {"pfnGetProperties" : 0, "pfnGetState" : 8, "pfnReset" : 16, "pfnProcessesGetState" : 24, "pfnPciGetProperties" : 32, "pfnPciGetState" : 40, "pfnPciGetBars" : 48, "pfnPciGetStats" : 56, "pfnEnumDiagnosticTestSuites" : 64, "pfnEnumEngineGroups" : 72, "pfnEventRegister" : 80, "pfnEnumFabricPorts" : 88, "pfnEnumFans" : 96, "pfnEnumFirmwares" : 104, "pfnEnumFrequencyDomains" : 112, "pfnEnumLeds" : 120, "pfnEnumMemoryModules" : 128, "pfnEnumPerformanceFactorDomains" : 136, "pfnEnumPowerDomains" : 144, "pfnGetCardPowerDomain" : 152, "pfnEnumPsus" : 160, "pfnEnumRasErrorSets" : 168, "pfnEnumSchedulers" : 176, "pfnEnumStandbyDomains" : 184, "pfnEnumTemperatureSensors" : 192, "pfnEccAvailable" : 200, "pfnEccConfigurable" : 208, "pfnGetEccState" : 216, "pfnSetEccState" : 224, "pfnGet" : 232, "pfnSetOverclockWaiver" : 240, "pfnGetOverclockDomains" : 248, "pfnGetOverclockControls" : 256, "pfnResetOverclockSettings" : 264, "pfnReadOverclockState" : 272, "pfnEnumOverclockDomains" : 280, "pfnResetExt" : 288}),
+    "_zes_device_exp_dditable_t" : (24, {"pfnGetSubDevicePropertiesExp" : 0, "pfnEnumActiveVFExp" : 8, "pfnEnumEnabledVFExp" : 16}),
+    "_zes_driver_dditable_t" : (40, {"pfnEventListen" : 0, "pfnEventListenEx" : 8, "pfnGet" : 16, "pfnGetExtensionProperties" : 24, "pfnGetExtensionFunctionAddress" : 32}),
+    "_zes_driver_exp_dditable_t" : (8, {"pfnGetDeviceByUuidExp" : 0}),
+    "_zes_overclock_dditable_t" : (72, {"pfnGetDomainProperties" : 0, "pfnGetDomainVFProperties" : 8, "pfnGetDomainControlProperties" : 16, "pfnGetControlCurrentValue" : 24, "pfnGetControlPendingValue" : 32, "pfnSetControlUserValue" : 40, "pfnGetControlState" : 48, "pfnGetVFPointValues" : 56, "pfnSetVFPointValues" : 64}),
+    "_zes_scheduler_dditable_t" : (64, {"pfnGetProperties" : 0, "pfnGetCurrentMode" : 8, "pfnGetTimeoutModeProperties" : 16, "pfnGetTimesliceModeProperties" : 24, "pfnSetTimeoutMode" : 32, "pfnSetTimesliceMode" : 40, "pfnSetExclusiveMode" : 48, "pfnSetComputeUnitDebugMode" : 56}),
+    "_zes_performance_factor_dditable_t" : (24, {"pfnGetProperties" : 0, "pfnGetConfig" : 8, "pfnSetConfig" : 16}),
+    "_zes_power_dditable_t" : (64, {"pfnGetProperties" : 0, "pfnGetEnergyCounter" : 8, "pfnGetLimits" : 16, "pfnSetLimits" : 24, "pfnGetEnergyThreshold" : 32, "pfnSetEnergyThreshold" : 40, "pfnGetLimitsExt" : 48, "pfnSetLimitsExt" : 56}),
+    "_zes_frequency_dditable_t" : (136, {"pfnGetProperties" : 0, "pfnGetAvailableClocks" : 8, "pfnGetRange" : 16, "pfnSetRange" : 24, "pfnGetState" : 32, "pfnGetThrottleTime" : 40, "pfnOcGetCapabilities" : 48, "pfnOcGetFrequencyTarget" : 56, "pfnOcSetFrequencyTarget" : 64, "pfnOcGetVoltageTarget" : 72, "pfnOcSetVoltageTarget" : 80, "pfnOcSetMode" : 88, "pfnOcGetMode" : 96, "pfnOcGetIccMax" : 104, "pfnOcSetIccMax" : 112, "pfnOcGetTjMax" : 120, "pfnOcSetTjMax" : 128}),
+    "_zes_engine_dditable_t" : (24, {"pfnGetProperties" : 0, "pfnGetActivity" : 8, "pfnGetActivityExt" : 16}),
+    "_zes_standby_dditable_t" : (24, {"pfnGetProperties" : 0, "pfnGetMode" : 8, "pfnSetMode" : 16}),
+    "_zes_firmware_dditable_t" : (32, {"pfnGetProperties" : 0, "pfnFlash" : 8, "pfnGetFlashProgress" : 16, "pfnGetConsoleLogs" : 24}),
+    "_zes_firmware_exp_dditable_t" : (16, {"pfnGetSecurityVersionExp" : 0, "pfnSetSecurityVersionExp" : 8}),
+    "_zes_memory_dditable_t" : (24, {"pfnGetProperties" : 0, "pfnGetState" : 8, "pfnGetBandwidth" : 16}),
+    "_zes_fabric_port_dditable_t" : (64, {"pfnGetProperties" : 0, "pfnGetLinkType" : 8, "pfnGetConfig" : 16, "pfnSetConfig" : 24, "pfnGetState" : 32, "pfnGetThroughput" : 40, "pfnGetFabricErrorCounters" : 48, "pfnGetMultiPortThroughput" : 56}),
+    "_zes_temperature_dditable_t" : (32, {"pfnGetProperties" : 0, "pfnGetConfig" : 8, "pfnSetConfig" : 16, "pfnGetState" : 24}),
+    "_zes_psu_dditable_t" : (16, {"pfnGetProperties" : 0, "pfnGetState" : 8}),
+    "_zes_fan_dditable_t" : (48, {"pfnGetProperties" : 0, "pfnGetConfig" : 8, "pfnSetDefaultMode" : 16, "pfnSetFixedSpeedMode" : 24, "pfnSetSpeedTableMode" : 32, "pfnGetState" : 40}),
+    "_zes_led_dditable_t" : (32, {"pfnGetProperties" : 0, "pfnGetState" : 8, "pfnSetState" : 16, "pfnSetColor" : 24}),
+    "_zes_ras_dditable_t" : (32, {"pfnGetProperties" : 0, "pfnGetConfig" : 8, "pfnSetConfig" : 16, "pfnGetState" : 24}),
+    "_zes_ras_exp_dditable_t" : (16, {"pfnGetStateExp" : 0, "pfnClearStateExp" : 8}),
+    "_zes_diagnostics_dditable_t" : (24, {"pfnGetProperties" : 0, "pfnGetTests" : 8, "pfnRunTests" : 16}),
+    "_zes_vf_management_exp_dditable_t" : (72, {"pfnGetVFPropertiesExp" : 0, "pfnGetVFMemoryUtilizationExp" : 8, "pfnGetVFEngineUtilizationExp" : 16, "pfnSetVFTelemetryModeExp" : 24, "pfnSetVFTelemetrySamplingIntervalExp" : 32, "pfnGetVFCapabilitiesExp" : 40, "pfnGetVFMemoryUtilizationExp2" : 48, "pfnGetVFEngineUtilizationExp2" : 56, "pfnGetVFCapabilitiesExp2" : 64}),
+    "_zes_dditable_t" : (1192, {"Global" : 0, "Device" : 8, "DeviceExp" : 304, "Driver" : 328, "DriverExp" : 368, "Overclock" : 376, "Scheduler" : 448, "PerformanceFactor" : 512, "Power" : 536, "Frequency" : 600, "Engine" : 736, "Standby" : 760, "Firmware" : 784, "FirmwareExp" : 816, "Memory" : 832, "FabricPort" : 856, "Temperature" : 920, "Psu" : 952, "Fan" : 968, "Led" : 1016, "Ras" : 1048, "RasExp" : 1080, "Diagnostics" : 1096, "VFManagementExp" : 1120}),
+    "zes_ras_state_exp_t" : (16, {"category" : 0, "errorCounter" : 8}),
+    "zes_mem_page_offline_state_exp_t" : (24, {"stype" : 0, "pNext" : 8, "memoryPageOffline" : 16, "maxMemoryPageOffline" : 20}),
+    "zes_mem_bandwidth_counter_bits_exp_properties_t" : (24, {"stype" : 0, "pNext" : 8, "validBitsCount" : 16}),
+    "zes_power_domain_exp_properties_t" : (24, {"stype" : 0, "pNext" : 8, "powerDomain" : 16}),
+    "zes_subdevice_exp_properties_t" : (40, {"stype" : 0, "pNext" : 8, "subdeviceId" : 16, "uuid" : 20}),
+    "zes_vf_exp_properties_t" : (56, {"stype" : 0, "pNext" : 8, "address" : 16, "uuid" : 32, "flags" : 48}),
+    "zes_vf_util_mem_exp_t" : (48, {"stype" : 0, "pNext" : 8, "memTypeFlags" : 16, "free" : 24, "size" : 32, "timestamp" : 40}),
+    "zes_vf_util_engine_exp_t" : (48, {"stype" : 0, "pNext" : 8, "type" : 16, "activeCounterValue" : 24, "samplingCounterValue" : 32, "timestamp" : 40}),
+    "zes_vf_exp_capabilities_t" : (40, {"stype" : 0, "pNext" : 8, "address" : 16, "vfDeviceMemSize" : 32, "vfID" : 36}),
+    "zes_vf_exp2_capabilities_t" : (48, {"stype" : 0, "pNext" : 8, "address" : 16, "vfDeviceMemSize" : 32, "vfID" : 40}),
+    "zes_vf_util_mem_exp2_t" : (32, {"stype" : 0, "pNext" : 8, "vfMemLocation" : 16, "vfMemUtilized" : 24}),
+    "zes_vf_util_engine_exp2_t" : (40, {"stype" : 0, "pNext" : 8, "vfEngineType" : 16, "activeCounterValue" : 24, "samplingCounterValue" : 32}),
+    "zet_base_properties_t" : (16, {"stype" : 0, "pNext" : 8}),
+    "zet_base_desc_t" : (16, {"stype" : 0, "pNext" : 8}),
+    "zet_value_t" : (8, {"ui32" : 0, "ui64" : 0, "fp32" : 0, "fp64" : 0, "b8" : 0}),
+    "zet_typed_value_t" : (16, {"type" : 0, "value" : 8}),
+    "zet_device_debug_properties_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16}),
+    "zet_debug_config_t" : (4, {"pid" : 0}),
+    "zet_debug_event_info_detached_t" : (4, {"reason" : 0}),
+    "zet_debug_event_info_module_t" : (32, {"format" : 0, "moduleBegin" : 8, "moduleEnd" : 16, "load" : 24}),
+    "zet_debug_event_info_thread_stopped_t" : (16, {"thread" : 0}),
+    "zet_debug_event_info_page_fault_t" : (24, {"address" : 0, "mask" : 8, "reason" : 16}),
+    "zet_debug_event_info_t" : (32, {"detached" : 0, "module" : 0, "thread" : 0, "page_fault" : 0}),
+    "zet_debug_event_t" : (40, {"type" : 0, "flags" : 4, "info" : 8}),
+    "zet_debug_memory_space_desc_t" : (32, {"stype" : 0, "pNext" : 8, "type" : 16, "address" : 24}),
+    "zet_debug_regset_properties_t" : (48, {"stype" : 0, "pNext" : 8, "type" : 16, "version" : 20, "generalFlags" : 24, "deviceFlags" : 28, "count" : 32, "bitSize" : 36, "byteSize" : 40}),
+    "zet_metric_group_properties_t" : (544, {"stype" : 0, "pNext" : 8, "name" : 16, "description" : 272, "samplingType" : 528, "domain" : 532, "metricCount" : 536}),
+    "zet_metric_properties_t" : (1056, {"stype" : 0, "pNext" : 8, "name" : 16, "description" : 272, "component" : 528, "tierNumber" : 784, "metricType" : 788, "resultType" : 792, "resultUnits" : 796}),
+    "zet_metric_streamer_desc_t" : (24, {"stype" : 0, "pNext" : 8, "notifyEveryNReports" : 16, "samplingPeriod" : 20}),
+    "zet_metric_query_pool_desc_t" : (24, {"stype" : 0, "pNext" : 8, "type" : 16, "count" : 20}),
+    "zet_profile_properties_t" : (24, {"stype" : 0, "pNext" : 8, "flags" : 16, "numTokens" : 20}),
+    "zet_profile_free_register_token_t" : (12, {"type" : 0, "size" : 4, "count" : 8}),
+    "zet_profile_register_sequence_t" : (8, {"start" : 0, "count" : 4}),
+    "zet_tracer_exp_desc_t" : (24, {"stype" : 0, "pNext" : 8, "pUserData" : 16}),
+    "_zet_metric_programmable_exp_dditable_t" : (32, {"pfnGetExp" : 0, "pfnGetPropertiesExp" : 8, "pfnGetParamInfoExp" : 16, "pfnGetParamValueInfoExp" : 24}),
+    "_zet_metric_tracer_exp_dditable_t" : (48, {"pfnCreateExp" : 0, "pfnDestroyExp" : 8, "pfnEnableExp" : 16, "pfnDisableExp" : 24, "pfnReadDataExp" : 32, "pfnDecodeExp" : 40}),
+    "_zet_metric_decoder_exp_dditable_t" : (24, {"pfnCreateExp" : 0, "pfnDestroyExp" : 8, "pfnGetDecodableMetricsExp" : 16}),
+    "_zet_device_dditable_t" : (8, {"pfnGetDebugProperties" : 0}),
+    "_zet_device_exp_dditable_t" : (32, {"pfnGetConcurrentMetricGroupsExp" : 0, "pfnCreateMetricGroupsFromMetricsExp" : 8, "pfnEnableMetricsExp" : 16, "pfnDisableMetricsExp" : 24}),
+    "_zet_context_dditable_t" : (8, {"pfnActivateMetricGroups" : 0}),
+    "_zet_command_list_dditable_t" : (32, {"pfnAppendMetricStreamerMarker" : 0, "pfnAppendMetricQueryBegin" : 8, "pfnAppendMetricQueryEnd" : 16, "pfnAppendMetricMemoryBarrier" : 24}),
+    "_zet_command_list_exp_dditable_t" : (8, {"pfnAppendMarkerExp" : 0}),
+    "_zet_module_dditable_t" : (8, {"pfnGetDebugInfo" : 0}),
+    "_zet_kernel_dditable_t" : (8, {"pfnGetProfileInfo" : 0}),
+    "_zet_metric_dditable_t" : (16, {"pfnGet" : 0, "pfnGetProperties" : 8}),
+    "_zet_metric_exp_dditable_t" : (24, {"pfnCreateFromProgrammableExp" : 0, "pfnDestroyExp" : 8, "pfnCreateFromProgrammableExp2" : 16}),
+    "_zet_metric_group_dditable_t" : (24, {"pfnGet" : 0, "pfnGetProperties" : 8, "pfnCalculateMetricValues" : 16}),
+    "_zet_metric_group_exp_dditable_t" : (72, {"pfnCalculateMultipleMetricValuesExp" : 0, "pfnGetGlobalTimestampsExp" : 8, "pfnGetExportDataExp" : 16, "pfnCalculateMetricExportDataExp" : 24, "pfnCreateExp" : 32, "pfnAddMetricExp" : 40, "pfnRemoveMetricExp" : 48, "pfnCloseExp" : 56, "pfnDestroyExp" : 64}),
+    "_zet_metric_streamer_dditable_t" : (24, {"pfnOpen" : 0, "pfnClose" : 8, "pfnReadData" : 16}),
+    "_zet_metric_query_pool_dditable_t" : (16, {"pfnCreate" : 0, "pfnDestroy" : 8}),
+    "_zet_metric_query_dditable_t" : (32, {"pfnCreate" : 0, "pfnDestroy" : 8, "pfnReset" : 16, "pfnGetData" : 24}),
+    "_zet_tracer_exp_dditable_t" : (40, {"pfnCreate" : 0, "pfnDestroy" : 8, "pfnSetPrologues" : 16, "pfnSetEpilogues" : 24, "pfnSetEnabled" : 32}),
+    "_zet_debug_dditable_t" : (96, {"pfnAttach" : 0, "pfnDetach" : 8, "pfnReadEvent" : 16, "pfnAcknowledgeEvent" : 24, "pfnInterrupt" : 32, "pfnResume" : 40, "pfnReadMemory" : 48, "pfnWriteMemory" : 56, "pfnGetRegisterSetProperties" : 64, "pfnReadRegisters" : 72, "pfnWriteRegisters" : 80, "pfnGetThreadRegisterSetProperties" : 88}),
+    "_zet_dditable_t" : (552, {"MetricProgrammableExp" : 0, "MetricTracerExp" : 32, "MetricDecoderExp" : 80, "Device" : 104, "DeviceExp" : 112, "Context" : 144, "CommandList" : 152, "CommandListExp" : 184, "Module" : 192, "Kernel" : 200, "Metric" : 208, "MetricExp" : 224, "MetricGroup" : 248, "MetricGroupExp" : 272, "MetricStreamer" : 344, "MetricQueryPool" : 368, "MetricQuery" : 384, "TracerExp" : 416, "Debug" : 456}),
+    "zet_metric_tracer_exp_desc_t" : (24, {"stype" : 0, "pNext" : 8, "notifyEveryNBytes" : 16}),
+    "zet_metric_entry_exp_t" : (32, {"value" : 0, "timeStamp" : 8, "metricIndex" : 16, "onSubdevice" : 20, "subdeviceId" : 24}),
+    "zet_metric_group_type_exp_t" : (24, {"stype" : 0, "pNext" : 8, "type" : 16}),
+    "zet_export_dma_buf_exp_properties_t" : (32, {"stype" : 0, "pNext" : 8, "fd" : 16, "size" : 24}),
+    "zet_metric_source_id_exp_t" : (24, {"stype" : 0, "pNext" : 8, "sourceId" : 16}),
+    "zet_metric_global_timestamps_resolution_exp_t" : (32, {"stype" : 0, "pNext" : 8, "timerResolution" : 16, "timestampValidBits" : 24}),
+    "zet_metric_calculate_exp_desc_t" : (24, {"stype" : 0, "pNext" : 8, "rawReportSkipCount" : 16}),
+    "zet_metric_programmable_exp_properties_t" : (424, {"stype" : 0, "pNext" : 8, "name" : 16, "description" : 144, "component" : 272, "tierNumber" : 400, "domain" : 404, "parameterCount" : 408, "samplingType" : 412, "sourceId" : 416}),
+    "zet_value_uint64_range_exp_t" : (16, {"ui64Min" : 0, "ui64Max" : 8}),
+    "zet_value_fp64_range_exp_t" : (16, {"fp64Min" : 0, "fp64Max" : 8}),
+    "zet_value_info_exp_t" : (16, {"ui32" : 0, "ui64" : 0, "fp32" : 0, "fp64" : 0, "b8" : 0, "ui8" : 0, "ui16" : 0, "ui64Range" : 0, "fp64Range" : 0}),
+    "zet_metric_programmable_param_info_exp_t" : (168, {"stype" : 0, "pNext" : 8, "type" : 16, "name" : 20, "valueInfoType" : 148, "defaultValue" : 152, "valueInfoCount" : 160}),
+    "zet_metric_programmable_param_value_info_exp_t" : (160, {"stype" : 0, "pNext" : 8, "valueInfo" : 16, "description" : 32}),
+    "zet_metric_programmable_param_value_exp_t" : (8, {"value" : 0}),
+}
+
+###############################################################################
+## @brief Returns a list of mismatches between the ctypes structures of the
+##        given binding modules and the C layout table
+def check(*modules):
+    errors = []
+    if sizeof(c_void_p) != 8:
+        return errors
+    for module in modules:
+        for name, (size, offsets) in layouts.items():
+            # deferred experimental structures are defined on access
+            value = getattr(module, name, None)
+            if not isinstance(value, type) or not issubclass(value, (Structure, Union)):
+                continue
+            if sizeof(value) != size:
+                errors.append("%s: sizeof %d, expected %d" % (name, sizeof(value), size))
+            for field, offset in offsets.items():
+                actual = getattr(value, field).offset
+                if actual != offset:
+                    errors.append("%s.%s: offset %d, expected %d" % (name, field, actual, offset))
+    return errors
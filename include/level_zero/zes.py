@@ -7,10 +7,16 @@
  @version v1.13-r1.13.1
 
  """
-import platform
+import sys
 from ctypes import *
 from enum import *
 
+from ._common import (
+    UnsupportedFunctionError, ZE_BIT, ZE_FASTCALL, ZE_MAKE_VERSION,
+    ze_api_version_t, ze_bool_t, ze_device_properties_t, ze_driver_handle_t,
+    ze_result_t, ze_result_v
+    )
+
 ###############################################################################
 __version__ = "1.0"
 
@@ -240,7 +246,7 @@ ZES_MAX_EXTENSION_NAME = 256
 class zes_driver_extension_properties_t(Structure):
     _fields_ = [
         ("name", c_char * ZES_MAX_EXTENSION_NAME),                      ## [out] extension name
-        ("version", c_ulong)                                            ## [out] extension version using ::ZE_MAKE_VERSION
+        ("version", c_uint32)                                           ## [out] extension version using ::ZE_MAKE_VERSION
     ]
 
 ###############################################################################
@@ -369,7 +375,7 @@ class zes_device_properties_t(Structure):
                                                                         ## structure (i.e. contains stype and pNext).
         ("core", ze_device_properties_t),                               ## [out] (Deprecated, use ::zes_uuid_t in the extended structure) Core
                                                                         ## device properties
-        ("numSubdevices", c_ulong),                                     ## [out] Number of sub-devices. A value of 0 indicates that this device
+        ("numSubdevices", c_uint32),                                    ## [out] Number of sub-devices. A value of 0 indicates that this device
                                                                         ## doesn't have sub-devices.
         ("serialNumber", c_char * ZES_STRING_PROPERTY_SIZE),            ## [out] Manufacturing serial number (NULL terminated string value). This
                                                                         ## value is intended to reflect the Part ID/SoC ID assigned by
@@ -418,10 +424,10 @@ class zes_process_state_t(Structure):
         ("stype", zes_structure_type_t),                                ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("processId", c_ulong),                                         ## [out] Host OS process ID.
-        ("memSize", c_ulonglong),                                       ## [out] Device memory size in bytes allocated by this process (may not
+        ("processId", c_uint32),                                        ## [out] Host OS process ID.
+        ("memSize", c_uint64),                                          ## [out] Device memory size in bytes allocated by this process (may not
                                                                         ## necessarily be resident on the device at the time of reading).
-        ("sharedSize", c_ulonglong),                                    ## [out] The size of shared device memory mapped into this process (may
+        ("sharedSize", c_uint64),                                       ## [out] The size of shared device memory mapped into this process (may
                                                                         ## not necessarily be resident on the device at the time of reading).
         ("engines", zes_engine_type_flags_t)                            ## [out] Bitfield of accelerator engine types being used by this process.
     ]
@@ -430,21 +436,21 @@ class zes_process_state_t(Structure):
 ## @brief PCI address
 class zes_pci_address_t(Structure):
     _fields_ = [
-        ("domain", c_ulong),                                            ## [out] BDF domain
-        ("bus", c_ulong),                                               ## [out] BDF bus
-        ("device", c_ulong),                                            ## [out] BDF device
-        ("function", c_ulong)                                           ## [out] BDF function
+        ("domain", c_uint32),                                           ## [out] BDF domain
+        ("bus", c_uint32),                                              ## [out] BDF bus
+        ("device", c_uint32),                                           ## [out] BDF device
+        ("function", c_uint32)                                          ## [out] BDF function
     ]
 
 ###############################################################################
 ## @brief PCI speed
 class zes_pci_speed_t(Structure):
     _fields_ = [
-        ("gen", c_int32_t),                                             ## [out] The link generation. A value of -1 means that this property is
+        ("gen", c_int32),                                               ## [out] The link generation. A value of -1 means that this property is
                                                                         ## unknown.
-        ("width", c_int32_t),                                           ## [out] The number of lanes. A value of -1 means that this property is
+        ("width", c_int32),                                             ## [out] The number of lanes. A value of -1 means that this property is
                                                                         ## unknown.
-        ("maxBandwidth", c_int64_t)                                     ## [out] The maximum bandwidth in bytes/sec (sum of all lanes). A value
+        ("maxBandwidth", c_int64)                                       ## [out] The maximum bandwidth in bytes/sec (sum of all lanes). A value
                                                                         ## of -1 means that this property is unknown.
     ]
 
@@ -542,9 +548,9 @@ class zes_pci_bar_properties_t(Structure):
         ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
         ("type", zes_pci_bar_type_t),                                   ## [out] The type of bar
-        ("index", c_ulong),                                             ## [out] The index of the bar
-        ("base", c_ulonglong),                                          ## [out] Base address of the bar.
-        ("size", c_ulonglong)                                           ## [out] Size of the bar.
+        ("index", c_uint32),                                            ## [out] The index of the bar
+        ("base", c_uint64),                                             ## [out] Base address of the bar.
+        ("size", c_uint64)                                              ## [out] Size of the bar.
     ]
 
 ###############################################################################
@@ -555,9 +561,9 @@ class zes_pci_bar_properties_1_2_t(Structure):
         ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
         ("type", zes_pci_bar_type_t),                                   ## [out] The type of bar
-        ("index", c_ulong),                                             ## [out] The index of the bar
-        ("base", c_ulonglong),                                          ## [out] Base address of the bar.
-        ("size", c_ulonglong),                                          ## [out] Size of the bar.
+        ("index", c_uint32),                                            ## [out] The index of the bar
+        ("base", c_uint64),                                             ## [out] Base address of the bar.
+        ("size", c_uint64),                                             ## [out] Size of the bar.
         ("resizableBarSupported", ze_bool_t),                           ## [out] Support for Resizable Bar on this device.
         ("resizableBarEnabled", ze_bool_t)                              ## [out] Resizable Bar enabled on this device
     ]
@@ -575,7 +581,7 @@ class zes_pci_bar_properties_1_2_t(Structure):
 ##       s1.timestamp))
 class zes_pci_stats_t(Structure):
     _fields_ = [
-        ("timestamp", c_ulonglong),                                     ## [out] Monotonic timestamp counter in microseconds when the measurement
+        ("timestamp", c_uint64),                                        ## [out] Monotonic timestamp counter in microseconds when the measurement
                                                                         ## was made.
                                                                         ## This timestamp should only be used to calculate delta time between
                                                                         ## snapshots of this structure.
@@ -583,16 +589,16 @@ class zes_pci_stats_t(Structure):
                                                                         ## different structure since they are not guaranteed to have the same base.
                                                                         ## The absolute value of the timestamp is only valid during within the
                                                                         ## application and may be different on the next execution.
-        ("replayCounter", c_ulonglong),                                 ## [out] Monotonic counter for the number of replay packets (sum of all
+        ("replayCounter", c_uint64),                                    ## [out] Monotonic counter for the number of replay packets (sum of all
                                                                         ## lanes). Will always be 0 when the `haveReplayCounters` member of
                                                                         ## ::zes_pci_properties_t is FALSE.
-        ("packetCounter", c_ulonglong),                                 ## [out] Monotonic counter for the number of packets (sum of all lanes).
+        ("packetCounter", c_uint64),                                    ## [out] Monotonic counter for the number of packets (sum of all lanes).
                                                                         ## Will always be 0 when the `havePacketCounters` member of
                                                                         ## ::zes_pci_properties_t is FALSE.
-        ("rxCounter", c_ulonglong),                                     ## [out] Monotonic counter for the number of bytes received (sum of all
+        ("rxCounter", c_uint64),                                        ## [out] Monotonic counter for the number of bytes received (sum of all
                                                                         ## lanes). Will always be 0 when the `haveBandwidthCounters` member of
                                                                         ## ::zes_pci_properties_t is FALSE.
-        ("txCounter", c_ulonglong),                                     ## [out] Monotonic counter for the number of bytes transmitted (including
+        ("txCounter", c_uint64),                                        ## [out] Monotonic counter for the number of bytes transmitted (including
                                                                         ## replays) (sum of all lanes). Will always be 0 when the
                                                                         ## `haveBandwidthCounters` member of ::zes_pci_properties_t is FALSE.
         ("speed", zes_pci_speed_t)                                      ## [out] The current speed of the link (sum of all lanes)
@@ -735,11 +741,11 @@ class zes_overclock_properties_t(Structure):
                                                                         ## structure (i.e. contains stype and pNext).
         ("domainType", zes_overclock_domain_t),                         ## [out] The hardware block that this overclock domain controls (GPU,
                                                                         ## VRAM, ...)
-        ("AvailableControls", c_ulong),                                 ## [out] Returns the overclock controls that are supported (a bit for
+        ("AvailableControls", c_uint32),                                ## [out] Returns the overclock controls that are supported (a bit for
                                                                         ## each of enum ::zes_overclock_control_t). If no bits are set, the
                                                                         ## domain doesn't support overclocking.
         ("VFProgramType", zes_vf_program_type_t),                       ## [out] Type of V-F curve programming that is permitted:.
-        ("NumberOfVFPoints", c_ulong)                                   ## [out] Number of VF points that can be programmed - max_num_points
+        ("NumberOfVFPoints", c_uint32)                                  ## [out] Number of VF points that can be programmed - max_num_points
     ]
 
 ###############################################################################
@@ -810,7 +816,7 @@ ZES_DIAG_LAST_TEST_INDEX = 0xFFFFFFFF
 ## @brief Diagnostic test
 class zes_diag_test_t(Structure):
     _fields_ = [
-        ("index", c_ulong),                                             ## [out] Index of the test
+        ("index", c_uint32),                                            ## [out] Index of the test
         ("name", c_char * ZES_STRING_PROPERTY_SIZE)                     ## [out] Name of the test
     ]
 
@@ -823,7 +829,7 @@ class zes_diag_properties_t(Structure):
                                                                         ## structure (i.e. contains stype and pNext).
         ("onSubdevice", ze_bool_t),                                     ## [out] True if the resource is located on a sub-device; false means
                                                                         ## that the resource is on the device of the calling Sysman handle
-        ("subdeviceId", c_ulong),                                       ## [out] If onSubdevice is true, this gives the ID of the sub-device
+        ("subdeviceId", c_uint32),                                      ## [out] If onSubdevice is true, this gives the ID of the sub-device
         ("name", c_char * ZES_STRING_PROPERTY_SIZE),                    ## [out] Name of the diagnostics test suite
         ("haveTests", ze_bool_t)                                        ## [out] Indicates if this test suite has individual tests which can be
                                                                         ## run separately (use the function ::zesDiagnosticsGetTests() to get the
@@ -934,7 +940,7 @@ class zes_engine_properties_t(Structure):
         ("type", zes_engine_group_t),                                   ## [out] The engine group
         ("onSubdevice", ze_bool_t),                                     ## [out] True if this resource is located on a sub-device; false means
                                                                         ## that the resource is on the device of the calling Sysman handle
-        ("subdeviceId", c_ulong)                                        ## [out] If onSubdevice is true, this gives the ID of the sub-device
+        ("subdeviceId", c_uint32)                                       ## [out] If onSubdevice is true, this gives the ID of the sub-device
     ]
 
 ###############################################################################
@@ -959,9 +965,9 @@ class zes_engine_properties_t(Structure):
 ##       application and may be different on the next execution.
 class zes_engine_stats_t(Structure):
     _fields_ = [
-        ("activeTime", c_ulonglong),                                    ## [out] Monotonic counter where the resource is actively running
+        ("activeTime", c_uint64),                                       ## [out] Monotonic counter where the resource is actively running
                                                                         ## workloads.
-        ("timestamp", c_ulonglong)                                      ## [out] Monotonic counter when activeTime counter was sampled.
+        ("timestamp", c_uint64)                                         ## [out] Monotonic counter when activeTime counter was sampled.
     ]
 
 ###############################################################################
@@ -1070,8 +1076,8 @@ class zes_fabric_port_failure_flags_t(c_int):
 ##       ::zes_fabric_port_properties_t.
 class zes_fabric_port_id_t(Structure):
     _fields_ = [
-        ("fabricId", c_ulong),                                          ## [out] Unique identifier for the fabric end-point
-        ("attachId", c_ulong),                                          ## [out] Unique identifier for the device attachment point
+        ("fabricId", c_uint32),                                         ## [out] Unique identifier for the fabric end-point
+        ("attachId", c_uint32),                                         ## [out] Unique identifier for the device attachment point
         ("portNumber", c_ubyte)                                         ## [out] The logical port number (this is typically marked somewhere on
                                                                         ## the physical device)
     ]
@@ -1080,9 +1086,9 @@ class zes_fabric_port_id_t(Structure):
 ## @brief Fabric port speed in one direction
 class zes_fabric_port_speed_t(Structure):
     _fields_ = [
-        ("bitRate", c_int64_t),                                         ## [out] Bits/sec that the link is operating at. A value of -1 means that
+        ("bitRate", c_int64),                                           ## [out] Bits/sec that the link is operating at. A value of -1 means that
                                                                         ## this property is unknown.
-        ("width", c_int32_t)                                            ## [out] The number of lanes. A value of -1 means that this property is
+        ("width", c_int32)                                              ## [out] The number of lanes. A value of -1 means that this property is
                                                                         ## unknown.
     ]
 
@@ -1097,7 +1103,7 @@ class zes_fabric_port_properties_t(Structure):
                                                                         ## "unkown" if this cannot be determined for this port.
         ("onSubdevice", ze_bool_t),                                     ## [out] True if the port is located on a sub-device; false means that
                                                                         ## the port is on the device of the calling Sysman handle
-        ("subdeviceId", c_ulong),                                       ## [out] If onSubdevice is true, this gives the ID of the sub-device
+        ("subdeviceId", c_uint32),                                      ## [out] If onSubdevice is true, this gives the ID of the sub-device
         ("portId", zes_fabric_port_id_t),                               ## [out] The unique port identifier
         ("maxRxSpeed", zes_fabric_port_speed_t),                        ## [out] Maximum speed supported by the receive side of the port (sum of
                                                                         ## all lanes)
@@ -1153,7 +1159,7 @@ class zes_fabric_port_state_t(Structure):
 ## @brief Fabric port throughput.
 class zes_fabric_port_throughput_t(Structure):
     _fields_ = [
-        ("timestamp", c_ulonglong),                                     ## [out] Monotonic timestamp counter in microseconds when the measurement
+        ("timestamp", c_uint64),                                        ## [out] Monotonic timestamp counter in microseconds when the measurement
                                                                         ## was made.
                                                                         ## This timestamp should only be used to calculate delta time between
                                                                         ## snapshots of this structure.
@@ -1161,9 +1167,9 @@ class zes_fabric_port_throughput_t(Structure):
                                                                         ## different structure since they are not guaranteed to have the same base.
                                                                         ## The absolute value of the timestamp is only valid during within the
                                                                         ## application and may be different on the next execution.
-        ("rxCounter", c_ulonglong),                                     ## [out] Monotonic counter for the number of bytes received (sum of all
+        ("rxCounter", c_uint64),                                        ## [out] Monotonic counter for the number of bytes received (sum of all
                                                                         ## lanes). This includes all protocol overhead, not only the GPU traffic.
-        ("txCounter", c_ulonglong)                                      ## [out] Monotonic counter for the number of bytes transmitted (sum of
+        ("txCounter", c_uint64)                                         ## [out] Monotonic counter for the number of bytes transmitted (sum of
                                                                         ## all lanes). This includes all protocol overhead, not only the GPU
                                                                         ## traffic.
     ]
@@ -1175,10 +1181,10 @@ class zes_fabric_port_error_counters_t(Structure):
         ("stype", zes_structure_type_t),                                ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("linkFailureCount", c_ulonglong),                              ## [out] Link Failure Error Count reported per port
-        ("fwCommErrorCount", c_ulonglong),                              ## [out] Firmware Communication Error Count reported per device
-        ("fwErrorCount", c_ulonglong),                                  ## [out] Firmware reported Error Count reported per device
-        ("linkDegradeCount", c_ulonglong)                               ## [out] Link Degrade Error Count reported per port
+        ("linkFailureCount", c_uint64),                                 ## [out] Link Failure Error Count reported per port
+        ("fwCommErrorCount", c_uint64),                                 ## [out] Firmware Communication Error Count reported per device
+        ("fwErrorCount", c_uint64),                                     ## [out] Firmware reported Error Count reported per device
+        ("linkDegradeCount", c_uint64)                                  ## [out] Link Degrade Error Count reported per port
     ]
 
 ###############################################################################
@@ -1209,7 +1215,7 @@ class zes_fan_speed_units_t(c_int):
 ## @brief Fan speed
 class zes_fan_speed_t(Structure):
     _fields_ = [
-        ("speed", c_int32_t),                                           ## [in,out] The speed of the fan. On output, a value of -1 indicates that
+        ("speed", c_int32),                                             ## [in,out] The speed of the fan. On output, a value of -1 indicates that
                                                                         ## there is no fixed fan speed setting.
         ("units", zes_fan_speed_units_t)                                ## [in,out] The units that the fan speed is expressed in. On output, if
                                                                         ## fan speed is -1 then units should be ignored.
@@ -1219,7 +1225,7 @@ class zes_fan_speed_t(Structure):
 ## @brief Fan temperature/speed pair
 class zes_fan_temp_speed_t(Structure):
     _fields_ = [
-        ("temperature", c_ulong),                                       ## [in,out] Temperature in degrees Celsius.
+        ("temperature", c_uint32),                                      ## [in,out] Temperature in degrees Celsius.
         ("speed", zes_fan_speed_t)                                      ## [in,out] The speed of the fan
     ]
 
@@ -1231,7 +1237,7 @@ ZES_FAN_TEMP_SPEED_PAIR_COUNT = 32
 ## @brief Fan speed table
 class zes_fan_speed_table_t(Structure):
     _fields_ = [
-        ("numPoints", c_int32_t),                                       ## [in,out] The number of valid points in the fan speed table. 0 means
+        ("numPoints", c_int32),                                         ## [in,out] The number of valid points in the fan speed table. 0 means
                                                                         ## that there is no fan speed table configured. -1 means that a fan speed
                                                                         ## table is not supported by the hardware.
         ("table", zes_fan_temp_speed_t * ZES_FAN_TEMP_SPEED_PAIR_COUNT) ## [in,out] Array of temperature/fan speed pairs. The table is ordered
@@ -1247,16 +1253,16 @@ class zes_fan_properties_t(Structure):
                                                                         ## structure (i.e. contains stype and pNext).
         ("onSubdevice", ze_bool_t),                                     ## [out] True if the resource is located on a sub-device; false means
                                                                         ## that the resource is on the device of the calling Sysman handle
-        ("subdeviceId", c_ulong),                                       ## [out] If onSubdevice is true, this gives the ID of the sub-device
+        ("subdeviceId", c_uint32),                                      ## [out] If onSubdevice is true, this gives the ID of the sub-device
         ("canControl", ze_bool_t),                                      ## [out] Indicates if software can control the fan speed assuming the
                                                                         ## user has permissions
-        ("supportedModes", c_ulong),                                    ## [out] Bitfield of supported fan configuration modes
+        ("supportedModes", c_uint32),                                   ## [out] Bitfield of supported fan configuration modes
                                                                         ## (1<<::zes_fan_speed_mode_t)
-        ("supportedUnits", c_ulong),                                    ## [out] Bitfield of supported fan speed units
+        ("supportedUnits", c_uint32),                                   ## [out] Bitfield of supported fan speed units
                                                                         ## (1<<::zes_fan_speed_units_t)
-        ("maxRPM", c_int32_t),                                          ## [out] The maximum RPM of the fan. A value of -1 means that this
+        ("maxRPM", c_int32),                                            ## [out] The maximum RPM of the fan. A value of -1 means that this
                                                                         ## property is unknown. 
-        ("maxPoints", c_int32_t)                                        ## [out] The maximum number of points in the fan temp/speed table. A
+        ("maxPoints", c_int32)                                          ## [out] The maximum number of points in the fan temp/speed table. A
                                                                         ## value of -1 means that this fan doesn't support providing a temp/speed
                                                                         ## table.
     ]
@@ -1282,7 +1288,7 @@ class zes_firmware_properties_t(Structure):
                                                                         ## structure (i.e. contains stype and pNext).
         ("onSubdevice", ze_bool_t),                                     ## [out] True if the resource is located on a sub-device; false means
                                                                         ## that the resource is on the device of the calling Sysman handle
-        ("subdeviceId", c_ulong),                                       ## [out] If onSubdevice is true, this gives the ID of the sub-device
+        ("subdeviceId", c_uint32),                                      ## [out] If onSubdevice is true, this gives the ID of the sub-device
         ("canControl", ze_bool_t),                                      ## [out] Indicates if software can flash the firmware assuming the user
                                                                         ## has permissions
         ("name", c_char * ZES_STRING_PROPERTY_SIZE),                    ## [out] NULL terminated string value. The string "unknown" will be
@@ -1322,7 +1328,7 @@ class zes_freq_properties_t(Structure):
                                                                         ## memory, ...)
         ("onSubdevice", ze_bool_t),                                     ## [out] True if this resource is located on a sub-device; false means
                                                                         ## that the resource is on the device of the calling Sysman handle
-        ("subdeviceId", c_ulong),                                       ## [out] If onSubdevice is true, this gives the ID of the sub-device
+        ("subdeviceId", c_uint32),                                      ## [out] If onSubdevice is true, this gives the ID of the sub-device
         ("canControl", ze_bool_t),                                      ## [out] Indicates if software can control the frequency of this domain
                                                                         ## assuming the user has permissions
         ("isThrottleEventSupported", ze_bool_t),                        ## [out] Indicates if software can register to receive event
@@ -1407,9 +1413,9 @@ class zes_freq_state_t(Structure):
 ##       s1.throttleTime) / (s2.timestamp - s1.timestamp)
 class zes_freq_throttle_time_t(Structure):
     _fields_ = [
-        ("throttleTime", c_ulonglong),                                  ## [out] The monotonic counter of time in microseconds that the frequency
+        ("throttleTime", c_uint64),                                     ## [out] The monotonic counter of time in microseconds that the frequency
                                                                         ## has been limited by the hardware.
-        ("timestamp", c_ulonglong)                                      ## [out] Microsecond timestamp when throttleTime was captured.
+        ("timestamp", c_uint64)                                         ## [out] Microsecond timestamp when throttleTime was captured.
                                                                         ## This timestamp should only be used to calculate delta time between
                                                                         ## snapshots of this structure.
                                                                         ## Never take the delta of this timestamp with the timestamp from a
@@ -1493,7 +1499,7 @@ class zes_led_properties_t(Structure):
                                                                         ## structure (i.e. contains stype and pNext).
         ("onSubdevice", ze_bool_t),                                     ## [out] True if the resource is located on a sub-device; false means
                                                                         ## that the resource is on the device of the calling Sysman handle
-        ("subdeviceId", c_ulong),                                       ## [out] If onSubdevice is true, this gives the ID of the sub-device
+        ("subdeviceId", c_uint32),                                      ## [out] If onSubdevice is true, this gives the ID of the sub-device
         ("canControl", ze_bool_t),                                      ## [out] Indicates if software can control the LED assuming the user has
                                                                         ## permissions
         ("haveRGB", ze_bool_t)                                          ## [out] Indicates if the LED is RGB capable
@@ -1588,14 +1594,14 @@ class zes_mem_properties_t(Structure):
         ("type", zes_mem_type_t),                                       ## [out] The memory type
         ("onSubdevice", ze_bool_t),                                     ## [out] True if this resource is located on a sub-device; false means
                                                                         ## that the resource is on the device of the calling Sysman handle
-        ("subdeviceId", c_ulong),                                       ## [out] If onSubdevice is true, this gives the ID of the sub-device
+        ("subdeviceId", c_uint32),                                      ## [out] If onSubdevice is true, this gives the ID of the sub-device
         ("location", zes_mem_loc_t),                                    ## [out] Location of this memory (system, device)
-        ("physicalSize", c_ulonglong),                                  ## [out] Physical memory size in bytes. A value of 0 indicates that this
+        ("physicalSize", c_uint64),                                     ## [out] Physical memory size in bytes. A value of 0 indicates that this
                                                                         ## property is not known. However, a call to ::zesMemoryGetState() will
                                                                         ## correctly return the total size of usable memory.
-        ("busWidth", c_int32_t),                                        ## [out] Width of the memory bus. A value of -1 means that this property
+        ("busWidth", c_int32),                                          ## [out] Width of the memory bus. A value of -1 means that this property
                                                                         ## is unknown.
-        ("numChannels", c_int32_t)                                      ## [out] The number of memory channels. A value of -1 means that this
+        ("numChannels", c_int32)                                        ## [out] The number of memory channels. A value of -1 means that this
                                                                         ## property is unknown.
     ]
 
@@ -1611,8 +1617,8 @@ class zes_mem_state_t(Structure):
         ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
         ("health", zes_mem_health_t),                                   ## [out] Indicates the health of the memory
-        ("free", c_ulonglong),                                          ## [out] The free memory in bytes
-        ("size", c_ulonglong)                                           ## [out] The total allocatable memory in bytes (can be less than the
+        ("free", c_uint64),                                             ## [out] The free memory in bytes
+        ("size", c_uint64)                                              ## [out] The total allocatable memory in bytes (can be less than the
                                                                         ## `physicalSize` member of ::zes_mem_properties_t)
     ]
 
@@ -1632,10 +1638,10 @@ class zes_mem_state_t(Structure):
 ##       multiplied by 32 to get delta between samples in actual byte count
 class zes_mem_bandwidth_t(Structure):
     _fields_ = [
-        ("readCounter", c_ulonglong),                                   ## [out] Total bytes read from memory
-        ("writeCounter", c_ulonglong),                                  ## [out] Total bytes written to memory
-        ("maxBandwidth", c_ulonglong),                                  ## [out] Current maximum bandwidth in units of bytes/sec
-        ("timestamp", c_ulonglong)                                      ## [out] The timestamp in microseconds when these measurements were sampled.
+        ("readCounter", c_uint64),                                      ## [out] Total bytes read from memory
+        ("writeCounter", c_uint64),                                     ## [out] Total bytes written to memory
+        ("maxBandwidth", c_uint64),                                     ## [out] Current maximum bandwidth in units of bytes/sec
+        ("timestamp", c_uint64)                                         ## [out] The timestamp in microseconds when these measurements were sampled.
                                                                         ## This timestamp should only be used to calculate delta time between
                                                                         ## snapshots of this structure.
                                                                         ## Never take the delta of this timestamp with the timestamp from a
@@ -1652,7 +1658,7 @@ class zes_mem_bandwidth_t(Structure):
 ##     - [DEPRECATED] No longer supported.
 class zes_mem_ext_bandwidth_t(Structure):
     _fields_ = [
-        ("memoryTimestampValidBits", c_ulong)                           ## [out] Returns the number of valid bits in the timestamp values
+        ("memoryTimestampValidBits", c_uint32)                          ## [out] Returns the number of valid bits in the timestamp values
     ]
 
 ###############################################################################
@@ -1664,7 +1670,7 @@ class zes_perf_properties_t(Structure):
                                                                         ## structure (i.e. contains stype and pNext).
         ("onSubdevice", ze_bool_t),                                     ## [out] True if this Performance Factor affects accelerators located on
                                                                         ## a sub-device
-        ("subdeviceId", c_ulong),                                       ## [out] If onSubdevice is true, this gives the ID of the sub-device
+        ("subdeviceId", c_uint32),                                      ## [out] If onSubdevice is true, this gives the ID of the sub-device
         ("engines", zes_engine_type_flags_t)                            ## [out] Bitfield of accelerator engine types that are affected by this
                                                                         ## Performance Factor.
     ]
@@ -1739,16 +1745,16 @@ class zes_power_properties_t(Structure):
                                                                         ## structure (i.e. contains stype and pNext).
         ("onSubdevice", ze_bool_t),                                     ## [out] True if this resource is located on a sub-device; false means
                                                                         ## that the resource is on the device of the calling Sysman handle
-        ("subdeviceId", c_ulong),                                       ## [out] If onSubdevice is true, this gives the ID of the sub-device
+        ("subdeviceId", c_uint32),                                      ## [out] If onSubdevice is true, this gives the ID of the sub-device
         ("canControl", ze_bool_t),                                      ## [out] Software can change the power limits of this domain assuming the
                                                                         ## user has permissions.
         ("isEnergyThresholdSupported", ze_bool_t),                      ## [out] Indicates if this power domain supports the energy threshold
                                                                         ## event (::ZES_EVENT_TYPE_FLAG_ENERGY_THRESHOLD_CROSSED).
-        ("defaultLimit", c_int32_t),                                    ## [out] (Deprecated) The factory default TDP power limit of the part in
+        ("defaultLimit", c_int32),                                      ## [out] (Deprecated) The factory default TDP power limit of the part in
                                                                         ## milliwatts. A value of -1 means that this is not known.
-        ("minLimit", c_int32_t),                                        ## [out] (Deprecated) The minimum power limit in milliwatts that can be
+        ("minLimit", c_int32),                                          ## [out] (Deprecated) The minimum power limit in milliwatts that can be
                                                                         ## requested. A value of -1 means that this is not known.
-        ("maxLimit", c_int32_t)                                         ## [out] (Deprecated) The maximum power limit in milliwatts that can be
+        ("maxLimit", c_int32)                                           ## [out] (Deprecated) The maximum power limit in milliwatts that can be
                                                                         ## requested. A value of -1 means that this is not known.
     ]
 
@@ -1761,8 +1767,8 @@ class zes_power_properties_t(Structure):
 ##       s1.timestamp)
 class zes_power_energy_counter_t(Structure):
     _fields_ = [
-        ("energy", c_ulonglong),                                        ## [out] The monotonic energy counter in microjoules.
-        ("timestamp", c_ulonglong)                                      ## [out] Microsecond timestamp when energy was captured.
+        ("energy", c_uint64),                                           ## [out] The monotonic energy counter in microjoules.
+        ("timestamp", c_uint64)                                         ## [out] Microsecond timestamp when energy was captured.
                                                                         ## This timestamp should only be used to calculate delta time between
                                                                         ## snapshots of this structure.
                                                                         ## Never take the delta of this timestamp with the timestamp from a
@@ -1782,8 +1788,8 @@ class zes_power_energy_counter_t(Structure):
 class zes_power_sustained_limit_t(Structure):
     _fields_ = [
         ("enabled", ze_bool_t),                                         ## [in,out] indicates if the limit is enabled (true) or ignored (false)
-        ("power", c_int32_t),                                           ## [in,out] power limit in milliwatts
-        ("interval", c_int32_t)                                         ## [in,out] power averaging window (Tau) in milliseconds
+        ("power", c_int32),                                             ## [in,out] power limit in milliwatts
+        ("interval", c_int32)                                           ## [in,out] power averaging window (Tau) in milliseconds
     ]
 
 ###############################################################################
@@ -1799,7 +1805,7 @@ class zes_power_sustained_limit_t(Structure):
 class zes_power_burst_limit_t(Structure):
     _fields_ = [
         ("enabled", ze_bool_t),                                         ## [in,out] indicates if the limit is enabled (true) or ignored (false)
-        ("power", c_int32_t)                                            ## [in,out] power limit in milliwatts
+        ("power", c_int32)                                              ## [in,out] power limit in milliwatts
     ]
 
 ###############################################################################
@@ -1818,8 +1824,8 @@ class zes_power_burst_limit_t(Structure):
 ##     - [DEPRECATED] No longer supported.
 class zes_power_peak_limit_t(Structure):
     _fields_ = [
-        ("powerAC", c_int32_t),                                         ## [in,out] power limit in milliwatts for the AC power source.
-        ("powerDC", c_int32_t)                                          ## [in,out] power limit in milliwatts for the DC power source. On input,
+        ("powerAC", c_int32),                                           ## [in,out] power limit in milliwatts for the AC power source.
+        ("powerDC", c_int32)                                            ## [in,out] power limit in milliwatts for the DC power source. On input,
                                                                         ## this is ignored if the product does not have a battery. On output,
                                                                         ## this will be -1 if the product does not have a battery.
     ]
@@ -1834,7 +1840,7 @@ class zes_energy_threshold_t(Structure):
         ("enable", ze_bool_t),                                          ## [in,out] Indicates if the energy threshold is enabled.
         ("threshold", c_double),                                        ## [in,out] The energy threshold in Joules. Will be 0.0 if no threshold
                                                                         ## has been set.
-        ("processId", c_ulong)                                          ## [in,out] The host process ID that set the energy threshold. Will be
+        ("processId", c_uint32)                                         ## [in,out] The host process ID that set the energy threshold. Will be
                                                                         ## 0xFFFFFFFF if no threshold has been set.
     ]
 
@@ -1861,9 +1867,9 @@ class zes_psu_properties_t(Structure):
                                                                         ## structure (i.e. contains stype and pNext).
         ("onSubdevice", ze_bool_t),                                     ## [out] True if the resource is located on a sub-device; false means
                                                                         ## that the resource is on the device of the calling Sysman handle
-        ("subdeviceId", c_ulong),                                       ## [out] If onSubdevice is true, this gives the ID of the sub-device
+        ("subdeviceId", c_uint32),                                      ## [out] If onSubdevice is true, this gives the ID of the sub-device
         ("haveFan", ze_bool_t),                                         ## [out] True if the power supply has a fan
-        ("ampLimit", c_int32_t)                                         ## [out] The maximum electrical current in milliamperes that can be
+        ("ampLimit", c_int32)                                           ## [out] The maximum electrical current in milliamperes that can be
                                                                         ## drawn. A value of -1 indicates that this property cannot be
                                                                         ## determined.
     ]
@@ -1877,9 +1883,9 @@ class zes_psu_state_t(Structure):
                                                                         ## structure (i.e. contains stype and pNext).
         ("voltStatus", zes_psu_voltage_status_t),                       ## [out] The current PSU voltage status
         ("fanFailed", ze_bool_t),                                       ## [out] Indicates if the fan has failed
-        ("temperature", c_int32_t),                                     ## [out] Read the current heatsink temperature in degrees Celsius. A
+        ("temperature", c_int32),                                       ## [out] Read the current heatsink temperature in degrees Celsius. A
                                                                         ## value of -1 indicates that this property cannot be determined.
-        ("current", c_int32_t)                                          ## [out] The amps being drawn in milliamperes. A value of -1 indicates
+        ("current", c_int32)                                            ## [out] The amps being drawn in milliamperes. A value of -1 indicates
                                                                         ## that this property cannot be determined.
     ]
 
@@ -1928,7 +1934,7 @@ class zes_ras_properties_t(Structure):
         ("type", zes_ras_error_type_t),                                 ## [out] The type of RAS error
         ("onSubdevice", ze_bool_t),                                     ## [out] True if the resource is located on a sub-device; false means
                                                                         ## that the resource is on the device of the calling Sysman handle
-        ("subdeviceId", c_ulong)                                        ## [out] If onSubdevice is true, this gives the ID of the sub-device
+        ("subdeviceId", c_uint32)                                       ## [out] If onSubdevice is true, this gives the ID of the sub-device
     ]
 
 ###############################################################################
@@ -1938,7 +1944,7 @@ class zes_ras_state_t(Structure):
         ("stype", zes_structure_type_t),                                ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("category", c_ulonglong * ZES_MAX_RAS_ERROR_CATEGORY_COUNT)    ## [in][out] Breakdown of error by category
+        ("category", c_uint64 * ZES_MAX_RAS_ERROR_CATEGORY_COUNT)       ## [in][out] Breakdown of error by category
     ]
 
 ###############################################################################
@@ -1961,7 +1967,7 @@ class zes_ras_config_t(Structure):
         ("stype", zes_structure_type_t),                                ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("totalThreshold", c_ulonglong),                                ## [in,out] If the total RAS errors exceeds this threshold, the event
+        ("totalThreshold", c_uint64),                                   ## [in,out] If the total RAS errors exceeds this threshold, the event
                                                                         ## will be triggered. A value of 0ULL disables triggering the event based
                                                                         ## on the total counter.
         ("detailedThresholds", zes_ras_state_t)                         ## [in,out] If the RAS errors for each category exceed the threshold for
@@ -1999,19 +2005,19 @@ class zes_sched_properties_t(Structure):
                                                                         ## structure (i.e. contains stype and pNext).
         ("onSubdevice", ze_bool_t),                                     ## [out] True if this resource is located on a sub-device; false means
                                                                         ## that the resource is on the device of the calling Sysman handle
-        ("subdeviceId", c_ulong),                                       ## [out] If onSubdevice is true, this gives the ID of the sub-device
+        ("subdeviceId", c_uint32),                                      ## [out] If onSubdevice is true, this gives the ID of the sub-device
         ("canControl", ze_bool_t),                                      ## [out] Software can change the scheduler component configuration
                                                                         ## assuming the user has permissions.
         ("engines", zes_engine_type_flags_t),                           ## [out] Bitfield of accelerator engine types that are managed by this
                                                                         ## scheduler component. Note that there can be more than one scheduler
                                                                         ## component for the same type of accelerator engine.
-        ("supportedModes", c_ulong)                                     ## [out] Bitfield of scheduler modes that can be configured for this
+        ("supportedModes", c_uint32)                                    ## [out] Bitfield of scheduler modes that can be configured for this
                                                                         ## scheduler component (bitfield of 1<<::zes_sched_mode_t).
     ]
 
 ###############################################################################
 ## @brief Disable forward progress guard timeout.
-ZES_SCHED_WATCHDOG_DISABLE = (~(0ULL))
+ZES_SCHED_WATCHDOG_DISABLE = 0xffffffffffffffff
 
 ###############################################################################
 ## @brief Configuration for timeout scheduler mode (::ZES_SCHED_MODE_TIMEOUT)
@@ -2020,7 +2026,7 @@ class zes_sched_timeout_properties_t(Structure):
         ("stype", zes_structure_type_t),                                ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("watchdogTimeout", c_ulonglong)                                ## [in,out] The maximum time in microseconds that the scheduler will wait
+        ("watchdogTimeout", c_uint64)                                   ## [in,out] The maximum time in microseconds that the scheduler will wait
                                                                         ## for a batch of work submitted to a hardware engine to complete or to
                                                                         ## be preempted so as to run another context.
                                                                         ## If this time is exceeded, the hardware engine is reset and the context terminated.
@@ -2037,10 +2043,10 @@ class zes_sched_timeslice_properties_t(Structure):
         ("stype", zes_structure_type_t),                                ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("interval", c_ulonglong),                                      ## [in,out] The average interval in microseconds that a submission for a
+        ("interval", c_uint64),                                         ## [in,out] The average interval in microseconds that a submission for a
                                                                         ## context will run on a hardware engine before being preempted out to
                                                                         ## run a pending submission for another context.
-        ("yieldTimeout", c_ulonglong)                                   ## [in,out] The maximum time in microseconds that the scheduler will wait
+        ("yieldTimeout", c_uint64)                                      ## [in,out] The maximum time in microseconds that the scheduler will wait
                                                                         ## to preempt a workload running on an engine before deciding to reset
                                                                         ## the hardware engine and terminating the associated context.
     ]
@@ -2065,7 +2071,7 @@ class zes_standby_properties_t(Structure):
         ("type", zes_standby_type_t),                                   ## [out] Which standby hardware component this controls
         ("onSubdevice", ze_bool_t),                                     ## [out] True if the resource is located on a sub-device; false means
                                                                         ## that the resource is on the device of the calling Sysman handle
-        ("subdeviceId", c_ulong)                                        ## [out] If onSubdevice is true, this gives the ID of the sub-device
+        ("subdeviceId", c_uint32)                                       ## [out] If onSubdevice is true, this gives the ID of the sub-device
     ]
 
 ###############################################################################
@@ -2108,7 +2114,7 @@ class zes_temp_properties_t(Structure):
         ("type", zes_temp_sensors_t),                                   ## [out] Which part of the device the temperature sensor measures
         ("onSubdevice", ze_bool_t),                                     ## [out] True if the resource is located on a sub-device; false means
                                                                         ## that the resource is on the device of the calling Sysman handle
-        ("subdeviceId", c_ulong),                                       ## [out] If onSubdevice is true, this gives the ID of the sub-device
+        ("subdeviceId", c_uint32),                                      ## [out] If onSubdevice is true, this gives the ID of the sub-device
         ("maxTemperature", c_double),                                   ## [out] Will contain the maximum temperature for the specific device in
                                                                         ## degrees Celsius.
         ("isCriticalTempSupported", ze_bool_t),                         ## [out] Indicates if the critical temperature event
@@ -2207,11 +2213,11 @@ class zes_power_limit_ext_desc_t(Structure):
                                                                         ## If enabledStateIsLocked is True, this value is ignored.
         ("intervalValueLocked", ze_bool_t),                             ## [out] indicates if the interval can be modified (false) or is fixed
                                                                         ## (true).
-        ("interval", c_int32_t),                                        ## [in,out] power averaging window in milliseconds. If
+        ("interval", c_int32),                                          ## [in,out] power averaging window in milliseconds. If
                                                                         ## intervalValueLocked is true, this value is ignored.
         ("limitValueLocked", ze_bool_t),                                ## [out] indicates if the limit can be set (false) or if the limit is
                                                                         ## fixed (true).
-        ("limit", c_int32_t)                                            ## [in,out] limit value. If limitValueLocked is true, this value is
+        ("limit", c_int32)                                              ## [in,out] limit value. If limitValueLocked is true, this value is
                                                                         ## ignored. The value should be provided in the unit specified by
                                                                         ## limitUnit.
     ]
@@ -2263,7 +2269,7 @@ class zes_engine_ext_properties_t(Structure):
         ("stype", zes_structure_type_t),                                ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("countOfVirtualFunctionInstance", c_ulong)                     ## [out] Number of Virtual Function(VF) instances associated with engine
+        ("countOfVirtualFunctionInstance", c_uint32)                    ## [out] Number of Virtual Function(VF) instances associated with engine
                                                                         ## to monitor the utilization of hardware across all Virtual Function
                                                                         ## from a Physical Function (PF) instance.
                                                                         ## These VF-by-VF views should provide engine group and individual engine
@@ -2287,38 +2293,6 @@ class zes_ras_state_exp_version_t(c_int):
         return str(zes_ras_state_exp_version_v(self.value))
 
 
-###############################################################################
-## @brief RAS error categories
-class zes_ras_error_category_exp_v(IntEnum):
-    RESET = 0                                                               ## The number of accelerator engine resets attempted by the driver
-    PROGRAMMING_ERRORS = 1                                                  ## The number of hardware exceptions generated by the way workloads have
-                                                                            ## programmed the hardware
-    DRIVER_ERRORS = 2                                                       ## The number of low level driver communication errors have occurred
-    COMPUTE_ERRORS = 3                                                      ## The number of errors that have occurred in the compute accelerator
-                                                                            ## hardware
-    NON_COMPUTE_ERRORS = 4                                                  ## The number of errors that have occurred in the fixed-function
-                                                                            ## accelerator hardware
-    CACHE_ERRORS = 5                                                        ## The number of errors that have occurred in caches (L1/L3/register
-                                                                            ## file/shared local memory/sampler)
-    DISPLAY_ERRORS = 6                                                      ## The number of errors that have occurred in the display
-    MEMORY_ERRORS = 7                                                       ## The number of errors that have occurred in Memory
-    SCALE_ERRORS = 8                                                        ## The number of errors that have occurred in Scale Fabric
-    L3FABRIC_ERRORS = 9                                                     ## The number of errors that have occurred in L3 Fabric
-
-class zes_ras_error_category_exp_t(c_int):
-    def __str__(self):
-        return str(zes_ras_error_category_exp_v(self.value))
-
-
-###############################################################################
-## @brief Extension structure for providing RAS error counters for different
-##        error sets
-class zes_ras_state_exp_t(Structure):
-    _fields_ = [
-        ("category", zes_ras_error_category_exp_t),                     ## [out] category for which error counter is provided.
-        ("errorCounter", c_ulonglong)                                   ## [out] Current value of RAS counter for specific error category.
-    ]
-
 ###############################################################################
 ## @brief Memory State Extension Name
 ZES_MEM_PAGE_OFFLINE_STATE_EXP_NAME = "ZES_extension_mem_state"
@@ -2334,22 +2308,6 @@ class zes_mem_page_offline_state_exp_version_t(c_int):
         return str(zes_mem_page_offline_state_exp_version_v(self.value))
 
 
-###############################################################################
-## @brief Extension properties for Memory State
-## 
-## @details
-##     - This structure may be returned from ::zesMemoryGetState via the
-##       `pNext` member of ::zes_mem_state_t
-##     - These additional parameters get Memory Page Offline Metrics
-class zes_mem_page_offline_state_exp_t(Structure):
-    _fields_ = [
-        ("stype", zes_structure_type_t),                                ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("memoryPageOffline", c_ulong),                                 ## [out] Returns the number of Memory Pages Offline
-        ("maxMemoryPageOffline", c_ulong)                               ## [out] Returns the Allowed Memory Pages Offline
-    ]
-
 ###############################################################################
 ## @brief Memory Bandwidth Counter Valid Bits Extension Name
 ZES_MEMORY_BANDWIDTH_COUNTER_BITS_EXP_PROPERTIES_NAME = "ZES_extension_mem_bandwidth_counter_bits_properties"
@@ -2365,24 +2323,6 @@ class zes_mem_bandwidth_counter_bits_exp_version_t(c_int):
         return str(zes_mem_bandwidth_counter_bits_exp_version_v(self.value))
 
 
-###############################################################################
-## @brief Extension properties for reporting valid bit count for memory
-##        bandwidth counter value
-## 
-## @details
-##     - Number of valid read and write counter bits of memory bandwidth
-##     - This structure may be returned from ::zesMemoryGetProperties via the
-##       `pNext` member of ::zes_mem_properties_t.
-##     - Used for denoting number of valid bits in the counter value returned
-##       in ::zes_mem_bandwidth_t.
-class zes_mem_bandwidth_counter_bits_exp_properties_t(Structure):
-    _fields_ = [
-        ("stype", zes_structure_type_t),                                ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("validBitsCount", c_ulong)                                     ## [out] Returns the number of valid bits in the counter values
-    ]
-
 ###############################################################################
 ## @brief Power Domain Properties Name
 ZES_POWER_DOMAIN_PROPERTIES_EXP_NAME = "ZES_extension_power_domain_properties"
@@ -2398,22 +2338,6 @@ class zes_power_domain_properties_exp_version_t(c_int):
         return str(zes_power_domain_properties_exp_version_v(self.value))
 
 
-###############################################################################
-## @brief Extension structure for providing power domain information associated
-##        with a power handle
-## 
-## @details
-##     - This structure may be returned from ::zesPowerGetProperties via the
-##       `pNext` member of ::zes_power_properties_t.
-##     - Used for associating a power handle with a power domain.
-class zes_power_domain_exp_properties_t(Structure):
-    _fields_ = [
-        ("stype", zes_structure_type_t),                                ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("powerDomain", zes_power_domain_t)                             ## [out] Power domain associated with the power handle.
-    ]
-
 ###############################################################################
 ## @brief Firmware security version
 ZES_FIRMWARE_SECURITY_VERSION_EXP_NAME = "ZES_experimental_firmware_security_version"
@@ -2444,17 +2368,6 @@ class zes_sysman_device_mapping_exp_version_t(c_int):
         return str(zes_sysman_device_mapping_exp_version_v(self.value))
 
 
-###############################################################################
-## @brief Sub Device Properties
-class zes_subdevice_exp_properties_t(Structure):
-    _fields_ = [
-        ("stype", zes_structure_type_t),                                ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("subdeviceId", c_ulong),                                       ## [out] this gives the ID of the sub device
-        ("uuid", zes_uuid_t)                                            ## [out] universal unique identifier of the sub device.
-    ]
-
 ###############################################################################
 ## @brief Virtual Function Management Extension Name
 ZES_VIRTUAL_FUNCTION_MANAGEMENT_EXP_NAME = "ZES_experimental_virtual_function_management"
@@ -2497,100 +2410,7 @@ class zes_vf_info_util_exp_flags_t(c_int):
 
 
 ###############################################################################
-## @brief Virtual function management properties (deprecated)
-class zes_vf_exp_properties_t(Structure):
-    _fields_ = [
-        ("stype", zes_structure_type_t),                                ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("address", zes_pci_address_t),                                 ## [out] Virtual function BDF address
-        ("uuid", zes_uuid_t),                                           ## [out] universal unique identifier of the device
-        ("flags", zes_vf_info_util_exp_flags_t)                         ## [out] utilization flags available. May be 0 or a valid combination of
-                                                                        ## ::zes_vf_info_util_exp_flag_t.
-    ]
-
-###############################################################################
-## @brief Provides memory utilization values for a virtual function (deprecated)
-class zes_vf_util_mem_exp_t(Structure):
-    _fields_ = [
-        ("stype", zes_structure_type_t),                                ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("memTypeFlags", zes_vf_info_mem_type_exp_flags_t),             ## [out] Memory type flags.
-        ("free", c_ulonglong),                                          ## [out] Free memory size in bytes.
-        ("size", c_ulonglong),                                          ## [out] Total allocatable memory in bytes.
-        ("timestamp", c_ulonglong)                                      ## [out] Wall clock time from VF when value was sampled.
-    ]
-
-###############################################################################
-## @brief Provides engine utilization values for a virtual function (deprecated)
-class zes_vf_util_engine_exp_t(Structure):
-    _fields_ = [
-        ("stype", zes_structure_type_t),                                ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("type", zes_engine_group_t),                                   ## [out] The engine group.
-        ("activeCounterValue", c_ulonglong),                            ## [out] Represents active counter.
-        ("samplingCounterValue", c_ulonglong),                          ## [out] Represents counter value when activeCounterValue was sampled.
-        ("timestamp", c_ulonglong)                                      ## [out] Wall clock time when the activeCounterValue was sampled.
-    ]
-
-###############################################################################
-## @brief Virtual function management capabilities (deprecated)
-class zes_vf_exp_capabilities_t(Structure):
-    _fields_ = [
-        ("stype", zes_structure_type_t),                                ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("address", zes_pci_address_t),                                 ## [out] Virtual function BDF address
-        ("vfDeviceMemSize", c_ulong),                                   ## [out] Virtual function memory size in kilo bytes
-        ("vfID", c_ulong)                                               ## [out] Virtual Function ID
-    ]
-
-###############################################################################
-## @brief Virtual function management capabilities
-class zes_vf_exp2_capabilities_t(Structure):
-    _fields_ = [
-        ("stype", zes_structure_type_t),                                ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("address", zes_pci_address_t),                                 ## [out] Virtual function BDF address
-        ("vfDeviceMemSize", c_ulonglong),                               ## [out] Virtual function memory size in bytes
-        ("vfID", c_ulong)                                               ## [out] Virtual Function ID
-    ]
-
-###############################################################################
-## @brief Provides memory utilization values for a virtual function
-class zes_vf_util_mem_exp2_t(Structure):
-    _fields_ = [
-        ("stype", zes_structure_type_t),                                ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("vfMemLocation", zes_mem_loc_t),                               ## [out] Location of this memory (system, device)
-        ("vfMemUtilized", c_ulonglong)                                  ## [out] Utilized memory size in bytes.
-    ]
-
-###############################################################################
-## @brief Provides engine utilization values for a virtual function
-## 
-## @details
-##     - Percent utilization is calculated by taking two snapshots (s1, s2) and
-##       using the equation: %util = (s2.activeCounterValue -
-##       s1.activeCounterValue) / (s2.samplingCounterValue -
-##       s1.samplingCounterValue)
-class zes_vf_util_engine_exp2_t(Structure):
-    _fields_ = [
-        ("stype", zes_structure_type_t),                                ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("vfEngineType", zes_engine_group_t),                           ## [out] The engine group.
-        ("activeCounterValue", c_ulonglong),                            ## [out] Represents active counter.
-        ("samplingCounterValue", c_ulonglong)                           ## [out] Represents counter value when activeCounterValue was sampled.
-                                                                        ## Refer to the formulae above for calculating the utilization percent
-    ]
-
-###############################################################################
-__use_win_types = "Windows" == platform.uname()[0]
+__use_win_types = "win32" == sys.platform
 
 ###############################################################################
 ## @brief Function-pointer for zesInit
@@ -2631,9 +2451,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zesDeviceProcessesGetState
 if __use_win_types:
-    _zesDeviceProcessesGetState_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_process_state_t) )
+    _zesDeviceProcessesGetState_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_process_state_t) )
 else:
-    _zesDeviceProcessesGetState_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_process_state_t) )
+    _zesDeviceProcessesGetState_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_process_state_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDevicePciGetProperties
@@ -2652,9 +2472,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zesDevicePciGetBars
 if __use_win_types:
-    _zesDevicePciGetBars_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_pci_bar_properties_t) )
+    _zesDevicePciGetBars_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_pci_bar_properties_t) )
 else:
-    _zesDevicePciGetBars_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_pci_bar_properties_t) )
+    _zesDevicePciGetBars_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_pci_bar_properties_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDevicePciGetStats
@@ -2666,16 +2486,16 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zesDeviceEnumDiagnosticTestSuites
 if __use_win_types:
-    _zesDeviceEnumDiagnosticTestSuites_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_diag_handle_t) )
+    _zesDeviceEnumDiagnosticTestSuites_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_diag_handle_t) )
 else:
-    _zesDeviceEnumDiagnosticTestSuites_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_diag_handle_t) )
+    _zesDeviceEnumDiagnosticTestSuites_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_diag_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDeviceEnumEngineGroups
 if __use_win_types:
-    _zesDeviceEnumEngineGroups_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_engine_handle_t) )
+    _zesDeviceEnumEngineGroups_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_engine_handle_t) )
 else:
-    _zesDeviceEnumEngineGroups_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_engine_handle_t) )
+    _zesDeviceEnumEngineGroups_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_engine_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDeviceEventRegister
@@ -2687,58 +2507,58 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zesDeviceEnumFabricPorts
 if __use_win_types:
-    _zesDeviceEnumFabricPorts_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_fabric_port_handle_t) )
+    _zesDeviceEnumFabricPorts_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_fabric_port_handle_t) )
 else:
-    _zesDeviceEnumFabricPorts_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_fabric_port_handle_t) )
+    _zesDeviceEnumFabricPorts_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_fabric_port_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDeviceEnumFans
 if __use_win_types:
-    _zesDeviceEnumFans_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_fan_handle_t) )
+    _zesDeviceEnumFans_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_fan_handle_t) )
 else:
-    _zesDeviceEnumFans_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_fan_handle_t) )
+    _zesDeviceEnumFans_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_fan_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDeviceEnumFirmwares
 if __use_win_types:
-    _zesDeviceEnumFirmwares_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_firmware_handle_t) )
+    _zesDeviceEnumFirmwares_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_firmware_handle_t) )
 else:
-    _zesDeviceEnumFirmwares_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_firmware_handle_t) )
+    _zesDeviceEnumFirmwares_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_firmware_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDeviceEnumFrequencyDomains
 if __use_win_types:
-    _zesDeviceEnumFrequencyDomains_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_freq_handle_t) )
+    _zesDeviceEnumFrequencyDomains_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_freq_handle_t) )
 else:
-    _zesDeviceEnumFrequencyDomains_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_freq_handle_t) )
+    _zesDeviceEnumFrequencyDomains_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_freq_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDeviceEnumLeds
 if __use_win_types:
-    _zesDeviceEnumLeds_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_led_handle_t) )
+    _zesDeviceEnumLeds_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_led_handle_t) )
 else:
-    _zesDeviceEnumLeds_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_led_handle_t) )
+    _zesDeviceEnumLeds_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_led_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDeviceEnumMemoryModules
 if __use_win_types:
-    _zesDeviceEnumMemoryModules_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_mem_handle_t) )
+    _zesDeviceEnumMemoryModules_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_mem_handle_t) )
 else:
-    _zesDeviceEnumMemoryModules_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_mem_handle_t) )
+    _zesDeviceEnumMemoryModules_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_mem_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDeviceEnumPerformanceFactorDomains
 if __use_win_types:
-    _zesDeviceEnumPerformanceFactorDomains_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_perf_handle_t) )
+    _zesDeviceEnumPerformanceFactorDomains_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_perf_handle_t) )
 else:
-    _zesDeviceEnumPerformanceFactorDomains_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_perf_handle_t) )
+    _zesDeviceEnumPerformanceFactorDomains_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_perf_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDeviceEnumPowerDomains
 if __use_win_types:
-    _zesDeviceEnumPowerDomains_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_pwr_handle_t) )
+    _zesDeviceEnumPowerDomains_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_pwr_handle_t) )
 else:
-    _zesDeviceEnumPowerDomains_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_pwr_handle_t) )
+    _zesDeviceEnumPowerDomains_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_pwr_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDeviceGetCardPowerDomain
@@ -2750,37 +2570,37 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zesDeviceEnumPsus
 if __use_win_types:
-    _zesDeviceEnumPsus_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_psu_handle_t) )
+    _zesDeviceEnumPsus_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_psu_handle_t) )
 else:
-    _zesDeviceEnumPsus_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_psu_handle_t) )
+    _zesDeviceEnumPsus_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_psu_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDeviceEnumRasErrorSets
 if __use_win_types:
-    _zesDeviceEnumRasErrorSets_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_ras_handle_t) )
+    _zesDeviceEnumRasErrorSets_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_ras_handle_t) )
 else:
-    _zesDeviceEnumRasErrorSets_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_ras_handle_t) )
+    _zesDeviceEnumRasErrorSets_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_ras_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDeviceEnumSchedulers
 if __use_win_types:
-    _zesDeviceEnumSchedulers_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_sched_handle_t) )
+    _zesDeviceEnumSchedulers_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_sched_handle_t) )
 else:
-    _zesDeviceEnumSchedulers_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_sched_handle_t) )
+    _zesDeviceEnumSchedulers_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_sched_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDeviceEnumStandbyDomains
 if __use_win_types:
-    _zesDeviceEnumStandbyDomains_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_standby_handle_t) )
+    _zesDeviceEnumStandbyDomains_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_standby_handle_t) )
 else:
-    _zesDeviceEnumStandbyDomains_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_standby_handle_t) )
+    _zesDeviceEnumStandbyDomains_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_standby_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDeviceEnumTemperatureSensors
 if __use_win_types:
-    _zesDeviceEnumTemperatureSensors_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_temp_handle_t) )
+    _zesDeviceEnumTemperatureSensors_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_temp_handle_t) )
 else:
-    _zesDeviceEnumTemperatureSensors_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_temp_handle_t) )
+    _zesDeviceEnumTemperatureSensors_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_temp_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDeviceEccAvailable
@@ -2813,9 +2633,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zesDeviceGet
 if __use_win_types:
-    _zesDeviceGet_t = WINFUNCTYPE( ze_result_t, zes_driver_handle_t, POINTER(c_ulong), POINTER(zes_device_handle_t) )
+    _zesDeviceGet_t = WINFUNCTYPE( ze_result_t, zes_driver_handle_t, POINTER(c_uint32), POINTER(zes_device_handle_t) )
 else:
-    _zesDeviceGet_t = CFUNCTYPE( ze_result_t, zes_driver_handle_t, POINTER(c_ulong), POINTER(zes_device_handle_t) )
+    _zesDeviceGet_t = CFUNCTYPE( ze_result_t, zes_driver_handle_t, POINTER(c_uint32), POINTER(zes_device_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDeviceSetOverclockWaiver
@@ -2827,16 +2647,16 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zesDeviceGetOverclockDomains
 if __use_win_types:
-    _zesDeviceGetOverclockDomains_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong) )
+    _zesDeviceGetOverclockDomains_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32) )
 else:
-    _zesDeviceGetOverclockDomains_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong) )
+    _zesDeviceGetOverclockDomains_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDeviceGetOverclockControls
 if __use_win_types:
-    _zesDeviceGetOverclockControls_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, zes_overclock_domain_t, POINTER(c_ulong) )
+    _zesDeviceGetOverclockControls_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, zes_overclock_domain_t, POINTER(c_uint32) )
 else:
-    _zesDeviceGetOverclockControls_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, zes_overclock_domain_t, POINTER(c_ulong) )
+    _zesDeviceGetOverclockControls_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, zes_overclock_domain_t, POINTER(c_uint32) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDeviceResetOverclockSettings
@@ -2855,9 +2675,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zesDeviceEnumOverclockDomains
 if __use_win_types:
-    _zesDeviceEnumOverclockDomains_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_overclock_handle_t) )
+    _zesDeviceEnumOverclockDomains_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_overclock_handle_t) )
 else:
-    _zesDeviceEnumOverclockDomains_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_overclock_handle_t) )
+    _zesDeviceEnumOverclockDomains_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_uint32), POINTER(zes_overclock_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDeviceResetExt
@@ -2910,28 +2730,6 @@ class _zes_device_dditable_t(Structure):
         ("pfnResetExt", c_void_p)                                       ## _zesDeviceResetExt_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zesDeviceGetSubDevicePropertiesExp
-if __use_win_types:
-    _zesDeviceGetSubDevicePropertiesExp_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_subdevice_exp_properties_t) )
-else:
-    _zesDeviceGetSubDevicePropertiesExp_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_subdevice_exp_properties_t) )
-
-###############################################################################
-## @brief Function-pointer for zesDeviceEnumActiveVFExp
-if __use_win_types:
-    _zesDeviceEnumActiveVFExp_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_vf_handle_t) )
-else:
-    _zesDeviceEnumActiveVFExp_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_vf_handle_t) )
-
-###############################################################################
-## @brief Function-pointer for zesDeviceEnumEnabledVFExp
-if __use_win_types:
-    _zesDeviceEnumEnabledVFExp_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_vf_handle_t) )
-else:
-    _zesDeviceEnumEnabledVFExp_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, POINTER(c_ulong), POINTER(zes_vf_handle_t) )
-
-
 ###############################################################################
 ## @brief Table of DeviceExp functions pointers
 class _zes_device_exp_dditable_t(Structure):
@@ -2944,30 +2742,30 @@ class _zes_device_exp_dditable_t(Structure):
 ###############################################################################
 ## @brief Function-pointer for zesDriverEventListen
 if __use_win_types:
-    _zesDriverEventListen_t = WINFUNCTYPE( ze_result_t, ze_driver_handle_t, c_ulong, c_ulong, POINTER(zes_device_handle_t), POINTER(c_ulong), POINTER(zes_event_type_flags_t) )
+    _zesDriverEventListen_t = WINFUNCTYPE( ze_result_t, ze_driver_handle_t, c_uint32, c_uint32, POINTER(zes_device_handle_t), POINTER(c_uint32), POINTER(zes_event_type_flags_t) )
 else:
-    _zesDriverEventListen_t = CFUNCTYPE( ze_result_t, ze_driver_handle_t, c_ulong, c_ulong, POINTER(zes_device_handle_t), POINTER(c_ulong), POINTER(zes_event_type_flags_t) )
+    _zesDriverEventListen_t = CFUNCTYPE( ze_result_t, ze_driver_handle_t, c_uint32, c_uint32, POINTER(zes_device_handle_t), POINTER(c_uint32), POINTER(zes_event_type_flags_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDriverEventListenEx
 if __use_win_types:
-    _zesDriverEventListenEx_t = WINFUNCTYPE( ze_result_t, ze_driver_handle_t, c_ulonglong, c_ulong, POINTER(zes_device_handle_t), POINTER(c_ulong), POINTER(zes_event_type_flags_t) )
+    _zesDriverEventListenEx_t = WINFUNCTYPE( ze_result_t, ze_driver_handle_t, c_uint64, c_uint32, POINTER(zes_device_handle_t), POINTER(c_uint32), POINTER(zes_event_type_flags_t) )
 else:
-    _zesDriverEventListenEx_t = CFUNCTYPE( ze_result_t, ze_driver_handle_t, c_ulonglong, c_ulong, POINTER(zes_device_handle_t), POINTER(c_ulong), POINTER(zes_event_type_flags_t) )
+    _zesDriverEventListenEx_t = CFUNCTYPE( ze_result_t, ze_driver_handle_t, c_uint64, c_uint32, POINTER(zes_device_handle_t), POINTER(c_uint32), POINTER(zes_event_type_flags_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDriverGet
 if __use_win_types:
-    _zesDriverGet_t = WINFUNCTYPE( ze_result_t, POINTER(c_ulong), POINTER(zes_driver_handle_t) )
+    _zesDriverGet_t = WINFUNCTYPE( ze_result_t, POINTER(c_uint32), POINTER(zes_driver_handle_t) )
 else:
-    _zesDriverGet_t = CFUNCTYPE( ze_result_t, POINTER(c_ulong), POINTER(zes_driver_handle_t) )
+    _zesDriverGet_t = CFUNCTYPE( ze_result_t, POINTER(c_uint32), POINTER(zes_driver_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDriverGetExtensionProperties
 if __use_win_types:
-    _zesDriverGetExtensionProperties_t = WINFUNCTYPE( ze_result_t, zes_driver_handle_t, POINTER(c_ulong), POINTER(zes_driver_extension_properties_t) )
+    _zesDriverGetExtensionProperties_t = WINFUNCTYPE( ze_result_t, zes_driver_handle_t, POINTER(c_uint32), POINTER(zes_driver_extension_properties_t) )
 else:
-    _zesDriverGetExtensionProperties_t = CFUNCTYPE( ze_result_t, zes_driver_handle_t, POINTER(c_ulong), POINTER(zes_driver_extension_properties_t) )
+    _zesDriverGetExtensionProperties_t = CFUNCTYPE( ze_result_t, zes_driver_handle_t, POINTER(c_uint32), POINTER(zes_driver_extension_properties_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDriverGetExtensionFunctionAddress
@@ -2988,14 +2786,6 @@ class _zes_driver_dditable_t(Structure):
         ("pfnGetExtensionFunctionAddress", c_void_p)                    ## _zesDriverGetExtensionFunctionAddress_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zesDriverGetDeviceByUuidExp
-if __use_win_types:
-    _zesDriverGetDeviceByUuidExp_t = WINFUNCTYPE( ze_result_t, zes_driver_handle_t, zes_uuid_t, POINTER(zes_device_handle_t), POINTER(ze_bool_t), POINTER(c_ulong) )
-else:
-    _zesDriverGetDeviceByUuidExp_t = CFUNCTYPE( ze_result_t, zes_driver_handle_t, zes_uuid_t, POINTER(zes_device_handle_t), POINTER(ze_bool_t), POINTER(c_ulong) )
-
-
 ###############################################################################
 ## @brief Table of DriverExp functions pointers
 class _zes_driver_exp_dditable_t(Structure):
@@ -3055,16 +2845,16 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zesOverclockGetVFPointValues
 if __use_win_types:
-    _zesOverclockGetVFPointValues_t = WINFUNCTYPE( ze_result_t, zes_overclock_handle_t, zes_vf_type_t, zes_vf_array_type_t, c_ulong, POINTER(c_ulong) )
+    _zesOverclockGetVFPointValues_t = WINFUNCTYPE( ze_result_t, zes_overclock_handle_t, zes_vf_type_t, zes_vf_array_type_t, c_uint32, POINTER(c_uint32) )
 else:
-    _zesOverclockGetVFPointValues_t = CFUNCTYPE( ze_result_t, zes_overclock_handle_t, zes_vf_type_t, zes_vf_array_type_t, c_ulong, POINTER(c_ulong) )
+    _zesOverclockGetVFPointValues_t = CFUNCTYPE( ze_result_t, zes_overclock_handle_t, zes_vf_type_t, zes_vf_array_type_t, c_uint32, POINTER(c_uint32) )
 
 ###############################################################################
 ## @brief Function-pointer for zesOverclockSetVFPointValues
 if __use_win_types:
-    _zesOverclockSetVFPointValues_t = WINFUNCTYPE( ze_result_t, zes_overclock_handle_t, zes_vf_type_t, c_ulong, c_ulong )
+    _zesOverclockSetVFPointValues_t = WINFUNCTYPE( ze_result_t, zes_overclock_handle_t, zes_vf_type_t, c_uint32, c_uint32 )
 else:
-    _zesOverclockSetVFPointValues_t = CFUNCTYPE( ze_result_t, zes_overclock_handle_t, zes_vf_type_t, c_ulong, c_ulong )
+    _zesOverclockSetVFPointValues_t = CFUNCTYPE( ze_result_t, zes_overclock_handle_t, zes_vf_type_t, c_uint32, c_uint32 )
 
 
 ###############################################################################
@@ -3229,16 +3019,16 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zesPowerGetLimitsExt
 if __use_win_types:
-    _zesPowerGetLimitsExt_t = WINFUNCTYPE( ze_result_t, zes_pwr_handle_t, POINTER(c_ulong), POINTER(zes_power_limit_ext_desc_t) )
+    _zesPowerGetLimitsExt_t = WINFUNCTYPE( ze_result_t, zes_pwr_handle_t, POINTER(c_uint32), POINTER(zes_power_limit_ext_desc_t) )
 else:
-    _zesPowerGetLimitsExt_t = CFUNCTYPE( ze_result_t, zes_pwr_handle_t, POINTER(c_ulong), POINTER(zes_power_limit_ext_desc_t) )
+    _zesPowerGetLimitsExt_t = CFUNCTYPE( ze_result_t, zes_pwr_handle_t, POINTER(c_uint32), POINTER(zes_power_limit_ext_desc_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesPowerSetLimitsExt
 if __use_win_types:
-    _zesPowerSetLimitsExt_t = WINFUNCTYPE( ze_result_t, zes_pwr_handle_t, POINTER(c_ulong), POINTER(zes_power_limit_ext_desc_t) )
+    _zesPowerSetLimitsExt_t = WINFUNCTYPE( ze_result_t, zes_pwr_handle_t, POINTER(c_uint32), POINTER(zes_power_limit_ext_desc_t) )
 else:
-    _zesPowerSetLimitsExt_t = CFUNCTYPE( ze_result_t, zes_pwr_handle_t, POINTER(c_ulong), POINTER(zes_power_limit_ext_desc_t) )
+    _zesPowerSetLimitsExt_t = CFUNCTYPE( ze_result_t, zes_pwr_handle_t, POINTER(c_uint32), POINTER(zes_power_limit_ext_desc_t) )
 
 
 ###############################################################################
@@ -3265,9 +3055,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zesFrequencyGetAvailableClocks
 if __use_win_types:
-    _zesFrequencyGetAvailableClocks_t = WINFUNCTYPE( ze_result_t, zes_freq_handle_t, POINTER(c_ulong), POINTER(c_double) )
+    _zesFrequencyGetAvailableClocks_t = WINFUNCTYPE( ze_result_t, zes_freq_handle_t, POINTER(c_uint32), POINTER(c_double) )
 else:
-    _zesFrequencyGetAvailableClocks_t = CFUNCTYPE( ze_result_t, zes_freq_handle_t, POINTER(c_ulong), POINTER(c_double) )
+    _zesFrequencyGetAvailableClocks_t = CFUNCTYPE( ze_result_t, zes_freq_handle_t, POINTER(c_uint32), POINTER(c_double) )
 
 ###############################################################################
 ## @brief Function-pointer for zesFrequencyGetRange
@@ -3415,9 +3205,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zesEngineGetActivityExt
 if __use_win_types:
-    _zesEngineGetActivityExt_t = WINFUNCTYPE( ze_result_t, zes_engine_handle_t, POINTER(c_ulong), POINTER(zes_engine_stats_t) )
+    _zesEngineGetActivityExt_t = WINFUNCTYPE( ze_result_t, zes_engine_handle_t, POINTER(c_uint32), POINTER(zes_engine_stats_t) )
 else:
-    _zesEngineGetActivityExt_t = CFUNCTYPE( ze_result_t, zes_engine_handle_t, POINTER(c_ulong), POINTER(zes_engine_stats_t) )
+    _zesEngineGetActivityExt_t = CFUNCTYPE( ze_result_t, zes_engine_handle_t, POINTER(c_uint32), POINTER(zes_engine_stats_t) )
 
 
 ###############################################################################
@@ -3470,16 +3260,16 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zesFirmwareFlash
 if __use_win_types:
-    _zesFirmwareFlash_t = WINFUNCTYPE( ze_result_t, zes_firmware_handle_t, c_void_p, c_ulong )
+    _zesFirmwareFlash_t = WINFUNCTYPE( ze_result_t, zes_firmware_handle_t, c_void_p, c_uint32 )
 else:
-    _zesFirmwareFlash_t = CFUNCTYPE( ze_result_t, zes_firmware_handle_t, c_void_p, c_ulong )
+    _zesFirmwareFlash_t = CFUNCTYPE( ze_result_t, zes_firmware_handle_t, c_void_p, c_uint32 )
 
 ###############################################################################
 ## @brief Function-pointer for zesFirmwareGetFlashProgress
 if __use_win_types:
-    _zesFirmwareGetFlashProgress_t = WINFUNCTYPE( ze_result_t, zes_firmware_handle_t, POINTER(c_ulong) )
+    _zesFirmwareGetFlashProgress_t = WINFUNCTYPE( ze_result_t, zes_firmware_handle_t, POINTER(c_uint32) )
 else:
-    _zesFirmwareGetFlashProgress_t = CFUNCTYPE( ze_result_t, zes_firmware_handle_t, POINTER(c_ulong) )
+    _zesFirmwareGetFlashProgress_t = CFUNCTYPE( ze_result_t, zes_firmware_handle_t, POINTER(c_uint32) )
 
 ###############################################################################
 ## @brief Function-pointer for zesFirmwareGetConsoleLogs
@@ -3499,21 +3289,6 @@ class _zes_firmware_dditable_t(Structure):
         ("pfnGetConsoleLogs", c_void_p)                                 ## _zesFirmwareGetConsoleLogs_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zesFirmwareGetSecurityVersionExp
-if __use_win_types:
-    _zesFirmwareGetSecurityVersionExp_t = WINFUNCTYPE( ze_result_t, zes_firmware_handle_t, c_char_p )
-else:
-    _zesFirmwareGetSecurityVersionExp_t = CFUNCTYPE( ze_result_t, zes_firmware_handle_t, c_char_p )
-
-###############################################################################
-## @brief Function-pointer for zesFirmwareSetSecurityVersionExp
-if __use_win_types:
-    _zesFirmwareSetSecurityVersionExp_t = WINFUNCTYPE( ze_result_t, zes_firmware_handle_t )
-else:
-    _zesFirmwareSetSecurityVersionExp_t = CFUNCTYPE( ze_result_t, zes_firmware_handle_t )
-
-
 ###############################################################################
 ## @brief Table of FirmwareExp functions pointers
 class _zes_firmware_exp_dditable_t(Structure):
@@ -3605,9 +3380,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zesFabricPortGetMultiPortThroughput
 if __use_win_types:
-    _zesFabricPortGetMultiPortThroughput_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, c_ulong, POINTER(zes_fabric_port_handle_t), POINTER(zes_fabric_port_throughput_t*) )
+    _zesFabricPortGetMultiPortThroughput_t = WINFUNCTYPE( ze_result_t, zes_device_handle_t, c_uint32, POINTER(zes_fabric_port_handle_t), POINTER(POINTER(zes_fabric_port_throughput_t)) )
 else:
-    _zesFabricPortGetMultiPortThroughput_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, c_ulong, POINTER(zes_fabric_port_handle_t), POINTER(zes_fabric_port_throughput_t*) )
+    _zesFabricPortGetMultiPortThroughput_t = CFUNCTYPE( ze_result_t, zes_device_handle_t, c_uint32, POINTER(zes_fabric_port_handle_t), POINTER(POINTER(zes_fabric_port_throughput_t)) )
 
 
 ###############################################################################
@@ -3724,9 +3499,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zesFanGetState
 if __use_win_types:
-    _zesFanGetState_t = WINFUNCTYPE( ze_result_t, zes_fan_handle_t, zes_fan_speed_units_t, POINTER(c_int32_t) )
+    _zesFanGetState_t = WINFUNCTYPE( ze_result_t, zes_fan_handle_t, zes_fan_speed_units_t, POINTER(c_int32) )
 else:
-    _zesFanGetState_t = CFUNCTYPE( ze_result_t, zes_fan_handle_t, zes_fan_speed_units_t, POINTER(c_int32_t) )
+    _zesFanGetState_t = CFUNCTYPE( ze_result_t, zes_fan_handle_t, zes_fan_speed_units_t, POINTER(c_int32) )
 
 
 ###############################################################################
@@ -3819,21 +3594,6 @@ class _zes_ras_dditable_t(Structure):
         ("pfnGetState", c_void_p)                                       ## _zesRasGetState_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zesRasGetStateExp
-if __use_win_types:
-    _zesRasGetStateExp_t = WINFUNCTYPE( ze_result_t, zes_ras_handle_t, POINTER(c_ulong), POINTER(zes_ras_state_exp_t) )
-else:
-    _zesRasGetStateExp_t = CFUNCTYPE( ze_result_t, zes_ras_handle_t, POINTER(c_ulong), POINTER(zes_ras_state_exp_t) )
-
-###############################################################################
-## @brief Function-pointer for zesRasClearStateExp
-if __use_win_types:
-    _zesRasClearStateExp_t = WINFUNCTYPE( ze_result_t, zes_ras_handle_t, zes_ras_error_category_exp_t )
-else:
-    _zesRasClearStateExp_t = CFUNCTYPE( ze_result_t, zes_ras_handle_t, zes_ras_error_category_exp_t )
-
-
 ###############################################################################
 ## @brief Table of RasExp functions pointers
 class _zes_ras_exp_dditable_t(Structure):
@@ -3852,16 +3612,16 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zesDiagnosticsGetTests
 if __use_win_types:
-    _zesDiagnosticsGetTests_t = WINFUNCTYPE( ze_result_t, zes_diag_handle_t, POINTER(c_ulong), POINTER(zes_diag_test_t) )
+    _zesDiagnosticsGetTests_t = WINFUNCTYPE( ze_result_t, zes_diag_handle_t, POINTER(c_uint32), POINTER(zes_diag_test_t) )
 else:
-    _zesDiagnosticsGetTests_t = CFUNCTYPE( ze_result_t, zes_diag_handle_t, POINTER(c_ulong), POINTER(zes_diag_test_t) )
+    _zesDiagnosticsGetTests_t = CFUNCTYPE( ze_result_t, zes_diag_handle_t, POINTER(c_uint32), POINTER(zes_diag_test_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zesDiagnosticsRunTests
 if __use_win_types:
-    _zesDiagnosticsRunTests_t = WINFUNCTYPE( ze_result_t, zes_diag_handle_t, c_ulong, c_ulong, POINTER(zes_diag_result_t) )
+    _zesDiagnosticsRunTests_t = WINFUNCTYPE( ze_result_t, zes_diag_handle_t, c_uint32, c_uint32, POINTER(zes_diag_result_t) )
 else:
-    _zesDiagnosticsRunTests_t = CFUNCTYPE( ze_result_t, zes_diag_handle_t, c_ulong, c_ulong, POINTER(zes_diag_result_t) )
+    _zesDiagnosticsRunTests_t = CFUNCTYPE( ze_result_t, zes_diag_handle_t, c_uint32, c_uint32, POINTER(zes_diag_result_t) )
 
 
 ###############################################################################
@@ -3873,70 +3633,6 @@ class _zes_diagnostics_dditable_t(Structure):
         ("pfnRunTests", c_void_p)                                       ## _zesDiagnosticsRunTests_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zesVFManagementGetVFPropertiesExp
-if __use_win_types:
-    _zesVFManagementGetVFPropertiesExp_t = WINFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(zes_vf_exp_properties_t) )
-else:
-    _zesVFManagementGetVFPropertiesExp_t = CFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(zes_vf_exp_properties_t) )
-
-###############################################################################
-## @brief Function-pointer for zesVFManagementGetVFMemoryUtilizationExp
-if __use_win_types:
-    _zesVFManagementGetVFMemoryUtilizationExp_t = WINFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(c_ulong), POINTER(zes_vf_util_mem_exp_t) )
-else:
-    _zesVFManagementGetVFMemoryUtilizationExp_t = CFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(c_ulong), POINTER(zes_vf_util_mem_exp_t) )
-
-###############################################################################
-## @brief Function-pointer for zesVFManagementGetVFEngineUtilizationExp
-if __use_win_types:
-    _zesVFManagementGetVFEngineUtilizationExp_t = WINFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(c_ulong), POINTER(zes_vf_util_engine_exp_t) )
-else:
-    _zesVFManagementGetVFEngineUtilizationExp_t = CFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(c_ulong), POINTER(zes_vf_util_engine_exp_t) )
-
-###############################################################################
-## @brief Function-pointer for zesVFManagementSetVFTelemetryModeExp
-if __use_win_types:
-    _zesVFManagementSetVFTelemetryModeExp_t = WINFUNCTYPE( ze_result_t, zes_vf_handle_t, zes_vf_info_util_exp_flags_t, ze_bool_t )
-else:
-    _zesVFManagementSetVFTelemetryModeExp_t = CFUNCTYPE( ze_result_t, zes_vf_handle_t, zes_vf_info_util_exp_flags_t, ze_bool_t )
-
-###############################################################################
-## @brief Function-pointer for zesVFManagementSetVFTelemetrySamplingIntervalExp
-if __use_win_types:
-    _zesVFManagementSetVFTelemetrySamplingIntervalExp_t = WINFUNCTYPE( ze_result_t, zes_vf_handle_t, zes_vf_info_util_exp_flags_t, c_ulonglong )
-else:
-    _zesVFManagementSetVFTelemetrySamplingIntervalExp_t = CFUNCTYPE( ze_result_t, zes_vf_handle_t, zes_vf_info_util_exp_flags_t, c_ulonglong )
-
-###############################################################################
-## @brief Function-pointer for zesVFManagementGetVFCapabilitiesExp
-if __use_win_types:
-    _zesVFManagementGetVFCapabilitiesExp_t = WINFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(zes_vf_exp_capabilities_t) )
-else:
-    _zesVFManagementGetVFCapabilitiesExp_t = CFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(zes_vf_exp_capabilities_t) )
-
-###############################################################################
-## @brief Function-pointer for zesVFManagementGetVFMemoryUtilizationExp2
-if __use_win_types:
-    _zesVFManagementGetVFMemoryUtilizationExp2_t = WINFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(c_ulong), POINTER(zes_vf_util_mem_exp2_t) )
-else:
-    _zesVFManagementGetVFMemoryUtilizationExp2_t = CFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(c_ulong), POINTER(zes_vf_util_mem_exp2_t) )
-
-###############################################################################
-## @brief Function-pointer for zesVFManagementGetVFEngineUtilizationExp2
-if __use_win_types:
-    _zesVFManagementGetVFEngineUtilizationExp2_t = WINFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(c_ulong), POINTER(zes_vf_util_engine_exp2_t) )
-else:
-    _zesVFManagementGetVFEngineUtilizationExp2_t = CFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(c_ulong), POINTER(zes_vf_util_engine_exp2_t) )
-
-###############################################################################
-## @brief Function-pointer for zesVFManagementGetVFCapabilitiesExp2
-if __use_win_types:
-    _zesVFManagementGetVFCapabilitiesExp2_t = WINFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(zes_vf_exp2_capabilities_t) )
-else:
-    _zesVFManagementGetVFCapabilitiesExp2_t = CFUNCTYPE( ze_result_t, zes_vf_handle_t, POINTER(zes_vf_exp2_capabilities_t) )
-
-
 ###############################################################################
 ## @brief Table of VFManagementExp functions pointers
 class _zes_vf_management_exp_dditable_t(Structure):
@@ -3981,382 +3677,342 @@ class _zes_dditable_t(Structure):
         ("VFManagementExp", _zes_vf_management_exp_dditable_t)
     ]
 
+###############################################################################
+## @brief Returns the named function-pointer type, defining it if deferred
+def _get_functype(name):
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
+###############################################################################
+## @brief Experimental definitions deferred to _zes_exp until first accessed
+_deferred = frozenset([
+    "_zesDeviceEnumActiveVFExp_t",
+    "_zesDeviceEnumEnabledVFExp_t",
+    "_zesDeviceGetSubDevicePropertiesExp_t",
+    "_zesDriverGetDeviceByUuidExp_t",
+    "_zesFirmwareGetSecurityVersionExp_t",
+    "_zesFirmwareSetSecurityVersionExp_t",
+    "_zesRasClearStateExp_t",
+    "_zesRasGetStateExp_t",
+    "_zesVFManagementGetVFCapabilitiesExp2_t",
+    "_zesVFManagementGetVFCapabilitiesExp_t",
+    "_zesVFManagementGetVFEngineUtilizationExp2_t",
+    "_zesVFManagementGetVFEngineUtilizationExp_t",
+    "_zesVFManagementGetVFMemoryUtilizationExp2_t",
+    "_zesVFManagementGetVFMemoryUtilizationExp_t",
+    "_zesVFManagementGetVFPropertiesExp_t",
+    "_zesVFManagementSetVFTelemetryModeExp_t",
+    "_zesVFManagementSetVFTelemetrySamplingIntervalExp_t",
+    "zes_mem_bandwidth_counter_bits_exp_properties_t",
+    "zes_mem_page_offline_state_exp_t",
+    "zes_power_domain_exp_properties_t",
+    "zes_ras_error_category_exp_t",
+    "zes_ras_error_category_exp_v",
+    "zes_ras_state_exp_t",
+    "zes_subdevice_exp_properties_t",
+    "zes_vf_exp2_capabilities_t",
+    "zes_vf_exp_capabilities_t",
+    "zes_vf_exp_properties_t",
+    "zes_vf_util_engine_exp2_t",
+    "zes_vf_util_engine_exp_t",
+    "zes_vf_util_mem_exp2_t",
+    "zes_vf_util_mem_exp_t",
+])
+
+###############################################################################
+## @brief Defines the deferred experimental definitions on first access
+def __getattr__(name):
+    if name in _deferred:
+        from . import _zes_exp
+        for deferred in _deferred:
+            globals()[deferred] = getattr(_zes_exp, deferred)
+        return globals()[name]
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+###############################################################################
+## @brief Lists the deferred experimental definitions before they are defined
+def __dir__():
+    return sorted(set(globals()) | _deferred)
+
 ###############################################################################
 ## @brief zes device-driver interfaces
 class ZES_DDI:
-    def __init__(self, version : ze_api_version_t):
+    ## @brief Map of table name to (proc-address table getter, table type)
+    _tables = {
+        "Global" : ("zesGetGlobalProcAddrTable", _zes_global_dditable_t),
+        "Device" : ("zesGetDeviceProcAddrTable", _zes_device_dditable_t),
+        "DeviceExp" : ("zesGetDeviceExpProcAddrTable", _zes_device_exp_dditable_t),
+        "Driver" : ("zesGetDriverProcAddrTable", _zes_driver_dditable_t),
+        "DriverExp" : ("zesGetDriverExpProcAddrTable", _zes_driver_exp_dditable_t),
+        "Overclock" : ("zesGetOverclockProcAddrTable", _zes_overclock_dditable_t),
+        "Scheduler" : ("zesGetSchedulerProcAddrTable", _zes_scheduler_dditable_t),
+        "PerformanceFactor" : ("zesGetPerformanceFactorProcAddrTable", _zes_performance_factor_dditable_t),
+        "Power" : ("zesGetPowerProcAddrTable", _zes_power_dditable_t),
+        "Frequency" : ("zesGetFrequencyProcAddrTable", _zes_frequency_dditable_t),
+        "Engine" : ("zesGetEngineProcAddrTable", _zes_engine_dditable_t),
+        "Standby" : ("zesGetStandbyProcAddrTable", _zes_standby_dditable_t),
+        "Firmware" : ("zesGetFirmwareProcAddrTable", _zes_firmware_dditable_t),
+        "FirmwareExp" : ("zesGetFirmwareExpProcAddrTable", _zes_firmware_exp_dditable_t),
+        "Memory" : ("zesGetMemoryProcAddrTable", _zes_memory_dditable_t),
+        "FabricPort" : ("zesGetFabricPortProcAddrTable", _zes_fabric_port_dditable_t),
+        "Temperature" : ("zesGetTemperatureProcAddrTable", _zes_temperature_dditable_t),
+        "Psu" : ("zesGetPsuProcAddrTable", _zes_psu_dditable_t),
+        "Fan" : ("zesGetFanProcAddrTable", _zes_fan_dditable_t),
+        "Led" : ("zesGetLedProcAddrTable", _zes_led_dditable_t),
+        "Ras" : ("zesGetRasProcAddrTable", _zes_ras_dditable_t),
+        "RasExp" : ("zesGetRasExpProcAddrTable", _zes_ras_exp_dditable_t),
+        "Diagnostics" : ("zesGetDiagnosticsProcAddrTable", _zes_diagnostics_dditable_t),
+        "VFManagementExp" : ("zesGetVFManagementExpProcAddrTable", _zes_vf_management_exp_dditable_t),
+    }
+
+    ## @brief Map of function name to (table name, table member, function-pointer type name)
+    _functions = {
+        "zesInit" : ("Global", "pfnInit", "_zesInit_t"),
+        "zesDeviceGetProperties" : ("Device", "pfnGetProperties", "_zesDeviceGetProperties_t"),
+        "zesDeviceGetState" : ("Device", "pfnGetState", "_zesDeviceGetState_t"),
+        "zesDeviceReset" : ("Device", "pfnReset", "_zesDeviceReset_t"),
+        "zesDeviceProcessesGetState" : ("Device", "pfnProcessesGetState", "_zesDeviceProcessesGetState_t"),
+        "zesDevicePciGetProperties" : ("Device", "pfnPciGetProperties", "_zesDevicePciGetProperties_t"),
+        "zesDevicePciGetState" : ("Device", "pfnPciGetState", "_zesDevicePciGetState_t"),
+        "zesDevicePciGetBars" : ("Device", "pfnPciGetBars", "_zesDevicePciGetBars_t"),
+        "zesDevicePciGetStats" : ("Device", "pfnPciGetStats", "_zesDevicePciGetStats_t"),
+        "zesDeviceEnumDiagnosticTestSuites" : ("Device", "pfnEnumDiagnosticTestSuites", "_zesDeviceEnumDiagnosticTestSuites_t"),
+        "zesDeviceEnumEngineGroups" : ("Device", "pfnEnumEngineGroups", "_zesDeviceEnumEngineGroups_t"),
+        "zesDeviceEventRegister" : ("Device", "pfnEventRegister", "_zesDeviceEventRegister_t"),
+        "zesDeviceEnumFabricPorts" : ("Device", "pfnEnumFabricPorts", "_zesDeviceEnumFabricPorts_t"),
+        "zesDeviceEnumFans" : ("Device", "pfnEnumFans", "_zesDeviceEnumFans_t"),
+        "zesDeviceEnumFirmwares" : ("Device", "pfnEnumFirmwares", "_zesDeviceEnumFirmwares_t"),
+        "zesDeviceEnumFrequencyDomains" : ("Device", "pfnEnumFrequencyDomains", "_zesDeviceEnumFrequencyDomains_t"),
+        "zesDeviceEnumLeds" : ("Device", "pfnEnumLeds", "_zesDeviceEnumLeds_t"),
+        "zesDeviceEnumMemoryModules" : ("Device", "pfnEnumMemoryModules", "_zesDeviceEnumMemoryModules_t"),
+        "zesDeviceEnumPerformanceFactorDomains" : ("Device", "pfnEnumPerformanceFactorDomains", "_zesDeviceEnumPerformanceFactorDomains_t"),
+        "zesDeviceEnumPowerDomains" : ("Device", "pfnEnumPowerDomains", "_zesDeviceEnumPowerDomains_t"),
+        "zesDeviceGetCardPowerDomain" : ("Device", "pfnGetCardPowerDomain", "_zesDeviceGetCardPowerDomain_t"),
+        "zesDeviceEnumPsus" : ("Device", "pfnEnumPsus", "_zesDeviceEnumPsus_t"),
+        "zesDeviceEnumRasErrorSets" : ("Device", "pfnEnumRasErrorSets", "_zesDeviceEnumRasErrorSets_t"),
+        "zesDeviceEnumSchedulers" : ("Device", "pfnEnumSchedulers", "_zesDeviceEnumSchedulers_t"),
+        "zesDeviceEnumStandbyDomains" : ("Device", "pfnEnumStandbyDomains", "_zesDeviceEnumStandbyDomains_t"),
+        "zesDeviceEnumTemperatureSensors" : ("Device", "pfnEnumTemperatureSensors", "_zesDeviceEnumTemperatureSensors_t"),
+        "zesDeviceEccAvailable" : ("Device", "pfnEccAvailable", "_zesDeviceEccAvailable_t"),
+        "zesDeviceEccConfigurable" : ("Device", "pfnEccConfigurable", "_zesDeviceEccConfigurable_t"),
+        "zesDeviceGetEccState" : ("Device", "pfnGetEccState", "_zesDeviceGetEccState_t"),
+        "zesDeviceSetEccState" : ("Device", "pfnSetEccState", "_zesDeviceSetEccState_t"),
+        "zesDeviceGet" : ("Device", "pfnGet", "_zesDeviceGet_t"),
+        "zesDeviceSetOverclockWaiver" : ("Device", "pfnSetOverclockWaiver", "_zesDeviceSetOverclockWaiver_t"),
+        "zesDeviceGetOverclockDomains" : ("Device", "pfnGetOverclockDomains", "_zesDeviceGetOverclockDomains_t"),
+        "zesDeviceGetOverclockControls" : ("Device", "pfnGetOverclockControls", "_zesDeviceGetOverclockControls_t"),
+        "zesDeviceResetOverclockSettings" : ("Device", "pfnResetOverclockSettings", "_zesDeviceResetOverclockSettings_t"),
+        "zesDeviceReadOverclockState" : ("Device", "pfnReadOverclockState", "_zesDeviceReadOverclockState_t"),
+        "zesDeviceEnumOverclockDomains" : ("Device", "pfnEnumOverclockDomains", "_zesDeviceEnumOverclockDomains_t"),
+        "zesDeviceResetExt" : ("Device", "pfnResetExt", "_zesDeviceResetExt_t"),
+        "zesDeviceGetSubDevicePropertiesExp" : ("DeviceExp", "pfnGetSubDevicePropertiesExp", "_zesDeviceGetSubDevicePropertiesExp_t"),
+        "zesDeviceEnumActiveVFExp" : ("DeviceExp", "pfnEnumActiveVFExp", "_zesDeviceEnumActiveVFExp_t"),
+        "zesDeviceEnumEnabledVFExp" : ("DeviceExp", "pfnEnumEnabledVFExp", "_zesDeviceEnumEnabledVFExp_t"),
+        "zesDriverEventListen" : ("Driver", "pfnEventListen", "_zesDriverEventListen_t"),
+        "zesDriverEventListenEx" : ("Driver", "pfnEventListenEx", "_zesDriverEventListenEx_t"),
+        "zesDriverGet" : ("Driver", "pfnGet", "_zesDriverGet_t"),
+        "zesDriverGetExtensionProperties" : ("Driver", "pfnGetExtensionProperties", "_zesDriverGetExtensionProperties_t"),
+        "zesDriverGetExtensionFunctionAddress" : ("Driver", "pfnGetExtensionFunctionAddress", "_zesDriverGetExtensionFunctionAddress_t"),
+        "zesDriverGetDeviceByUuidExp" : ("DriverExp", "pfnGetDeviceByUuidExp", "_zesDriverGetDeviceByUuidExp_t"),
+        "zesOverclockGetDomainProperties" : ("Overclock", "pfnGetDomainProperties", "_zesOverclockGetDomainProperties_t"),
+        "zesOverclockGetDomainVFProperties" : ("Overclock", "pfnGetDomainVFProperties", "_zesOverclockGetDomainVFProperties_t"),
+        "zesOverclockGetDomainControlProperties" : ("Overclock", "pfnGetDomainControlProperties", "_zesOverclockGetDomainControlProperties_t"),
+        "zesOverclockGetControlCurrentValue" : ("Overclock", "pfnGetControlCurrentValue", "_zesOverclockGetControlCurrentValue_t"),
+        "zesOverclockGetControlPendingValue" : ("Overclock", "pfnGetControlPendingValue", "_zesOverclockGetControlPendingValue_t"),
+        "zesOverclockSetControlUserValue" : ("Overclock", "pfnSetControlUserValue", "_zesOverclockSetControlUserValue_t"),
+        "zesOverclockGetControlState" : ("Overclock", "pfnGetControlState", "_zesOverclockGetControlState_t"),
+        "zesOverclockGetVFPointValues" : ("Overclock", "pfnGetVFPointValues", "_zesOverclockGetVFPointValues_t"),
+        "zesOverclockSetVFPointValues" : ("Overclock", "pfnSetVFPointValues", "_zesOverclockSetVFPointValues_t"),
+        "zesSchedulerGetProperties" : ("Scheduler", "pfnGetProperties", "_zesSchedulerGetProperties_t"),
+        "zesSchedulerGetCurrentMode" : ("Scheduler", "pfnGetCurrentMode", "_zesSchedulerGetCurrentMode_t"),
+        "zesSchedulerGetTimeoutModeProperties" : ("Scheduler", "pfnGetTimeoutModeProperties", "_zesSchedulerGetTimeoutModeProperties_t"),
+        "zesSchedulerGetTimesliceModeProperties" : ("Scheduler", "pfnGetTimesliceModeProperties", "_zesSchedulerGetTimesliceModeProperties_t"),
+        "zesSchedulerSetTimeoutMode" : ("Scheduler", "pfnSetTimeoutMode", "_zesSchedulerSetTimeoutMode_t"),
+        "zesSchedulerSetTimesliceMode" : ("Scheduler", "pfnSetTimesliceMode", "_zesSchedulerSetTimesliceMode_t"),
+        "zesSchedulerSetExclusiveMode" : ("Scheduler", "pfnSetExclusiveMode", "_zesSchedulerSetExclusiveMode_t"),
+        "zesSchedulerSetComputeUnitDebugMode" : ("Scheduler", "pfnSetComputeUnitDebugMode", "_zesSchedulerSetComputeUnitDebugMode_t"),
+        "zesPerformanceFactorGetProperties" : ("PerformanceFactor", "pfnGetProperties", "_zesPerformanceFactorGetProperties_t"),
+        "zesPerformanceFactorGetConfig" : ("PerformanceFactor", "pfnGetConfig", "_zesPerformanceFactorGetConfig_t"),
+        "zesPerformanceFactorSetConfig" : ("PerformanceFactor", "pfnSetConfig", "_zesPerformanceFactorSetConfig_t"),
+        "zesPowerGetProperties" : ("Power", "pfnGetProperties", "_zesPowerGetProperties_t"),
+        "zesPowerGetEnergyCounter" : ("Power", "pfnGetEnergyCounter", "_zesPowerGetEnergyCounter_t"),
+        "zesPowerGetLimits" : ("Power", "pfnGetLimits", "_zesPowerGetLimits_t"),
+        "zesPowerSetLimits" : ("Power", "pfnSetLimits", "_zesPowerSetLimits_t"),
+        "zesPowerGetEnergyThreshold" : ("Power", "pfnGetEnergyThreshold", "_zesPowerGetEnergyThreshold_t"),
+        "zesPowerSetEnergyThreshold" : ("Power", "pfnSetEnergyThreshold", "_zesPowerSetEnergyThreshold_t"),
+        "zesPowerGetLimitsExt" : ("Power", "pfnGetLimitsExt", "_zesPowerGetLimitsExt_t"),
+        "zesPowerSetLimitsExt" : ("Power", "pfnSetLimitsExt", "_zesPowerSetLimitsExt_t"),
+        "zesFrequencyGetProperties" : ("Frequency", "pfnGetProperties", "_zesFrequencyGetProperties_t"),
+        "zesFrequencyGetAvailableClocks" : ("Frequency", "pfnGetAvailableClocks", "_zesFrequencyGetAvailableClocks_t"),
+        "zesFrequencyGetRange" : ("Frequency", "pfnGetRange", "_zesFrequencyGetRange_t"),
+        "zesFrequencySetRange" : ("Frequency", "pfnSetRange", "_zesFrequencySetRange_t"),
+        "zesFrequencyGetState" : ("Frequency", "pfnGetState", "_zesFrequencyGetState_t"),
+        "zesFrequencyGetThrottleTime" : ("Frequency", "pfnGetThrottleTime", "_zesFrequencyGetThrottleTime_t"),
+        "zesFrequencyOcGetCapabilities" : ("Frequency", "pfnOcGetCapabilities", "_zesFrequencyOcGetCapabilities_t"),
+        "zesFrequencyOcGetFrequencyTarget" : ("Frequency", "pfnOcGetFrequencyTarget", "_zesFrequencyOcGetFrequencyTarget_t"),
+        "zesFrequencyOcSetFrequencyTarget" : ("Frequency", "pfnOcSetFrequencyTarget", "_zesFrequencyOcSetFrequencyTarget_t"),
+        "zesFrequencyOcGetVoltageTarget" : ("Frequency", "pfnOcGetVoltageTarget", "_zesFrequencyOcGetVoltageTarget_t"),
+        "zesFrequencyOcSetVoltageTarget" : ("Frequency", "pfnOcSetVoltageTarget", "_zesFrequencyOcSetVoltageTarget_t"),
+        "zesFrequencyOcSetMode" : ("Frequency", "pfnOcSetMode", "_zesFrequencyOcSetMode_t"),
+        "zesFrequencyOcGetMode" : ("Frequency", "pfnOcGetMode", "_zesFrequencyOcGetMode_t"),
+        "zesFrequencyOcGetIccMax" : ("Frequency", "pfnOcGetIccMax", "_zesFrequencyOcGetIccMax_t"),
+        "zesFrequencyOcSetIccMax" : ("Frequency", "pfnOcSetIccMax", "_zesFrequencyOcSetIccMax_t"),
+        "zesFrequencyOcGetTjMax" : ("Frequency", "pfnOcGetTjMax", "_zesFrequencyOcGetTjMax_t"),
+        "zesFrequencyOcSetTjMax" : ("Frequency", "pfnOcSetTjMax", "_zesFrequencyOcSetTjMax_t"),
+        "zesEngineGetProperties" : ("Engine", "pfnGetProperties", "_zesEngineGetProperties_t"),
+        "zesEngineGetActivity" : ("Engine", "pfnGetActivity", "_zesEngineGetActivity_t"),
+        "zesEngineGetActivityExt" : ("Engine", "pfnGetActivityExt", "_zesEngineGetActivityExt_t"),
+        "zesStandbyGetProperties" : ("Standby", "pfnGetProperties", "_zesStandbyGetProperties_t"),
+        "zesStandbyGetMode" : ("Standby", "pfnGetMode", "_zesStandbyGetMode_t"),
+        "zesStandbySetMode" : ("Standby", "pfnSetMode", "_zesStandbySetMode_t"),
+        "zesFirmwareGetProperties" : ("Firmware", "pfnGetProperties", "_zesFirmwareGetProperties_t"),
+        "zesFirmwareFlash" : ("Firmware", "pfnFlash", "_zesFirmwareFlash_t"),
+        "zesFirmwareGetFlashProgress" : ("Firmware", "pfnGetFlashProgress", "_zesFirmwareGetFlashProgress_t"),
+        "zesFirmwareGetConsoleLogs" : ("Firmware", "pfnGetConsoleLogs", "_zesFirmwareGetConsoleLogs_t"),
+        "zesFirmwareGetSecurityVersionExp" : ("FirmwareExp", "pfnGetSecurityVersionExp", "_zesFirmwareGetSecurityVersionExp_t"),
+        "zesFirmwareSetSecurityVersionExp" : ("FirmwareExp", "pfnSetSecurityVersionExp", "_zesFirmwareSetSecurityVersionExp_t"),
+        "zesMemoryGetProperties" : ("Memory", "pfnGetProperties", "_zesMemoryGetProperties_t"),
+        "zesMemoryGetState" : ("Memory", "pfnGetState", "_zesMemoryGetState_t"),
+        "zesMemoryGetBandwidth" : ("Memory", "pfnGetBandwidth", "_zesMemoryGetBandwidth_t"),
+        "zesFabricPortGetProperties" : ("FabricPort", "pfnGetProperties", "_zesFabricPortGetProperties_t"),
+        "zesFabricPortGetLinkType" : ("FabricPort", "pfnGetLinkType", "_zesFabricPortGetLinkType_t"),
+        "zesFabricPortGetConfig" : ("FabricPort", "pfnGetConfig", "_zesFabricPortGetConfig_t"),
+        "zesFabricPortSetConfig" : ("FabricPort", "pfnSetConfig", "_zesFabricPortSetConfig_t"),
+        "zesFabricPortGetState" : ("FabricPort", "pfnGetState", "_zesFabricPortGetState_t"),
+        "zesFabricPortGetThroughput" : ("FabricPort", "pfnGetThroughput", "_zesFabricPortGetThroughput_t"),
+        "zesFabricPortGetFabricErrorCounters" : ("FabricPort", "pfnGetFabricErrorCounters", "_zesFabricPortGetFabricErrorCounters_t"),
+        "zesFabricPortGetMultiPortThroughput" : ("FabricPort", "pfnGetMultiPortThroughput", "_zesFabricPortGetMultiPortThroughput_t"),
+        "zesTemperatureGetProperties" : ("Temperature", "pfnGetProperties", "_zesTemperatureGetProperties_t"),
+        "zesTemperatureGetConfig" : ("Temperature", "pfnGetConfig", "_zesTemperatureGetConfig_t"),
+        "zesTemperatureSetConfig" : ("Temperature", "pfnSetConfig", "_zesTemperatureSetConfig_t"),
+        "zesTemperatureGetState" : ("Temperature", "pfnGetState", "_zesTemperatureGetState_t"),
+        "zesPsuGetProperties" : ("Psu", "pfnGetProperties", "_zesPsuGetProperties_t"),
+        "zesPsuGetState" : ("Psu", "pfnGetState", "_zesPsuGetState_t"),
+        "zesFanGetProperties" : ("Fan", "pfnGetProperties", "_zesFanGetProperties_t"),
+        "zesFanGetConfig" : ("Fan", "pfnGetConfig", "_zesFanGetConfig_t"),
+        "zesFanSetDefaultMode" : ("Fan", "pfnSetDefaultMode", "_zesFanSetDefaultMode_t"),
+        "zesFanSetFixedSpeedMode" : ("Fan", "pfnSetFixedSpeedMode", "_zesFanSetFixedSpeedMode_t"),
+        "zesFanSetSpeedTableMode" : ("Fan", "pfnSetSpeedTableMode", "_zesFanSetSpeedTableMode_t"),
+        "zesFanGetState" : ("Fan", "pfnGetState", "_zesFanGetState_t"),
+        "zesLedGetProperties" : ("Led", "pfnGetProperties", "_zesLedGetProperties_t"),
+        "zesLedGetState" : ("Led", "pfnGetState", "_zesLedGetState_t"),
+        "zesLedSetState" : ("Led", "pfnSetState", "_zesLedSetState_t"),
+        "zesLedSetColor" : ("Led", "pfnSetColor", "_zesLedSetColor_t"),
+        "zesRasGetProperties" : ("Ras", "pfnGetProperties", "_zesRasGetProperties_t"),
+        "zesRasGetConfig" : ("Ras", "pfnGetConfig", "_zesRasGetConfig_t"),
+        "zesRasSetConfig" : ("Ras", "pfnSetConfig", "_zesRasSetConfig_t"),
+        "zesRasGetState" : ("Ras", "pfnGetState", "_zesRasGetState_t"),
+        "zesRasGetStateExp" : ("RasExp", "pfnGetStateExp", "_zesRasGetStateExp_t"),
+        "zesRasClearStateExp" : ("RasExp", "pfnClearStateExp", "_zesRasClearStateExp_t"),
+        "zesDiagnosticsGetProperties" : ("Diagnostics", "pfnGetProperties", "_zesDiagnosticsGetProperties_t"),
+        "zesDiagnosticsGetTests" : ("Diagnostics", "pfnGetTests", "_zesDiagnosticsGetTests_t"),
+        "zesDiagnosticsRunTests" : ("Diagnostics", "pfnRunTests", "_zesDiagnosticsRunTests_t"),
+        "zesVFManagementGetVFPropertiesExp" : ("VFManagementExp", "pfnGetVFPropertiesExp", "_zesVFManagementGetVFPropertiesExp_t"),
+        "zesVFManagementGetVFMemoryUtilizationExp" : ("VFManagementExp", "pfnGetVFMemoryUtilizationExp", "_zesVFManagementGetVFMemoryUtilizationExp_t"),
+        "zesVFManagementGetVFEngineUtilizationExp" : ("VFManagementExp", "pfnGetVFEngineUtilizationExp", "_zesVFManagementGetVFEngineUtilizationExp_t"),
+        "zesVFManagementSetVFTelemetryModeExp" : ("VFManagementExp", "pfnSetVFTelemetryModeExp", "_zesVFManagementSetVFTelemetryModeExp_t"),
+        "zesVFManagementSetVFTelemetrySamplingIntervalExp" : ("VFManagementExp", "pfnSetVFTelemetrySamplingIntervalExp", "_zesVFManagementSetVFTelemetrySamplingIntervalExp_t"),
+        "zesVFManagementGetVFCapabilitiesExp" : ("VFManagementExp", "pfnGetVFCapabilitiesExp", "_zesVFManagementGetVFCapabilitiesExp_t"),
+        "zesVFManagementGetVFMemoryUtilizationExp2" : ("VFManagementExp", "pfnGetVFMemoryUtilizationExp2", "_zesVFManagementGetVFMemoryUtilizationExp2_t"),
+        "zesVFManagementGetVFEngineUtilizationExp2" : ("VFManagementExp", "pfnGetVFEngineUtilizationExp2", "_zesVFManagementGetVFEngineUtilizationExp2_t"),
+        "zesVFManagementGetVFCapabilitiesExp2" : ("VFManagementExp", "pfnGetVFCapabilitiesExp2", "_zesVFManagementGetVFCapabilitiesExp2_t"),
+    }
+
+    _functype = staticmethod(_get_functype)
+
+    def __init__(self, version : ze_api_version_t, lazy : bool = False, strict : bool = True):
         # load the ze_loader library
-        if "Windows" == platform.uname()[0]:
+        if "win32" == sys.platform:
             self.__dll = WinDLL("ze_loader.dll")
         else:
             self.__dll = CDLL("ze_loader.so")
+        self.__version = version
+        self.__strict = strict
 
         # fill the ddi tables
         self.__dditable = _zes_dditable_t()
+        self.__loaded = {}
+        self.__results = {}
+        self.__fastcall = None
 
-        # call driver to get function pointers
-        _Global = _zes_global_dditable_t()
-        r = ze_result_v(self.__dll.zesGetGlobalProcAddrTable(version, byref(_Global)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Global = _Global
-
-        # attach function interface to function address
-        self.zesInit = _zesInit_t(self.__dditable.Global.pfnInit)
-
-        # call driver to get function pointers
-        _Device = _zes_device_dditable_t()
-        r = ze_result_v(self.__dll.zesGetDeviceProcAddrTable(version, byref(_Device)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Device = _Device
-
-        # attach function interface to function address
-        self.zesDeviceGetProperties = _zesDeviceGetProperties_t(self.__dditable.Device.pfnGetProperties)
-        self.zesDeviceGetState = _zesDeviceGetState_t(self.__dditable.Device.pfnGetState)
-        self.zesDeviceReset = _zesDeviceReset_t(self.__dditable.Device.pfnReset)
-        self.zesDeviceProcessesGetState = _zesDeviceProcessesGetState_t(self.__dditable.Device.pfnProcessesGetState)
-        self.zesDevicePciGetProperties = _zesDevicePciGetProperties_t(self.__dditable.Device.pfnPciGetProperties)
-        self.zesDevicePciGetState = _zesDevicePciGetState_t(self.__dditable.Device.pfnPciGetState)
-        self.zesDevicePciGetBars = _zesDevicePciGetBars_t(self.__dditable.Device.pfnPciGetBars)
-        self.zesDevicePciGetStats = _zesDevicePciGetStats_t(self.__dditable.Device.pfnPciGetStats)
-        self.zesDeviceEnumDiagnosticTestSuites = _zesDeviceEnumDiagnosticTestSuites_t(self.__dditable.Device.pfnEnumDiagnosticTestSuites)
-        self.zesDeviceEnumEngineGroups = _zesDeviceEnumEngineGroups_t(self.__dditable.Device.pfnEnumEngineGroups)
-        self.zesDeviceEventRegister = _zesDeviceEventRegister_t(self.__dditable.Device.pfnEventRegister)
-        self.zesDeviceEnumFabricPorts = _zesDeviceEnumFabricPorts_t(self.__dditable.Device.pfnEnumFabricPorts)
-        self.zesDeviceEnumFans = _zesDeviceEnumFans_t(self.__dditable.Device.pfnEnumFans)
-        self.zesDeviceEnumFirmwares = _zesDeviceEnumFirmwares_t(self.__dditable.Device.pfnEnumFirmwares)
-        self.zesDeviceEnumFrequencyDomains = _zesDeviceEnumFrequencyDomains_t(self.__dditable.Device.pfnEnumFrequencyDomains)
-        self.zesDeviceEnumLeds = _zesDeviceEnumLeds_t(self.__dditable.Device.pfnEnumLeds)
-        self.zesDeviceEnumMemoryModules = _zesDeviceEnumMemoryModules_t(self.__dditable.Device.pfnEnumMemoryModules)
-        self.zesDeviceEnumPerformanceFactorDomains = _zesDeviceEnumPerformanceFactorDomains_t(self.__dditable.Device.pfnEnumPerformanceFactorDomains)
-        self.zesDeviceEnumPowerDomains = _zesDeviceEnumPowerDomains_t(self.__dditable.Device.pfnEnumPowerDomains)
-        self.zesDeviceGetCardPowerDomain = _zesDeviceGetCardPowerDomain_t(self.__dditable.Device.pfnGetCardPowerDomain)
-        self.zesDeviceEnumPsus = _zesDeviceEnumPsus_t(self.__dditable.Device.pfnEnumPsus)
-        self.zesDeviceEnumRasErrorSets = _zesDeviceEnumRasErrorSets_t(self.__dditable.Device.pfnEnumRasErrorSets)
-        self.zesDeviceEnumSchedulers = _zesDeviceEnumSchedulers_t(self.__dditable.Device.pfnEnumSchedulers)
-        self.zesDeviceEnumStandbyDomains = _zesDeviceEnumStandbyDomains_t(self.__dditable.Device.pfnEnumStandbyDomains)
-        self.zesDeviceEnumTemperatureSensors = _zesDeviceEnumTemperatureSensors_t(self.__dditable.Device.pfnEnumTemperatureSensors)
-        self.zesDeviceEccAvailable = _zesDeviceEccAvailable_t(self.__dditable.Device.pfnEccAvailable)
-        self.zesDeviceEccConfigurable = _zesDeviceEccConfigurable_t(self.__dditable.Device.pfnEccConfigurable)
-        self.zesDeviceGetEccState = _zesDeviceGetEccState_t(self.__dditable.Device.pfnGetEccState)
-        self.zesDeviceSetEccState = _zesDeviceSetEccState_t(self.__dditable.Device.pfnSetEccState)
-        self.zesDeviceGet = _zesDeviceGet_t(self.__dditable.Device.pfnGet)
-        self.zesDeviceSetOverclockWaiver = _zesDeviceSetOverclockWaiver_t(self.__dditable.Device.pfnSetOverclockWaiver)
-        self.zesDeviceGetOverclockDomains = _zesDeviceGetOverclockDomains_t(self.__dditable.Device.pfnGetOverclockDomains)
-        self.zesDeviceGetOverclockControls = _zesDeviceGetOverclockControls_t(self.__dditable.Device.pfnGetOverclockControls)
-        self.zesDeviceResetOverclockSettings = _zesDeviceResetOverclockSettings_t(self.__dditable.Device.pfnResetOverclockSettings)
-        self.zesDeviceReadOverclockState = _zesDeviceReadOverclockState_t(self.__dditable.Device.pfnReadOverclockState)
-        self.zesDeviceEnumOverclockDomains = _zesDeviceEnumOverclockDomains_t(self.__dditable.Device.pfnEnumOverclockDomains)
-        self.zesDeviceResetExt = _zesDeviceResetExt_t(self.__dditable.Device.pfnResetExt)
-
-        # call driver to get function pointers
-        _DeviceExp = _zes_device_exp_dditable_t()
-        r = ze_result_v(self.__dll.zesGetDeviceExpProcAddrTable(version, byref(_DeviceExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.DeviceExp = _DeviceExp
-
-        # attach function interface to function address
-        self.zesDeviceGetSubDevicePropertiesExp = _zesDeviceGetSubDevicePropertiesExp_t(self.__dditable.DeviceExp.pfnGetSubDevicePropertiesExp)
-        self.zesDeviceEnumActiveVFExp = _zesDeviceEnumActiveVFExp_t(self.__dditable.DeviceExp.pfnEnumActiveVFExp)
-        self.zesDeviceEnumEnabledVFExp = _zesDeviceEnumEnabledVFExp_t(self.__dditable.DeviceExp.pfnEnumEnabledVFExp)
-
-        # call driver to get function pointers
-        _Driver = _zes_driver_dditable_t()
-        r = ze_result_v(self.__dll.zesGetDriverProcAddrTable(version, byref(_Driver)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Driver = _Driver
-
-        # attach function interface to function address
-        self.zesDriverEventListen = _zesDriverEventListen_t(self.__dditable.Driver.pfnEventListen)
-        self.zesDriverEventListenEx = _zesDriverEventListenEx_t(self.__dditable.Driver.pfnEventListenEx)
-        self.zesDriverGet = _zesDriverGet_t(self.__dditable.Driver.pfnGet)
-        self.zesDriverGetExtensionProperties = _zesDriverGetExtensionProperties_t(self.__dditable.Driver.pfnGetExtensionProperties)
-        self.zesDriverGetExtensionFunctionAddress = _zesDriverGetExtensionFunctionAddress_t(self.__dditable.Driver.pfnGetExtensionFunctionAddress)
-
-        # call driver to get function pointers
-        _DriverExp = _zes_driver_exp_dditable_t()
-        r = ze_result_v(self.__dll.zesGetDriverExpProcAddrTable(version, byref(_DriverExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.DriverExp = _DriverExp
-
-        # attach function interface to function address
-        self.zesDriverGetDeviceByUuidExp = _zesDriverGetDeviceByUuidExp_t(self.__dditable.DriverExp.pfnGetDeviceByUuidExp)
-
-        # call driver to get function pointers
-        _Overclock = _zes_overclock_dditable_t()
-        r = ze_result_v(self.__dll.zesGetOverclockProcAddrTable(version, byref(_Overclock)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Overclock = _Overclock
-
-        # attach function interface to function address
-        self.zesOverclockGetDomainProperties = _zesOverclockGetDomainProperties_t(self.__dditable.Overclock.pfnGetDomainProperties)
-        self.zesOverclockGetDomainVFProperties = _zesOverclockGetDomainVFProperties_t(self.__dditable.Overclock.pfnGetDomainVFProperties)
-        self.zesOverclockGetDomainControlProperties = _zesOverclockGetDomainControlProperties_t(self.__dditable.Overclock.pfnGetDomainControlProperties)
-        self.zesOverclockGetControlCurrentValue = _zesOverclockGetControlCurrentValue_t(self.__dditable.Overclock.pfnGetControlCurrentValue)
-        self.zesOverclockGetControlPendingValue = _zesOverclockGetControlPendingValue_t(self.__dditable.Overclock.pfnGetControlPendingValue)
-        self.zesOverclockSetControlUserValue = _zesOverclockSetControlUserValue_t(self.__dditable.Overclock.pfnSetControlUserValue)
-        self.zesOverclockGetControlState = _zesOverclockGetControlState_t(self.__dditable.Overclock.pfnGetControlState)
-        self.zesOverclockGetVFPointValues = _zesOverclockGetVFPointValues_t(self.__dditable.Overclock.pfnGetVFPointValues)
-        self.zesOverclockSetVFPointValues = _zesOverclockSetVFPointValues_t(self.__dditable.Overclock.pfnSetVFPointValues)
-
-        # call driver to get function pointers
-        _Scheduler = _zes_scheduler_dditable_t()
-        r = ze_result_v(self.__dll.zesGetSchedulerProcAddrTable(version, byref(_Scheduler)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Scheduler = _Scheduler
-
-        # attach function interface to function address
-        self.zesSchedulerGetProperties = _zesSchedulerGetProperties_t(self.__dditable.Scheduler.pfnGetProperties)
-        self.zesSchedulerGetCurrentMode = _zesSchedulerGetCurrentMode_t(self.__dditable.Scheduler.pfnGetCurrentMode)
-        self.zesSchedulerGetTimeoutModeProperties = _zesSchedulerGetTimeoutModeProperties_t(self.__dditable.Scheduler.pfnGetTimeoutModeProperties)
-        self.zesSchedulerGetTimesliceModeProperties = _zesSchedulerGetTimesliceModeProperties_t(self.__dditable.Scheduler.pfnGetTimesliceModeProperties)
-        self.zesSchedulerSetTimeoutMode = _zesSchedulerSetTimeoutMode_t(self.__dditable.Scheduler.pfnSetTimeoutMode)
-        self.zesSchedulerSetTimesliceMode = _zesSchedulerSetTimesliceMode_t(self.__dditable.Scheduler.pfnSetTimesliceMode)
-        self.zesSchedulerSetExclusiveMode = _zesSchedulerSetExclusiveMode_t(self.__dditable.Scheduler.pfnSetExclusiveMode)
-        self.zesSchedulerSetComputeUnitDebugMode = _zesSchedulerSetComputeUnitDebugMode_t(self.__dditable.Scheduler.pfnSetComputeUnitDebugMode)
-
-        # call driver to get function pointers
-        _PerformanceFactor = _zes_performance_factor_dditable_t()
-        r = ze_result_v(self.__dll.zesGetPerformanceFactorProcAddrTable(version, byref(_PerformanceFactor)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.PerformanceFactor = _PerformanceFactor
-
-        # attach function interface to function address
-        self.zesPerformanceFactorGetProperties = _zesPerformanceFactorGetProperties_t(self.__dditable.PerformanceFactor.pfnGetProperties)
-        self.zesPerformanceFactorGetConfig = _zesPerformanceFactorGetConfig_t(self.__dditable.PerformanceFactor.pfnGetConfig)
-        self.zesPerformanceFactorSetConfig = _zesPerformanceFactorSetConfig_t(self.__dditable.PerformanceFactor.pfnSetConfig)
-
-        # call driver to get function pointers
-        _Power = _zes_power_dditable_t()
-        r = ze_result_v(self.__dll.zesGetPowerProcAddrTable(version, byref(_Power)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Power = _Power
-
-        # attach function interface to function address
-        self.zesPowerGetProperties = _zesPowerGetProperties_t(self.__dditable.Power.pfnGetProperties)
-        self.zesPowerGetEnergyCounter = _zesPowerGetEnergyCounter_t(self.__dditable.Power.pfnGetEnergyCounter)
-        self.zesPowerGetLimits = _zesPowerGetLimits_t(self.__dditable.Power.pfnGetLimits)
-        self.zesPowerSetLimits = _zesPowerSetLimits_t(self.__dditable.Power.pfnSetLimits)
-        self.zesPowerGetEnergyThreshold = _zesPowerGetEnergyThreshold_t(self.__dditable.Power.pfnGetEnergyThreshold)
-        self.zesPowerSetEnergyThreshold = _zesPowerSetEnergyThreshold_t(self.__dditable.Power.pfnSetEnergyThreshold)
-        self.zesPowerGetLimitsExt = _zesPowerGetLimitsExt_t(self.__dditable.Power.pfnGetLimitsExt)
-        self.zesPowerSetLimitsExt = _zesPowerSetLimitsExt_t(self.__dditable.Power.pfnSetLimitsExt)
-
-        # call driver to get function pointers
-        _Frequency = _zes_frequency_dditable_t()
-        r = ze_result_v(self.__dll.zesGetFrequencyProcAddrTable(version, byref(_Frequency)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Frequency = _Frequency
-
-        # attach function interface to function address
-        self.zesFrequencyGetProperties = _zesFrequencyGetProperties_t(self.__dditable.Frequency.pfnGetProperties)
-        self.zesFrequencyGetAvailableClocks = _zesFrequencyGetAvailableClocks_t(self.__dditable.Frequency.pfnGetAvailableClocks)
-        self.zesFrequencyGetRange = _zesFrequencyGetRange_t(self.__dditable.Frequency.pfnGetRange)
-        self.zesFrequencySetRange = _zesFrequencySetRange_t(self.__dditable.Frequency.pfnSetRange)
-        self.zesFrequencyGetState = _zesFrequencyGetState_t(self.__dditable.Frequency.pfnGetState)
-        self.zesFrequencyGetThrottleTime = _zesFrequencyGetThrottleTime_t(self.__dditable.Frequency.pfnGetThrottleTime)
-        self.zesFrequencyOcGetCapabilities = _zesFrequencyOcGetCapabilities_t(self.__dditable.Frequency.pfnOcGetCapabilities)
-        self.zesFrequencyOcGetFrequencyTarget = _zesFrequencyOcGetFrequencyTarget_t(self.__dditable.Frequency.pfnOcGetFrequencyTarget)
-        self.zesFrequencyOcSetFrequencyTarget = _zesFrequencyOcSetFrequencyTarget_t(self.__dditable.Frequency.pfnOcSetFrequencyTarget)
-        self.zesFrequencyOcGetVoltageTarget = _zesFrequencyOcGetVoltageTarget_t(self.__dditable.Frequency.pfnOcGetVoltageTarget)
-        self.zesFrequencyOcSetVoltageTarget = _zesFrequencyOcSetVoltageTarget_t(self.__dditable.Frequency.pfnOcSetVoltageTarget)
-        self.zesFrequencyOcSetMode = _zesFrequencyOcSetMode_t(self.__dditable.Frequency.pfnOcSetMode)
-        self.zesFrequencyOcGetMode = _zesFrequencyOcGetMode_t(self.__dditable.Frequency.pfnOcGetMode)
-        self.zesFrequencyOcGetIccMax = _zesFrequencyOcGetIccMax_t(self.__dditable.Frequency.pfnOcGetIccMax)
-        self.zesFrequencyOcSetIccMax = _zesFrequencyOcSetIccMax_t(self.__dditable.Frequency.pfnOcSetIccMax)
-        self.zesFrequencyOcGetTjMax = _zesFrequencyOcGetTjMax_t(self.__dditable.Frequency.pfnOcGetTjMax)
-        self.zesFrequencyOcSetTjMax = _zesFrequencyOcSetTjMax_t(self.__dditable.Frequency.pfnOcSetTjMax)
-
-        # call driver to get function pointers
-        _Engine = _zes_engine_dditable_t()
-        r = ze_result_v(self.__dll.zesGetEngineProcAddrTable(version, byref(_Engine)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Engine = _Engine
-
-        # attach function interface to function address
-        self.zesEngineGetProperties = _zesEngineGetProperties_t(self.__dditable.Engine.pfnGetProperties)
-        self.zesEngineGetActivity = _zesEngineGetActivity_t(self.__dditable.Engine.pfnGetActivity)
-        self.zesEngineGetActivityExt = _zesEngineGetActivityExt_t(self.__dditable.Engine.pfnGetActivityExt)
-
-        # call driver to get function pointers
-        _Standby = _zes_standby_dditable_t()
-        r = ze_result_v(self.__dll.zesGetStandbyProcAddrTable(version, byref(_Standby)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Standby = _Standby
-
-        # attach function interface to function address
-        self.zesStandbyGetProperties = _zesStandbyGetProperties_t(self.__dditable.Standby.pfnGetProperties)
-        self.zesStandbyGetMode = _zesStandbyGetMode_t(self.__dditable.Standby.pfnGetMode)
-        self.zesStandbySetMode = _zesStandbySetMode_t(self.__dditable.Standby.pfnSetMode)
-
-        # call driver to get function pointers
-        _Firmware = _zes_firmware_dditable_t()
-        r = ze_result_v(self.__dll.zesGetFirmwareProcAddrTable(version, byref(_Firmware)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Firmware = _Firmware
-
-        # attach function interface to function address
-        self.zesFirmwareGetProperties = _zesFirmwareGetProperties_t(self.__dditable.Firmware.pfnGetProperties)
-        self.zesFirmwareFlash = _zesFirmwareFlash_t(self.__dditable.Firmware.pfnFlash)
-        self.zesFirmwareGetFlashProgress = _zesFirmwareGetFlashProgress_t(self.__dditable.Firmware.pfnGetFlashProgress)
-        self.zesFirmwareGetConsoleLogs = _zesFirmwareGetConsoleLogs_t(self.__dditable.Firmware.pfnGetConsoleLogs)
-
-        # call driver to get function pointers
-        _FirmwareExp = _zes_firmware_exp_dditable_t()
-        r = ze_result_v(self.__dll.zesGetFirmwareExpProcAddrTable(version, byref(_FirmwareExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.FirmwareExp = _FirmwareExp
-
-        # attach function interface to function address
-        self.zesFirmwareGetSecurityVersionExp = _zesFirmwareGetSecurityVersionExp_t(self.__dditable.FirmwareExp.pfnGetSecurityVersionExp)
-        self.zesFirmwareSetSecurityVersionExp = _zesFirmwareSetSecurityVersionExp_t(self.__dditable.FirmwareExp.pfnSetSecurityVersionExp)
-
-        # call driver to get function pointers
-        _Memory = _zes_memory_dditable_t()
-        r = ze_result_v(self.__dll.zesGetMemoryProcAddrTable(version, byref(_Memory)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Memory = _Memory
-
-        # attach function interface to function address
-        self.zesMemoryGetProperties = _zesMemoryGetProperties_t(self.__dditable.Memory.pfnGetProperties)
-        self.zesMemoryGetState = _zesMemoryGetState_t(self.__dditable.Memory.pfnGetState)
-        self.zesMemoryGetBandwidth = _zesMemoryGetBandwidth_t(self.__dditable.Memory.pfnGetBandwidth)
-
-        # call driver to get function pointers
-        _FabricPort = _zes_fabric_port_dditable_t()
-        r = ze_result_v(self.__dll.zesGetFabricPortProcAddrTable(version, byref(_FabricPort)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.FabricPort = _FabricPort
-
-        # attach function interface to function address
-        self.zesFabricPortGetProperties = _zesFabricPortGetProperties_t(self.__dditable.FabricPort.pfnGetProperties)
-        self.zesFabricPortGetLinkType = _zesFabricPortGetLinkType_t(self.__dditable.FabricPort.pfnGetLinkType)
-        self.zesFabricPortGetConfig = _zesFabricPortGetConfig_t(self.__dditable.FabricPort.pfnGetConfig)
-        self.zesFabricPortSetConfig = _zesFabricPortSetConfig_t(self.__dditable.FabricPort.pfnSetConfig)
-        self.zesFabricPortGetState = _zesFabricPortGetState_t(self.__dditable.FabricPort.pfnGetState)
-        self.zesFabricPortGetThroughput = _zesFabricPortGetThroughput_t(self.__dditable.FabricPort.pfnGetThroughput)
-        self.zesFabricPortGetFabricErrorCounters = _zesFabricPortGetFabricErrorCounters_t(self.__dditable.FabricPort.pfnGetFabricErrorCounters)
-        self.zesFabricPortGetMultiPortThroughput = _zesFabricPortGetMultiPortThroughput_t(self.__dditable.FabricPort.pfnGetMultiPortThroughput)
-
-        # call driver to get function pointers
-        _Temperature = _zes_temperature_dditable_t()
-        r = ze_result_v(self.__dll.zesGetTemperatureProcAddrTable(version, byref(_Temperature)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Temperature = _Temperature
-
-        # attach function interface to function address
-        self.zesTemperatureGetProperties = _zesTemperatureGetProperties_t(self.__dditable.Temperature.pfnGetProperties)
-        self.zesTemperatureGetConfig = _zesTemperatureGetConfig_t(self.__dditable.Temperature.pfnGetConfig)
-        self.zesTemperatureSetConfig = _zesTemperatureSetConfig_t(self.__dditable.Temperature.pfnSetConfig)
-        self.zesTemperatureGetState = _zesTemperatureGetState_t(self.__dditable.Temperature.pfnGetState)
-
-        # call driver to get function pointers
-        _Psu = _zes_psu_dditable_t()
-        r = ze_result_v(self.__dll.zesGetPsuProcAddrTable(version, byref(_Psu)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Psu = _Psu
-
-        # attach function interface to function address
-        self.zesPsuGetProperties = _zesPsuGetProperties_t(self.__dditable.Psu.pfnGetProperties)
-        self.zesPsuGetState = _zesPsuGetState_t(self.__dditable.Psu.pfnGetState)
-
-        # call driver to get function pointers
-        _Fan = _zes_fan_dditable_t()
-        r = ze_result_v(self.__dll.zesGetFanProcAddrTable(version, byref(_Fan)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Fan = _Fan
-
-        # attach function interface to function address
-        self.zesFanGetProperties = _zesFanGetProperties_t(self.__dditable.Fan.pfnGetProperties)
-        self.zesFanGetConfig = _zesFanGetConfig_t(self.__dditable.Fan.pfnGetConfig)
-        self.zesFanSetDefaultMode = _zesFanSetDefaultMode_t(self.__dditable.Fan.pfnSetDefaultMode)
-        self.zesFanSetFixedSpeedMode = _zesFanSetFixedSpeedMode_t(self.__dditable.Fan.pfnSetFixedSpeedMode)
-        self.zesFanSetSpeedTableMode = _zesFanSetSpeedTableMode_t(self.__dditable.Fan.pfnSetSpeedTableMode)
-        self.zesFanGetState = _zesFanGetState_t(self.__dditable.Fan.pfnGetState)
-
-        # call driver to get function pointers
-        _Led = _zes_led_dditable_t()
-        r = ze_result_v(self.__dll.zesGetLedProcAddrTable(version, byref(_Led)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Led = _Led
-
-        # attach function interface to function address
-        self.zesLedGetProperties = _zesLedGetProperties_t(self.__dditable.Led.pfnGetProperties)
-        self.zesLedGetState = _zesLedGetState_t(self.__dditable.Led.pfnGetState)
-        self.zesLedSetState = _zesLedSetState_t(self.__dditable.Led.pfnSetState)
-        self.zesLedSetColor = _zesLedSetColor_t(self.__dditable.Led.pfnSetColor)
-
-        # call driver to get function pointers
-        _Ras = _zes_ras_dditable_t()
-        r = ze_result_v(self.__dll.zesGetRasProcAddrTable(version, byref(_Ras)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Ras = _Ras
-
-        # attach function interface to function address
-        self.zesRasGetProperties = _zesRasGetProperties_t(self.__dditable.Ras.pfnGetProperties)
-        self.zesRasGetConfig = _zesRasGetConfig_t(self.__dditable.Ras.pfnGetConfig)
-        self.zesRasSetConfig = _zesRasSetConfig_t(self.__dditable.Ras.pfnSetConfig)
-        self.zesRasGetState = _zesRasGetState_t(self.__dditable.Ras.pfnGetState)
-
-        # call driver to get function pointers
-        _RasExp = _zes_ras_exp_dditable_t()
-        r = ze_result_v(self.__dll.zesGetRasExpProcAddrTable(version, byref(_RasExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.RasExp = _RasExp
-
-        # attach function interface to function address
-        self.zesRasGetStateExp = _zesRasGetStateExp_t(self.__dditable.RasExp.pfnGetStateExp)
-        self.zesRasClearStateExp = _zesRasClearStateExp_t(self.__dditable.RasExp.pfnClearStateExp)
-
-        # call driver to get function pointers
-        _Diagnostics = _zes_diagnostics_dditable_t()
-        r = ze_result_v(self.__dll.zesGetDiagnosticsProcAddrTable(version, byref(_Diagnostics)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Diagnostics = _Diagnostics
-
-        # attach function interface to function address
-        self.zesDiagnosticsGetProperties = _zesDiagnosticsGetProperties_t(self.__dditable.Diagnostics.pfnGetProperties)
-        self.zesDiagnosticsGetTests = _zesDiagnosticsGetTests_t(self.__dditable.Diagnostics.pfnGetTests)
-        self.zesDiagnosticsRunTests = _zesDiagnosticsRunTests_t(self.__dditable.Diagnostics.pfnRunTests)
-
-        # call driver to get function pointers
-        _VFManagementExp = _zes_vf_management_exp_dditable_t()
-        r = ze_result_v(self.__dll.zesGetVFManagementExpProcAddrTable(version, byref(_VFManagementExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.VFManagementExp = _VFManagementExp
-
-        # attach function interface to function address
-        self.zesVFManagementGetVFPropertiesExp = _zesVFManagementGetVFPropertiesExp_t(self.__dditable.VFManagementExp.pfnGetVFPropertiesExp)
-        self.zesVFManagementGetVFMemoryUtilizationExp = _zesVFManagementGetVFMemoryUtilizationExp_t(self.__dditable.VFManagementExp.pfnGetVFMemoryUtilizationExp)
-        self.zesVFManagementGetVFEngineUtilizationExp = _zesVFManagementGetVFEngineUtilizationExp_t(self.__dditable.VFManagementExp.pfnGetVFEngineUtilizationExp)
-        self.zesVFManagementSetVFTelemetryModeExp = _zesVFManagementSetVFTelemetryModeExp_t(self.__dditable.VFManagementExp.pfnSetVFTelemetryModeExp)
-        self.zesVFManagementSetVFTelemetrySamplingIntervalExp = _zesVFManagementSetVFTelemetrySamplingIntervalExp_t(self.__dditable.VFManagementExp.pfnSetVFTelemetrySamplingIntervalExp)
-        self.zesVFManagementGetVFCapabilitiesExp = _zesVFManagementGetVFCapabilitiesExp_t(self.__dditable.VFManagementExp.pfnGetVFCapabilitiesExp)
-        self.zesVFManagementGetVFMemoryUtilizationExp2 = _zesVFManagementGetVFMemoryUtilizationExp2_t(self.__dditable.VFManagementExp.pfnGetVFMemoryUtilizationExp2)
-        self.zesVFManagementGetVFEngineUtilizationExp2 = _zesVFManagementGetVFEngineUtilizationExp2_t(self.__dditable.VFManagementExp.pfnGetVFEngineUtilizationExp2)
-        self.zesVFManagementGetVFCapabilitiesExp2 = _zesVFManagementGetVFCapabilitiesExp2_t(self.__dditable.VFManagementExp.pfnGetVFCapabilitiesExp2)
+        # in lazy mode, tables are fetched and functions bound on first access
+        if not lazy:
+            for name in self._functions:
+                getattr(self, name)
 
         # success!
+
+    ## @brief Returns the named ddi table, calling the driver to fill it on first use;
+    ##        in non-strict mode, returns None if the driver does not provide the table
+    def _get_table(self, table):
+        if table not in self.__loaded:
+            # call driver to get function pointers
+            getter, tabletype = self._tables[table]
+            _table = tabletype()
+            try:
+                r = ze_result_v(getattr(self.__dll, getter)(self.__version, byref(_table)))
+            except AttributeError:
+                if self.__strict:
+                    raise
+                r = ze_result_v.ERROR_UNSUPPORTED_FEATURE
+            self.__results[table] = r
+            if r != ze_result_v.SUCCESS:
+                if self.__strict:
+                    raise Exception(r)
+                self.__loaded[table] = None
+            else:
+                setattr(self.__dditable, table, _table)
+                self.__loaded[table] = getattr(self.__dditable, table)
+        return self.__loaded[table]
+
+    ## @brief Fast-call view of this interface; see ::ZE_FASTCALL
+    @property
+    def fastcall(self):
+        if self.__fastcall is None:
+            self.__fastcall = ZE_FASTCALL(self)
+        return self.__fastcall
+
+    ## @brief Map of table name to ddi table, or None if not provided by the driver
+    @property
+    def tables(self):
+        return {table : self._get_table(table) for table in self._tables}
+
+    ## @brief Set of table names provided by the driver
+    @property
+    def supported_tables(self):
+        return set(table for table, _table in self.tables.items() if _table is not None)
+
+    ## @brief Returns True if the driver provides the named function
+    def is_supported(self, name):
+        table, pfn, _ = self._functions[name]
+        _table = self._get_table(table)
+        return _table is not None and bool(getattr(_table, pfn))
+
+    ## @brief Binds the named function on first access and caches it on the instance
+    def __getattr__(self, name):
+        try:
+            table, pfn, functype = self._functions[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+        _table = self._get_table(table)
+        if _table is None or not getattr(_table, pfn):
+            # calling a function the driver did not provide raises instead of crashing
+            result = self.__results.get(table, ze_result_v.ERROR_UNSUPPORTED_FEATURE)
+            if result == ze_result_v.SUCCESS:
+                result = ze_result_v.ERROR_UNSUPPORTED_FEATURE
+            def func(*args):
+                raise UnsupportedFunctionError(name, table, result)
+        else:
+            # attach function interface to function address
+            func = _get_functype(functype)(getattr(_table, pfn))
+        setattr(self, name, func)
+        return func
+
+###############################################################################
+## @brief Names of 'from level_zero.zes import *': every public name, including
+##        the deferred experimental definitions, which the import defines
+__all__ = sorted(set(name for name in globals() if not name.startswith("_")) |
+                 set(name for name in _deferred if not name.startswith("_")))
@@ -7,10 +7,16 @@
  @version v1.13-r1.13.1
 
  """
-import platform
+import sys
 from ctypes import *
 from enum import *
 
+from .ze import (
+    UnsupportedFunctionError, ZE_BIT, ZE_FASTCALL, ZE_MAKE_VERSION,
+    ze_api_version_t, ze_bool_t, ze_callbacks_t, ze_device_thread_t,
+    ze_event_handle_t, ze_result_t, ze_result_v
+    )
+
 ###############################################################################
 __version__ = "1.0"
 
@@ -146,10 +152,10 @@ class zet_value_type_t(c_int):
 
 ###############################################################################
 ## @brief Union of values
-class zet_value_t(Structure):
+class zet_value_t(Union):
     _fields_ = [
-        ("ui32", c_ulong),                                              ## [out] 32-bit unsigned-integer
-        ("ui64", c_ulonglong),                                          ## [out] 64-bit unsigned-integer
+        ("ui32", c_uint32),                                             ## [out] 32-bit unsigned-integer
+        ("ui64", c_uint64),                                             ## [out] 64-bit unsigned-integer
         ("fp32", c_float),                                              ## [out] 32-bit floating-point
         ("fp64", c_double),                                             ## [out] 64-bit floating-point
         ("b8", ze_bool_t)                                               ## [out] 8-bit boolean
@@ -208,7 +214,7 @@ class zet_device_debug_properties_t(Structure):
 ## @brief Debug configuration provided to ::zetDebugAttach
 class zet_debug_config_t(Structure):
     _fields_ = [
-        ("pid", c_ulong)                                                ## [in] the host process identifier
+        ("pid", c_uint32)                                               ## [in] the host process identifier
     ]
 
 ###############################################################################
@@ -264,9 +270,9 @@ class zet_debug_event_info_detached_t(Structure):
 class zet_debug_event_info_module_t(Structure):
     _fields_ = [
         ("format", zet_module_debug_info_format_t),                     ## [out] the module format
-        ("moduleBegin", c_ulonglong),                                   ## [out] the begin address of the in-memory module (inclusive)
-        ("moduleEnd", c_ulonglong),                                     ## [out] the end address of the in-memory module (exclusive)
-        ("load", c_ulonglong)                                           ## [out] the load address of the module on the device
+        ("moduleBegin", c_uint64),                                      ## [out] the begin address of the in-memory module (inclusive)
+        ("moduleEnd", c_uint64),                                        ## [out] the end address of the in-memory module (exclusive)
+        ("load", c_uint64)                                              ## [out] the load address of the module on the device
     ]
 
 ###############################################################################
@@ -293,14 +299,14 @@ class zet_debug_page_fault_reason_t(c_int):
 ## @brief Event information for ::ZET_DEBUG_EVENT_TYPE_PAGE_FAULT
 class zet_debug_event_info_page_fault_t(Structure):
     _fields_ = [
-        ("address", c_ulonglong),                                       ## [out] the faulting address
-        ("mask", c_ulonglong),                                          ## [out] the alignment mask
+        ("address", c_uint64),                                          ## [out] the faulting address
+        ("mask", c_uint64),                                             ## [out] the alignment mask
         ("reason", zet_debug_page_fault_reason_t)                       ## [out] the page fault reason
     ]
 
 ###############################################################################
 ## @brief Event type-specific information
-class zet_debug_event_info_t(Structure):
+class zet_debug_event_info_t(Union):
     _fields_ = [
         ("detached", zet_debug_event_info_detached_t),                  ## [out] type == ::ZET_DEBUG_EVENT_TYPE_DETACHED
         ("module", zet_debug_event_info_module_t),                      ## [out] type == ::ZET_DEBUG_EVENT_TYPE_MODULE_LOAD or
@@ -339,7 +345,7 @@ class zet_debug_memory_space_desc_t(Structure):
         ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
         ("type", zet_debug_memory_space_type_t),                        ## [in] type of memory space
-        ("address", c_ulonglong)                                        ## [in] the virtual address within the memory space
+        ("address", c_uint64)                                           ## [in] the virtual address within the memory space
     ]
 
 ###############################################################################
@@ -361,13 +367,13 @@ class zet_debug_regset_properties_t(Structure):
         ("stype", zet_structure_type_t),                                ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("type", c_ulong),                                              ## [out] device-specific register set type
-        ("version", c_ulong),                                           ## [out] device-specific version of this register set
+        ("type", c_uint32),                                             ## [out] device-specific register set type
+        ("version", c_uint32),                                          ## [out] device-specific version of this register set
         ("generalFlags", zet_debug_regset_flags_t),                     ## [out] general register set flags
-        ("deviceFlags", c_ulong),                                       ## [out] device-specific register set flags
-        ("count", c_ulong),                                             ## [out] number of registers in the set
-        ("bitSize", c_ulong),                                           ## [out] the size of a register in bits
-        ("byteSize", c_ulong)                                           ## [out] the size required for reading or writing a register in bytes
+        ("deviceFlags", c_uint32),                                      ## [out] device-specific register set flags
+        ("count", c_uint32),                                            ## [out] number of registers in the set
+        ("bitSize", c_uint32),                                          ## [out] the size of a register in bits
+        ("byteSize", c_uint32)                                          ## [out] the size required for reading or writing a register in bytes
     ]
 
 ###############################################################################
@@ -401,9 +407,9 @@ class zet_metric_group_properties_t(Structure):
         ("description", c_char * ZET_MAX_METRIC_GROUP_DESCRIPTION),     ## [out] metric group description
         ("samplingType", zet_metric_group_sampling_type_flags_t),       ## [out] metric group sampling type.
                                                                         ## returns a combination of ::zet_metric_group_sampling_type_flag_t.
-        ("domain", c_ulong),                                            ## [out] metric group domain number. Cannot use multiple, simultaneous
+        ("domain", c_uint32),                                           ## [out] metric group domain number. Cannot use multiple, simultaneous
                                                                         ## metric groups from the same domain.
-        ("metricCount", c_ulong)                                        ## [out] metric count belonging to this group
+        ("metricCount", c_uint32)                                       ## [out] metric count belonging to this group
     ]
 
 ###############################################################################
@@ -470,7 +476,7 @@ class zet_metric_properties_t(Structure):
         ("name", c_char * ZET_MAX_METRIC_NAME),                         ## [out] metric name
         ("description", c_char * ZET_MAX_METRIC_DESCRIPTION),           ## [out] metric description
         ("component", c_char * ZET_MAX_METRIC_COMPONENT),               ## [out] metric component
-        ("tierNumber", c_ulong),                                        ## [out] number of tier
+        ("tierNumber", c_uint32),                                       ## [out] number of tier
         ("metricType", zet_metric_type_t),                              ## [out] metric type
         ("resultType", zet_value_type_t),                               ## [out] metric result type
         ("resultUnits", c_char * ZET_MAX_METRIC_RESULT_UNITS)           ## [out] metric result units
@@ -483,11 +489,11 @@ class zet_metric_streamer_desc_t(Structure):
         ("stype", zet_structure_type_t),                                ## [in] type of this structure
         ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
-        ("notifyEveryNReports", c_ulong),                               ## [in,out] number of collected reports after which notification event
+        ("notifyEveryNReports", c_uint32),                              ## [in,out] number of collected reports after which notification event
                                                                         ## will be signaled. If the requested value is not supported exactly,
                                                                         ## then the driver may use a value that is the closest supported
                                                                         ## approximation and shall update this member during ::zetMetricStreamerOpen.
-        ("samplingPeriod", c_ulong)                                     ## [in,out] streamer sampling period in nanoseconds. If the requested
+        ("samplingPeriod", c_uint32)                                    ## [in,out] streamer sampling period in nanoseconds. If the requested
                                                                         ## value is not supported exactly, then the driver may use a value that
                                                                         ## is the closest supported approximation and shall update this member
                                                                         ## during ::zetMetricStreamerOpen.
@@ -512,7 +518,7 @@ class zet_metric_query_pool_desc_t(Structure):
         ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
                                                                         ## structure (i.e. contains stype and pNext).
         ("type", zet_metric_query_pool_type_t),                         ## [in] Query pool type.
-        ("count", c_ulong)                                              ## [in] Internal slots count within query pool object.
+        ("count", c_uint32)                                             ## [in] Internal slots count within query pool object.
     ]
 
 ###############################################################################
@@ -536,7 +542,7 @@ class zet_profile_properties_t(Structure):
                                                                         ## structure (i.e. contains stype and pNext).
         ("flags", zet_profile_flags_t),                                 ## [out] indicates which flags were enabled during compilation.
                                                                         ## returns 0 (none) or a combination of ::zet_profile_flag_t
-        ("numTokens", c_ulong)                                          ## [out] number of tokens immediately following this structure
+        ("numTokens", c_uint32)                                         ## [out] number of tokens immediately following this structure
     ]
 
 ###############################################################################
@@ -555,8 +561,8 @@ class zet_profile_token_type_t(c_int):
 class zet_profile_free_register_token_t(Structure):
     _fields_ = [
         ("type", zet_profile_token_type_t),                             ## [out] type of token
-        ("size", c_ulong),                                              ## [out] total size of the token, in bytes
-        ("count", c_ulong)                                              ## [out] number of register sequences immediately following this
+        ("size", c_uint32),                                             ## [out] total size of the token, in bytes
+        ("count", c_uint32)                                             ## [out] number of register sequences immediately following this
                                                                         ## structure
     ]
 
@@ -565,9 +571,9 @@ class zet_profile_free_register_token_t(Structure):
 ##        are unused
 class zet_profile_register_sequence_t(Structure):
     _fields_ = [
-        ("start", c_ulong),                                             ## [out] starting byte in the register table, representing the start of
+        ("start", c_uint32),                                            ## [out] starting byte in the register table, representing the start of
                                                                         ## unused bytes in the current function
-        ("count", c_ulong)                                              ## [out] number of consecutive bytes in the sequence, starting from start
+        ("count", c_uint32)                                             ## [out] number of consecutive bytes in the sequence, starting from start
     ]
 
 ###############################################################################
@@ -630,44 +636,6 @@ class zet_metric_tracer_exp_version_t(c_int):
         return str(zet_metric_tracer_exp_version_v(self.value))
 
 
-###############################################################################
-## @brief Handle of metric tracer's object
-class zet_metric_tracer_exp_handle_t(c_void_p):
-    pass
-
-###############################################################################
-## @brief Handle of metric decoder's object
-class zet_metric_decoder_exp_handle_t(c_void_p):
-    pass
-
-###############################################################################
-## @brief Metric tracer descriptor
-class zet_metric_tracer_exp_desc_t(Structure):
-    _fields_ = [
-        ("stype", zet_structure_type_t),                                ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("notifyEveryNBytes", c_ulong)                                  ## [in,out] number of collected bytes after which notification event will
-                                                                        ## be signaled. If the requested value is not supported exactly, then the
-                                                                        ## driver may use a value that is the closest supported approximation and
-                                                                        ## shall update this member during ::zetMetricTracerCreateExp.
-    ]
-
-###############################################################################
-## @brief Decoded metric entry
-class zet_metric_entry_exp_t(Structure):
-    _fields_ = [
-        ("value", zet_value_t),                                         ## [out] value of the decodable metric entry or event. Number is
-                                                                        ## meaningful based on the metric type.
-        ("timeStamp", c_ulonglong),                                     ## [out] timestamp at which the event happened.
-        ("metricIndex", c_ulong),                                       ## [out] index to the decodable metric handle in the input array
-                                                                        ## (phMetric) in ::zetMetricTracerDecodeExp().
-        ("onSubdevice", ze_bool_t),                                     ## [out] True if the event occurred on a sub-device; false means the
-                                                                        ## device on which the metric tracer was opened does not have
-                                                                        ## sub-devices.
-        ("subdeviceId", c_ulong)                                        ## [out] If onSubdevice is true, this gives the ID of the sub-device.
-    ]
-
 ###############################################################################
 ## @brief Metric group type
 class zet_metric_group_type_exp_flags_v(IntEnum):
@@ -683,31 +651,6 @@ class zet_metric_group_type_exp_flags_t(c_int):
         return hex(self.value)
 
 
-###############################################################################
-## @brief Query the metric group type using `pNext` of
-##        ::zet_metric_group_properties_t
-class zet_metric_group_type_exp_t(Structure):
-    _fields_ = [
-        ("stype", zet_structure_type_t),                                ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("type", zet_metric_group_type_exp_flags_t)                     ## [out] metric group type.
-                                                                        ## returns a combination of ::zet_metric_group_type_exp_flags_t.
-    ]
-
-###############################################################################
-## @brief Exported dma_buf properties queried using `pNext` of
-##        ::zet_metric_group_properties_t or ::zet_metric_properties_t
-class zet_export_dma_buf_exp_properties_t(Structure):
-    _fields_ = [
-        ("stype", zet_structure_type_t),                                ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("fd", c_int),                                                  ## [out] the file descriptor handle that could be used to import the
-                                                                        ## memory by the host process.
-        ("size", c_size_t)                                              ## [out] size in bytes of the dma_buf
-    ]
-
 ###############################################################################
 ## @brief Marker Support Using MetricGroup Experimental Extension Name
 ZET_METRIC_GROUP_MARKER_EXP_NAME = "ZET_experimental_metric_group_marker"
@@ -723,17 +666,6 @@ class zet_metric_group_marker_exp_version_t(c_int):
         return str(zet_metric_group_marker_exp_version_v(self.value))
 
 
-###############################################################################
-## @brief Query the metric source unique identifier using `pNext` of
-##        ::zet_metric_group_properties_t
-class zet_metric_source_id_exp_t(Structure):
-    _fields_ = [
-        ("stype", zet_structure_type_t),                                ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("sourceId", c_ulong)                                           ## [out] unique number representing the Metric Source.
-    ]
-
 ###############################################################################
 ## @brief Runtime Enabling and Disabling Metrics Extension Name
 ZET_METRICS_RUNTIME_ENABLE_DISABLE_EXP_NAME = "ZET_experimental_metrics_runtime_enable_disable"
@@ -779,23 +711,6 @@ class ze_metric_global_timestamps_exp_version_t(c_int):
         return str(ze_metric_global_timestamps_exp_version_v(self.value))
 
 
-###############################################################################
-## @brief Metric timestamps resolution
-## 
-## @details
-##     - This structure may be returned from ::zetMetricGroupGetProperties via
-##       the `pNext` member of ::zet_metric_group_properties_t.
-##     - Used for mapping metric timestamps to other timers.
-class zet_metric_global_timestamps_resolution_exp_t(Structure):
-    _fields_ = [
-        ("stype", zet_structure_type_t),                                ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("timerResolution", c_ulonglong),                               ## [out] Returns the resolution of metrics timer (used for timestamps) in
-                                                                        ## cycles/sec.
-        ("timestampValidBits", c_ulonglong)                             ## [out] Returns the number of valid bits in the timestamp value.
-    ]
-
 ###############################################################################
 ## @brief Exporting Metrics Data Experimental Extension Name
 ZET_EXPORT_METRICS_DATA_EXP_NAME = "ZET_experimental_metric_export_data"
@@ -819,16 +734,6 @@ ZET_MAX_METRIC_EXPORT_DATA_ELEMENT_NAME_EXP = 256
 ## @brief Maximum export data element description string size
 ZET_MAX_METRIC_EXPORT_DATA_ELEMENT_DESCRIPTION_EXP = 256
 
-###############################################################################
-## @brief Metrics calculation descriptor
-class zet_metric_calculate_exp_desc_t(Structure):
-    _fields_ = [
-        ("stype", zet_structure_type_t),                                ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("rawReportSkipCount", c_ulong)                                 ## [in] number of reports to skip during calculation
-    ]
-
 ###############################################################################
 ## @brief Programmable Metrics Experimental Extension Name
 ZET_PROGRAMMABLE_METRICS_EXP_NAME = "ZET_experimental_programmable_metrics"
@@ -881,159 +786,7 @@ ZET_MAX_METRIC_PROGRAMMABLE_VALUE_DESCRIPTION_EXP = 128
 ZE_MAX_METRIC_GROUP_NAME_PREFIX = 64
 
 ###############################################################################
-## @brief Handle of metric programmable's object
-class zet_metric_programmable_exp_handle_t(c_void_p):
-    pass
-
-###############################################################################
-## @brief Metric Programmable properties queried using
-##        ::zetMetricProgrammableGetPropertiesExp
-class zet_metric_programmable_exp_properties_t(Structure):
-    _fields_ = [
-        ("stype", zet_structure_type_t),                                ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("name", c_char * ZET_MAX_METRIC_PROGRAMMABLE_NAME_EXP),        ## [out] metric programmable name
-        ("description", c_char * ZET_MAX_METRIC_PROGRAMMABLE_DESCRIPTION_EXP),  ## [out] metric programmable description
-        ("component", c_char * ZET_MAX_METRIC_PROGRAMMABLE_COMPONENT_EXP),  ## [out] metric programmable component
-        ("tierNumber", c_ulong),                                        ## [out] tier number
-        ("domain", c_ulong),                                            ## [out] metric domain number.
-        ("parameterCount", c_ulong),                                    ## [out] number of parameters in the programmable
-        ("samplingType", zet_metric_group_sampling_type_flags_t),       ## [out] metric sampling type.
-                                                                        ## returns a combination of ::zet_metric_group_sampling_type_flag_t.
-        ("sourceId", c_ulong)                                           ## [out] unique metric source identifier(within platform)to identify the
-                                                                        ## HW block where the metric is collected.
-    ]
-
-###############################################################################
-## @brief Metric Programmable Parameter types
-class zet_metric_programmable_param_type_exp_v(IntEnum):
-    DISAGGREGATION = 0                                                      ## Metric is disaggregated.
-    LATENCY = 1                                                             ## Metric for latency measurement.
-    NORMALIZATION_UTILIZATION = 2                                           ## Produces normalization in percent using raw_metric * 100 / cycles / HW
-                                                                            ## instance_count.
-    NORMALIZATION_AVERAGE = 3                                               ## Produces normalization using raw_metric / HW instance_count.
-    NORMALIZATION_RATE = 4                                                  ## Produces normalization average using raw_metric / timestamp.
-    NORMALIZATION_BYTES = 5                                                 ## Produces normalization average using raw_metric * n bytes.
-    GENERIC = 6                                                             ## Generic Parameter type. Please refer the parameter's description.
-
-class zet_metric_programmable_param_type_exp_t(c_int):
-    def __str__(self):
-        return str(zet_metric_programmable_param_type_exp_v(self.value))
-
-
-###############################################################################
-## @brief Supported value info types
-class zet_value_info_type_exp_v(IntEnum):
-    UINT32 = 0                                                              ## 32-bit unsigned-integer
-    UINT64 = 1                                                              ## 64-bit unsigned-integer
-    FLOAT32 = 2                                                             ## 32-bit floating-point
-    FLOAT64 = 3                                                             ## 64-bit floating-point
-    BOOL8 = 4                                                               ## 8-bit boolean
-    UINT8 = 5                                                               ## 8-bit unsigned-integer
-    UINT16 = 6                                                              ## 16-bit unsigned-integer
-    UINT64_RANGE = 7                                                        ## 64-bit unsigned-integer range (minimum and maximum)
-    FLOAT64_RANGE = 8                                                       ## 64-bit floating point range (minimum and maximum)
-
-class zet_value_info_type_exp_t(c_int):
-    def __str__(self):
-        return str(zet_value_info_type_exp_v(self.value))
-
-
-###############################################################################
-## @brief Value info of type uint64_t range
-class zet_value_uint64_range_exp_t(Structure):
-    _fields_ = [
-        ("ui64Min", c_ulonglong),                                       ## [out] minimum value of the range
-        ("ui64Max", c_ulonglong)                                        ## [out] maximum value of the range
-    ]
-
-###############################################################################
-## @brief Value info of type float64 range
-class zet_value_fp64_range_exp_t(Structure):
-    _fields_ = [
-        ("fp64Min", c_double),                                          ## [out] minimum value of the range
-        ("fp64Max", c_double)                                           ## [out] maximum value of the range
-    ]
-
-###############################################################################
-## @brief Union of value information
-class zet_value_info_exp_t(Structure):
-    _fields_ = [
-        ("ui32", c_ulong),                                              ## [out] 32-bit unsigned-integer
-        ("ui64", c_ulonglong),                                          ## [out] 64-bit unsigned-integer
-        ("fp32", c_float),                                              ## [out] 32-bit floating-point
-        ("fp64", c_double),                                             ## [out] 64-bit floating-point
-        ("b8", ze_bool_t),                                              ## [out] 8-bit boolean
-        ("ui8", c_ubyte),                                               ## [out] 8-bit unsigned integer
-        ("ui16", c_ushort),                                             ## [out] 16-bit unsigned integer
-        ("ui64Range", zet_value_uint64_range_exp_t),                    ## [out] minimum and maximum value of the range
-        ("fp64Range", zet_value_fp64_range_exp_t)                       ## [out] minimum and maximum value of the range
-    ]
-
-###############################################################################
-## @brief Metric Programmable parameter information
-class zet_metric_programmable_param_info_exp_t(Structure):
-    _fields_ = [
-        ("stype", zet_structure_type_t),                                ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("type", zet_metric_programmable_param_type_exp_t),             ## [out] programmable parameter type
-        ("name", c_char * ZET_MAX_METRIC_PROGRAMMABLE_PARAMETER_NAME_EXP),  ## [out] metric programmable parameter name
-        ("valueInfoType", zet_value_info_type_exp_t),                   ## [out] value info type
-        ("defaultValue", zet_value_t),                                  ## [out] default value for the parameter
-        ("valueInfoCount", c_ulong)                                     ## [out] count of ::zet_metric_programmable_param_value_info_exp_t
-    ]
-
-###############################################################################
-## @brief Metric Programmable parameter value information
-class zet_metric_programmable_param_value_info_exp_t(Structure):
-    _fields_ = [
-        ("stype", zet_structure_type_t),                                ## [in] type of this structure
-        ("pNext", c_void_p),                                            ## [in,out][optional] must be null or a pointer to an extension-specific
-                                                                        ## structure (i.e. contains stype and pNext).
-        ("valueInfo", zet_value_info_exp_t),                            ## [out] information about the parameter value
-        ("description", c_char * ZET_MAX_METRIC_PROGRAMMABLE_VALUE_DESCRIPTION_EXP) ## [out] description about the value
-    ]
-
-###############################################################################
-## @brief Metric Programmable parameter value
-class zet_metric_programmable_param_value_exp_t(Structure):
-    _fields_ = [
-        ("value", zet_value_t)                                          ## [in] parameter value
-    ]
-
-###############################################################################
-__use_win_types = "Windows" == platform.uname()[0]
-
-###############################################################################
-## @brief Function-pointer for zetMetricProgrammableGetExp
-if __use_win_types:
-    _zetMetricProgrammableGetExp_t = WINFUNCTYPE( ze_result_t, zet_device_handle_t, POINTER(c_ulong), POINTER(zet_metric_programmable_exp_handle_t) )
-else:
-    _zetMetricProgrammableGetExp_t = CFUNCTYPE( ze_result_t, zet_device_handle_t, POINTER(c_ulong), POINTER(zet_metric_programmable_exp_handle_t) )
-
-###############################################################################
-## @brief Function-pointer for zetMetricProgrammableGetPropertiesExp
-if __use_win_types:
-    _zetMetricProgrammableGetPropertiesExp_t = WINFUNCTYPE( ze_result_t, zet_metric_programmable_exp_handle_t, POINTER(zet_metric_programmable_exp_properties_t) )
-else:
-    _zetMetricProgrammableGetPropertiesExp_t = CFUNCTYPE( ze_result_t, zet_metric_programmable_exp_handle_t, POINTER(zet_metric_programmable_exp_properties_t) )
-
-###############################################################################
-## @brief Function-pointer for zetMetricProgrammableGetParamInfoExp
-if __use_win_types:
-    _zetMetricProgrammableGetParamInfoExp_t = WINFUNCTYPE( ze_result_t, zet_metric_programmable_exp_handle_t, POINTER(c_ulong), POINTER(zet_metric_programmable_param_info_exp_t) )
-else:
-    _zetMetricProgrammableGetParamInfoExp_t = CFUNCTYPE( ze_result_t, zet_metric_programmable_exp_handle_t, POINTER(c_ulong), POINTER(zet_metric_programmable_param_info_exp_t) )
-
-###############################################################################
-## @brief Function-pointer for zetMetricProgrammableGetParamValueInfoExp
-if __use_win_types:
-    _zetMetricProgrammableGetParamValueInfoExp_t = WINFUNCTYPE( ze_result_t, zet_metric_programmable_exp_handle_t, c_ulong, POINTER(c_ulong), POINTER(zet_metric_programmable_param_value_info_exp_t) )
-else:
-    _zetMetricProgrammableGetParamValueInfoExp_t = CFUNCTYPE( ze_result_t, zet_metric_programmable_exp_handle_t, c_ulong, POINTER(c_ulong), POINTER(zet_metric_programmable_param_value_info_exp_t) )
-
+__use_win_types = "win32" == sys.platform
 
 ###############################################################################
 ## @brief Table of MetricProgrammableExp functions pointers
@@ -1045,49 +798,6 @@ class _zet_metric_programmable_exp_dditable_t(Structure):
         ("pfnGetParamValueInfoExp", c_void_p)                           ## _zetMetricProgrammableGetParamValueInfoExp_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zetMetricTracerCreateExp
-if __use_win_types:
-    _zetMetricTracerCreateExp_t = WINFUNCTYPE( ze_result_t, zet_context_handle_t, zet_device_handle_t, c_ulong, POINTER(zet_metric_group_handle_t), POINTER(zet_metric_tracer_exp_desc_t), ze_event_handle_t, POINTER(zet_metric_tracer_exp_handle_t) )
-else:
-    _zetMetricTracerCreateExp_t = CFUNCTYPE( ze_result_t, zet_context_handle_t, zet_device_handle_t, c_ulong, POINTER(zet_metric_group_handle_t), POINTER(zet_metric_tracer_exp_desc_t), ze_event_handle_t, POINTER(zet_metric_tracer_exp_handle_t) )
-
-###############################################################################
-## @brief Function-pointer for zetMetricTracerDestroyExp
-if __use_win_types:
-    _zetMetricTracerDestroyExp_t = WINFUNCTYPE( ze_result_t, zet_metric_tracer_exp_handle_t )
-else:
-    _zetMetricTracerDestroyExp_t = CFUNCTYPE( ze_result_t, zet_metric_tracer_exp_handle_t )
-
-###############################################################################
-## @brief Function-pointer for zetMetricTracerEnableExp
-if __use_win_types:
-    _zetMetricTracerEnableExp_t = WINFUNCTYPE( ze_result_t, zet_metric_tracer_exp_handle_t, ze_bool_t )
-else:
-    _zetMetricTracerEnableExp_t = CFUNCTYPE( ze_result_t, zet_metric_tracer_exp_handle_t, ze_bool_t )
-
-###############################################################################
-## @brief Function-pointer for zetMetricTracerDisableExp
-if __use_win_types:
-    _zetMetricTracerDisableExp_t = WINFUNCTYPE( ze_result_t, zet_metric_tracer_exp_handle_t, ze_bool_t )
-else:
-    _zetMetricTracerDisableExp_t = CFUNCTYPE( ze_result_t, zet_metric_tracer_exp_handle_t, ze_bool_t )
-
-###############################################################################
-## @brief Function-pointer for zetMetricTracerReadDataExp
-if __use_win_types:
-    _zetMetricTracerReadDataExp_t = WINFUNCTYPE( ze_result_t, zet_metric_tracer_exp_handle_t, POINTER(c_size_t), POINTER(c_ubyte) )
-else:
-    _zetMetricTracerReadDataExp_t = CFUNCTYPE( ze_result_t, zet_metric_tracer_exp_handle_t, POINTER(c_size_t), POINTER(c_ubyte) )
-
-###############################################################################
-## @brief Function-pointer for zetMetricTracerDecodeExp
-if __use_win_types:
-    _zetMetricTracerDecodeExp_t = WINFUNCTYPE( ze_result_t, zet_metric_decoder_exp_handle_t, POINTER(c_size_t), POINTER(c_ubyte), c_ulong, POINTER(zet_metric_handle_t), POINTER(c_ulong), POINTER(c_ulong), POINTER(c_ulong), POINTER(zet_metric_entry_exp_t) )
-else:
-    _zetMetricTracerDecodeExp_t = CFUNCTYPE( ze_result_t, zet_metric_decoder_exp_handle_t, POINTER(c_size_t), POINTER(c_ubyte), c_ulong, POINTER(zet_metric_handle_t), POINTER(c_ulong), POINTER(c_ulong), POINTER(c_ulong), POINTER(zet_metric_entry_exp_t) )
-
-
 ###############################################################################
 ## @brief Table of MetricTracerExp functions pointers
 class _zet_metric_tracer_exp_dditable_t(Structure):
@@ -1100,28 +810,6 @@ class _zet_metric_tracer_exp_dditable_t(Structure):
         ("pfnDecodeExp", c_void_p)                                      ## _zetMetricTracerDecodeExp_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zetMetricDecoderCreateExp
-if __use_win_types:
-    _zetMetricDecoderCreateExp_t = WINFUNCTYPE( ze_result_t, zet_metric_tracer_exp_handle_t, POINTER(zet_metric_decoder_exp_handle_t) )
-else:
-    _zetMetricDecoderCreateExp_t = CFUNCTYPE( ze_result_t, zet_metric_tracer_exp_handle_t, POINTER(zet_metric_decoder_exp_handle_t) )
-
-###############################################################################
-## @brief Function-pointer for zetMetricDecoderDestroyExp
-if __use_win_types:
-    _zetMetricDecoderDestroyExp_t = WINFUNCTYPE( ze_result_t, zet_metric_decoder_exp_handle_t )
-else:
-    _zetMetricDecoderDestroyExp_t = CFUNCTYPE( ze_result_t, zet_metric_decoder_exp_handle_t )
-
-###############################################################################
-## @brief Function-pointer for zetMetricDecoderGetDecodableMetricsExp
-if __use_win_types:
-    _zetMetricDecoderGetDecodableMetricsExp_t = WINFUNCTYPE( ze_result_t, zet_metric_decoder_exp_handle_t, POINTER(c_ulong), POINTER(zet_metric_handle_t) )
-else:
-    _zetMetricDecoderGetDecodableMetricsExp_t = CFUNCTYPE( ze_result_t, zet_metric_decoder_exp_handle_t, POINTER(c_ulong), POINTER(zet_metric_handle_t) )
-
-
 ###############################################################################
 ## @brief Table of MetricDecoderExp functions pointers
 class _zet_metric_decoder_exp_dditable_t(Structure):
@@ -1146,35 +834,6 @@ class _zet_device_dditable_t(Structure):
         ("pfnGetDebugProperties", c_void_p)                             ## _zetDeviceGetDebugProperties_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zetDeviceGetConcurrentMetricGroupsExp
-if __use_win_types:
-    _zetDeviceGetConcurrentMetricGroupsExp_t = WINFUNCTYPE( ze_result_t, zet_device_handle_t, c_ulong, *, *, * )
-else:
-    _zetDeviceGetConcurrentMetricGroupsExp_t = CFUNCTYPE( ze_result_t, zet_device_handle_t, c_ulong, *, *, * )
-
-###############################################################################
-## @brief Function-pointer for zetDeviceCreateMetricGroupsFromMetricsExp
-if __use_win_types:
-    _zetDeviceCreateMetricGroupsFromMetricsExp_t = WINFUNCTYPE( ze_result_t, zet_device_handle_t, c_ulong, *, *, *, *, POINTER(zet_metric_group_handle_t) )
-else:
-    _zetDeviceCreateMetricGroupsFromMetricsExp_t = CFUNCTYPE( ze_result_t, zet_device_handle_t, c_ulong, *, *, *, *, POINTER(zet_metric_group_handle_t) )
-
-###############################################################################
-## @brief Function-pointer for zetDeviceEnableMetricsExp
-if __use_win_types:
-    _zetDeviceEnableMetricsExp_t = WINFUNCTYPE( ze_result_t, zet_device_handle_t )
-else:
-    _zetDeviceEnableMetricsExp_t = CFUNCTYPE( ze_result_t, zet_device_handle_t )
-
-###############################################################################
-## @brief Function-pointer for zetDeviceDisableMetricsExp
-if __use_win_types:
-    _zetDeviceDisableMetricsExp_t = WINFUNCTYPE( ze_result_t, zet_device_handle_t )
-else:
-    _zetDeviceDisableMetricsExp_t = CFUNCTYPE( ze_result_t, zet_device_handle_t )
-
-
 ###############################################################################
 ## @brief Table of DeviceExp functions pointers
 class _zet_device_exp_dditable_t(Structure):
@@ -1188,9 +847,9 @@ class _zet_device_exp_dditable_t(Structure):
 ###############################################################################
 ## @brief Function-pointer for zetContextActivateMetricGroups
 if __use_win_types:
-    _zetContextActivateMetricGroups_t = WINFUNCTYPE( ze_result_t, zet_context_handle_t, zet_device_handle_t, c_ulong, POINTER(zet_metric_group_handle_t) )
+    _zetContextActivateMetricGroups_t = WINFUNCTYPE( ze_result_t, zet_context_handle_t, zet_device_handle_t, c_uint32, POINTER(zet_metric_group_handle_t) )
 else:
-    _zetContextActivateMetricGroups_t = CFUNCTYPE( ze_result_t, zet_context_handle_t, zet_device_handle_t, c_ulong, POINTER(zet_metric_group_handle_t) )
+    _zetContextActivateMetricGroups_t = CFUNCTYPE( ze_result_t, zet_context_handle_t, zet_device_handle_t, c_uint32, POINTER(zet_metric_group_handle_t) )
 
 
 ###############################################################################
@@ -1203,9 +862,9 @@ class _zet_context_dditable_t(Structure):
 ###############################################################################
 ## @brief Function-pointer for zetCommandListAppendMetricStreamerMarker
 if __use_win_types:
-    _zetCommandListAppendMetricStreamerMarker_t = WINFUNCTYPE( ze_result_t, zet_command_list_handle_t, zet_metric_streamer_handle_t, c_ulong )
+    _zetCommandListAppendMetricStreamerMarker_t = WINFUNCTYPE( ze_result_t, zet_command_list_handle_t, zet_metric_streamer_handle_t, c_uint32 )
 else:
-    _zetCommandListAppendMetricStreamerMarker_t = CFUNCTYPE( ze_result_t, zet_command_list_handle_t, zet_metric_streamer_handle_t, c_ulong )
+    _zetCommandListAppendMetricStreamerMarker_t = CFUNCTYPE( ze_result_t, zet_command_list_handle_t, zet_metric_streamer_handle_t, c_uint32 )
 
 ###############################################################################
 ## @brief Function-pointer for zetCommandListAppendMetricQueryBegin
@@ -1217,9 +876,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zetCommandListAppendMetricQueryEnd
 if __use_win_types:
-    _zetCommandListAppendMetricQueryEnd_t = WINFUNCTYPE( ze_result_t, zet_command_list_handle_t, zet_metric_query_handle_t, ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zetCommandListAppendMetricQueryEnd_t = WINFUNCTYPE( ze_result_t, zet_command_list_handle_t, zet_metric_query_handle_t, ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 else:
-    _zetCommandListAppendMetricQueryEnd_t = CFUNCTYPE( ze_result_t, zet_command_list_handle_t, zet_metric_query_handle_t, ze_event_handle_t, c_ulong, POINTER(ze_event_handle_t) )
+    _zetCommandListAppendMetricQueryEnd_t = CFUNCTYPE( ze_result_t, zet_command_list_handle_t, zet_metric_query_handle_t, ze_event_handle_t, c_uint32, POINTER(ze_event_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zetCommandListAppendMetricMemoryBarrier
@@ -1239,14 +898,6 @@ class _zet_command_list_dditable_t(Structure):
         ("pfnAppendMetricMemoryBarrier", c_void_p)                      ## _zetCommandListAppendMetricMemoryBarrier_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zetCommandListAppendMarkerExp
-if __use_win_types:
-    _zetCommandListAppendMarkerExp_t = WINFUNCTYPE( ze_result_t, zet_command_list_handle_t, zet_metric_group_handle_t, c_ulong )
-else:
-    _zetCommandListAppendMarkerExp_t = CFUNCTYPE( ze_result_t, zet_command_list_handle_t, zet_metric_group_handle_t, c_ulong )
-
-
 ###############################################################################
 ## @brief Table of CommandListExp functions pointers
 class _zet_command_list_exp_dditable_t(Structure):
@@ -1287,9 +938,9 @@ class _zet_kernel_dditable_t(Structure):
 ###############################################################################
 ## @brief Function-pointer for zetMetricGet
 if __use_win_types:
-    _zetMetricGet_t = WINFUNCTYPE( ze_result_t, zet_metric_group_handle_t, POINTER(c_ulong), POINTER(zet_metric_handle_t) )
+    _zetMetricGet_t = WINFUNCTYPE( ze_result_t, zet_metric_group_handle_t, POINTER(c_uint32), POINTER(zet_metric_handle_t) )
 else:
-    _zetMetricGet_t = CFUNCTYPE( ze_result_t, zet_metric_group_handle_t, POINTER(c_ulong), POINTER(zet_metric_handle_t) )
+    _zetMetricGet_t = CFUNCTYPE( ze_result_t, zet_metric_group_handle_t, POINTER(c_uint32), POINTER(zet_metric_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zetMetricGetProperties
@@ -1307,28 +958,6 @@ class _zet_metric_dditable_t(Structure):
         ("pfnGetProperties", c_void_p)                                  ## _zetMetricGetProperties_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zetMetricCreateFromProgrammableExp
-if __use_win_types:
-    _zetMetricCreateFromProgrammableExp_t = WINFUNCTYPE( ze_result_t, zet_metric_programmable_exp_handle_t, POINTER(zet_metric_programmable_param_value_exp_t), c_ulong, c_char_p, c_char_p, POINTER(c_ulong), POINTER(zet_metric_handle_t) )
-else:
-    _zetMetricCreateFromProgrammableExp_t = CFUNCTYPE( ze_result_t, zet_metric_programmable_exp_handle_t, POINTER(zet_metric_programmable_param_value_exp_t), c_ulong, c_char_p, c_char_p, POINTER(c_ulong), POINTER(zet_metric_handle_t) )
-
-###############################################################################
-## @brief Function-pointer for zetMetricDestroyExp
-if __use_win_types:
-    _zetMetricDestroyExp_t = WINFUNCTYPE( ze_result_t, zet_metric_handle_t )
-else:
-    _zetMetricDestroyExp_t = CFUNCTYPE( ze_result_t, zet_metric_handle_t )
-
-###############################################################################
-## @brief Function-pointer for zetMetricCreateFromProgrammableExp2
-if __use_win_types:
-    _zetMetricCreateFromProgrammableExp2_t = WINFUNCTYPE( ze_result_t, zet_metric_programmable_exp_handle_t, c_ulong, POINTER(zet_metric_programmable_param_value_exp_t), c_char_p, c_char_p, POINTER(c_ulong), POINTER(zet_metric_handle_t) )
-else:
-    _zetMetricCreateFromProgrammableExp2_t = CFUNCTYPE( ze_result_t, zet_metric_programmable_exp_handle_t, c_ulong, POINTER(zet_metric_programmable_param_value_exp_t), c_char_p, c_char_p, POINTER(c_ulong), POINTER(zet_metric_handle_t) )
-
-
 ###############################################################################
 ## @brief Table of MetricExp functions pointers
 class _zet_metric_exp_dditable_t(Structure):
@@ -1341,9 +970,9 @@ class _zet_metric_exp_dditable_t(Structure):
 ###############################################################################
 ## @brief Function-pointer for zetMetricGroupGet
 if __use_win_types:
-    _zetMetricGroupGet_t = WINFUNCTYPE( ze_result_t, zet_device_handle_t, POINTER(c_ulong), POINTER(zet_metric_group_handle_t) )
+    _zetMetricGroupGet_t = WINFUNCTYPE( ze_result_t, zet_device_handle_t, POINTER(c_uint32), POINTER(zet_metric_group_handle_t) )
 else:
-    _zetMetricGroupGet_t = CFUNCTYPE( ze_result_t, zet_device_handle_t, POINTER(c_ulong), POINTER(zet_metric_group_handle_t) )
+    _zetMetricGroupGet_t = CFUNCTYPE( ze_result_t, zet_device_handle_t, POINTER(c_uint32), POINTER(zet_metric_group_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zetMetricGroupGetProperties
@@ -1355,9 +984,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zetMetricGroupCalculateMetricValues
 if __use_win_types:
-    _zetMetricGroupCalculateMetricValues_t = WINFUNCTYPE( ze_result_t, zet_metric_group_handle_t, zet_metric_group_calculation_type_t, c_size_t, POINTER(c_ubyte), POINTER(c_ulong), POINTER(zet_typed_value_t) )
+    _zetMetricGroupCalculateMetricValues_t = WINFUNCTYPE( ze_result_t, zet_metric_group_handle_t, zet_metric_group_calculation_type_t, c_size_t, POINTER(c_ubyte), POINTER(c_uint32), POINTER(zet_typed_value_t) )
 else:
-    _zetMetricGroupCalculateMetricValues_t = CFUNCTYPE( ze_result_t, zet_metric_group_handle_t, zet_metric_group_calculation_type_t, c_size_t, POINTER(c_ubyte), POINTER(c_ulong), POINTER(zet_typed_value_t) )
+    _zetMetricGroupCalculateMetricValues_t = CFUNCTYPE( ze_result_t, zet_metric_group_handle_t, zet_metric_group_calculation_type_t, c_size_t, POINTER(c_ubyte), POINTER(c_uint32), POINTER(zet_typed_value_t) )
 
 
 ###############################################################################
@@ -1369,70 +998,6 @@ class _zet_metric_group_dditable_t(Structure):
         ("pfnCalculateMetricValues", c_void_p)                          ## _zetMetricGroupCalculateMetricValues_t
     ]
 
-###############################################################################
-## @brief Function-pointer for zetMetricGroupCalculateMultipleMetricValuesExp
-if __use_win_types:
-    _zetMetricGroupCalculateMultipleMetricValuesExp_t = WINFUNCTYPE( ze_result_t, zet_metric_group_handle_t, zet_metric_group_calculation_type_t, c_size_t, POINTER(c_ubyte), POINTER(c_ulong), POINTER(c_ulong), POINTER(c_ulong), POINTER(zet_typed_value_t) )
-else:
-    _zetMetricGroupCalculateMultipleMetricValuesExp_t = CFUNCTYPE( ze_result_t, zet_metric_group_handle_t, zet_metric_group_calculation_type_t, c_size_t, POINTER(c_ubyte), POINTER(c_ulong), POINTER(c_ulong), POINTER(c_ulong), POINTER(zet_typed_value_t) )
-
-###############################################################################
-## @brief Function-pointer for zetMetricGroupGetGlobalTimestampsExp
-if __use_win_types:
-    _zetMetricGroupGetGlobalTimestampsExp_t = WINFUNCTYPE( ze_result_t, zet_metric_group_handle_t, ze_bool_t, POINTER(c_ulonglong), POINTER(c_ulonglong) )
-else:
-    _zetMetricGroupGetGlobalTimestampsExp_t = CFUNCTYPE( ze_result_t, zet_metric_group_handle_t, ze_bool_t, POINTER(c_ulonglong), POINTER(c_ulonglong) )
-
-###############################################################################
-## @brief Function-pointer for zetMetricGroupGetExportDataExp
-if __use_win_types:
-    _zetMetricGroupGetExportDataExp_t = WINFUNCTYPE( ze_result_t, zet_metric_group_handle_t, POINTER(c_ubyte), c_size_t, POINTER(c_size_t), * )
-else:
-    _zetMetricGroupGetExportDataExp_t = CFUNCTYPE( ze_result_t, zet_metric_group_handle_t, POINTER(c_ubyte), c_size_t, POINTER(c_size_t), * )
-
-###############################################################################
-## @brief Function-pointer for zetMetricGroupCalculateMetricExportDataExp
-if __use_win_types:
-    _zetMetricGroupCalculateMetricExportDataExp_t = WINFUNCTYPE( ze_result_t, ze_driver_handle_t, zet_metric_group_calculation_type_t, c_size_t, POINTER(c_ubyte), POINTER(zet_metric_calculate_exp_desc_t), POINTER(c_ulong), POINTER(c_ulong), POINTER(c_ulong), POINTER(zet_typed_value_t) )
-else:
-    _zetMetricGroupCalculateMetricExportDataExp_t = CFUNCTYPE( ze_result_t, ze_driver_handle_t, zet_metric_group_calculation_type_t, c_size_t, POINTER(c_ubyte), POINTER(zet_metric_calculate_exp_desc_t), POINTER(c_ulong), POINTER(c_ulong), POINTER(c_ulong), POINTER(zet_typed_value_t) )
-
-###############################################################################
-## @brief Function-pointer for zetMetricGroupCreateExp
-if __use_win_types:
-    _zetMetricGroupCreateExp_t = WINFUNCTYPE( ze_result_t, zet_device_handle_t, c_char_p, c_char_p, zet_metric_group_sampling_type_flags_t, POINTER(zet_metric_group_handle_t) )
-else:
-    _zetMetricGroupCreateExp_t = CFUNCTYPE( ze_result_t, zet_device_handle_t, c_char_p, c_char_p, zet_metric_group_sampling_type_flags_t, POINTER(zet_metric_group_handle_t) )
-
-###############################################################################
-## @brief Function-pointer for zetMetricGroupAddMetricExp
-if __use_win_types:
-    _zetMetricGroupAddMetricExp_t = WINFUNCTYPE( ze_result_t, zet_metric_group_handle_t, zet_metric_handle_t, *, c_char_p )
-else:
-    _zetMetricGroupAddMetricExp_t = CFUNCTYPE( ze_result_t, zet_metric_group_handle_t, zet_metric_handle_t, *, c_char_p )
-
-###############################################################################
-## @brief Function-pointer for zetMetricGroupRemoveMetricExp
-if __use_win_types:
-    _zetMetricGroupRemoveMetricExp_t = WINFUNCTYPE( ze_result_t, zet_metric_group_handle_t, zet_metric_handle_t )
-else:
-    _zetMetricGroupRemoveMetricExp_t = CFUNCTYPE( ze_result_t, zet_metric_group_handle_t, zet_metric_handle_t )
-
-###############################################################################
-## @brief Function-pointer for zetMetricGroupCloseExp
-if __use_win_types:
-    _zetMetricGroupCloseExp_t = WINFUNCTYPE( ze_result_t, zet_metric_group_handle_t )
-else:
-    _zetMetricGroupCloseExp_t = CFUNCTYPE( ze_result_t, zet_metric_group_handle_t )
-
-###############################################################################
-## @brief Function-pointer for zetMetricGroupDestroyExp
-if __use_win_types:
-    _zetMetricGroupDestroyExp_t = WINFUNCTYPE( ze_result_t, zet_metric_group_handle_t )
-else:
-    _zetMetricGroupDestroyExp_t = CFUNCTYPE( ze_result_t, zet_metric_group_handle_t )
-
-
 ###############################################################################
 ## @brief Table of MetricGroupExp functions pointers
 class _zet_metric_group_exp_dditable_t(Structure):
@@ -1465,9 +1030,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zetMetricStreamerReadData
 if __use_win_types:
-    _zetMetricStreamerReadData_t = WINFUNCTYPE( ze_result_t, zet_metric_streamer_handle_t, c_ulong, POINTER(c_size_t), POINTER(c_ubyte) )
+    _zetMetricStreamerReadData_t = WINFUNCTYPE( ze_result_t, zet_metric_streamer_handle_t, c_uint32, POINTER(c_size_t), POINTER(c_ubyte) )
 else:
-    _zetMetricStreamerReadData_t = CFUNCTYPE( ze_result_t, zet_metric_streamer_handle_t, c_ulong, POINTER(c_size_t), POINTER(c_ubyte) )
+    _zetMetricStreamerReadData_t = CFUNCTYPE( ze_result_t, zet_metric_streamer_handle_t, c_uint32, POINTER(c_size_t), POINTER(c_ubyte) )
 
 
 ###############################################################################
@@ -1505,9 +1070,9 @@ class _zet_metric_query_pool_dditable_t(Structure):
 ###############################################################################
 ## @brief Function-pointer for zetMetricQueryCreate
 if __use_win_types:
-    _zetMetricQueryCreate_t = WINFUNCTYPE( ze_result_t, zet_metric_query_pool_handle_t, c_ulong, POINTER(zet_metric_query_handle_t) )
+    _zetMetricQueryCreate_t = WINFUNCTYPE( ze_result_t, zet_metric_query_pool_handle_t, c_uint32, POINTER(zet_metric_query_handle_t) )
 else:
-    _zetMetricQueryCreate_t = CFUNCTYPE( ze_result_t, zet_metric_query_pool_handle_t, c_ulong, POINTER(zet_metric_query_handle_t) )
+    _zetMetricQueryCreate_t = CFUNCTYPE( ze_result_t, zet_metric_query_pool_handle_t, c_uint32, POINTER(zet_metric_query_handle_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zetMetricQueryDestroy
@@ -1605,9 +1170,9 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zetDebugReadEvent
 if __use_win_types:
-    _zetDebugReadEvent_t = WINFUNCTYPE( ze_result_t, zet_debug_session_handle_t, c_ulonglong, POINTER(zet_debug_event_t) )
+    _zetDebugReadEvent_t = WINFUNCTYPE( ze_result_t, zet_debug_session_handle_t, c_uint64, POINTER(zet_debug_event_t) )
 else:
-    _zetDebugReadEvent_t = CFUNCTYPE( ze_result_t, zet_debug_session_handle_t, c_ulonglong, POINTER(zet_debug_event_t) )
+    _zetDebugReadEvent_t = CFUNCTYPE( ze_result_t, zet_debug_session_handle_t, c_uint64, POINTER(zet_debug_event_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zetDebugAcknowledgeEvent
@@ -1647,30 +1212,30 @@ else:
 ###############################################################################
 ## @brief Function-pointer for zetDebugGetRegisterSetProperties
 if __use_win_types:
-    _zetDebugGetRegisterSetProperties_t = WINFUNCTYPE( ze_result_t, zet_device_handle_t, POINTER(c_ulong), POINTER(zet_debug_regset_properties_t) )
+    _zetDebugGetRegisterSetProperties_t = WINFUNCTYPE( ze_result_t, zet_device_handle_t, POINTER(c_uint32), POINTER(zet_debug_regset_properties_t) )
 else:
-    _zetDebugGetRegisterSetProperties_t = CFUNCTYPE( ze_result_t, zet_device_handle_t, POINTER(c_ulong), POINTER(zet_debug_regset_properties_t) )
+    _zetDebugGetRegisterSetProperties_t = CFUNCTYPE( ze_result_t, zet_device_handle_t, POINTER(c_uint32), POINTER(zet_debug_regset_properties_t) )
 
 ###############################################################################
 ## @brief Function-pointer for zetDebugReadRegisters
 if __use_win_types:
-    _zetDebugReadRegisters_t = WINFUNCTYPE( ze_result_t, zet_debug_session_handle_t, ze_device_thread_t, c_ulong, c_ulong, c_ulong, c_void_p )
+    _zetDebugReadRegisters_t = WINFUNCTYPE( ze_result_t, zet_debug_session_handle_t, ze_device_thread_t, c_uint32, c_uint32, c_uint32, c_void_p )
 else:
-    _zetDebugReadRegisters_t = CFUNCTYPE( ze_result_t, zet_debug_session_handle_t, ze_device_thread_t, c_ulong, c_ulong, c_ulong, c_void_p )
+    _zetDebugReadRegisters_t = CFUNCTYPE( ze_result_t, zet_debug_session_handle_t, ze_device_thread_t, c_uint32, c_uint32, c_uint32, c_void_p )
 
 ###############################################################################
 ## @brief Function-pointer for zetDebugWriteRegisters
 if __use_win_types:
-    _zetDebugWriteRegisters_t = WINFUNCTYPE( ze_result_t, zet_debug_session_handle_t, ze_device_thread_t, c_ulong, c_ulong, c_ulong, c_void_p )
+    _zetDebugWriteRegisters_t = WINFUNCTYPE( ze_result_t, zet_debug_session_handle_t, ze_device_thread_t, c_uint32, c_uint32, c_uint32, c_void_p )
 else:
-    _zetDebugWriteRegisters_t = CFUNCTYPE( ze_result_t, zet_debug_session_handle_t, ze_device_thread_t, c_ulong, c_ulong, c_ulong, c_void_p )
+    _zetDebugWriteRegisters_t = CFUNCTYPE( ze_result_t, zet_debug_session_handle_t, ze_device_thread_t, c_uint32, c_uint32, c_uint32, c_void_p )
 
 ###############################################################################
 ## @brief Function-pointer for zetDebugGetThreadRegisterSetProperties
 if __use_win_types:
-    _zetDebugGetThreadRegisterSetProperties_t = WINFUNCTYPE( ze_result_t, zet_debug_session_handle_t, ze_device_thread_t, POINTER(c_ulong), POINTER(zet_debug_regset_properties_t) )
+    _zetDebugGetThreadRegisterSetProperties_t = WINFUNCTYPE( ze_result_t, zet_debug_session_handle_t, ze_device_thread_t, POINTER(c_uint32), POINTER(zet_debug_regset_properties_t) )
 else:
-    _zetDebugGetThreadRegisterSetProperties_t = CFUNCTYPE( ze_result_t, zet_debug_session_handle_t, ze_device_thread_t, POINTER(c_ulong), POINTER(zet_debug_regset_properties_t) )
+    _zetDebugGetThreadRegisterSetProperties_t = CFUNCTYPE( ze_result_t, zet_debug_session_handle_t, ze_device_thread_t, POINTER(c_uint32), POINTER(zet_debug_regset_properties_t) )
 
 
 ###############################################################################
@@ -1715,257 +1280,277 @@ class _zet_dditable_t(Structure):
         ("Debug", _zet_debug_dditable_t)
     ]
 
+###############################################################################
+## @brief Returns the named function-pointer type, defining it if deferred
+def _get_functype(name):
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
+###############################################################################
+## @brief Experimental definitions deferred to _zet_exp until first accessed
+_deferred = frozenset([
+    "_zetCommandListAppendMarkerExp_t",
+    "_zetDeviceCreateMetricGroupsFromMetricsExp_t",
+    "_zetDeviceDisableMetricsExp_t",
+    "_zetDeviceEnableMetricsExp_t",
+    "_zetDeviceGetConcurrentMetricGroupsExp_t",
+    "_zetMetricCreateFromProgrammableExp2_t",
+    "_zetMetricCreateFromProgrammableExp_t",
+    "_zetMetricDecoderCreateExp_t",
+    "_zetMetricDecoderDestroyExp_t",
+    "_zetMetricDecoderGetDecodableMetricsExp_t",
+    "_zetMetricDestroyExp_t",
+    "_zetMetricGroupAddMetricExp_t",
+    "_zetMetricGroupCalculateMetricExportDataExp_t",
+    "_zetMetricGroupCalculateMultipleMetricValuesExp_t",
+    "_zetMetricGroupCloseExp_t",
+    "_zetMetricGroupCreateExp_t",
+    "_zetMetricGroupDestroyExp_t",
+    "_zetMetricGroupGetExportDataExp_t",
+    "_zetMetricGroupGetGlobalTimestampsExp_t",
+    "_zetMetricGroupRemoveMetricExp_t",
+    "_zetMetricProgrammableGetExp_t",
+    "_zetMetricProgrammableGetParamInfoExp_t",
+    "_zetMetricProgrammableGetParamValueInfoExp_t",
+    "_zetMetricProgrammableGetPropertiesExp_t",
+    "_zetMetricTracerCreateExp_t",
+    "_zetMetricTracerDecodeExp_t",
+    "_zetMetricTracerDestroyExp_t",
+    "_zetMetricTracerDisableExp_t",
+    "_zetMetricTracerEnableExp_t",
+    "_zetMetricTracerReadDataExp_t",
+    "zet_export_dma_buf_exp_properties_t",
+    "zet_metric_calculate_exp_desc_t",
+    "zet_metric_decoder_exp_handle_t",
+    "zet_metric_entry_exp_t",
+    "zet_metric_global_timestamps_resolution_exp_t",
+    "zet_metric_group_type_exp_t",
+    "zet_metric_programmable_exp_handle_t",
+    "zet_metric_programmable_exp_properties_t",
+    "zet_metric_programmable_param_info_exp_t",
+    "zet_metric_programmable_param_type_exp_t",
+    "zet_metric_programmable_param_type_exp_v",
+    "zet_metric_programmable_param_value_exp_t",
+    "zet_metric_programmable_param_value_info_exp_t",
+    "zet_metric_source_id_exp_t",
+    "zet_metric_tracer_exp_desc_t",
+    "zet_metric_tracer_exp_handle_t",
+    "zet_value_fp64_range_exp_t",
+    "zet_value_info_exp_t",
+    "zet_value_info_type_exp_t",
+    "zet_value_info_type_exp_v",
+    "zet_value_uint64_range_exp_t",
+])
+
+###############################################################################
+## @brief Defines the deferred experimental definitions on first access
+def __getattr__(name):
+    if name in _deferred:
+        from . import _zet_exp
+        for deferred in _deferred:
+            globals()[deferred] = getattr(_zet_exp, deferred)
+        return globals()[name]
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+###############################################################################
+## @brief Lists the deferred experimental definitions before they are defined
+def __dir__():
+    return sorted(set(globals()) | _deferred)
+
 ###############################################################################
 ## @brief zet device-driver interfaces
 class ZET_DDI:
-    def __init__(self, version : ze_api_version_t):
+    ## @brief Map of table name to (proc-address table getter, table type)
+    _tables = {
+        "MetricProgrammableExp" : ("zetGetMetricProgrammableExpProcAddrTable", _zet_metric_programmable_exp_dditable_t),
+        "MetricTracerExp" : ("zetGetMetricTracerExpProcAddrTable", _zet_metric_tracer_exp_dditable_t),
+        "MetricDecoderExp" : ("zetGetMetricDecoderExpProcAddrTable", _zet_metric_decoder_exp_dditable_t),
+        "Device" : ("zetGetDeviceProcAddrTable", _zet_device_dditable_t),
+        "DeviceExp" : ("zetGetDeviceExpProcAddrTable", _zet_device_exp_dditable_t),
+        "Context" : ("zetGetContextProcAddrTable", _zet_context_dditable_t),
+        "CommandList" : ("zetGetCommandListProcAddrTable", _zet_command_list_dditable_t),
+        "CommandListExp" : ("zetGetCommandListExpProcAddrTable", _zet_command_list_exp_dditable_t),
+        "Module" : ("zetGetModuleProcAddrTable", _zet_module_dditable_t),
+        "Kernel" : ("zetGetKernelProcAddrTable", _zet_kernel_dditable_t),
+        "Metric" : ("zetGetMetricProcAddrTable", _zet_metric_dditable_t),
+        "MetricExp" : ("zetGetMetricExpProcAddrTable", _zet_metric_exp_dditable_t),
+        "MetricGroup" : ("zetGetMetricGroupProcAddrTable", _zet_metric_group_dditable_t),
+        "MetricGroupExp" : ("zetGetMetricGroupExpProcAddrTable", _zet_metric_group_exp_dditable_t),
+        "MetricStreamer" : ("zetGetMetricStreamerProcAddrTable", _zet_metric_streamer_dditable_t),
+        "MetricQueryPool" : ("zetGetMetricQueryPoolProcAddrTable", _zet_metric_query_pool_dditable_t),
+        "MetricQuery" : ("zetGetMetricQueryProcAddrTable", _zet_metric_query_dditable_t),
+        "TracerExp" : ("zetGetTracerExpProcAddrTable", _zet_tracer_exp_dditable_t),
+        "Debug" : ("zetGetDebugProcAddrTable", _zet_debug_dditable_t),
+    }
+
+    ## @brief Map of function name to (table name, table member, function-pointer type name)
+    _functions = {
+        "zetMetricProgrammableGetExp" : ("MetricProgrammableExp", "pfnGetExp", "_zetMetricProgrammableGetExp_t"),
+        "zetMetricProgrammableGetPropertiesExp" : ("MetricProgrammableExp", "pfnGetPropertiesExp", "_zetMetricProgrammableGetPropertiesExp_t"),
+        "zetMetricProgrammableGetParamInfoExp" : ("MetricProgrammableExp", "pfnGetParamInfoExp", "_zetMetricProgrammableGetParamInfoExp_t"),
+        "zetMetricProgrammableGetParamValueInfoExp" : ("MetricProgrammableExp", "pfnGetParamValueInfoExp", "_zetMetricProgrammableGetParamValueInfoExp_t"),
+        "zetMetricTracerCreateExp" : ("MetricTracerExp", "pfnCreateExp", "_zetMetricTracerCreateExp_t"),
+        "zetMetricTracerDestroyExp" : ("MetricTracerExp", "pfnDestroyExp", "_zetMetricTracerDestroyExp_t"),
+        "zetMetricTracerEnableExp" : ("MetricTracerExp", "pfnEnableExp", "_zetMetricTracerEnableExp_t"),
+        "zetMetricTracerDisableExp" : ("MetricTracerExp", "pfnDisableExp", "_zetMetricTracerDisableExp_t"),
+        "zetMetricTracerReadDataExp" : ("MetricTracerExp", "pfnReadDataExp", "_zetMetricTracerReadDataExp_t"),
+        "zetMetricTracerDecodeExp" : ("MetricTracerExp", "pfnDecodeExp", "_zetMetricTracerDecodeExp_t"),
+        "zetMetricDecoderCreateExp" : ("MetricDecoderExp", "pfnCreateExp", "_zetMetricDecoderCreateExp_t"),
+        "zetMetricDecoderDestroyExp" : ("MetricDecoderExp", "pfnDestroyExp", "_zetMetricDecoderDestroyExp_t"),
+        "zetMetricDecoderGetDecodableMetricsExp" : ("MetricDecoderExp", "pfnGetDecodableMetricsExp", "_zetMetricDecoderGetDecodableMetricsExp_t"),
+        "zetDeviceGetDebugProperties" : ("Device", "pfnGetDebugProperties", "_zetDeviceGetDebugProperties_t"),
+        "zetDeviceGetConcurrentMetricGroupsExp" : ("DeviceExp", "pfnGetConcurrentMetricGroupsExp", "_zetDeviceGetConcurrentMetricGroupsExp_t"),
+        "zetDeviceCreateMetricGroupsFromMetricsExp" : ("DeviceExp", "pfnCreateMetricGroupsFromMetricsExp", "_zetDeviceCreateMetricGroupsFromMetricsExp_t"),
+        "zetDeviceEnableMetricsExp" : ("DeviceExp", "pfnEnableMetricsExp", "_zetDeviceEnableMetricsExp_t"),
+        "zetDeviceDisableMetricsExp" : ("DeviceExp", "pfnDisableMetricsExp", "_zetDeviceDisableMetricsExp_t"),
+        "zetContextActivateMetricGroups" : ("Context", "pfnActivateMetricGroups", "_zetContextActivateMetricGroups_t"),
+        "zetCommandListAppendMetricStreamerMarker" : ("CommandList", "pfnAppendMetricStreamerMarker", "_zetCommandListAppendMetricStreamerMarker_t"),
+        "zetCommandListAppendMetricQueryBegin" : ("CommandList", "pfnAppendMetricQueryBegin", "_zetCommandListAppendMetricQueryBegin_t"),
+        "zetCommandListAppendMetricQueryEnd" : ("CommandList", "pfnAppendMetricQueryEnd", "_zetCommandListAppendMetricQueryEnd_t"),
+        "zetCommandListAppendMetricMemoryBarrier" : ("CommandList", "pfnAppendMetricMemoryBarrier", "_zetCommandListAppendMetricMemoryBarrier_t"),
+        "zetCommandListAppendMarkerExp" : ("CommandListExp", "pfnAppendMarkerExp", "_zetCommandListAppendMarkerExp_t"),
+        "zetModuleGetDebugInfo" : ("Module", "pfnGetDebugInfo", "_zetModuleGetDebugInfo_t"),
+        "zetKernelGetProfileInfo" : ("Kernel", "pfnGetProfileInfo", "_zetKernelGetProfileInfo_t"),
+        "zetMetricGet" : ("Metric", "pfnGet", "_zetMetricGet_t"),
+        "zetMetricGetProperties" : ("Metric", "pfnGetProperties", "_zetMetricGetProperties_t"),
+        "zetMetricCreateFromProgrammableExp" : ("MetricExp", "pfnCreateFromProgrammableExp", "_zetMetricCreateFromProgrammableExp_t"),
+        "zetMetricDestroyExp" : ("MetricExp", "pfnDestroyExp", "_zetMetricDestroyExp_t"),
+        "zetMetricCreateFromProgrammableExp2" : ("MetricExp", "pfnCreateFromProgrammableExp2", "_zetMetricCreateFromProgrammableExp2_t"),
+        "zetMetricGroupGet" : ("MetricGroup", "pfnGet", "_zetMetricGroupGet_t"),
+        "zetMetricGroupGetProperties" : ("MetricGroup", "pfnGetProperties", "_zetMetricGroupGetProperties_t"),
+        "zetMetricGroupCalculateMetricValues" : ("MetricGroup", "pfnCalculateMetricValues", "_zetMetricGroupCalculateMetricValues_t"),
+        "zetMetricGroupCalculateMultipleMetricValuesExp" : ("MetricGroupExp", "pfnCalculateMultipleMetricValuesExp", "_zetMetricGroupCalculateMultipleMetricValuesExp_t"),
+        "zetMetricGroupGetGlobalTimestampsExp" : ("MetricGroupExp", "pfnGetGlobalTimestampsExp", "_zetMetricGroupGetGlobalTimestampsExp_t"),
+        "zetMetricGroupGetExportDataExp" : ("MetricGroupExp", "pfnGetExportDataExp", "_zetMetricGroupGetExportDataExp_t"),
+        "zetMetricGroupCalculateMetricExportDataExp" : ("MetricGroupExp", "pfnCalculateMetricExportDataExp", "_zetMetricGroupCalculateMetricExportDataExp_t"),
+        "zetMetricGroupCreateExp" : ("MetricGroupExp", "pfnCreateExp", "_zetMetricGroupCreateExp_t"),
+        "zetMetricGroupAddMetricExp" : ("MetricGroupExp", "pfnAddMetricExp", "_zetMetricGroupAddMetricExp_t"),
+        "zetMetricGroupRemoveMetricExp" : ("MetricGroupExp", "pfnRemoveMetricExp", "_zetMetricGroupRemoveMetricExp_t"),
+        "zetMetricGroupCloseExp" : ("MetricGroupExp", "pfnCloseExp", "_zetMetricGroupCloseExp_t"),
+        "zetMetricGroupDestroyExp" : ("MetricGroupExp", "pfnDestroyExp", "_zetMetricGroupDestroyExp_t"),
+        "zetMetricStreamerOpen" : ("MetricStreamer", "pfnOpen", "_zetMetricStreamerOpen_t"),
+        "zetMetricStreamerClose" : ("MetricStreamer", "pfnClose", "_zetMetricStreamerClose_t"),
+        "zetMetricStreamerReadData" : ("MetricStreamer", "pfnReadData", "_zetMetricStreamerReadData_t"),
+        "zetMetricQueryPoolCreate" : ("MetricQueryPool", "pfnCreate", "_zetMetricQueryPoolCreate_t"),
+        "zetMetricQueryPoolDestroy" : ("MetricQueryPool", "pfnDestroy", "_zetMetricQueryPoolDestroy_t"),
+        "zetMetricQueryCreate" : ("MetricQuery", "pfnCreate", "_zetMetricQueryCreate_t"),
+        "zetMetricQueryDestroy" : ("MetricQuery", "pfnDestroy", "_zetMetricQueryDestroy_t"),
+        "zetMetricQueryReset" : ("MetricQuery", "pfnReset", "_zetMetricQueryReset_t"),
+        "zetMetricQueryGetData" : ("MetricQuery", "pfnGetData", "_zetMetricQueryGetData_t"),
+        "zetTracerExpCreate" : ("TracerExp", "pfnCreate", "_zetTracerExpCreate_t"),
+        "zetTracerExpDestroy" : ("TracerExp", "pfnDestroy", "_zetTracerExpDestroy_t"),
+        "zetTracerExpSetPrologues" : ("TracerExp", "pfnSetPrologues", "_zetTracerExpSetPrologues_t"),
+        "zetTracerExpSetEpilogues" : ("TracerExp", "pfnSetEpilogues", "_zetTracerExpSetEpilogues_t"),
+        "zetTracerExpSetEnabled" : ("TracerExp", "pfnSetEnabled", "_zetTracerExpSetEnabled_t"),
+        "zetDebugAttach" : ("Debug", "pfnAttach", "_zetDebugAttach_t"),
+        "zetDebugDetach" : ("Debug", "pfnDetach", "_zetDebugDetach_t"),
+        "zetDebugReadEvent" : ("Debug", "pfnReadEvent", "_zetDebugReadEvent_t"),
+        "zetDebugAcknowledgeEvent" : ("Debug", "pfnAcknowledgeEvent", "_zetDebugAcknowledgeEvent_t"),
+        "zetDebugInterrupt" : ("Debug", "pfnInterrupt", "_zetDebugInterrupt_t"),
+        "zetDebugResume" : ("Debug", "pfnResume", "_zetDebugResume_t"),
+        "zetDebugReadMemory" : ("Debug", "pfnReadMemory", "_zetDebugReadMemory_t"),
+        "zetDebugWriteMemory" : ("Debug", "pfnWriteMemory", "_zetDebugWriteMemory_t"),
+        "zetDebugGetRegisterSetProperties" : ("Debug", "pfnGetRegisterSetProperties", "_zetDebugGetRegisterSetProperties_t"),
+        "zetDebugReadRegisters" : ("Debug", "pfnReadRegisters", "_zetDebugReadRegisters_t"),
+        "zetDebugWriteRegisters" : ("Debug", "pfnWriteRegisters", "_zetDebugWriteRegisters_t"),
+        "zetDebugGetThreadRegisterSetProperties" : ("Debug", "pfnGetThreadRegisterSetProperties", "_zetDebugGetThreadRegisterSetProperties_t"),
+    }
+
+    _functype = staticmethod(_get_functype)
+
+    def __init__(self, version : ze_api_version_t, lazy : bool = False, strict : bool = True):
         # load the ze_loader library
-        if "Windows" == platform.uname()[0]:
+        if "win32" == sys.platform:
             self.__dll = WinDLL("ze_loader.dll")
         else:
             self.__dll = CDLL("ze_loader.so")
+        self.__version = version
+        self.__strict = strict
 
         # fill the ddi tables
         self.__dditable = _zet_dditable_t()
+        self.__loaded = {}
+        self.__results = {}
+        self.__fastcall = None
 
-        # call driver to get function pointers
-        _MetricProgrammableExp = _zet_metric_programmable_exp_dditable_t()
-        r = ze_result_v(self.__dll.zetGetMetricProgrammableExpProcAddrTable(version, byref(_MetricProgrammableExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.MetricProgrammableExp = _MetricProgrammableExp
-
-        # attach function interface to function address
-        self.zetMetricProgrammableGetExp = _zetMetricProgrammableGetExp_t(self.__dditable.MetricProgrammableExp.pfnGetExp)
-        self.zetMetricProgrammableGetPropertiesExp = _zetMetricProgrammableGetPropertiesExp_t(self.__dditable.MetricProgrammableExp.pfnGetPropertiesExp)
-        self.zetMetricProgrammableGetParamInfoExp = _zetMetricProgrammableGetParamInfoExp_t(self.__dditable.MetricProgrammableExp.pfnGetParamInfoExp)
-        self.zetMetricProgrammableGetParamValueInfoExp = _zetMetricProgrammableGetParamValueInfoExp_t(self.__dditable.MetricProgrammableExp.pfnGetParamValueInfoExp)
-
-        # call driver to get function pointers
-        _MetricTracerExp = _zet_metric_tracer_exp_dditable_t()
-        r = ze_result_v(self.__dll.zetGetMetricTracerExpProcAddrTable(version, byref(_MetricTracerExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.MetricTracerExp = _MetricTracerExp
-
-        # attach function interface to function address
-        self.zetMetricTracerCreateExp = _zetMetricTracerCreateExp_t(self.__dditable.MetricTracerExp.pfnCreateExp)
-        self.zetMetricTracerDestroyExp = _zetMetricTracerDestroyExp_t(self.__dditable.MetricTracerExp.pfnDestroyExp)
-        self.zetMetricTracerEnableExp = _zetMetricTracerEnableExp_t(self.__dditable.MetricTracerExp.pfnEnableExp)
-        self.zetMetricTracerDisableExp = _zetMetricTracerDisableExp_t(self.__dditable.MetricTracerExp.pfnDisableExp)
-        self.zetMetricTracerReadDataExp = _zetMetricTracerReadDataExp_t(self.__dditable.MetricTracerExp.pfnReadDataExp)
-        self.zetMetricTracerDecodeExp = _zetMetricTracerDecodeExp_t(self.__dditable.MetricTracerExp.pfnDecodeExp)
-
-        # call driver to get function pointers
-        _MetricDecoderExp = _zet_metric_decoder_exp_dditable_t()
-        r = ze_result_v(self.__dll.zetGetMetricDecoderExpProcAddrTable(version, byref(_MetricDecoderExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.MetricDecoderExp = _MetricDecoderExp
-
-        # attach function interface to function address
-        self.zetMetricDecoderCreateExp = _zetMetricDecoderCreateExp_t(self.__dditable.MetricDecoderExp.pfnCreateExp)
-        self.zetMetricDecoderDestroyExp = _zetMetricDecoderDestroyExp_t(self.__dditable.MetricDecoderExp.pfnDestroyExp)
-        self.zetMetricDecoderGetDecodableMetricsExp = _zetMetricDecoderGetDecodableMetricsExp_t(self.__dditable.MetricDecoderExp.pfnGetDecodableMetricsExp)
-
-        # call driver to get function pointers
-        _Device = _zet_device_dditable_t()
-        r = ze_result_v(self.__dll.zetGetDeviceProcAddrTable(version, byref(_Device)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Device = _Device
-
-        # attach function interface to function address
-        self.zetDeviceGetDebugProperties = _zetDeviceGetDebugProperties_t(self.__dditable.Device.pfnGetDebugProperties)
-
-        # call driver to get function pointers
-        _DeviceExp = _zet_device_exp_dditable_t()
-        r = ze_result_v(self.__dll.zetGetDeviceExpProcAddrTable(version, byref(_DeviceExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.DeviceExp = _DeviceExp
-
-        # attach function interface to function address
-        self.zetDeviceGetConcurrentMetricGroupsExp = _zetDeviceGetConcurrentMetricGroupsExp_t(self.__dditable.DeviceExp.pfnGetConcurrentMetricGroupsExp)
-        self.zetDeviceCreateMetricGroupsFromMetricsExp = _zetDeviceCreateMetricGroupsFromMetricsExp_t(self.__dditable.DeviceExp.pfnCreateMetricGroupsFromMetricsExp)
-        self.zetDeviceEnableMetricsExp = _zetDeviceEnableMetricsExp_t(self.__dditable.DeviceExp.pfnEnableMetricsExp)
-        self.zetDeviceDisableMetricsExp = _zetDeviceDisableMetricsExp_t(self.__dditable.DeviceExp.pfnDisableMetricsExp)
-
-        # call driver to get function pointers
-        _Context = _zet_context_dditable_t()
-        r = ze_result_v(self.__dll.zetGetContextProcAddrTable(version, byref(_Context)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Context = _Context
-
-        # attach function interface to function address
-        self.zetContextActivateMetricGroups = _zetContextActivateMetricGroups_t(self.__dditable.Context.pfnActivateMetricGroups)
-
-        # call driver to get function pointers
-        _CommandList = _zet_command_list_dditable_t()
-        r = ze_result_v(self.__dll.zetGetCommandListProcAddrTable(version, byref(_CommandList)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.CommandList = _CommandList
-
-        # attach function interface to function address
-        self.zetCommandListAppendMetricStreamerMarker = _zetCommandListAppendMetricStreamerMarker_t(self.__dditable.CommandList.pfnAppendMetricStreamerMarker)
-        self.zetCommandListAppendMetricQueryBegin = _zetCommandListAppendMetricQueryBegin_t(self.__dditable.CommandList.pfnAppendMetricQueryBegin)
-        self.zetCommandListAppendMetricQueryEnd = _zetCommandListAppendMetricQueryEnd_t(self.__dditable.CommandList.pfnAppendMetricQueryEnd)
-        self.zetCommandListAppendMetricMemoryBarrier = _zetCommandListAppendMetricMemoryBarrier_t(self.__dditable.CommandList.pfnAppendMetricMemoryBarrier)
-
-        # call driver to get function pointers
-        _CommandListExp = _zet_command_list_exp_dditable_t()
-        r = ze_result_v(self.__dll.zetGetCommandListExpProcAddrTable(version, byref(_CommandListExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.CommandListExp = _CommandListExp
-
-        # attach function interface to function address
-        self.zetCommandListAppendMarkerExp = _zetCommandListAppendMarkerExp_t(self.__dditable.CommandListExp.pfnAppendMarkerExp)
-
-        # call driver to get function pointers
-        _Module = _zet_module_dditable_t()
-        r = ze_result_v(self.__dll.zetGetModuleProcAddrTable(version, byref(_Module)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Module = _Module
-
-        # attach function interface to function address
-        self.zetModuleGetDebugInfo = _zetModuleGetDebugInfo_t(self.__dditable.Module.pfnGetDebugInfo)
-
-        # call driver to get function pointers
-        _Kernel = _zet_kernel_dditable_t()
-        r = ze_result_v(self.__dll.zetGetKernelProcAddrTable(version, byref(_Kernel)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Kernel = _Kernel
-
-        # attach function interface to function address
-        self.zetKernelGetProfileInfo = _zetKernelGetProfileInfo_t(self.__dditable.Kernel.pfnGetProfileInfo)
-
-        # call driver to get function pointers
-        _Metric = _zet_metric_dditable_t()
-        r = ze_result_v(self.__dll.zetGetMetricProcAddrTable(version, byref(_Metric)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Metric = _Metric
-
-        # attach function interface to function address
-        self.zetMetricGet = _zetMetricGet_t(self.__dditable.Metric.pfnGet)
-        self.zetMetricGetProperties = _zetMetricGetProperties_t(self.__dditable.Metric.pfnGetProperties)
-
-        # call driver to get function pointers
-        _MetricExp = _zet_metric_exp_dditable_t()
-        r = ze_result_v(self.__dll.zetGetMetricExpProcAddrTable(version, byref(_MetricExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.MetricExp = _MetricExp
-
-        # attach function interface to function address
-        self.zetMetricCreateFromProgrammableExp = _zetMetricCreateFromProgrammableExp_t(self.__dditable.MetricExp.pfnCreateFromProgrammableExp)
-        self.zetMetricDestroyExp = _zetMetricDestroyExp_t(self.__dditable.MetricExp.pfnDestroyExp)
-        self.zetMetricCreateFromProgrammableExp2 = _zetMetricCreateFromProgrammableExp2_t(self.__dditable.MetricExp.pfnCreateFromProgrammableExp2)
-
-        # call driver to get function pointers
-        _MetricGroup = _zet_metric_group_dditable_t()
-        r = ze_result_v(self.__dll.zetGetMetricGroupProcAddrTable(version, byref(_MetricGroup)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.MetricGroup = _MetricGroup
-
-        # attach function interface to function address
-        self.zetMetricGroupGet = _zetMetricGroupGet_t(self.__dditable.MetricGroup.pfnGet)
-        self.zetMetricGroupGetProperties = _zetMetricGroupGetProperties_t(self.__dditable.MetricGroup.pfnGetProperties)
-        self.zetMetricGroupCalculateMetricValues = _zetMetricGroupCalculateMetricValues_t(self.__dditable.MetricGroup.pfnCalculateMetricValues)
-
-        # call driver to get function pointers
-        _MetricGroupExp = _zet_metric_group_exp_dditable_t()
-        r = ze_result_v(self.__dll.zetGetMetricGroupExpProcAddrTable(version, byref(_MetricGroupExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.MetricGroupExp = _MetricGroupExp
-
-        # attach function interface to function address
-        self.zetMetricGroupCalculateMultipleMetricValuesExp = _zetMetricGroupCalculateMultipleMetricValuesExp_t(self.__dditable.MetricGroupExp.pfnCalculateMultipleMetricValuesExp)
-        self.zetMetricGroupGetGlobalTimestampsExp = _zetMetricGroupGetGlobalTimestampsExp_t(self.__dditable.MetricGroupExp.pfnGetGlobalTimestampsExp)
-        self.zetMetricGroupGetExportDataExp = _zetMetricGroupGetExportDataExp_t(self.__dditable.MetricGroupExp.pfnGetExportDataExp)
-        self.zetMetricGroupCalculateMetricExportDataExp = _zetMetricGroupCalculateMetricExportDataExp_t(self.__dditable.MetricGroupExp.pfnCalculateMetricExportDataExp)
-        self.zetMetricGroupCreateExp = _zetMetricGroupCreateExp_t(self.__dditable.MetricGroupExp.pfnCreateExp)
-        self.zetMetricGroupAddMetricExp = _zetMetricGroupAddMetricExp_t(self.__dditable.MetricGroupExp.pfnAddMetricExp)
-        self.zetMetricGroupRemoveMetricExp = _zetMetricGroupRemoveMetricExp_t(self.__dditable.MetricGroupExp.pfnRemoveMetricExp)
-        self.zetMetricGroupCloseExp = _zetMetricGroupCloseExp_t(self.__dditable.MetricGroupExp.pfnCloseExp)
-        self.zetMetricGroupDestroyExp = _zetMetricGroupDestroyExp_t(self.__dditable.MetricGroupExp.pfnDestroyExp)
-
-        # call driver to get function pointers
-        _MetricStreamer = _zet_metric_streamer_dditable_t()
-        r = ze_result_v(self.__dll.zetGetMetricStreamerProcAddrTable(version, byref(_MetricStreamer)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.MetricStreamer = _MetricStreamer
-
-        # attach function interface to function address
-        self.zetMetricStreamerOpen = _zetMetricStreamerOpen_t(self.__dditable.MetricStreamer.pfnOpen)
-        self.zetMetricStreamerClose = _zetMetricStreamerClose_t(self.__dditable.MetricStreamer.pfnClose)
-        self.zetMetricStreamerReadData = _zetMetricStreamerReadData_t(self.__dditable.MetricStreamer.pfnReadData)
-
-        # call driver to get function pointers
-        _MetricQueryPool = _zet_metric_query_pool_dditable_t()
-        r = ze_result_v(self.__dll.zetGetMetricQueryPoolProcAddrTable(version, byref(_MetricQueryPool)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.MetricQueryPool = _MetricQueryPool
-
-        # attach function interface to function address
-        self.zetMetricQueryPoolCreate = _zetMetricQueryPoolCreate_t(self.__dditable.MetricQueryPool.pfnCreate)
-        self.zetMetricQueryPoolDestroy = _zetMetricQueryPoolDestroy_t(self.__dditable.MetricQueryPool.pfnDestroy)
-
-        # call driver to get function pointers
-        _MetricQuery = _zet_metric_query_dditable_t()
-        r = ze_result_v(self.__dll.zetGetMetricQueryProcAddrTable(version, byref(_MetricQuery)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.MetricQuery = _MetricQuery
-
-        # attach function interface to function address
-        self.zetMetricQueryCreate = _zetMetricQueryCreate_t(self.__dditable.MetricQuery.pfnCreate)
-        self.zetMetricQueryDestroy = _zetMetricQueryDestroy_t(self.__dditable.MetricQuery.pfnDestroy)
-        self.zetMetricQueryReset = _zetMetricQueryReset_t(self.__dditable.MetricQuery.pfnReset)
-        self.zetMetricQueryGetData = _zetMetricQueryGetData_t(self.__dditable.MetricQuery.pfnGetData)
-
-        # call driver to get function pointers
-        _TracerExp = _zet_tracer_exp_dditable_t()
-        r = ze_result_v(self.__dll.zetGetTracerExpProcAddrTable(version, byref(_TracerExp)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.TracerExp = _TracerExp
-
-        # attach function interface to function address
-        self.zetTracerExpCreate = _zetTracerExpCreate_t(self.__dditable.TracerExp.pfnCreate)
-        self.zetTracerExpDestroy = _zetTracerExpDestroy_t(self.__dditable.TracerExp.pfnDestroy)
-        self.zetTracerExpSetPrologues = _zetTracerExpSetPrologues_t(self.__dditable.TracerExp.pfnSetPrologues)
-        self.zetTracerExpSetEpilogues = _zetTracerExpSetEpilogues_t(self.__dditable.TracerExp.pfnSetEpilogues)
-        self.zetTracerExpSetEnabled = _zetTracerExpSetEnabled_t(self.__dditable.TracerExp.pfnSetEnabled)
-
-        # call driver to get function pointers
-        _Debug = _zet_debug_dditable_t()
-        r = ze_result_v(self.__dll.zetGetDebugProcAddrTable(version, byref(_Debug)))
-        if r != ze_result_v.SUCCESS:
-            raise Exception(r)
-        self.__dditable.Debug = _Debug
-
-        # attach function interface to function address
-        self.zetDebugAttach = _zetDebugAttach_t(self.__dditable.Debug.pfnAttach)
-        self.zetDebugDetach = _zetDebugDetach_t(self.__dditable.Debug.pfnDetach)
-        self.zetDebugReadEvent = _zetDebugReadEvent_t(self.__dditable.Debug.pfnReadEvent)
-        self.zetDebugAcknowledgeEvent = _zetDebugAcknowledgeEvent_t(self.__dditable.Debug.pfnAcknowledgeEvent)
-        self.zetDebugInterrupt = _zetDebugInterrupt_t(self.__dditable.Debug.pfnInterrupt)
-        self.zetDebugResume = _zetDebugResume_t(self.__dditable.Debug.pfnResume)
-        self.zetDebugReadMemory = _zetDebugReadMemory_t(self.__dditable.Debug.pfnReadMemory)
-        self.zetDebugWriteMemory = _zetDebugWriteMemory_t(self.__dditable.Debug.pfnWriteMemory)
-        self.zetDebugGetRegisterSetProperties = _zetDebugGetRegisterSetProperties_t(self.__dditable.Debug.pfnGetRegisterSetProperties)
-        self.zetDebugReadRegisters = _zetDebugReadRegisters_t(self.__dditable.Debug.pfnReadRegisters)
-        self.zetDebugWriteRegisters = _zetDebugWriteRegisters_t(self.__dditable.Debug.pfnWriteRegisters)
-        self.zetDebugGetThreadRegisterSetProperties = _zetDebugGetThreadRegisterSetProperties_t(self.__dditable.Debug.pfnGetThreadRegisterSetProperties)
+        # in lazy mode, tables are fetched and functions bound on first access
+        if not lazy:
+            for name in self._functions:
+                getattr(self, name)
 
         # success!
+
+    ## @brief Returns the named ddi table, calling the driver to fill it on first use;
+    ##        in non-strict mode, returns None if the driver does not provide the table
+    def _get_table(self, table):
+        if table not in self.__loaded:
+            # call driver to get function pointers
+            getter, tabletype = self._tables[table]
+            _table = tabletype()
+            try:
+                r = ze_result_v(getattr(self.__dll, getter)(self.__version, byref(_table)))
+            except AttributeError:
+                if self.__strict:
+                    raise
+                r = ze_result_v.ERROR_UNSUPPORTED_FEATURE
+            self.__results[table] = r
+            if r != ze_result_v.SUCCESS:
+                if self.__strict:
+                    raise Exception(r)
+                self.__loaded[table] = None
+            else:
+                setattr(self.__dditable, table, _table)
+                self.__loaded[table] = getattr(self.__dditable, table)
+        return self.__loaded[table]
+
+    ## @brief Fast-call view of this interface; see ::ZE_FASTCALL
+    @property
+    def fastcall(self):
+        if self.__fastcall is None:
+            self.__fastcall = ZE_FASTCALL(self)
+        return self.__fastcall
+
+    ## @brief Map of table name to ddi table, or None if not provided by the driver
+    @property
+    def tables(self):
+        return {table : self._get_table(table) for table in self._tables}
+
+    ## @brief Set of table names provided by the driver
+    @property
+    def supported_tables(self):
+        return set(table for table, _table in self.tables.items() if _table is not None)
+
+    ## @brief Returns True if the driver provides the named function
+    def is_supported(self, name):
+        table, pfn, _ = self._functions[name]
+        _table = self._get_table(table)
+        return _table is not None and bool(getattr(_table, pfn))
+
+    ## @brief Binds the named function on first access and caches it on the instance
+    def __getattr__(self, name):
+        try:
+            table, pfn, functype = self._functions[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+        _table = self._get_table(table)
+        if _table is None or not getattr(_table, pfn):
+            # calling a function the driver did not provide raises instead of crashing
+            result = self.__results.get(table, ze_result_v.ERROR_UNSUPPORTED_FEATURE)
+            if result == ze_result_v.SUCCESS:
+                result = ze_result_v.ERROR_UNSUPPORTED_FEATURE
+            def func(*args):
+                raise UnsupportedFunctionError(name, table, result)
+        else:
+            # attach function interface to function address
+            func = _get_functype(functype)(getattr(_table, pfn))
+        setattr(self, name, func)
+        return func
+
+###############################################################################
+## @brief Names of 'from level_zero.zet import *': every public name, including
+##        the deferred experimental definitions, which the import defines
+__all__ = sorted(set(name for name in globals() if not name.startswith("_")) |
+                 set(name for name in _deferred if not name.startswith("_")))
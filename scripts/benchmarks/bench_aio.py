@@ -0,0 +1,116 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import random
+import time
+from ctypes import *
+import stub_loader
+from level_zero import ze, aio
+
+"""
+    native events completing at a deadline set at creation, on CLOCK_MONOTONIC
+    as time.monotonic_ns(); a handle is the index of its deadline
+"""
+FAKE_EVENTS = r'''
+#include <stdint.h>
+#include <time.h>
+static uint64_t deadlines[1 << 20];
+static uint64_t now_ns(void) {
+    struct timespec t; clock_gettime(CLOCK_MONOTONIC, &t);
+    return (uint64_t)t.tv_sec * 1000000000ull + (uint64_t)t.tv_nsec; }
+uint64_t fake_event_create(uint64_t index, uint64_t delay_ns) { return deadlines[index] = now_ns() + delay_ns; }
+int fake_query(void *h) { return now_ns() >= deadlines[(uintptr_t)h] ? 0 : 1; }
+int fake_synchronize(void *h, uint64_t timeout) {
+    uint64_t deadline = deadlines[(uintptr_t)h], now = now_ns();
+    if (now >= deadline) return 0;
+    uint64_t end = (timeout == UINT64_MAX || now + timeout > deadline) ? deadline : now + timeout;
+    struct timespec t = { (time_t)(end / 1000000000ull), (long)(end % 1000000000ull) };
+    clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME, &t, NULL);
+    return now_ns() >= deadline ? 0 : 1; }
+'''
+
+"""
+    compiles the fake event library
+"""
+def build_fake():
+    fake = stub_loader.build_library(FAKE_EVENTS, "ze_aio_")
+    fake.fake_event_create.restype = c_uint64
+    fake.fake_event_create.argtypes = [c_uint64, c_uint64]
+    return fake
+
+"""
+    returns a ZE_DDI whose event and fence functions are the fake events
+"""
+def make_ddi(fake):
+    functions = {
+        "zeEventQueryStatus" : "fake_query",
+        "zeEventHostSynchronize" : "fake_synchronize",
+        "zeFenceQueryStatus" : "fake_query",
+        "zeFenceHostSynchronize" : "fake_synchronize",
+    }
+    overrides = stub_loader.native_overrides(ze.ZE_DDI, fake, functions)
+    with stub_loader.patched_loader(ze, stub_loader.StubLoader(ze.ZE_DDI, overrides=overrides)):
+        return ze.ZE_DDI(ze.ZE_API_VERSION_CURRENT_M, lazy=True)
+
+"""
+    creates 'count' events completing within 'max_delay' seconds and awaits them
+    all with 'wait'; returns the wall time and the sorted lateness of each
+    completion past its deadline, in seconds
+"""
+async def run(fake, count, max_delay, wait):
+    lateness = []
+
+    async def one(index, delay):
+        deadline = fake.fake_event_create(index, delay)
+        await wait(index)
+        lateness.append((time.monotonic_ns() - deadline) * 1e-9)
+
+    start = time.perf_counter()
+    tasks = [one(i, int(random.uniform(0, max_delay) * 1e9)) for i in range(1, count + 1)]
+    await asyncio.gather(*tasks)
+    return time.perf_counter() - start, sorted(lateness)
+
+"""
+    prints one result line
+"""
+def report(name, elapsed, lateness, threads):
+    p50 = lateness[len(lateness) // 2] * 1e3
+    p99 = lateness[int(len(lateness) * 0.99)] * 1e3
+    print("%-28s %8.1f ms %10.3f ms %10.3f ms %8d" % (name, elapsed * 1e3, p50, p99, threads))
+
+"""
+    compares the waiter pool with one executor thread per blocking
+    zeEventHostSynchronize
+"""
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=5000, help="number of outstanding events.")
+    parser.add_argument("--max-delay", type=float, default=0.05, help="maximum event completion delay in seconds.")
+    parser.add_argument("--threads", type=int, default=2, help="waiter pool threads.")
+    parser.add_argument("--executor-threads", type=int, default=64, help="executor threads of the blocking baseline.")
+    args = parser.parse_args()
+
+    fake = build_fake()
+    ddi = make_ddi(fake)
+
+    print("%-28s %11s %13s %13s %8s" % ("", "wall", "p50 late", "p99 late", "threads"))
+    with aio.Waiter(threads=args.threads) as waiter:
+        elapsed, lateness = asyncio.run(run(fake, args.events, args.max_delay,
+            lambda h: waiter.wait_event(ddi, h)))
+        report("aio.Waiter", elapsed, lateness, args.threads)
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=args.executor_threads)
+
+    async def blocking(h):
+        await asyncio.get_running_loop().run_in_executor(executor, ddi.zeEventHostSynchronize, h, 0xffffffffffffffff)
+
+    elapsed, lateness = asyncio.run(run(fake, args.events, args.max_delay, blocking))
+    report("executor + HostSynchronize", elapsed, lateness, args.executor_threads)
+    executor.shutdown()
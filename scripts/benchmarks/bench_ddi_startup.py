@@ -0,0 +1,48 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import argparse
+import time
+import stub_loader
+from level_zero import ze
+
+"""
+    returns the mean time in microseconds of 'count' calls to 'func'
+"""
+def measure(func, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return (time.perf_counter() - start) * 1e6 / count
+
+"""
+    compares eager and lazy construction of ZE_DDI against a stub loader
+"""
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=200, help="number of constructions to average over.")
+    parser.add_argument("--calls", type=int, default=10, help="number of distinct functions touched after lazy construction.")
+    args = parser.parse_args()
+
+    loader = stub_loader.StubLoader(ze.ZE_DDI)
+    names = list(ze.ZE_DDI._functions)[:args.calls]
+    version = ze.ZE_API_VERSION_CURRENT_M
+
+    def lazy_and_touch():
+        ddi = ze.ZE_DDI(version, lazy=True)
+        for name in names:
+            getattr(ddi, name)
+
+    with stub_loader.patched_loader(ze, loader):
+        eager = measure(lambda: ze.ZE_DDI(version), args.count)
+        lazy = measure(lambda: ze.ZE_DDI(version, lazy=True), args.count)
+        touched = measure(lazy_and_touch, args.count)
+
+    print("ZE_DDI functions: %d, tables: %d" % (len(ze.ZE_DDI._functions), len(ze.ZE_DDI._tables)))
+    print("eager construction:          %10.1f us" % eager)
+    print("lazy construction:           %10.1f us" % lazy)
+    print("lazy + %3d functions bound:  %10.1f us" % (len(names), touched))
@@ -0,0 +1,86 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import argparse
+import time
+from ctypes import *
+import stub_loader
+from level_zero import ze
+
+"""
+    submission-path functions measured by default
+"""
+submission_functions = [
+    "zeCommandListAppendLaunchKernel",
+    "zeCommandListAppendMemoryCopy",
+    "zeCommandListAppendMemoryFill",
+    "zeCommandListAppendBarrier",
+    "zeCommandListAppendSignalEvent",
+    "zeCommandListAppendWaitOnEvents",
+    "zeCommandListAppendEventReset",
+    "zeCommandListClose",
+    "zeCommandListReset",
+    "zeCommandQueueExecuteCommandLists",
+    "zeCommandQueueSynchronize",
+    "zeKernelSetArgumentValue",
+    "zeKernelSetGroupSize",
+    "zeKernelSuggestGroupSize",
+    "zeEventHostSynchronize",
+    "zeEventHostSignal",
+    "zeEventHostReset",
+    "zeEventQueryStatus",
+    "zeFenceHostSynchronize",
+    "zeFenceReset",
+]
+
+"""
+    builds call arguments for a prototype: handles as ints, pointers as byref
+    objects for the standard path or raw addresses for the fast-call path
+"""
+def make_args(functype, fast, keepalive):
+    args = []
+    for argtype in functype._argtypes_:
+        if issubclass(argtype, c_void_p):
+            args.append(0x1000)
+        elif isinstance(getattr(argtype, "_type_", None), type):
+            obj = argtype._type_()
+            keepalive.append(obj)
+            args.append(addressof(obj) if fast else byref(obj))
+        elif issubclass(argtype, c_char_p):
+            args.append(None)
+        else:
+            args.append(0)
+    return args
+
+"""
+    returns calls per second of 'func(*args)'
+"""
+def measure(func, args, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        func(*args)
+    return count / (time.perf_counter() - start)
+
+"""
+    compares calls per second through ZE_DDI and ZE_DDI.fastcall against a stub library
+"""
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=100000, help="number of calls per function.")
+    args = parser.parse_args()
+
+    loader = stub_loader.StubLoader(ze.ZE_DDI, default=stub_loader.native_stub())
+    keepalive = []
+    with stub_loader.patched_loader(ze, loader):
+        ddi = ze.ZE_DDI(ze.ZE_API_VERSION_CURRENT_M, lazy=True)
+
+    print("%-36s %14s %14s %8s" % ("function", "ddi calls/s", "fast calls/s", "speedup"))
+    for name in submission_functions:
+        functype = ddi._functype(ddi._functions[name][2])
+        slow = measure(getattr(ddi, name), make_args(functype, False, keepalive), args.count)
+        fast = measure(getattr(ddi.fastcall, name), make_args(functype, True, keepalive), args.count)
+        print("%-36s %14.0f %14.0f %7.2fx" % (name, slow, fast, fast / slow))
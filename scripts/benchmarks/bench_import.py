@@ -0,0 +1,49 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+include_dir = os.path.normpath(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "..", "include"))
+
+"""
+    module sets measured by default
+"""
+scenarios = [
+    ["level_zero.zes"],
+    ["level_zero.zet"],
+    ["level_zero.ze"],
+    ["level_zero.ze", "level_zero.zes", "level_zero.zet"],
+]
+
+"""
+    returns the import time in milliseconds of 'modules' in a fresh interpreter
+"""
+def import_time(modules, env):
+    code = "import time; t = time.perf_counter(); import %s; print((time.perf_counter() - t) * 1000)" % ", ".join(modules)
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=include_dir, env=env)
+    return float(output)
+
+"""
+    measures warm (bytecode cached) import times of the python bindings
+"""
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=10, help="number of interpreter launches per scenario.")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPYCACHEPREFIX"] = tempfile.mkdtemp(prefix="ze_pyc_")
+
+    for modules in scenarios:
+        import_time(modules, env)
+        times = sorted(import_time(modules, env) for _ in range(args.count))
+        print("%-50s min %6.1f ms  median %6.1f ms" % (", ".join(modules), times[0], times[len(times) // 2]))
@@ -0,0 +1,72 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import synthetic_spec
+
+json2src = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "json2src.py")
+
+"""
+    returns {path : mtime_ns} of every generated file under 'out_dir'
+"""
+def snapshot(out_dir):
+    mtimes = {}
+    for top in ("source", "include"):
+        for root, dirs, files in os.walk(os.path.join(out_dir, top)):
+            for name in files:
+                path = os.path.join(root, name)
+                mtimes[path] = os.stat(path).st_mtime_ns
+    return mtimes
+
+"""
+    runs json2src.py over 'spec' into 'out_dir'; returns the elapsed seconds
+    and the number of files created or modified
+"""
+def run(spec, out_dir, *options):
+    path = os.path.join(out_dir, "spec.json")
+    with open(path, 'w') as fout:
+        json.dump(spec, fout)
+    before = snapshot(out_dir)
+    start = time.perf_counter()
+    subprocess.check_call([sys.executable, json2src, "--api-json", path] + list(options) + [out_dir],
+        stdout=subprocess.DEVNULL)
+    elapsed = time.perf_counter() - start
+    after = snapshot(out_dir)
+    touched = sum(1 for path, mtime in after.items() if before.get(path) != mtime)
+    return elapsed, touched
+
+"""
+    measures a full generation, an incremental run with no change, an
+    incremental run after editing one section and the render of one template
+"""
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=1, help="multiplier of the synthetic specification size.")
+    parser.add_argument("--jobs", type=int, default=1, help="json2src.py rendering processes.")
+    args = parser.parse_args()
+
+    spec = synthetic_spec.make_spec(args.scale)
+    out_dir = tempfile.mkdtemp(prefix="ze_json2src_")
+    synthetic_spec.make_tree(out_dir)
+
+    options = ["--incremental", "--jobs", str(args.jobs)]
+    results = [("full", run(spec, out_dir, *options))]
+    results.append(("no change", run(spec, out_dir, *options)))
+    # a description change in one sysman function
+    spec["specs"][2][1]["objects"][-1]["desc"] += " (edited)"
+    results.append(("one section", run(spec, out_dir, *options)))
+    # iterating on one layer template of one section
+    results.append(("one template", run(spec, out_dir, "--jobs", str(args.jobs), "--sections", "sysman", "--targets", "valddi.cpp")))
+
+    for name, (elapsed, touched) in results:
+        print("%-12s %8.2f s %6d files written" % (name, elapsed, touched))
@@ -0,0 +1,130 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import argparse
+import time
+from ctypes import *
+import stub_loader
+from level_zero import ze, kernels
+
+"""
+    native kernel stand-in: each call costs COST loop iterations, standing in
+    for the driver's validation and state updates, and the suggested group
+    size is the largest power of two up to 256 dividing the global size
+"""
+FAKE_DRIVER = r'''
+#include <stdint.h>
+#include <stdlib.h>
+static volatile uint64_t sink;
+static void spin(void) { for (uint64_t i = 0; i < COST; ++i) sink += i; }
+uint64_t calls;
+int fake_kernel_create(void *module, void *desc, void **out) { spin(); ++calls; *out = malloc(1); return 0; }
+int fake_kernel_destroy(void *kernel) { free(kernel); return 0; }
+int fake_set_group_size(void *kernel, uint32_t x, uint32_t y, uint32_t z) { spin(); ++calls; return 0; }
+int fake_suggest_group_size(void *kernel, uint32_t x, uint32_t y, uint32_t z,
+                            uint32_t *gx, uint32_t *gy, uint32_t *gz) {
+    spin(); ++calls;
+    uint32_t g = 1;
+    while (g < 256 && x % (g * 2) == 0) g *= 2;
+    *gx = g; *gy = 1; *gz = 1;
+    return 0;
+}
+int fake_set_argument(void *kernel, uint32_t index, size_t size, const void *value) { spin(); ++calls; return 0; }
+int fake_append_launch(void *list, void *kernel, const void *count, void *event, uint32_t n, void **waits) { spin(); ++calls; return 0; }
+'''
+
+"""
+    kernel functions routed to the fake: {api name : symbol}
+"""
+FAKE_FUNCTIONS = {
+    "zeKernelCreate" : "fake_kernel_create",
+    "zeKernelDestroy" : "fake_kernel_destroy",
+    "zeKernelSetGroupSize" : "fake_set_group_size",
+    "zeKernelSuggestGroupSize" : "fake_suggest_group_size",
+    "zeKernelSetArgumentValue" : "fake_set_argument",
+    "zeCommandListAppendLaunchKernel" : "fake_append_launch",
+}
+
+"""
+    returns a dispatch loop of 'launches' launches cycling over 'names': each
+    kernel reads 'arguments' buffers and a scalar, and only the scalar of
+    every 'change'-th launch differs from the kernel's previous launch
+    format: [(name, [args], global size)]
+"""
+def dispatch_loop(launches, names, arguments, change):
+    buffers = [c_void_p(0x10000000 + (index << 20)) for index in range(arguments)]
+    loop = []
+    for launch in range(launches):
+        scalar = c_float(launch // (change * len(names)))
+        loop.append((names[launch % len(names)], buffers + [scalar], (1 << 20,)))
+    return loop
+
+"""
+    compares a dispatch loop setting every argument and the group size
+    before each launch with one launching through a KernelCache, over a fake
+    driver whose calls cost --cost loop iterations
+"""
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--launches", type=int, default=20000, help="launches of the dispatch loop.")
+    parser.add_argument("--kernels", type=int, default=4, help="kernels of the module.")
+    parser.add_argument("--arguments", type=int, default=6, help="buffer arguments of each kernel.")
+    parser.add_argument("--change", type=int, default=10, help="launches of a kernel between scalar changes.")
+    parser.add_argument("--cost", type=int, default=2000, help="loop iterations of each fake driver call.")
+    args = parser.parse_args()
+
+    fake = stub_loader.build_library(FAKE_DRIVER, "ze_kernels_", ["COST=%d" % args.cost])
+    calls = c_uint64.in_dll(fake, "calls")
+    loader = stub_loader.StubLoader(ze.ZE_DDI, overrides=stub_loader.native_overrides(ze.ZE_DDI, fake, FAKE_FUNCTIONS))
+    with stub_loader.patched_loader(ze, loader):
+        ddi = ze.ZE_DDI(ze.ZE_API_VERSION_CURRENT_M, lazy=True)
+    fast = ddi.fastcall
+    module = 0x1000
+    command_list = 0x2000
+    names = ["kernel%d" % index for index in range(args.kernels)]
+    loop = dispatch_loop(args.launches, names, args.arguments, args.change)
+
+    # the direct path: handles created once, everything set before each launch
+    handles = {}
+    for name in names:
+        handle = ze.ze_kernel_handle_t()
+        desc = ze.ze_kernel_desc_t(ze.ze_structure_type_v.KERNEL_DESC, None, 0, name.encode())
+        fast.zeKernelCreate(module, byref(desc), byref(handle))
+        handles[name] = handle.value
+    group = (c_uint32 * 3)()
+    count = ze.ze_group_count_t()
+    calls.value = 0
+    start = time.perf_counter()
+    for name, values, global_size in loop:
+        kernel = handles[name]
+        fast.zeKernelSuggestGroupSize(kernel, global_size[0], 1, 1, byref(group, 0), byref(group, 4), byref(group, 8))
+        fast.zeKernelSetGroupSize(kernel, group[0], group[1], group[2])
+        for index, value in enumerate(values):
+            fast.zeKernelSetArgumentValue(kernel, index, sizeof(value), byref(value))
+        count.groupCountX = global_size[0] // group[0]
+        count.groupCountY = count.groupCountZ = 1
+        fast.zeCommandListAppendLaunchKernel(command_list, kernel, byref(count), None, 0, None)
+    direct = time.perf_counter() - start
+    direct_calls = calls.value
+    for handle in handles.values():
+        fast.zeKernelDestroy(handle)
+
+    calls.value = 0
+    with kernels.KernelCache(ddi, module) as cache:
+        start = time.perf_counter()
+        for name, values, global_size in loop:
+            cache.launch(command_list, name, values, global_size)
+        cached = time.perf_counter() - start
+        stats = cache.stats()
+    cached_calls = calls.value
+
+    print("launches: %d, kernels: %d, arguments: %d" % (args.launches, args.kernels, args.arguments + 1))
+    print("%-8s %10s %12s %14s" % ("path", "seconds", "us/launch", "calls/launch"))
+    print("%-8s %10.3f %12.2f %14.2f" % ("direct", direct, direct * 1e6 / args.launches, direct_calls / args.launches))
+    print("%-8s %10.3f %12.2f %14.2f" % ("cached", cached, cached * 1e6 / args.launches, cached_calls / args.launches))
+    print("avoided per launch: %.2f (suggest %d, group size %d, arguments %d)" % (stats["avoided_per_launch"],
+        stats["suggest_hits"], stats["group_size_skips"], stats["argument_skips"]))
@@ -0,0 +1,53 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import argparse
+import time
+import numpy
+import stub_loader
+from level_zero import metrics, zet
+
+"""
+    returns a buffer of 'count' typed values with a mix of the numeric types
+"""
+def make_values(count):
+    values = metrics.typed_values(count)
+    types = numpy.array([zet.zet_value_type_v.UINT64, zet.zet_value_type_v.FLOAT32,
+                         zet.zet_value_type_v.UINT32, zet.zet_value_type_v.BOOL8], dtype=numpy.int32)
+    values["type"] = numpy.resize(types, count)
+    values["value"]["ui64"] = numpy.arange(count, dtype=numpy.uint64)
+    return values
+
+"""
+    decodes one value at a time through ctypes, as the bindings allow without numpy
+"""
+def decode_ctypes(values, count):
+    array = (zet.zet_typed_value_t * count).from_buffer(values.view(numpy.uint8))
+    members = {0 : "ui32", 1 : "ui64", 2 : "fp32", 3 : "fp64", 4 : "b8"}
+    return [getattr(item.value, members[item.type.value]) for item in array]
+
+"""
+    compares per-element ctypes decoding with the vectorized decoder
+"""
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=1000000, help="number of typed values to decode.")
+    args = parser.parse_args()
+
+    values = make_values(args.count)
+
+    start = time.perf_counter()
+    decode_ctypes(values, args.count)
+    scalar = time.perf_counter() - start
+
+    start = time.perf_counter()
+    metrics.decode_typed_values(values).as_float64()
+    vector = time.perf_counter() - start
+
+    print("typed values: %d" % args.count)
+    print("ctypes per element:  %10.1f Mvalues/s" % (args.count / scalar / 1e6))
+    print("vectorized decode:   %10.1f Mvalues/s" % (args.count / vector / 1e6))
@@ -0,0 +1,62 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import argparse
+import time
+import numpy
+import stub_loader
+from level_zero import metrics, zet
+
+"""
+    returns a calculation stage turning raw reports of 'metric_count' uint64
+    counters into typed values, standing in for the driver
+"""
+def make_calculate(metric_count):
+    def calculate(raw):
+        counters = raw.view(numpy.uint64)
+        values = metrics.typed_values(len(counters))
+        values["type"] = zet.zet_value_type_v.UINT64
+        values["value"]["ui64"] = counters
+        return values
+    return calculate
+
+"""
+    replays recorded reads at a fixed rate through a MetricStream and reports
+    the sustained rate and the drop counters
+"""
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rate", type=int, default=10000, help="streamer reads per second to replay.")
+    parser.add_argument("--seconds", type=float, default=2.0, help="duration of the replay.")
+    parser.add_argument("--reports", type=int, default=4, help="reports per read.")
+    parser.add_argument("--metrics", type=int, default=64, help="metrics per report.")
+    parser.add_argument("--buffers", type=int, default=8, help="ring buffers.")
+    parser.add_argument("--batch", type=int, default=4, help="buffers calculated per batch.")
+    parser.add_argument("--overflow", type=str, default="drop", choices=["drop", "block"], help="policy when the ring is full.")
+    args = parser.parse_args()
+
+    reads = int(args.rate * args.seconds)
+    read_size = args.reports * args.metrics * 8
+    recorded = [numpy.full(args.reports * args.metrics, i, dtype=numpy.uint64).view(numpy.uint8) for i in range(reads)]
+
+    stream = metrics.MetricStream(metrics.ReplayStreamer(recorded, period=1.0 / args.rate),
+        make_calculate(args.metrics), args.metrics, buffer_size=read_size,
+        buffers=args.buffers, batch=args.batch, overflow=args.overflow)
+
+    start = time.perf_counter()
+    samples = 0
+    for batch in stream:
+        samples += batch.samples().shape[0]
+    elapsed = time.perf_counter() - start
+
+    counters = stream.counters
+    print("replayed %d reads of %d bytes at %d Hz in %.2f s" % (reads, read_size, args.rate, elapsed))
+    print("reads/s:        %10.0f" % (counters["reads"] / elapsed))
+    print("reports/s:      %10.0f" % (samples / elapsed))
+    print("batches:        %10d" % counters["batches"])
+    print("stalls:         %10d" % counters["stalls"])
+    print("dropped reads:  %10d" % counters["dropped_reads"])
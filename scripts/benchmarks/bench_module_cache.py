@@ -0,0 +1,148 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import argparse
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from ctypes import *
+import stub_loader
+from level_zero import ze, module_cache
+
+"""
+    native module stand-in: building SPIR-V sleeps COMPILE_MS, standing in for
+    the driver's compiler, and the module's native binary is "NATV" followed
+    by the IL; native binaries without the magic fail with
+    ZE_RESULT_ERROR_INVALID_NATIVE_BINARY
+"""
+FAKE_DRIVER = r'''
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+typedef struct {
+    uint32_t stype; const void *pNext; uint32_t format; size_t inputSize;
+    const uint8_t *pInputModule; const char *pBuildFlags; const void *pConstants;
+} module_desc_t;
+typedef struct { size_t size; uint8_t data[]; } module_t;
+int fake_module_create(void *ctx, void *dev, const module_desc_t *desc, module_t **out, void **log) {
+    const uint8_t *il = desc->pInputModule;
+    size_t size = desc->inputSize;
+    if (desc->format == 1) {
+        if (size < 4 || memcmp(il, "NATV", 4)) return 0x7800000f;
+        il += 4; size -= 4;
+    } else {
+        struct timespec ts = { COMPILE_MS / 1000, (COMPILE_MS % 1000) * 1000000L };
+        nanosleep(&ts, NULL);
+    }
+    module_t *module = malloc(sizeof(module_t) + 4 + size);
+    module->size = 4 + size;
+    memcpy(module->data, "NATV", 4);
+    memcpy(module->data + 4, il, size);
+    *out = module;
+    return 0;
+}
+int fake_module_get_native_binary(module_t *module, size_t *size, uint8_t *binary) {
+    if (binary) memcpy(binary, module->data, *size < module->size ? *size : module->size);
+    *size = module->size;
+    return 0;
+}
+int fake_module_destroy(module_t *module) { free(module); return 0; }
+'''
+
+"""
+    module functions routed to the fake: {api name : symbol}
+"""
+FAKE_FUNCTIONS = {
+    "zeModuleCreate" : "fake_module_create",
+    "zeModuleGetNativeBinary" : "fake_module_get_native_binary",
+    "zeModuleDestroy" : "fake_module_destroy",
+}
+
+ddi = None
+context = 0x1000
+device = 0x2000
+driver = 0x3000
+
+"""
+    returns the seconds taken to create, then destroy, every module of 'ils'
+    through a cache of 'path', and the cache counters
+"""
+def start(ddi, path, ils, max_bytes):
+    cache = module_cache.ModuleCache(ddi, context, device, driver, path, max_bytes=max_bytes)
+    begin = time.perf_counter()
+    modules = [cache.create(il, build_flags="-ze-opt-level=2") for il in ils]
+    elapsed = time.perf_counter() - begin
+    for module in modules:
+        ddi.fastcall.zeModuleDestroy(module)
+    return elapsed, cache.stats()
+
+def _worker(args):
+    path, il = args
+    cache = module_cache.ModuleCache(ddi, context, device, driver, path)
+    ddi.fastcall.zeModuleDestroy(cache.create(il))
+    return cache.stats()
+
+"""
+    compares process start times creating --modules modules without a cache,
+    with a cold cache and with a warm cache, over a fake driver whose builds
+    take --compile-ms; then has --processes processes miss on the same module
+    at once, which must build it once
+"""
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modules", type=int, default=20, help="modules created at start.")
+    parser.add_argument("--il-size", type=int, default=256, help="IL size of each module in KB.")
+    parser.add_argument("--compile-ms", type=int, default=50, help="build time of a module in the fake, in ms.")
+    parser.add_argument("--processes", type=int, default=8, help="processes of the concurrent miss test.")
+    args = parser.parse_args()
+
+    fake = stub_loader.build_library(FAKE_DRIVER, "ze_module_cache_", ["COMPILE_MS=%d" % args.compile_ms])
+    loader = stub_loader.StubLoader(ze.ZE_DDI, overrides=stub_loader.native_overrides(ze.ZE_DDI, fake, FAKE_FUNCTIONS))
+    with stub_loader.patched_loader(ze, loader):
+        ddi = ze.ZE_DDI(ze.ZE_API_VERSION_CURRENT_M, lazy=True)
+    ils = [b"\x03\x02\x23\x07" + os.urandom(args.il_size << 10) for _ in range(args.modules)]
+    path = tempfile.mkdtemp(prefix="ze_module_cache_dir_")
+
+    try:
+        begin = time.perf_counter()
+        module = ze.ze_module_handle_t()
+        for il in ils:
+            desc = ze.ze_module_desc_t(ze.ze_structure_type_v.MODULE_DESC, None, ze.ze_module_format_v.IL_SPIRV,
+                len(il), cast(c_char_p(il), POINTER(c_ubyte)), b"-ze-opt-level=2")
+            ddi.fastcall.zeModuleCreate(context, device, byref(desc), byref(module), None)
+            ddi.fastcall.zeModuleDestroy(module.value)
+        uncached = time.perf_counter() - begin
+
+        cold, cold_stats = start(ddi, path, ils, 1 << 30)
+        warm, warm_stats = start(ddi, path, ils, 1 << 30)
+        assert warm_stats["hits"] == args.modules and warm_stats["misses"] == 0
+
+        # saving a new module in a cache bounded to half the modules evicts
+        # the least recently used ones
+        small = (args.il_size << 10) * args.modules // 2
+        _, evict_stats = start(ddi, path, [b"\x03\x02\x23\x07" + os.urandom(args.il_size << 10)], small)
+
+        shutil.rmtree(path)
+        os.makedirs(path)
+        il = b"\x03\x02\x23\x07" + os.urandom(args.il_size << 10)
+        with multiprocessing.get_context("fork").Pool(args.processes) as pool:
+            stats = pool.map(_worker, [(path, il)] * args.processes)
+        builds = sum(stat["misses"] for stat in stats)
+        assert builds == 1
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+    print("modules: %d x %d KB, build: %d ms" % (args.modules, args.il_size, args.compile_ms))
+    print("%-10s %10s %8s %8s" % ("start", "ms", "hits", "misses"))
+    print("%-10s %10.1f %8s %8s" % ("uncached", uncached * 1e3, "-", "-"))
+    print("%-10s %10.1f %8d %8d" % ("cold", cold * 1e3, cold_stats["hits"], cold_stats["misses"]))
+    print("%-10s %10.1f %8d %8d" % ("warm", warm * 1e3, warm_stats["hits"], warm_stats["misses"]))
+    print("evictions at %d KB: %d" % (small >> 10, evict_stats["evictions"]))
+    print("concurrent miss: %d processes, %d build(s)" % (args.processes, builds))
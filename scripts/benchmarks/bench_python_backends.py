@@ -0,0 +1,126 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import argparse
+import importlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from ctypes import *
+import stub_loader
+import synthetic_spec
+
+json2src = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "json2src.py")
+
+"""
+    generates the python bindings of the synthetic specification at 'scale'
+    into a temporary 'level_zero' package; returns {module name : module}
+"""
+def generate(scale):
+    out_dir = tempfile.mkdtemp(prefix="ze_python_")
+    synthetic_spec.make_tree(out_dir)
+    spec_path = os.path.join(out_dir, "spec.json")
+    with open(spec_path, 'w') as fout:
+        json.dump(synthetic_spec.make_spec(scale), fout)
+    package_dir = os.path.join(out_dir, "python")
+    subprocess.check_call([sys.executable, json2src, "--api-json", spec_path, "--targets", "python",
+        "--python-dir", os.path.join(package_dir, "level_zero"), out_dir],
+        stdout=subprocess.DEVNULL)
+    sys.path.insert(0, package_dir)
+    modules = {}
+    for name in sorted(os.listdir(os.path.join(package_dir, "level_zero"))):
+        if name.endswith(".py") and name != "__init__.py":
+            modules[name[:-3]] = importlib.import_module("level_zero." + name[:-3])
+    return modules
+
+"""
+    compares the size and field offsets of every ctypes API structure of 'module'
+    with the numpy dtype and the cffi type of the same name; returns the
+    list of differences
+"""
+def check_layouts(module, numpy_module, cffi_module):
+    errors = []
+    for name, struct in sorted(vars(module).items()):
+        # the private ddi tables are not part of the API
+        if name.startswith("_") or not isinstance(struct, type) or not issubclass(struct, (Structure, Union)) or struct.__module__ != module.__name__:
+            continue
+        dtype = numpy_module.dtype(name)
+        layouts = {
+            "numpy" : (dtype.itemsize, lambda field: dtype.fields[field][1]),
+            "cffi" : (cffi_module.ffi.sizeof(name), lambda field: cffi_module.ffi.offsetof(name, field)),
+        }
+        for backend, (size, offsetof) in layouts.items():
+            if size != sizeof(struct):
+                errors.append("%s: %s size %d, ctypes %d" % (name, backend, size, sizeof(struct)))
+            for field, _ in struct._fields_:
+                offset = getattr(struct, field).offset
+                if offsetof(field) != offset:
+                    errors.append("%s.%s: %s offset %d, ctypes %d" % (name, field, backend, offsetof(field), offset))
+    return errors
+
+"""
+    returns calls per second of 'func(*args)'
+"""
+def measure(func, args, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        func(*args)
+    return count / (time.perf_counter() - start)
+
+"""
+    returns {backend : [calls per second of each function]} of the functions
+    of 'module', called through a native stub
+"""
+def bench_calls(module, cffi_module, count):
+    address = cast(stub_loader.native_stub(), c_void_p).value
+    ffi = cffi_module.ffi
+    ddi = getattr(module, module.__name__.split(".")[-1].upper() + "_DDI")
+    cffi_ddi = getattr(cffi_module, module.__name__.split(".")[-1].upper() + "_DDI")
+    rates = {"ctypes" : [], "ctypes fastcall" : [], "cffi" : []}
+    for fname, (table, pfn, functype) in ddi._functions.items():
+        functype = ddi._functype(functype)
+        args = [None if issubclass(argtype, c_void_p) or hasattr(argtype, "contents") else 0
+            for argtype in functype._argtypes_]
+        rates["ctypes"].append(measure(functype(address), args, count))
+        fast = module._fastcall_type(functype)(address)
+        rates["ctypes fastcall"].append(measure(fast, [0 if arg is None else arg for arg in args], count))
+
+        # the cffi function-pointer type of the table member
+        tabletype = cffi_ddi._tables[table][1]
+        func = ffi.cast(dict(ffi.typeof(tabletype).fields)[pfn].type, address)
+        cargs = [ffi.NULL if argtype.kind == "pointer" else 0 for argtype in ffi.typeof(func).args]
+        rates["cffi"].append(measure(func, cargs, count))
+    return rates
+
+"""
+    generates the ctypes, cffi and numpy bindings of the synthetic
+    specification, checks that their structure layouts agree, and compares
+    calls per second of the ze functions through each call path
+"""
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=1, help="multiplier of the synthetic specification size.")
+    parser.add_argument("--count", type=int, default=100000, help="number of calls per function.")
+    args = parser.parse_args()
+
+    modules = generate(args.scale)
+    errors = []
+    for name in ("ze", "zes", "zet"):
+        errors += check_layouts(modules[name], modules[name + "_numpy"], modules[name + "_cffi"])
+    for error in errors:
+        print(error)
+    print("%d layout differences between the backends" % len(errors))
+
+    rates = bench_calls(modules["ze"], modules["ze_cffi"], args.count)
+    print("%-16s %12s %12s" % ("backend", "median/s", "min/s"))
+    for backend, values in rates.items():
+        print("%-16s %12.0f %12.0f" % (backend, statistics.median(values), min(values)))
+    sys.exit(1 if errors else 0)
@@ -0,0 +1,96 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import synthetic_spec
+
+json2src = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "json2src.py")
+
+"""
+    runs a profiled json2src.py generation of the synthetic specification at
+    'scale'; returns the profile
+"""
+def profile(scale, work_dir):
+    out_dir = os.path.join(work_dir, "scale%d" % scale)
+    synthetic_spec.make_tree(out_dir)
+    spec_path = os.path.join(out_dir, "spec.json")
+    with open(spec_path, 'w') as fout:
+        json.dump(synthetic_spec.make_spec(scale), fout)
+    prefix = os.path.join(out_dir, "profile")
+    subprocess.check_call([sys.executable, json2src, "--api-json", spec_path, "--profile", prefix, out_dir],
+        stdout=subprocess.DEVNULL)
+    with open(prefix + ".json", 'r') as fin:
+        return json.load(fin)
+
+"""
+    returns the least-squares slope of log(seconds) over log(scale): about 1
+    for work growing linearly with the specification, 2 for quadratic work
+"""
+def exponent(scales, seconds):
+    points = [(math.log(s), math.log(t)) for s, t in zip(scales, seconds) if t > 0]
+    if len(points) < 2:
+        return 0.0
+    mx = sum(x for x, _ in points) / len(points)
+    my = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mx) ** 2 for x, _ in points)
+    return sum((x - mx) * (y - my) for x, y in points) / sxx
+
+"""
+    profiles generation over synthetic specifications of increasing size and
+    reports how the time of each template and helper grows; with --check,
+    fails if any grows faster than scale^limit
+"""
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scales", type=str, default="1,2,5,10,20", help="comma-separated multipliers of the number of classes, and so functions.")
+    parser.add_argument("--helpers", type=int, default=15, help="number of helpers reported, by cumulative time at the largest scale.")
+    parser.add_argument("--limit", type=float, default=1.25, help="growth exponent above which a template or helper is reported as superlinear.")
+    parser.add_argument("--check", action='store_true', help="exit with an error if anything is superlinear.")
+    args = parser.parse_args()
+
+    scales = [int(s) for s in args.scales.split(",")]
+    work_dir = tempfile.mkdtemp(prefix="ze_scaling_")
+    profiles = [profile(scale, work_dir) for scale in scales]
+
+    rows = []
+    templates = {}
+    for index, result in enumerate(profiles):
+        for render in result["renders"]:
+            if render["template"]:
+                times = templates.setdefault(render["template"], [0.0] * len(scales))
+                times[index] += render["seconds"]
+    for template, times in sorted(templates.items()):
+        rows.append(("template", template, times))
+
+    largest = profiles[-1]["helpers"][:args.helpers]
+    for helper in largest:
+        times = []
+        for result in profiles:
+            match = [h for h in result["helpers"] if h["function"] == helper["function"] and h["line"] == helper["line"]]
+            times.append(match[0]["cumulative"] if match else 0.0)
+        rows.append(("helper", helper["function"], times))
+    rows.append(("total", "elapsed", [result["elapsed"] for result in profiles]))
+
+    print("%-8s %-40s %s %8s" % ("kind", "name", " ".join("%8s" % ("x%d" % s) for s in scales), "exponent"))
+    superlinear = []
+    for kind, name, times in rows:
+        growth = exponent(scales, times)
+        flag = ""
+        if kind != "total" and growth > args.limit:
+            flag = " superlinear"
+            superlinear.append(name)
+        print("%-8s %-40s %s %8.2f%s" % (kind, name, " ".join("%8.3f" % t for t in times), growth, flag))
+
+    if superlinear:
+        print("%d superlinear: %s" % (len(superlinear), ", ".join(superlinear)))
+    sys.exit(1 if args.check and superlinear else 0)
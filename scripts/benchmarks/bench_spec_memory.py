@@ -0,0 +1,60 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import synthetic_spec
+
+scripts_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..")
+sys.path.insert(0, scripts_dir)
+import spec_loader
+
+"""
+    runs json2src.py over the specification at 'spec_path'; returns the peak
+    memory use in MB it reports and the seconds taken
+"""
+def generate(spec_path, out_dir, options):
+    start = time.perf_counter()
+    output = subprocess.check_output([sys.executable, os.path.join(scripts_dir, "json2src.py"), "--api-json", spec_path,
+        "--manifest", os.path.join(out_dir, "manifest.json")] + options + [out_dir], universal_newlines=True)
+    seconds = time.perf_counter() - start
+    return float(re.search(r"Peak memory use was ([0-9.]+) MB", output).group(1)), seconds
+
+"""
+    compares the peak memory use of json2src.py over the combined, split and
+    JSON-lines layouts of a synthetic specification
+"""
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=50, help="multiplier of the synthetic specification size.")
+    parser.add_argument("options", nargs="*", help="json2src.py options, default is -- --targets lib")
+    args = parser.parse_args()
+
+    out_dir = tempfile.mkdtemp(prefix="ze_spec_memory_")
+    synthetic_spec.make_tree(out_dir)
+    data = synthetic_spec.make_spec(args.scale)
+    layouts = {
+        "combined": os.path.join(out_dir, "spec.json"),
+        "split": os.path.join(out_dir, "spec"),
+        "jsonl": os.path.join(out_dir, "spec.jsonl"),
+    }
+    with open(layouts["combined"], 'w') as fout:
+        json.dump(data, fout)
+    spec_loader.write_split(data, layouts["split"])
+    spec_loader.write_jsonl(data, layouts["jsonl"])
+    del data
+
+    print("specification: %.1f MB, orjson: %s" % (os.path.getsize(layouts["combined"]) / 2**20, "yes" if spec_loader.orjson else "no"))
+    for name, path in layouts.items():
+        peak, seconds = generate(path, out_dir, args.options or ["--targets", "lib"])
+        print("%-10s peak %8.1f MB %8.2f s" % (name, peak, seconds))
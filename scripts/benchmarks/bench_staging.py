@@ -0,0 +1,208 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import argparse
+import time
+from ctypes import *
+import numpy
+import stub_loader
+from level_zero import ze, staging
+
+"""
+    native copy-engine stand-in: copies appended to the immediate command list
+    are done by a worker thread, taking size/BANDWIDTH seconds of DMA time
+    before the memcpy, then signal their event. As in the driver, copies from
+    or to pageable host memory are staged through an internal buffer
+    synchronously in the calling thread. Device memory is malloc'ed.
+"""
+FAKE_DRIVER = r'''
+#include <pthread.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+typedef struct { int signaled; } event_t;
+typedef struct { void *dst; const void *src; size_t size; event_t *event; } copy_t;
+typedef struct { char *base; size_t size; int device; } range_t;
+#define QUEUE 256
+#define RANGES 256
+static copy_t queue[QUEUE];
+static unsigned head, tail;
+static range_t ranges[RANGES];
+static pthread_mutex_t lock = PTHREAD_MUTEX_INITIALIZER;
+static pthread_cond_t submitted = PTHREAD_COND_INITIALIZER, signaled = PTHREAD_COND_INITIALIZER;
+static pthread_t worker;
+static int started;
+static char *bounce;
+
+static void dma(void *dst, const void *src, size_t size) {
+    double seconds = (double)size / (BANDWIDTH * 1e9);
+    struct timespec ts = { (time_t)seconds, (long)((seconds - (time_t)seconds) * 1e9) };
+    nanosleep(&ts, NULL);
+    memcpy(dst, src, size);
+}
+static void *run(void *arg) {
+    for (;;) {
+        pthread_mutex_lock(&lock);
+        while (head == tail) pthread_cond_wait(&submitted, &lock);
+        copy_t copy = queue[head % QUEUE];
+        pthread_mutex_unlock(&lock);
+        dma(copy.dst, copy.src, copy.size);
+        pthread_mutex_lock(&lock);
+        ++head;
+        if (copy.event) copy.event->signaled = 1;
+        pthread_cond_broadcast(&signaled);
+        pthread_mutex_unlock(&lock);
+    }
+    return NULL;
+}
+static int find(const void *p) {
+    for (int i = 0; i < RANGES; ++i)
+        if (ranges[i].base && (const char *)p >= ranges[i].base && (const char *)p < ranges[i].base + ranges[i].size)
+            return i;
+    return -1;
+}
+static int track(void **out, size_t size, int device) {
+    for (int i = 0; i < RANGES; ++i)
+        if (!ranges[i].base) {
+            ranges[i].base = aligned_alloc(64, (size + 63) / 64 * 64);
+            ranges[i].size = size; ranges[i].device = device;
+            *out = ranges[i].base;
+            return 0;
+        }
+    return 0x70000002;
+}
+int fake_alloc_host(void *ctx, void *desc, size_t size, size_t alignment, void **out) { return track(out, size, 0); }
+int fake_alloc_device(void *ctx, void *desc, size_t size, size_t alignment, void *dev, void **out) { return track(out, size, 1); }
+int fake_free(void *ctx, void *p) { int i = find(p); if (i >= 0) { free(ranges[i].base); ranges[i].base = NULL; } return 0; }
+int fake_event_pool_create(void *ctx, void *desc, uint32_t n, void **devices, void **pool) { *pool = (void *)1; return 0; }
+int fake_event_pool_destroy(void *pool) { return 0; }
+int fake_event_create(void *pool, void *desc, void **event) { *event = calloc(1, sizeof(event_t)); return 0; }
+int fake_event_destroy(void *event) { free(event); return 0; }
+int fake_list_create_immediate(void *ctx, void *dev, void *desc, void **list) {
+    if (!started) { pthread_create(&worker, NULL, run, NULL); started = 1; }
+    *list = (void *)1; return 0; }
+int fake_list_destroy(void *list) { return 0; }
+int fake_append_copy(void *list, void *dst, const void *src, size_t size, event_t *event, uint32_t n, void **waits) {
+    int d = find(dst), s = find(src);
+    if (d < 0 || s < 0) {
+        /* pageable host memory: staged by the driver before the call returns */
+        static size_t bounce_size;
+        pthread_mutex_lock(&lock);
+        while (head != tail) pthread_cond_wait(&signaled, &lock);
+        pthread_mutex_unlock(&lock);
+        if (bounce_size < size) { free(bounce); bounce = malloc(size); bounce_size = size; }
+        if (d >= 0 && ranges[d].device) { memcpy(bounce, src, size); dma(dst, bounce, size); }
+        else { dma(bounce, src, size); memcpy(dst, bounce, size); }
+        if (event) event->signaled = 1;
+        return 0;
+    }
+    pthread_mutex_lock(&lock);
+    queue[tail++ % QUEUE] = (copy_t){ dst, src, size, event };
+    pthread_cond_signal(&submitted);
+    pthread_mutex_unlock(&lock);
+    return 0;
+}
+int fake_event_host_synchronize(event_t *event, uint64_t timeout) {
+    pthread_mutex_lock(&lock);
+    while (!event->signaled) pthread_cond_wait(&signaled, &lock);
+    pthread_mutex_unlock(&lock);
+    return 0;
+}
+int fake_event_host_reset(event_t *event) { event->signaled = 0; return 0; }
+'''
+
+"""
+    transfer functions routed to the fake: {api name : symbol}
+"""
+FAKE_FUNCTIONS = {
+    "zeMemAllocHost" : "fake_alloc_host",
+    "zeMemAllocDevice" : "fake_alloc_device",
+    "zeMemFree" : "fake_free",
+    "zeEventPoolCreate" : "fake_event_pool_create",
+    "zeEventPoolDestroy" : "fake_event_pool_destroy",
+    "zeEventCreate" : "fake_event_create",
+    "zeEventDestroy" : "fake_event_destroy",
+    "zeCommandListCreateImmediate" : "fake_list_create_immediate",
+    "zeCommandListDestroy" : "fake_list_destroy",
+    "zeCommandListAppendMemoryCopy" : "fake_append_copy",
+    "zeEventHostSynchronize" : "fake_event_host_synchronize",
+    "zeEventHostReset" : "fake_event_host_reset",
+}
+
+"""
+    returns the best throughput in GB/s of 'repeat' runs of 'transfer()'
+"""
+def throughput(transfer, size, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        transfer()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return size / best / 1e9
+
+"""
+    compares upload and download throughput of a pageable array copied
+    directly with zeCommandListAppendMemoryCopy and through a StagingPool,
+    by chunk size, over a fake copy engine of --bandwidth GB/s
+"""
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=64, help="transfer size in MB.")
+    parser.add_argument("--chunks", type=str, default="256,1024,4096,16384", help="comma-separated chunk sizes in KB.")
+    parser.add_argument("--buffers", type=int, default=2, help="staging buffers per pool.")
+    parser.add_argument("--bandwidth", type=float, default=12.0, help="copy-engine bandwidth of the fake, in GB/s.")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement, the best is reported.")
+    args = parser.parse_args()
+
+    fake = stub_loader.build_library(FAKE_DRIVER, "ze_staging_", ["BANDWIDTH=%f" % args.bandwidth], ["-pthread"])
+    loader = stub_loader.StubLoader(ze.ZE_DDI, overrides=stub_loader.native_overrides(ze.ZE_DDI, fake, FAKE_FUNCTIONS))
+    with stub_loader.patched_loader(ze, loader):
+        ddi = ze.ZE_DDI(ze.ZE_API_VERSION_CURRENT_M, lazy=True)
+    fast = ddi.fastcall
+    context = 0x1000
+    device = 0x2000
+
+    size = args.size << 20
+    host = numpy.random.default_rng(0).integers(0, 255, size, dtype=numpy.uint8)
+    out = numpy.empty_like(host)
+    address = c_void_p()
+    desc = ze.ze_device_mem_alloc_desc_t(ze.ze_structure_type_v.DEVICE_MEM_ALLOC_DESC, None, 0, 0)
+    fast.zeMemAllocDevice(context, byref(desc), size, 64, device, byref(address))
+    dst = address.value
+
+    # the direct path: one copy from or to the pageable array, then a wait
+    command_list = c_void_p()
+    queue_desc = ze.ze_command_queue_desc_t(ze.ze_structure_type_v.COMMAND_QUEUE_DESC, None, 0, 0, 0,
+        ze.ze_command_queue_mode_v.ASYNCHRONOUS, ze.ze_command_queue_priority_v.NORMAL)
+    fast.zeCommandListCreateImmediate(context, device, byref(queue_desc), byref(command_list))
+    event = c_void_p()
+    fast.zeEventCreate(None, None, byref(event))
+    def direct(dst, src):
+        fast.zeCommandListAppendMemoryCopy(command_list.value, dst, src, size, event.value, 0, None)
+        fast.zeEventHostSynchronize(event.value, 0xffffffffffffffff)
+        fast.zeEventHostReset(event.value)
+    rows = [("direct",
+        throughput(lambda: direct(dst, host.ctypes.data), size, args.repeat),
+        throughput(lambda: direct(out.ctypes.data, dst), size, args.repeat))]
+    assert numpy.array_equal(host, out)
+    fast.zeEventDestroy(event.value)
+    fast.zeCommandListDestroy(command_list.value)
+
+    for chunk in [int(c) << 10 for c in args.chunks.split(",")]:
+        out[:] = 0
+        with staging.StagingPool(ddi, context, device, chunk_size=chunk, buffers=args.buffers) as pool:
+            rows.append(("staged %dK" % (chunk >> 10),
+                throughput(lambda: pool.upload(host, dst), size, args.repeat),
+                throughput(lambda: pool.download(dst, out=out), size, args.repeat)))
+        assert numpy.array_equal(host, out)
+
+    print("transfer: %d MB, copy engine: %.1f GB/s" % (args.size, args.bandwidth))
+    print("%-14s %12s %12s" % ("path", "upload GB/s", "download GB/s"))
+    for name, upload, download in rows:
+        print("%-14s %12.2f %12.2f" % (name, upload, download))
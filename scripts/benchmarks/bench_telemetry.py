@@ -0,0 +1,101 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import argparse
+import time
+from ctypes import *
+import numpy
+import stub_loader
+from level_zero import ze, zes, telemetry
+
+"""
+    native sysman stand-in: every enumeration returns a fixed number of domains
+    with handles 1..n, and counters advance with a global microsecond clock.
+    Energy is kept in 32 bits to exercise wraparound; power is the handle in
+    watts, utilization 50% and memory bandwidth 1 GB/s.
+"""
+FAKE_SYSMAN = r'''
+#include <stdint.h>
+#include <stddef.h>
+static uint64_t clock_us = 0xfff00000u;
+void fake_advance(uint64_t us) { clock_us += us; }
+#define ENUM(kind, n) \
+    int fake_enum_##kind(void *dev, uint32_t *count, void **handles) { \
+        if (handles) { for (uint32_t i = 0; i < *count && i < n; ++i) handles[i] = (void *)(uintptr_t)(i + 1); } \
+        *count = n; return 0; }
+ENUM(power, POWER) ENUM(engine, ENGINE) ENUM(memory, MEMORY) ENUM(fabric, FABRIC)
+int fake_power(void *h, uint64_t *c) { c[0] = (clock_us * (uintptr_t)h) & 0xffffffffu; c[1] = clock_us; return 0; }
+int fake_engine(void *h, uint64_t *c) { c[0] = clock_us / 2; c[1] = clock_us; return 0; }
+int fake_memory(void *h, uint64_t *c) { c[0] = clock_us * 1000; c[1] = clock_us * 500; c[2] = 0; c[3] = clock_us; return 0; }
+int fake_pci(void *h, uint64_t *c) { c[0] = clock_us; c[3] = clock_us * 100; c[4] = clock_us * 200; return 0; }
+int fake_fabric(void *h, uint64_t *c) { c[0] = clock_us; c[1] = clock_us * 10; c[2] = clock_us * 20; return 0; }
+'''
+
+"""
+    sampled functions routed to the fake: {api name : symbol}
+"""
+FAKE_FUNCTIONS = {
+    "zesDeviceEnumPowerDomains" : "fake_enum_power",
+    "zesDeviceEnumEngineGroups" : "fake_enum_engine",
+    "zesDeviceEnumMemoryModules" : "fake_enum_memory",
+    "zesDeviceEnumFabricPorts" : "fake_enum_fabric",
+    "zesPowerGetEnergyCounter" : "fake_power",
+    "zesEngineGetActivity" : "fake_engine",
+    "zesMemoryGetBandwidth" : "fake_memory",
+    "zesDevicePciGetStats" : "fake_pci",
+    "zesFabricPortGetThroughput" : "fake_fabric",
+}
+
+"""
+    measures the per-tick cost of a TelemetrySampler over the fake devices
+"""
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--devices", type=int, default=8, help="number of devices.")
+    parser.add_argument("--engines", type=int, default=30, help="engine groups per device.")
+    parser.add_argument("--fabric", type=int, default=16, help="fabric ports per device.")
+    parser.add_argument("--ticks", type=int, default=2000, help="number of samples to average over.")
+    args = parser.parse_args()
+
+    # domain counts per device
+    fake = stub_loader.build_library(FAKE_SYSMAN, "ze_telemetry_",
+        ["POWER=2", "ENGINE=%d" % args.engines, "MEMORY=2", "FABRIC=%d" % args.fabric])
+    loader = stub_loader.StubLoader(zes.ZES_DDI, overrides=stub_loader.native_overrides(zes.ZES_DDI, fake, FAKE_FUNCTIONS))
+    with stub_loader.patched_loader(zes, loader):
+        ddi = zes.ZES_DDI(ze.ZE_API_VERSION_CURRENT_M, lazy=True)
+    devices = list(range(1, args.devices + 1))
+    sampler = telemetry.TelemetrySampler(ddi, devices, counter_bits={"power" : 32})
+    domains = sum(len(d) for d in sampler.domains.values())
+
+    # the 32-bit energy counters wrap within the first ticks
+    elapsed = 0.0
+    for tick in range(args.ticks):
+        fake.fake_advance(c_uint64(100000))
+        start = time.perf_counter()
+        rates = sampler.sample()
+        elapsed += time.perf_counter() - start
+        if tick > 0:
+            power = sampler.per_device("power", "power")
+            assert numpy.allclose(power, 3.0), (tick, power)
+    assert numpy.allclose(rates["engine"]["utilization"], 0.5)
+    assert numpy.allclose(rates["memory"]["read_bandwidth"], 1e9)
+
+    # without the Power table, power domains still enumerate through the
+    # Device table, but are not sampled
+    loader = stub_loader.StubLoader(zes.ZES_DDI, overrides=stub_loader.native_overrides(zes.ZES_DDI, fake, FAKE_FUNCTIONS),
+        missing=["Power"])
+    with stub_loader.patched_loader(zes, loader):
+        partial = zes.ZES_DDI(ze.ZE_API_VERSION_CURRENT_M, lazy=True, strict=False)
+    partial_sampler = telemetry.TelemetrySampler(partial, devices)
+    assert len(partial_sampler.domains["power"]) == 0
+    for _ in range(2):
+        fake.fake_advance(c_uint64(100000))
+        partial_sampler.sample()
+    assert numpy.allclose(partial_sampler.rates["engine"]["utilization"], 0.5)
+
+    print("devices: %d, domains: %d" % (args.devices, domains))
+    print("per tick: %10.1f us" % (elapsed * 1e6 / args.ticks))
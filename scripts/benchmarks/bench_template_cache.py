@@ -0,0 +1,72 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import argparse
+import glob
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import synthetic_spec
+
+scripts_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..")
+sys.path.insert(0, scripts_dir)
+import util
+
+"""
+    returns the seconds taken to load every template in a fresh process, with
+    the compiled modules in 'cache'
+"""
+def load_templates(cache):
+    code = ("import sys, time, glob; sys.path.insert(0, %r); import util; util.templateCache = %r; "
+            "start = time.perf_counter(); "
+            "[util.getTemplate(path) for path in glob.glob(%r, recursive=True)]; "
+            "print(time.perf_counter() - start)") % (scripts_dir, cache, os.path.join(util.templates_dir, "**", "*.mako"))
+    return float(subprocess.check_output([sys.executable, "-c", code], cwd=scripts_dir))
+
+"""
+    returns the seconds taken by a full, non-incremental json2src.py run
+"""
+def generate(spec_path, out_dir, cache):
+    start = time.perf_counter()
+    subprocess.check_call([sys.executable, os.path.join(scripts_dir, "json2src.py"), "--api-json", spec_path,
+        "--template-cache", cache, out_dir], stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+"""
+    compares template loading and generation with an empty (cold) and a
+    populated (warm) compiled template cache
+"""
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=1, help="multiplier of the synthetic specification size.")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement, the best is reported.")
+    args = parser.parse_args()
+
+    out_dir = tempfile.mkdtemp(prefix="ze_template_cache_")
+    synthetic_spec.make_tree(out_dir)
+    spec_path = os.path.join(out_dir, "spec.json")
+    with open(spec_path, 'w') as fout:
+        json.dump(synthetic_spec.make_spec(args.scale), fout)
+    cache = os.path.join(out_dir, "cache")
+    templates = len(glob.glob(os.path.join(util.templates_dir, "**", "*.mako"), recursive=True))
+
+    results = {}
+    for name, measure in (("load", lambda: load_templates(cache)), ("generate", lambda: generate(spec_path, out_dir, cache))):
+        cold = []
+        for _ in range(args.repeat):
+            shutil.rmtree(cache, ignore_errors=True)
+            cold.append(measure())
+        warm = [measure() for _ in range(args.repeat)]
+        results[name] = (min(cold), min(warm))
+
+    print("templates: %d" % templates)
+    for name, (cold, warm) in results.items():
+        print("%-10s cold %8.3f s  warm %8.3f s  saved %8.3f s" % (name, cold, warm, cold - warm))
@@ -0,0 +1,85 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import argparse
+import contextlib
+import cProfile
+import glob
+import io
+import os
+import pstats
+import sys
+import tempfile
+import synthetic_spec
+
+scripts_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..")
+sys.path.insert(0, scripts_dir)
+import util
+import generate_code
+
+"""
+    renders every output of every section of 'spec' under 'out_dir' in this
+    process; returns {(template, section) : seconds}
+"""
+def render_all(spec, out_dir):
+    srcpath = os.path.join(out_dir, "source")
+    util.timings.clear()
+    sections = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for specs, config in zip(spec['specs'], spec['configs']):
+            args = (srcpath, config['name'], config['namespace'], config['tags'], "1.0", specs, spec['meta'])
+            before = set(util.timings)
+            generate_code.generate_lib(*args)
+            generate_code.generate_loader(*args)
+            generate_code.generate_layers(*args)
+            generate_code.generate_drivers(*args)
+            for outpath in set(util.timings) - before:
+                sections[outpath] = config['name']
+    results = {}
+    for outpath, seconds in util.timings.items():
+        entry = util.manifest.get(outpath) or util.renderedManifest[outpath]
+        template = os.path.relpath(entry["template"], util.templates_dir)
+        key = (template, sections[outpath])
+        results[key] = results.get(key, 0.0) + seconds
+    return results
+
+"""
+    reports the render time of each template, per section, over a synthetic
+    specification; optionally profiles the renders
+"""
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=4, help="multiplier of the synthetic specification size.")
+    parser.add_argument("--profile", type=int, default=0, help="print the given number of functions with the most cumulative time.")
+    args = parser.parse_args()
+
+    spec = synthetic_spec.make_spec(args.scale)
+    out_dir = tempfile.mkdtemp(prefix="ze_templates_")
+    synthetic_spec.make_tree(out_dir)
+    # compile the templates outside of the measurement
+    for path in glob.glob(os.path.join(util.templates_dir, "**", "*.mako"), recursive=True):
+        util.getTemplate(path)
+
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler:
+        profiler.enable()
+    results = render_all(spec, out_dir)
+    if profiler:
+        profiler.disable()
+
+    print("%-48s %8s %8s %8s" % ("template", "core", "tools", "sysman"))
+    totals = {}
+    for template in sorted(set(template for template, _ in results)):
+        row = [results.get((template, section)) for section in ("core", "tools", "sysman")]
+        print("%-48s %s" % (template, " ".join("%8.3f" % t if t is not None else "%8s" % "-" for t in row)))
+        for section, t in zip(("core", "tools", "sysman"), row):
+            totals[section] = totals.get(section, 0.0) + (t or 0.0)
+    print("%-48s %s" % ("total", " ".join("%8.3f" % totals[section] for section in ("core", "tools", "sysman"))))
+
+    if profiler:
+        print()
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(args.profile)
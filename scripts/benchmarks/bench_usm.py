@@ -0,0 +1,154 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import argparse
+import random
+import time
+from ctypes import *
+import stub_loader
+from level_zero import ze, usm
+
+"""
+    native memory stand-in: every allocation is a distinct small malloc, as the
+    memory is never touched, and each call costs COST loop iterations,
+    standing in for the driver's mapping work
+"""
+FAKE_DRIVER = r'''
+#include <stdint.h>
+#include <stdlib.h>
+static volatile uint64_t sink;
+static void spin(void) { for (uint64_t i = 0; i < COST; ++i) sink += i; }
+int fake_alloc_device(void *ctx, void *desc, size_t size, size_t alignment, void *dev, void **out) {
+    spin(); *out = malloc(64); return *out ? 0 : 0x70000003; }
+int fake_free(void *ctx, void *ptr) { spin(); free(ptr); return 0; }
+int fake_query(void *event) { return 0; }
+int fake_synchronize(void *queue, uint64_t timeout) { return 0; }
+'''
+
+"""
+    memory functions routed to the fake: {api name : symbol}
+"""
+FAKE_FUNCTIONS = {
+    "zeMemAllocDevice" : "fake_alloc_device",
+    "zeMemFree" : "fake_free",
+    "zeEventQueryStatus" : "fake_query",
+    "zeCommandQueueSynchronize" : "fake_synchronize",
+}
+
+"""
+    returns a synthetic trace of a service handling 'requests' requests
+    round-robin over 'queues' queues: each allocates a few buffers of
+    log-uniform sizes and frees them when done, and every 50th request also
+    replaces a long-lived buffer
+    format: [("alloc", id, size, queue) or ("free", id, queue)]
+"""
+def synthetic_trace(requests, queues, seed=0):
+    rng = random.Random(seed)
+    trace = []
+    next_id = 0
+    long_lived = []
+    for request in range(requests):
+        queue = request % queues + 1
+        ids = []
+        for _ in range(rng.randint(2, 8)):
+            size = int(2 ** rng.uniform(8, 24))
+            trace.append(("alloc", next_id, size, queue))
+            ids.append(next_id)
+            next_id += 1
+        rng.shuffle(ids)
+        trace += [("free", id, queue) for id in ids]
+        if request % 50 == 0:
+            trace.append(("alloc", next_id, int(2 ** rng.uniform(20, 26)), queue))
+            long_lived.append(next_id)
+            next_id += 1
+            if len(long_lived) > 4:
+                trace.append(("free", long_lived.pop(0), queue))
+    return trace
+
+"""
+    reads a trace written by write_trace: one "alloc ID SIZE QUEUE" or
+    "free ID QUEUE" per line
+"""
+def read_trace(path):
+    trace = []
+    with open(path, 'r') as fin:
+        for line in fin:
+            fields = line.split()
+            if fields:
+                trace.append((fields[0],) + tuple(int(field) for field in fields[1:]))
+    return trace
+
+def write_trace(trace, path):
+    with open(path, 'w') as fout:
+        for entry in trace:
+            fout.write(" ".join(str(field) for field in entry) + "\n")
+
+"""
+    replays 'trace' through alloc(size, queue) and free(address, queue);
+    returns the elapsed seconds
+"""
+def replay(trace, alloc, free):
+    addresses = {}
+    start = time.perf_counter()
+    for entry in trace:
+        if entry[0] == "alloc":
+            addresses[entry[1]] = alloc(entry[2], entry[3])
+        else:
+            free(addresses.pop(entry[1]), entry[2])
+    elapsed = time.perf_counter() - start
+    for address in addresses.values():
+        free(address, None)
+    return elapsed
+
+"""
+    replays an allocation trace through the driver directly and through a
+    CachingAllocator, over a fake driver whose allocations cost --cost
+    loop iterations
+"""
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trace", type=str, default=None, help="trace to replay, default is a synthetic trace.")
+    parser.add_argument("--record", type=str, default=None, help="write the synthetic trace to RECORD.")
+    parser.add_argument("--requests", type=int, default=5000, help="requests of the synthetic trace.")
+    parser.add_argument("--queues", type=int, default=4, help="queues of the synthetic trace.")
+    parser.add_argument("--cost", type=int, default=20000, help="loop iterations of each fake driver call.")
+    parser.add_argument("--high-water", type=int, default=256 << 20, help="high-water mark of the allocator, in bytes.")
+    args = parser.parse_args()
+
+    trace = read_trace(args.trace) if args.trace else synthetic_trace(args.requests, args.queues)
+    if args.record:
+        write_trace(trace, args.record)
+    allocs = sum(1 for entry in trace if entry[0] == "alloc")
+
+    fake = stub_loader.build_library(FAKE_DRIVER, "ze_usm_", ["COST=%d" % args.cost])
+    loader = stub_loader.StubLoader(ze.ZE_DDI, overrides=stub_loader.native_overrides(ze.ZE_DDI, fake, FAKE_FUNCTIONS))
+    with stub_loader.patched_loader(ze, loader):
+        ddi = ze.ZE_DDI(ze.ZE_API_VERSION_CURRENT_M, lazy=True)
+    context = 0x1000
+    device = 0x2000
+
+    desc = ze.ze_device_mem_alloc_desc_t(ze.ze_structure_type_v.DEVICE_MEM_ALLOC_DESC, None, 0, 0)
+    address = c_void_p()
+    fast = ddi.fastcall
+    def direct_alloc(size, queue):
+        fast.zeMemAllocDevice(context, byref(desc), size, 64, device, byref(address))
+        return address.value
+    def direct_free(ptr, queue):
+        fast.zeMemFree(context, ptr)
+    direct = replay(trace, direct_alloc, direct_free)
+
+    allocator = usm.CachingAllocator(ddi, context, device, high_water=args.high_water)
+    cached = replay(trace, allocator.alloc, allocator.free)
+    stats = allocator.stats()
+    allocator.close()
+
+    print("trace: %d allocations" % allocs)
+    print("%-10s %10s %12s %14s" % ("path", "seconds", "us/alloc", "driver allocs"))
+    print("%-10s %10.3f %12.2f %14d" % ("direct", direct, direct * 1e6 / allocs, allocs))
+    print("%-10s %10.3f %12.2f %14d" % ("cached", cached, cached * 1e6 / allocs, stats["driver_allocs"]))
+    print("hit rate: %.1f%%, peak reserved: %.1f MB, trims: %d" % (
+        100.0 * stats["hits"] / (stats["hits"] + stats["misses"]), stats["peak_reserved"] / 2**20, stats["trims"]))
@@ -0,0 +1,77 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import synthetic_spec
+
+scripts_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..")
+golden_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "golden_synthetic.json")
+
+"""
+    generates the synthetic specification with json2src.py; returns
+    {relative path : sha256} of the generated sources
+"""
+def generate(scale, options):
+    out_dir = tempfile.mkdtemp(prefix="ze_golden_")
+    synthetic_spec.make_tree(out_dir)
+    spec_path = os.path.join(out_dir, "spec.json")
+    with open(spec_path, 'w') as fout:
+        json.dump(synthetic_spec.make_spec(scale), fout)
+    subprocess.check_call([sys.executable, os.path.join(scripts_dir, "json2src.py"), "--api-json", spec_path,
+        "--manifest", os.path.join(out_dir, "manifest.json")] + options + [out_dir],
+        stdout=subprocess.DEVNULL)
+    digests = {}
+    for top in ("source", "include"):
+        for root, dirs, files in os.walk(os.path.join(out_dir, top)):
+            for name in files:
+                path = os.path.join(root, name)
+                with open(path, 'rb') as fin:
+                    digests[os.path.relpath(path, out_dir).replace(os.sep, "/")] = hashlib.sha256(fin.read()).hexdigest()
+    return digests
+
+"""
+    checks that json2src.py output for the synthetic specification is
+    byte-identical to the recorded digests; --update records new digests
+    after an intended change of the generated code
+"""
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=2, help="multiplier of the synthetic specification size.")
+    parser.add_argument("--update", action='store_true', help="record the digests of the current output.")
+    parser.add_argument("options", nargs="*", help="json2src.py options, e.g. -- --jobs 4")
+    args = parser.parse_args()
+
+    digests = generate(args.scale, args.options)
+    if args.update:
+        with open(golden_path, 'w') as fout:
+            json.dump({"scale": args.scale, "files": digests}, fout, indent=4, sort_keys=True)
+            fout.write("\n")
+        print("Recorded %d files." % len(digests))
+        sys.exit(0)
+
+    with open(golden_path, 'r') as fin:
+        golden = json.load(fin)
+    if golden["scale"] != args.scale:
+        sys.exit("golden digests are for scale %d" % golden["scale"])
+    errors = []
+    for path in sorted(set(golden["files"]) | set(digests)):
+        if path not in digests:
+            errors.append("%s: missing" % path)
+        elif path not in golden["files"]:
+            errors.append("%s: not in the golden digests" % path)
+        elif digests[path] != golden["files"][path]:
+            errors.append("%s: differs" % path)
+    for error in errors:
+        print(error)
+    print("%d of %d files differ from the golden digests" % (len(errors), len(digests)))
+    sys.exit(1 if errors else 0)
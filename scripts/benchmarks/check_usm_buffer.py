@@ -0,0 +1,200 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import gc
+import sys
+from ctypes import *
+import numpy
+import stub_loader
+from level_zero import ze, usm
+
+"""
+    native memory stand-in: host and device allocations are malloc'ed and
+    tracked by range, so zeMemGetAllocProperties reports their type, and
+    UNKNOWN for other addresses; frees counts zeMemFree calls
+"""
+FAKE_DRIVER = r'''
+#include <stdint.h>
+#include <stdlib.h>
+typedef struct { uint32_t stype; const void *pNext; uint32_t type; uint64_t id; uint64_t pageSize; } properties_t;
+typedef struct { char *base; size_t size; uint32_t type; } range_t;
+#define RANGES 64
+static range_t ranges[RANGES];
+uint64_t frees;
+static int find(const void *p) {
+    for (int i = 0; i < RANGES; ++i)
+        if (ranges[i].base && (const char *)p >= ranges[i].base && (const char *)p < ranges[i].base + ranges[i].size)
+            return i;
+    return -1;
+}
+static int track(void **out, size_t size, uint32_t type) {
+    for (int i = 0; i < RANGES; ++i)
+        if (!ranges[i].base) {
+            ranges[i].base = aligned_alloc(64, (size + 63) / 64 * 64);
+            ranges[i].size = size; ranges[i].type = type;
+            *out = ranges[i].base;
+            return 0;
+        }
+    return 0x70000002;
+}
+int fake_alloc_host(void *ctx, void *desc, size_t size, size_t alignment, void **out) { return track(out, size, 1); }
+int fake_alloc_device(void *ctx, void *desc, size_t size, size_t alignment, void *dev, void **out) { return track(out, size, 2); }
+int fake_free(void *ctx, void *p) {
+    int i = find(p);
+    if (i < 0) return 0x78000004;
+    free(ranges[i].base); ranges[i].base = NULL; ++frees;
+    return 0;
+}
+int fake_get_properties(void *ctx, const void *p, properties_t *properties, void **device) {
+    int i = find(p);
+    properties->type = i < 0 ? 0 : ranges[i].type;
+    if (device) *device = i < 0 ? NULL : (void *)0x2000;
+    return 0;
+}
+'''
+
+"""
+    memory functions routed to the fake: {api name : symbol}
+"""
+FAKE_FUNCTIONS = {
+    "zeMemAllocHost" : "fake_alloc_host",
+    "zeMemAllocDevice" : "fake_alloc_device",
+    "zeMemFree" : "fake_free",
+    "zeMemGetAllocProperties" : "fake_get_properties",
+}
+
+context = 0x1000
+device = 0x2000
+
+"""
+    numpy views of a host buffer share its memory, with its shape and dtype
+"""
+def check_views(ddi):
+    with usm.USMBuffer.allocate(ddi, context, 24 * 4, format="f", shape=(4, 6)) as buf:
+        view = numpy.asarray(buf)
+        assert view.shape == (4, 6) and view.dtype == numpy.float32, (view.shape, view.dtype)
+        assert view.ctypes.data == buf.address
+        view[...] = numpy.arange(24, dtype=numpy.float32).reshape(4, 6)
+        assert buf.memoryview()[1, 1] == 7.0
+        del view
+
+"""
+    float16 buffers have no memoryview, but the array interface and DLPack
+    export them
+"""
+def check_float16(ddi):
+    with usm.USMBuffer.allocate(ddi, context, 8 * 2, format="e") as buf:
+        try:
+            buf.memoryview()
+        except BufferError:
+            pass
+        else:
+            raise AssertionError("memoryview of a float16 buffer did not raise BufferError")
+        view = numpy.asarray(buf)
+        assert view.dtype == numpy.float16 and view.shape == (8,), (view.shape, view.dtype)
+        view[:] = 1.5
+        array = numpy.from_dlpack(buf)
+        assert array.dtype == numpy.float16 and array.sum() == 12.0, (array.dtype, array.sum())
+        del view, array
+        gc.collect()
+        assert len(usm._exports) == 0, "the deleter did not drop the export"
+
+"""
+    numpy.from_dlpack consumes the capsule without a copy; the deleter called
+    when the array is collected drops the export
+"""
+def check_dlpack(ddi):
+    with usm.USMBuffer.allocate(ddi, context, 16 * 8, format="q", shape=(16,)) as buf:
+        assert buf.__dlpack_device__() == (1, 0)
+        array = numpy.from_dlpack(buf)
+        assert array.shape == (16,) and array.dtype == numpy.int64, (array.shape, array.dtype)
+        assert array.ctypes.data == buf.address
+        assert len(usm._exports) == 1
+        numpy.asarray(buf)[:] = 5
+        assert array.sum() == 80
+        del array
+        gc.collect()
+        assert len(usm._exports) == 0, "the deleter did not drop the export"
+
+"""
+    a capsule that is never consumed drops the export in its destructor
+"""
+def check_unconsumed(ddi):
+    with usm.USMBuffer.allocate(ddi, context, 64) as buf:
+        capsule = buf.__dlpack__()
+        assert len(usm._exports) == 1
+        del capsule
+        gc.collect()
+        assert len(usm._exports) == 0, "the capsule destructor did not drop the export"
+
+"""
+    device memory has no host views and only exports as a oneAPI tensor
+"""
+def check_device(ddi):
+    with usm.USMBuffer.allocate(ddi, context, 64, kind="device", hDevice=device, device_id=1) as buf:
+        assert buf.type == ze.ze_memory_type_v.DEVICE and buf.device == device
+        for view in (numpy.asarray, usm.USMBuffer.memoryview, lambda buf: buf.__dlpack__(dl_device=(1, 0))):
+            try:
+                view(buf)
+            except BufferError:
+                continue
+            raise AssertionError("%s of device memory did not raise BufferError" % view)
+        assert buf.__dlpack_device__() == (14, 1)
+        capsule = buf.__dlpack__()
+        del capsule
+        gc.collect()
+        assert len(usm._exports) == 0, "the capsule destructor did not drop the export"
+
+"""
+    addresses not allocated in the context are rejected; close() frees owned
+    allocations only
+"""
+def check_ownership(ddi, frees):
+    try:
+        usm.USMBuffer(ddi, context, 0x40, 64)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("an unknown address did not raise ValueError")
+    before = frees.value
+    owned = usm.USMBuffer.allocate(ddi, context, 64)
+    view = usm.USMBuffer(ddi, context, owned.address, 64)
+    view.close()
+    assert frees.value == before, "closing a view freed the allocation"
+    owned.close()
+    owned.close()
+    assert frees.value == before + 1, "closing an owned buffer did not free it once"
+
+"""
+    checks USMBuffer views, DLPack exports and their lifetimes over a fake
+    driver
+"""
+if __name__ == '__main__':
+    fake = stub_loader.build_library(FAKE_DRIVER, "ze_usm_buffer_")
+    loader = stub_loader.StubLoader(ze.ZE_DDI, overrides=stub_loader.native_overrides(ze.ZE_DDI, fake, FAKE_FUNCTIONS))
+    with stub_loader.patched_loader(ze, loader):
+        ddi = ze.ZE_DDI(ze.ZE_API_VERSION_CURRENT_M, lazy=True)
+    frees = c_uint64.in_dll(fake, "frees")
+
+    checks = [
+        ("views", lambda: check_views(ddi)),
+        ("dlpack", lambda: check_dlpack(ddi)),
+        ("float16", lambda: check_float16(ddi)),
+        ("unconsumed capsule", lambda: check_unconsumed(ddi)),
+        ("device memory", lambda: check_device(ddi)),
+        ("ownership", lambda: check_ownership(ddi, frees)),
+    ]
+    errors = 0
+    for name, check in checks:
+        try:
+            check()
+            print("%-20s ok" % name)
+        except Exception as error:
+            errors += 1
+            print("%-20s FAILED: %s" % (name, error))
+    print("%d of %d checks failed" % (errors, len(checks)))
+    sys.exit(1 if errors else 0)
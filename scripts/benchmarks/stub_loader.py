@@ -0,0 +1,119 @@
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import os
+import subprocess
+import sys
+import tempfile
+from ctypes import *
+
+include_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "..", "include")
+if include_dir not in sys.path:
+    sys.path.insert(0, include_dir)
+
+"""
+    default entry point installed in every ddi table slot; returns ZE_RESULT_SUCCESS
+"""
+_stub_func_t = CFUNCTYPE(c_int)
+_stub_func = _stub_func_t(lambda: 0)
+
+"""
+    compiles C 'source' into a shared library in a new temporary directory
+    named with 'prefix', with -D for each "NAME=VALUE" of 'defines' and the
+    extra compiler 'flags'; returns the loaded CDLL
+"""
+def build_library(source, prefix, defines=(), flags=()):
+    builddir = tempfile.mkdtemp(prefix=prefix)
+    src = os.path.join(builddir, "fake.c")
+    lib = os.path.join(builddir, "fake.so")
+    with open(src, 'w') as fout:
+        fout.write(source)
+    subprocess.check_call(["cc", "-shared", "-fPIC", "-O2"] + list(flags) + ["-o", lib, src] +
+        ["-D%s" % define for define in defines])
+    return CDLL(lib)
+
+"""
+    returns the StubLoader overrides of 'ddi' (a ZE_DDI, ZES_DDI or ZET_DDI
+    class) routing each API function of 'symbols' ({api name : symbol}) to
+    that symbol of the library 'lib'
+"""
+def native_overrides(ddi, lib, symbols):
+    return dict((name, ddi._functype(ddi._functions[name][2])(cast(getattr(lib, symbol), c_void_p).value))
+        for name, symbol in symbols.items())
+
+"""
+    returns a native entry point that ignores its arguments and returns
+    ZE_RESULT_SUCCESS, so call overhead can be measured without a Python
+    callback on the driver side; falls back to the Python stub without a compiler
+"""
+_native_lib = None
+
+def native_stub():
+    global _native_lib
+    if _native_lib is None:
+        try:
+            _native_lib = build_library("int ze_stub(void) { return 0; }\n", "ze_stub_")
+        except (OSError, subprocess.CalledProcessError):
+            return _stub_func
+    return _stub_func_t(cast(_native_lib.ze_stub, c_void_p).value)
+
+"""
+    stands in for the ze_loader library: every zeGet*ProcAddrTable call fills the
+    table with stub entry points ('default', or a Python callback returning
+    ZE_RESULT_SUCCESS). 'overrides' maps an API function name of 'ddi'
+    (e.g. 'zeEventHostSynchronize') to a ctypes function object to install instead,
+    and 'missing' lists table names whose getter fails with 'missing_result'.
+"""
+class StubLoader:
+    def __init__(self, ddi, overrides=None, missing=(), missing_result=0x78000003, default=None):
+        self.default = default if default is not None else _stub_func
+        self.members = {}
+        for fname, func in (overrides or {}).items():
+            table, pfn, _ = ddi._functions[fname]
+            self.members.setdefault(ddi._tables[table][0], {})[pfn] = func
+        self.missing = set(ddi._tables[table][0] for table in missing)
+        self.missing_result = missing_result
+        self.getter_calls = 0
+
+    def __getattr__(self, name):
+        if not name.endswith("ProcAddrTable"):
+            raise AttributeError(name)
+
+        def getter(version, ptable):
+            self.getter_calls += 1
+            if name in self.missing:
+                return self.missing_result
+            table = ptable._obj
+            members = self.members.get(name, {})
+            for member, _ in table._fields_:
+                func = members.get(member, self.default)
+                setattr(table, member, cast(func, c_void_p).value)
+            return 0
+
+        setattr(self, name, getter)
+        return getter
+
+"""
+    replaces the library loaders used by a bindings module with a StubLoader
+"""
+class patched_loader:
+    def __init__(self, module, loader):
+        self.module = module
+        self.loader = loader
+
+    def __enter__(self):
+        self._saved = (self.module.CDLL, self.module.WinDLL if hasattr(self.module, "WinDLL") else None)
+        self.module.CDLL = lambda name: self.loader
+        self.module.WinDLL = lambda name: self.loader
+        return self.loader
+
+    def __exit__(self, *exc):
+        self.module.CDLL, windll = self._saved
+        if windll is not None:
+            self.module.WinDLL = windll
+        else:
+            del self.module.WinDLL
+        return False
@@ -0,0 +1,272 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import argparse
+import json
+import os
+import re
+import sys
+
+"""
+    sections of the synthetic specification: (name, namespace, tags, class
+    prefix, number of classes at scale 1)
+"""
+sections = [
+    ("core", "ze", {"$x": "ze"}, "$x", 12),
+    ("tools", "zet", {"$t": "zet", "$x": "ze"}, "$t", 4),
+    ("sysman", "zes", {"$s": "zes", "$x": "ze"}, "$s", 12),
+]
+
+versions = ["1.0", "1.0", "1.1", "1.2", "1.3", "1.5", "1.8", "1.10"]
+
+"""
+    returns the snake_case form of a CamelCase name
+"""
+def _snake(name):
+    return "".join(("_" + c.lower()) if c.isupper() else c for c in name).lstrip("_")
+
+def _returns(*checks):
+    returns = [{"$X_RESULT_SUCCESS": []}, {"$X_RESULT_ERROR_UNINITIALIZED": []}]
+    for key, values in checks:
+        returns.append({key: ["`%s`" % value for value in values]})
+    return returns
+
+def _function(prefix, cls, name, params, returns, ordinal, version="1.0", details=None):
+    obj = {
+        "type": "function",
+        "desc": "%s the %s" % (name, cls),
+        "class": prefix + cls,
+        "name": name,
+        "params": params,
+        "returns": returns,
+        "ordinal": str(ordinal),
+        "version": version,
+    }
+    if details:
+        obj["details"] = details
+    return obj
+
+"""
+    returns the spec document of one class: its handle, enumeration, two
+    structures and 'functions' functions, the last one experimental
+"""
+def _class_doc(prefix, cls, parent, index, functions, meta):
+    snake = _snake(cls)
+    upper = prefix.upper() + "_" + snake.upper()
+    handle = "%s_%s_handle_t" % (prefix, snake)
+    flags = "%s_%s_flags_t" % (prefix, snake)
+    flag = "%s_%s_flag_t" % (prefix, snake)
+    desc = "%s_%s_desc_t" % (prefix, snake)
+    properties = "%s_%s_properties_t" % (prefix, snake)
+    parent_handle = "%s_%s_handle_t" % (prefix, _snake(parent)) if parent else None
+    etors = ["%s_FLAG_%s" % (upper, name) for name in ("FIRST", "SECOND", "THIRD")]
+
+    objects = [
+        {"type": "handle", "desc": "Handle of a %s object" % cls, "class": prefix + cls, "name": handle},
+        {"type": "macro", "desc": "Maximum %s name length" % cls, "class": prefix + cls, "name": "$X_MAX_%s_NAME" % snake.upper(), "value": "256"},
+        {"type": "typedef", "desc": "Supported %s flags" % cls, "class": prefix + cls, "name": flags, "value": "uint32_t"},
+        {"type": "enum", "desc": "Supported %s flags" % cls, "class": prefix + cls, "name": flag,
+            "etors": [{"name": etor, "value": "$X_BIT(%d)" % i, "desc": "flag %d" % i} for i, etor in enumerate(etors)]},
+        {"type": "struct", "desc": "%s descriptor" % cls, "class": prefix + cls, "name": desc, "base": "$x_base_desc_t",
+            "members": [
+                {"type": "$x_structure_type_t", "name": "stype", "desc": "[in] type of this structure", "init": "$X_STRUCTURE_TYPE_%s_DESC" % snake.upper()},
+                {"type": "const void*", "name": "pNext", "desc": "[in][optional] must be null or a pointer to an extension-specific structure"},
+                {"type": flags, "name": "flags", "desc": "[in] creation flags"},
+                {"type": "uint32_t", "name": "ordinal", "desc": "[in] ordinal of the object"},
+            ]},
+        {"type": "struct", "desc": "%s properties" % cls, "class": prefix + cls, "name": properties, "base": "$x_base_properties_t",
+            "members": [
+                {"type": "$x_structure_type_t", "name": "stype", "desc": "[in] type of this structure", "init": "$X_STRUCTURE_TYPE_%s_PROPERTIES" % snake.upper()},
+                {"type": "void*", "name": "pNext", "desc": "[in,out][optional] must be null or a pointer to an extension-specific structure"},
+                {"type": "uint64_t", "name": "size", "desc": "[out] size in bytes"},
+                {"type": "char", "name": "name[$X_MAX_%s_NAME]" % snake.upper(), "desc": "[out] name"},
+            ]},
+    ]
+
+    hself = "h" + cls
+    self_param = {"type": handle, "name": hself, "desc": "[in] handle of the %s" % cls}
+    ordinal = 0
+    if parent_handle:
+        objects.append(_function(prefix, cls, "Create", [
+                {"type": parent_handle, "name": "h" + parent, "desc": "[in] handle of the %s" % parent},
+                {"type": "const %s*" % desc, "name": "desc", "desc": "[in] pointer to the descriptor"},
+                {"type": handle + "*", "name": "ph" + cls, "desc": "[out] pointer to handle of the %s created" % cls},
+            ], _returns(("$X_RESULT_ERROR_INVALID_NULL_HANDLE", ["nullptr == h" + parent]),
+                        ("$X_RESULT_ERROR_INVALID_NULL_POINTER", ["nullptr == desc", "nullptr == ph" + cls]),
+                        ("$X_RESULT_ERROR_INVALID_ENUMERATION", ["0x7 < desc->flags"])),
+            ordinal, details=["The application may call this function from simultaneous threads."]))
+        ordinal += 1
+        objects.append(_function(prefix, cls, "Destroy", [
+                dict(self_param, desc="[in][release] handle of the %s to destroy" % cls),
+            ], _returns(("$X_RESULT_ERROR_INVALID_NULL_HANDLE", ["nullptr == " + hself])), ordinal))
+        ordinal += 1
+    objects.append(_function(prefix, cls, "GetProperties", [
+            self_param,
+            {"type": properties + "*", "name": "pProperties", "desc": "[in,out] query result for the properties"},
+        ], _returns(("$X_RESULT_ERROR_INVALID_NULL_HANDLE", ["nullptr == " + hself]),
+                    ("$X_RESULT_ERROR_INVALID_NULL_POINTER", ["nullptr == pProperties"])), ordinal))
+    ordinal += 1
+
+    for i in range(functions):
+        experimental = i == functions - 1
+        name = "Operation%d" % i + ("Exp" if experimental else "")
+        params = [self_param]
+        checks = [("$X_RESULT_ERROR_INVALID_NULL_HANDLE", ["nullptr == " + hself])]
+        if parent_handle and i % 3 == 0:
+            params += [
+                {"type": "uint32_t", "name": "numHandles", "desc": "[in] number of handles"},
+                {"type": parent_handle + "*", "name": "ph" + parent + "s", "desc": "[in][optional][range(0, numHandles)] handles of the %ss" % parent},
+            ]
+        if i % 3 == 1:
+            params += [
+                {"type": "uint32_t*", "name": "pCount", "desc": "[in,out] number of values"},
+                {"type": "uint64_t*", "name": "pValues", "desc": "[in,out][optional][range(0, *pCount)] values"},
+            ]
+            checks.append(("$X_RESULT_ERROR_INVALID_NULL_POINTER", ["nullptr == pCount"]))
+        else:
+            params += [
+                {"type": flags, "name": "flags", "desc": "[in] operation flags"},
+                {"type": "size_t", "name": "size", "desc": "[in] size in bytes"},
+                {"type": "void*", "name": "pValue", "desc": "[out] pointer to the value"},
+            ]
+            checks.append(("$X_RESULT_ERROR_INVALID_NULL_POINTER", ["nullptr == pValue"]))
+            checks.append(("$X_RESULT_ERROR_INVALID_ENUMERATION", ["0x7 < flags"]))
+        version = "1.0" if experimental else versions[(index + i) % len(versions)]
+        objects.append(_function(prefix, cls, name, params, _returns(*checks), ordinal, version))
+        ordinal += 1
+
+    meta["class"][prefix + cls] = {"ordinal": "%d" % (len(meta["class"]) * 10), "handle": [handle]}
+    meta["handle"][handle] = {"class": [prefix + cls]}
+    meta["enum"][flag] = {"class": prefix + cls, "etors": etors, "types": [flags]}
+    meta["typedef"][flags] = {"class": prefix + cls}
+    meta["struct"][desc] = {"class": prefix + cls, "base": "$x_base_desc_t"}
+    meta["struct"][properties] = {"class": prefix + cls, "base": "$x_base_properties_t"}
+    meta["macro"]["$X_MAX_%s_NAME" % snake.upper()] = {"class": prefix + cls}
+
+    return {"header": {"type": "header", "desc": "%s APIs" % cls, "ordinal": str(index)},
+            "name": snake, "objects": objects}
+
+"""
+    returns the driver document of a section that has its own Init and
+    DriverGet
+"""
+def _driver_doc(prefix, meta):
+    handle = "%s_driver_handle_t" % prefix
+    objects = [
+        {"type": "handle", "desc": "Handle of a driver instance", "class": prefix + "Driver", "name": handle},
+        _function(prefix, "", "Init", [
+                {"type": "$x_init_flags_t", "name": "flags", "desc": "[in] initialization flags"},
+            ], _returns(("$X_RESULT_ERROR_INVALID_ENUMERATION", ["0x3 < flags"])), 0),
+        _function(prefix, "Driver", "Get", [
+                {"type": "uint32_t*", "name": "pCount", "desc": "[in,out] pointer to the number of driver instances"},
+                {"type": handle + "*", "name": "phDrivers", "desc": "[in,out][optional][range(0, *pCount)] array of driver instance handles"},
+            ], _returns(("$X_RESULT_ERROR_INVALID_NULL_POINTER", ["nullptr == pCount"])), 1),
+    ]
+    meta["class"][prefix + "Driver"] = {"ordinal": "%d" % (len(meta["class"]) * 10), "handle": [handle]}
+    meta["handle"][handle] = {"class": [prefix + "Driver"]}
+    return {"header": {"type": "header", "desc": "Driver APIs", "ordinal": "0"}, "name": "driver", "objects": objects}
+
+"""
+    returns the core document of the types every section uses: version and
+    bit macros, results, API versions, structure types (the 'stypes' used by
+    the sections' structures), initialization flags, base structures, a union
+    and a callback
+"""
+def _common_doc(stypes, meta):
+    results = [("SUCCESS", "0"), ("ERROR_UNINITIALIZED", "0x78000001"), ("ERROR_UNSUPPORTED_FEATURE", "0x78000003"),
+               ("ERROR_INVALID_NULL_HANDLE", "0x78000005"), ("ERROR_INVALID_NULL_POINTER", "0x78000007"),
+               ("ERROR_INVALID_ENUMERATION", "0x7800000c"), ("ERROR_UNKNOWN", "0x7ffffffe")]
+    base_members = [
+        {"type": "$x_structure_type_t", "name": "stype", "desc": "[in] type of this structure"},
+        {"type": "void*", "name": "pNext", "desc": "[in,out][optional] must be null or a pointer to an extension-specific structure"},
+    ]
+    objects = [
+        {"type": "macro", "desc": "Generates generic API versions", "name": "$X_MAKE_VERSION( _major, _minor )", "value": "(( _major << 16 )|( _minor & 0x0000ffff))"},
+        {"type": "macro", "desc": "Generic macro for enumerator bit masks", "name": "$X_BIT( _i )", "value": "( 1 << _i )"},
+        {"type": "macro", "desc": "Maximum universal unique id (UUID) size in bytes", "name": "$X_MAX_UUID_SIZE", "value": "16"},
+        {"type": "typedef", "desc": "compiler-independent type", "name": "$x_bool_t", "value": "uint8_t"},
+        {"type": "enum", "desc": "Defines Return/Error codes", "name": "$x_result_t",
+            "etors": [{"name": "$X_RESULT_" + name, "value": value, "desc": name.lower().replace("_", " ")} for name, value in results]},
+        {"type": "enum", "desc": "Supported API versions", "name": "$x_api_version_t",
+            "etors": [{"name": "$X_API_VERSION_1_0", "value": "$X_MAKE_VERSION( 1, 0 )", "desc": "version 1.0"},
+                      {"name": "$X_API_VERSION_CURRENT", "value": "$X_MAKE_VERSION( 1, 10 )", "desc": "latest known version"}]},
+        {"type": "enum", "desc": "Defines structure types", "name": "$x_structure_type_t",
+            "etors": [{"name": stype, "value": "0x%x" % (i + 1), "desc": stype} for i, stype in enumerate(stypes)]},
+        {"type": "enum", "desc": "Supported initialization flags", "name": "$x_init_flags_t",
+            "etors": [{"name": "$X_INIT_FLAG_GPU_ONLY", "value": "$X_BIT(0)", "desc": "only initialize GPU drivers"},
+                      {"name": "$X_INIT_FLAG_VPU_ONLY", "value": "$X_BIT(1)", "desc": "only initialize VPU drivers"}]},
+        {"type": "struct", "desc": "Base for all descriptor types", "name": "$x_base_desc_t", "members": base_members},
+        {"type": "struct", "desc": "Base for all properties types", "name": "$x_base_properties_t", "members": base_members},
+        {"type": "struct", "desc": "Universal unique id (UUID)", "name": "$x_uuid_t",
+            "members": [{"type": "uint8_t", "name": "id[$X_MAX_UUID_SIZE]", "desc": "[out] opaque data representing a UUID"}]},
+        {"type": "union", "desc": "Union of values", "name": "$x_value_t",
+            "members": [
+                {"type": "uint32_t", "name": "ui32", "desc": "[out] 32-bit unsigned-integer"},
+                {"type": "uint64_t", "name": "ui64", "desc": "[out] 64-bit unsigned-integer"},
+                {"type": "float", "name": "fp32", "desc": "[out] 32-bit floating-point"},
+                {"type": "double", "name": "fp64", "desc": "[out] 64-bit floating-point"},
+                {"type": "$x_bool_t", "name": "b8", "desc": "[out] 8-bit boolean"},
+            ]},
+        {"type": "fptr_typedef", "desc": "Callback receiving a value", "name": "$x_value_cb_t", "return": "void",
+            "params": [{"type": "$x_value_t*", "name": "pValue", "desc": "[in] the value"},
+                       {"type": "void*", "name": "pUserData", "desc": "[in] user data"}]},
+    ]
+    for obj in objects:
+        if obj["type"] == "enum":
+            meta["enum"][obj["name"]] = {"class": "$x", "etors": [etor["name"] for etor in obj["etors"]], "types": []}
+        elif obj["type"] in ("struct", "union", "typedef", "macro"):
+            meta[obj["type"]][re.sub(r"\(.*", "", obj["name"])] = {"class": "$x"}
+    return {"header": {"type": "header", "desc": "Common types", "ordinal": "0"}, "name": "common", "objects": objects}
+
+"""
+    returns an input in the format read by json2src.py with the number of
+    classes of each section, and functions of each class, multiplied by 'scale'
+"""
+def make_spec(scale=1, functions=6):
+    meta = {"class": {}, "handle": {}, "enum": {}, "typedef": {}, "struct": {}, "union": {}, "macro": {}}
+    specs = []
+    configs = []
+    for name, namespace, tags, prefix, classes in sections:
+        docs = []
+        if name != "tools":
+            docs.append(_driver_doc(prefix, meta))
+        for i in range(classes * scale):
+            cls = "Widget%d" % i
+            parent = "Driver" if name != "tools" else None
+            docs.append(_class_doc(prefix, cls, parent, i, functions, meta))
+        specs.append(docs)
+        configs.append({"name": name, "namespace": namespace, "tags": tags})
+    stypes = []
+    for docs in specs:
+        for doc in docs:
+            for obj in doc["objects"]:
+                for member in obj.get("members", []):
+                    if member.get("init", "").startswith("$X_STRUCTURE_TYPE_") and member["init"] not in stypes:
+                        stypes.append(member["init"])
+    specs[0].insert(0, _common_doc(stypes, meta))
+    return {"specs": specs, "configs": configs, "meta": meta}
+
+"""
+    creates the directories json2src.py writes into under 'out_dir', as laid
+    out in this repository
+"""
+def make_tree(out_dir):
+    source_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "..", "source")
+    for root, dirs, files in os.walk(source_dir):
+        os.makedirs(os.path.join(out_dir, "source", os.path.relpath(root, source_dir)), exist_ok=True)
+    os.makedirs(os.path.join(out_dir, "include"), exist_ok=True)
+
+"""
+    writes a synthetic specification for benchmarking json2src.py
+"""
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=1, help="multiplier of the number of classes per section.")
+    parser.add_argument("--functions", type=int, default=6, help="functions per class, besides Create, Destroy and GetProperties.")
+    parser.add_argument("-o", "--output", type=argparse.FileType('w'), default=sys.stdout, help="output file, default is stdout")
+    args = parser.parse_args()
+    json.dump(make_spec(args.scale, args.functions), args.output, indent=1)
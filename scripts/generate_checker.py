@@ -33,7 +33,6 @@ if __name__ == '__main__':
     filename = "zel_%s_checker.h"%(name)
     fout = os.path.join(srcpath, filename)
 
-    print("Generating %s..."%fout)
     loc += util.makoWrite(
         fin, fout,
         name=name)
@@ -44,7 +43,6 @@ if __name__ == '__main__':
     filename = "zel_%s_checker.cpp"%(name)
     fout = os.path.join(srcpath, filename)
 
-    print("Generating %s..."%fout)
     loc += util.makoWrite(
         fin, fout,
         name=name,
@@ -56,7 +54,6 @@ if __name__ == '__main__':
     filename = "CMakeLists.txt"
     fout = os.path.join(srcpath, filename)
 
-    print("Generating %s..."%fout)
     loc += util.makoWrite(
         fin, fout,
         name=name,
@@ -4,6 +4,7 @@
  SPDX-License-Identifier: MIT
 
 """
+import io
 import os
 import re
 import util
@@ -11,6 +12,7 @@ import util
 templates_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "templates")
 tracing_templates_dir = os.path.join(templates_dir, "tracing")
 validation_templates_dir = os.path.join(templates_dir, "validation")
+python_templates_dir = os.path.join(templates_dir, "python")
 
 """
     generates c/c++ files from the specification documents
@@ -22,7 +24,6 @@ def _mako_ddi_cpp(path, namespace, tags, version, specs, meta):
     filename = "%s_ddi.h"%(namespace)
     fout = os.path.join(path, filename)
 
-    print("Generating %s..."%fout)
     return util.makoWrite(
         fin, fout,
         ver=version,
@@ -43,7 +44,6 @@ def _mako_lib_cpp(path, namespace, tags, version, specs, meta):
     filename = "%s.cpp"%(name)
     fout = os.path.join(path, filename)
 
-    print("Generating %s..."%fout)
     loc += util.makoWrite(
         fin, fout,
         name = name,
@@ -60,7 +60,6 @@ def _mako_lib_cpp(path, namespace, tags, version, specs, meta):
     filename = "%s.cpp"%(name)
     fout = os.path.join(path, filename)
 
-    print("Generating %s..."%fout)
     loc += util.makoWrite(
         fin, fout,
         name=name,
@@ -83,7 +82,6 @@ def _mako_wrapper_cpp(path, namespace, tags, version, specs, meta):
     filename = "%s.cpp"%(name)
     fout = os.path.join(path, filename)
 
-    print("Generating %s..."%fout)
     loc += util.makoWrite(
         fin, fout,
         name = name,
@@ -107,7 +105,6 @@ def _mako_loader_cpp(path, namespace, tags, version, specs, meta):
     filename = "%s.h"%(name)
     fout = os.path.join(path, filename)
 
-    print("Generating %s..."%fout)
     loc += util.makoWrite(
         fin, fout,
         name=name,
@@ -117,16 +114,14 @@ def _mako_loader_cpp(path, namespace, tags, version, specs, meta):
         specs=specs,
         meta=meta)
 
+    # merged into ze_loader_internal.h by generate_loader_internal
     template = "ze_loader_internal.h.mako"
     fin = os.path.join(templates_dir, template)
 
-    name = "%s_loader_internal_tmp"%(namespace)
-    filename = "%s.h"%(name)
-    fout = os.path.join(path, filename)
+    name = "%s_loader_internal"%(namespace)
 
-    print("Generating %s..."%fout)
-    loc += util.makoWrite(
-        fin, fout,
+    loc += util.makoRender(
+        fin, name,
         name=name,
         ver=version,
         namespace=namespace,
@@ -141,7 +136,6 @@ def _mako_loader_cpp(path, namespace, tags, version, specs, meta):
     filename = "%s.cpp"%(name)
     fout = os.path.join(path, filename)
 
-    print("Generating %s..."%fout)
     loc += util.makoWrite(
         fin, fout,
         name=name,
@@ -167,6 +161,35 @@ validation_files = {
     'certification.h.mako' : ('checkers/certification/generated', 'certification.h'),
 }
 
+# 'target' : templates rendered for it, relative to templates_dir
+targets = {
+    'lib' : ['libapi.cpp.mako', 'libddi.cpp.mako'],
+    'loader' : ['ldrddi.h.mako', 'ze_loader_internal.h.mako', 'ldrddi.cpp.mako'],
+    'validation' : [os.path.join('validation', input_file) for input_file in validation_files],
+    'tracing' : [os.path.join('tracing', input_file) for input_file in [
+        'trcddi.cpp.mako', 'trc_setters.cpp.mako', 'trc_setters.h.mako', 'trc_cb_struct.h.mako', 'trc_register_cb_libapi.cpp.mako']],
+    'drivers' : ['nullddi.cpp.mako'],
+    'python' : [os.path.join('python', t) for t in ['__init__.py.mako', 'api.py.mako', 'api_cffi.py.mako', 'api_numpy.py.mako']],
+}
+
+"""
+    returns the absolute paths of the templates of the named targets; a name is
+    a key of 'targets' or a template, e.g. 'valddi.cpp' or 'validation/valddi.cpp.mako'
+"""
+def get_target_templates(names):
+    templates = set()
+    for name in names:
+        if name in targets:
+            matches = targets[name]
+        else:
+            filename = name if name.endswith(".mako") else name + ".mako"
+            matches = [t for group in targets.values() for t in group
+                if t == filename or os.path.basename(t) == filename]
+            if not matches:
+                raise ValueError("unknown target '%s', expected one of %s or a template name"%(name, ", ".join(targets)))
+        templates.update(os.path.join(templates_dir, t) for t in matches)
+    return templates
+
 def _mako_validation_layer_cpp(path, namespace, tags, version, specs, meta):
     loc = 0
     
@@ -181,7 +204,6 @@ def _mako_validation_layer_cpp(path, namespace, tags, version, specs, meta):
         dstpath = os.path.join(dstpath, validation_files[input_file][0])
         fout = os.path.join(dstpath, filename)
 
-        print("Generating %s..."%fout)
         loc += util.makoWrite(
             fin, fout,
             name=filename,
@@ -208,7 +230,6 @@ def _mako_tracing_layer_h(path, namespace, tags, version, specs, meta):
     filename = "%s.h"%(name)
     fout = os.path.join(dstpath, filename)
 
-    print("Generating %s..."%fout)
     return util.makoWrite(
         fin, fout,
         name=name,
@@ -233,7 +254,6 @@ def _mako_tracing_layer_cpp(path, namespace, tags, version, specs, meta):
     filename = "%s.cpp"%(name)
     fout = os.path.join(dstpath, filename)
 
-    print("Generating %s..."%fout)
     loc = util.makoWrite(
         fin, fout,
         name=name,
@@ -250,7 +270,6 @@ def _mako_tracing_layer_cpp(path, namespace, tags, version, specs, meta):
     filename = "%s.cpp"%(name)
     fout = os.path.join(dstpath, filename)
 
-    print("Generating %s..."%fout)
     loc += util.makoWrite(
         fin, fout,
         name=name,
@@ -267,7 +286,6 @@ def _mako_tracing_layer_cpp(path, namespace, tags, version, specs, meta):
     filename = "%s.h"%(name)
     fout = os.path.join(dstpath, filename)
 
-    print("Generating %s..."%fout)
     loc += util.makoWrite(
         fin, fout,
         name=name,
@@ -293,7 +311,6 @@ def _mako_tracing_lib_cpp(path, namespace, tags, version, specs, meta):
     filename = "%s.cpp"%(name)
     fout = os.path.join(dstpath, filename)
 
-    print("Generating %s..."%fout)
     return util.makoWrite(
         fin, fout,
         name=name,
@@ -317,7 +334,6 @@ def _mako_null_driver_cpp(path, namespace, tags, version, specs, meta):
     filename = "%s.cpp"%(name)
     fout = os.path.join(dstpath, filename)
 
-    print("Generating %s..."%fout)
     return util.makoWrite(
         fin, fout,
         name=name,
@@ -351,6 +367,69 @@ def generate_loader(path, section, namespace, tags, version, specs, meta):
     loc += _mako_loader_cpp(dstpath, namespace, tags, version, specs, meta)
     print("Generated %s lines of code.\n"%loc)
 
+"""
+Private:
+    returns the lines between the '/// factories' and '/// end factories'
+    markers of a header
+"""
+def _factory_lines(content):
+    lines = []
+    inside_factory = False
+    for line in io.StringIO(content):
+        if '/// factories' in line:
+            inside_factory = True
+            continue
+        if '/// end factories' in line:
+            inside_factory = False
+            continue
+        if inside_factory:
+            lines.append(line)
+    return lines
+
+"""
+Entry-point:
+    generates ze_loader_internal.h from the core section's loader internal
+    header, with the factory section replaced by the sorted, unique factory
+    lines of every section's header
+"""
+def generate_loader_internal(path, namespaces=["ze", "zet", "zes"]):
+    if not util.isSelected(os.path.join(templates_dir, "ze_loader_internal.h.mako")):
+        return
+    fout = os.path.join(path, "loader", "ze_loader_internal.h")
+    names = ["%s_loader_internal"%(namespace) for namespace in namespaces]
+    if util.incremental and not util.changed.intersection(names) and os.path.exists(fout):
+        return
+
+    # sections not generated this time contribute their header from the previous run
+    headers = []
+    for name in names:
+        if name in util.rendered:
+            headers.append(util.rendered[name])
+        elif name in util.previousRendered:
+            headers.append(util.previousRendered[name]["content"])
+        else:
+            print("Skipping %s, %s was never generated."%(fout, name))
+            return
+
+    factory_lines = set()
+    for content in headers:
+        factory_lines.update(_factory_lines(content))
+
+    output_lines = []
+    inside_factory = False
+    for line in io.StringIO(headers[0]):
+        if '/// factories' in line:
+            inside_factory = True
+            output_lines.append(line)
+            output_lines.extend(sorted(factory_lines))
+        elif '/// end factories' in line:
+            inside_factory = False
+        if not inside_factory:
+            output_lines.append(line)
+
+    print("Generating %s..."%fout)
+    util.writeIfChanged(fout, "".join(output_lines))
+
 """
 Entry-point:
     generates layers for level_zero driver
@@ -385,3 +464,53 @@ def generate_drivers(path, section, namespace, tags, version, specs, meta):
     loc = 0
     loc += _mako_null_driver_cpp(dstpath, namespace, tags, version, specs, meta)
     print("Generated %s lines of code.\n"%loc)
+
+"""
+    python backends: 'backend' : (template, filename of the <namespace> module)
+"""
+python_backends = {
+    'ctypes' : ('api.py.mako', '%s.py'),
+    'cffi' : ('api_cffi.py.mako', '%s_cffi.py'),
+    'numpy' : ('api_numpy.py.mako', '%s_numpy.py'),
+}
+
+"""
+    generates python files from the specification documents
+"""
+def _mako_python(path, namespace, tags, version, specs, meta, backends):
+    loc = 0
+    for backend in backends:
+        template, filename = python_backends[backend]
+        fin = os.path.join(python_templates_dir, template)
+        fout = os.path.join(path, filename%(namespace))
+
+        loc += util.makoWrite(
+            fin, fout,
+            ver=version,
+            namespace=namespace,
+            tags=tags,
+            specs=specs,
+            meta=meta)
+    return loc
+
+"""
+Entry-point:
+    generates the python bindings of the given backends
+"""
+def generate_python(path, section, namespace, tags, version, specs, meta, backends=list(python_backends)):
+    os.makedirs(path, exist_ok=True)
+
+    loc = 0
+    if namespace == tags['$x']:
+        template = "__init__.py.mako"
+        fin = os.path.join(python_templates_dir, template)
+        fout = os.path.join(path, "__init__.py")
+
+        loc += util.makoWrite(
+            fin, fout,
+            ver=version,
+            namespace=namespace,
+            tags=tags,
+            backends=backends)
+    loc += _mako_python(path, namespace, tags, version, specs, meta, backends)
+    print("Generated %s lines of code.\n"%loc)
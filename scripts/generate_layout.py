@@ -0,0 +1,344 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+root_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..")
+include_dir = os.path.normpath(os.path.join(root_dir, "include"))
+package_dir = os.path.join(include_dir, "level_zero")
+
+modules = ["ze", "zes", "zet"]
+sources = ["_common", "ze", "_ze_exp", "zes", "_zes_exp", "zet", "_zet_exp"]
+headers = ["ze_api.h", "zes_api.h", "zet_api.h", "ze_ddi.h", "zes_ddi.h", "zet_ddi.h"]
+
+"""
+    returns the ordered list of (struct name, [field names]) declared by a python binding
+"""
+def parse_structs(path):
+    structs = []
+    with open(path, 'r') as fin:
+        text = fin.read()
+    for m in re.finditer(r"^class (\w+)\((?:Structure|Union)\):\n    _fields_ = \[\n(.*?)\n    \]", text, re.M | re.S):
+        fields = re.findall(r"^        \(\"(\w+)\",", m.group(2), re.M)
+        structs.append((m.group(1), fields))
+    return structs
+
+"""
+    returns the C type name for a python structure name
+"""
+def c_name(name):
+    # ddi tables are private in python, e.g. _ze_global_dditable_t
+    return name[1:] if name.startswith("_") else name
+
+"""
+    compiles and runs a C program printing sizeof/offsetof of every structure
+"""
+def measure(structs, cc):
+    lines = ["#include <stdio.h>", "#include <stddef.h>"]
+    lines += ["#include \"%s\"" % h for h in headers]
+    lines.append("int main(void) {")
+    for name, fields in structs:
+        lines.append("    printf(\"S %s %%zu\\n\", sizeof(%s));" % (name, c_name(name)))
+        for field in fields:
+            lines.append("    printf(\"F %s %%zu\\n\", offsetof(%s, %s));" % (field, c_name(name), field))
+    lines.append("    return 0;")
+    lines.append("}")
+
+    builddir = tempfile.mkdtemp(prefix="ze_layout_")
+    src = os.path.join(builddir, "layout.c")
+    exe = os.path.join(builddir, "layout")
+    with open(src, 'w') as fout:
+        fout.write("\n".join(lines) + "\n")
+    subprocess.check_call([cc, "-I", include_dir, "-o", exe, src])
+    output = subprocess.check_output([exe]).decode()
+
+    layouts = []
+    for line in output.splitlines():
+        kind, name, value = line.split()
+        if kind == "S":
+            layouts.append((name, int(value), []))
+        else:
+            layouts[-1][2].append((name, int(value)))
+    return layouts
+
+"""
+    writes the layout table module
+"""
+def write_layout(path, layouts):
+    lines = []
+    for name, size, fields in layouts:
+        offsets = ", ".join("\"%s\" : %d" % field for field in fields)
+        lines.append("    \"%s\" : (%d, {%s})," % (name, size, offsets))
+
+    with open(path, 'w') as fout:
+        fout.write(LAYOUT_TEMPLATE % "\n".join(lines))
+
+LAYOUT_TEMPLATE = '''"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+ @file ze_layout.py
+
+ Generated by scripts/generate_layout.py from the C headers, do not edit.
+
+ """
+from ctypes import *
+
+###############################################################################
+## @brief Expected (sizeof, {field : offset}) of every structure declared by
+##        the ze, zes and zet bindings, as laid out by the C compiler on 64-bit
+##        targets
+layouts = {
+%s
+}
+
+###############################################################################
+## @brief Returns a list of mismatches between the ctypes structures of the
+##        given binding modules and the C layout table
+def check(*modules):
+    errors = []
+    if sizeof(c_void_p) != 8:
+        return errors
+    for module in modules:
+        for name, (size, offsets) in layouts.items():
+            # deferred experimental structures are defined on access
+            value = getattr(module, name, None)
+            if not isinstance(value, type) or not issubclass(value, (Structure, Union)):
+                continue
+            if sizeof(value) != size:
+                errors.append("%%s: sizeof %%d, expected %%d" %% (name, sizeof(value), size))
+            for field, offset in offsets.items():
+                actual = getattr(value, field).offset
+                if actual != offset:
+                    errors.append("%%s.%%s: offset %%d, expected %%d" %% (name, field, actual, offset))
+    return errors
+'''
+
+"""
+    returns a list of mismatches between the numpy dtypes of a python package
+    generated with json2src.py --targets python and the layout table
+"""
+def check_dtypes(layouts, module):
+    from ctypes import c_void_p, sizeof
+    errors = []
+    if sizeof(c_void_p) != 8:
+        return errors
+    for name, (size, offsets) in layouts.items():
+        if name not in module._structs:
+            continue
+        value = module.dtype(name)
+        if value.itemsize != size:
+            errors.append("%s: itemsize %d, expected %d" % (name, value.itemsize, size))
+        for field, offset in offsets.items():
+            actual = value.fields[field][1]
+            if actual != offset:
+                errors.append("%s.%s: offset %d, expected %d" % (name, field, actual, offset))
+    return errors
+
+"""
+    returns the numpy format of a ctypes field type: a struct name for nested
+    structures, a (format, count) tuple for arrays, otherwise a format string
+"""
+def dtype_format(ctype):
+    from ctypes import Structure, Union, Array, sizeof
+    if issubclass(ctype, (Structure, Union)):
+        return ctype.__name__
+    if issubclass(ctype, Array):
+        if ctype._type_.__name__ == "c_char":
+            return "S%d" % ctype._length_
+        return (dtype_format(ctype._type_), ctype._length_)
+    code = getattr(ctype, "_type_", None)
+    if not isinstance(code, str) or code in "PzZ":
+        # handles, pointers and function pointers are addresses
+        return "u%d" % sizeof(ctype)
+    if code in "bhilq":
+        return "i%d" % sizeof(ctype)
+    if code in "BHILQ":
+        return "u%d" % sizeof(ctype)
+    if code in "fd":
+        return "f%d" % sizeof(ctype)
+    if code == "?":
+        return "?"
+    if code == "c":
+        return "S1"
+    raise Exception("no dtype for %s" % ctype.__name__)
+
+"""
+    returns the python literal of a dtype_format result
+"""
+def format_literal(format):
+    if isinstance(format, tuple):
+        return "(\"%s\", %d)" % format
+    return "\"%s\"" % format
+
+"""
+    writes the numpy dtype table module, using the measured layouts and the
+    field types of the python bindings
+"""
+def write_dtypes(path, layouts):
+    sys.path.insert(0, include_dir)
+    import importlib
+    bindings = [importlib.import_module("level_zero." + name) for name in modules]
+
+    lines = []
+    for name, size, offsets in layouts:
+        struct = next(getattr(module, name) for module in bindings if hasattr(module, name))
+        fieldtypes = dict((field[0], field[1]) for field in struct._fields_)
+        fields = ", ".join("(\"%s\", %s, %d)" % (field, format_literal(dtype_format(fieldtypes[field])), offset) for field, offset in offsets)
+        lines.append("    \"%s\" : (%d, [%s])," % (name, size, fields))
+
+    with open(path, 'w') as fout:
+        fout.write(DTYPES_TEMPLATE % "\n".join(lines))
+
+DTYPES_TEMPLATE = '''"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+ @file ze_dtypes.py
+
+ Generated by scripts/generate_layout.py from the C headers, do not edit.
+
+ NumPy structured dtypes matching the ze, zes and zet structures, so arrays of
+ descriptors, properties and counters can be passed to the driver and read
+ back without per-element Python objects. Requires numpy.
+
+ """
+from ctypes import *
+import numpy
+
+###############################################################################
+## @brief (itemsize, [(field, format, offset)]) of every structure, on 64-bit
+##        targets; a format naming another structure nests its dtype
+_specs = {
+%s
+}
+
+_dtypes = {}
+
+###############################################################################
+## @brief Returns the numpy dtype of a structure, given its ctypes class or name
+def dtype(struct):
+    name = struct if isinstance(struct, str) else struct.__name__
+    value = _dtypes.get(name)
+    if value is None:
+        itemsize, fields = _specs[name]
+        formats = []
+        for _, format, _ in fields:
+            if isinstance(format, tuple):
+                format = (dtype(format[0]) if format[0] in _specs else format[0], format[1])
+            elif format in _specs:
+                format = dtype(format)
+            formats.append(format)
+        value = numpy.dtype({
+            "names" : [field[0] for field in fields],
+            "formats" : formats,
+            "offsets" : [field[2] for field in fields],
+            "itemsize" : itemsize})
+        _dtypes[name] = value
+    return value
+
+###############################################################################
+## @brief Allocates a zero-filled array of 'count' structures, optionally
+##        setting each element's stype
+def zeros(struct, count, stype=None):
+    array = numpy.zeros(count, dtype=dtype(struct))
+    if stype is not None:
+        array["stype"] = stype
+    return array
+
+###############################################################################
+## @brief Returns the ctypes class of a structure, given the class or its name,
+##        looked up in the ze, zes and zet bindings
+def _struct(struct):
+    if not isinstance(struct, str):
+        return struct
+    from . import ze, zes, zet
+    for module in (ze, zes, zet):
+        value = getattr(module, struct, None)
+        if value is not None:
+            return value
+    raise KeyError(struct)
+
+###############################################################################
+## @brief Returns 'array' as a ctypes POINTER(struct), for functions taking an
+##        array of structures, given the structure's ctypes class or name; raw
+##        fast-call functions also accept array.ctypes.data directly
+def pointer(array, struct):
+    struct = _struct(struct)
+    if array.dtype != dtype(struct):
+        raise TypeError("array dtype does not match %%s" %% struct.__name__)
+    return cast(array.ctypes.data, POINTER(struct))
+
+###############################################################################
+## @brief Returns a numpy view of 'count' structures at 'address', without
+##        copying; the memory must outlive the view
+def view(address, struct, count):
+    value = dtype(struct)
+    buffer = (c_ubyte * (value.itemsize * count)).from_address(address)
+    return numpy.frombuffer(buffer, dtype=value, count=count)
+'''
+
+"""
+    regenerates include/level_zero/ze_layout.py and ze_dtypes.py, or checks the
+    bindings against the layout table
+"""
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cc", type=str, default="cc", help="C compiler used to measure the header layouts.")
+    parser.add_argument("--check", action='store_true', help="check the python bindings against the existing layout table.")
+    parser.add_argument("--python-dir", type=str, help="with --check, also check the numpy backend of the package generated by json2src.py --targets python into this directory.")
+    args = parser.parse_args()
+
+    if args.check:
+        sys.path.insert(0, include_dir)
+        import importlib
+        from level_zero import ze_layout
+        errors = []
+        for name in modules:
+            try:
+                errors += ze_layout.check(importlib.import_module("level_zero." + name))
+            except Exception as e:
+                errors.append("%s: import failed: %s" % (name, e))
+        if args.python_dir:
+            # the generated package has the same name as include/level_zero
+            package = os.path.basename(os.path.normpath(args.python_dir))
+            for name in [name for name in sys.modules if name == package or name.startswith(package + ".")]:
+                del sys.modules[name]
+            sys.path.insert(0, os.path.dirname(os.path.abspath(os.path.normpath(args.python_dir))))
+            # zes and zet include the core structures, which are checked once
+            checked = set()
+            for name in modules:
+                try:
+                    module = importlib.import_module("%s.%s_numpy" % (package, name))
+                except Exception as e:
+                    errors.append("%s_numpy: import failed: %s" % (name, e))
+                    continue
+                errors += check_dtypes(dict(item for item in ze_layout.layouts.items() if item[0] not in checked), module)
+                checked.update(module._structs)
+        for error in errors:
+            print(error)
+        print("%d layout mismatches" % len(errors))
+        sys.exit(1 if errors else 0)
+
+    structs = []
+    for name in sources:
+        structs += parse_structs(os.path.join(package_dir, "%s.py" % name))
+    layouts = measure(structs, args.cc)
+    fout = os.path.join(package_dir, "ze_layout.py")
+    print("Generating %s..." % fout)
+    write_layout(fout, layouts)
+    fout = os.path.join(package_dir, "ze_dtypes.py")
+    print("Generating %s..." % fout)
+    write_dtypes(fout, layouts)
+    print("Generated layouts and dtypes for %d structures." % len(layouts))
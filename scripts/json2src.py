@@ -8,9 +8,13 @@
 import argparse
 import util
 import generate_code
+import profiler
+import spec_loader
+from templates import helper
 import os, sys
 import time
-import json
+import io
+import contextlib
 
 """
     helper for adding mutually-exclusive boolean arguments "--name" and "--skip-name"
@@ -27,132 +31,121 @@ if __name__ == '__main__':
     add_argument(parser, "loader", "generation of loader files.", True)
     add_argument(parser, "layers", "generation of validation layer files.", True)
     add_argument(parser, "drivers", "generation of null driver files.", True)
-    parser.add_argument("--debug", action='store_true', help="dump intermediate data to disk.")
-    parser.add_argument("--sections", type=list, default=None, help="Optional list of sections for which to generate source, default is all")
+    add_argument(parser, "python", "generation of python bindings.", False)
+    parser.add_argument("--python-dir", type=str, default=None, help="directory of the python bindings, default is <out_dir>/build/python/level_zero")
+    parser.add_argument("--python-backends", type=str, default=None, help="Optional comma-separated list of python backends (%s), default is all" % ", ".join(generate_code.python_backends))
+    parser.add_argument("--debug", action='store_true', help="print how each output was generated.")
+    parser.add_argument("--incremental", action='store_true', help="skip rendering outputs whose templates and spec objects are unchanged since the last run.")
+    parser.add_argument("--manifest", type=str, default=None, help="manifest of the generated files, default is <out_dir>/.json2src-manifest.json")
+    parser.add_argument("--jobs", type=int, default=1, help="number of processes rendering templates in parallel, 0 for one per CPU, default is 1")
+    parser.add_argument("--template-cache", type=str, default=None, help="directory of the compiled templates, default is <out_dir>/build/json2src")
+    parser.add_argument("--profile", type=str, default=None, help="profile the run, writing PROFILE.json and the collapsed stacks of PROFILE.collapsed; renders serially")
+    parser.add_argument("--sections", type=str, default=None, help="Optional comma-separated list of sections for which to generate source, default is all")
+    parser.add_argument("--targets", type=str, default=None, help="Optional comma-separated list of targets (%s) or template names to generate, default is all" % ", ".join(generate_code.targets))
     parser.add_argument("--ver", type=str, default="1.0", help="specification version to generate.")
-    parser.add_argument('--api-json', nargs='?', type=argparse.FileType('r'), default=sys.stdin, help="JSON file containing the API specification, by default read from stdin")
+    parser.add_argument('--api-json', type=str, default="-", help="JSON file, .jsonl file or split directory containing the API specification, by default JSON read from stdin")
     parser.add_argument("out_dir", type=str, help="Root of the loader repository.")
     args = parser.parse_args()
 
-    input = json.loads(args.api_json.read())
+    profile = None
+    if args.profile:
+        profile = profiler.Profile()
+        profile.start()
+        args.jobs = 1
+
+    with util.phase("spec"):
+        spec = spec_loader.open_spec(args.api_json)
+
+    sections = [config['name'] for config in spec.configs]
+    if args.sections != None:
+        args.sections = args.sections.split(",")
+        for section in args.sections:
+            if section not in sections:
+                parser.error("unknown section '%s', expected one of %s" % (section, ", ".join(sections)))
+    if args.targets != None:
+        try:
+            util.selected = generate_code.get_target_templates(args.targets.split(","))
+        except ValueError as e:
+            parser.error(str(e))
+        # the python bindings are not generated by default, selecting them enables them
+        if util.selected & generate_code.get_target_templates(["python"]):
+            args.python = True
+    backends = list(generate_code.python_backends)
+    if args.python_backends != None:
+        backends = args.python_backends.split(",")
+        for backend in backends:
+            if backend not in generate_code.python_backends:
+                parser.error("unknown python backend '%s', expected one of %s" % (backend, ", ".join(generate_code.python_backends)))
 
     start = time.time()
 
-    srcpath = os.path.join(args.out_dir, "source")
+    manifest = args.manifest or os.path.join(args.out_dir, ".json2src-manifest.json")
+    util.loadManifest(manifest)
+    util.incremental = args.incremental
+    util.jobs = args.jobs or os.cpu_count()
+    util.templateCache = args.template_cache or os.path.join(args.out_dir, "build", "json2src")
 
-    for idx, specs in enumerate(input['specs']):
-        config = input['configs'][idx]
-        if args.sections == None or config['name'] in args.sections:
+    srcpath = os.path.join(args.out_dir, "source")
+    pythonpath = args.python_dir or os.path.join(args.out_dir, "build", "python", "level_zero")
+
+    util.share("meta", spec.meta)
+    loc = 0
+    for idx, config in enumerate(spec.configs):
+        if args.sections != None and config['name'] not in args.sections:
+            continue
+        with util.phase("spec"):
+            specs = spec.section(idx)
+        util.share("specs%d"%idx, specs)
+        # with --jobs, the generators only queue the renders, so their line counts are not printed
+        with contextlib.redirect_stdout(io.StringIO()) if util.jobs > 1 else contextlib.nullcontext():
             if args.lib:
-                generate_code.generate_lib(srcpath, config['name'], config['namespace'], config['tags'], args.ver, specs, input['meta'])
+                generate_code.generate_lib(srcpath, config['name'], config['namespace'], config['tags'], args.ver, specs, spec.meta)
             if args.loader:
-                generate_code.generate_loader(srcpath, config['name'], config['namespace'], config['tags'], args.ver, specs, input['meta'])
+                generate_code.generate_loader(srcpath, config['name'], config['namespace'], config['tags'], args.ver, specs, spec.meta)
             if args.layers:
-                generate_code.generate_layers(srcpath, config['name'], config['namespace'], config['tags'], args.ver, specs, input['meta'])
+                generate_code.generate_layers(srcpath, config['name'], config['namespace'], config['tags'], args.ver, specs, spec.meta)
             if args.drivers:
-                generate_code.generate_drivers(srcpath, config['name'], config['namespace'], config['tags'], args.ver, specs, input['meta'])
-
-    def merge_header_files(input_files, output_file):
-        """
-        Merges the unique content of multiple header files into a single output file.
-
-        Args:
-            input_files: A list of paths to the input header files.
-            output_file: The path to the output file.
-        """
-        try:
-            unique_lines = set()
-            for infile_path in input_files:
-                try:
-                    with open(infile_path, 'r') as infile:
-                        inside_factory = False
-                        for line in infile:
-                            if '/// factories' in line:
-                                inside_factory = True
-                                continue
-                            if '/// end factories' in line:
-                                inside_factory = False
-                                continue
-                            if inside_factory:
-                                unique_lines.add(line)
-                except FileNotFoundError:
-                    print(f"Error: Input file not found: {infile_path}")
-                    return
-
-            with open(output_file, 'w') as outfile:
-                for line in sorted(unique_lines):
-                    outfile.write(line)
-            print(f"Successfully merged unique header file content into: {output_file}")
-        except Exception as e:
-            print(f"An error occurred: {e}")
-
-    header_files = [
-        'source/loader/ze_loader_internal_tmp.h',
-        'source/loader/zet_loader_internal_tmp.h',
-        'source/loader/zes_loader_internal_tmp.h'
-    ]
-    output_file = 'source/loader/ze_loader_internal_factories.h'
-    merge_header_files(header_files, output_file)
-    def replace_factory_section(input_file, factory_file, output_file):
-        """
-        Replaces the content between '/// factory' and '/// end factory' in the input file
-        with the content from the factory file and writes the result to the output file.
-
-        Args:
-            input_file: The path to the input file.
-            factory_file: The path to the factory file.
-            output_file: The path to the output file.
-        """
-        try:
-            with open(input_file, 'r') as infile:
-                lines = infile.readlines()
-
-            with open(factory_file, 'r') as factory:
-                factory_lines = factory.readlines()
-
-            output_lines = []
-            inside_factory = False
-
-            for line in lines:
-                if '/// factories' in line:
-                    inside_factory = True
-                    output_lines.append(line)
-                    output_lines.extend(factory_lines)
-                elif '/// end factories' in line:
-                    inside_factory = False
-                if not inside_factory:
-                    output_lines.append(line)
-
-            with open(output_file, 'w') as outfile:
-                outfile.writelines(output_lines)
-
-            print(f"Successfully replaced factory section in: {output_file}")
-        except Exception as e:
-            print(f"An error occurred: {e}")
-
-    input_file = 'source/loader/ze_loader_internal_tmp.h'
-    factory_file = 'source/loader/ze_loader_internal_factories.h'
-    output_file = 'source/loader/ze_loader_internal.h'
-    replace_factory_section(input_file, factory_file, output_file)
-
-    # Delete temporary and factory files
-    files_to_delete = [
-        'source/loader/ze_loader_internal_tmp.h',
-        'source/loader/zet_loader_internal_tmp.h',
-        'source/loader/zes_loader_internal_tmp.h',
-        'source/loader/ze_loader_internal_factories.h'
-    ]
-
-    for file_path in files_to_delete:
-        try:
-            os.remove(file_path)
-            print(f"Deleted file: {file_path}")
-        except FileNotFoundError:
-            print(f"File not found, could not delete: {file_path}")
-        except Exception as e:
-            print(f"An error occurred while deleting {file_path}: {e}")
-
+                generate_code.generate_drivers(srcpath, config['name'], config['namespace'], config['tags'], args.ver, specs, spec.meta)
+            if args.python:
+                generate_code.generate_python(pythonpath, config['name'], config['namespace'], config['tags'], args.ver, specs, spec.meta, backends)
+        # the section's outputs are rendered before the next section is loaded,
+        # so only one section is resident at a time
+        if util.jobs > 1:
+            loc += util.renderQueued()
+        util.release(specs)
+        helper.clear_caches()
+        del specs
+    if util.jobs > 1:
+        print("Generated %s lines of code.\n"%loc)
+
+    if args.loader:
+        with util.phase("merge"):
+            generate_code.generate_loader_internal(srcpath)
+
+    util.saveManifest(manifest)
     if args.debug:
-        util.makoFileListWrite("generated.json")
+        for outpath, action in sorted(util.actions.items()):
+            if outpath in util.timings:
+                print("%s: %s in %.3f seconds" % (outpath, action, util.timings[outpath]))
+            else:
+                print("%s: %s" % (outpath, action))
+    print("Rendered %d files (%d written, %d unchanged), skipped %d unchanged templates." % (
+        util.stats["rendered"], util.stats["written"], util.stats["unchanged"], util.stats["skipped"]))
+    if util.timings:
+        slowest = max(util.timings, key=util.timings.get)
+        print("Rendering took %.1f seconds in total, the longest %.1f seconds for %s." % (
+            sum(util.timings.values()), util.timings[slowest], slowest))
+
+    peak = util.peakMemory()
+    if peak:
+        if util.jobs > 1:
+            print("Peak memory use was %.1f MB, %.1f MB in the largest worker." % (peak[0] / 2**20, peak[1] / 2**20))
+        else:
+            print("Peak memory use was %.1f MB." % (peak[0] / 2**20))
+
+    if profile:
+        profile.stop()
+        profile.write(args.profile)
+        print("Wrote the profile to %s.json and %s.collapsed." % (args.profile, args.profile))
 
     print("\nCompleted in %.1f seconds!"%(time.time() - start))
@@ -0,0 +1,109 @@
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import cProfile
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import util
+
+helper_path = os.path.join(util.templates_dir, "helper.py")
+
+"""
+    returns the frame label used in collapsed stacks, e.g. "helper.py:subt";
+    compiled templates are labelled with their template name
+"""
+def _frame_label(code):
+    filename = code.co_filename
+    if filename.endswith(".mako.py"):
+        filename = filename[:-3]
+    return "%s:%s" % (os.path.basename(filename), code.co_name)
+
+"""
+    profiles a generator run: phases from util.phases, render time of each
+    output from util.timings, call counts and times of the template helpers
+    from cProfile, and stack samples of the main thread taken every
+    'interval' seconds, written as collapsed stacks for flame graph tools
+"""
+class Profile:
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        self.samples = {}
+        self.__profiler = cProfile.Profile()
+        self.__thread = None
+        self.__stopped = threading.Event()
+        self.__start = None
+        self.__elapsed = 0.0
+
+    def start(self):
+        # the sampler needs the GIL on time, rather than when the main thread
+        # blocks, which would over-represent I/O
+        self.__switchinterval = sys.getswitchinterval()
+        sys.setswitchinterval(self.interval / 2)
+        self.__start = time.perf_counter()
+        main = threading.main_thread().ident
+        self.__thread = threading.Thread(target=self.__sample, args=(main,), name="json2src-profile", daemon=True)
+        self.__thread.start()
+        self.__profiler.enable()
+
+    def stop(self):
+        self.__profiler.disable()
+        self.__stopped.set()
+        self.__thread.join()
+        self.__elapsed = time.perf_counter() - self.__start
+        sys.setswitchinterval(self.__switchinterval)
+
+    def __sample(self, ident):
+        while not self.__stopped.wait(self.interval):
+            frame = sys._current_frames().get(ident)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            key = ";".join(reversed(stack))
+            self.samples[key] = self.samples.get(key, 0) + 1
+
+    # returns [{function, calls, total, cumulative}] of the helper.py
+    # functions, by decreasing cumulative time
+    def helpers(self):
+        stats = pstats.Stats(self.__profiler).stats
+        helpers = []
+        for (filename, lineno, name), (cc, nc, tt, ct, callers) in stats.items():
+            if os.path.abspath(filename) == helper_path:
+                helpers.append({"function": name, "line": lineno, "calls": nc, "total": tt, "cumulative": ct})
+        return sorted(helpers, key=lambda helper: -helper["cumulative"])
+
+    # returns the profile as a JSON-serializable dict
+    def report(self):
+        renders = []
+        for outpath, seconds in sorted(util.timings.items(), key=lambda item: -item[1]):
+            entry = util.manifest.get(outpath) or util.renderedManifest.get(outpath)
+            template = os.path.relpath(entry["template"], util.templates_dir) if entry else None
+            renders.append({"output": outpath, "template": template, "seconds": seconds})
+        phases = dict(util.phases)
+        phases["render"] = sum(util.timings.values())
+        peak = util.peakMemory()
+        return {
+            "elapsed": self.__elapsed,
+            "peak_rss": peak[0] if peak else None,
+            "phases": phases,
+            "renders": renders,
+            "helpers": self.helpers(),
+            "samples": sum(self.samples.values()),
+            "interval": self.interval,
+        }
+
+    # writes '<prefix>.json' and the collapsed stacks to '<prefix>.collapsed'
+    def write(self, prefix):
+        with open(prefix + ".json", 'w') as fout:
+            json.dump(self.report(), fout, indent=4)
+            fout.write("\n")
+        with open(prefix + ".collapsed", 'w') as fout:
+            for stack, count in sorted(self.samples.items()):
+                fout.write("%s %d\n" % (stack, count))
@@ -0,0 +1,170 @@
+#! /usr/bin/env python3
+"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+"""
+import argparse
+import json
+import mmap
+import os
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+"""
+    the layouts of the API specification:
+        combined: one JSON document {"specs": [...], "configs": [...], "meta": {...}}
+        split:    a directory with index.json {"configs", "meta", "sections": {name : file}}
+                  and one JSON list of specs per section
+        jsonl:    a .jsonl file, a {"configs", "meta"} line followed by one
+                  {"name", "specs"} line per section, in the order of the configs
+    the split and jsonl layouts are loaded one section at a time
+"""
+index_name = "index.json"
+
+"""
+    parses JSON from str or bytes; with orjson when installed
+"""
+def loads(data):
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+"""
+    parses JSON from mm[start:end]; orjson parses the mapped pages in place,
+    json needs a copy
+"""
+def _load_range(mm, start, end):
+    if not orjson:
+        return json.loads(mm[start:end])
+    with memoryview(mm) as view, view[start:end] as data:
+        return orjson.loads(data)
+
+"""
+    returns the parsed content of the file at 'path', memory-mapped
+"""
+def _load_file(path):
+    with open(path, 'rb') as fin:
+        if os.fstat(fin.fileno()).st_size == 0:
+            return loads(b"")
+        with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _load_range(mm, 0, len(mm))
+
+"""
+    an API specification whose sections are loaded on demand, so only the
+    configs, the meta and the section being generated are resident
+"""
+class Spec:
+    def __init__(self, configs, meta, load):
+        self.configs = configs
+        self.meta = meta
+        self.__load = load
+
+    # returns the specs of the section at 'idx', parsed on each call
+    def section(self, idx):
+        return self.__load(idx)
+
+"""
+    returns the Spec of the combined JSON document 'data'; the sections are
+    resident, each is dropped once it has been loaded
+"""
+def _combined_spec(data):
+    specs = data['specs']
+    def load(idx):
+        section, specs[idx] = specs[idx], None
+        return section
+    return Spec(data['configs'], data['meta'], load)
+
+"""
+    returns the Spec of the split layout in the directory 'path'
+"""
+def _split_spec(path):
+    index = _load_file(os.path.join(path, index_name))
+    files = [os.path.join(path, index['sections'][config['name']]) for config in index['configs']]
+    return Spec(index['configs'], index['meta'], lambda idx: _load_file(files[idx]))
+
+"""
+    returns the Spec of the JSON-lines layout at 'path'; the file stays
+    memory-mapped and each section line is parsed when loaded
+"""
+def _jsonl_spec(path):
+    fin = open(path, 'rb')
+    mm = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+    lines = []
+    start = 0
+    while start < len(mm):
+        end = mm.find(b"\n", start)
+        if end < 0:
+            end = len(mm)
+        if end > start:
+            lines.append((start, end))
+        start = end + 1
+    header = _load_range(mm, *lines[0])
+    configs = header['configs']
+    if len(lines) - 1 != len(configs):
+        raise ValueError("%s has %d sections, expected %d" % (path, len(lines) - 1, len(configs)))
+    def load(idx):
+        start, end = lines[idx + 1]
+        section = _load_range(mm, start, end)
+        if section['name'] != configs[idx]['name']:
+            raise ValueError("%s has section '%s' in place of '%s'" % (path, section['name'], configs[idx]['name']))
+        return section['specs']
+    return Spec(configs, header['meta'], load)
+
+"""
+    returns the Spec at 'path': a split layout directory, a .jsonl file, or
+    a combined JSON file; "-" reads combined JSON from stdin
+"""
+def open_spec(path):
+    if path == "-":
+        return _combined_spec(loads(sys.stdin.buffer.read()))
+    if os.path.isdir(path):
+        return _split_spec(path)
+    if path.endswith(".jsonl"):
+        return _jsonl_spec(path)
+    return _combined_spec(_load_file(path))
+
+"""
+    writes the combined JSON document 'data' in the split layout to the
+    directory 'path'
+"""
+def write_split(data, path):
+    os.makedirs(path, exist_ok=True)
+    sections = {}
+    for config, specs in zip(data['configs'], data['specs']):
+        sections[config['name']] = "%s.json" % config['name']
+        with open(os.path.join(path, sections[config['name']]), 'w') as fout:
+            json.dump(specs, fout)
+    with open(os.path.join(path, index_name), 'w') as fout:
+        json.dump({"configs": data['configs'], "meta": data['meta'], "sections": sections}, fout)
+
+"""
+    writes the combined JSON document 'data' in the JSON-lines layout to 'path'
+"""
+def write_jsonl(data, path):
+    with open(path, 'w') as fout:
+        fout.write(json.dumps({"configs": data['configs'], "meta": data['meta']}) + "\n")
+        for config, specs in zip(data['configs'], data['specs']):
+            fout.write(json.dumps({"name": config['name'], "specs": specs}) + "\n")
+
+"""
+    converts a combined JSON specification to the split or JSON-lines layout
+"""
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("api_json", type=str, help="combined JSON file containing the API specification.")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--split", type=str, default=None, help="directory of the split layout to write.")
+    group.add_argument("--jsonl", type=str, default=None, help=".jsonl file to write.")
+    args = parser.parse_args()
+
+    data = _load_file(args.api_json)
+    if args.split:
+        write_split(data, args.split)
+    else:
+        write_jsonl(data, args.jsonl)
@@ -280,10 +280,7 @@ class type_traits:
     def is_known(name, meta):
         try:
             name = _remove_const_ptr(name)
-            for group in meta:
-                if name in meta[group]:
-                    return True
-            return False
+            return _get_meta_group(name, meta) is not None
         except:
             return False
 
@@ -311,9 +308,9 @@ class type_traits:
     def find_class_name(name, meta):
         try:
             name = _remove_const_ptr(name)
-            for group in meta:
-                if name in meta[group]:
-                    return meta[group][name]['class']
+            group = _get_meta_group(name, meta)
+            if group is not None:
+                return meta[group][name]['class']
             return None
         except:
             return None
@@ -517,27 +514,61 @@ Public:
     substitues each tag['key'] with tag['value']
     if cpp, then remove each tag['key'] if matches namespace
     if comment, then insert doxygen '::' notation at beginning (for autogen links)
+    results are memoized, and the regexes of each set of tags compiled once
 """
 def subt(namespace, tags, string, comment=False, cpp=False, remove_namespace=False):
-    for key, value in tags.items():
+    key = (namespace, tuple(tags.items()), string, comment, cpp, remove_namespace)
+    result = _subt_results.get(key)
+    if result is None:
+        result = string
+        for pattern, repl in _get_subt_plan(key[0], key[1], comment, cpp, remove_namespace):
+            result = pattern.sub(repl, result)
+        _subt_results[key] = result
+    return result
+
+_subt_results = {}
+_subt_plans = {}
+
+"""
+Public:
+    clears the caches of values computed from a section's specs, so the
+    section can be freed once it has been generated
+"""
+def clear_caches():
+    _subt_results.clear()
+    _spec_indexes.clear()
+    _param_lines.clear()
+
+"""
+Private:
+    returns the list of (compiled regex, replacement) applied by subt, in order
+"""
+def _get_subt_plan(namespace, tags, comment, cpp, remove_namespace):
+    plan_key = (namespace, tags, comment, cpp, remove_namespace)
+    plan = _subt_plans.get(plan_key)
+    if plan is not None:
+        return plan
+    plan = []
+    for key, value in tags:
         if comment or not cpp:                                                  # generating c names
-            string = re.sub(r"-%s"%re.escape(key), "-"+value, string)           # hack for compile options
+            plan.append((re.compile(r"-%s"%re.escape(key)), "-"+value))         # hack for compile options
             repl = "::"+value if comment and "$OneApi" != key else value        # replace tag; e.g., "$x" -> "xe"
-            string = re.sub(re.escape(key), repl, string)
-            string = re.sub(re.escape(key.upper()), repl.upper(), string)
+            plan.append((re.compile(re.escape(key)), repl))
+            plan.append((re.compile(re.escape(key.upper())), repl.upper()))
         elif re.match(namespace, value):                                        # generating c++ names and tag matches current namespace
             repl = ""                                                           # remove tags; e.g., "$x" -> ""
-            string = re.sub(r"%s_?"%re.escape(key), repl, string)
-            string = re.sub(r"%s_?"%re.escape(key.upper()), repl.upper(), string)
+            plan.append((re.compile(r"%s_?"%re.escape(key)), repl))
+            plan.append((re.compile(r"%s_?"%re.escape(key.upper())), repl.upper()))
         elif remove_namespace:                                                  # generating c++ names and tags do _not_ match current namespace
             repl = ""                                                           # remove namespace; e.g. "$x" -> ""
-            string = re.sub(r"%s_?"%re.escape(key), repl, string)
-            string = re.sub(r"%s_?"%re.escape(key.upper()), repl.upper(), string)
+            plan.append((re.compile(r"%s_?"%re.escape(key)), repl))
+            plan.append((re.compile(r"%s_?"%re.escape(key.upper())), repl.upper()))
         else:                                                                   # generating c++ names and tags do _not_ match current namespace
             repl = value+"::"                                                   # add namespace; e.g. "$x" -> "xe::"
-            string = re.sub(r"%s_?"%re.escape(key), repl, string)
-            string = re.sub(r"%s_?"%re.escape(key.upper()), repl.upper(), string)
-    return string
+            plan.append((re.compile(r"%s_?"%re.escape(key)), repl))
+            plan.append((re.compile(r"%s_?"%re.escape(key.upper())), repl.upper()))
+    _subt_plans[plan_key] = plan
+    return plan
 
 """
 Public:
@@ -586,6 +617,97 @@ def split_line(line, ch_count):
         lines.append(" ".join(word_list))
     return lines
 
+"""
+Public:
+    index of the objects of a section's specs, built once and reused by the
+    helpers instead of scanning every object of every spec on each call
+"""
+class SpecIndex:
+    def __init__(self, specs):
+        self.specs = specs
+        self.objects = [obj for s in specs for obj in s['objects']]
+        self.by_name = {}
+        self.__by_type = {}
+        self.__functions = {}
+        for obj in self.objects:
+            if 'name' in obj:
+                self.by_name.setdefault((obj.get('type'), obj['name']), obj)
+            if obj_traits.is_function(obj):
+                self.__functions.setdefault(obj_traits.class_name(obj), []).append(obj)
+
+        self.__exp = {}
+        for cname, objects in self.__functions.items():
+            objects.sort(key=_function_order)
+            optional = not any(obj.get('version',"1.0") == "1.0" for obj in objects)
+            self.__exp[cname] = (
+                [obj for obj in objects if not obj_traits.is_experimental(obj)],
+                [obj for obj in objects if obj_traits.is_experimental(obj)],
+                optional)
+
+    # returns the objects whose type matches 'value', in spec order
+    def objects_of_type(self, value):
+        objs = self.__by_type.get(value)
+        if objs is None:
+            objs = [obj for obj in self.objects if re.match(value, obj['type'])]
+            self.__by_type[value] = objs
+        return objs
+
+    # returns the object of a type with the given name, or None
+    def find(self, type, name):
+        return self.by_name.get((type, name))
+
+    # returns the functions of a class, in version and ordinal order
+    def class_functions(self, cname):
+        return self.__functions.get(cname, [])
+
+    # returns the non-experimental and experimental functions of a class, in
+    # version and ordinal order, and whether no function is from version 1.0
+    def class_functions_exp(self, cname):
+        return self.__exp.get(cname, ([], [], True))
+
+"""
+Private:
+    returns the sort key of functions within a class
+"""
+def _function_order(obj):
+    return (float(obj.get('version',"1.0"))*10000) + int(obj.get('ordinal',"100"))
+
+"""
+Private:
+    returns the value of 'build(key)', built once per 'key' object; the
+    cache entry keeps 'key' alive, so its id is not reused
+"""
+def _cached(cache, key, build):
+    entry = cache.get(id(key))
+    if entry is None or entry[0] is not key:
+        entry = (key, build(key))
+        cache[id(key)] = entry
+    return entry[1]
+
+_spec_indexes = {}
+_meta_indexes = {}
+
+"""
+Public:
+    returns the SpecIndex of a section's specs
+"""
+def get_spec_index(specs):
+    return _cached(_spec_indexes, specs, SpecIndex)
+
+"""
+Private:
+    returns {name : group} of the first meta group containing each name
+"""
+def _make_meta_index(meta):
+    groups = {}
+    for group in meta:
+        for name in meta[group]:
+            groups.setdefault(name, group)
+    return groups
+
+def _get_meta_group(name, meta):
+    return _cached(_meta_indexes, meta, _make_meta_index).get(name)
+
 """
 Private:
     converts string from camelCase to snake_case
@@ -623,12 +745,7 @@ Public:
     returns a list of all objects of type in all specs
 """
 def extract_objs(specs, value):
-    objs = []
-    for s in specs:
-        for obj in s['objects']:
-            if re.match(value, obj['type']):
-                objs.append(obj)
-    return objs
+    return list(get_spec_index(specs).objects_of_type(value))
 
 """
 Private:
@@ -870,15 +987,14 @@ def get_ctype_name(namespace, tags, item):
     name = _remove_const(name)
     name = re.sub(r"void\*", "c_void_p", name)
     name = re.sub(r"char\*", "c_char_p", name)
-    name = re.sub(r"uint8_t", "c_ubyte", name)
-    name = re.sub(r"uint16_t", "c_ushort", name)
-    name = re.sub(r"uint32_t", "c_ulong", name)
-    name = re.sub(r"uint64_t", "c_ulonglong", name)
-    name = re.sub(r"size_t", "c_size_t", name)
-    name = re.sub(r"float", "c_float", name)
-    name = re.sub(r"double", "c_double", name)
-    name = re.sub(r"\bchar", "c_char", name)
-    name = re.sub(r"\bint", "c_int", name)
+    # exact-width types, c_ulong is 8 bytes on 64-bit Linux
+    name = re.sub(r"\buint8_t\b", "c_ubyte", name)
+    name = re.sub(r"\b(u?)int(8|16|32|64)_t\b", r"c_\1int\2", name)
+    name = re.sub(r"\bsize_t\b", "c_size_t", name)
+    name = re.sub(r"\bfloat\b", "c_float", name)
+    name = re.sub(r"\bdouble\b", "c_double", name)
+    name = re.sub(r"\bchar\b", "c_char", name)
+    name = re.sub(r"\bint\b", "c_int", name)
 
     if type_traits.is_pointer(name):
         name = _remove_ptr(name)
@@ -890,6 +1006,115 @@ def get_ctype_name(namespace, tags, item):
 
     return name
 
+"""
+Private:
+    numpy formats of the C base types
+"""
+_dtype_formats = {
+    "uint8_t": "u1", "uint16_t": "u2", "uint32_t": "u4", "uint64_t": "u8",
+    "int8_t": "i1", "int16_t": "i2", "int32_t": "i4", "int64_t": "i8", "int": "i4",
+    "size_t": "uintp", "float": "f4", "double": "f8", "char": "S1"
+    }
+
+"""
+Public:
+    returns the python expression of the numpy format of a member: a base
+    format, a type name resolved by the generated module, or (format, count)
+    for arrays; pointers are addresses
+"""
+def get_dtype_format(namespace, tags, item):
+    name = _remove_const(subt(namespace, tags, item['type']))
+    if type_traits.is_pointer(name):
+        format = "\"uintp\""
+    else:
+        format = "\"%s\""%_dtype_formats.get(name, name)
+
+    if 'name' in item and value_traits.is_array(item['name']):
+        length = subt(namespace, tags, value_traits.get_array_length(item['name']))
+        if name == "char":
+            return "\"S%%d\" %% %s"%length
+        return "(%s, %s)"%(format, length)
+    return format
+
+"""
+Public:
+    returns the numpy format of a type declared by a typedef, enum or handle
+"""
+def get_dtype_base_format(namespace, tags, name):
+    name = _remove_const(subt(namespace, tags, name))
+    if type_traits.is_pointer(name) or type_traits.is_handle(name):
+        return "uintp"
+    return _dtype_formats.get(name, name)
+
+"""
+Public:
+    returns a list of python expressions of the cffi cdef lines declaring each
+    member of a structure or union; array lengths are evaluated on import
+    format: "TYPE NAME;" or "TYPE NAME[%d];" % (LENGTH)
+"""
+def make_cdef_member_lines(namespace, tags, obj):
+    lines = []
+    for item in obj['members']:
+        tname = subt(namespace, tags, item['type'])
+        name = subt(namespace, tags, item['name'])
+        if value_traits.is_array(item['name']):
+            length = subt(namespace, tags, value_traits.get_array_length(item['name']))
+            lines.append("\"    %s %s[%%d];\" %% (%s)"%(tname, value_traits.get_array_name(name), length))
+        else:
+            lines.append("\"    %s %s;\""%(tname, name))
+    return lines
+
+"""
+Public:
+    returns a list of python expressions of the cffi cdef lines declaring each
+    enumerator of an enumeration; values are evaluated on import
+    format: "ETOR_NAME = %d," % (VALUE)
+"""
+def make_cdef_etor_lines(namespace, tags, obj):
+    lines = []
+    for item in obj['etors']:
+        name = subt(namespace, tags, item['name'])
+        if 'value' in item:
+            lines.append("\"    %s = %%d,\" %% (%s)"%(name, subt(namespace, tags, item['value'])))
+        else:
+            lines.append("\"    %s,\""%name)
+    lines.append("\"    %sFORCE_UINT32 = 0x7fffffff\""%make_enum_name(namespace, tags, obj)[:-1].upper())
+    return lines
+
+"""
+Public:
+    returns the sorted python names of the types and macros declared by other
+    namespaces that the python bindings of 'specs' reference: in member,
+    parameter, typedef and return types, array lengths, and enumerator and
+    macro values; 'groups' limits them to those meta groups
+"""
+def get_imported_names(namespace, tags, specs, meta, groups=("handle", "enum", "typedef", "struct", "union", "macro")):
+    values = []
+    declared = set()
+    for s in specs:
+        for obj in s['objects']:
+            declared.add(obj['name'])
+            if re.match(r"macro", obj['type']):
+                if 'altvalue' not in obj and 'condition' not in obj and not obj['value'].startswith("__"):
+                    values.append(obj['value'])
+            elif re.match(r"typedef", obj['type']):
+                values.append(obj['value'])
+            elif re.match(r"enum", obj['type']):
+                values += [item['value'] for item in obj['etors'] if 'value' in item]
+            elif re.match(r"struct|union", obj['type']):
+                values += [item['type'] for item in obj['members']]
+                values += [item['name'] for item in obj['members']]
+            elif re.match(r"function|fptr_typedef", obj['type']):
+                values += [item['type'] for item in obj['params']]
+                values.append(obj.get('return', ""))
+
+    names = set()
+    for value in values:
+        for name in re.findall(r"\$\w+", value):
+            if name not in declared and any(name in meta.get(group, {}) for group in groups):
+                names.add(subt(namespace, tags, name))
+    return sorted(names)
+
 """
 Public:
     returns c/c++ name of member of struct/class
@@ -1031,6 +1256,17 @@ Public:
     format: "TYPE NAME = INIT, ///< DESCRIPTION"
 """
 def make_param_lines(namespace, tags, obj, cpp=False, py=False, decl=False, meta=None, format=["type", "name", "init", "delim", "desc"], delim=","):
+    key = (id(obj), id(meta), namespace, tuple(tags.items()), cpp, py, decl, tuple(format), delim)
+    # the entry keeps 'obj' and 'meta' alive, so their ids can't be reused
+    entry = _param_lines.get(key)
+    if entry is None or entry[0] is not obj or entry[1] is not meta:
+        entry = (obj, meta, _make_param_lines(namespace, tags, obj, cpp, py, decl, meta, format, delim))
+        _param_lines[key] = entry
+    return list(entry[2])
+
+_param_lines = {}
+
+def _make_param_lines(namespace, tags, obj, cpp, py, decl, meta, format, delim):
     lines = []
 
     if cpp:
@@ -1397,12 +1633,13 @@ Private:
     returns a ctor dict in c++ wrapper
 """
 def _make_ctor(namespace, tags, item, obj, meta, specs):
-    cobj = next(iter(filter_items(extract_objs(specs, 'class'), 'name', type_traits.find_class_name(item['type'], meta))), None)
+    index = get_spec_index(specs)
+    cobj = index.find('class', type_traits.find_class_name(item['type'], meta))
     is_singleton = class_traits.is_singleton(cobj)
     fty_name = "g_%sFactory"%make_class_name(namespace, tags, cobj)
 
     if obj_traits.class_name(obj) in meta['class'][cobj['name']].get('child',[]):
-        cobj2 = next(iter(filter_items(extract_objs(specs, 'class'), 'name', obj_traits.class_name(obj))), None)
+        cobj2 = index.find('class', obj_traits.class_name(obj))
         is_singleton = class_traits.is_singleton(cobj2)
         fty_name = "g_%sFactory"%make_class_name(namespace, tags, cobj2)
 
@@ -1692,38 +1929,19 @@ Public:
 """
 def get_class_function_objs(specs, cname, minVersion = 0, maxVersion = 9999):
     objects = []
-    for s in specs:
-        for obj in s['objects']:
-            is_function = obj_traits.is_function(obj)
-            match_cls = cname == obj_traits.class_name(obj)
-            if is_function and match_cls:
-                func_ver = float(obj.get('version',"1.0"))
-                if func_ver <= maxVersion and func_ver >= minVersion:
-                    objects.append(obj)
-    return sorted(objects, key=lambda obj: (float(obj.get('version',"1.0"))*10000) + int(obj.get('ordinal',"100")))
+    for obj in get_spec_index(specs).class_functions(cname):
+        func_ver = float(obj.get('version',"1.0"))
+        if func_ver <= maxVersion and func_ver >= minVersion:
+            objects.append(obj)
+    return objects
 
 """
 Public:
     returns a list of all non-experimental function objs and a list of experimental function objs for the specified class
 """
 def get_class_function_objs_exp(specs, cname):
-    objects = []
-    exp_objects = []
-    optional = True
-    for s in specs:
-        for obj in s['objects']:
-            is_function = obj_traits.is_function(obj)
-            match_cls = cname == obj_traits.class_name(obj)
-            if is_function and match_cls:
-                if obj_traits.is_experimental(obj):
-                    exp_objects.append(obj)
-                else:
-                    objects.append(obj)
-                if obj.get('version',"1.0") == "1.0":
-                    optional = False
-    objects = sorted(objects, key=lambda obj: (float(obj.get('version',"1.0"))*10000) + int(obj.get('ordinal',"100")))
-    exp_objects = sorted(exp_objects, key=lambda obj: (float(obj.get('version',"1.0"))*10000) + int(obj.get('ordinal',"100")))              
-    return objects, exp_objects, optional
+    objects, exp_objects, optional = get_spec_index(specs).class_functions_exp(cname)
+    return list(objects), list(exp_objects), optional
 
 
 """
@@ -0,0 +1,25 @@
+<%
+    x=tags['$x']
+%>"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+ @file __init__.py
+ @version v${ver}
+
+ Python bindings generated from the API specification, one module per
+ namespace and backend:
+%if 'ctypes' in backends:
+     ${x}.py, ...        ctypes
+%endif
+%if 'cffi' in backends:
+     ${x}_cffi.py, ...   cffi ABI mode, requires cffi
+%endif
+%if 'numpy' in backends:
+     ${x}_numpy.py, ...  numpy structured dtypes, requires numpy
+%endif
+ Submodules are imported on demand, e.g. `from level_zero import ${x}_cffi`.
+
+ """
+__version__ = "1.0"
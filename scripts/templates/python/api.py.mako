@@ -0,0 +1,320 @@
+## Note: include/level_zero is still maintained by hand (its _common.py
+## split, deferred _*_exp modules and callback tables are not generated);
+## the python target writes a separate package, by default under
+## <out_dir>/build/python/level_zero.
+<%
+import re
+import textwrap
+from templates import helper as th
+%><%
+    n=namespace
+    N=n.upper()
+
+    x=tags['$x']
+    X=x.upper()
+
+    tables = th.get_pfntables(specs, meta, n, tags)
+%>"""
+ Copyright (C) 2019-2021 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+ @file ${n}.py
+ @version v${ver}
+
+ """
+import sys
+from ctypes import *
+from enum import *
+%if n != x:
+<%
+    # import only the core names this namespace uses, not the whole core API:
+    # those its objects reference, and those of the ddi class below
+    used = sorted(set(th.get_imported_names(n, tags, specs, meta)) |
+        {"UnsupportedFunctionError", "%s_FASTCALL" % X, "%s_api_version_t" % x, "%s_result_t" % x, "%s_result_v" % x})
+%>from .${x} import (
+${textwrap.fill(", ".join(used), width=80, initial_indent="    ", subsequent_indent="    ", break_on_hyphens=False)}
+    )
+%endif
+
+${"##"}#############################################################################
+__version__ = "1.0"
+
+%for spec in specs:
+%for obj in spec['objects']:
+%if re.match(r"macro|typedef|fptr_typedef|handle|enum|struct|union", obj['type']):
+${"##"}#############################################################################
+${"##"} @brief ${th.subt(n, tags, obj['desc'])}
+%if 'details' in obj:
+${"##"} 
+${"##"} @details
+%for line in th.make_details_lines(n, tags, obj):
+${"##"}     ${line}
+%endfor
+%endif
+## ------------------ MACRO
+%if re.match(r"macro", obj['type']):
+%if re.match(r".*\(.*\)", obj['name']):
+def ${th.make_macro_name(n, tags, obj)}:
+    return ${th.subt(n, tags, obj['value'])}
+%elif 'altvalue' not in obj and 'condition' not in obj and not obj['value'].startswith("__"):
+${th.make_macro_name(n, tags, obj)} = ${th.subt(n, tags, obj['value'])}
+%else:
+# ${th.make_macro_name(n, tags, obj)} not required for python
+%endif
+## ------------------ TYPEDEF
+%elif re.match(r"typedef", obj['type']):
+class ${th.make_type_name(n, tags, obj)}(${th.get_ctype_name(n, tags, {'type': obj['value']})}):
+    pass
+## ------------------ FPTR TYPEDEF
+%elif re.match(r"fptr_typedef", obj['type']):
+<%
+    ret = "None" if obj['return'] == "void" else th.get_ctype_name(n, tags, {'type': obj['return']})
+    params = [ret] + [th.get_ctype_name(n, tags, item) for item in obj['params']]
+%>${th.make_type_name(n, tags, obj)} = CFUNCTYPE( ${", ".join(params)} )
+## ------------------ HANDLE
+%elif re.match(r"handle", obj['type']):
+class ${th.make_type_name(n, tags, obj)}(c_void_p):
+    pass
+## ------------------ ENUM
+%elif re.match(r"enum", obj['type']):
+class ${th.make_type_name(n, tags, obj)[:-2]}_v(IntEnum):
+    %for line in th.make_etor_lines(n, tags, obj, py=True, meta=meta):
+    ${line}
+    %endfor
+
+class ${th.make_type_name(n, tags, obj)}(c_int):
+    def __str__(self):
+        %if th.is_enum_bitfield(obj):
+        return hex(self.value)
+        %else:
+        return str(${th.make_type_name(n, tags, obj)[:-2]}_v(self.value))
+        %endif
+
+## ------------------ STRUCT/UNION
+%elif re.match(r"struct|union", obj['type']):
+class ${th.make_type_name(n, tags, obj)}(${"Union" if obj['type'] == "union" else "Structure"}):
+    _fields_ = [
+        %for line in th.make_member_lines(n, tags, obj, py=True, meta=meta):
+        ${line}
+        %endfor
+    ]
+%endif
+
+%endif
+%endfor
+%endfor
+${"##"}#############################################################################
+__use_win_types = "win32" == sys.platform
+
+%if n == x:
+${"##"}#############################################################################
+${"##"} @brief Fast-call argument type: handles and pointers become c_void_p, so raw
+${"##"}        int addresses are accepted, and typedefs decay to their ctypes base
+def _fastcall_argtype(argtype):
+    if issubclass(argtype, c_void_p) or isinstance(getattr(argtype, "_type_", None), type):
+        return c_void_p
+    for base in argtype.__mro__:
+        if base.__module__ == "ctypes":
+            return base
+    return argtype
+
+_fastcall_types = {}
+
+${"##"}#############################################################################
+${"##"} @brief Returns the (cached) fast-call equivalent of a function-pointer type
+def _fastcall_type(functype):
+    fasttype = _fastcall_types.get(functype)
+    if fasttype is None:
+        argtypes = [_fastcall_argtype(argtype) for argtype in functype._argtypes_]
+        if __use_win_types:
+            fasttype = WINFUNCTYPE( c_int, *argtypes )
+        else:
+            fasttype = CFUNCTYPE( c_int, *argtypes )
+        _fastcall_types[functype] = fasttype
+    return fasttype
+
+${"##"}#############################################################################
+${"##"} @brief Fast-call view of a device-driver interface
+${"##"} 
+${"##"} @details
+${"##"}     - Functions are bound to the same driver entry points as the ddi, but
+${"##"}       take handles and pointers as raw int addresses (or byref/ctypes
+${"##"}       objects), and return the result as a plain int.
+${"##"}     - 0 is ::${X}_RESULT_SUCCESS; only other values need converting with
+${"##"}       ${x}_result_v.
+${"##"}     - Unsupported functions raise ::UnsupportedFunctionError as on the ddi.
+class ${X}_FASTCALL:
+    def __init__(self, ddi):
+        self.__ddi = ddi
+
+    def __getattr__(self, name):
+        try:
+            table, pfn, functype = self.__ddi._functions[name]
+        except (KeyError, AttributeError):
+            raise AttributeError(name) from None
+
+        _table = self.__ddi._get_table(table)
+        if _table is None or not getattr(_table, pfn):
+            func = getattr(self.__ddi, name)
+        else:
+            func = _fastcall_type(self.__ddi._functype(functype))(getattr(_table, pfn))
+        setattr(self, name, func)
+        return func
+
+${"##"}#############################################################################
+${"##"} @brief Raised when calling a function whose ddi table, or table entry, was
+${"##"}        not provided by the driver
+class UnsupportedFunctionError(Exception):
+    def __init__(self, function, table, result):
+        super().__init__("%s is not supported by the driver (%s table: %s)" % (function, table, result.name))
+        self.function = function
+        self.table = table
+        self.result = result
+
+%endif
+%for tbl in tables:
+%for obj in tbl['functions']:
+${"##"}#############################################################################
+${"##"} @brief Function-pointer for ${th.make_func_name(n, tags, obj)}
+<%
+    params = ["%s_result_t"%x] + [line.rstrip(",") for line in th.make_param_lines(n, tags, obj, py=True, format=["type", "delim"])]
+%>if __use_win_types:
+    _${th.make_func_name(n, tags, obj)}_t = WINFUNCTYPE( ${", ".join(params)} )
+else:
+    _${th.make_func_name(n, tags, obj)}_t = CFUNCTYPE( ${", ".join(params)} )
+
+%endfor
+
+${"##"}#############################################################################
+${"##"} @brief Table of ${tbl['name']} functions pointers
+class _${tbl['type']}(Structure):
+    _fields_ = [
+        %for obj in tbl['functions']:
+        ${th.append_ws("(\"%s\", c_void_p)%s"%(th.make_pfn_name(n, tags, obj), "" if loop.last else ","), 63)} ## _${th.make_func_name(n, tags, obj)}_t
+        %endfor
+    ]
+
+%endfor
+${"##"}#############################################################################
+class _${n}_dditable_t(Structure):
+    _fields_ = [
+        %for tbl in tables:
+        ("${tbl['name']}", _${tbl['type']})${"" if loop.last else ","}
+        %endfor
+    ]
+
+${"##"}#############################################################################
+${"##"} @brief Returns the named function-pointer type
+def _get_functype(name):
+    return globals()[name]
+
+${"##"}#############################################################################
+${"##"} @brief ${n} device-driver interfaces
+class ${N}_DDI:
+    ${"##"} @brief Map of table name to (proc-address table getter, table type)
+    _tables = {
+        %for tbl in tables:
+        "${tbl['name']}" : ("${tbl['export']['name']}", _${tbl['type']}),
+        %endfor
+    }
+
+    ${"##"} @brief Map of function name to (table name, table member, function-pointer type name)
+    _functions = {
+        %for tbl in tables:
+        %for obj in tbl['functions']:
+        "${th.make_func_name(n, tags, obj)}" : ("${tbl['name']}", "${th.make_pfn_name(n, tags, obj)}", "_${th.make_func_name(n, tags, obj)}_t"),
+        %endfor
+        %endfor
+    }
+
+    _functype = staticmethod(_get_functype)
+
+    def __init__(self, version : ${x}_api_version_t, lazy : bool = False, strict : bool = True):
+        # load the ze_loader library
+        if "win32" == sys.platform:
+            self.__dll = WinDLL("ze_loader.dll")
+        else:
+            self.__dll = CDLL("ze_loader.so")
+        self.__version = version
+        self.__strict = strict
+
+        # fill the ddi tables
+        self.__dditable = _${n}_dditable_t()
+        self.__loaded = {}
+        self.__results = {}
+        self.__fastcall = None
+
+        # in lazy mode, tables are fetched and functions bound on first access
+        if not lazy:
+            for name in self._functions:
+                getattr(self, name)
+
+        # success!
+
+    ${"##"} @brief Returns the named ddi table, calling the driver to fill it on first use;
+    ${"##"}        in non-strict mode, returns None if the driver does not provide the table
+    def _get_table(self, table):
+        if table not in self.__loaded:
+            # call driver to get function pointers
+            getter, tabletype = self._tables[table]
+            _table = tabletype()
+            try:
+                r = ${x}_result_v(getattr(self.__dll, getter)(self.__version, byref(_table)))
+            except AttributeError:
+                if self.__strict:
+                    raise
+                r = ${x}_result_v.ERROR_UNSUPPORTED_FEATURE
+            self.__results[table] = r
+            if r != ${x}_result_v.SUCCESS:
+                if self.__strict:
+                    raise Exception(r)
+                self.__loaded[table] = None
+            else:
+                setattr(self.__dditable, table, _table)
+                self.__loaded[table] = getattr(self.__dditable, table)
+        return self.__loaded[table]
+
+    ${"##"} @brief Fast-call view of this interface; see ::${X}_FASTCALL
+    @property
+    def fastcall(self):
+        if self.__fastcall is None:
+            self.__fastcall = ${X}_FASTCALL(self)
+        return self.__fastcall
+
+    ${"##"} @brief Map of table name to ddi table, or None if not provided by the driver
+    @property
+    def tables(self):
+        return {table : self._get_table(table) for table in self._tables}
+
+    ${"##"} @brief Set of table names provided by the driver
+    @property
+    def supported_tables(self):
+        return set(table for table, _table in self.tables.items() if _table is not None)
+
+    ${"##"} @brief Returns True if the driver provides the named function
+    def is_supported(self, name):
+        table, pfn, _ = self._functions[name]
+        _table = self._get_table(table)
+        return _table is not None and bool(getattr(_table, pfn))
+
+    ${"##"} @brief Binds the named function on first access and caches it on the instance
+    def __getattr__(self, name):
+        try:
+            table, pfn, functype = self._functions[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+        _table = self._get_table(table)
+        if _table is None or not getattr(_table, pfn):
+            # calling a function the driver did not provide raises instead of crashing
+            result = self.__results.get(table, ${x}_result_v.ERROR_UNSUPPORTED_FEATURE)
+            if result == ${x}_result_v.SUCCESS:
+                result = ${x}_result_v.ERROR_UNSUPPORTED_FEATURE
+            def func(*args):
+                raise UnsupportedFunctionError(name, table, result)
+        else:
+            # attach function interface to function address
+            func = _get_functype(functype)(getattr(_table, pfn))
+        setattr(self, name, func)
+        return func
@@ -0,0 +1,232 @@
+<%
+import re
+import textwrap
+from templates import helper as th
+%><%
+    n=namespace
+    N=n.upper()
+
+    x=tags['$x']
+    X=x.upper()
+
+    tables = th.get_pfntables(specs, meta, n, tags)
+%>"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+ @file ${n}_cffi.py
+ @version v${ver}
+
+ cffi ABI-mode bindings of the ${n} API, with the same ${N}_DDI interface as
+ ${n}.py: functions are called through cdata function pointers, and take
+ cdata, ffi.NULL or ints for handles and pointers. Requires cffi.
+
+ """
+import sys
+from cffi import FFI
+%if n != x:
+<%
+    # core types are declared by the included core ffi; only the core macros
+    # used to evaluate array lengths and values, and the ddi's names, are imported
+    used = th.get_imported_names(n, tags, specs, meta, groups=["macro"]) + ["UnsupportedFunctionError", "ffi as _%s_ffi" % x, "%s_results" % x]
+%>
+from .${x}_cffi import (
+${textwrap.fill(", ".join(used), width=80, initial_indent="    ", subsequent_indent="    ", break_on_hyphens=False)}
+    )
+%endif
+
+${"##"}#############################################################################
+__version__ = "1.0"
+
+%for spec in specs:
+%for obj in spec['objects']:
+%if re.match(r"macro", obj['type']):
+%if re.match(r".*\(.*\)", obj['name']):
+${"##"} @brief ${th.subt(n, tags, obj['desc'])}
+def ${th.make_macro_name(n, tags, obj)}:
+    return ${th.subt(n, tags, obj['value'])}
+
+%elif 'altvalue' not in obj and 'condition' not in obj and not obj['value'].startswith("__"):
+${"##"} @brief ${th.subt(n, tags, obj['desc'])}
+${th.make_macro_name(n, tags, obj)} = ${th.subt(n, tags, obj['value'])}
+
+%endif
+%endif
+%endfor
+%endfor
+${"##"}#############################################################################
+${"##"} @brief Calling convention of the driver entry points
+_apicall = "__stdcall " if "win32" == sys.platform else ""
+
+${"##"}#############################################################################
+${"##"} @brief Declarations of the ${n} types and entry points; array lengths and
+${"##"}        enumerator values are evaluated from the macros above
+_cdef = "\n".join([
+%for spec in specs:
+%for obj in spec['objects']:
+%if re.match(r"handle", obj['type']):
+    "typedef struct _${th.make_type_name(n, tags, obj)} *${th.make_type_name(n, tags, obj)};",
+%elif re.match(r"struct|union", obj['type']):
+    "typedef ${obj['type']} _${th.make_type_name(n, tags, obj)} ${th.make_type_name(n, tags, obj)};",
+%endif
+%endfor
+%endfor
+%for spec in specs:
+%for obj in spec['objects']:
+%if re.match(r"typedef", obj['type']):
+    "typedef ${th.subt(n, tags, obj['value'])} ${th.make_type_name(n, tags, obj)};",
+%elif re.match(r"enum", obj['type']):
+%if th.make_enum_name(n, tags, obj) != th.make_type_name(n, tags, obj):
+    "typedef uint32_t ${th.make_type_name(n, tags, obj)};",
+%endif
+    "typedef enum _${th.make_enum_name(n, tags, obj)} {",
+    %for line in th.make_cdef_etor_lines(n, tags, obj):
+    ${line},
+    %endfor
+    "} ${th.make_enum_name(n, tags, obj)};",
+%endif
+%endfor
+%endfor
+%for spec in specs:
+%for obj in spec['objects']:
+%if re.match(r"fptr_typedef", obj['type']):
+    "typedef ${th.subt(n, tags, obj['return'])} (*${th.make_type_name(n, tags, obj)})(${" ".join(th.make_param_lines(n, tags, obj, format=["type", "name", "delim"]))});",
+%elif re.match(r"struct|union", obj['type']):
+    "${obj['type']} _${th.make_type_name(n, tags, obj)} {",
+    %for line in th.make_cdef_member_lines(n, tags, obj):
+    ${line},
+    %endfor
+    "};",
+%endif
+%endfor
+%endfor
+%for tbl in tables:
+%for obj in tbl['functions']:
+    "typedef ${x}_result_t (%s*${th.make_pfn_type(n, tags, obj)})(${" ".join(th.make_param_lines(n, tags, obj, format=["type", "name", "delim"]))});" % _apicall,
+%endfor
+    "typedef struct _${tbl['type']} {",
+    %for obj in tbl['functions']:
+    "    ${th.make_pfn_type(n, tags, obj)} ${th.make_pfn_name(n, tags, obj)};",
+    %endfor
+    "} ${tbl['type']};",
+    "${x}_result_t %s${tbl['export']['name']}(${" ".join(th.make_param_lines(n, tags, tbl['export'], format=["type", "name", "delim"]))});" % _apicall,
+%endfor
+])
+
+ffi = FFI()
+%if n != x:
+ffi.include(_${x}_ffi)
+%endif
+ffi.cdef(_cdef)
+
+%if n == x:
+${"##"}#############################################################################
+${"##"} @brief Map of ${x}_result_t enumerator name to value
+${x}_results = ffi.typeof("${x}_result_t").relements
+
+${"##"}#############################################################################
+${"##"} @brief Raised when calling a function whose ddi table, or table entry, was
+${"##"}        not provided by the driver
+class UnsupportedFunctionError(Exception):
+    def __init__(self, function, table, result):
+        super().__init__("%s is not supported by the driver (%s table: %s)" % (function, table, ffi.typeof("${x}_result_t").elements.get(result, result)))
+        self.function = function
+        self.table = table
+        self.result = result
+
+%endif
+${"##"}#############################################################################
+${"##"} @brief ${n} device-driver interfaces
+class ${N}_DDI:
+    ${"##"} @brief Map of table name to (proc-address table getter, table type)
+    _tables = {
+        %for tbl in tables:
+        "${tbl['name']}" : ("${tbl['export']['name']}", "${tbl['type']}"),
+        %endfor
+    }
+
+    ${"##"} @brief Map of function name to (table name, table member)
+    _functions = {
+        %for tbl in tables:
+        %for obj in tbl['functions']:
+        "${th.make_func_name(n, tags, obj)}" : ("${tbl['name']}", "${th.make_pfn_name(n, tags, obj)}"),
+        %endfor
+        %endfor
+    }
+
+    def __init__(self, version : int, lazy : bool = False, strict : bool = True):
+        # load the ze_loader library
+        if "win32" == sys.platform:
+            self.__dll = ffi.dlopen("ze_loader.dll")
+        else:
+            self.__dll = ffi.dlopen("ze_loader.so")
+        self.__version = version
+        self.__strict = strict
+
+        self.__loaded = {}
+        self.__results = {}
+
+        # in lazy mode, tables are fetched and functions bound on first access
+        if not lazy:
+            for name in self._functions:
+                getattr(self, name)
+
+    ${"##"} @brief Returns the named ddi table, calling the driver to fill it on first use;
+    ${"##"}        in non-strict mode, returns None if the driver does not provide the table
+    def _get_table(self, table):
+        if table not in self.__loaded:
+            # call driver to get function pointers
+            getter, tabletype = self._tables[table]
+            _table = ffi.new("%s*" % tabletype)
+            try:
+                r = getattr(self.__dll, getter)(self.__version, _table)
+            except AttributeError:
+                if self.__strict:
+                    raise
+                r = ${x}_results["${X}_RESULT_ERROR_UNSUPPORTED_FEATURE"]
+            self.__results[table] = r
+            if r != ${x}_results["${X}_RESULT_SUCCESS"]:
+                if self.__strict:
+                    raise Exception(r)
+                self.__loaded[table] = None
+            else:
+                self.__loaded[table] = _table
+        return self.__loaded[table]
+
+    ${"##"} @brief Map of table name to ddi table, or None if not provided by the driver
+    @property
+    def tables(self):
+        return {table : self._get_table(table) for table in self._tables}
+
+    ${"##"} @brief Set of table names provided by the driver
+    @property
+    def supported_tables(self):
+        return set(table for table, _table in self.tables.items() if _table is not None)
+
+    ${"##"} @brief Returns True if the driver provides the named function
+    def is_supported(self, name):
+        table, pfn = self._functions[name]
+        _table = self._get_table(table)
+        return _table is not None and getattr(_table, pfn) != ffi.NULL
+
+    ${"##"} @brief Binds the named function on first access and caches it on the instance
+    def __getattr__(self, name):
+        try:
+            table, pfn = self._functions[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+        _table = self._get_table(table)
+        if _table is None or getattr(_table, pfn) == ffi.NULL:
+            # calling a function the driver did not provide raises instead of crashing
+            result = self.__results.get(table, ${x}_results["${X}_RESULT_ERROR_UNSUPPORTED_FEATURE"])
+            if result == ${x}_results["${X}_RESULT_SUCCESS"]:
+                result = ${x}_results["${X}_RESULT_ERROR_UNSUPPORTED_FEATURE"]
+            def func(*args):
+                raise UnsupportedFunctionError(name, table, result)
+        else:
+            # the table member is a cdata function pointer, callable as is
+            func = getattr(_table, pfn)
+        setattr(self, name, func)
+        return func
@@ -0,0 +1,146 @@
+<%
+import re
+import textwrap
+from templates import helper as th
+%><%
+    n=namespace
+    N=n.upper()
+
+    x=tags['$x']
+    X=x.upper()
+%>"""
+ Copyright (C) 2025 Intel Corporation
+
+ SPDX-License-Identifier: MIT
+
+ @file ${n}_numpy.py
+ @version v${ver}
+
+ NumPy structured dtypes of the ${n} structures, with the field offsets of the
+ C layout, so arrays of descriptors and properties can be passed to the
+ driver without per-element Python objects. Requires numpy.
+
+ The offsets follow numpy's C alignment; the layout table measured from the
+ C headers stays the reference: check them against it with
+ scripts/generate_layout.py --check --python-dir, as ze_dtypes.py of
+ include/level_zero is generated from it.
+
+ """
+from ctypes import *
+import numpy
+%if n != x:
+<%
+    # core types are named by string and resolved through the merged tables;
+    # only the core macros used in array lengths and values are imported
+    used = th.get_imported_names(n, tags, specs, meta, groups=["macro"]) + ["_formats as _%s_formats" % x, "_structs as _%s_structs" % x]
+%>
+from .${x}_numpy import (
+${textwrap.fill(", ".join(used), width=80, initial_indent="    ", subsequent_indent="    ", break_on_hyphens=False)}
+    )
+%endif
+
+${"##"}#############################################################################
+__version__ = "1.0"
+
+%for spec in specs:
+%for obj in spec['objects']:
+%if re.match(r"macro", obj['type']):
+%if re.match(r".*\(.*\)", obj['name']):
+${"##"} @brief ${th.subt(n, tags, obj['desc'])}
+def ${th.make_macro_name(n, tags, obj)}:
+    return ${th.subt(n, tags, obj['value'])}
+
+%elif 'altvalue' not in obj and 'condition' not in obj and not obj['value'].startswith("__"):
+${"##"} @brief ${th.subt(n, tags, obj['desc'])}
+${th.make_macro_name(n, tags, obj)} = ${th.subt(n, tags, obj['value'])}
+
+%endif
+%endif
+%endfor
+%endfor
+${"##"}#############################################################################
+${"##"} @brief numpy format of every typedef, enumeration and handle
+_formats = {
+%if n != x:
+    **_${x}_formats,
+%endif
+%for spec in specs:
+%for obj in spec['objects']:
+%if re.match(r"typedef", obj['type']):
+    "${th.make_type_name(n, tags, obj)}" : "${th.get_dtype_base_format(n, tags, obj['value'])}",
+%elif re.match(r"handle", obj['type']):
+    "${th.make_type_name(n, tags, obj)}" : "uintp",
+%elif re.match(r"enum", obj['type']):
+    "${th.make_type_name(n, tags, obj)}" : "i4",
+%endif
+%endfor
+%endfor
+}
+
+${"##"}#############################################################################
+${"##"} @brief (is union, [(field, format)]) of every structure and union; a format
+${"##"}        naming another type is resolved by dtype
+_structs = {
+%if n != x:
+    **_${x}_structs,
+%endif
+%for spec in specs:
+%for obj in spec['objects']:
+%if re.match(r"struct|union", obj['type']):
+    "${th.make_type_name(n, tags, obj)}" : (${obj['type'] == "union"}, [${", ".join("(\"%s\", %s)" % (th.value_traits.get_array_name(th.subt(n, tags, item['name'])), th.get_dtype_format(n, tags, item)) for item in obj['members'])}]),
+%endif
+%endfor
+%endfor
+}
+
+_dtypes = {}
+
+${"##"}#############################################################################
+${"##"} @brief Returns the numpy dtype of a format, resolving the type names
+def _resolve(format):
+    if isinstance(format, tuple):
+        return (_resolve(format[0]), format[1])
+    if format in _structs:
+        return dtype(format)
+    return numpy.dtype(_formats.get(format, format))
+
+${"##"}#############################################################################
+${"##"} @brief Returns the numpy dtype of a structure, given its ctypes class or name;
+${"##"}        fields are aligned as by the C compiler, the members of a union
+${"##"}        all start at offset 0
+def dtype(struct):
+    name = struct if isinstance(struct, str) else struct.__name__
+    value = _dtypes.get(name)
+    if value is None:
+        union, fields = _structs[name]
+        names = [field[0] for field in fields]
+        formats = [_resolve(field[1]) for field in fields]
+        if union:
+            alignment = max(numpy.dtype(format).alignment for format in formats)
+            itemsize = max(numpy.dtype(format).itemsize for format in formats)
+            value = numpy.dtype({
+                "names" : names,
+                "formats" : formats,
+                "offsets" : [0] * len(fields),
+                "itemsize" : (itemsize + alignment - 1) // alignment * alignment}, align=True)
+        else:
+            value = numpy.dtype({"names" : names, "formats" : formats}, align=True)
+        _dtypes[name] = value
+    return value
+
+${"##"}#############################################################################
+${"##"} @brief Allocates a zero-filled array of 'count' structures, optionally
+${"##"}        setting each element's stype
+def zeros(struct, count, stype=None):
+    array = numpy.zeros(count, dtype=dtype(struct))
+    if stype is not None:
+        array["stype"] = stype
+    return array
+
+${"##"}#############################################################################
+${"##"} @brief Returns a numpy view of 'count' structures at 'address', without
+${"##"}        copying; the memory must outlive the view
+def view(address, struct, count):
+    value = dtype(struct)
+    buffer = (c_ubyte * (value.itemsize * count)).from_address(address)
+    return numpy.frombuffer(buffer, dtype=value, count=count)
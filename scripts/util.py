@@ -5,22 +5,335 @@
 
 """
 import re
+import os
+import sys
 import json
+import time
+import contextlib
+import hashlib
+import concurrent.futures
+import mako
 from mako.template import Template
 
-makoFileList = []
+try:
+    import resource
+except ImportError:
+    resource = None
 
+templates_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "templates")
+
+"""
+    generation state: every output is recorded in the manifest with its key
+    (template sources + render arguments); in incremental mode, makoWrite
+    skips rendering outputs whose key matches the previous manifest entry
+"""
+incremental = False
+manifest = {}
+previousManifest = {}
+stats = {"rendered": 0, "skipped": 0, "written": 0, "unchanged": 0}
+actions = {}
+timings = {}
+phases = {}
+
+"""
+    adds the time spent in the 'with' block to phases[name]
+"""
+@contextlib.contextmanager
+def phase(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases[name] = phases.get(name, 0.0) + time.perf_counter() - start
+
+"""
+    outputs rendered in memory, by name, for post-processing before they are
+    written; their content is kept in the manifest, so outputs that are not
+    rendered again are taken from the previous run, and 'changed' holds the
+    names whose content differs from it
+"""
+rendered = {}
+renderedManifest = {}
+previousRendered = {}
+changed = set()
+
+"""
+    absolute paths of the templates to render, or None for all
+"""
+selected = None
+
+"""
+    parallel rendering: with jobs > 1, makoWrite queues the renders and
+    renderQueued runs them in a process pool; arguments registered with
+    'share' are sent to each worker once, and referenced by name in the tasks
+"""
+jobs = 1
+_queue = []
+_shared = {}
+_sharedNames = {}
+
+"""
+    compiled templates: each template is compiled to a python module once, in
+    'templateCache' if set, where mako reuses it across runs until the template
+    is modified; loaded templates are kept by path and mtime
+"""
+templateCache = None
+_templates = {}
+
+_digests = {}
+
+"""
+    returns the sha256 hex digest of the canonical JSON of a render argument;
+    digests of the large shared objects (specs, meta) are computed once per run
+"""
+def _valueDigest(value):
+    if not isinstance(value, (dict, list)):
+        return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()
+    # the entry keeps 'value' alive, so its id can't be reused
+    entry = _digests.get(id(value))
+    if entry is None or entry[0] is not value:
+        digest = hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()
+        entry = (value, digest)
+        _digests[id(value)] = entry
+    return entry[1]
+
+"""
+    returns the sha256 hex digest of a file's content, or "" if missing
+"""
+def _fileDigest(path):
+    try:
+        with open(path, 'rb') as fin:
+            return hashlib.sha256(fin.read()).hexdigest()
+    except FileNotFoundError:
+        return ""
+
+"""
+    returns the key of a render: the template, the helper module it imports,
+    the mako version and every render argument
+"""
+def makoKey(inpath, **args):
+    h = hashlib.sha256()
+    h.update(mako.__version__.encode())
+    h.update(_fileDigest(inpath).encode())
+    h.update(_fileDigest(os.path.join(templates_dir, "helper.py")).encode())
+    for name in sorted(args):
+        h.update(("%s=%s;" % (name, _valueDigest(args[name]))).encode())
+    return h.hexdigest()
+
+"""
+    writes 'content' to 'outpath' unless the file already holds it, so
+    unchanged outputs keep their mtime; returns True if written
+"""
+def writeIfChanged(outpath, content):
+    with phase("io"):
+        try:
+            with open(outpath, 'r') as fin:
+                if fin.read() == content:
+                    return False
+        except FileNotFoundError:
+            pass
+        with open(outpath, 'w') as fout:
+            fout.write(content)
+        return True
+
+"""
+    renders 'inpath' into 'outpath'; returns the number of lines, or 0 when
+    the render is queued
+"""
 def makoWrite(inpath, outpath, **args):
-    template = Template(filename=inpath)
-    rendered = template.render(**args)
-    rendered = re.sub(r"\r\n", r"\n", rendered)
+    if not isSelected(inpath):
+        return 0
+    print("Generating %s..."%outpath)
+
+    key = makoKey(inpath, **args)
+    entry = previousManifest.get(os.path.abspath(outpath))
+    if incremental and entry is not None and entry["key"] == key and os.path.exists(outpath):
+        stats["skipped"] += 1
+        _record(inpath, outpath, key, entry["lines"], "skipped")
+        return entry["lines"]
 
-    with open(outpath, 'w') as fout:
-        fout.write(rendered)
+    if jobs > 1:
+        _queue.append((inpath, outpath, key, _sharedArgs(args), None))
+        return 0
 
-    makoFileList.append(outpath)
-    return len(rendered.splitlines())
+    content, seconds = _render(inpath, args)
+    return _finish(inpath, outpath, key, content, seconds)
 
-def makoFileListWrite(outpath):
-    with open(outpath, 'w') as fout:
-        fout.write(json.dumps(makoFileList, indent=4, sort_keys=True))
+"""
+    renders 'inpath' into rendered[outname] instead of a file; returns the
+    number of lines, or 0 when the render is queued
+"""
+def makoRender(inpath, outname, **args):
+    entry = previousRendered.get(outname)
+    if not isSelected(inpath):
+        if entry is not None:
+            rendered[outname] = entry["content"]
+        return 0
+
+    key = makoKey(inpath, **args)
+    if incremental and entry is not None and entry["key"] == key:
+        rendered[outname] = entry["content"]
+        renderedManifest[outname] = entry
+        return len(entry["content"].splitlines())
+
+    if jobs > 1:
+        _queue.append((inpath, None, key, _sharedArgs(args), outname))
+        return 0
+
+    content, seconds = _render(inpath, args)
+    return _finishMemory(inpath, outname, key, content, seconds)
+
+"""
+    returns True if 'inpath' is one of the selected templates
+"""
+def isSelected(inpath):
+    return selected is None or os.path.abspath(inpath) in selected
+
+"""
+    returns the compiled template of 'inpath'
+"""
+def getTemplate(inpath):
+    path = os.path.abspath(inpath)
+    key = (path, os.stat(path).st_mtime_ns)
+    template = _templates.get(key)
+    if template is None:
+        template = Template(filename=path, module_directory=templateCache)
+        _templates[key] = template
+    return template
+
+def _render(inpath, args):
+    start = time.perf_counter()
+    template = getTemplate(inpath)
+    content = template.render(**args)
+    content = re.sub(r"\r\n", r"\n", content)
+    return content, time.perf_counter() - start
+
+def _finish(inpath, outpath, key, content, seconds):
+    stats["rendered"] += 1
+    timings[os.path.abspath(outpath)] = seconds
+
+    action = "written" if writeIfChanged(outpath, content) else "unchanged"
+    stats[action] += 1
+
+    lines = len(content.splitlines())
+    _record(inpath, outpath, key, lines, action)
+    return lines
+
+def _finishMemory(inpath, outname, key, content, seconds):
+    timings[outname] = seconds
+    rendered[outname] = content
+    entry = previousRendered.get(outname)
+    if entry is None or entry["content"] != content:
+        changed.add(outname)
+    renderedManifest[outname] = {"template": os.path.abspath(inpath), "key": key, "content": content}
+    return len(content.splitlines())
+
+def _record(inpath, outpath, key, lines, action):
+    actions[os.path.abspath(outpath)] = action
+    manifest[os.path.abspath(outpath)] = {"template": os.path.abspath(inpath), "key": key, "lines": lines}
+
+"""
+    registers a render argument shared by many renders, e.g. a section's specs
+"""
+def share(name, value):
+    _shared[name] = value
+    _sharedNames[id(value)] = name
+
+"""
+    drops the shared argument 'value' and its cached digest, once the renders
+    using it are done, so it can be freed
+"""
+def release(value):
+    name = _sharedNames.pop(id(value), None)
+    if name is not None:
+        del _shared[name]
+    _digests.pop(id(value), None)
+
+def _sharedArgs(args):
+    return dict((name, ("shared", _sharedNames[id(value)]) if id(value) in _sharedNames else ("value", value))
+        for name, value in args.items())
+
+def _initWorker(shared, cache):
+    global _shared, templateCache
+    _shared = shared
+    templateCache = cache
+
+def _renderTask(inpath, args):
+    args = dict((name, _shared[value] if kind == "shared" else value) for name, (kind, value) in args.items())
+    return _render(inpath, args)
+
+"""
+    renders the queued outputs in a pool of 'jobs' processes; outputs are
+    written, and accounted, in the order they were queued, so the results
+    match a serial run; returns the number of lines rendered
+"""
+def renderQueued():
+    global _queue
+    queue, _queue = _queue, []
+    if not queue:
+        return 0
+    loc = 0
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(jobs, len(queue)),
+            initializer=_initWorker, initargs=(_shared, templateCache)) as pool:
+        futures = [pool.submit(_renderTask, inpath, args) for inpath, outpath, key, args, outname in queue]
+        for (inpath, outpath, key, args, outname), future in zip(queue, futures):
+            content, seconds = future.result()
+            if outname is not None:
+                loc += _finishMemory(inpath, outname, key, content, seconds)
+                continue
+            print("Generating %s..."%outpath)
+            loc += _finish(inpath, outpath, key, content, seconds)
+    return loc
+
+"""
+    returns the peak resident set size in bytes of this process and of its
+    largest worker process, or None where it can't be measured
+"""
+def peakMemory():
+    if resource is None:
+        return None
+    # ru_maxrss is in bytes on macOS, in kilobytes elsewhere
+    unit = 1 if sys.platform == "darwin" else 1024
+    return (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * unit)
+
+"""
+    loads the manifest of a previous run; paths are stored relative to the
+    manifest's directory
+"""
+def loadManifest(path):
+    global previousManifest, previousRendered
+    base = os.path.dirname(os.path.abspath(path))
+    try:
+        with phase("io"), open(path, 'r') as fin:
+            data = json.load(fin)
+        files = data["files"]
+        memory = data.get("rendered", {})
+    except (FileNotFoundError, ValueError, KeyError):
+        files = {}
+        memory = {}
+    previousManifest = {}
+    for outpath, entry in files.items():
+        entry["template"] = os.path.normpath(os.path.join(base, entry["template"]))
+        previousManifest[os.path.normpath(os.path.join(base, outpath))] = entry
+    previousRendered = {}
+    for outname, entry in memory.items():
+        entry["template"] = os.path.normpath(os.path.join(base, entry["template"]))
+        previousRendered[outname] = entry
+
+"""
+    writes the manifest of this run, keeping the entries of outputs not
+    generated this time (e.g. sections that were not selected)
+"""
+def saveManifest(path):
+    base = os.path.dirname(os.path.abspath(path))
+    files = dict(previousManifest)
+    files.update(manifest)
+    entries = {}
+    for outpath, entry in files.items():
+        entries[os.path.relpath(outpath, base)] = dict(entry, template=os.path.relpath(entry["template"], base))
+    memory = dict(previousRendered)
+    memory.update(renderedManifest)
+    for outname, entry in memory.items():
+        memory[outname] = dict(entry, template=os.path.relpath(entry["template"], base))
+    writeIfChanged(path, json.dumps({"files": entries, "rendered": memory}, indent=4, sort_keys=True) + "\n")